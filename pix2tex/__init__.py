@@ -1,2 +1,4 @@
 import os
 os.environ['FOR_DISABLE_CONSOLE_CTRL_HANDLER'] = '1'
+
+__version__ = '0.1.2'
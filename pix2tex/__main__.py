@@ -1,27 +1,127 @@
 #!/usr/bin/env python
-def main():
-    from argparse import ArgumentParser
-
-    parser = ArgumentParser()
+def add_model_arguments(parser):
     parser.add_argument('-t', '--temperature', type=float, default=.333, help='Softmax sampling frequency')
     parser.add_argument('-c', '--config', type=str, default='settings/config.yaml', help='path to config file')
     parser.add_argument('-m', '--checkpoint', type=str, default='checkpoints/weights.pth', help='path to weights file')
     parser.add_argument('--no-cuda', action='store_true', help='Compute on CPU')
     parser.add_argument('--no-resize', action='store_true', help='Resize the image beforehand')
 
+
+def batch(argv):
+    from argparse import ArgumentParser
+    import os
+
+    parser = ArgumentParser(prog='pix2tex batch', description='Predict many images and write one JSON line {"file", "latex", "timing"} per image')
+    add_model_arguments(parser)
+    parser.add_argument('-o', '--output', type=str, default=None, help='JSONL output file. Defaults to stdout')
+    parser.add_argument('-b', '--batchsize', type=int, default=16, help='Number of images of the same size decoded together')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(), help='Number of processes loading the images')
+    parser.add_argument('inputs', nargs='+', type=str, help='Image files, directories or glob patterns')
+    arguments = parser.parse_args(argv)
+
+    from .batch import main
+    main(arguments)
+
+
+def watch(argv):
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(prog='pix2tex watch', description='Predict new and changed images in a folder as they arrive')
+    add_model_arguments(parser)
+    parser.add_argument('--jsonl', type=str, default=None, help='Append results to this JSONL file instead of writing a .tex file next to every image')
+    parser.add_argument('--state', type=str, default=None, help='File recording the processed images. Defaults to DIRECTORY/.pix2tex-state.json')
+    parser.add_argument('--no-recursive', dest='recursive', action='store_false', help='Do not watch subdirectories')
+    parser.add_argument('--poll', action='store_true', help='Poll the folder instead of using filesystem events')
+    parser.add_argument('--interval', type=float, default=2, help='Polling interval in seconds')
+    parser.add_argument('--settle', type=float, default=1, help='Seconds a file has to be unchanged before it is processed')
+    parser.add_argument('-b', '--batchsize', type=int, default=16, help='Number of images of the same size decoded together')
+    parser.add_argument('directory', type=str, help='Folder to watch')
+    arguments = parser.parse_args(argv)
+
+    from .watch import main
+    main(arguments)
+
+
+def serve(argv):
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(prog='pix2tex serve', description='Keep the model loaded and answer "pix2tex FILE" calls over a Unix domain socket')
+    add_model_arguments(parser)
+    parser.add_argument('--socket', type=str, default=None, help='Socket path. Defaults to $PIX2TEX_SOCKET or a per-user socket in $XDG_RUNTIME_DIR')
+    arguments = parser.parse_args(argv)
+
+    from .daemon import main
+    main(arguments)
+
+
+def predict_with_daemon(arguments) -> bool:
+    import glob
+    import os
+    from .client import model_settings, predict
+
+    files = []
+    for file in arguments.file:
+        if file:
+            files.extend(sorted(glob.glob(os.path.expanduser(file))) or [file])
+    results = predict(files, path=arguments.socket, temperature=arguments.temperature, resize=not arguments.no_resize,
+                      settings=model_settings(arguments))
+    if results is None:
+        return False
+    # same output as the in-process cli
+    from .clipboard import copy
+    from .output import output_prediction
+    for file, result in zip(files, results):
+        print(file + ': ', end='')
+        if 'error' in result:
+            print(result['error'])
+            continue
+        output_prediction(result['latex'], arguments)
+        try:
+            copy(result['latex'])
+        except:
+            pass
+    return True
+
+
+def main():
+    from argparse import ArgumentParser
+    import os
+    import sys
+
+    modes = {'batch': batch, 'watch': watch, 'serve': serve}
+    if len(sys.argv) > 1 and sys.argv[1] in modes:
+        return modes[sys.argv[1]](sys.argv[2:])
+
+    from pix2tex import __version__
+
+    parser = ArgumentParser(epilog='modes: "pix2tex batch -h" for predicting whole directories, "pix2tex watch -h" for watching a folder, "pix2tex serve -h" for a background daemon')
+    parser.add_argument('--version', action='version', version='pix2tex %s' % __version__)
+    add_model_arguments(parser)
+
     parser.add_argument('-s', '--show', action='store_true', help='Show the rendered predicted latex code (cli only)')
     parser.add_argument('-k', '--katex', action='store_true', help='Render the latex code in the browser (cli only)')
 
     parser.add_argument('--gui', action='store_true', help='Use GUI (gui only)')
+    parser.add_argument('--socket', type=str, default=None, help='Socket of a running "pix2tex serve" daemon that predicts the files (cli only)')
+    parser.add_argument('--no-daemon', action='store_true', help='Do not send the files to a running daemon (cli only)')
+    parser.add_argument('--stdin', nargs='?', const='paths', choices=['paths', 'blobs'], default=None,
+                        help='Read newline separated image paths or length prefixed (4 byte big endian) image files from stdin and write one JSON line per image')
+    parser.add_argument('-b', '--batchsize', type=int, default=16, help='Maximal number of images decoded together (stdin only)')
 
     parser.add_argument('file', nargs='*', type=str, default=None, help='Predict LaTeX code from image file instead of clipboard (cli only)')
     arguments = parser.parse_args()
 
-    import os
-    import sys
+    if arguments.stdin:
+        from .stream import main
+        return main(arguments)
 
     name = os.path.split(sys.argv[0])[-1]
-    if arguments.gui or name in ['pix2tex_gui', 'latexocr']:
+    gui = arguments.gui or name in ['pix2tex_gui', 'latexocr']
+    if not gui and arguments.file and not (arguments.no_daemon or arguments.show or arguments.katex):
+        # a running daemon spares loading torch and the model
+        if predict_with_daemon(arguments):
+            return
+    if gui:
         from .gui import main
     else:
         from .cli import main
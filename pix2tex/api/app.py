@@ -1,25 +1,118 @@
 # Adapted from https://github.com/kingyiusuen/image-to-latex/blob/main/api/app.py
 
 from http import HTTPStatus
-from fastapi import FastAPI, File, UploadFile, Form
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+import zlib
+from contextlib import suppress
+from fastapi import FastAPI, File, UploadFile, Form, Header, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 from PIL import Image
 from io import BytesIO
-from pix2tex.cli import LatexOCR
+import numpy as np
+from pix2tex.api.scheduler import InferenceScheduler, PRIORITIES
+from pix2tex.api.jobs import JobQueue
+from pix2tex.api.registry import ModelRegistry
+from pix2tex.appdirs import user_data_dir
+from pix2tex.utils import pad
 
-model = None
+models = None
+scheduler = None
+jobs = None
 app = FastAPI(title='pix2tex API')
 
 
+class SingleFlight:
+    '''Coalesce identical in-flight calls into one computation.
+
+    The first caller for a key starts the computation, every caller arriving with
+    the same key before it finished awaits the same future.
+    '''
+
+    def __init__(self):
+        self.calls = {}
+
+    async def do(self, key, func, *args, **kwargs):
+        future = self.calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func(*args, **kwargs))
+            self.calls[key] = future
+            future.add_done_callback(lambda _: self.calls.pop(key, None))
+        # shield the shared computation from waiters that are cancelled (e.g. disconnected clients)
+        return await asyncio.shield(future)
+
+
+inflight = SingleFlight()
+
+
 def read_imagefile(file) -> Image.Image:
     image = Image.open(BytesIO(file))
     return image
 
 
+def request_key(data: bytes, **params) -> str:
+    """Identify a request by the hash of the image and the decoding parameters
+
+    Args:
+        data (bytes): Raw image file
+        params: Decoding parameters that influence the result
+
+    Returns:
+        str: Key for the request
+    """
+    return hashlib.sha256(data).hexdigest() + repr(sorted(params.items()))
+
+
+def get_priority(x_priority: str = None, default: str = 'interactive') -> str:
+    priority = (x_priority or default).lower()
+    if priority not in PRIORITIES:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='Unknown priority "%s". Choose one of %s' % (priority, ', '.join(PRIORITIES)))
+    return priority
+
+
+def get_model(name: str = None):
+    try:
+        return models.get(name)
+    except KeyError as e:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=e.args[0])
+
+
+async def run_model(model, data: bytes, resize: bool = True, priority: str = 'interactive') -> str:
+    image = await run_in_threadpool(model.preprocess, read_imagefile(data), resize=resize)
+    return await asyncio.wrap_future(scheduler.submit(image, priority=priority, model=model))
+
+
+async def coalesced_predict(data: bytes, resize: bool = True, priority: str = 'interactive', name: str = None) -> str:
+    model = get_model(name)
+    # the priority is not part of the key: a bulk duplicate of an interactive request may share its result
+    key = request_key(data, resize=resize, temperature=model.args.get('temperature', .25), model=name or models.default, version=models.version(name))
+    return await inflight.do(key, run_model, model, data, resize=resize, priority=priority)
+
+
 @app.on_event('startup')
 async def load_model():
-    global model
-    if model is None:
-        model = LatexOCR()
+    global models, scheduler
+    if models is None:
+        models = ModelRegistry.from_file(os.environ.get('PIX2TEX_MODELS'))
+        await run_in_threadpool(models.load_all)
+    if scheduler is None:
+        scheduler = InferenceScheduler()
+
+
+@app.on_event('startup')
+async def load_jobs():
+    global jobs
+    if jobs is None:
+        jobs = JobQueue(os.environ.get('PIX2TEX_JOBS', os.path.join(user_data_dir('pix2tex'), 'jobs')), models, scheduler)
 
 
 @app.get('/')
@@ -34,31 +127,294 @@ def root():
 
 
 @app.post('/predict/')
-async def predict(file: UploadFile = File(...)) -> str:
+async def predict(file: UploadFile = File(...), x_priority: str = Header(None), model: str = Query(None)) -> str:
     """Predict the Latex code from an image file.
 
     Args:
         file (UploadFile, optional): Image to predict. Defaults to File(...).
+        x_priority (str, optional): Priority class from the `X-Priority` header, `interactive` or `bulk`. Defaults to interactive.
+        model (str, optional): Name of the model variant. Defaults to the default model.
 
     Returns:
         str: Latex prediction
     """
-    global model
-    image = Image.open(file.file)
-    return model(image)
+    return await coalesced_predict(await file.read(), priority=get_priority(x_priority), name=model)
 
 
 @app.post('/bytes/')
-async def predict_from_bytes(file: bytes = File(...)) -> str:  # , size: str = Form(...)
+async def predict_from_bytes(file: bytes = File(...), x_priority: str = Header(None), model: str = Query(None)) -> str:  # , size: str = Form(...)
     """Predict the Latex code from a byte array
 
     Args:
         file (bytes, optional): Image as byte array. Defaults to File(...).
+        x_priority (str, optional): Priority class from the `X-Priority` header, `interactive` or `bulk`. Defaults to interactive.
+        model (str, optional): Name of the model variant. Defaults to the default model.
 
     Returns:
         str: Latex prediction
     """
-    global model
     #size = tuple(int(a) for a in size.split(','))
-    image = Image.open(BytesIO(file))
-    return model(image, resize=False)
+    return await coalesced_predict(file, resize=False, priority=get_priority(x_priority), name=model)
+
+
+@app.post('/bulk/predict/')
+async def predict_bulk(file: UploadFile = File(...), model: str = Query(None)) -> str:
+    """Predict the Latex code from an image file with bulk priority.
+
+    Args:
+        file (UploadFile, optional): Image to predict. Defaults to File(...).
+        model (str, optional): Name of the model variant. Defaults to the default model.
+
+    Returns:
+        str: Latex prediction
+    """
+    return await coalesced_predict(await file.read(), priority='bulk', name=model)
+
+
+def read_manifest(data: bytes, root: str = None):
+    """Image paths of a manifest, relative to `root` (`$PIX2TEX_JOBS_ROOT`). Paths outside of it are rejected."""
+    root = os.environ.get('PIX2TEX_JOBS_ROOT') if root is None else root
+    if not root:
+        raise HTTPException(status_code=HTTPStatus.FORBIDDEN, detail='Manifests are disabled, set $PIX2TEX_JOBS_ROOT on the server.')
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='The manifest has to be UTF-8 encoded.')
+    try:
+        paths = json.loads(text)
+    except json.JSONDecodeError:
+        paths = [line.strip() for line in text.splitlines() if line.strip()]
+    if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='The manifest has to be a list of paths.')
+    root = os.path.realpath(root)
+    files, invalid = [], []
+    for path in paths:
+        real = os.path.realpath(os.path.join(root, path))
+        # the same answer for paths outside of the root and missing files, so the existence of other files is not revealed
+        if os.path.commonpath([root, real]) != root or not os.path.isfile(real):
+            invalid.append(path)
+        else:
+            files.append((path, real))
+    if invalid:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='Files not found in the jobs root: %s' % ', '.join(invalid[:10]))
+    return files
+
+
+def read_archive(file: UploadFile, job: str):
+    with tempfile.NamedTemporaryFile(suffix=os.path.basename(file.filename or '')) as tmp:
+        shutil.copyfileobj(file.file, tmp)
+        tmp.flush()
+        try:
+            return jobs.extract(tmp.name, job)
+        except ValueError as e:
+            jobs.delete(job)
+            raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+        except (zipfile.BadZipFile, zipfile.LargeZipFile, tarfile.TarError, zlib.error, EOFError, OSError):
+            jobs.delete(job)
+            raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='The archive is damaged.')
+
+
+@app.post('/jobs/')
+async def create_job(archive: UploadFile = File(None), manifest: UploadFile = File(None), model: str = Form(None)) -> dict:
+    """Start an asynchronous conversion job.
+
+    Args:
+        archive (UploadFile, optional): Zip or tar archive of images. Defaults to File(None).
+        manifest (UploadFile, optional): JSON list or newline separated list of image paths on the server, relative to `$PIX2TEX_JOBS_ROOT`. Defaults to File(None).
+        model (str, optional): Name of the model variant. Defaults to the default model.
+
+    Returns:
+        dict: Status of the new job, including its `id`
+    """
+    get_model(model)
+    if (archive is None) == (manifest is None):
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='Upload either an archive or a manifest.')
+    job = jobs.new()
+    if archive is not None:
+        files = await run_in_threadpool(read_archive, archive, job)
+    else:
+        files = read_manifest(await manifest.read())
+    if not files:
+        jobs.delete(job)
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='No images found.')
+    return jobs.status(await run_in_threadpool(jobs.submit, files, model, job))
+
+
+@app.get('/jobs/{job}')
+def job_status(job: str) -> dict:
+    """Progress of a conversion job.
+
+    Args:
+        job (str): Job id
+
+    Returns:
+        dict: `state` (queued, running, done or failed), `total` and `done` number of images
+    """
+    status = jobs.status(job)
+    if status is None:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail='Unknown job %s' % job)
+    return status
+
+
+@app.get('/jobs/{job}/results')
+def job_results(job: str):
+    """Results of a conversion job as JSONL, one `{"file", "latex"}` object per image in order.
+
+    Args:
+        job (str): Job id
+
+    Returns:
+        FileResponse: The results converted so far
+    """
+    if jobs.status(job) is None:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail='Unknown job %s' % job)
+    return FileResponse(jobs.results(job), media_type='application/x-ndjson', filename='%s.jsonl' % job)
+
+
+@app.delete('/jobs/{job}')
+def delete_job(job: str) -> dict:
+    """Delete a conversion job with its results and uploaded images. A running job is stopped.
+
+    Args:
+        job (str): Job id
+
+    Returns:
+        dict: `id` of the deleted job
+    """
+    if jobs.status(job) is None or not jobs.delete(job):
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail='Unknown job %s' % job)
+    return {'id': job}
+
+
+@app.get('/models/')
+def list_models() -> dict:
+    '''Available model variants and their loading state.'''
+    return models.status()
+
+
+def weights_file(path: str) -> str:
+    """Resolve a file below `$PIX2TEX_WEIGHTS_DIR`, the only place reloaded models may come from"""
+    root = os.environ.get('PIX2TEX_WEIGHTS_DIR')
+    if not root:
+        raise HTTPException(status_code=HTTPStatus.FORBIDDEN, detail='Loading other files is disabled, set $PIX2TEX_WEIGHTS_DIR on the server.')
+    root = os.path.realpath(root)
+    real = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, real]) != root or not os.path.isfile(real):
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail='File not found in the weights directory: %s' % path)
+    return real
+
+
+@app.post('/models/{name}/reload')
+def reload_model(name: str, checkpoint: str = Form(None), config: str = Form(None), x_reload_token: str = Header(None)) -> dict:
+    """Load a configured model variant in the background and swap it in once it is ready.
+    Only available if `$PIX2TEX_RELOAD_TOKEN` is set on the server, the request has to send it as `X-Reload-Token`.
+
+    Args:
+        name (str): Name of a configured variant.
+        checkpoint (str, optional): Path to the new weights, relative to `$PIX2TEX_WEIGHTS_DIR`. Defaults to the current checkpoint of the variant.
+        config (str, optional): Path to the new config, relative to `$PIX2TEX_WEIGHTS_DIR`. Defaults to the current config of the variant.
+
+    Returns:
+        dict: Status of all variants
+    """
+    token = os.environ.get('PIX2TEX_RELOAD_TOKEN')
+    if not token:
+        raise HTTPException(status_code=HTTPStatus.FORBIDDEN, detail='Reloading is disabled, set $PIX2TEX_RELOAD_TOKEN on the server.')
+    if x_reload_token is None or not hmac.compare_digest(x_reload_token.encode('utf-8'), token.encode('utf-8')):
+        raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, detail='Invalid reload token.')
+    if name not in models.status():
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail='Unknown model "%s"' % name)
+    checkpoint = None if checkpoint is None else weights_file(checkpoint)
+    config = None if config is None else weights_file(config)
+    if not models.reload(name, checkpoint=checkpoint, config=config):
+        raise HTTPException(status_code=HTTPStatus.CONFLICT, detail='Model "%s" is already loading.' % name)
+    return models.status()
+
+
+def frame_changed(previous: np.ndarray, current: np.ndarray, threshold: float = .002, tolerance: int = 64) -> bool:
+    """Decide whether the content of two normalized frames differs meaningfully
+
+    Args:
+        previous (np.ndarray): Last frame that was predicted, output of `pad`
+        current (np.ndarray): New frame, output of `pad`
+        threshold (float, optional): Fraction of pixels that have to change. Defaults to .002.
+        tolerance (int, optional): Gray value difference that still counts as noise (e.g. anti-aliasing). Defaults to 64.
+
+    Returns:
+        bool: Whether the frame has to be predicted again
+    """
+    if previous is None or previous.shape != current.shape:
+        return True
+    diff = np.abs(previous.astype(np.int16)-current.astype(np.int16)) > tolerance
+    return diff.mean() > threshold
+
+
+@app.websocket('/ws/capture')
+async def capture(websocket: WebSocket, model: str = None, threshold: float = .002):
+    """Predict a continuous stream of frames.
+
+    Every binary message is an image. A prediction `{"frame", "latex"}` is only sent when the
+    cropped and normalized content of a frame changed compared to the last predicted frame.
+    Frames arriving while a prediction is running replace each other, only the newest one is predicted next.
+    A frame that cannot be read or predicted is answered with `{"frame", "error"}`.
+
+    Args:
+        websocket (WebSocket): Connection
+        model (str, optional): Name of the model variant. Defaults to the default model.
+        threshold (float, optional): Fraction of pixels that have to change to predict a frame again. Defaults to .002.
+    """
+    await websocket.accept()
+    latest = {}
+    arrived = asyncio.Event()
+
+    async def predict_frame(index, data, previous):
+        # returns the normalized frame if it was predicted
+        try:
+            image = read_imagefile(data)
+            normalized = np.array(await run_in_threadpool(pad, image))
+            if not frame_changed(previous, normalized, threshold):
+                return None
+            ocr = models.get(model)
+            tensor = await run_in_threadpool(ocr.preprocess, image)
+            latex = await asyncio.wrap_future(scheduler.submit(tensor, priority='interactive', model=ocr))
+        except Exception as e:
+            await websocket.send_json({'frame': index, 'error': str(e)})
+            return None
+        await websocket.send_json({'frame': index, 'latex': latex})
+        return normalized
+
+    async def predict_frames():
+        previous = None
+        try:
+            while True:
+                await arrived.wait()
+                arrived.clear()
+                normalized = await predict_frame(latest['frame'], latest['data'], previous)
+                if normalized is not None:
+                    # a frame that failed is compared against the last successful one
+                    previous = normalized
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # the frames would not be answered anymore, e.g. because sending failed
+            logging.exception('Capture worker failed')
+            with suppress(Exception):
+                await websocket.close(code=1011)
+
+    try:
+        get_model(model)
+    except HTTPException as e:
+        await websocket.close(code=1008, reason=e.detail)
+        return
+    worker = asyncio.ensure_future(predict_frames())
+    try:
+        frame = 0
+        while not worker.done():
+            latest.update(frame=frame, data=await websocket.receive_bytes())
+            arrived.set()
+            frame += 1
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError: the worker closed the connection
+        pass
+    finally:
+        worker.cancel()
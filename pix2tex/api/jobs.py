@@ -0,0 +1,263 @@
+from collections import deque
+import json
+import logging
+import os
+import shutil
+import tarfile
+import threading
+import time
+import uuid
+import zipfile
+from typing import List, Optional, Tuple
+
+from PIL import Image
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tif', '.tiff', '.webp')
+
+
+class JobQueue:
+    '''On-disk queue of conversion jobs that survives restarts.
+
+    Every job is a directory under `root` holding the `manifest.jsonl` of images to
+    convert, the `results.jsonl` written so far and a small `status.json`. Images
+    of uploaded archives are extracted to its `uploads` directory, which is removed
+    when the job is finished. Images are decoded one after the other through the bulk
+    class of the scheduler and results are appended in manifest order, so after a
+    restart a job resumes after the last line of its results file.
+    '''
+
+    def __init__(self, root: str, models, scheduler, window: int = 16, max_files: int = 100000, max_bytes: int = 2**32):
+        """
+        Args:
+            root (str): Directory the jobs are stored in.
+            models (ModelRegistry): Models the jobs can choose from.
+            scheduler (InferenceScheduler): Scheduler that decodes the images.
+            window (int, optional): Maximal number of images of a job in the scheduler at once. Defaults to 16.
+            max_files (int, optional): Maximal number of images in an archive. Defaults to 100000.
+            max_bytes (int, optional): Maximal extracted size of an archive. Defaults to 4GiB.
+        """
+        self.root = root
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.models = models
+        self.scheduler = scheduler
+        self.window = window
+        self.cond = threading.Condition()
+        self.deleted = set()  # running jobs that stop after the current image
+        os.makedirs(root, exist_ok=True)
+        statuses = [self.status(job) for job in os.listdir(root)]
+        pending = [status for status in statuses if status is not None and status['state'] in ('queued', 'running')]
+        self.pending = deque(status['id'] for status in sorted(pending, key=lambda status: status['created']))
+        self.thread = threading.Thread(target=self._work, daemon=True)
+        self.thread.start()
+
+    def path(self, job: str, *name: str) -> str:
+        return os.path.join(self.root, job, *name)
+
+    def status(self, job: str) -> Optional[dict]:
+        """Get the status of a job
+
+        Args:
+            job (str): Job id
+
+        Returns:
+            Optional[dict]: `id`, `state`, `model`, `total`, `done` and `created` of the job. None if the job does not exist.
+        """
+        if os.path.basename(job) != job or not os.path.isfile(self.path(job, 'status.json')):
+            return None
+        with open(self.path(job, 'status.json'), 'r') as f:
+            status = json.load(f)
+        status['done'] = count_lines(self.path(job, 'results.jsonl'))
+        return status
+
+    def results(self, job: str) -> str:
+        return self.path(job, 'results.jsonl')
+
+    def new(self) -> str:
+        """Id for a job that is submitted later, e.g. after its archive is extracted (see `extract`)"""
+        return uuid.uuid4().hex
+
+    def submit(self, files: List[Tuple[str, str]], model: Optional[str] = None, job: Optional[str] = None) -> str:
+        """Create a job
+
+        Args:
+            files (List[Tuple[str, str]]): Pairs of the name reported in the results and the path of the image.
+            model (str, optional): Name of the model variant. Defaults to None (the default variant).
+            job (str, optional): Id from `new`. Defaults to a new id.
+
+        Returns:
+            str: Job id
+        """
+        job = self.new() if job is None else job
+        os.makedirs(self.path(job), exist_ok=True)
+        with open(self.path(job, 'manifest.jsonl'), 'w') as f:
+            for name, path in files:
+                f.write(json.dumps({'file': name, 'path': path})+'\n')
+        open(self.path(job, 'results.jsonl'), 'w').close()
+        self._set_status(job, state='queued', model=model, total=len(files), created=time.time())
+        with self.cond:
+            self.pending.append(job)
+            self.cond.notify()
+        return job
+
+    def delete(self, job: str) -> bool:
+        """Delete a job with its results and uploads. A running job stops after the current image.
+
+        Args:
+            job (str): Job id
+
+        Returns:
+            bool: Whether the job existed
+        """
+        if os.path.basename(job) != job or not os.path.isdir(self.path(job)):
+            return False
+        with self.cond:
+            if self.pending and self.pending[0] == job:
+                # removed by the worker once the job stopped
+                self.deleted.add(job)
+                return True
+            if job in self.pending:
+                self.pending.remove(job)
+        shutil.rmtree(self.path(job), ignore_errors=True)
+        return True
+
+    def extract(self, archive: str, job: str) -> List[Tuple[str, str]]:
+        """Unpack the images of a zip or tar archive into the uploads directory of a job
+
+        Args:
+            archive (str): Path to the archive
+            job (str): Job id from `new`
+
+        Raises:
+            ValueError: Not a zip or tar file, or more than `max_files` images or `max_bytes` in total
+
+        Returns:
+            List[Tuple[str, str]]: Pairs of member name and extracted path
+        """
+        out = self.path(job, 'uploads')
+        os.makedirs(out)
+        files, size = [], 0
+
+        def copy(name: str, src):
+            nonlocal size
+            if len(files) >= self.max_files:
+                raise ValueError('The archive contains more than %i images.' % self.max_files)
+            path = os.path.join(out, '%07d%s' % (len(files), os.path.splitext(name)[1]))
+            with open(path, 'wb') as dst:
+                # copy in chunks and stop at the limit, the sizes in the archive can not be trusted
+                for chunk in iter(lambda: src.read(1 << 20), b''):
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise ValueError('The images of the archive are larger than %i bytes.' % self.max_bytes)
+                    dst.write(chunk)
+            files.append((name, path))
+
+        if zipfile.is_zipfile(archive):
+            with zipfile.ZipFile(archive) as z:
+                for member in sorted(z.namelist()):
+                    if member.lower().endswith(IMAGE_EXTENSIONS):
+                        with z.open(member) as src:
+                            copy(member, src)
+        elif tarfile.is_tarfile(archive):
+            with tarfile.open(archive) as t:
+                for member in sorted(t.getmembers(), key=lambda m: m.name):
+                    if member.isfile() and member.name.lower().endswith(IMAGE_EXTENSIONS):
+                        with t.extractfile(member) as src:
+                            copy(member.name, src)
+        else:
+            raise ValueError('Archive has to be a zip or tar file.')
+        return files
+
+    def _set_status(self, job: str, **kwargs):
+        path = self.path(job, 'status.json')
+        status = {'id': job}
+        if os.path.isfile(path):
+            with open(path, 'r') as f:
+                status = json.load(f)
+        status.update(kwargs)
+        with open(path+'.tmp', 'w') as f:
+            json.dump(status, f)
+        os.replace(path+'.tmp', path)
+
+    def _predict(self, path: str, name: Optional[str] = None):
+        try:
+            # look the model up for every image, so a job picks up a reloaded model
+            model = self.models.get(name)
+            image = model.preprocess(Image.open(path))
+            return self.scheduler.submit(image, priority='bulk', model=model)
+        except Exception as e:
+            return e
+
+    def _write(self, out, item: dict, pending):
+        result = {'file': item['file']}
+        try:
+            if isinstance(pending, Exception):
+                raise pending
+            result['latex'] = pending.result()
+        except Exception as e:
+            result['error'] = str(e)
+        out.write(json.dumps(result)+'\n')
+        out.flush()
+
+    def _run(self, job: str):
+        self._set_status(job, state='running')
+        name = self.status(job).get('model')
+        with open(self.path(job, 'manifest.jsonl'), 'r') as f:
+            manifest = [json.loads(line) for line in f if line.strip()]
+        results = self.path(job, 'results.jsonl')
+        start = truncate_partial_line(results)
+        inflight = deque()
+        with open(results, 'a') as out:
+            for item in manifest[start:]:
+                if job in self.deleted:
+                    break
+                inflight.append((item, self._predict(item['path'], name)))
+                if len(inflight) >= self.window:
+                    self._write(out, *inflight.popleft())
+            while inflight:
+                self._write(out, *inflight.popleft())
+        self._set_status(job, state='done')
+
+    def _work(self):
+        while True:
+            with self.cond:
+                while not self.pending:
+                    self.cond.wait()
+                job = self.pending[0]
+            try:
+                self._run(job)
+            except Exception as e:
+                logging.exception('Job %s failed' % job)
+                self._set_status(job, state='failed', error=str(e))
+            # the extracted images are not needed anymore
+            shutil.rmtree(self.path(job, 'uploads'), ignore_errors=True)
+            with self.cond:
+                self.pending.popleft()
+                deleted = job in self.deleted
+                self.deleted.discard(job)
+            if deleted:
+                shutil.rmtree(self.path(job), ignore_errors=True)
+
+
+def count_lines(path: str) -> int:
+    if not os.path.isfile(path):
+        return 0
+    with open(path, 'rb') as f:
+        return sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+
+
+def truncate_partial_line(path: str) -> int:
+    """Cut off an incomplete last line (e.g. after a crash) and count the complete lines
+
+    Args:
+        path (str): Path to a JSONL file
+
+    Returns:
+        int: Number of complete lines
+    """
+    with open(path, 'rb+') as f:
+        data = f.read()
+        end = data.rfind(b'\n')+1
+        if end != len(data):
+            f.truncate(end)
+    return data[:end].count(b'\n')
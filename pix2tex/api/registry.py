@@ -0,0 +1,131 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+import torch
+import yaml
+from munch import Munch
+
+from pix2tex.cli import LatexOCR
+
+DEFAULT_MODELS = {'default': {'config': 'settings/config.yaml', 'checkpoint': 'checkpoints/weights.pth'}}
+
+
+class ModelRegistry:
+    '''Named model variants that can be replaced while the server is running.
+
+    Every variant is described by a dict with the `config` and `checkpoint` paths
+    (relative to the `pix2tex/model` directory like for the cli), optionally
+    `no_resize` to skip the resizer and `quantize` to run the decoder with dynamic
+    int8 quantization. A (re)load builds the new model on a background thread and
+    swaps it in afterwards. Requests hold on to the model they started with, so
+    nothing in flight is dropped.
+    '''
+
+    def __init__(self, variants: Optional[Dict[str, dict]] = None):
+        """
+        Args:
+            variants (Dict[str, dict], optional): Variant specification by name. Defaults to `DEFAULT_MODELS`.
+        """
+        self.variants = {name: dict(spec) for name, spec in (DEFAULT_MODELS if variants is None else variants).items()}
+        self.models = {}
+        self.versions = {name: 0 for name in self.variants}
+        self.loading = {}
+        self.errors = {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, filename: Optional[str] = None):
+        """Read the variants from a yaml file mapping the name to its specification
+
+        Args:
+            filename (str, optional): Path to the yaml file. Defaults to None (only the default model).
+        """
+        if filename is None:
+            return cls()
+        with open(filename, 'r') as f:
+            return cls(yaml.load(f, Loader=yaml.FullLoader))
+
+    @property
+    def default(self) -> str:
+        return 'default' if 'default' in self.variants else next(iter(self.variants))
+
+    def load_all(self):
+        for name in self.variants:
+            self.models[name] = self._build(self.variants[name])
+
+    def get(self, name: Optional[str] = None) -> LatexOCR:
+        """Get the current model of a variant
+
+        Args:
+            name (str, optional): Name of the variant. Defaults to the default variant.
+
+        Raises:
+            KeyError: The variant is unknown or not loaded yet
+
+        Returns:
+            LatexOCR: model
+        """
+        name = self.default if name is None else name
+        with self.lock:
+            if name not in self.models:
+                raise KeyError('Model "%s" is not available. Choose one of %s' % (name, ', '.join(self.models)))
+            return self.models[name]
+
+    def version(self, name: Optional[str] = None) -> int:
+        return self.versions.get(self.default if name is None else name, 0)
+
+    def status(self) -> dict:
+        with self.lock:
+            return {name: {**spec, 'version': self.versions[name], 'loaded': name in self.models,
+                           'loading': name in self.loading, 'error': self.errors.get(name)} for name, spec in self.variants.items()}
+
+    def reload(self, name: str, **spec) -> bool:
+        """Load a (new) variant in the background and atomically swap it in once it is ready
+
+        Args:
+            name (str): Name of a configured variant.
+            spec: Changes to the specification of the variant, e.g. a new `checkpoint`.
+
+        Raises:
+            KeyError: The variant is not configured
+
+        Returns:
+            bool: False if the variant is already being loaded
+        """
+        with self.lock:
+            if name not in self.variants:
+                raise KeyError('Model "%s" is not configured. Choose one of %s' % (name, ', '.join(self.variants)))
+            if name in self.loading:
+                return False
+            spec = {**self.variants[name], **{k: v for k, v in spec.items() if v is not None}}
+            self.loading[name] = threading.Thread(target=self._reload, args=(name, spec), daemon=True)
+            self.loading[name].start()
+        return True
+
+    def _reload(self, name: str, spec: dict):
+        try:
+            start = time.time()
+            model = self._build(spec)
+            with self.lock:
+                self.models[name] = model
+                self.variants[name] = spec
+                self.versions[name] = self.versions.get(name, 0)+1
+                self.errors.pop(name, None)
+            logging.warning('Loaded model "%s" from %s in %.1fs' % (name, spec['checkpoint'], time.time()-start))
+        except Exception as e:
+            logging.exception('Loading model "%s" failed' % name)
+            with self.lock:
+                self.errors[name] = str(e)
+        finally:
+            with self.lock:
+                self.loading.pop(name, None)
+
+    @staticmethod
+    def _build(spec: dict) -> LatexOCR:
+        model = LatexOCR(Munch({'config': spec['config'], 'checkpoint': spec['checkpoint'],
+                                'no_cuda': spec.get('no_cuda', True), 'no_resize': spec.get('no_resize', False)}))
+        if spec.get('quantize', False):
+            model.model.decoder = torch.quantization.quantize_dynamic(model.model.decoder, {torch.nn.Linear}, dtype=torch.qint8)
+        return model
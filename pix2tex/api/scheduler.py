@@ -0,0 +1,130 @@
+from collections import deque
+from concurrent.futures import Future
+import threading
+import logging
+from typing import Dict, Optional
+
+import torch
+
+PRIORITIES = {'interactive': 4, 'bulk': 1}
+
+
+class InferenceRequest:
+    def __init__(self, image: torch.Tensor, priority: str, model, temperature: Optional[float] = None):
+        self.image = image
+        self.priority = priority
+        self.model = model
+        self.temperature = temperature
+        self.future = Future()
+
+
+class InferenceScheduler:
+    '''Single inference worker with weighted fair scheduling between priority classes.
+
+    Requests are queued per priority class. The worker picks the next class by
+    stride scheduling: every class advances its pass by `1/weight` whenever a
+    batch of it is run and the class with the smallest pass goes next. Requests of
+    the same image size, model and temperature in the chosen class are decoded together as one batch.
+    Between two decoding steps a running batch yields to any class the scheduler
+    would currently prefer, so interactive requests do not wait for a long bulk
+    batch to finish.
+    '''
+
+    def __init__(self, model=None, weights: Optional[Dict[str, float]] = None, max_batchsize: int = 8):
+        """
+        Args:
+            model (LatexOCR, optional): Model that does the work if a request does not name another one.
+            weights (Dict[str, float], optional): Share of the decoding time per priority class. Defaults to `PRIORITIES`.
+            max_batchsize (int, optional): Maximal number of images decoded together. Defaults to 8.
+        """
+        self.model = model
+        self.weights = dict(PRIORITIES if weights is None else weights)
+        self.max_batchsize = max_batchsize
+        self.queues = {name: deque() for name in self.weights}
+        self.passes = {name: 0. for name in self.weights}
+        self.vtime = 0.  # pass of the batch that was started last
+        self.cond = threading.Condition()
+        self.running = []  # priority classes of the (possibly preempted) batches on the worker stack
+        self.thread = threading.Thread(target=self._work, daemon=True)
+        self.thread.start()
+
+    def submit(self, image: torch.Tensor, priority: str = 'interactive', model=None, temperature: Optional[float] = None) -> Future:
+        """Queue a preprocessed image for decoding
+
+        Args:
+            image (torch.Tensor): Image tensor of shape (1, 1, H, W), see `LatexOCR.preprocess`.
+            priority (str, optional): Priority class. Defaults to 'interactive'.
+            model (LatexOCR, optional): Model to decode the image with. Defaults to the model of the scheduler.
+            temperature (float, optional): Sampling temperature. Defaults to the temperature of the model.
+
+        Returns:
+            Future: Resolves to the predicted Latex code
+        """
+        if priority not in self.queues:
+            raise ValueError('Unknown priority "%s". Choose one of %s' % (priority, ', '.join(self.queues)))
+        request = InferenceRequest(image, priority, self.model if model is None else model, temperature)
+        with self.cond:
+            if not self.queues[priority]:
+                # an idle class must not bank credit for the time it had nothing to do
+                self.passes[priority] = max(self.passes[priority], self.vtime)
+            self.queues[priority].append(request)
+            self.cond.notify()
+        return request.future
+
+    def _select(self, exclude=()) -> Optional[str]:
+        candidates = [name for name, queue in self.queues.items() if queue and name not in exclude]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda name: (self.passes[name], -self.weights[name]))
+
+    def _take_batch(self, priority: str):
+        queue = self.queues[priority]
+        shape, model, temperature = queue[0].image.shape, queue[0].model, queue[0].temperature
+        batch, rest = [], deque()
+        while queue and len(batch) < self.max_batchsize:
+            request = queue.popleft()
+            if request.image.shape != shape or request.model is not model or request.temperature != temperature:
+                rest.append(request)
+            elif request.future.set_running_or_notify_cancel():
+                batch.append(request)
+        rest.extend(queue)
+        self.queues[priority] = rest
+        self.vtime = self.passes[priority]
+        self.passes[priority] += 1/self.weights[priority]
+        return batch
+
+    def _run(self, priority: str, batch):
+        if not batch:
+            return
+        self.running.append(priority)
+        try:
+            preds = batch[0].model.generate(torch.cat([request.image for request in batch]), callback=self._preempt, temperature=batch[0].temperature)
+        except Exception as e:
+            logging.exception('Inference failed')
+            for request in batch:
+                request.future.set_exception(e)
+        else:
+            for request, pred in zip(batch, preds):
+                request.future.set_result(pred)
+        finally:
+            self.running.pop()
+
+    def _preempt(self, tokens=None):
+        # called between two decoding steps of the running batch
+        while True:
+            with self.cond:
+                priority = self._select(exclude=self.running)
+                if priority is None or self.passes[priority] >= self.passes[self.running[-1]]:
+                    return
+                batch = self._take_batch(priority)
+            self._run(priority, batch)
+
+    def _work(self):
+        while True:
+            with self.cond:
+                priority = self._select()
+                while priority is None:
+                    self.cond.wait()
+                    priority = self._select()
+                batch = self._take_batch(priority)
+            self._run(priority, batch)
@@ -0,0 +1,21 @@
+'''Per-user data directory without importing torch (`torch._appdirs`), same locations.'''
+import os
+import sys
+
+
+def user_data_dir(appname: str) -> str:
+    """Directory for user specific data of an application
+
+    Args:
+        appname (str): Name of the application
+
+    Returns:
+        str: `%LOCALAPPDATA%\\appname\\appname` on Windows, `~/Library/Application Support/appname` on macOS
+        and `$XDG_DATA_HOME/appname` (default `~/.local/share/appname`) elsewhere
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+        return os.path.join(base, appname, appname)
+    if sys.platform == 'darwin':
+        return os.path.join(os.path.expanduser('~/Library/Application Support'), appname)
+    return os.path.join(os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share'), appname)
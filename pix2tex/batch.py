@@ -0,0 +1,128 @@
+from collections import defaultdict
+from functools import partial
+from multiprocessing import Pool
+import glob
+import json
+import os
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from PIL import Image
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tif', '.tiff', '.webp')
+
+
+def collect_files(inputs: List[str]) -> List[str]:
+    """Expand files, directories (recursively) and glob patterns to a sorted list of image files
+
+    Args:
+        inputs (List[str]): Paths, directories or glob patterns
+
+    Returns:
+        List[str]: Absolute paths of the images
+    """
+    files = set()
+    for path in inputs:
+        path = os.path.expanduser(path)
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.update(os.path.join(root, name) for name in names if name.lower().endswith(IMAGE_EXTENSIONS))
+        elif os.path.isfile(path):
+            files.add(path)
+        else:
+            files.update(p for p in glob.glob(path, recursive=True) if os.path.isfile(p))
+    return sorted(os.path.abspath(f) for f in files)
+
+
+def load_image(path: str, max_dimensions: Tuple[int, int], min_dimensions: Tuple[int, int],
+               resize: bool = True) -> Tuple[str, Optional[Image.Image], Optional[str], float]:
+    """Decode, crop and scale an image (path or file object), see `prepare_image`. Runs in a worker process.
+
+    Returns:
+        Tuple[str, Optional[Image.Image], Optional[str], float]: path, image, error message and time needed
+    """
+    from pix2tex.cli import prepare_image
+    start = time.time()
+    try:
+        img = prepare_image(Image.open(path), max_dimensions, min_dimensions, resize)
+        return path, img, None, time.time()-start
+    except Exception as e:
+        return path, None, str(e), time.time()-start
+
+
+class BatchPredictor:
+    '''Group preprocessed images by size and decode every group once it is full.
+
+    Every result dict (`file`, `latex` or `error`, `timing`) is passed to `write`.
+    '''
+
+    def __init__(self, model, batchsize: int, write):
+        self.model = model
+        self.batchsize = batchsize
+        self.write = write
+        self.buckets = defaultdict(list)
+
+    def add(self, path: str, image, timing: dict):
+        bucket = self.buckets[tuple(image.shape)]
+        bucket.append((path, image, timing))
+        if len(bucket) >= self.batchsize:
+            self.flush(tuple(image.shape))
+
+    def flush(self, shape=None):
+        import torch
+        for key in ([shape] if shape is not None else list(self.buckets)):
+            items = self.buckets.pop(key, [])
+            if not items:
+                continue
+            start = time.time()
+            try:
+                preds = self.model.generate(torch.cat([image for _, image, _ in items]))
+            except Exception as e:
+                for path, _, timing in items:
+                    self.write({'file': path, 'error': str(e), 'timing': timing})
+                continue
+            decode = (time.time()-start)/len(items)
+            for (path, _, timing), pred in zip(items, preds):
+                self.write({'file': path, 'latex': pred, 'timing': {**timing, 'decode': round(decode, 4)}})
+
+    def predict(self, path: str, img, error: Optional[str], timing: dict, resize: bool = True):
+        """Finish preprocessing a loaded image (see `load_image`, with the same `resize`) and queue it for decoding"""
+        if error is None:
+            start = time.time()
+            try:
+                image = self.model.finish_preprocess(img, resize=resize)
+            except Exception as e:
+                error = str(e)
+            else:
+                timing['preprocess'] = round(time.time()-start, 4)
+                return self.add(path, image, timing)
+        self.write({'file': path, 'error': error, 'timing': timing})
+
+
+def write_jsonl(out):
+    def write(result: dict):
+        out.write(json.dumps(result)+'\n')
+        out.flush()
+    return write
+
+
+def main(arguments):
+    from pix2tex.cli import LatexOCR
+    files = collect_files(arguments.inputs)
+    if not files:
+        print('No images found.', file=sys.stderr)
+        return
+    out = open(arguments.output, 'w') if arguments.output else sys.stdout
+    # start the workers before the model is loaded so that they do not inherit it
+    with Pool(arguments.workers) as pool:
+        model = LatexOCR(arguments)
+        predictor = BatchPredictor(model, arguments.batchsize, write_jsonl(out))
+        # the workers do all preprocessing except for the resize model and the normalization
+        resize = model.resizes(not arguments.no_resize)
+        loader = partial(load_image, max_dimensions=model.args.max_dimensions, min_dimensions=model.args.min_dimensions, resize=resize)
+        for path, img, error, load in pool.imap_unordered(loader, files, chunksize=4):
+            predictor.predict(path, img, error, {'load': round(load, 4)}, resize=resize)
+        predictor.flush()
+    if out is not sys.stdout:
+        out.close()
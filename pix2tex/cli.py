@@ -1,10 +1,7 @@
 from pix2tex.dataset.transforms import test_transform
-import pandas.io.clipboard as clipboard
-from PIL import ImageGrab
 from PIL import Image
 import os
 from pathlib import Path
-import sys
 from typing import List, Optional, Tuple
 import atexit
 from contextlib import suppress
@@ -17,16 +14,13 @@ with suppress(ImportError, AttributeError):
 
 import numpy as np
 import torch
-from torch._appdirs import user_data_dir
 from munch import Munch
-from transformers import PreTrainedTokenizerFast
-from timm.models.resnetv2 import ResNetV2
-from timm.models.layers import StdConv2dSame
 
-from pix2tex.dataset.latex2png import tex2pil
-from pix2tex.models import get_model
+from pix2tex import clipboard
+from pix2tex.output import output_prediction
+from pix2tex.appdirs import user_data_dir
+from pix2tex.models import get_model, load_pretrained, find_weights
 from pix2tex.utils import *
-from pix2tex.model.checkpoints.get_latest_checkpoint import download_checkpoints
 
 
 def minmax_size(img: Image, max_dimensions: Tuple[int, int] = None, min_dimensions: Tuple[int, int] = None) -> Image:
@@ -55,6 +49,25 @@ def minmax_size(img: Image, max_dimensions: Tuple[int, int] = None, min_dimensio
     return img
 
 
+def prepare_image(img: Image, max_dimensions: Tuple[int, int], min_dimensions: Tuple[int, int], resize: bool = True) -> Image:
+    """The part of `LatexOCR.preprocess` that does not need the model: crop, pad and scale an image.
+    Can run in worker processes, `LatexOCR.finish_preprocess` turns the result into the model input.
+
+    Args:
+        img (Image): Image to preprocess.
+        max_dimensions (Tuple[int, int]): Maximum dimensions of the model.
+        min_dimensions (Tuple[int, int]): Minimum dimensions of the model.
+        resize (bool, optional): Whether the resize model is called afterwards, see `LatexOCR.resizes`. Defaults to True.
+
+    Returns:
+        Image: Prepared grayscale image
+    """
+    img = minmax_size(pad(img), max_dimensions, min_dimensions)
+    if not resize:
+        img = pad(img)
+    return img.convert('L')
+
+
 class LatexOCR:
     '''Get a prediction of an image in the easiest way'''
 
@@ -79,25 +92,30 @@ class LatexOCR:
         self.args.wandb = False
         self.args.device = 'cuda' if torch.cuda.is_available() and not self.args.no_cuda else 'cpu'
         if not os.path.exists(self.args.checkpoint):
+            from pix2tex.model.checkpoints.get_latest_checkpoint import download_checkpoints
             download_checkpoints()
-        self.model = get_model(self.args)
-        self.model.load_state_dict(torch.load(self.args.checkpoint, map_location=self.args.device))
+        self.model = get_model(self.args, checkpoint=find_weights(self.args.checkpoint))
         self.model.eval()
 
-        if 'image_resizer.pth' in os.listdir(os.path.dirname(self.args.checkpoint)) and not arguments.no_resize:
-            self.image_resizer = ResNetV2(layers=[2, 3, 3], num_classes=max(self.args.max_dimensions)//32, global_pool='avg', in_chans=1, drop_rate=.05,
-                                          preact=True, stem_type='same', conv_layer=StdConv2dSame).to(self.args.device)
-            self.image_resizer.load_state_dict(torch.load(os.path.join(os.path.dirname(self.args.checkpoint), 'image_resizer.pth'), map_location=self.args.device))
+        resizer = find_weights(os.path.join(os.path.dirname(self.args.checkpoint), 'image_resizer.pth'))
+        if os.path.exists(resizer) and not arguments.no_resize:
+            from timm.models.resnetv2 import ResNetV2
+            from timm.models.layers import StdConv2dSame
+            self.image_resizer = load_pretrained(lambda: ResNetV2(layers=[2, 3, 3], num_classes=max(self.args.max_dimensions)//32, global_pool='avg', in_chans=1, drop_rate=.05,
+                                                                  preact=True, stem_type='same', conv_layer=StdConv2dSame), resizer, self.args.device)
             self.image_resizer.eval()
-        self.tokenizer = PreTrainedTokenizerFast(tokenizer_file=self.args.tokenizer)
+        from tokenizers import Tokenizer
+        self.tokenizer = Tokenizer.from_file(self.args.tokenizer)
+        self.detokenizer = Detokenizer(self.tokenizer)
 
     @in_model_path()
-    def __call__(self, img=None, resize=True) -> str:
+    def __call__(self, img=None, resize=True, callback=None) -> str:
         """Get a prediction from an image
 
         Args:
             img (Image, optional): Image to predict. Defaults to None.
             resize (bool, optional): Whether to call the resize model. Defaults to True.
+            callback (callable, optional): Called with the generated tokens after every decoding step, see `generate`. Defaults to None.
 
         Returns:
             str: predicted Latex code
@@ -112,70 +130,87 @@ class LatexOCR:
                 img = self.last_pic.copy()
         else:
             self.last_pic = img.copy()
-        img = minmax_size(pad(img), self.args.max_dimensions, self.args.min_dimensions)
-        if (self.image_resizer is not None and not self.args.no_resize) and resize:
+        pred = self.generate(self.preprocess(img, resize=resize), callback=callback)[0]
+        try:
+            clipboard.copy(pred)
+        except:
+            pass
+        return pred
+
+    def resizes(self, resize=True) -> bool:
+        """Whether preprocessing calls the resize model"""
+        return self.image_resizer is not None and not self.args.no_resize and resize
+
+    def preprocess(self, img, resize=True) -> torch.Tensor:
+        """Crop, normalize and rescale an image to the input the model expects
+
+        Args:
+            img (Image): Image to preprocess.
+            resize (bool, optional): Whether to call the resize model. Defaults to True.
+
+        Returns:
+            torch.Tensor: Image tensor of shape (1, 1, H, W)
+        """
+        resize = self.resizes(resize)
+        return self.finish_preprocess(prepare_image(img, self.args.max_dimensions, self.args.min_dimensions, resize), resize)
+
+    def finish_preprocess(self, img, resize=True) -> torch.Tensor:
+        """Rescale (with the resize model) and normalize an image prepared by `prepare_image`
+
+        Args:
+            img (Image): Image returned by `prepare_image`.
+            resize (bool, optional): Whether to call the resize model, has to match the `resize` of `prepare_image`. Defaults to True.
+
+        Returns:
+            torch.Tensor: Image tensor of shape (1, 1, H, W)
+        """
+        if self.resizes(resize):
             with torch.no_grad():
-                input_image = img.convert('RGB').copy()
+                input_image = img.copy()
                 r, w, h = 1, input_image.size[0], input_image.size[1]
                 for _ in range(10):
                     h = int(h * r)  # height to resize
                     img = pad(minmax_size(input_image.resize((w, h), Image.Resampling.BILINEAR if r > 1 else Image.Resampling.LANCZOS), self.args.max_dimensions, self.args.min_dimensions))
-                    t = test_transform(image=np.array(img.convert('RGB')))['image'][:1].unsqueeze(0)
+                    t = test_transform(image=np.array(img.convert('L')))['image'].unsqueeze(0)
                     w = (self.image_resizer(t.to(self.args.device)).argmax(-1).item()+1)*32
                     logging.info(r, img.size, (w, int(input_image.size[1]*r)))
                     if (w == img.size[0]):
                         break
                     r = w/img.size[0]
         else:
-            img = np.array(pad(img).convert('RGB'))
-            t = test_transform(image=img)['image'][:1].unsqueeze(0)
-        im = t.to(self.args.device)
+            t = test_transform(image=np.array(img))['image'].unsqueeze(0)
+        return t
 
-        dec = self.model.generate(im.to(self.args.device), temperature=self.args.get('temperature', .25))
-        pred = post_process(token2str(dec, self.tokenizer)[0])
-        try:
-            clipboard.copy(pred)
-        except:
-            pass
-        return pred
+    def encode(self, images: torch.Tensor) -> torch.Tensor:
+        """Run the encoder on a batch of preprocessed images. The result can be decoded repeatedly with `generate`.
 
+        Args:
+            images (torch.Tensor): Images of shape (B, 1, H, W), see `preprocess`.
 
-def output_prediction(pred, args):
-    TERM = os.getenv('TERM', 'xterm')
-    if not sys.stdout.isatty():
-        TERM = 'dumb'
-    try:
-        from pygments import highlight
-        from pygments.lexers import get_lexer_by_name
-        from pygments.formatters import get_formatter_by_name
+        Returns:
+            torch.Tensor: Encoder output
+        """
+        return self.model.encode(images.to(self.args.device))
 
-        if TERM.split('-')[-1] == '256color':
-            formatter_name = 'terminal256'
-        elif TERM != 'dumb':
-            formatter_name = 'terminal'
-        else:
-            formatter_name = None
-        if formatter_name:
-            formatter = get_formatter_by_name(formatter_name)
-            lexer = get_lexer_by_name('tex')
-            print(highlight(pred, lexer, formatter), end='')
-    except ImportError:
-        TERM = 'dumb'
-    if TERM == 'dumb':
-        print(pred)
-    if args.show or args.katex:
-        try:
-            if args.katex:
-                raise ValueError
-            tex2pil([f'$${pred}$$'])[0].show()
-        except Exception as e:
-            # render using katex
-            import webbrowser
-            from urllib.parse import quote
-            url = 'https://katex.org/?data=' + \
-                quote('{"displayMode":true,"leqno":false,"fleqn":false,"throwOnError":true,"errorColor":"#cc0000",\
-"strict":"warn","output":"htmlAndMathml","trust":false,"code":"%s"}' % pred.replace('\\', '\\\\'))
-            webbrowser.open(url)
+    def generate(self, images: torch.Tensor, callback=None, context: torch.Tensor = None, temperature: float = None) -> List[str]:
+        """Decode a batch of preprocessed images of the same size
+
+        Args:
+            images (torch.Tensor): Images of shape (B, 1, H, W), see `preprocess`. Can be None if `context` is given.
+            callback (callable, optional): Called with the generated tokens after every decoding step. Defaults to None.
+            context (torch.Tensor, optional): Encoder output of the images (see `encode`), the encoder is skipped. Defaults to None.
+            temperature (float, optional): Sampling temperature. Defaults to the temperature of the arguments.
+
+        Returns:
+            List[str]: predicted Latex code for every image
+        """
+        if images is not None:
+            images = images.to(self.args.device)
+        if temperature is None:
+            temperature = self.args.get('temperature', .25)
+        dec = self.model.generate(images, temperature=temperature, callback=callback, context=context)
+        # a sequence keeps sampling until every sequence in the batch is done, the detokenizer stops at its EOS token
+        return [post_process(pred) for pred in self.detokenizer(dec)]
 
 
 def predict(model, file, arguments):
@@ -187,6 +222,7 @@ def predict(model, file, arguments):
             print(e, end='')
     else:
         try:
+            from PIL import ImageGrab
             img = ImageGrab.grabclipboard()
         except NotImplementedError as e:
             print(e, end='')
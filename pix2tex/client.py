@@ -0,0 +1,89 @@
+'''Thin client for the `pix2tex serve` daemon. Only uses the standard library so it starts fast.
+
+The protocol is line based JSON over a Unix domain socket: every request is one line
+`{"path": "/abs/path.png"}` or `{"image": "<base64 encoded file>"}` and is answered
+by one line `{"latex": "..."}` or `{"error": "..."}`. A request can also carry the
+decoding parameters `temperature` and `resize`, and the `settings` (config and checkpoint)
+of the model the client expects. If they differ from the daemon's model, the answer is
+`{"error": "...", "mismatch": true}` and the client predicts the images itself.
+'''
+import base64
+import json
+import os
+import socket
+import tempfile
+from typing import List, Optional
+
+
+def socket_path() -> str:
+    """Default location of the daemon socket, `$PIX2TEX_SOCKET` if set"""
+    if 'PIX2TEX_SOCKET' in os.environ:
+        return os.environ['PIX2TEX_SOCKET']
+    user = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', '')
+    return os.path.join(os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(), 'pix2tex-%s.sock' % user)
+
+
+def model_settings(arguments) -> dict:
+    """The arguments that select the model. Relative paths are relative to the model directory, as in `LatexOCR`."""
+    return {k: os.path.normpath(getattr(arguments, k)) for k in ['config', 'checkpoint']}
+
+
+def connect(path: Optional[str] = None, timeout: Optional[float] = None) -> Optional[socket.socket]:
+    """Connect to a running daemon
+
+    Args:
+        path (str, optional): Socket path. Defaults to `socket_path()`.
+        timeout (float, optional): Socket timeout in seconds. Defaults to None.
+
+    Returns:
+        Optional[socket.socket]: The connection. None if no daemon is running.
+    """
+    path = socket_path() if path is None else path
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def predict(files: List[str] = None, images: List[bytes] = None, path: Optional[str] = None, temperature: Optional[float] = None,
+            resize: bool = True, settings: Optional[dict] = None) -> Optional[List[dict]]:
+    """Let the daemon predict image files (paths) and/or raw image files (bytes)
+
+    Args:
+        files (List[str], optional): Paths of images.
+        images (List[bytes], optional): Encoded image files.
+        path (str, optional): Socket path. Defaults to `socket_path()`.
+        temperature (float, optional): Sampling temperature. Defaults to the temperature of the daemon.
+        resize (bool, optional): Whether to call the resize model. Defaults to True.
+        settings (dict, optional): Model the daemon has to use, see `model_settings`. Defaults to any model.
+
+    Returns:
+        Optional[List[dict]]: One `{"latex"}` or `{"error"}` dict per image. None if no daemon is running or it uses a different model.
+    """
+    options = {'resize': resize}
+    if temperature is not None:
+        options['temperature'] = temperature
+    if settings is not None:
+        options['settings'] = settings
+    requests = [{'path': os.path.abspath(f), **options} for f in files or []]
+    requests += [{'image': base64.b64encode(image).decode('ascii'), **options} for image in images or []]
+    sock = connect(path)
+    if sock is None:
+        return None
+    results = []
+    with sock, sock.makefile('rw', encoding='utf-8') as stream:
+        # one request at a time, the daemon blocks on writing answers nobody reads
+        for request in requests:
+            stream.write(json.dumps(request)+'\n')
+            stream.flush()
+            result = json.loads(stream.readline() or '{"error": "connection closed"}')
+            if result.get('mismatch'):
+                return None
+            results.append(result)
+    return results
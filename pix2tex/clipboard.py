@@ -0,0 +1,36 @@
+'''Copy text to the clipboard without pandas: pyperclip if it is installed, otherwise the tools of the platform.'''
+import os
+import shutil
+import subprocess
+import sys
+
+
+def copy(text: str):
+    """Copy text to the system clipboard
+
+    Uses pyperclip if it is installed, otherwise `pbcopy` (macOS), `clip` (Windows),
+    `wl-copy` (Wayland), `xclip` or `xsel` (X11).
+
+    Args:
+        text (str): Text to copy
+
+    Raises:
+        RuntimeError: No clipboard mechanism is available
+    """
+    try:
+        import pyperclip
+        return pyperclip.copy(text)
+    except ImportError:
+        pass
+    if sys.platform == 'darwin':
+        commands = [['pbcopy']]
+    elif sys.platform == 'win32':
+        return subprocess.run(['clip'], input=text.encode('utf-16'), check=True)
+    else:
+        commands = [['xclip', '-selection', 'clipboard'], ['xsel', '--clipboard', '--input']]
+        if os.environ.get('WAYLAND_DISPLAY'):
+            commands.insert(0, ['wl-copy'])
+    for command in commands:
+        if shutil.which(command[0]):
+            return subprocess.run(command, input=text.encode('utf-8'), check=True)
+    raise RuntimeError('No clipboard mechanism available. Install xclip, xsel or wl-clipboard.')
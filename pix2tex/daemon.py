@@ -0,0 +1,68 @@
+import base64
+import io
+import json
+import os
+import socketserver
+import sys
+
+from PIL import Image
+
+from pix2tex.client import connect, model_settings, socket_path
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                resize = request.get('resize', True)
+                if request.get('settings', self.server.settings) != self.server.settings or resize and self.server.no_resize:
+                    result = {'error': 'the daemon uses a different model', 'mismatch': True}
+                else:
+                    if 'path' in request:
+                        img = Image.open(request['path'])
+                    else:
+                        img = Image.open(io.BytesIO(base64.b64decode(request['image'])))
+                    model = self.server.model
+                    future = self.server.scheduler.submit(model.preprocess(img, resize=resize), model=model, temperature=request.get('temperature'))
+                    result = {'latex': future.result()}
+            except Exception as e:
+                result = {'error': str(e)}
+            self.wfile.write((json.dumps(result)+'\n').encode('utf-8'))
+            self.wfile.flush()
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def main(arguments):
+    from pix2tex.cli import LatexOCR
+    from pix2tex.api.scheduler import InferenceScheduler
+    path = socket_path() if arguments.socket is None else arguments.socket
+    if os.path.exists(path):
+        sock = connect(path)
+        if sock is not None:
+            sock.close()
+            print('pix2tex is already serving on %s' % path, file=sys.stderr)
+            return
+        # left behind by a daemon that did not shut down cleanly
+        os.unlink(path)
+    model = LatexOCR(arguments)
+    with Server(path, RequestHandler) as server:
+        os.chmod(path, 0o600)
+        server.model = model
+        server.settings = model_settings(arguments)
+        # without the resizer loaded, requests that want to resize are answered by the client itself
+        server.no_resize = arguments.no_resize
+        # concurrent clients share the decoding steps like in the api
+        server.scheduler = InferenceScheduler(model)
+        print('pix2tex serving on %s' % path, file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
@@ -7,14 +7,17 @@ import logging
 import glob
 import os
 from os.path import join
-from collections import defaultdict
 import pickle
+import hashlib
 import cv2
 from transformers import PreTrainedTokenizerFast
 from tqdm.auto import tqdm
 
 from pix2tex.utils.utils import in_model_path
 from pix2tex.dataset.transforms import train_transform, test_transform
+from pix2tex.dataset.index import DatasetIndex, is_index
+from pix2tex.dataset.shards import ShardReader
+from pix2tex.dataset.sampler import bucket, padding_efficiency
 
 
 
@@ -25,6 +28,8 @@ class Im2LatexDataset:
     max_dimensions = (1024, 512)
     min_dimensions = (32, 32)
     max_seq_len = 1024
+    length_band = 0
+    min_bucket_size = 0
     pad_token = "[PAD]"
     bos_token = "[BOS]"
     eos_token = "[EOS]"
@@ -32,10 +37,17 @@ class Im2LatexDataset:
     bos_token_id = 1
     eos_token_id = 2
     transform = train_transform
-    data = defaultdict(lambda: [])
+    index = None
+    shards = None
+    generator = None
+    data = {}
+    dropped = 0
+    settings = ['batchsize', 'shuffle', 'pad', 'keep_smaller_batches', 'test', 'max_seq_len', 'max_dimensions', 'min_dimensions',
+                'length_band', 'min_bucket_size']
 
     def __init__(self, equations=None, images=None, tokenizer=None, shuffle=True, batchsize=16, max_seq_len=1024,
-                 max_dimensions=(1024, 512), min_dimensions=(32, 32), pad=False, keep_smaller_batches=False, test=False):
+                 max_dimensions=(1024, 512), min_dimensions=(32, 32), pad=False, keep_smaller_batches=False, test=False,
+                 length_band=0, min_bucket_size=0):
         """Generates a torch dataset from pairs of `equations` and `images`.
 
         Args:
@@ -50,6 +62,8 @@ class Im2LatexDataset:
             pad (bool): Pad the images to `max_dimensions`. Defaults to False.
             keep_smaller_batches (bool): Whether to also return batches with smaller size than `batchsize`. Defaults to False.
             test (bool): Whether to use the test transformation or not. Defaults to False.
+            length_band (int): Also bucket the samples by token length in bands of this many tokens, 0 to only bucket by image size. Defaults to 0.
+            min_bucket_size (int): Merge length bands with fewer samples into their neighbours, 0 for `batchsize`. Defaults to 0.
         """
 
         if images is not None and equations is not None:
@@ -67,15 +81,23 @@ class Im2LatexDataset:
             self.pad = pad
             self.keep_smaller_batches = keep_smaller_batches
             self.test = test
+            self.length_band = length_band
+            self.min_bucket_size = min_bucket_size
             # check the image dimension for every image and group them together
+            widths, heights, equations, paths = [], [], [], []
             try:
                 for i, im in tqdm(enumerate(self.images), total=len(self.images)):
                     width, height = imagesize.get(im)
                     if min_dimensions[0] <= width <= max_dimensions[0] and min_dimensions[1] <= height <= max_dimensions[1]:
-                        self.data[(width, height)].append((eqs[self.indices[i]], im))
+                        widths.append(width)
+                        heights.append(height)
+                        equations.append(eqs[self.indices[i]])
+                        paths.append(im)
             except KeyboardInterrupt:
                 pass
-            self.data = dict(self.data)
+            self.index = DatasetIndex.from_samples(widths, heights, equations, paths)
+            self._tokenize()
+            self._filter()
             self._get_size()
 
             iter(self)
@@ -86,21 +108,29 @@ class Im2LatexDataset:
     def __iter__(self):
         self.i = 0
         self.transform = test_transform if self.test else train_transform
-        self.pairs = []
-        for k in self.data:
-            info = np.array(self.data[k], dtype=object)
-            p = torch.randperm(len(info)) if self.shuffle else torch.arange(len(info))
-            for i in range(0, len(info), self.batchsize):
-                batch = info[p[i:i+self.batchsize]]
-                if len(batch.shape) == 1:
-                    batch = batch[None, :]
-                if len(batch) < self.batchsize and not self.keep_smaller_batches:
-                    continue
-                self.pairs.append(batch)
+        self.pairs, self.dropped = [], 0
+        # shuffle with the generator of the epoch if there is one (see pix2tex.dataset.loader), not the global random state
+        rng = np.random if self.generator is None else self.generator
+        keys, rest = list(self.data), None
+        for j, k in enumerate(keys):
+            ids = self.data[k] if rest is None else np.concatenate([rest, self.data[k]])
+            if self.shuffle:
+                ids = ids[rng.permutation(len(ids))]
+            full = len(ids)//self.batchsize*self.batchsize
+            for i in range(0, full, self.batchsize):
+                # sorted rows are read front to back from the index and the shards
+                self.pairs.append(np.sort(ids[i:i+self.batchsize]))
+            rest = ids[full:] if full < len(ids) else None
+            if rest is None or j+1 < len(keys) and keys[j+1][:2] == k[:2]:
+                # rows of an incomplete batch fill up a batch of the next length band of the same image size
+                continue
+            if self.keep_smaller_batches:
+                self.pairs.append(np.sort(rest))
+            else:
+                self.dropped += len(rest)
+            rest = None
         if self.shuffle:
-            self.pairs = np.random.permutation(np.array(self.pairs, dtype=object))
-        else:
-            self.pairs = np.array(self.pairs, dtype=object)
+            self.pairs = [self.pairs[i] for i in rng.permutation(len(self.pairs))]
         self.size = len(self.pairs)
         return self
 
@@ -110,54 +140,99 @@ class Im2LatexDataset:
         self.i += 1
         return self.prepare_data(self.pairs[self.i-1])
 
-    def prepare_data(self, batch):
+    def prepare_data(self, batch, rng=None):
         """loads images into memory
 
         Args:
-            batch (numpy.array[[str, str]]): array of equations and image path pairs
+            batch (numpy.array[int]): rows of the samples in the index
+            rng (numpy.random.Generator, optional): random generator for the augmentations drawn here. Defaults to the global state.
 
         Returns:
             tuple(torch.tensor, torch.tensor): data in memory
         """
 
-        eqs, ims = batch.T
-        tok = self.tokenizer(list(eqs), return_token_type_ids=False)
-        # pad with bos and eos token
-        for k, p in zip(tok, [[self.bos_token_id, self.eos_token_id], [1, 1]]):
-            tok[k] = pad_sequence([torch.LongTensor([p[0]]+x+[p[1]]) for x in tok[k]], batch_first=True, padding_value=self.pad_token_id)
-        # check if sequence length is too long
-        if self.max_seq_len < tok['attention_mask'].shape[1]:
-            return next(self)
+        ims = self.index.paths(batch)
+        # token ids are cached in the index, pad them with bos and eos token
+        seqs = [torch.LongTensor([self.bos_token_id]+self.index.item('tokens', i).tolist()+[self.eos_token_id]) for i in batch]
+        tok = {'input_ids': pad_sequence(seqs, batch_first=True, padding_value=self.pad_token_id),
+               'attention_mask': pad_sequence([torch.ones_like(x) for x in seqs], batch_first=True, padding_value=self.pad_token_id)}
         images = []
-        for path in list(ims):
-            im = cv2.imread(path)
+        for path, im in zip(ims, self.read_images(batch)):
             if im is None:
                 print(path, 'not found!')
                 continue
-            im = cv2.cvtColor(im, cv2.COLOR_BGR2RGB)
             if not self.test:
                 # sometimes convert to bitmask
-                if np.random.random() < .04:
+                if (np.random if rng is None else rng).random() < .04:
                     im[im != 255] = 0
-            images.append(self.transform(image=im)['image'][:1])
+            images.append(self.transform(image=im)['image'])
         try:
             images = torch.cat(images).float().unsqueeze(1)
         except RuntimeError:
-            logging.critical('Images not working: %s' % (' '.join(list(ims))))
+            logging.critical('Images not working: %s' % (' '.join(ims)))
             return None, None
         if self.pad:
             h, w = images.shape[2:]
             images = F.pad(images, (0, self.max_dimensions[0]-w, 0, self.max_dimensions[1]-h), value=1)
         return tok, images
 
+    def read_images(self, batch):
+        """Read the images of a batch from the shards if there are any, otherwise from their files
+
+        Args:
+            batch (numpy.array[int]): rows of the samples in the index
+
+        Returns:
+            list: grayscale images as numpy arrays of shape (height, width), None for images that could not be read
+        """
+        images = self.shards.read(self.index, batch) if self.shards is not None else [None]*len(batch)
+        for j, i in enumerate(batch):
+            if images[j] is None:
+                images[j] = cv2.imread(self.index.path(i), cv2.IMREAD_GRAYSCALE)
+        return images
+
     def _get_size(self):
         self.size = 0
         for k in self.data:
             div, mod = divmod(len(self.data[k]), self.batchsize)
             self.size += div  # + (1 if mod > 0 else 0)
 
+    def _tokenize(self, chunksize=100000):
+        """Tokenize all equations once and store the token ids in the index (column `tokens`)"""
+        if getattr(self, 'tokenizer', None) is None:
+            return
+        tokenizer = hashlib.sha1(self.tokenizer.backend_tokenizer.to_str().encode('utf-8')).hexdigest()
+        if 'tokens' in self.index.columns and self.index.meta.get('tokens_tokenizer') == tokenizer:
+            return
+        ids = []
+        for i in range(0, len(self.index), chunksize):
+            ids.extend(self.tokenizer(self.index.equations(range(i, min(i+chunksize, len(self.index)))), return_token_type_ids=False,
+                                      return_attention_mask=False)['input_ids'])
+        self.index.set_ragged('tokens', ids, np.uint16 if len(self.tokenizer) <= 2**16 else np.int32)
+        self.index.meta['tokens_tokenizer'] = tokenizer
+
+    def _filter(self):
+        """Group the rows by image size and token length (see `pix2tex.dataset.sampler`), without images outside of
+        the dimension limits and sequences longer than `max_seq_len`"""
+        lengths = self.index.lengths('tokens')+2 if 'tokens' in self.index.columns else None
+        data = {}
+        for k, ids in self.index.buckets().items():
+            if self.min_dimensions[0] <= k[0] <= self.max_dimensions[0] and self.min_dimensions[1] <= k[1] <= self.max_dimensions[1]:
+                if lengths is not None:
+                    ids = ids[lengths[ids] <= self.max_seq_len]
+                if len(ids) > 0:
+                    data[k] = ids
+        if lengths is None:
+            self.data = data
+        else:
+            self.data = bucket(data, lengths, self.length_band, self.min_bucket_size or self.batchsize)
+
+    def padding_efficiency(self):
+        """Fraction of the token positions in the batches of the current epoch that are not padding"""
+        return padding_efficiency(self.pairs, self.index.lengths('tokens')+2)
+
     def load(self, filename, args=[]):
-        """returns a pickled version of a dataset
+        """returns a saved dataset. The index is memory-mapped, datasets pickled by older versions are converted.
 
         Args:
             filename (str): Path to dataset
@@ -167,8 +242,27 @@ class Im2LatexDataset:
                 tempf = os.path.join('..', filename)
                 if os.path.exists(tempf):
                     filename = os.path.realpath(tempf)
-        with open(filename, 'rb') as file:
-            x = pickle.load(file)
+        if is_index(filename):
+            x = Im2LatexDataset()
+            x.index = DatasetIndex.load(filename)
+            for k in self.settings:
+                if k in x.index.meta:
+                    setattr(x, k, x.index.meta[k])
+            if 'tokenizer' in x.index.meta:
+                from tokenizers import Tokenizer
+                x.tokenizer = PreTrainedTokenizerFast(tokenizer_object=Tokenizer.from_str(x.index.meta['tokenizer']))
+            if 'shards' in x.index.meta and 'shard' in x.index.columns:
+                x.shards = ShardReader(os.path.join(os.path.dirname(os.path.abspath(filename)), x.index.meta['shards']))
+        else:
+            with open(filename, 'rb') as file:
+                x = pickle.load(file)
+            if x.index is None:
+                samples = [(k[0], k[1], eq, path) for k in x.data for eq, path in x.data[k]]
+                x.index = DatasetIndex.from_samples(*[list(column) for column in zip(*samples)] if samples else [[]]*4)
+        x._tokenize()
+        x._filter()
+        x._get_size()
+        iter(x)
         return x
 
     def combine(self, x):
@@ -177,26 +271,45 @@ class Im2LatexDataset:
         Args:
             x (Im2LatexDataset): Dataset to absorb
         """
-        for key in x.data.keys():
-            if key in self.data.keys():
-                self.data[key].extend(x.data[key])
-                self.data[key] = list(set(self.data[key]))
-            else:
-                self.data[key] = x.data[key]
+        index = self.index.concatenate(x.index)
+        if self.index.meta.get('tokens_tokenizer') != x.index.meta.get('tokens_tokenizer'):
+            # token ids of a different tokenizer, tokenized again below
+            index.columns.pop('tokens', None)
+            index.columns.pop('tokens_offsets', None)
+        if self.shards is not None and (x.shards is None or os.path.abspath(x.shards.directory) != os.path.abspath(self.shards.directory)):
+            # the shard columns of the rows of `x` refer to other shard files, read all images from their paths instead
+            if x.shards is not None:
+                logging.warning('The datasets use different shard directories, images are read from their files')
+            index.columns.pop('shard', None)
+            index.columns.pop('shard_offset', None)
+            index.meta.pop('shards', None)
+            self.shards = None
+        # keep every (equation, image) pair once
+        first = {}
+        for i, pair in enumerate(zip(index.equations(range(len(index))), index.paths(range(len(index))))):
+            first.setdefault(pair, i)
+        self.index = index.select(sorted(first.values())) if len(first) < len(index) else index
+        self._tokenize()
+        self._filter()
         self._get_size()
         iter(self)
 
     def save(self, filename):
-        """save a pickled version of a dataset
+        """save the dataset as memory-mappable index (see `pix2tex.dataset.index`)
 
         Args:
             filename (str): Path to dataset
         """
-        with open(filename, 'wb') as file:
-            pickle.dump(self, file)
+        self.index.meta.update({k: getattr(self, k) for k in self.settings})
+        if self.shards is not None:
+            # the shard directory is stored relative to the dataset file
+            self.index.meta['shards'] = os.path.relpath(os.path.abspath(self.shards.directory), os.path.dirname(os.path.abspath(filename)))
+        if getattr(self, 'tokenizer', None) is not None:
+            self.index.meta['tokenizer'] = self.tokenizer.backend_tokenizer.to_str()
+        self.index.save(filename)
 
     def update(self, **kwargs):
-        for k in ['batchsize', 'shuffle', 'pad', 'keep_smaller_batches', 'test', 'max_seq_len']:
+        for k in ['batchsize', 'shuffle', 'pad', 'keep_smaller_batches', 'test', 'max_seq_len', 'length_band', 'min_bucket_size']:
             if k in kwargs:
                 setattr(self, k, kwargs[k])
         if 'max_dimensions' in kwargs or 'min_dimensions' in kwargs:
@@ -204,17 +317,14 @@ class Im2LatexDataset:
                 self.max_dimensions = kwargs['max_dimensions']
             if 'min_dimensions' in kwargs:
                 self.min_dimensions = kwargs['min_dimensions']
-            temp = {}
-            for k in self.data:
-                if self.min_dimensions[0] <= k[0] <= self.max_dimensions[0] and self.min_dimensions[1] <= k[1] <= self.max_dimensions[1]:
-                    temp[k] = self.data[k]
-            self.data = temp
         if 'tokenizer' in kwargs:
             tokenizer_file = kwargs['tokenizer']
             if not os.path.exists(tokenizer_file):
                 with in_model_path():
                     tokenizer_file = os.path.realpath(tokenizer_file)
             self.tokenizer = PreTrainedTokenizerFast(tokenizer_file=tokenizer_file)
+        self._tokenize()
+        self._filter()
         self._get_size()
         iter(self)
 
@@ -0,0 +1,190 @@
+'''Columnar on-disk index of a dataset.
+
+Every sample is one row. Fixed size columns (e.g. image `width` and `height`) are plain
+numpy arrays, variable size columns (e.g. `equations` and `paths`) are stored as one
+concatenated blob plus an offsets array (`<name>_offsets`, one entry more than rows).
+A saved index is a single file: a JSON header followed by the raw column data, which
+is memory-mapped when it is loaded. Rows are sorted by image size, so every bucket
+of same sized images is one contiguous range.
+'''
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+MAGIC = b'PIX2TEX\x01'
+ALIGNMENT = 64
+
+
+def is_index(filename: str) -> bool:
+    """Whether `filename` is a saved `DatasetIndex`"""
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def ragged(values: Iterable[np.ndarray], dtype) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate arrays to a blob and offsets
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: blob and offsets (length `len(values)+1`)
+    """
+    values = [np.asarray(v, dtype=dtype) for v in values]
+    offsets = np.zeros(len(values)+1, dtype=np.int64)
+    np.cumsum([len(v) for v in values], out=offsets[1:])
+    blob = np.concatenate(values) if values else np.zeros(0, dtype=dtype)
+    return blob, offsets
+
+
+def encode(strings: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    return ragged((np.frombuffer(s.encode('utf-8'), dtype=np.uint8) for s in strings), np.uint8)
+
+
+class DatasetIndex:
+    '''Rows of a dataset as numpy columns, see the module docstring'''
+
+    def __init__(self, columns: Dict[str, np.ndarray], meta: Optional[dict] = None):
+        self.columns = columns
+        self.meta = meta or {}
+        # name -> (array, offset) of the columns that are mapped from `filename`
+        self.filename, self.mapped = None, {}
+
+    @classmethod
+    def from_samples(cls, widths: List[int], heights: List[int], equations: List[str], paths: List[str]) -> 'DatasetIndex':
+        eqs, eq_offsets = encode(equations)
+        paths, path_offsets = encode(paths)
+        return cls({'width': np.asarray(widths, dtype=np.int32), 'height': np.asarray(heights, dtype=np.int32),
+                    'equations': eqs, 'equations_offsets': eq_offsets, 'paths': paths, 'paths_offsets': path_offsets})
+
+    def __len__(self):
+        return len(self.columns['width'])
+
+    def item(self, name: str, i: int) -> np.ndarray:
+        """Row `i` of the variable size column `name`"""
+        offsets = self.columns[name+'_offsets']
+        return self.columns[name][offsets[i]:offsets[i+1]]
+
+    def lengths(self, name: str) -> np.ndarray:
+        """Number of elements of every row of the variable size column `name`"""
+        return np.diff(self.columns[name+'_offsets'])
+
+    def set_ragged(self, name: str, values: Iterable[np.ndarray], dtype):
+        """Add or replace the variable size column `name` with one array per row"""
+        self.columns[name], self.columns[name+'_offsets'] = ragged(values, dtype)
+
+    def equation(self, i: int) -> str:
+        return self.item('equations', i).tobytes().decode('utf-8')
+
+    def path(self, i: int) -> str:
+        return self.item('paths', i).tobytes().decode('utf-8')
+
+    def equations(self, ids: Iterable[int]) -> List[str]:
+        return [self.equation(i) for i in ids]
+
+    def paths(self, ids: Iterable[int]) -> List[str]:
+        return [self.path(i) for i in ids]
+
+    def buckets(self) -> Dict[Tuple[int, int], np.ndarray]:
+        """Row ids grouped by image size
+
+        Returns:
+            Dict[Tuple[int, int], np.ndarray]: (width, height) -> row ids
+        """
+        keys = self.columns['width'].astype(np.int64) << 32 | self.columns['height'].astype(np.int64)
+        order = np.argsort(keys, kind='stable')
+        sizes, starts = np.unique(keys[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+        return {(int(k >> 32), int(k & 0xffffffff)): order[s:e] for k, s, e in zip(sizes, starts, ends)}
+
+    def select(self, ids: np.ndarray) -> 'DatasetIndex':
+        """New (in memory) index that only contains the rows `ids` in this order"""
+        ids = np.asarray(ids, dtype=np.int64)
+        columns = {}
+        for name, values in self.columns.items():
+            if name.endswith('_offsets') and name[:-len('_offsets')] in self.columns:
+                continue
+            if name+'_offsets' in self.columns:
+                columns[name], columns[name+'_offsets'] = ragged((self.item(name, i) for i in ids), values.dtype)
+            else:
+                columns[name] = np.asarray(values[ids])
+        return DatasetIndex(columns, dict(self.meta))
+
+    def concatenate(self, other: 'DatasetIndex') -> 'DatasetIndex':
+        """New (in memory) index with the rows of both indices. Only columns both have are kept."""
+        columns = {}
+        for name in self.columns:
+            if name not in other.columns or name.endswith('_offsets') and name[:-len('_offsets')] in self.columns:
+                continue
+            if name+'_offsets' in self.columns:
+                if name+'_offsets' not in other.columns:
+                    continue
+                columns[name] = np.concatenate([self.columns[name], other.columns[name]])
+                columns[name+'_offsets'] = np.concatenate([self.columns[name+'_offsets'],
+                                                           other.columns[name+'_offsets'][1:]+self.columns[name+'_offsets'][-1]])
+            else:
+                columns[name] = np.concatenate([self.columns[name], other.columns[name]])
+        return DatasetIndex(columns, dict(self.meta))
+
+    def save(self, filename: str):
+        """Write the index sorted by image size to `filename`"""
+        keys = self.columns['width'].astype(np.int64) << 32 | self.columns['height'].astype(np.int64)
+        order = np.argsort(keys, kind='stable')
+        index = self if np.all(order == np.arange(len(order))) else self.select(order)
+        columns, offset = {}, 0
+        for name, values in index.columns.items():
+            columns[name] = {'dtype': values.dtype.str, 'shape': list(values.shape), 'offset': offset}
+            offset += -(-values.nbytes//ALIGNMENT)*ALIGNMENT
+        header = json.dumps({'meta': self.meta, 'columns': columns}).encode('utf-8')
+        start = -(-(len(MAGIC)+8+len(header))//ALIGNMENT)*ALIGNMENT
+        with open(filename+'.tmp', 'wb') as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(8, 'little'))
+            f.write(header)
+            for name, values in index.columns.items():
+                f.seek(start+columns[name]['offset'])
+                f.write(np.ascontiguousarray(values).tobytes())
+            f.truncate(start+offset)
+        os.replace(filename+'.tmp', filename)
+
+    @classmethod
+    def load(cls, filename: str) -> 'DatasetIndex':
+        """Memory-map an index written by `save`"""
+        with open(filename, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError('%s is not a dataset index' % filename)
+            size = int.from_bytes(f.read(8), 'little')
+            header = json.loads(f.read(size).decode('utf-8'))
+        start = -(-(len(MAGIC)+8+size)//ALIGNMENT)*ALIGNMENT
+        columns = {}
+        for name, column in header['columns'].items():
+            shape = tuple(column['shape'])
+            if np.prod(shape) == 0:
+                columns[name] = np.zeros(shape, dtype=column['dtype'])
+            else:
+                columns[name] = np.memmap(filename, dtype=column['dtype'], mode='r', offset=start+column['offset'], shape=shape)
+        index = cls(columns, header['meta'])
+        index.filename = filename
+        index.mapped = {name: (columns[name], start+column['offset']) for name, column in header['columns'].items()
+                        if isinstance(columns[name], np.memmap)}
+        return index
+
+    def __getstate__(self):
+        # mapped columns are mapped again when unpickled (e.g. in worker processes) instead of being copied
+        columns = {}
+        for name, values in self.columns.items():
+            if name in self.mapped and self.mapped[name][0] is values:
+                columns[name] = ('mapped', values.dtype.str, values.shape, self.mapped[name][1])
+            else:
+                columns[name] = values
+        return {'columns': columns, 'meta': self.meta, 'filename': self.filename}
+
+    def __setstate__(self, state):
+        self.__init__({}, state['meta'])
+        self.filename = state['filename']
+        for name, values in state['columns'].items():
+            if isinstance(values, tuple):
+                _, dtype, shape, offset = values
+                values = np.memmap(self.filename, dtype=dtype, mode='r', offset=offset, shape=shape)
+                self.mapped[name] = (values, offset)
+            self.columns[name] = values
+
@@ -0,0 +1,81 @@
+'''Prepare the batches of an `Im2LatexDataset` in worker processes.
+
+The batches of an epoch (which images and equations form a batch and in which order)
+are still drawn by `iter(dataset)` in the main process, so bucketing by image size and
+shuffling behave exactly as without workers. Loading, padding and augmenting a batch
+happens in `torch.utils.data.DataLoader` workers with a bounded number of prefetched
+batches. The random state for the shuffling and the augmentations is derived from the
+seed, the epoch and the batch number, so the result does not depend on the number of
+workers. The global random state of the training process (e.g. for dropout) is not
+changed, also not when the batches are prepared in it (`workers: 0`).
+'''
+from contextlib import contextmanager
+import random
+
+import numpy as np
+from torch.utils.data import Dataset, DataLoader
+
+
+def identity(batch):
+    return batch
+
+
+@contextmanager
+def seeded(seed: int):
+    """Seed the global `random` and `np.random` state the augmentations (albumentations) draw from and restore it afterwards"""
+    state = random.getstate(), np.random.get_state()
+    random.seed(seed)
+    np.random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state[0])
+        np.random.set_state(state[1])
+
+
+class EpochBatches(Dataset):
+    '''The batches of the current epoch of an `Im2LatexDataset`, one batch per item'''
+
+    def __init__(self, dataset, seed: int, epoch: int):
+        self.dataset = dataset
+        self.seed = seed
+        self.epoch = epoch
+
+    def __len__(self):
+        return len(self.dataset.pairs)
+
+    def __getitem__(self, i):
+        seeds = np.random.SeedSequence([self.seed, self.epoch, i])
+        with seeded(int(seeds.generate_state(1)[0])):
+            return self.dataset.prepare_data(self.dataset.pairs[i], rng=np.random.default_rng(seeds))
+
+
+class PrefetchLoader:
+    '''Iterate over an `Im2LatexDataset` while `workers` processes prepare the next batches
+
+    Args:
+        dataset (Im2LatexDataset): Dataset to iterate over
+        workers (int, optional): Number of worker processes, 0 prepares the batches in the main process. Defaults to 4.
+        prefetch (int, optional): Number of batches every worker prepares in advance. Defaults to 2.
+        seed (int, optional): Seed for the augmentations. Defaults to 42.
+    '''
+
+    def __init__(self, dataset, workers: int = 4, prefetch: int = 2, seed: int = 42):
+        self.dataset = dataset
+        self.workers = workers
+        self.prefetch = prefetch
+        self.seed = seed
+        self.epoch = 0
+
+    def __len__(self):
+        return len(self.dataset)
+
+    def __iter__(self):
+        self.dataset.generator = np.random.default_rng([self.seed, self.epoch])
+        iter(self.dataset)
+        batches = EpochBatches(self.dataset, self.seed, self.epoch)
+        self.epoch += 1
+        if self.workers <= 0:
+            return (batches[i] for i in range(len(batches)))
+        return iter(DataLoader(batches, batch_size=None, shuffle=False, num_workers=self.workers,
+                               prefetch_factor=self.prefetch, collate_fn=identity))
@@ -0,0 +1,36 @@
+import unittest
+import numpy as np
+from pix2tex.dataset.sampler import length_bands, bucket, padding_efficiency
+
+
+class TestSampler(unittest.TestCase):
+    def setUp(self):
+        self.lengths = np.random.default_rng(0).geometric(.02, size=5000)+2
+        self.ids = np.arange(len(self.lengths))
+
+    def test_bands(self):
+        for band, min_size in [(0, 64), (16, 64), (16, 1000), (16, 10000), (4, 1)]:
+            buckets = length_bands(self.ids, self.lengths, band, min_size)
+            self.assertTrue(np.array_equal(np.sort(np.concatenate(buckets)), self.ids))
+            for b in buckets:
+                self.assertGreaterEqual(len(b), min(min_size, len(self.ids)))
+            if band > 0:
+                # buckets do not overlap in length
+                for a, b in zip(buckets, buckets[1:]):
+                    self.assertLessEqual(self.lengths[a].max(), self.lengths[b].min())
+
+    def test_bucket(self):
+        buckets = bucket({(64, 32): self.ids[:100], (128, 32): self.ids[100:]}, self.lengths, 16, 50)
+        self.assertEqual({k[:2] for k in buckets}, {(64, 32), (128, 32)})
+        self.assertEqual(sum(len(b) for b in buckets.values()), len(self.ids))
+
+    def test_efficiency(self):
+        self.assertEqual(padding_efficiency([np.array([0, 1])], np.array([5, 5])), 1)
+        self.assertEqual(padding_efficiency([np.array([0, 1])], np.array([2, 6])), 8/12)
+        batches = [b[i:i+64] for b in length_bands(self.ids, self.lengths, 16, 64) for i in range(0, len(b), 64)]
+        unbucketed = [self.ids[i:i+64] for i in range(0, len(self.ids), 64)]
+        self.assertGreater(padding_efficiency(batches, self.lengths), padding_efficiency(unbucketed, self.lengths))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+'''Bucketing of the samples by image size and token length.
+
+The images of a batch have to be of the same size, so samples are first grouped by
+`(width, height)`. The token sequences of a batch are padded to the longest one, so
+every image size bucket is split further into bands of `length_band` tokens. Bands
+with fewer than `min_size` samples would mostly give incomplete batches, they are
+merged with the next longer band of the same image size (the last one with the band
+before it) until every bucket is large enough.
+'''
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+def length_bands(ids: np.ndarray, lengths: np.ndarray, band: int, min_size: int) -> List[np.ndarray]:
+    """Split the rows `ids` of one image size into buckets of similar token length
+
+    Args:
+        ids (np.ndarray): Row ids
+        lengths (np.ndarray): Token lengths of all rows of the index
+        band (int): Width of a length band in tokens, 0 keeps all rows in one bucket
+        min_size (int): Sparse bands are merged with their neighbours until a bucket has this many rows
+
+    Returns:
+        List[np.ndarray]: Row ids of every bucket, from short to long sequences
+    """
+    if band <= 0 or len(ids) == 0:
+        return [ids]
+    ids = ids[np.argsort(lengths[ids], kind='stable')]
+    bands = lengths[ids]//band
+    ends = np.append(np.flatnonzero(np.diff(bands))+1, len(ids))
+    buckets, start = [], 0
+    for end in ends:
+        if end-start >= min_size:
+            buckets.append(ids[start:end])
+            start = end
+    if start < len(ids):
+        if buckets:
+            buckets[-1] = ids[start-len(buckets[-1]):]
+        else:
+            buckets.append(ids[start:])
+    return buckets
+
+
+def bucket(data: Dict[Tuple[int, int], np.ndarray], lengths: np.ndarray, band: int, min_size: int) -> Dict[Tuple[int, int, int], np.ndarray]:
+    """Buckets by image size and token length band
+
+    Args:
+        data (Dict[Tuple[int, int], np.ndarray]): (width, height) -> row ids
+        lengths (np.ndarray): Token lengths of all rows of the index
+        band (int): Width of a length band in tokens, 0 only buckets by image size
+        min_size (int): Minimal number of rows of a bucket (see `length_bands`)
+
+    Returns:
+        Dict[Tuple[int, int, int], np.ndarray]: (width, height, shortest length in the bucket) -> row ids
+    """
+    buckets = {}
+    for (w, h), ids in data.items():
+        for b in length_bands(ids, lengths, band, min_size):
+            buckets[(w, h, int(lengths[b].min()) if band > 0 else 0)] = b
+    return buckets
+
+
+def padding_efficiency(batches: Iterable[np.ndarray], lengths: np.ndarray) -> float:
+    """Fraction of the padded token positions of `batches` that are actual tokens
+
+    Args:
+        batches (Iterable[np.ndarray]): Row ids of every batch
+        lengths (np.ndarray): Token lengths of all rows of the index
+
+    Returns:
+        float: tokens / (batch size * longest sequence), summed over all batches
+    """
+    tokens, padded = 0, 0
+    for batch in batches:
+        if len(batch) == 0:
+            continue
+        ls = lengths[batch]
+        tokens += int(ls.sum())
+        padded += len(batch)*int(ls.max())
+    return tokens/padded if padded else 1.
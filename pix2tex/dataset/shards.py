@@ -0,0 +1,131 @@
+'''Packed image shards for training.
+
+The images of a dataset are decoded once, converted to grayscale uint8 and written
+back to back into large shard files (`shard-00000.bin`, ...) in the order of the dataset
+index. The index is sorted by image size, so the images of one `(width, height)` bucket
+are stored next to each other. Every row of the index gets the shard it is stored in
+(`shard`, -1 if the image could not be read) and its byte offset (`shard_offset`); the
+width and height of the image are already columns of the index. Shards are memory-mapped
+when they are read.
+
+Convert a dataset with
+    python -m pix2tex.dataset.shards --data dataset.pkl --out shards/
+The converted dataset is written to `shards/dataset.pkl`, see `--output-data` and `--in-place`.
+'''
+from multiprocessing import Pool
+import argparse
+import logging
+import os
+from typing import List, Optional
+
+import numpy as np
+import cv2
+from tqdm.auto import tqdm
+
+from pix2tex.dataset.index import DatasetIndex
+
+
+def shard_name(shard: int) -> str:
+    return 'shard-%05d.bin' % shard
+
+
+class ShardReader:
+    '''Read images of a dataset index from its shards'''
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.files = {}
+
+    def file(self, shard: int) -> np.memmap:
+        if shard not in self.files:
+            self.files[shard] = np.memmap(os.path.join(self.directory, shard_name(shard)), dtype=np.uint8, mode='r')
+        return self.files[shard]
+
+    def read(self, index: DatasetIndex, ids: np.ndarray) -> List[Optional[np.ndarray]]:
+        """Images of the rows `ids`
+
+        Args:
+            index (DatasetIndex): Index with the `shard` and `shard_offset` columns
+            ids (np.ndarray): Rows to read. Reads are faster if they are sorted.
+
+        Returns:
+            List[Optional[np.ndarray]]: Grayscale images of shape (height, width), None if the image is not in a shard
+        """
+        images = []
+        for i in ids:
+            shard = int(index.columns['shard'][i])
+            if shard < 0:
+                images.append(None)
+                continue
+            w, h, offset = int(index.columns['width'][i]), int(index.columns['height'][i]), int(index.columns['shard_offset'][i])
+            images.append(np.array(self.file(shard)[offset:offset+w*h]).reshape(h, w))
+        return images
+
+    def __getstate__(self):
+        # memory maps are opened again in every worker process
+        return {'directory': self.directory, 'files': {}}
+
+
+def read_image(args):
+    path, width, height = args
+    im = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    if im is None or im.shape != (height, width):
+        return None
+    return im
+
+
+def convert(index: DatasetIndex, directory: str, shard_size: int = 2**30, workers: int = None):
+    """Write the images of `index` to shards in `directory` and add the `shard` and `shard_offset` columns to the index
+
+    Args:
+        index (DatasetIndex): Index sorted by image size (as saved by `DatasetIndex.save`)
+        directory (str): Output directory
+        shard_size (int, optional): Approximate size of a shard file in bytes. Defaults to 1GiB.
+        workers (int, optional): Number of processes decoding images. Defaults to the number of CPUs.
+    """
+    os.makedirs(directory, exist_ok=True)
+    n = len(index)
+    shards, offsets = np.full(n, -1, dtype=np.int32), np.zeros(n, dtype=np.int64)
+    widths, heights = index.columns['width'], index.columns['height']
+    jobs = ((index.path(i), int(widths[i]), int(heights[i])) for i in range(n))
+    shard, out, missing = 0, None, 0
+    with Pool(workers) as pool:
+        for i, im in enumerate(tqdm(pool.imap(read_image, jobs, chunksize=64), total=n)):
+            if im is None:
+                missing += 1
+                continue
+            if out is None or out.tell() >= shard_size:
+                if out is not None:
+                    out.close()
+                    shard += 1
+                out = open(os.path.join(directory, shard_name(shard)), 'wb')
+            shards[i], offsets[i] = shard, out.tell()
+            out.write(np.ascontiguousarray(im).tobytes())
+    if out is not None:
+        out.close()
+    if missing:
+        logging.warning('%i images could not be read, they are loaded from their path' % missing)
+    index.columns['shard'], index.columns['shard_offset'] = shards, offsets
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Pack the images of a dataset into shards')
+    parser.add_argument('-d', '--data', type=str, required=True, help='dataset (see pix2tex.dataset.dataset)')
+    parser.add_argument('-o', '--out', type=str, required=True, help='output directory for the shards')
+    parser.add_argument('--output-data', type=str, default=None, help='where to save the dataset that uses the shards. Defaults to the file name of --data in --out')
+    parser.add_argument('--in-place', action='store_true', help='replace --data with the dataset that uses the shards')
+    parser.add_argument('-s', '--shard-size', type=int, default=1024, help='size of a shard in MiB')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='number of processes decoding images')
+    args = parser.parse_args()
+    from pix2tex.dataset.dataset import Im2LatexDataset
+    dataset = Im2LatexDataset().load(args.data)
+    output = args.data if args.in_place else args.output_data or os.path.join(args.out, os.path.basename(args.data))
+    os.makedirs(args.out, exist_ok=True)
+    # rows are sorted by image size once the index is saved
+    dataset.save(output)
+    index = DatasetIndex.load(output)
+    # in memory, so that the file can be replaced
+    index = DatasetIndex({k: np.array(v) for k, v in index.columns.items()}, index.meta)
+    convert(index, args.out, args.shard_size*2**20, args.workers)
+    index.meta['shards'] = os.path.relpath(os.path.abspath(args.out), os.path.dirname(os.path.abspath(output)))
+    index.save(output)
@@ -1,29 +1,48 @@
 import albumentations as alb
-from albumentations.pytorch import ToTensorV2
+import numpy as np
+import torch
 
-train_transform = alb.Compose(
+
+class Grayscale:
+    '''Apply albumentations transforms to a single channel image of shape (H, W) or (H, W, 1)
+
+    The image is passed to the transforms as (H, W, 1), which albumentations handles in all
+    supported releases. The result is returned as tensor of shape (1, H, W), also if a
+    transform dropped the channel axis.
+    '''
+
+    def __init__(self, transforms):
+        self.transform = alb.Compose(transforms)
+
+    def __call__(self, image, **kwargs):
+        if image.ndim == 2:
+            image = image[..., None]
+        image = self.transform(image=image, **kwargs)['image']
+        image = np.ascontiguousarray(image.reshape(image.shape[:2]))
+        return {'image': torch.from_numpy(image)[None]}
+
+
+# the images are loaded as single channel grayscale images
+train_transform = Grayscale(
     [
         alb.Compose(
             [alb.ShiftScaleRotate(shift_limit=0, scale_limit=(-.15, 0), rotate_limit=1, border_mode=0, interpolation=3,
-                                  value=[255, 255, 255], p=1),
-             alb.GridDistortion(distort_limit=0.1, border_mode=0, interpolation=3, value=[255, 255, 255], p=.5)], p=.15),
+                                  value=255, p=1),
+             alb.GridDistortion(distort_limit=0.1, border_mode=0, interpolation=3, value=255, p=.5)], p=.15),
         # alb.InvertImg(p=.15),
-        alb.RGBShift(r_shift_limit=15, g_shift_limit=15,
-                     b_shift_limit=15, p=0.3),
-        alb.GaussNoise(10, p=.2),
+        # grayscale version of the former RGBShift(15, 15, 15) followed by ToGray: a brightness shift of up to 15
+        alb.RandomBrightnessContrast(15/255, 0, True, p=0.3),
+        # noise of the three channels used to be averaged by ToGray, which reduced its variance to ~0.45
+        alb.GaussNoise(4.5, p=.2),
         alb.RandomBrightnessContrast(.05, (-.2, 0), True, p=0.2),
         alb.ImageCompression(95, p=.3),
-        alb.ToGray(always_apply=True),
-        alb.Normalize((0.7931, 0.7931, 0.7931), (0.1738, 0.1738, 0.1738)),
+        alb.Normalize((0.7931,), (0.1738,)),
         # alb.Sharpen()
-        ToTensorV2(),
     ]
 )
-test_transform = alb.Compose(
+test_transform = Grayscale(
     [
-        alb.ToGray(always_apply=True),
-        alb.Normalize((0.7931, 0.7931, 0.7931), (0.1738, 0.1738, 0.1738)),
+        alb.Normalize((0.7931,), (0.1738,)),
         # alb.Sharpen()
-        ToTensorV2(),
     ]
-)
\ No newline at end of file
+)
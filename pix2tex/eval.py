@@ -11,20 +11,12 @@ from tqdm.auto import tqdm
 import wandb
 from Levenshtein import distance
 
-from pix2tex.models import get_model, Model
+from pix2tex.models import get_model, find_weights, Model
 from pix2tex.utils import *
 
 
 def detokenize(tokens, tokenizer):
-    toks = [tokenizer.convert_ids_to_tokens(tok) for tok in tokens]
-    for b in range(len(toks)):
-        for i in reversed(range(len(toks[b]))):
-            if toks[b][i] is None:
-                toks[b][i] = ''
-            toks[b][i] = toks[b][i].replace('Ġ', ' ').strip()
-            if toks[b][i] in (['[BOS]', '[EOS]', '[PAD]']):
-                del toks[b][i]
-    return toks
+    return get_detokenizer(tokenizer).tokens(tokens, stop_at_eos=False)
 
 
 @torch.no_grad()
@@ -119,11 +111,10 @@ if __name__ == '__main__':
     args.temperature = parsed_args.temperature
     logging.getLogger().setLevel(logging.DEBUG if parsed_args.debug else logging.WARNING)
     seed_everything(args.seed if 'seed' in args else 42)
-    model = get_model(args)
     if parsed_args.checkpoint is None:
         with in_model_path():
             parsed_args.checkpoint = os.path.realpath('checkpoints/weights.pth')
-    model.load_state_dict(torch.load(parsed_args.checkpoint, args.device))
+    model = get_model(args, checkpoint=find_weights(parsed_args.checkpoint))
     dataset = Im2LatexDataset().load(parsed_args.data)
     valargs = args.copy()
     valargs.update(batchsize=args.testbatchsize, keep_smaller_batches=True, test=True)
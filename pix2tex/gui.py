@@ -1,11 +1,15 @@
 from shutil import which
 import io
+import json
+import re
 import subprocess
 import sys
 import os
 import tempfile
+import threading
+import traceback
 from PyQt6 import QtCore, QtGui
-from PyQt6.QtCore import Qt, pyqtSlot, pyqtSignal, QThread, QTimer
+from PyQt6.QtCore import pyqtSlot, pyqtSignal, QThread, QTimer, QResource
 from PyQt6.QtGui import QGuiApplication
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWidgets import QMainWindow, QApplication, QMessageBox, QVBoxLayout, QWidget, \
@@ -15,18 +19,39 @@ from pynput.mouse import Controller
 from PIL import ImageGrab, Image
 import numpy as np
 from screeninfo import get_monitors
-from pix2tex import cli
-from pix2tex.utils import in_model_path
+from pix2tex import cli, clipboard
+from pix2tex.utils import in_model_path, post_process
+
+# MathJax and the icons, built with `pyside6-rcc --binary --no-compress resources.qrc -o resources.rcc`.
+# Qt memory-maps the uncompressed file and only reads a resource when it is used
+QResource.registerResource(os.path.join(os.path.dirname(__file__), 'resources', 'resources.rcc'))
+
 
-import pix2tex.resources.resources
 class App(QMainWindow):
     isProcessing = False
 
     def __init__(self, args=None):
         super().__init__()
         self.args = args
-        self.model = cli.LatexOCR(self.args)
         self.initUI()
+        # the model is loaded by the worker, snips are predicted once it is ready
+        self.worker = ModelThread(self.args)
+        self.worker.predicted.connect(self.returnPrediction)
+        self.worker.partial.connect(self.returnPartial)
+        self.worker.progress.connect(self.showDownloadProgress)
+        self.worker.ready.connect(self.modelReady)
+        self.worker.failed.connect(self.modelFailed)
+        self.statusBar().showMessage('Loading model...')
+        self.worker.start()
+        # the equation is rendered at most every 100ms while it is decoded
+        self.partialPrediction = None
+        self.partialShown = False
+        # id of the current snip, signals of older (cancelled) predictions are ignored
+        self.request = 0
+        self.partialTimer = QTimer(self)
+        self.partialTimer.setSingleShot(True)
+        self.partialTimer.setInterval(100)
+        self.partialTimer.timeout.connect(self.displayPartial)
         self.snipWidget = SnipWidget(self)
         self.show()
 
@@ -102,7 +127,6 @@ class App(QMainWindow):
                 text = 'Snip [Alt+S]'
             func = self.onClick
             self.retryButton.setEnabled(True)
-        self.shortcut.setEnabled(not self.isProcessing)
         self.snipButton.setText(text)
         self.snipButton.clicked.disconnect()
         self.snipButton.clicked.connect(func)
@@ -126,10 +150,10 @@ class App(QMainWindow):
 
     @pyqtSlot()
     def interrupt(self):
-        if hasattr(self, 'thread'):
-            self.thread.terminate()
-            self.thread.wait()
-            self.toggleProcessing(False)
+        self.request += 1
+        self.partialTimer.stop()
+        self.worker.cancel()
+        self.toggleProcessing(False)
 
     def snip_using_gnome_screenshot(self):
         try:
@@ -160,23 +184,23 @@ class App(QMainWindow):
             self.returnSnip()
 
     def returnSnip(self, img=None):
+        self.request += 1
+        self.partialTimer.stop()
+        self.partialPrediction = None
+        self.partialShown = False
         self.toggleProcessing(True)
         self.retryButton.setEnabled(False)
 
         self.show()
-        try:
-            self.model.args.temperature = self.tempField.value()
-            if self.model.args.temperature == 0:
-                self.model.args.temperature = 1e-8
-        except:
-            pass
-        # Run the model in a separate thread
-        self.thread = ModelThread(img=img, model=self.model)
-        self.thread.finished.connect(self.returnPrediction)
-        self.thread.finished.connect(self.thread.deleteLater)
-        self.thread.start()
-
-    def returnPrediction(self, result):
+        temperature = self.tempField.value()
+        if temperature == 0:
+            temperature = 1e-8
+        # a prediction that is still running for an older snip is cancelled
+        self.worker.submit(img, temperature, self.request)
+
+    def returnPrediction(self, request, result):
+        if request != self.request:
+            return
         self.toggleProcessing(False)
         success, prediction = result["success"], result["prediction"]
 
@@ -190,8 +214,62 @@ class App(QMainWindow):
             msg.setText("Prediction failed.")
             msg.exec()
 
+    def showDownloadProgress(self, name, done, total):
+        if total > 0:
+            self.statusBar().showMessage('Downloading %s: %.1f/%.1f MB' % (name, done/2**20, total/2**20))
+        else:
+            self.statusBar().showMessage('Downloading %s: %.1f MB' % (name, done/2**20))
+
+    def loadModel(self):
+        self.snipButton.setEnabled(False)
+        self.statusBar().showMessage('Loading model...')
+        self.worker.start()
+
+    def modelReady(self):
+        self.statusBar().showMessage('Model loaded', 3000)
+        if not self.snipButton.isEnabled():
+            # loaded after a failed attempt
+            self.snipButton.setEnabled(True)
+            self.shortcut.setEnabled(True)
+            self.toggleProcessing(False)
+            self.retryButton.setEnabled(False)
+
+    def modelFailed(self, error):
+        self.statusBar().showMessage('Loading the model failed')
+        self.toggleProcessing(False)
+        self.retryButton.setEnabled(False)
+        # nothing can be snipped without a model, the snip button loads it again instead
+        self.shortcut.setEnabled(False)
+        self.snipButton.setEnabled(True)
+        self.snipButton.setText('Load model')
+        self.snipButton.clicked.disconnect()
+        self.snipButton.clicked.connect(self.loadModel)
+        msg = QMessageBox()
+        msg.setWindowTitle(" ")
+        msg.setText("Loading the model failed:\n%s" % error)
+        msg.exec()
+
+    def returnPartial(self, request, prediction):
+        if request != self.request:
+            return
+        self.partialPrediction = prediction
+        if not self.partialTimer.isActive():
+            self.partialTimer.start()
+
+    def displayPartial(self):
+        if not self.isProcessing or self.partialPrediction is None:
+            return
+        if self.partialShown:
+            # typeset the new equation in the loaded page instead of loading MathJax again
+            self.webView.page().runJavaScript('if (window.setEquation) setEquation(%s);' % json.dumps(self.partialPrediction))
+        else:
+            self.webView.setHtml(self.equationPage(self.partialPrediction))
+            self.partialShown = True
+
     def displayPrediction(self, prediction=None):
         if self.isProcessing:
+            if self.partialShown:
+                return
             pageSource = """<center>
             <img src="qrc:/icons/processing-icon-anim.svg" width="50", height="50">
             </center>"""
@@ -200,7 +278,12 @@ class App(QMainWindow):
                 self.textbox.setText("${equation}$".format(equation=prediction))
             else:
                 prediction = self.textbox.toPlainText().strip('$')
-            pageSource = """
+            pageSource = self.equationPage(prediction)
+        self.webView.setHtml(pageSource)
+
+    @staticmethod
+    def equationPage(equation):
+        return """
             <html>
             <head><script id="MathJax-script" src="qrc:MathJax.js"></script>
             <script>
@@ -210,34 +293,186 @@ class App(QMainWindow):
                     document.getElementById("equation").style.visibility = "";
                 }
                 );
+            function setEquation(equation) {
+                var element = document.getElementById("equation");
+                element.textContent = "$$" + equation + "$$";
+                MathJax.Hub.Queue(["Typeset", MathJax.Hub, element]);
+            }
             </script>
             </head> """ + """
             <body>
             <div id="equation" style="font-size:1em; visibility:hidden">$${equation}$$</div>
             </body>
             </html>
-                """.format(equation=prediction)
-        self.webView.setHtml(pageSource)
+                """.format(equation=equation)
 
 
-class ModelThread(QThread):
-    finished = pyqtSignal(dict)
+def escape(prediction):
+    # replace <, > with \lt, \gt so it won't be interpreted as html code
+    return prediction.replace('<', '\\lt ').replace('>', '\\gt ')
+
+
+def close_braces(prediction):
+    # an equation that is still being decoded may not be closed yet
+    depth = 0
+    for match in re.finditer(r'\\.|[{}]', prediction):
+        if match.group(0) == '{':
+            depth += 1
+        elif match.group(0) == '}':
+            depth = max(depth-1, 0)
+    return prediction + '}'*depth
+
+
+class Cancelled(Exception):
+    '''Raised between two decoding steps to stop a prediction that is not needed anymore'''
+
 
-    def __init__(self, img, model):
+class ModelThread(QThread):
+    '''Inference worker that lives as long as the app.
+
+    Only the newest submitted image is kept: it replaces an image that is still waiting
+    and the running prediction is cancelled after its current decoding step.
+    The preprocessed image and the encoder output of the last image are kept. While
+    idle, a few alternative predictions are sampled from them, so that a retry can
+    show the next one right away.
+    '''
+    predicted = pyqtSignal(int, dict)
+    partial = pyqtSignal(int, str)
+    progress = pyqtSignal(str, int, int)
+    ready = pyqtSignal()
+    failed = pyqtSignal(str)
+    samples = 3
+
+    def __init__(self, args):
         super().__init__()
-        self.img = img
-        self.model = model
+        self.args = args
+        self.model = None
+        self.condition = threading.Condition()
+        self.pending = None
+        self.stopped = False
+        self.cancelled = threading.Event()
+        self.image = self.context = None
+        self.alternatives, self.shown = [], set()
+        self.temperature = None
+        self.sampling = False
+        self.request = None
+
+    def submit(self, img=None, temperature=None, request=0):
+        """Predict `img` (the last image if None) as soon as possible. The signals of the prediction carry `request`."""
+        with self.condition:
+            self.pending = (img, temperature, request)
+            self.cancelled.set()
+            self.condition.notify()
+
+    def cancel(self):
+        with self.condition:
+            self.pending = None
+            self.cancelled.set()
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.pending = None
+            self.cancelled.set()
+            self.condition.notify()
+        self.wait()
+
+    def checkCancelled(self, tokens=None):
+        if self.cancelled.is_set():
+            raise Cancelled
+
+    def step(self, tokens):
+        self.checkCancelled()
+        text = self.stream.append(tokens[:, -1])[0]
+        self.partial.emit(self.request, escape(close_braces(post_process(text))))
+
+    def needsAlternatives(self):
+        return self.sampling and len(self.alternatives) < self.samples
+
+    def sampleAlternatives(self):
+        temperature = self.model.args.temperature
+        if temperature != self.temperature:
+            self.alternatives, self.temperature = [], temperature
+        n = self.samples-len(self.alternatives)
+        self.alternatives.extend(self.model.generate(None, callback=self.checkCancelled, context=self.context.expand(n, *self.context.shape[1:])))
+
+    def load(self):
+        if not os.path.exists(self.args.checkpoint):
+            from pix2tex.model.checkpoints.get_latest_checkpoint import download_checkpoints
+            # stop() does not have to wait until the download is finished
+            download_checkpoints(progress=self.progress.emit, cancelled=lambda: self.stopped)
+            if self.stopped:
+                return
+        self.model = cli.LatexOCR(self.args)
+
+    def predict(self, img, temperature=None):
+        if temperature is not None:
+            self.model.args.temperature = temperature
+        if img is not None:
+            self.model.last_pic = img.copy()
+            self.image = self.context = None
+            self.alternatives, self.shown = [], set()
+            self.sampling = False
+            self.image = self.model.preprocess(img)
+            self.context = self.model.encode(self.image)
+            self.temperature = self.model.args.temperature
+        elif self.context is None:
+            return ''
+        if self.model.args.temperature == self.temperature and self.alternatives:
+            # prefer a candidate that was not shown yet
+            unseen = [i for i, pred in enumerate(self.alternatives) if pred not in self.shown]
+            pred = self.alternatives.pop(unseen[0] if unseen else 0)
+        else:
+            self.stream = self.model.detokenizer.stream()
+            pred = self.model.generate(self.image, callback=self.step, context=self.context)[0]
+            self.sampling = True
+        self.shown.add(pred)
+        try:
+            clipboard.copy(pred)
+        except:
+            pass
+        return pred
 
     def run(self):
+        # the thread ends if loading fails and is started again to retry
         try:
-            prediction = self.model(self.img)
-            # replace <, > with \lt, \gt so it won't be interpreted as html code
-            prediction = prediction.replace('<', '\\lt ').replace('>', '\\gt ')
-            self.finished.emit({"success": True, "prediction": prediction})
+            self.load()
         except Exception as e:
-            import traceback
             traceback.print_exc()
-            self.finished.emit({"success": False, "prediction": None})
+            with self.condition:
+                self.pending = None
+            self.failed.emit(str(e))
+            return
+        if self.stopped:
+            return
+        self.ready.emit()
+        while True:
+            with self.condition:
+                while self.pending is None and not self.stopped and not self.needsAlternatives():
+                    self.condition.wait()
+                if self.stopped:
+                    return
+                job, self.pending = self.pending, None
+                self.cancelled.clear()
+            if job is None:
+                try:
+                    self.sampleAlternatives()
+                except Cancelled:
+                    pass
+                except Exception:
+                    traceback.print_exc()
+                    self.sampling = False
+                continue
+            img, temperature, self.request = job
+            try:
+                result = {"success": True, "prediction": escape(self.predict(img, temperature))}
+            except Cancelled:
+                continue
+            except Exception:
+                traceback.print_exc()
+                result = {"success": False, "prediction": None}
+            if not self.cancelled.is_set():
+                self.predicted.emit(self.request, result)
 
 
 class SnipWidget(QMainWindow):
@@ -351,4 +586,5 @@ def main(arguments):
             os.environ['QTWEBENGINE_DISABLE_SANDBOX'] = '1'
         app = QApplication(sys.argv)
         ex = App(arguments)
+        app.aboutToQuit.connect(ex.worker.stop)
         sys.exit(app.exec())
@@ -0,0 +1,32 @@
+import argparse
+import os
+
+import torch
+from safetensors.torch import save_file
+
+
+def convert(filename: str, output: str = None) -> str:
+    """Convert a `.pth` checkpoint to a `.safetensors` file that can be memory-mapped
+
+    Args:
+        filename (str): Path to the `.pth` file
+        output (str, optional): Output path. Defaults to the same path with `.safetensors` extension.
+
+    Returns:
+        str: Output path
+    """
+    if output is None:
+        output = os.path.splitext(filename)[0]+'.safetensors'
+    state_dict = torch.load(filename, map_location='cpu')
+    # safetensors does not store tensors that share memory or views
+    save_file({k: v.detach().clone().contiguous() for k, v in state_dict.items()}, output)
+    return output
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Convert .pth checkpoints to .safetensors')
+    parser.add_argument('checkpoints', nargs='*', help='Checkpoints to convert. Defaults to the downloaded weights.pth and image_resizer.pth')
+    args = parser.parse_args()
+    checkpoints = args.checkpoints or [os.path.join(os.path.dirname(__file__), name) for name in ['weights.pth', 'image_resizer.pth']]
+    for checkpoint in checkpoints:
+        print(checkpoint, '->', convert(checkpoint))
@@ -14,9 +14,10 @@ def get_latest_tag():
     return tag
 
 
-def download_as_bytes_with_progress(url: str, name: str = None) -> bytes:
+def download_as_bytes_with_progress(url: str, name: str = None, progress=None, cancelled=None) -> bytes:
     # source: https://stackoverflow.com/questions/71459213/requests-tqdm-to-a-variable
-    resp = requests.get(url, stream=True, allow_redirects=True)
+    # returns None if `cancelled()` became true during the download
+    resp = requests.get(url, stream=True, allow_redirects=True, timeout=30)
     total = int(resp.headers.get('content-length', 0))
     bio = io.BytesIO()
     if name is None:
@@ -27,21 +28,33 @@ def download_as_bytes_with_progress(url: str, name: str = None) -> bytes:
         unit='b',
         unit_scale=True,
         unit_divisor=1024,
-    ) as bar:
+    ) as bar, resp:
         for chunk in resp.iter_content(chunk_size=65536):
+            if cancelled is not None and cancelled():
+                return None
             bar.update(len(chunk))
             bio.write(chunk)
+            if progress is not None:
+                progress(name, bio.tell(), total)
     return bio.getvalue()
 
 
-def download_checkpoints():
+def download_checkpoints(progress=None, cancelled=None):
+    """Download the weights of the model and of the image resizer
+
+    Args:
+        progress (callable, optional): Called with the file name, the downloaded and the total number of bytes. Defaults to None.
+        cancelled (callable, optional): Checked after every chunk, the download stops without writing the file once it returns True. Defaults to None.
+    """
     tag = 'v0.0.1'  # get_latest_tag()
     path = os.path.dirname(__file__)
     print('download weights', tag, 'to path', path)
     weights = 'https://github.com/lukas-blecher/LaTeX-OCR/releases/download/%s/weights.pth' % tag
     resizer = 'https://github.com/lukas-blecher/LaTeX-OCR/releases/download/%s/image_resizer.pth' % tag
     for url, name in zip([weights, resizer], ['weights.pth', 'image_resizer.pth']):
-        file = download_as_bytes_with_progress(url, name)
+        file = download_as_bytes_with_progress(url, name, progress, cancelled)
+        if file is None:
+            return
         open(os.path.join(path, name), "wb").write(file)
 
 
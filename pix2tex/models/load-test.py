@@ -0,0 +1,53 @@
+import unittest
+import os
+import tempfile
+
+try:
+    import torch
+    import yaml
+    from munch import Munch
+    from pix2tex.models.utils import build_model, load_pretrained
+    from pix2tex.utils import parse_args
+except ImportError:
+    torch = None
+
+
+def default_args():
+    import pix2tex
+    with open(os.path.join(os.path.dirname(pix2tex.__file__), 'model', 'settings', 'config.yaml'), 'r') as f:
+        args = parse_args(Munch(yaml.load(f, Loader=yaml.FullLoader)))
+    args.update(device='cpu', wandb=False, no_cuda=True)
+    return args
+
+
+@unittest.skipIf(torch is None, 'torch, timm and x_transformers are needed')
+class TestLoadPretrained(unittest.TestCase):
+    def roundtrip(self, build):
+        torch.manual_seed(0)
+        module = build().eval()
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'weights.pth')
+            torch.save(module.state_dict(), filename)
+            loaded = load_pretrained(build, filename).eval()
+        expected, actual = module.state_dict(), loaded.state_dict()
+        self.assertEqual(expected.keys(), actual.keys())
+        for k in expected:
+            self.assertTrue(torch.equal(expected[k], actual[k]), k)
+        return module, loaded
+
+    def test_model(self):
+        args = default_args()
+        model, loaded = self.roundtrip(lambda: build_model(args))
+        im = torch.rand(1, args.channels, 64, 128)
+        with torch.no_grad():
+            self.assertTrue(torch.equal(model.encode(im), loaded.encode(im)))
+
+    def test_resizer(self):
+        from timm.models.resnetv2 import ResNetV2
+        from timm.models.layers import StdConv2dSame
+        self.roundtrip(lambda: ResNetV2(layers=[2, 3, 3], num_classes=21, global_pool='avg', in_chans=1, drop_rate=.05,
+                                        preact=True, stem_type='same', conv_layer=StdConv2dSame))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,7 @@ class CustomARWrapper(AutoregressiveWrapper):
         super(CustomARWrapper, self).__init__(*args, **kwargs)
 
     @torch.no_grad()
-    def generate(self, start_tokens, seq_len=256, eos_token=None, temperature=1., filter_logits_fn=top_k, filter_thres=0.9, **kwargs):
+    def generate(self, start_tokens, seq_len=256, eos_token=None, temperature=1., filter_logits_fn=top_k, filter_thres=0.9, callback=None, **kwargs):
         device = start_tokens.device
         was_training = self.net.training
         num_dims = len(start_tokens.shape)
@@ -39,6 +39,9 @@ class CustomARWrapper(AutoregressiveWrapper):
 
             out = torch.cat((out, sample), dim=-1)
             mask = F.pad(mask, (0, 1), value=True)
+            if callback is not None:
+                # hook between decoding steps, e.g. to report progress or to let other work run
+                callback(out[:, t:])
 
             if eos_token is not None and (torch.cumsum(out == eos_token, 1)[:, -1] >= 1).all():
                 break
@@ -1,3 +1,6 @@
+import os
+import inspect
+from contextlib import contextmanager
 import torch
 import torch.nn as nn
 
@@ -32,12 +35,98 @@ class Model(nn.Module):
         return out
 
     @torch.no_grad()
-    def generate(self, x: torch.Tensor, temperature: float = 0.25):
-        return self.decoder.generate((torch.LongTensor([self.args.bos_token]*len(x))[:, None]).to(x.device), self.args.max_seq_len,
-                                     eos_token=self.args.eos_token, context=self.encoder(x), temperature=temperature)
+    def encode(self, x: torch.Tensor):
+        return self.encoder(x)
 
+    @torch.no_grad()
+    def generate(self, x: torch.Tensor, temperature: float = 0.25, callback=None, context=None):
+        if context is None:
+            context = self.encoder(x)
+        return self.decoder.generate((torch.LongTensor([self.args.bos_token]*len(context))[:, None]).to(context.device), self.args.max_seq_len,
+                                     eos_token=self.args.eos_token, context=context, temperature=temperature, callback=callback)
+
+
+def load_weights(filename: str, device='cpu') -> dict:
+    """Load a state dict. `.safetensors` files and (with torch>=2.1) `.pth` files are memory-mapped,
+    so processes loading the same file share it through the page cache. `.pth` files are loaded
+    with `weights_only=True` where torch supports it (torch>=1.13).
+
+    Args:
+        filename (str): Path to a `.pth` or `.safetensors` file
+        device (str, optional): Device to load the tensors to. Defaults to 'cpu'.
+
+    Returns:
+        dict: state dict
+    """
+    if filename.endswith('.safetensors'):
+        from safetensors.torch import load_file
+        return load_file(filename, device=str(device))
+    parameters = inspect.signature(torch.load).parameters
+    # a state dict only holds tensors, do not unpickle arbitrary objects
+    kwargs = {'weights_only': True} if 'weights_only' in parameters else {}
+    if 'mmap' in parameters:
+        try:
+            return torch.load(filename, map_location=device, mmap=True, **kwargs)
+        except RuntimeError:
+            pass  # legacy (non zip) format can not be memory-mapped
+    return torch.load(filename, map_location=device, **kwargs)
+
+
+def find_weights(filename: str) -> str:
+    """Prefer a converted `.safetensors` file next to a `.pth` checkpoint"""
+    base, ext = os.path.splitext(filename)
+    if ext == '.pth' and os.path.exists(base+'.safetensors'):
+        return base+'.safetensors'
+    return filename
+
+
+# weight initialization functions that are skipped when the weights are loaded anyway
+INIT_FUNCTIONS = ['uniform_', 'normal_', 'trunc_normal_', 'constant_', 'ones_', 'zeros_', 'eye_', 'dirac_', 'xavier_uniform_',
+                  'xavier_normal_', 'kaiming_uniform_', 'kaiming_normal_', 'orthogonal_', 'sparse_']
+
+
+@contextmanager
+def skip_init():
+    """Turn the initialization functions of `torch.nn.init` into no-ops while modules are built.
+    The parameters of layers like `nn.Linear` and `nn.Conv2d` are then left uninitialized."""
+    saved = {name: getattr(nn.init, name) for name in INIT_FUNCTIONS if hasattr(nn.init, name)}
+    for name in saved:
+        setattr(nn.init, name, lambda tensor, *args, **kwargs: tensor)
+    try:
+        yield
+    finally:
+        for name, init in saved.items():
+            setattr(nn.init, name, init)
 
-def get_model(args):
+
+def load_pretrained(build, filename: str, device='cpu') -> nn.Module:
+    """Build a module and load its weights without spending time on the random initialization.
+
+    The module is built on the CPU with the initialization functions of `torch.nn.init`
+    disabled (see `skip_init`), then every parameter is overwritten by the checkpoint,
+    which has to cover all of them. The module is not built on the meta device, because
+    some modules (e.g. the drop path rates in timm) compute values while they are built.
+
+    Args:
+        build (callable): Returns the module
+        filename (str): Path to the weights, see `load_weights`
+        device (str, optional): Device of the module. Defaults to 'cpu'.
+
+    Returns:
+        nn.Module: module with loaded weights
+    """
+    state_dict = load_weights(filename, device)
+    with skip_init():
+        module = build()
+    if 'assign' in inspect.signature(nn.Module.load_state_dict).parameters:
+        # use the loaded (possibly memory-mapped) tensors instead of copying them
+        module.load_state_dict(state_dict, assign=True)
+    else:
+        module.load_state_dict(state_dict)
+    return module.to(device)
+
+
+def build_model(args) -> Model:
     if args.encoder_structure.lower() == 'vit':
         encoder = vit.get_encoder(args)
     elif args.encoder_structure.lower() == 'hybrid':
@@ -45,9 +134,14 @@ def get_model(args):
     else:
         raise NotImplementedError('Encoder structure "%s" not supported.' % args.encoder_structure)
     decoder = transformer.get_decoder(args)
-    encoder.to(args.device)
-    decoder.to(args.device)
-    model = Model(encoder, decoder, args)
+    return Model(encoder, decoder, args)
+
+
+def get_model(args, checkpoint: str = None):
+    if checkpoint is not None:
+        model = load_pretrained(lambda: build_model(args), checkpoint, args.device)
+    else:
+        model = build_model(args).to(args.device)
     if args.wandb:
         import wandb
         wandb.watch(model)
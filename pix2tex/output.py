@@ -0,0 +1,42 @@
+'''Print predictions on the terminal. Kept free of heavy imports, so the daemon client can use it.'''
+import os
+import sys
+
+
+def output_prediction(pred, args):
+    TERM = os.getenv('TERM', 'xterm')
+    if not sys.stdout.isatty():
+        TERM = 'dumb'
+    try:
+        from pygments import highlight
+        from pygments.lexers import get_lexer_by_name
+        from pygments.formatters import get_formatter_by_name
+
+        if TERM.split('-')[-1] == '256color':
+            formatter_name = 'terminal256'
+        elif TERM != 'dumb':
+            formatter_name = 'terminal'
+        else:
+            formatter_name = None
+        if formatter_name:
+            formatter = get_formatter_by_name(formatter_name)
+            lexer = get_lexer_by_name('tex')
+            print(highlight(pred, lexer, formatter), end='')
+    except ImportError:
+        TERM = 'dumb'
+    if TERM == 'dumb':
+        print(pred)
+    if args.show or args.katex:
+        try:
+            if args.katex:
+                raise ValueError
+            from pix2tex.dataset.latex2png import tex2pil
+            tex2pil([f'$${pred}$$'])[0].show()
+        except Exception as e:
+            # render using katex
+            import webbrowser
+            from urllib.parse import quote
+            url = 'https://katex.org/?data=' + \
+                quote('{"displayMode":true,"leqno":false,"fleqn":false,"throwOnError":true,"errorColor":"#cc0000",\
+"strict":"warn","output":"htmlAndMathml","trust":false,"code":"%s"}' % pred.replace('\\', '\\\\'))
+            webbrowser.open(url)
@@ -1,9232 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.4.2
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x02*\x89\
-\x00\
-\x07\xfc\xb4x\xda\xdc\xbdksdIv\x18\xf6W\x80\
-\xbb;\xd8\xba\x83\x8bB\x15zz\x1e\xb7\xe6\x0e\x8c\x06\
-\xd0\xdd\xe0\xa0\x01\x08@\xf7\xec\x12\xa8\x1d]T]\x00\
-\xb7\xbbPU[\x8f~LU9\xc8\x10\xc3\xa2\x14\xe2\
-\x07\xdbA\xd1\x8eP8L\x85\x1d\xa4d\xd1\x22\xb9d\
-\x04IQV\x84\x97\xfc\xa6\x0f\xb3\x9f\xb8+}!\x1d\
-\x0aZ\xe1\xb0\xad\xbf\xe0\xf3\xca\xd7}T\x01\xdd\xb3\xe4\
-\xca\x5cN\xa3n\xe6\xc9\x93\x99'O\x9e<y\xf2\xe4\
-\xc9v\xaf5\xbeI\xba\xa3\xeaU2\xda\xed$\xf8\xf3\
-\xc1\x9b\xbd\xf6\xcaJ[e\xb4\xae\xd3N\xfb\xa0\xd7N\
-\x86v\xe2 \x89G\x89\x14XY\xa9\xbcJ\xbb\xed\xde\
-\xab\xea\x93xt\xfd\x0b\xf1\xeb\x95\x15\xf9Q}<\xbe\
-\x98N3\xb9\x9b\xeeg4\xd9\x1a\x8f\xae{\x83\xed^\
-\xf72\xbd\x0a\xdd\xccY\x98\x05\x9e\x05\x0a\xf7\xcbd0\
-L{\xdd\xc8\xdb\xa8~T\xbd\xef\xe9\xf4\xcb\xb4\x93\x94\
-\xe5\xb5\xda\xddg\xe5Y\x0f\xa1\xa4d\x0f\xb1\xa6\xcbq\
-\xb75\x82\x8f\xca\x83\xad\x93\xdd\x83\xad'\xbb\xfe\xe4e\
-<X\xc2\xaf\xc8mW\x03\xd3\xa0\xa7\x05Y\x80\xc8o\
-`\xb1\xa3\xe3\xc3\xd3\xc3\xe8\xac\x19\x1c>\xf8\x85\xdd\xed\
-\xd3Hco'\x97\x8c\xb8w\xf1<\x82\x8fj\x0b\xea\
-\x1f\x0d\xc6\xadQo\xd0\xb8\xec\x0d*\x98\x97\xb6\x97\xd2\
-.B@-\x08\xa7K\xfb\x80?@\x14\x9eU\xcc[\
-\x8e\xa2\x14G\x11\xb0]\xc7\xc3\xc3W\xdd\xa3A\xaf\x9f\
-\x0cFo*i\xdb\x87\x01\x03\x14gi\xbb\x89\xd5\xe1\
-_\xbf1HF\xe3\x01U0\x0b\xb6\x0f\x0fNN\x8f\
-\x9fn\x9f\x1e\x1e\xdb\xf5\x08H>%\x1e\x5c\x11[\x0c\
-\xab\xad\xb8\xd3I\x92\xea^7\x1d\xd1\xef\xca\xe8:\x1d\
-\x06:\xdf\x9f\xcd\x88R\xd5\xc3\x8b\xe7Ik\x141%\
-*\x13\xab\xe5\xe1;\xa1\x0fN\xc6\x17\xadN<\x1c\x86\
-6u\x03Jr\xc8\xfcN\xb5X\xc4\xaa\x9e<=\xda\
-=\x8e\x08\x02?\xb1\x10}\xd1/JRM\xe2d\xf5\
-EY[\xe3+D\xc99\xf2A\x19\xfdAo\xd4{\
-(m\xe4l'\x89\x80Z\xb1d\xc1\x0fJ\x80\x91\xe6\
-\x04\xf8A\x09\xe90\xe6\x04\xf8a\xf0\x8e\xde\xf4\x93\xa8\
-\x9b\xbcZ\xc2\xac\x0a\xb1\xa5\xef\xe6\xda\x1c\x18A\x8e\xdd\
-X\x97\xa0\x011\x0c\xf6\xd5P\x1c(54\x94\xc6J\
-\x14\xc1\xeaQ\x14an\xb5\x93t\xafF\xd7++\xf8\
-qVkB25c\x13\x0a\x84\xc8\x9b\xc0\xeb\xc3Q\
-\xdcm%\xbd\xcb%*\xc0c\x22\xbc\x8fm\xb7R\xa5\
-\x0b\xbe\x1e\x80j\xdc\xefw\xde h@m\x99N\xe1\
-'0\x87\xf4`\x1eo\xa4\xedFzY\xe9\x8e;\x9d\
-\xe5\x88\x12q\xfe\xf1\xdc\xc3\xcf\xb2\xf9\x94\x1f!H\x0f\
-\xf4\xe4\xc2b\xa3\xde\xc9h\x90v\xaf`f\x1ah\x22\
-\xb6\xca\xe1\xe9j\xc1MfV^A\x15\x9e\xca\xf5\x02\
-\xbb\xa4?\xd3]\xd0\x9d3\xdd\xd0I\xeaG\xb1\x80\xc0\
-\xeaHB(0GL`\xee,pZc\xa8\xca=\
-\xf7'n7\x95\xb8\x09<\x05\xe8\x01% \x03\x86\x18\
-\x92\xa1Jl\x8b\x99N\xfc\xd3\x94\xf7\xa5>\xfc\x1dN\
-\x5c\x8e\x03\x19\x18\x10\xb8I\xba\xec\x1a\x81\xd5US\x9a\
-`f\x01\xcc\x17\x03x\x93\xc0\xea\xd3V\xc0\x05\x8d#\
-J0Ts\x16\x00\xb1L\xd9\xbe\xd0LW\xf5\xb2\x07\
-D\xae\xc9\x10\x9f\xa9l(\x06\x13\xd0\x14Cn\x9c\x18\
-\x19b3;\x0bF\x1em;\x1d\xa7\xd9\xdc\x86/e\
-\x98\x0a@-\xe1%\xb0\x8b\x9a\x9f\xc1\x01\xc0\x16\x0e\x0d\
-]\xd4\x1b\xb5L\xd9\x82\x83f\xbe\xbd\x96\xf9\x13`L\
-\x1b\x22B\xe1\xe2s\xe5\xcb5\x1b6\xb2~\xcb\xb0\x09\
-X\x1d\x86:\xbd\xe9w\x12\x1e\xf0\xb9K\x08\xb1\xa1\xdd\
-7\xabd\x152\xd3nB0\xb3\x80?L\xc9\xe1\xa0\
-\xc5\x02\xa1=\x1c\xc1<4B\x812\xdcE\x19\x93\xe0\
-\xbf\xe2y\x04\xe5\x89\xf3\xa9\xfaW\x83\xb8\x8f\xd3\x03\xa0\
-i:\xf9\x0d,w\x1b\xc9\x90\x81s$\x03\xd6\xa1?\
-\xad\x8a,\xf1`\x17\xf7}!%\xf6m\x16 \xa83\
-w/i\x98\xccDXV\x13\xe1r:]6R\xa6\
-\xe2Wo\xe2Q\xeb\xba\xb2~^=\x1f\xbeO4\x85\
-\xbf\xe7\x95u\xdfW\x13\x8f\xf4\x9e\xcb\xae\xbd\xda\x9a\xa9\
-\x1d\xc1\xbc\xa4\x1fH\x8a\xc6h\xf0\x86\xe8=H\x86\xe3\
-\xce(\xba\x14\x19\x9e]z[Te2\x18 \xa6A\
-\xef\x15\x88\x8eN2J\x96\x0c\xda\x002u\x07s\x99\
-\x8c^\xaf\xe0\xd0\x04M\xb8\x02MGgJk.\x1d\
-]\xe3\xb2;\x9b\xf9\xa0|Y\x1a\x0d,\xb4[\x83A\
-\xfc&\xa2\x7f\xd5\xd7tZ4\xf5\xbd\xb3\x1e\x95Y\x22\
-\x98&\x08\x9cH\x90\xe4\x19\x80\xa7!\xafbvuV\
-e\xb3\x8a'\x1a\xa7\xe7\x7f\xc3\x9a\xab\xeaTAG\x83\
-\xed\xad\xfd\xfd\x07[\xdb\x9f[\xeal<\x8a\xb9\xba\xd6\
-\xc5m\xf4\xac\xe4u\xd2\x1a\x8f\x12!q6\xdb\xd1\xbb\
-\xdcy\xa7\xaa\xb6\xd6\x88|R\xf1\xacl]\xd0\xa4\xd4\
-\xe2\x1a\xdb\x8c)\x9b\xeaG\x98\xc7\xe4,\x80\xad\x0b\xc3\
-8\x05\x95\xaa\xbc\xa0u1k\xe4\xf3\xa3I:\xdc\x86\
-\xee]\xc4\xad\x17\xe1r-\xb8\xee\xf5^\xb8\xab\x19\xb6\
-#\x84\xbd\x02\xb3\x88\xec\x82\x02!\x95\x0d\x0aSuY\
-\x94@ W{:\xa5\x8fx<\xea\x1d'\xc3d\xe4\
-\xdb\xd2\x8fA\xa2e\x17$`\x95\x11\x9a`\xcd\xb9*\
-W\xccy\xd8\x18T\x09a\xf2U\xce\x9a\xd5a'm\
-%\xcc\x91zp\x82\x9a\x0fr\x05\xa7W\xe2\xac\xcb\xf6\
-\x0c\xe4\xeag\x81\x22N\x81\xaao\x9a\x92\x99y:\xc3\
-\xddL 3\xec\x9d\xe4y\xf0r\xcez\x0e\xaa\xc6e\
-\xd5\xd0\x7f\x16\xec>\xdb\xda7E[\xb0\xd5\xd5\xedI\
-^\xc6\x1d\xee\xa9\x8c\x00\xe5\xce\x82\xd3\xdd\x93S\xb7\x18\
-\x8d\x04&U<l\xd4\x97_\x9e&'\xa3/\x9f\xc5\
-\xc7_~\xb9\x14-\xd5aN\xca\xe4\xb2s|\x94z\
-B\xa2\x82l#\xedz \xef\x0a\x00\x22\x5c\x93fI\
-g\x98,Qk\x04\x04\xd9\xe4\xa45H\xfb\xa3\xcdL\
-\xb7h\x06\x7f\xf9%~D\xf8\x0f\xf5'\xf2\xa0\x19K\
-\x13\xb5\x11\xfe\xf2K\x16\x92\xd0l\xec~\xc5\xa4s\xe7\
-\x97\x8c\x0c..\x04\xf2\xd7\x0brM\xe1\x164,\x19\
-/\x8d\xe1/\x5ca\x85\x12Nz\xe0&R\xa3\xa5*\
-K=\xda%\x12\xf1\x8a \xf8d\x04E\xe0\x87\x7f[\
-\x84\xa0\x0e_'q;j\xe7M-\xc3\x07oN\xe3\
-\xab\x83\xf8&\xa9x\x08\xe3\xf9\xb0\x19j\xe0/\x90\xc8\
-n\xa1\x8b^\xfb\x0dSoH\xe4\x8c\x8am1\x15\x8f\
-\xb3=P-\xe8\x07\xce\x9f\xa4\xdb\xdeF+N%S\
-\xe64y=B\xcb\x0e\xd3\xc4\x0f\xb0F\x07\x9eQH\
-\xc6 \xb9\xe9\xbdL\x9c\x8c\xbf\xad\xd1l\xe8\xf9G\x13\
- xz\xb2w\xf0(r6\xa0AJ3\xd2,'\
-\xbc\xe5\xfc\xac\x0e\xd2\x1f\xf3\xa3\x0d\xde\x8b:\xb9++\
-\x05j\x8f\x06\x82\xb1\xa1\x1d\xab\xfe*\xd0\xdb\xbd\xee\xf8\
-\xe6\x22\x19\x18ic\xe0\xeb\xcd\xcd\x9c\xf0\xc4f\x86s\
-Dj \xcb,\xef\xa9WVr\x1b\xe8\x02\xf9&{\
-j\xd5O\xf9\xf4\x83\x12P\xdf\xac\xcbC\xb5\x16C-\
-\x05\x8b\x9adn\x22\xa4^\x1f+\x13Z\xbc0\x0d\xb4\
-\x05\xa0\xb8\xd3bV%\x87\xac\x85\xe6[H?\xea\x85\
-t,\xe9W\xbdy&\xa5\x9b\xaa\xe1\x05-\xb1\xc1\xd4\
-\x12*\xe9\xbc\xb2Rg\x89\xe8\x95\x0d\x9f\xdb]N\xc9\
-y\x15\xd5\xf2\x08\xeb\x0b\x10\xd6\x17\xb4\xdcip\xad\xb8\
-\xc1$\xf3Ki\xab\xf0\xabY\xb2\xb2\xa2~U\xfc \
-S)\xa6\x8a\xb6\x81E\x9b\xdcv\xfc\x99\xdf\x96\xe6\xda\
-M\x95!<+R\xc2\x9c\xf9\xeeA\x83y6\xd3\xcc\
-\xaex\xdbq\xf7;\xa3\xa5\x9b\xf8E\xb2\xd4\x92ex\
-\xe9r\xd0\xbbY\xbaJ_&\xa0\xb6Cs<Xe\
-wv\xf7\xb7\xbeg\xa6\xf5(\xbd\x019-\xf0j\x89\
-\xae\xa8\x84\x88\x84\x80\xfe\xf4\xfd*\xc2\xf7\xc6\xa3\x08T\
-\x92S\xfe\xa9s\x03\xcc\xf35\xb2Y\xf0\xc5\xd6\xde\xe9\
-C\xdb\xdc\xa9!\x87\xe9U7\xee\xf8\x939\x15)\xd5\
-\xab\x82XN\xf6\x1e\x1d\x00\xa1\xb3\xe5\xe5o\x15\x85+\
-\x0c\xd8\xea\xaa\xcf\x95\xee~ww\xfb\xe9\xe9\xae\xadH\
-\x90\x90'h1\xe7\xf1G\xc3\xd6\xa58\x89\xd535\
-iYo\xeb\xb4w\xf9;\xb0\xe1M\xb2-\xb3\xed\xe2\
-\xc5\x1b.\x1c\x5c\xa3`U\xb8\x1c\x08\xa2e\xfe%]\
-\xf7\xad\x8e\x8b\xa0\x97\x0e\xf8\x0d\xd2N\xb4\xe2\x1e\xd5\x82\
-\x9bH\xf2D\x885\xd2Oo\x1a)\x10D\x92\xcf\xd2\
-\xa6\xa2\xd2\xdaZ\x90O\xfc4\xaa\xc1~\xd8$\x93\xd4\
-\x14jr\x1bJGq\x08\xf2H\xc4\x93J\x80QS\
-\xb4>\x93\x1fM\xc3\x18B\xe7M\x94\xbbn\xab73\
- \xd5\xfexx\xadP\xa1\xd0\x083\x00Q\xb6\x80(\
-\xd4\xaa!\xa1n\xac5X\xa6\x90\x8cR\x90M\x88,\
-&\xca6[5\x19M\x9f\x0fOw\x0b\xb8{.[\
-\x0b\xbd\xa3\x9a\xd9wEu\x18\xbe\xec\xaa\xa9\x07\xd0\xac\
-u)\x08w\x99R\x15;\xd5L_d,\x14\x18\xba\
-\xc9R\x9bo[\x01Tf\xc5o\x141\xa1i\xbb$\
-\xa9}\xbf\x99\xd7\x8f\x0f\x0f??\x89\x94r&{W\
-e\x83\xafd\xcc\x88\xb4{\x11\x13\x05\x0a\xc7!\x9e\xd6\
-\xd0\x17\xeb>\xd6'\x00F\x03\xb3{\x1a\x8c\xbb]$\
-\x15Z\xa7\xb6\xdam\x83\x92\xb6,\xfdA\xda\x1b\xa4h\
-gCu%\x8a\xd47\xf4@\xfd\x8c\xea5?\xb0\xfa\
-\x88\xe5\x907\xf1\xaf\x8c\x0c%\xf9\xb4W\xac\xeab\xea\
-\x875D\xa6\xf9z|>\x83\x19\xa3 ?5\xf9g\
-\xe9Z\xbd\xa9q5\xfctm\xad\x91\xdd\x88\x81\xa8\xe9\
-\xd3\xb2\x93\x06\xbcO\xe5\x16\xcc\x82c\x22\x89\xdbS\xcb\
-2F\x13\xbd\xa0)\xc2*0\xfav;\xf0\x04\x80\x10\
-Xv\xd4\x8aM\xd9Mk\x18x\xaa\x81\xe2T\xd4\xc8\
-:nCw\xf3\xfbd\xb2G\x08[\xc0\xb8Nf\xcd\
-\x86;r6\x97\xcfo\xfb\xc4\xf0\x80\x98\xe5U/8\
-\xb1\xe2\xe7d\xac\x06`!+\x9bIK\xcc.\x96\xb1\
-++\xba\xf9L\x80\x0c\xcfg\xf8\xd0\xe6[\xad-R\
-\x1a\x0f\xdc\x11O7P\x08\xea\xd6,\xd4\xd2\x0d\x195\
-\xdc(\xca\xd1\x09\xa0\xaa\x84$V\xa4S\x93\x99\x9e\xdd\
-(q\x9cj\xc2\xac\x05P&\x94\xdd\xc8ao\x80\xa4\
-\xcb0\xb2\xd3\x83\xb5:\xf02\xc8#`T\xbfx\xf0\
-\x1b\xeet\x9d\xcd\xfc@\x84#K\x02\x87]\x87\xa4\xf8\
-\x042\xed\xd1\x92B\xa9\x8a\x09\x91\x06\x0d\xb5^p\x8e\
-\xccH` \xfa\xd34\x0a:Y\xbd \x1b\xffF<\
-\xcd\xf1'\xa8\xfc\xe1\x19\xfeh\x9a\x9e]\xc7\xddv'\
-\x19D\xd4\x22\x11:\x013]!\xbf\x09|\x15\x04K\
-E1\x926D\xa9\xcc]g\x15\x97T\xea\x1f\x8c\xc5\
-\xdfy\xba\xfbt\xd71\xdf\x95\x89@uj#\xa2\xdf\
-a\xaa\x1a\xf3\xd4\x0f\xc6\xc9\xd8\x88\xc2#`\xc5\x12[\
-m\x80y6j}H\xa0Ve\xeet\xe9z\x92]\
-\x9b\xec\x95\xc4\xf7\x97\xad\xfd\x1b$L\xa7z)\xd1\xfa\
-X\xa6\xfc\x99\xf7*NG\x1e5\x5c\xf3*`\xb2\xfa\
-\xc5S\xcb\xacR\x05\x93KLlB\x22\xf9:\x1a\xf4\
-Z\x09\x90\xd3\xd6)%\xcdP\x80j`24\x96m\
-\x940\xd7m\x9c2Q\xb9AB\x13W\x82E\x06\x00\
--\x06<$V!\xb5\x13)\x1a\xb1\x93\xf1\x10\xebq\
-\xa5\x94\xb5\xd2\x8a\x90\x18\x02e\xa1;v#\xe4XP\
-\xf0q\x8eh1&\xddw\xd6\xb1Ra\xa6\xb4\x03Q\
-\x17\xb1\xbc?\xc3\xf3{j\x5c^^0\xa1VWQ\
-\xb0`\xd3\xca \x84v\xf2\xb5\xb6\xc6B)\x07-c\
-S\xc6\xb9\xc8'a\x81\xb6\x94\xd5/@\xbc\x88\xcaI\
-S\xactZuc\xd8nL\x18\xc6l\xa8]\x0f\x03\
-\x19,\x04\x8d\xf0\x1f\xfe\xec\xf7\x86\xa3\xa4\xad\x07\xaf\x93\
-\xc2g7\x19\x0cEz,\xd7|\x03gK~\xcd)\
-l!9\x82l\xfb\xe8p8\x8c\xaf\x8c2\x19\x00K\
-^\x89\x0c,\xd3\x07\x9dj\xdc9\xe0kI\x00S\x0c\
-k\x92)VRM\x937\x05\x13\xb7\x9d\x1aHOc\
-YL\xa5\x94\xaa\x92\xe8\xc1\xd3T\xf0\xfb\x19\xbe\xce\x10\
-\xa4\x96[\x8d5\x11\x95\xd4\xd4\x98\x1ao\xcb\xba\x81;\
-k\x0a\x87\xc4\x95\x18\xb2m\xc9i\xac\xdb\x9d$\x1e\xdc\
-\x82\xf7\xee0>\x9b\xae\xd8\x90\x81\xa2\x8ar\xc20\xac\
-d\xd8\xceH\x06[\xb6\x15N*\x0dj\x91D\x0bF\
-\xf4\x12\x19%@\xb3\x82\x89\x15\xc0>\xa57H\x8e\xe2\
-\xe1\xc8R\x96\x172\xa3\x19G\x5c\x1a52\x8d!X\
-6x\xfd\x02\xedNx)\xab\xdee\x19\xb0PNZ\
-\x08h9.b\x9c4\x8a\x0a*Z\xab\x97H\xbf\x1c\
-+\x1c\xf4\xcaI&$7$`}\xcb\xe4\xcf\x82'\
-\xcc\xd4\x8f\x9d\xc3\xa5\x9b\xe1U\x90\xa7\xd4d>\xa1I\
-\xeb\x80\xf5\xd4\xda\x19\x81\xb6'nN\xdcB`(\x99\
-LX\xdf\x90\xf9J\xaf\xad\xac\xb6@\xddM\x07\x0b\xa5\
-\x18I\x96\x03.\x19\xd7\xc6\xad\xc7\xd2\x1d\xa5(\x02\xa4\
-\xd6\xb6QK\x98\xb2Q5\xc7}\xaa\x04 \x88l\x12\
-\xea\xbd\x06\xf5\xda!3\xaf\xd8t\xdc\xa7\x94DL\xdd\
-\x84\x7f`\xcd\x0e\xe1O~\xb3u\x86\xe0\xcd\xcdl\x82\
-\x91S\x80 d\x89\xce\xe3\xed\x0e.\xef\xc1\xac\xd2\xb4\
-Y$J\x0a{\x10\x04\xac\xb3\x131\x0d\x84\xe8\xe6\x98\
-\xda\x0b./U\xd22^\xdc\xaa\xca\xac\x81y8\x82\
-E\xc9\xe4\x95%6 \xc2\xa1\x96F\x17\x0c\x96Lv\
-\x01T\xe7o\x91\xfez\xa0\xf9/p \xaa;I'\
-~\x13\x9150\x93\xb3u\x09\xdc\x17\xd1.$\x93\xf3\
-wHG\xa1\x157\x93s\xc2\xb6\x11i\x1cv>\x03\
-@C\xc9\x5c\x99\xc9\xb1\xc7:\xb2\xf7\x15?\xd3\xc3\xf7\
-\x93\xf82\x1e\xa4\x1b\x91\xb7\x05\xcaJ\xb2\xb4\xdd\xbb\xe9\
-C#\x06\xc1\xd2^\xb7UE\xb7\x81n\xfc2\xbd\x8a\
-\xd1S\xe6%\x08\xfc\xde`eE\xdbc\xb3Y\xa0\xa0\
-\x04\xc3\xeb$\x19\x0da\xea<\xde\xdd\xda\xb1vDI\
-l\xbc\x89\xf4I\xd1p\xf4\xa6\x93\x9cP\x09\xcb\xff\xd7\
-JU\x07+C\x81\xa9\x08\xfa9\xb0|\xa0\x94;\xe2\
-\xe2\xc4\xdb\x1e\x93\xf9\xc5Gd\x84\x1a\xf4\xc8\xed\xe3\xbd\
-\xa3\xd3\x13\x5c\xc0\x8ew\x9f\x1c>\xdbU\x09\x05\xdb\x11\
-\x96\x22\x02\x90\x95 \xc4\x00[\xcf\xe3\xd7\xd5\xdc!\x98\
-\x94 \xf1o\xea\x03]k\xeb\xf4q\xa4\x0e\x04C\xcf\
-\x0b\xe2z\xfdM\xe8\x9dIJs=y\x0d2\x9b\xbc\
-\x8c\xd71\xcb\x0b\xb6{\xdd\xd1 \xbd\x08\xbd\xeb\xd1\xa8\
-?\x0c\xd7\xd7[\xed.z\xd7\x5cc\xbd\xa0\xfd\xac\xcb\
-\xef\xf5\x16\x03z\xe2F\x8b\xed\x8a&\x9d^\xdcN\xda\
-8\x93\xf1\x17\xee\xb6\xe5'\xcb$\x94\xd4l\xfe\x0e\xeb\
-\xf7\x93{\x01\x8d\x07M\xa9\xb0\x1e\xb4\xd8\xebz2\xe8\
-\xf5F\xd8\xd4>T\x14b\x07f\xf0s\x10\xdfP\xf1\
-\x93\xd3\xad\xd3\xa7'\xe1\xe4\xf0s(\xb1{||x\
-\x1c\xae\xd5Qnt\x92\xa7\xc7\xfb\x96\xcf\x1d$\x18\xb2\
-\x92wP\xa3B\x7f\x22\xccR\xfeB\xdf??\xab\x9c\
-\xadU\xbf\x8c\xd7\xbe\xaa\xad}\xd2\x5c\xf5\xcf\x9b\xeb\xa9\
-\x0f\xeb%\xd6\x9b\xf5\xd7\xa02xf\xd2\xf0\x11GT\
-A\xa03\x95\xdaT\xca\x14u\xa3\x8a\xbd\xf0W\xa9\xae\
-\xe1\xf8b8\x1a\xe8\xe22\xac\xab\x1bZ\xa4#\x14\xf7\
-\x01\x19\xcbtb<\xe8\x88\x0d\x12\x90EY\xec\x0d\xc8\
-V\xb8k\x01\xa6(\x9e\x86\xc9\x86\x9f0\x01\x00$2\
-\xa3\xed\xadZE\xec\x02~\xa3\xdd\x13cg\xeb:\x01\
-\xd1\xb7\x5c\xcf8\xb8`W\xd1RVD\x17\xf2c!\
-Z\xa4\xed\xe6\xca\x8a\xd3,\x95l5M%\xf9\x13n\
-\x9d\xb7\x9a\xb6W=\xb7q\xd9b\x81nX\xadq1\
-Hb\xd8\xee\xbc\x02\xc6O*\x92\xaeI\x098\x98\x92\
-\xc7\xc9\xcb,7`o\x9e\xb1\x8c\xcfx\xd8\x9f!\x00\
-\x0c\xa0\xca\x93\xf4\xe9\xd4\xf3\x14\xe2g@\xcdg\x91\xb7\
-\x09\xff\xad>\xf3\x83g\xb3\x00\xaa*\xa8\xc4^G\x85\
-+9gU'A)N\xc2\x95\xf3\x07\xe3t\x90\xb8\
-H\xac\x83%\xb5l7l\x05\xd4Y\x08,\xfd\x08\xcb\
-\x16\x9c\x94\xe9\x81\xc4q\xa4z\x89+\xb3\x83H\x9e\xb6\
-\xa4!TG\xbd\xa7}H\xdd\x8e\x87\xb8\x81 ^\xc7\
-\x7fH\xba\xd0\x19\x0a\xc11o\xf7;\xe9\x08\xfd\xee\xd6\
-}PV\xfa\x15\xdf-\xdcP\xc6U\x9e\xc1\xd5nO\
-\xe4\xcb\xca\x8aw&?\xc9\xdd\xcc\x9e(\xb5\xe0\x13\xdf\
-w\xf5 \x9e\xf6U\x9a\xf0\xd2\x06\xc0L-\xcbSZ\
-4r\x12E<\xb2\x19lN\x16o\x00\x91@\x0f\xf7\
-\xf6w\xd1\xc1\x12\xff\xb2\xb2C\xcdbt\xfbP\xa6\x82\
-9ft\xf2Z2\x02\xfd\xffz,\x17R\x1cD\xbe\
-\xd0\x95=\xbb\xda$\xf93\xa4h\xa8#cV\x0fq\
-\xe5\xc4\xf5\xdf|\xc2v\xc9\x0c\xd4\x80\xc7\xc2/8\xb6\
-\xc5|\x22\xc3p\x09\xbd\xa3\x01l\xc9[%\xef\xbbF\
-\xae\xbc\xe5>\xec\xb6\xa6x\x18]m\xd6)Q\xb2/\
-\xfc\xd9\x0d\xa5;j\xd6\xa2q+\xe6\xdf\x9c\xc3\xfca\
-\xf9(Y{WC\x19\x81\x5cL\x18]\x15-\xfcJ\
-\xbeV\x8a\x92\xf5\x91\x98\xab\xf5V|\xab/\x16x\xd9\
-\x06[\xef\x8b4\xb5\xd0\x07p\xee\xc6\xc4`\xa6\xcd\x09\
-\xa1W\x86\xc5\xa2<g\xe7\x12\x94\x83\xd9\xa6s\xd0\x22\
-\xad\xb3\xef\x22p\xb4N\x0f\x12\xa5/\x95*\x85\xa5\xa6\
-i\x12,ynp,\xd4\x8d\xfc\x04\xb5GC'F\
-\x93>7\x05\x94\xb8\xe5\xda\x0c\xb7g<\x87\xc2\xc9/\
-\x9c\xcc\x95ld+\xd4\x0d \x05\x99\xf9\xf1\x96>b\
-J1\xccL\xa33\x0f\xeb\x17\x9f\x09\xb1\x10\x89\xdc.\
-j\xbdjS\xe8xW\xa0\xbeiy^H\x12\x0f\xa0\
-|@;G\xf1h<\x0c\xed\xe5\xe6\xf0si}\xc8\
-\x7ff\x05r\xae*\xf6:n\xb7\xd89\xaa\xa8\x5c\xf0\
-\xd6S0T{]\xf2\x9d\x8cT\xe5\x92L\xd2\xd7\x1b\
-\x81\x1a\xbe\xfe<~\x19\x0b5T\xeep\xd0\x22Nv\
-u\x07\xc6\xab\x85e\x91\x9b\xdc,\xd8>y\xcb\xf1\xea\
-\xa4\xdd\x17\xa5\xa3\x85\x99\x9e\xdf\xc0?\xb0\xff\x00\xed\x8d\
-4x\xdafyT\xd2\xeePk8\x94\xc4\xebAr\
-9\xbf#\x0b\xc7Q\xc8\x1c\x96\x92\xb9h\xf8f%T\
-\xc2F\xf9f\xfc\x07\xd2Mk\x898\xb32\x89z\xd4\
-0\xea\x0dN\x0a\xca\x08'\x5c\xac\xc0\x88\xd8\xb5=w\
-\x17\xae\x10\xde\xc9\xe9\xf7\xf6wi\xfb\x0c\xe5\xaa\xf8\x0f\
-\x0e\xc8\xca\x0a}\x9aM\xab\xdaL/\x0b\xa0\xc9\xa9\x02\
-\xad\xd1\x85r\xb3Pm:\xfc\xdcW\x97W[\xb0\x88\
-\x22fo\x7f\xef\xe0\xf3\x5c\x8d\xe5\xc5\xf5\xd6\x7f\xd3\x22\
-\x0c\xd0|0\xca\xd3\x8b4r\x01\x97\x1d\xfe\xea\xaa\xb1\
-\xeb2\xdd\xcd\xd6O\x16\xa1\xc5(\xf7I\xee\x11m\xe7\
-`\xb3V+BfFg\xeb\x17\xb6\xbe\x1b\x10&\xf4\
-G\x8a\xdf(\xd9\x80\x9e'\xb4\xb9\xc8\x8c\x0fm,|\
-\xd7\xa7I\xfb\xbe`&5.\xd2\xcd\x94D\xa6Z\x84\
-\xb5\xc9o\x0b\x1a%\x9c\xfc\x9dN\x09D\x09\x04\x86\xa1\
-\x86E\x02\xdf\x1b\xc5\x9d\x88R\xa6\xd3\x1a\xb7y\xd3\xf6\
- 3]\xf1C\xfa@\xd36\xe2\x9bc\xb3\xe7\xd6\x22\
-\xe6Un\xb9\x90B\xff\xa4\xe5\xb8z\xd9\xe9\xc1\xeaS\
-\xaf\xd6\xee\xbfo\xb2V\xef\xabI\x83\xe5?\x8bl\x01\
-\xbaY\x99\xa3\xb1\x07u?\xac\xf1\xbe,#\x94x\xda\
-\xfa\x13\xfe\xfbim\xd3\x189,\xc1\xcf\xa2)t\xf3\
-\xd0\xf8\x84+\xab\xdaK\x15\xdcH0>\xfczf\xdb\
-\xb7\x09\xcc\x95\x02tn4\x1fu\x5c\x93m.\xb6\xe8\
-I4\xe7\x15\xd8\x92\xa8f\x80\x0d\xc5\xf1\x04~\x8e\x91\
-J\x9dc\x16\xc1\x9cqf\x13\xa7\xf5\xf1\xb8\x93\x0co\
-\x09\x96u\x8c\xa8\xd8\x1cI\xf38\xc7>\x16\xdb\xf9\xaa\
-\xd7<\xd1\xb2\x9dv\xe6\x1d\xfb(\x14u[.\xaf\x0e\
-O\xb0\x9d\xa0\xb9\x90\x00\x10y\x85?\xa7\xd3\x8c\xec\xa2\
-\xfbVl\xaa\xd3\x1d\x99N\xf9{\xc0\x1fgM_\x91\
-\xad\x06\x0a\x9aB^w.a\xc1?j1V\xe6\x1d\
-<\xdf\x84\xc1N\xdaK\xd0\xa64\xbe\xe8$S< \
-\x18\xa4\x94\xf6\xf4xo\xdd\xdf\xd4\xc8\xc2\x02\x04'\xc0\
-R\xa8^.\xd1\xe2\xbd\xee\xbb\x95\xcbO{Nf\xb4\
-\x17s\x92\xe8\x0eD\xd3\x0fj\x0b\x06c&\xba\x97b\
-\xf3\x9cm\xabX\xff'C\xad\xac\xa6Q~iU\xbb\
-\x07I\x5cYY\x96_U\xad\xf8mV\x9c5\x96\xce\
-\xe6*\x0aJ\x9fs\xb60Y\xb5^\xe5jeJ%\
-\xb0:\x02TC\x03\xb0k\xd6\x5cY\xb1\xba\xef\x18F\
-\x814\xcah\xca\x87\xab.6\xbf`\x8f\x13i\x10\x92\
-#AV\xe7\xd6\xfd\x0f\xf2\x1b\x1eU\xd4ppX\xd1\
-\xe4Y\x80\xc8iCFuT\x830)VM\x8aw\
-7\x9b\x85[\x1eu\xe6\xe2\xf6R\x1d\xbfX\x822\xcb\
-$\x05\xfa\xaa\x8c\xd1\xca\x8a3\x82\xe5\x80E\x0a\x9a4\
- \xcaIz\x03\xcb\xfb\xf4\xcc\x964+\xb25`\xb6\
-\xdd\x0e\x07\x9e$x\xa4\x87\x9b\xf2\x871\xe4\xb6\xbd\xc0\
-C\xc5o\xe9\x92\xbe\x96F=\xe2\xe6p\xe9\xbd\xba'\
-j\x1a\xd2%\xd8H\xee\xc9\x85\xc8\xc7\xe3\x0b\xe5\xe9\x8a\
-.\x01\x80\x8c\xf6\xe4d=\xa0\x89-\xe50h\x03\xe9\
-\xb3\xd6\xe5[\xfa\xce\xe8\xce,\xbb\xac;\xae'&A\
-J\xb0\xdb=*X\x16\xb0\xbf\xd0X\xe0W,{\x14\
-\x95,\xdf8a.\xde\xad\xc1\xbf9\xb5\xbb\xdc\xb2R\
-\xb2o@,>\x1b\xe4\x8b5\xcel\x96V9\xcb2\
-\xec\x9e\x87\x0ct\x9b\x0b@6\xbd\x8c2\x17\xcdS\xd6\
-\x8dk5\xf5\x22o\xd0\xb1\xc6';\xb4\xc5\xd7B$\
-O\x10\xf1\x17\xdfx\xe2Q\xf7\xbc\x00\xefNcz\xc3\
-\xc43\x90R\x80\x90\x7f\x15\x18\xca\xfd\xf2\xda\xc8&\xce\
-Y\xab\x11\x9a\xc4\x97&\xde\xaa\xc9Z\xf5f\xe7]O\
-\xdb>\x0b.\xc0V,<\xb6\x8fA#\xfd\xd4\xe4h\
-\xeb\x01:\xb51\x87Mf>]A5@\xe8\x1e\xad\
-ZR\xcc\xe0\xc6\x08\xeb\xfd\x177I;\x8d\x91\xd5\xd3\
-\xb61\xe1~\xe8\xe7\xfaR2U\xa8\xbd\x99\xde\xc9\x05\
-w\x93\xaf\x8d!\xb8\xdb\xd3\xb4\xc635\x87x\xba\x97\
-\x19\xca\xd3\x1e\x11\xf6S\x19\xb4|\x0e\x8c\x07\x85\x98t\
-\xc6L*J\x159>\xadz\xe1\x92=\x08\x5c\x00'\
-]\xc10U\x9f\xf7\xd2n\xc5k,y\xd2\x9d\x99\xe6\
-\x1f\x84\x86\x05\xdd>\x9a\xd5q\x89N\x9f\xecG\x13\x99\
-\xd6\x86;\x915\x02\x0a\x0a\xd2\xeb\x8e\xc8\x15\xcc\xc4\xe5\
-)\x96\x08d\xf7\x0c8j\x08E\x1b\xe0\xbfYR(\
-\xc1\xe1\xdb2\x06\xc0\xb2\xcc\xac\xd3\xd0\xbf\x82\xc7\x9c{\
-Y\x1c[@A\x03\x95\xaa\x83\xa4\xdf\x89[Ie}\
-\xadr\x16\xaf}\xd5\xf4\xd7\xafX\xec\x8c[OP\xaf\
-\xf2\x85\xd7h\xd0f\xa6J+TSu\xaf;\x04\xf4\
-\x148\x85\x82\xbbPX\xa1A\x0fZ.\xf1\x84<\xd4\
-\xe8\xd6\xf8\xcb\xb0\xdd}\x8e\xb0R\x05\xddbk\x84\xa7\
-\x0b\xb8lZ\xf1Of\x1c\xf6A(\x9aq\xc6W\xf3\
-H\x03\xa0\xdf\xa6\xfc\x8e\xce\xd4\xaff\xd6\xe9Ced\
-\x0ds\x0b\xb0\xa3]\x0e\xa3\xcc8R\x91\xc8\xa4F\xd4\
-\x82\xc4\x0d\x8a\xfdYw?7`\xc6\x87\xca\x96\x16\xb1\
-`aU\x02\x08!\x97^\x91\x94v\xdda\xb6\xee\xf2\
-+\x99\xa6\x90\x16\xae\x14lG\xc6\xd3\xf25\xc1\xcf\xa0\
-eL\x1f\xee\x11\x02\x19\x90s\xac>\xec\xc7\xdd\xa0\x80\
-\xdf\xd5\xec\x81\xecr\x1a\xe5\xcb\xe1\x9dhi\xba5\x9d\
- %\xefQ\x90\xe9(\x01Q\x1b1)\xdb@\x1bC\
-q\x9b\x5cD\x80I\x13\xdf\xc2E\xdf\x82M\x1d\x81h\
-\xb8\x07\xe3+_Y\x06q\x09\xc5\x7fX! O]\
-\xc9\xbaL\x07\xc3\x11\xd5\xdbP\xd0\xf9\x1b\xb1\x16\x94\xd8\
-J\xa5_N\x13`\x93qU\xd6H9\xb2\xc2&\xc8\
-\x057VhL\xfb6\xe5w\xda\xed&\x03\x14d\xa1\
-\x95\xe9\x1b9\xf0\xfd\xf3\xe1\xeaz\xe0yV\x12\xa4|\
-\x9b\x92f\xc16h\xbai\x12\xa2\xe9\xf92}\x1dz\
-7\xcf_{\xb0\x9b\xef\xa7\xb0W\x0b\xef}x?8\
-I2\xfe\xab\x81\x0e\x92\xf4\x22y\x83Wc\x94\xccs\
-\x0f\xad\xe7\x85I\xc2\x82r{\x03dx\xe8\xad\x8a\x84\
-\xb0\x83\x8a\xe8\xc6\xae\x80\x00\xf3@\xe4\xf8\xbc\xbdjQ\
-\x83U\x84\x14l\xf4\xaaW\xf5Vy\xc1\x88\xbc\xd5d\
-\xd8\x8a\xfbI\x85\xaa\xe05a\xa5\x81e\xd5pK\xdf\
-\x84\xbehCB\x87\xa5\x1d`\xc5\x06~!;\xe0\x07\
-\x19\xaa\xd1\xf7\x84>\xe4\x00Y\x95\x0d\xb8\x11\xab\x11\xac\
-7\x92\x065S\x89Q\xef\xd1\x93S\xd5\x89\x19\xdd\xeb\
-\xd7\x0c\xcf-\x97\xb2P\x14\x9d,\xa2u\xcf\xdeG\x03\
-K<\xca\x11\x9c\x82\x85\x98\x90o\xca#\x08\x8a\x8f\x92\
-A\x97\xda\x7f\x9c\x5c\xed\xbe\xeeW\xbc\xcaf\xf8\xfdi\
-\xe3\xfc|\xf8\xbe/k\xbe\xa2\xd1\xf9\xb9\xa1R\xe5\xec\
-\xfb\x8d\xe6\xfb>\x007\xa6\xdf\xf6a=d\x1f\x0dl\
--\xbbi\x08j\xb2\xb8U2\x1dp\xf6\xfd(\xd2\xa9\
-\x08\x0c\x10.\x07\xdaMC1\x03\xf1\xc8\xb8+\xa3\xa2\
-\xb3\xe5\xbc\x93\xc6F\xdc\xffi\xc4\x8a\x8eW^\xc6\x9d\
-q\x12\x89\x03\x09B\xe1\x05\x1a\xb1\x11@O\xc2\xe6*\
-l\x1a\xab\xef\xfb\xeb\xbe\x0f\xb2\xd8b\x1c\xe6\x1cP\xd3\
-\xbd\xd1`\x9c\xe0\xf4!T\x9b\x8cp\xb9\x16z\x971\
-L\xef\x5cF=\xa4\x1f\xdaOem\xb3r\xde^\xad\
-\x9cW\xe1_\x7fs\xca\x7f\xbfM\x06\x09.\xd1\x8f\x07\
-\xc3\xe4!liF\x9c\xc01\xc8\x8cw\x0a\xa3\xb7\xa5\
-\xf7\xcc\xc4/\xdc\xef\x81\xae\x9c~\x15S\x88\xb7I\x07\
-\xbf\x92\xd0K\xba^\xd0\x06\xc6\xc2@F\x8e\xd3P\xc7\
-\x02\xf7DQ\x1c\x86\x93x\x10N`\x90\xc6\xa7\xe9\x08\
-\x8b\xff\xe4\xb7~\xfa+?\xf9\xe3\x9f\xfc\xdeO~\xfb\
-\xa7\xff\xf0'\xff\xcc\x03\xb9:\x1c9\x00\xf0=\x865\
-\xbc;\x86\xbc\x8b+'\xeb\xeb\xdf\xfb\xf1?\xfc\xfa_\
-}\xfd\xc3\xaf\x7f\xf7\xc7\xbf\xf4\xe3_\xfe\xfaO\xbe\xfe\
-#\x84i\xb5\xdc\x0a~\xfb\xa7\xbf\xf2\xd3_\xfdw\xff\
-\xd5\xbf\xffG\x98\xe9V~1H\xbe\xba\xeeu\x93+\
-\x0f\x1d\x84\x9d,`\x9d\xb8\xf3\xa3\xff\x113\xda='\
-\xe7\xc9\x8f\xfeE\xf7j\xad\xfdg\xbf\xfeo\xff'\xf8\
-\xdb\xbd\xfa\xab?\xfe\xe1\xbf\xfd\x15\x84\x1b:`\x7f\xf6\
-k\xc9\x9f\xff\xe6(\xed\xc6\x1e\x06Gq\xb2\xdaqw\
-\xf8\x02\x93\x13'y'\x19\x8f\x86\xadk\xccH\x7f\xe0\
-\xe4\xfcb\xfcU\xfc\x22\x85\x8c\xa4\xeb\xa4\xefv\xaf:\
-\xe9\xf0\x1a\xb6\x19\xc3}}\x1c\x17$n{w\x87 \
-\xd0\xe2\xee\xa8\x87\xe5\xdd6&\xb0B\xfd\xe8\xf7z\x1d\
-\xc8\xb9t\x9b\xf8\xd3_\xfe\xc9o\xc1\xa0\xfc\x90\xa8v\
-\x99:y\xc3q\xef\x06\x1bs\xe9\x12\xf3\x12*\xf9\xd1\
-o\xc5\xe9\x10\xb2\xae:N\xd6\x15p\xca\x15\xd6\x7f\xed\
-\xf6\xf8/\xfe\xe9_\xfc\xd7\x7f\xf1\xdb\x7f\xf1\xdf\xff\xc5\
-?\x87\xbc\xd4mA\x8a~\xba\x1d\xe0\x991R0u\
-\x99\x22\x85\xc1\x01\x9e@\x94\xcf\xddb\x7f\xfd\x1b\xff\xf3\
-_\xff\x93\x7f\xf1\x1f\xff\xf9\xff\x00Y/\x5cj\xfd\xe5\
-\xef\xff\xfa_\xfe\xfeo\xff\xe5\x0f\x7f\x0d\xff\xfd\xfd\xdf\
-D\x00\x97R\xff\xcf\xaf\xff\x93\xff\xeb\x0f\x7f\xe7\xff\xfe\
-\xc7\x7f\x00Y\x9d\x0b'k\xffG\xff\xcb\xe8\xab\xe4b\
-\x9c\x0c\xae\x12\x1e\xa3\xce\x0b\x97*?\xfd\x95\x7f\xff\xeb\
-\xff\xee\x9f\x11\xbd:nc;)L\xa7\x97\xe9\x9f\xff\
-\x10\xb2n^\xb8\x1c\xfc\xa7_\xff.\xf0\xed\x1f~\xfd\
-\x07_\xffo_\xffk\xcd\xc3]\x97|\x07I\x1bH\
-\x11w\xdbH\xda\x9e\xcb\xde\xbdV\x0b\x88\x01\xbb\x88\xa0\
-\xef\x16\xea\xf7:C\xe2\x99\xfe(\x93>\x18\x8d\xaf\xc6\
-?\xfa\xe7\x88\xcc\xeb\x8f\xd6.\x06^\x09\x00\xa8@K\
-\x0f\x06\xf10E\x06\x19\x8c\x1d(\x98q\x7f\xef\xc7\xbf\
-\xcc-\xfe\xfa\x8f!\x7f\xd8r\x89y\xd2\xea\x8d\x86\x94\
-\xee\x8e\xc20m\xa5\x1d\x99\xcfC\x97\x1a\xc3\x0eh'\
-\xdd?\xfb5\x9e4\xc3NA\xe6\x9f\xff\xa6\xce~\xe9\
-fC\xe6\xf0\x05f\x8c\xae\xddQ\xff\xe3_\xf9\xcb?\
-\xfa\x8d\xbf\xfc\xa3\x7f\x8aY.\xc7\x9e\xfe\xe8O\x07/\
-~\xf4[\x09\xe4\x8c\xdd\x96\xfc\xf8\xef}\xfd'?\xfe\
-%\x90+\xbf\x81\xa3\xf2\xe3\x7f\x04\xbd\xfc]\x80z\xe9\
-\x0e\xf9i\xfaW\x7f\xf2o\xbaWK\xcf\xd2\xbf\xfaW\
-\x7f\x7f\x84\xe4\xfc\xeaz\xed\x1a&\xb7K\xd0\xff\xf0G\
-\xbf\xf3\xd7\xff\xf8\xef\xff\xa7?\xfd\xd5\xff\xf3\x7f\xfd\xa5\
-\xff\xf0\xaf\xff\xdb\xff\xf4\xa7\xff\xc0\x80\x8e\x5c\xd0\xbf\xfe\
-\xbd\x7f\xf0\x1f\xff\xe5\xefx3tf\xa4\x85-\x5c\x7f\
-\x0fE\xfa\xf4|\x02\xff\x9e\xcf\xe0/\xed\x95V\xc3\xf3\
-\xf7P\xd2o\x86\xe7S\xf8\xe7=\x95\xfd^uz\xf6\
-\xfd\xf3Y\xd3\x7f\xdf\xc7\xcf*\xee\xa9N\x8e\xf6\xf7N\
-\xc3{\xb0vx\xf1\xeb\x0bO9\xf0T^\xc3:\xa4\
-\x8e\x02,s\x07E\x81\x1a$W\xc9k\xa3\xc7r`\
-#.\xc8Y\xb3\xb0\xa4\x88u\xf5\x00\xb6\xdd\xac\xe9w\
-@\x86\xcb\xa5l\x82\xaab\xc2^\xb7\x9d\xbc\x86T^\
--9\x9dVq\xc6\xe77|\xb9\xc5\xc2\xf7\xd4\xa5\x09\
-\xbc\x83\xc3\xf2\x8c\x1b\x94J@\xb3\x86\x09\xbe\x1fX%\
-\xe4\xa2\x94\xdcW`Xu\xc9\xcc\xe7\x16Y\x08Vy\
-\x05\xaci\xc3\x87\x13\xbe\xa5\xac\x09\xba\xc6Y\xf0\xa5\x13\
-\x91\xae\x7f\x0d\xb3\xc6\x1c\xed\x96l\xf1\x04jS\xc5\xd0\
-\xc3k''\xdd\x14\xf6\x0b#\x0bI\xe8d\xb3\xbe&\
-\xa6\xd2\xde\x8bq\xff\x88\xa0,\xf8\xa0,:\xcb\x86\xcf\
-\x11)\x0d\x9e\xdc\x18R\x80\x97v\xef&N\xbbr@\
-\x13\xdc\xa8\x0b\xa3Qq/\xd8\x16\xa0|Orz\x11\
-#[Y\xb1\x83\xac\xe0\x0eQ\x82\xbd\xe0\x1d\x87\xa2\xee\
-s\xb1@A+5r0R\xd6d\xe4i\xd5jq\
-\x1d\xa4\xf9\xe2K{\xf0\xda?\xc1\xbb\x0d\x8a6\xe4Z\
-\x22gR4\x86\xebx\xb05\xaa\xd4H\xf1n}\x16\
-y5\xd0\xe1[\x9fF\xde'\x9e\xaf\x808&\x8d\xfa\
-Z\x83mu.l\x8e\xca\xc4+\xf2\xaa\x14_\x8f#\
-@\x9d\xe8[6\xb1\x09*t-4\xf6U\xac\x06\x09\
-\x83\x01\x9b\xde\xa61\x1a<\xd0)rkg\xc3\xff&\
-\x1a:\xd1\x9e\xd1\xa6\x85\xda-z\xc2\x96\x1bPkI\
-J\xf9 \x8c@\xbd=\x9f\x81\xca\xd9P\xfa6\xd92\
-\xfb\x9d\xf1 \xee`w\xb5b\xcd\xfe%\xdc\x19N\xdc\
-@\xca:\xc1Y\xba\xa6\xd3\xde\xe6\xe6&[\xfe&*\
-\xbe0\xe1\xact\xa1\x9b\xcc\x1e\xf4=\x94\x1a\xeeY\xfa\
-u\xe5\xfb \x15\xdfk\xfa\x95\xf7\xde\xf3\xdf\x7f\xef|\
-\x8a\xda\xf6\xb7\xeb\xdf\xdex\xef\xff\xfd7\xff\xd2\xf3\xb5\
-G\xe3\x14Z\xdd\xfd\x0c\x83ut?\x15dJ>\xba\
-\x94r'\xa3\x80\x9eu\xad\x1a\xcf\xc7\xbb\x0fw\x1fb\
-=S\xd86\xd8\xd3*t{4\xe3`h&\xf1=\
-oU}\xcc$\xf8B\xc1\x80QY2S-\x0b^\
-\x115\xcc\xf3\xbc\x9d\xf4$\xfc\x16\xcf)\x14\xc7\x98\x1b\
-y\x9e\x9a\xb3z\x96b\xfa\xaa\xae(X]\x85\x0c:\
-\xc4\x14A\xa5Xb\xb3\x22\xc8X\x22b\xba\x1f(\xfc\
-*K.\xd8\xeaB\xaaV\xee\xba\xa9F\xf9(\xd2v\
-\x0c\x13WV\xca\xb1\x1b\xc9\xc5\xdfV\xc8T\x16\x15\x02\
-gL\xc0f\x11\x92\x18.\x82;\x1f\xd7\xa1D<K\
-\x01\x9a\x0a\x1cY\x15o\xca\x9b\xd4F\x91\x91^y\x06\
-Hl\xe6H\xdc\x06\x1a%u\xa4m\xb4\x1e\x02\xdc\x99\
-t\x83B6\x127\x934\x8f\x0a%\xbd\xaa\xa4!}\
-T\xd7=\xad\x9b\xcdB\xad'\xf1\xe0E\xbb\xf7\xaa+\
-k\x0d\x95\xd4Q\x99\x14Krp\xa6\xb2UJU\xb6\
-\xb9\xb02\x19\x1a\xfb\x8a2]\xe7\xf7C\xaaV\x8e\xe6\
-\xa3{\x9b\xf6\xaaz\xa6\x1c+\xa4\x9e`\xcer@ \
-\x1bM\xbf\xe9\x87\xce\xc2l\x06\x8a{R\x92\x99\x89\xc9\
-\x06J\x01\x13\xe7H\xa9Z\x95\xf7\xaa\xfe\xb4r\xfe\xfe\
-\xa4\x1e\xdc\x9b\xf9\x15T\xac\xaa\xa0C\xadn\xfa\xe7\x1b\
-\xd3\xca\xdf]u\x93>\x98\x9e\x9f9\x09\xcd\xf3\x0a\xec\
-\xf2\xcf\x87\xe7>^\x11\xf1\xd7\x83\xcc Xq\x8cy\
-4\x9c\xe56\xcf\xb7\x14\xeb\x81\x17=. \x92\x8a(\
-\x94i\xbc/\x1bl\x99]5\xe4\xfa\xb25\xf0c%\
-UW\xeb\xcdM\x8e\xffP$\xd6\x04f\xa3\xe9\xb43\
-\x98\xc3&:\x9c\x84\x04\x90\x08\xf8\xe3\xcc\xbb\xf0\x02/\
-\xa5\xff\x9ag\xa6n}\xbd\xb4\x19H\x00\xd1f\x80j\
-j\x0e\x02O\x0e\x08\x13\x22R\xa0\xbe\x16\xa5\xab\xf7n\
-\xd1\x8d\x0f\x9a\x8e\xa11ggd3\xe3\xbbv\xd5\xc3\
-\x00\x81V\x1bu\x13\xef\xdf\xa2\x89\xf7\xdf\x99\xd2^\x0c\
-u\xa3\x1be8\xa7\x9a\x0f\xb9\x1a?\x18\xc5xM=\
-\xf4\xbe\xbc\x80\xbd%\xd9#\xb8\xcd\x15un\xa5\x17\x04\
-\x1d#\x84+\x82\xf1\xa8\xd8\xd7\xd3Y\x16H5*\x9c\
-V^\xa3\xf4yFR\xfb\x03}D\xea\x07z\x01\xc0\
-\xd6}\xc4\x07mN\x03 13y\xefT\xef,\xb0\
-\x01\x9d\xe8I%%&fe\x1a\xaa\x98\xd5C\xeb$\
-\xdf%l\x01\x82\xb2\xb1\x93\xbd\x0d\xc6\xf0btg\xfc\
-\xb7\xa9v\x12\x19\xf1:T'\xdcJf\xd9KA\xc1\
-\x96Cw\x80\xff\x92s\x19\xfe\x88\xbc/\xbd\xd2F\xc9\
-\xd9\x1c\x03\xa6m\x10\x1e\xd3)\xc0\xc3Z\x84_u\xfc\
-\xf2\x8c\xc7\x90q\x17\xda\xa1\x12R\xd0o`\x92\xf3\x90\
-\x0aF\x17@\xdfJ\xba\xf3J^)\x0a\x0bZ\x0ew\
-\xf4l\x10\xd3\xe0\x99 \xc6LZ\x5c\x0d\xdc\xca\x8a\xf9\
-]\xe5\xfa\xc8\xd9\x0d\x7f\xa0\x09?\x9f++6}P\
-My\x10Yr\x9b\x0d\x03\xa5\x9a\x02\xfb\x15>\x1a(\
-\xc8\x11\xe1\x1d\xe5\xf3\xf8\xe8P)b\x04\xc5\xce+\x0f\
-\xf3\x1e\x8d$\xdb]\x7f\x91v:h\x18\xd7\x8f\xecu\
-\x07\xcb\x11\x98oz\xd0\x9a\x8a\xbf\xa6S\xf2\x861\xc1\
-\xcd\x9f\x830C\x16#W\xea\xc8\x83o\x8f\xef\x97h\
-\xc5]\xd4\xf6\x10V0\xa9\xe7\xbc\x89Vi)\x14U\
-J\xc7\xa5\xaaM\xbdr\x91Q\x7f\xafz\xebb\xc8g\
-P\xe0\x9ab[\xb0\x0b\xe6S9\xd7)Mw\x9e\xbc\
-8\xe5\xf6\x1b\xd3\xad\x92\x0f\xc1L\x84P\x06\xd0h\xb9\
-f\x05\x80\x98\x99\x0b\xf1\x88W\x02bp\xac(L\xe0\
-\xe1a>\xcei\x94\xee\xe8 `pw\xcee\x0fH\
-\x8b\xf9TC\x81\x91\xdc\xd9D^\xea\x16\x22\xab2_\
-\x07\xa8\xcf]\x82\xa1[\xe3\x84)\xe0K\x10\xdc\x19\xb9\
-\x03!\x1c\xees\x04\x0d\xd5\xa1\xe9t\xc2A3\x7f\x96\
-\x93\xcalMn\xd1m\xa5\xdfi\xf8[\xf58\xd3-\
-\x7f6+)c@\xf0p\xf9t\xf0\xc6}u\x03\xfe\
-\xc9O\xb7K\x5c\xaft\xc8q\xbcQ\x8a\x87N\x97\xc0\
-w\xf6\xa9\x12\xf6\x12\x1dB\x07,\xe9\xe4\xf6\x19\xa44\
-r\xedf)x\xe6A\xf5\xea\x86J\xb7\x19\xd8\x85g\
-\x12\x8e|\x9fOVt\x1be\xa2L\xf4\x88\xb1\xb2\xc8\
-\xbfe\x0c\xaa\xa3\xde~\xef\x95\xbe\x84\xb7\xec\xb0\xa7\xe2\
-L\xb5\x8d\x19^\x1f\xf5\x86\xaa\xa0\xb6\xc5\x1d\xc2vf\
-\xcd#\xc6X\xc3\x10k\x02'\x03\xd1p\xabc\xab\x03\
-\xae~\xb5@\x01\xceX}\xbd\x89\xfbQQ\xf5U\xca\
-jX,\x1eQ\xcat*\x0c\x9f#\x19\x07>\xa8x\
-\xb0\x96\x80\xb2&NyL\x9d%\x1a\x16/\xb0g\x1e\
-\x12p\x0e\xf9L\x10<\x86P\x19\xba\xde'Iw,\
-\xd1\x98\xac\xe5\x8d\x9cq0\xcb\x93C\xffA\xdc\x1dv\
-b\xf7\x05\x19\xe9\x81\xe2c|\x9b#\xc5\x0ck\xe3X\
-D\x92 \x1d\x1e$\xaf\xf0\x1e5\x82(\x9d\xae\x08\x12\
-\xddk\x04\xb8\xc6J\x98\x9aqRJ}F\xf4\xba\x96\
-X\xdd\x9c\x1c553\x05T2\x17\xc4\xfa\x8br-\
-O$\xe3vC\x8b\x98\xd5Yn\xa1\xd1\x01\x90j\xd5\
-\x1b\xa2\xaa\x93\xb4M\x0e\x15<\x0a\x98Pa'\x08\xe7\
-2R;}\xa9\x04/\xb1J\xb9\xbc\xd5\x02\x1e?I\
-\xbe\x10\x87^\xf6\xba\xa3\x87\xf1M\xda\xc1\xa8\x95\x80\x8d\
-\x1d\x8f\xac\xe4(\x07\xe8\x07V\xd2\x0e-l\xd0\x14\xa7\
-x[\xa5FE\xa0\x817\x18\x91\x95k!\x1et}\
-\xd8\xea\x00\x7fG\xde \xbd\xba\x1ey \xf1\x02\xc8\x9e\
-\x05\xa69\xd9h\x90w\xa3\xc4f\xae{\xe2\x08\xec4\
-\xea\x9b\xab\xc3\xa0\xe4j\xd8,f9\x08\xbc\xddpJ\
-\x0d\x8cm\xd3\xf9\x02\x94!\x08\xaa\xeef=\xdc\x98\x05\
-l\xbe\xfc\xa6\xeacl\x9b\xce\x17\xd6\xd7\xb5\xce\xc3\xc5\
-\xf38\x02E$n\xbf\x09\x97\xeb\xc0>W!F\xea\
-\x0cZ\xe3\xc1\x00\xbd\x97\xc8\xc5x$\x0e?\x0f\xc6W\
-\xe17\x14\x12e:\x95\x9bZ\xae\xd3\xca\xcaJar\
-\xc5{\xd1\xeb\xfe`\x9c\xa0\x0f\xb3x\xef\x0e\xc3\x89\xf7\
--\xe9\xc8\x97\xd2\x11/\x9c\xf4{C\x9a\xca\xa1w\x99\
-\xbeF\x1f\xeaNr\x09;\xc4z\xff\xb5\x17\x5c\xf4F\
-\xa3\xdeM\xe8m\xe0\x87\x87\x02\xfaj\xd0\x1bw\xdbk\
-\xad^\x07\x10\x87\xde\xb7v?\xc4\xff!\xe4\x00/\x83\
-b\xb1\xa5a\xaf\x03\xdd\xf8\xd6'\xf7\xf1\x7f\x1e\xda\x5c\
-\xae@\xd7\xf2j\x88\xa4\x0f\xe2\x14wd\x88r\xe9c\
-B\xfb\xd5\x1a\x9d\xc7\x00\xb6zm\xc3\x0b\x08u\xe8\xc1\
-\x06\xb5\xf5\x02r\x91\xcf\xd6\x86\xe9W\xd0T\xef\xe3\xda\
-{\xf8hC{t\x1dz\xb8NC\xf6\xab\xebt\x94\
-\xac\x0d\xfb\xb0\xa5\x07\x80n\x0f_\x0a\xc2\xa36\xd3\xd1\
-\x93\xbd\xdd/\x1f\x0e\xe2\x1b\xb7\xaf\xf1\x05\xb4\x12\x86\x03\
-\x96\x93^?\xacq\xa7k\x0ay\xcdmX\xbdV\xd7\
-\x1d\xa4\xac\xe2.\xe1\xd7\x0c\x1d\x0ez\xaf@V\x02\xb9\
-\xb1n\xc3\x9d\x92n\x9c\x0b\x95\x1b\xfb\xcd0M\x1e\x22\
-\xed\x8f\xa4y\xc05\x91\xf1lQ?\x9e\x00?M\xa7\
-5\xff\xd3\x8f\x82\xdb`\x00\xd9c\xcbo\x89\x0f\x22\x1e\
-\xabyFhV\x15q\x22C\x1c?W\x13\xea\xe5/\
-\x86\x91\x87q\x90\x90\xa3c\xf2*\xb4\xbcp0\x09[\
-:\x0b\xb6\xe9F\xe1\x9c\xfe\xdf\xaeY\xcc\x83\x91W\xaf\
-\xdeOn\xbc\xe0n\x85qX\xa1(\x14\x9ce_\x00\
-\xb4\xbc\xbc\xf9\xa7\xba\xe0MS\x9b\xd6\xdce'l\xcf\
-t\xbal\xf2\xd5\x83`u\xed\xbb\x05\x92\x9c\xfd\x88%\
-\x9e\x1a\x0a\xfe~\x8c\x22\x01\x05\x81B\x0e\xa9E\x8fl\
-\xe0{\xa6\xda\x07X\xb7_]\xaa#\x87?)\xbd\xa9\
-\x91\x1b7\xbe\x90\xed4\xcb*Kn~#\xd3\xbb\x91\
-\x87X\x13+\xe6\x16\x11#\xf1h\x14\xb7\xaew_\xf2\
-\x9b\xa9\x15F\xc2\xb7\x89\xccO\xe0\xf8\x9d\xf4e\xc5\x8d\
-j\xe4\x8b\xaf\xa1q\xaf\xf5\xd26nC\xb1\x9c\xac\x81\
-\x05<\xe6\xe4\xf3,\x8b\xec$\x9ekN\x92\xcc\xb8\x88\
-\xe7\x9f\x9d\xf3\x15\x1f1\x83$\xa9\xbb\x19\xd7\x09.\xb9\
-R\xa2\x92\xef\x0a\xa5@\x17\xd2v\xe4\x15\x88\x8e O\
-\x9d\x8a\xd7\xeb\x0e[\x83^\xa7#*\xe9\x13\xe8;A\
-\xfb%\xd0\xa0\x88\xa2\x1c\xcbA\xbb\xdf:\xbc\x01\xb2J\
-\xbe\x89:Ok'\xc3>^\xce\x04\xd9\xd7M<'\
-\xd02\xf2\x8d\xba\xcc\xef\xf0\xd0\xad\x9c{=\xd2O\xd0\
-\xb9\x88\xeb\xb7L\xd9\xc4\xd5\xca\x82\xf1\xb2\xf4\x22\x0a\xe4\
-yz3\x8e\xd5:\xc4\x15\x1e\x0f\x18\x9b\xc5\xcd\x9b\x92\
-\x92\x92\xc6\xf9 \x81\x8dO\x82jT\x1e\x92l\xad\x98\
-\xe4\xf4\x07\xf8\x9f\xd5*M\xd2\xac\xc6\x83\xec\x1a\x15K\
-\xb6M\x87\xa7\xc3\x9c\x10\x96\xce1o\xe5pPj\xc3\
-\xe6;\x12@\x88\xaa\xca\xbc\xb2\x0f\xdf\xab^\x96ma\
-\x0d\xb2\x81N{\xfd<\x0c-M\x0c\xd5\xea\xa4\xd0\x86\
-/0\x81\xe1\x84\xa1\x19\xdc\xa2\x8f\xcb\xfcV\xd9\xc7\x94\
-B\x85g\x81Xj\x92\x5c\xec\xd5\x9c7\x83\xed\x0eX\
-\xfdR\x87hU\xe0t\x91\x17T\x1c\xd7I\x1aY/\
-\xc0c.mc\x1d\xd2\x0b\x87\xb8p\x14HsAF\
-\xd7A@\x02\xf1\xf5\xae\x94\xc1\xd3\xf6\xa6s!-\x13\
-\xaa\x222Z\x1et\x87\x8b\xe2Q\x9d\xbf\xea-\xa10\
-\xd5s@\xe0\x9d\x0blh6\xf3\xfc\xd0;R'8\
-\xa3k\xa7J1\x00[\xb5\x9a\x94l\xc5G:'_\
-\xb7)\x15d\xbeU\x0bN\xdf\xf4q\xcbjZ\xa0\x16\
-\x8f\x11g\x8c\xac6XI\xd9F\x9c\x9a\xac|+\xac\
-rA6\x81\xdb\xc1\xd03\xbe\xcf\xb9\x0dZ\xdfhX\
-\xf6h\x9a\x22\xa7\x9dfu\xd3N\xb6\xaa\x99\xb9\xee\xdb\
-\xc2&T\x1d_\xd8\x97\x97\x08p\x17\xd5U\x9d\xbb\x92\
-\xf3!5tWg\xbc\x8dm\xc8\xe1\xab\xe75\xca\x8f\
-w\xd9\xfb~\x02`\xf8\x0bO\xcc\xe6\x9a\xc7\x951\xdc\
-';\x10\xd1\xaex\x22\xc8\xf1gQ\xa68\xd3\xdf\xca\
-~\x94\xc9Q\xef\x96X\x91\xde\xa3\xc8\xea\xb6\x82K\xda\
-&4\x8d\x9b\x1e\xd5\xfc\xa00cu5s\x11\x96\xb2\
-\x89\xf4I;(\xb5c\x9d(\xf3K\x90\x1b,\xd7\xac\
-\x15tg\xeeJ\x84\xd7\xf30\xa8i\xeef)\xe5\xf8\
-.\x8bp\x92\xdd2}\xe5\xc1Iea\x93\xd0\xdd\x85\
-\xc8\xb0\xb6\x91A\x96\xe8\x09\xf4\xd6\xca\xc6\xd0\x85\xfc\x0c\
-\xf1\xba\x1a\x8fl\xe8\x02\xbe\x1bf'\xd9E\xect|\
-\xa7\x22y\x19u\xa5\xf1\x92\x9a\xfb&\x96\xe6\xf5z\xf9\
-6\x22P?\xd5]\xf17\xcdj.\xdbK\xa3\x0f\xea\
-\xbb\x16D\x8bP\x03R\x10\x8fg\xe4\x0bnHX\xa0\
-@x*b\x06\xde\xe0\x85jE\x89\x91\x1b\xbd\x9e\xe7\
-\x0c\x92\x5c4\xf6\xc3\x0c\x98\xa9A\x12L\xc8\xdc\x05\x5c\
-+\xdc\xa7\xb8\x84\xe3\xa9\x02\x03\xc3\x98\xad\xad\x95 (\
-gb\xdf\xe2M\xfb\x1a~\xce\xe8\xeb\xc6\x98F\xab\x97\
-%\x81B\xa8\xdc|\x8a\xa1\x90\xef\xbdw\xf12z7\
-\x17\x0a\xbb+a7&\x16\xd7H\xcb\x907r\x9cc\
-\xe5\xd9\xbcg1\xa3\x1f\xe4Qe\xf96\x9b'\x8c\x98\
-\xad\xa1\x88\x0f+NR\x16\x91\xd9\x80lV\xe6\xecm\
-,\x0e\x0d,0\xc1\xbaYyk! \x8fT0\xf5\
-+\x1c\x86\xe4\xc3\x1as\x05'oZ\xef\x85T\xec\x88\
-1\xd1\xfcQ\xe7\x12*\x04\xb4\x8c\x9a\x1f\xdeuZ.\
-\x9a\x89\xc5b\xc2\x96\x5c\xc5\x13uq9\xff\xad\xa6\xeb\
-\xbc2\x05#\xe7yaISx--ZF\x88o\
-\x0a\xd2\x91\x03\x8b\xd2\xedN\xddER\xa0h\xc9?\xf1\
-#F\xff\x0c=\x95p+\xdd7\x05\xf9\x03\xdb\xcc\xab\
-\xdc&\xd6\x00*\xa3\x81R.\xb3\xc1\x05h+\x8e\x91\
-\x02\x0b#\xb6\x899\x92]\xd4\xea*.\xb8Qk\xcc\
-;c\xea|\xb9ix!e\xaa7\x1c\x17m\xe5\xf9\
-w\xde\xf5|\xcbP\x09l\x1bM\xb2\x81s\xe5[\xdd\
-\x8d\xe6X1\xfa\x13\xed\x83*\xb2\xf3\x97G0Xi\
-\xf2\xca\x0b'b\x8f\xfb\xd6\xc7\x1f\x7f\x8cF\x94\xe7\xf1\
-k,a\xc2\x03\xe3\x17\x0c-\x86\x11&\x02`dr\
-\xfd!T&\xb3w\xe8\xb5\x12\xbc\xe0\xe1\xa9T\xdc\xab\
-w\xa1a5\x0f\x11\xf0@n\xe3\xcb\x14\xa1\x97mF\
-0\xbc\xee\xbd2Z\xb5\xec\xb7\x86\xf8.\xb1=+q\
-\xfa\x0en\xe2\x8e\xc7\xf3\xf9\x04\xd9g\xdc\x7f\xda\x1d\xa5\
-\x1d\x99\xd9\xc1\xf0E\xda\x97tQ\x90\xd1\x8a\x9bH\x10\
-g\xea\x8c\xd8(N{\x8f\xe3\xe15V\x81\x95\xab#\
-\xa1\xec7\xd9\xf8\xa8\x19\xdd\xf1\x09+\xb6@\xc8\xafz\
-h6=\xa0\x1a\xb7O\x8f\xf7\xb1\x8e\xad\xfdS\xfc\xb3\
-\xfdd\x07\xff\x9c\x5c\xa7\x97T5\x10\xa3\x05\x1d\x1f`\
-\x10\x1a\xfc\xfej\xc8\x97\xac6jh\xed\x84\xc9\xd6\x86\
-\xc91`r\xa214\xf4\xb6\xc8\xf4I\xd7ZA|\
-\xe8\x9b\xe3r\x92\xc1\x907\xfdm\xc9\x07\x947\xfd'\
-\xbd\xf1\x90\xb0C\xd2\xe3\x14;\x0aM~\x18\x0fGB\
-`.\x04\xa4O\x87\xa3\xf4e\xf2\xe4\xc9>\xa7\xa4\xdd\
-\xd3\xf8\xe2\x90,\x9f\xd8\xef\xe4&\x06Z\xb6\xa0t}\
-\x16P\x80\x0c\xd3e\x15\x87\xed\xcc;\xf3\x823j\x95\
-\x19\xb0]\x0e\xa6A\xa9K&\x99\x83vz\xcd\xc0k\
-z\xc2\x85\x86\xe1\xb6\xb7k\xf0\x7f\xda\x04L\x97\xd3\xe5\
-\x1aP\x0b9\x91\xdfM\x80\xa6\xc6\xca\xe0\x84\x81\xa0\xd1\
-k4\x91\x1az\x83aX\x12C\x12\xcd{i\xb7?\
-&V\x9d\xcc\x02X%\xd4\x07\x1bz\x19\x13\xfb\xfc\xf0\
-!\x07\x87\xa3\xbe_S\xc9O\xfbm\xb4\x97`T\xad\
-\x8dl\xaa\x84\xae\xae\xc9\x9b~\xe1\xfcsN\x8c\xad\x8d\
-\x13\xd3\x9c\x84\xe1-VYT\xe9\xd8\xcd\x0a\xf1\xcc\xb7\
-\xde\xed\x98\xcf[\xe3\xab\x1b\xd2J)Q\xbe*\x05\x10\
-t\xa5\xf6\xe6\x22\xed&\xd9\x0a\xcd\xddY\xfd\xfe\x11A\
-\xd8\xb1\xa51\xb0\x05/\xfa\xe2^[\xd1\xcf\xc0\xd8\x11\
-b\xfd\xac(\xe3\xd2g\xb0\x9bBP\x90bM\xbe=\
-\xcf\x89|\x08\xc9x#\xa9H\xea60\x0d\xe3\xea\x0c\
-`T\xcan\x9f:\x9b\xe4\xcb\xde\x90\xec\xcb_\x5c\x1e\
-\xae\xf0\xf5\x09\x18\xcf#\x8b-\x0a^\xf5\xb6\xd7{\x87\
-\x830\xachf\x83\x97\x83q\xde\xe5)|\xd2\xa2\xb0\
-\x1e\x09=c\x15(\xa8H^\xd1\xb4k\x10\xf9u\x8b\
-\x1a\x04\xf2v5\xb9\xc0N\x8d\xf9\xc0\xb7\xb9\xea\xc8q\
-G\xc1e\xb0c\x9e\xf3(z\xf0\xb4\xbbhd8\x1c\
-k\xf9\xb08\x8fE\x14\x13=\x8fB\xe8`\xde\xa5P\
-\xe5\x0bI\x9a/\x9f\xa1g\x1eO\x9eP.\x12\xa2\xd2\
- [\x8c\xee\xdaou:(\x7ftAY\x93\xcc\x94\
-\xc4@\xfa\xb8X\xd3Mz\xb9\x15#@|O\x7f\xa8\
-\xcb(\x07xN\xce)\x17\x9c\x8c\x0a\x85\xb4ke%\
-\x9f\xa6pS66\x9b\x9d\xab\xe7\xc1ik/\x80S\
-\x9f \xed\xc1\x1b\x5cg3\xf1K~\xae\xfa67\xbb\
-z\x03\x02\x1e{ \xc13\xde\x8d\x14{\xb8\xe4\xfcg\
-D\x0f\xeeq&\xc1\xf8P/\xbd\xdf\xa8T\xa7\xe7C\
-\xff}r\xa5\xfe\x06H\xf4\xd0\x16\x01\x9a*E\xd7.\
-$\x13\xf6\x06\xf2\xab\xf4\x5cM\xa1\xf1\x03]F~\xa8\
-F)\x1b[&\xd9j\xab>\xe6K\x87\x92I\x87$\
-\x1a5\x0d\x9c*\xaea`\xa1S\x8dSyv\xf0\x0d\
-\xdd\x9ce\x95\x0b\x94\xd8\xdbi\xf8\xd9Bf\xaf\x8d\xed\
-P\x95f\xaf\x1a*\x15\xe6\xcc\xc1\xd6\xac\x0ae\x07\xbd\
-\x1b\x04\xd5\xc5g\x96a\x11=\x8d\x8a\x85\xcf7E\xfa\
-y\xc4\x93\x86\xd4\xad\xce\xad\xacXAk4aG\xfc\
-\xc2\x0ay'\xbb\xeeo\xd4\xd0[\x8e*nw\x13\xeb\
-\xf0a\xd7Lv\x0cY\xb7[=:>\xdc\xde=9\
-\xd9\xdd\xd9\xac\x87kv\xabd>p_\xba\x19j\xcf\
-\x9d\x1a\xea=\xf5\xb5\xba\x22{\x0din\x91\xa3\x80\xf6\
-r\xc6\xbc\x9c\xa3\xb7\xcda\xe6D\x0dw$\xfb\x0e\xbd\
-\xe8\x9d?M1v\xb9:V;\x0a\xcb)\x9eS(\
-\xd4\x0e\x11R\xa5\xf0q\xd9/l}7\xca3\x99\x82\
-!\xbfO\x00Q\xef\xab)[\x89\xd9\x0eU\x15h\xa4\
-k\x12S\x03Q\x93\x1f$\xf0\xf0\xe9\x98\x9b\x9b\x0eh\
-\xc3\x18\xfc6\x1d>\xed\xbe\xe8\xf6^uWV\xf0S\
-)\x0b\x1c\xcb\xaa\xa1$$\xc7mUM\xb2\xc4\x09G\
-\xf6'A$A\xfe\xd5\xb5\x12\xd5\x84\xe5(\xd2\x99x\
-\x09\x18\xcfy\x0c\xf4\xb8;\xc4\xfd\x19\xf5+\xb0\x1e3\
-W\x1e\x89\x8a\x88K'@j\x8c\x19jvjxK\
-\x85\xa6\xd4\x1c\x92\xe5\xc9Y\x99\xa4\xed\xd0\x1bs\x9f\xbd\
-\xe0%\xbf3\x12z\xf5j\xadZ\xc3`\x0fB\x0e\x0a\
-\xbe\x1e,\xa6\xb4\xe75t\xf4w\xcb)\x1b\x89\xcc\xf4\
-Z\xf7V\x15\xf0\xaa\xb7.\xb8\x9e\x0f\xf5\xb3&\xe5\xfe\
-\xd8g\x9e\xc5Eb7uX\x88\xbc2\xc9g\xb7@\
-]\xb4\x1e\x00\xcd<\xcb\xca\xa9\x8e\xda\xa9v\xe8\xd9\xa9\
-\x91\x896\xab\xda\x9a\x0e\x8f-\xdf\x0c~\x1b\x17\xa9\x90\
-\xb4\x9c\x05T[\x01s\xd8h\xaa\xb7\x80\xb2c\x98~\
-X\x92_\x11-qH>\xf3\x8c\xe6*t\x80\xc2\xca\
-\x94\xd0\x0c\xce\xbc\xf2L\xbd\xf6\x19RP\xcd\xe6e<\
-\x83{^\xf7\xef\xd4\xbd`nw\xdc\xde3fin\
-\x84\xce\xc1*k\xf3\xcc\xeeHh}4\xac\xce\xd8\x8f\
-l\xaa\x1d\xc5\x99\xf7\x00\xe6qw\xc9&\x9b\x8d+\x17\
-@M\xe5d\x95\x1a\x95NWd\x9dJ% \xaa\xa7\
-\xceV\xedM\x9aU\x0ajZ\xd8\xd6\xddn{NK\
-g\x8b\xc7o\xe1\xe09Gd\xf1\x8bd\x8b\x01\x0d\xdb\
-\xe4\x8a\xc0\xc6\x89\xec\x0bo\x83\x95K\x16\x22=N\xfa\
-o\xdfZ]\xb8\x045\xcb\x86\xb7\xc3\xcce\x0b\x11\x1b\
-@\x83:f\x97\xdcw\x9d&\x9a\xed\xad!\x0f\x16\x88\
-\x02\xeb\x14IX\xa8\xc9o\x0f$\xd1D\xb4`\xb6\xb4\
-b\xe4\xf9\x8a\x0a\xeb\xe5\xa3\xc2\x84&\xa4\x0a\xa8\xf1a\
--x\x8e\xff\xb1E\x8a\x947,3\xcb\xcfK>\x08\
-9\xf3\xc8\xcc\xe4\xe5\x0el\xdd\x0b\xb5\x96\xf5\xaa\xd9\xa0\
-\x92g\x1b\xe4\x11NH\xd0\xfa\xe2L\x05\xeb\xbc\xdf\xcb\
-\xba\xff\x91L+\x9d\xd6\xde\xaaK\x7f\x98&s\xe1\xc9\
-\xc1A\x03\x07\x5c\x98\xca\xc0\xbcE\x95Wv:\x22>\
-3\xc8\x99\xb8\x8bkX\xa2=WY=D\x22\x81\xa0\
-Z\xe6bE\x910\x1f'\x07\xcd\xd7=\xe0\xf5\xddF\
-\x1dxF(y\x06~A\x1f\x14\x9e9\x9d\xc8W\xb5\
-\xb0\x17\xe5Xo\xd3\x8d\x1eZ\x8fo\xd3\x0fU_q\
-\xf3\xcbJ\x14s\xd3\x5c\xee\x5c,\x94y&\x8a\xd8\x98\
-\xe4D\xb4\x0ao\x98\x17\xb3v\xe0C\xd4<%\x9ca\
-\xc1F\xf1\xb92\x97t\x93\xa4-\xe6`<\xb8g=\
-\x8alVh|\xce `I\xf1\x5coA\x9e\x1e\xed\
-\xc0\x1f?\x5c\x00\xa6w*\x852\xfc\x8e\x8d~\xbb&\
-\x16\x89\xf8\x9fm\xc5\x87OO\x8f\x9e\x9e\xfal\xea\xb7\
-\xe4D\xe9:@\x08XU4\x8f%\x91w\x0d\x9d\x03\
-\xe2\xc9K[\x07\x05\xbc\x95\xc9\x85\x1aR\xba\x81\x9co\
-\x91\x99\x98Z\x22c\x1fiX\xef\xfedw\x98VV\
-n\x83\xd9U\x1bL\xbc\xaf\xec\xd0-\x97P`\xe4)\
-2x]\xe3i\x94\xb9\xbe\xb3\xabN\xfa\x08\x96\x9cY\
-\x87\xd5\xc7\x08\xc3\x9e\x10\xf4\xb3\xbc\xa6\xe2\xd1\x84\xdd\x97\
-0\xf0\xee\xc1\xce\xde\xc1#\xe9\xb1==\xcfDFT\
-tp\x7f\x17\x11^\xa8v\x128\x9e~\x12:\x88g\
-\xb9\xfa\xe9\xd8J\xbb\x8e\x14e.h\xb1\x9ar@C\
-\xcc\xa8\xaaa\xb6\x0c^>2'\xbf\x13B\xdf'\xe9\
-E\x87N\xc9r3\x04y2S\x1d\x95\x03\x86\x9c\x94\
-\x1c\xc3\x00\xd3\xab\x09\x85G\xeaio<\x14\xfc\xa8(\
-@\xd2\xca\x8a\xf7-<\xfaCS\x00|\xeaG|\x18\
-#\x9f\xd5\xaacZ\xfa\xab\xd0\xe1\xc9\xbdB\x85\xe9\x1a\
-\x11^\xd6\x87o\xeb\x01\xa2\x0a\x95c\xbfs\xd9<2\
-bt\xd9\xcc\xda\x8b\xb2\x00\xce\xb7\x1d\x22\xd4\xc9X\xf5\
-\xbe\x8d^\x88\x02\xa5:\xf2\xcc\x8a~\xe9\x80\xfb\xa6!\
-\xdc\xb5\x95\x15\xeeCy{\x14\x5c\xc5Mp\x82\x96~\
-\xdf[us\xb1I\x02\xa7iR\xd4(\x0d\xbd\xcc\xed\
-\x9bN\xb3\xd5.\xcb/\xe0d\xa7w\x99\xbe\xaa\x19\xef\
-\xf4V\xc8\xa2\x22\xac\xd47\xf9\xfb\xac\xde\x0c1\xbe\x02\
-\xf2\x88\x5c\x0a\xd0\x95dFA7\xab\xe2v#\xdb\xab\
-l\xf5\x16\xdf\xb8\x0d\xe0\x04i\x015\x81+\xc9Qh\
-\xfd\xfc\x84\xe2\x93b#1?\xc3\xc5\xfe\xcc\xb4\xd4r\
-\x0a\x80\xe1D\x8cX@\x9b\xb50\x96V1lV \
-\xf5\xf9\x9c\x1b\xeb\xcbI\x04\x99pQ\xdd\x1c\xf9\x92~\
-g\xdf\x15\xa1\x05D\x96\xb3E\xd2_\xc2(\x93\xbf\x0b\
-\xac\x02\x8e\x90\x90\xb5\x80.\x16S\xe0f\xca\xc5\xa5\x81\
-^\x07\x90U\xc1.r& M\x0a\x1aF~]\xc5\
-\xb3\x1fH\xaam\x81|\xae\xce\xf3\xff\xa5\xa1\x17\x91\xcf\
-v\xddr\xc2C\xb3\x8b\x98Bn\xb9we\xd7\x95\xdb\
-\xc9G\xbeZs\xeb\x15\xc8\xc5\x22\xcaE\xa1&\xa0`\
-X\x0fPKG\xfcR\xf4\x80\xf2:Eu\x95\xf1!\
-$\x12\xf1\x8c\xe5k^`+9\xddPo\xb4F\xf3\
-\xd6be\xece\xcf\x82\xc8]\xc4\xc92F\x01\xa4\x14\
-[i\x81\x84\xfaOD\x80UQIU(nf<\
-\xb6n\xa3\x02$.\xc1\xe8\xfb\x91v\xc7IC\x9c\xdf\
-\xac\x98\x1b\x00\xe5\xcf\x10\x1f\x82o\xd1\x05\x14\x85\x8ck\
-H\xd5S\x1f\x16\xc5\x9e\x17\xd3F\xf6\x91=\xbc-\x0e\
-E\xc9sB?9\x83e\x14\xc6@\xbd.(\xbc\xba\
-\xbaJ\x04\xeb\xf6^EE[\xdd\x06d\xac\x09\x93c\
-\xcb?\xb3\xf7\xab\xc6\xadB-\xb0\xf8JE~\x0eQ\
-|\x16\x8d\x22\x02\x94A\x9e\x1a\xb9\xed:m\x831\xd0\
-\x9e\xc4\x8d2\x0dv?m\x8fm\xdb<!\x8d\xe4G\
-l W\xed\x86xC\xe8\x9b\x87\x1d\x8a\x1al\x9bm\
-\x8b\x1d\x9a\xec[\xd3\xf6\x1b7\xf6\xa5\x84\xc0\xba^\x80\
-a\xfa\xae\xf1\x81\x9b\xf7\xde\xf3\x82z\xad\xd6D\xafT\
-\x9b,\x85\x96\x06\xe9\xa5\xc8\x99\xe7\xa0\xac\xca\xfd]g\
-\xa4\xe7\xb9\xce\x18\xde1B\xb2\x84\x89H\xc5q\x0d\xf5\
-g\xcf\xadsU\xf5~o\xe1T\xb7\x85A /\xfc\
-\x1e\xf4\x96\x18\x13\xca\xe2\xa5\x81\x9c\x0c$\xed%\x10\xa8\
-\xb0k\xb4q\xfb\x0dz\x9c^\xd5\x1b\xcdk\x06\x1f\x02\
-\x08m\x9eK\xae\x86E\x83I\x8d\x1e\xed\x91\xec\xbd\x1d\
-\x1d)\xb0\xac\x88+\xc7\xc3J\xbd\xb8\xbcfd\xc4`\
-\xe7C\x8b28$\x8e[M\x8d\xa0\xef\x97\xb67:\
-kZ\x99X\x1b\xe9\xa7\x0e\x90\x9f\x81Pk\xb9\x9ax\
-y\xac\x8e\x92\x1b\xcc\x192\x96\xcdz\x87\xc6\x06\x84\xcc\
-\x82\x1a\xdc$\xa3\xeb^\xdb\xb7W\xc2\xe7\x9f\x16\xb4\xa8\
-\xa1c\xeb9\xe4\x91\x8ffP|@\x85~C|4\
-u\xc6\x15\x01\xa7\xc1\xb2k\x05\x5c\xb3\xb2d\x89/\x96\
-\xcf\x02/Gc\x1c\xaci\xa1 \x962\xb3\x02Ib\
-]\x95\x00\xb6*\x9b\xf1I_y\xcd\xd1\xdf%&%\
-\xbb\x9c\xaa\x19Pyo\xc3\xa7\x17\x87\xa4\x1b\xec\x83J\
-\x1e\xd2\xb6\xdbJ\x87=\xfd\x18a\xa4\xc5V\xf59l\
-G\xcb\xaf{\x94\x1b\x7fTmN(\x13\x8d\xd2=X\
-v\xccS\x85*\x95\x04\xe5\xba\x9dVu7\x85j\x81\
-F\xa5\x95\x90y\xda\xcer\xd1\x1e\xf16\xb6\x0d^\xb3\
-\xfd\xc9r\x1d\xd4\x1a\x15=-\xcf\xa7\x99\x19V\xac\x01\
-\xe45Z{\xb6i\x9d+(V{K\xf5a\xcbU\
-\xdd\xf3J\x0a\x17:L\x17\x9e\x8a\x1e\xc0Z\xc3K\x14\
-\xf6\x89\x94\x83\xbd\x9d\xa6\x962?\xf7jA\xbe>\xbe\
-\x06\x92S\x16f\xef\xa6,\xc8\x8c\xfa\x06\xb4\x85\x12\xe1\
-a\xdf \x0c\xec\x8b\x80\x85\xfaB\x16\x07_p\xa9\xf9\
-s\x14\x05QG\xc4\xe57#\xd6\xd9\x8d\x80\x82\x08\xdb\
-o\xc6\x0a\xb2\xf5\xa2\xde\xbe_G\x91\xa5^\xccV\x04\
-R\xef\x15\xdd\xb2C\xcd\xf0v\x8aR\xb3\xf1\xb6\x8a\x98\
-z\x04TB\xf5\xdd\xe0c\x9d\x9a\x1a\x99\xf7\x0a\xcdx\
-k\xb7\x0a\xe7\xde\x9f\xd1\x8b\xa4!\x8e?\xb5~O\xd3\
-\x5c\x0f\xe4\xcbm\xe8\xdf>b\x8e*\x16j(\x94\xad\
-\x197+`H\xe9\x92=\x5c\xf3V\x01\xb6\xf1\xaf\x92\
-\xa3\x9a}\xba\xe0H\xff\xc0jY\xeeQ#\x9a\x19\xc8\
-\x10\xfb\x87\xdb[\xfb{\xbf\xb8\x1b\xd9q\x0c\xe9\xceX\
-<\xb8\xaa\xe3?\x1b\x8b.\x1d\xe7\x0b\xcc4\xe3(\xf4\
-\x15^2\xf5\x1ds\xfe\xe4\x87 \xad\xc7\x5c\xfdU\xbc\
-6\xd1\xc0\xa1\xaa\x0e{\xe3A\x0b_K\x9dN\xf1S\
-\xbd}\x8e\x82W\xa0W#\x84^\xcd\xd4!\xb7A\xe8\
-\x05c\x8d\xbf\x0c\x99\x1fP]\xb0\xb5L8\x07\x7f\x1d\
-P\xa4\x99\x85\x15\xed\xa7x\x99\x00\x1fZ\xb7**\xc4\
-\xa4'\x12!*@u\x9a\xf6\x87\x80j'\xb9\x18_\
-]\xe1\xe4\x18AB\xb84\x06\x99\xf6^=XJ\xbb\
-\xc3~\xd2\x1a-\xbd\xb7\x811\xe1F\xd7\xc9\x92\x84\xee\
-@\xc3\xd9\xb0G\xfd\xfd\xce\xb8\xdb\x8f\xd1j\xb2\xae\x86\
-\xe9\xf9\xf0;\x98\x9eU;\xa8\xc2\xefx\xc5f\xd8\xfc\
-jX%\xf8*z\xc4\xa8\xdb\xe5%\xda\xa6mJ\xa8\
-\x14!W\x0bP\xf9\x0a\xad x{\xef\xcc\xbf\xa8t\
-f\xf2\xbd\x07\xbas\xaa\xc9Z8u\xf7\xdaA\xf1\x94\
-\x0e\xdc\xbe\xe3\xea[5\xafw\xf6\xe3\xae\x17L\xb4\xc9\
-&\xcc\xd8t\xf8\x5c8\xf4\xe4K;\x82\xe1\xfd\x8c\xb4\
-\x1d\xce#\xc4\xaa\xb7\xc6\xd1,f\xc1\xd9\x99TD\xfa\
-\xa2\xee\x11\xfaE\x14:\xfeX.D\xe6\xe6\xcf\xbau\
- \xf0|\xe89\x81\x1a\x91\xa0\xbb\xcfv\x0fN\xa3\xb9\
-\xe7\x08\xf4'x\xfc\xf4\x81}\xdf\xae\xc1\xad\x06\x19\xcb\
-WX\xd0\xc3)\x22d\x14K,P\xd97x\xa9\x05\
-\x03\x22\xabL\xf5\xad!^$o\xac\xfc\xcf\xf9Kr\
-G\xf1\x05\x07\x0b\x81\xdaI\x07\x91\x8b.\x15\xf9fg\
-Tc\xd0\x97\x17\x09\xd0\x98Y\xee\xee\xc8\xe4n\xa3*\
-\x83\xaa$=h]bm\xc3\xbcy\xd66\xab\x98\x13\
-\x09\xc3>\xa2\xf0\xff\xa6\xf5==\xa3i\x13Q\xa0\x02\
-\x16_\xf0\x09\xcc:\xd0\xa4\x03C\xa3\x8b\x15\xbdH\xcf\
-k\x9e}\xb5C\xb6\xfe\xb2\xda@k&\xf23,\x0f\
-\xfc8\xc3\xa7\xdf]_\x8f\x05\x8ed\xec\x95\xa8\x92,\
-\xed*\x13\x1e@\x1d\x03N\xa7\x05{E\xed\xd5\x8a[\
-\x92\x5c\xeb\xf4\x09\xa2\x8e\xfa\xaaZ\xa2\x5ciI\xc3\x12\
-\x85\xd2\x9f\xc8\x83\x00y\x8f[G>\xc9\x099\xbd\x87\
-\xae<mq\x90\xb7{\x9dN\xe2:\x95fQ\xb8`\
-\x1bn\x07K\xe3\x07\x1b\x0ahl\xca\x0f6\xe7\xc4e\
- \x9aJq\xd2\xf8\xb3g\xa3e\xae\xc6\xfc\x16\x82\xf9\
-X\xe4p\xcc\x8fYd_u\xe4(Nn\xd8\xa2\x22\
-L\xc3\x07oN\xd9\xd3\xb8\xe2!\x8c\xe7\x9f\xd5\x9at\
-\xe7X9\xd6*\x1d];hS\x94k'\x1cR`\
-b\xaf\x9a\x10\xbf\xe8m3!G\x9e\xd0Een \
-\x92\xab\x9d\x93\xb7\xa9:Uk\x86Y\xbe\x0d\xf5[\xc6\
-\x9a\xd9s\xa7\xe1\xda\x9f\xd8>\xde\xe6\xa7\x11\x17\x0e\xef\
-|f2\xf7\x15\x1c\x7f\xbd\xdc\x89\xb7\x82\x8a;\x14<\
-k\x07$\x0a\xc0\xc3~\xa2\xf1\xfc\xd3\x14v\xd8Vz\
-\x03m\x126\x9c\xea\xfcs\xe2\x9e\x11F\xa8\xb4G\xb9\
-a\xc1N\xa7\xf6Y\xac\xb8\x96JR0\xe7<\xdfy\
-\xbfT\xe0g*V\xcd7\xe0\xfb\xfeM1`\x99,\
-\xc80\x1e\xc7\x0b\xc8\xf8\xcc;\x0e\xf5\x99<\xd7\x95~\
-S\xcf\xe4P\x11O\x17(n\xa2 \x16\xd1\x83\xe1\xc5\
-\x5c~\xe1ht\x8ecE\xa1\xd8\x11\x08}\xd4\x8f.\
-\xc0Y\xde3lM/O\xca(\xb90\x1e\xa8\xad|\
-\xb5\x1dz\xdd#\xd66\x03\x08\xdf++\xf0\x0f\xaa\xb9\
-\xa3\xb8\xdb\xc24\xb7\xf8,(j\x9duY\x12\xd6\xe4\
-\xa1\xb5\x7f+\xec\xb08!\xbb/3qI-\x1f\x0f\
-\x0ewvO\xccs%\x94\x9b\x9d;\x04\x83\x12\x8fr\
-\xd1QD\xf8\x9420\xa8\x1d.\x90\xd6\xd5\xd1\xe1(\
-\x18\x0eZ\xd6\xcc\xe4\x17\xc8!\x09\xfe+~\xa3Y\xd1\
-hY\xbf;>h\xa1\xf9t:-\x8bi\xcf\xf9\xb8\
-\x00f\x8bB\xfd\x98\x05\x84\xd7Kc6oS\xfeF\
-\x82&t.qr^\xa0\xaa0R|8\xa2KB\
-\xfaBr\xce\x97\xc2\xde\xe9\x169\xc7\x9b\xcb\xcc\x9b\xb5\
-p\xad>\x0bN\xf0\xd6\xea~:\x1c\x85\x1e\xcc\xf2\x1b\
-d\x1b\x8e\xef\x8f\x1b\xe5Q\x8fl\x0f&\xde/\xc0\xe9\
-:\xf0\xa3\x8ae*\xe6-\xa1\xe1\xea\xba\xfdFZ\x1e\
-\xfeV\xaf\xde\xba\xe8fE1xKC \xe6,9\
-\x12\xe3\xf0nH\xac(\x00\xac\xbd\x85\x05\xb0\xee\xce\x86\
-J\xceL=Z\xd7\xc7\x18\xc6vi\xbew<\xc6\xe8\
-\x0d9\xd5h2s\x1b*w-\x95\xfb,\x060 \
-\xbf\xbe\xb0\xcc\x7f}\xe1ek\xc1\xe8\xd1}\xe3\xf8\x06\
-\xaf\x8b\xe7\xae^\x9b\xb7\x97\x178\x88\x8b{&\x97\xf7\
-\xach\xc9[\xe3\xd1uo\xc0\xe9\xc6\x8cd\xa7V1\
- \x83\xa5^\xd2V\xabe\xb2\xa2\xd2B\xeaH\x96\x9a\
-_\xd5\xf1\x8f\x0bM%v\xdc\xeb|)?(\x8cp\
-bM\x17;\x8cn\xa6\xa8\x9d&7\xae\x95\xb8A[\
-\xc70\xca\x03(\xbe\x0e\xd6\xd5\x85E\x82\xcc\x8a;J\
-\xb4\x1e\x1cs\x9f6\xc0\x1c\xfd\xbcA~\x90d\xb7j\
-\x1cC\xe9\xde1\xc1==\xde\xafx\xdc\x12\x0e\xd7A\
-\xcfQ5\xe5\x01l\x07\x8b\x8c\xa8M\x9f\xc2\xb1U\xaa\
-\xb6\xec\xa2\x1c\xdf\x96,V\x0bp\xd5k\x9cw\xeb\x8d\
-\xc2\x0e0b\xf1\xea\xa6\xc84\x81J|\x00\xb4\x7f1\
-\xd4\xa9\x9a_O\x1f\xef\x9dh1\x83\x1f\x14\x8d\x8d\xc5\
-t\xc1\x08\x8b\x0f\x99&\x05\xed\xff)\x90\x8a\xaa\xae\x80\
-\xd3\xd1\x1dW\xf3\xb9\x9a2\x1c\xe2 \xb3\xe5g\x9fr\
-{\xf4s\x818\xcc\xa2b5+\x07\xa5\x1e\x0a\xebu\
-\xb1;\x9e\x1b\xed\x87\x13C\xe9\x04J\x13\x03P,m\
-B\xcaTMgZ\x16\xc6g\x11\x1de\x81N\xa6\x15\
-\x9e\xf9\x17jn\xe1\x07J>%\xeaQ\x19\xf7\x9a\xad\
-\xb5:,\xe1\xb3r\x1e0+z\x9d\xa8\x17=\xd04\
-r\xbe\xfez\x0d-\xdb\xc0\xe7kL\x8dJ\xa3\xfa\xbe\
-\xbfI\x0f@/\xdb\xe0\x8d\x84\xfd6\xda\x11\xbe7\xbd\
-n\x0e\x94t}\xf8b\xb8\x03\xe4\xd9\x17\x03,`m\
-C\xd0\xac\x5c\xe4xm[\x83\x16\x0a:\x8b\x150}\
-\xe6\x9b\xd7\xdf\x17^!\x9b/\x9d\x11\x87\x87|\xfd\x08\
-\x83\xd7967\xce\x0c<\x94z\xde\x22qh\xcf9\
-\x11y4\x80'\xbb\xa7\xa7{\x07\x8fN\xa2\x822\x0d\
-\x95\xa9%\xf5BA\x9d)\xc16'}\xabo\xde\x95\
-?4\x0c*\x80\xe7|\xfa\xe8^\xe3\xa4h\x1d^\xee\
-\xf6\x1f\xb9H\x0c{\xa0\x12d7\xee\xcf\xb5{_\x83\
-\x1e\x07\xd4e\xe5\xee\xa4y\x89\xb2\x16|\xe4\x13Oc\
-\xadi\x14\xdd\xac\xd5}\xba\x03\xde\xebW\xe4\xf1K:\
-\x9c\xa5cY\xf1eB\x9d6\xa2\x90 \xfe\x84\x9a\xd0\
-'\xdf\x864\xa8\xfb\x8d\x0b\xd8\xd2\xbd\x98\xe1\xe9\x05\xe6\
-\xa8\xcb\x98\x04;\xe3\xdd\x8d\xa6\xd36\x0e\xa51{\xf1\
-\x16I\xe7Z!n \xb3(\xb9\x18\x93\x0elU\x92\
-[\x5c\xc1rN\xff9\xf3.\x01`M\xcayM\xf7\
-\xb1$\xa5Ki\x8b*\xdb\x11\x9c2\xbc\xd6\x15\x0d\xbc\
-\x1d\xad\xa7\xa8\xee\xea\x96\x03p\x9b\x8a\xed\x12T\xf1\xac\
-`Z\xcc]$x\xbaQ@\x0d\x0a)\xf5N\xb3\x97\
-q\xd0\xec\xd5\x8b\x9a\xf8!\x94\xa9\xaf\x1c\xd3J\xafo\
-XT\xb0\xb8JA\xa9\xfa;\xa7w\xaa9\xd0;\xe7\
-\xae|.hN\x1e9MN;Y\x1f\xf8\xcb\x1aa\
-&\xae2\x08\xbd\xb0\x1e\xeb4\xf3\xd7\xc0Y\xd3\x0f&\
-\x9f\x9e\x9b\xc6%6?EU|r\xf28\xc0}\xd0\
-\x19\xe2l\xca\x05\x0c+%z\x11\xbc\x80jg\xfa\x0a\
-lc\xfe\xd3<\xfe\xc2\xa1\xc4\x00UE\xe3h\xda\x1a\
-\xe0\x0dpO\x8d\x1cr\xdf\x9c\xa1 t0\x0e\xbb&\
-\x0cYF\x13\xf9f\x9am\xf0\xdf\x96\x0b\xcd\x9c\x0a\xbc\
-\xc4-]\xd2\x17\xbb\x0e\x13\xc9&,X>\xd5\xb6\x8e\
-\x22-\x92\xd2F\x11\xc92=\xa7\xe3\x92\x05\xab\xd9\x1c\
-~4\x0eu\x0d\xd7\x84\x80\xbe,\xe2\x86ZdEx\
-\xce.W\xc2\xbe8\xdd\x15\x9eH\xb2D\xac\x9b\x0c\xbc\
-\x8d\xaf~\x1b\xf7\x0dl\xa7^\xd5VV\x9cOXy\
-L\x11\xf6\xd8s\x90\xa8\xa5\x22\xefe\xe3\xa0i\xfa\x81\
-\xf3\x9dC\x0a\xa4\xa5\xe0o\xee\xb6\xb0\x80\xa8n\xb08\
-|KK\x14G\x5c\xbfiu\xbfv\xd3\xd1D\x97\xf9\
-\x94\xa8\xdf{\xddQ\xef\x19\xae.f\xb6\xb7\x13|\x5c\
-\xf2\xe9\xf1\x1e>\xb5\xd0\xeb\xe2\x01aq\x05\xd6\x0b\xd2\
-\xf2\xc6c\xa9Y\x92VQ\x8a5\xcc\x80z\xe7\x16/\
-\xd2zcOi\xb4q\xc1\x93\xba1\x0a\x9b.;\xe5\
-\xf3\xaa.\x0d\xc1\x0c\xb5\xa2\xc3\xd6\x9a+eg-i\
-B\x86\x00\x0d_JJ\xae\x15\xfd\xa4\xa2r\xc8\x86\x08\
-\x1d\xdfF\x9fm\x85\x147^E\x08WV\xacX\xa0\
-\xb6^Z\x08M3\xcb\x075d6c.\xa0:\xac\
-\x80=\xd2\x03\xe5\x00fs\x8597\x14(+&\x85\
-Y\x82K}\xbf\xaeUm\x18\x15\x83{z\xfb2\x9a\
-\x0a\xc2\x01,\x1d~\x11#\x11\x16\xc8\x12{\xe1\xb3\xc2\
-\x19Z\xc6\x04\xf7\xc0\x163\x17\x04\xd2\xb5\xdf\xa2+\x8c\
-\x85m\xde\xd5\x82\x09XO\xee\xf9a\xc9\xb8\x94\xde\xb2\
-.\xde\xe1\x97\x9fN\xd3\xdbSx6\x8d/\xf4\xdc\xb1\
-\x853ncPL\x0f\xa4\xebt\xba(\xc6\xec\xddZ\
-\x8b8Uk\xfd`\x03*\x079\xd4\xebbL\xb1\xac\
-\x90\xe7-pdm\x87\xf3\x06\xb5J\xc9\xb0g\x82\x98\
-\xd1\xc9\xad\xc7\xd5xt\xce\x0d\xd3\xb4L^\xd1Y\xcb\
-\x09\xf9$f\x04\xe2\x03\xf6\x11\xc1\xd04'{\xec\xf6\
-\xed\xe1s0\xa8F;o\xc4X(\xc4F\xce\x1dh\
-\xb2W\x1d\x96\x93\x80\xf2\xb8\xd1X\x5cLM1\xf5\xe8\
-F\xbbM^\x05h\xd7M`\xa3\xbaY)\xc9\xe0j\
-\xbc\x80\xd1\x04\xcbu\xd7\xae\xd5\xed\xed\x1c>\xa1 \x9a\
-\xdd\x11\x95\xd3\x0f0\xe5\x11\x19H~\xf2\xd0F\xea\x87\
-\xf9\xd7@6\x8b\x1f\x08\xb1\xdb\xa3\x8b\xc9\xe8\x0aB\xfe\
-s\xab\xc8(\x05\xe1\x00\xd5\x84\xcf\xc5@\xdd\xb4Xe\
-\x16\xdeAE\x97\xf2\xa4\xdf\xa8\xdf\x8e\xe5,\xdb\xae9\
-\x8a\x90\xc6\x85a.\x8e\xf7\xed\x87\xe1\x06\x01/)\xca\
-\xb3\x18\x0f\xad\xb2/\x9b\x9e\xaf\x9f\xafO\xcf\xcf\xa6\xe7\
-\xeb>\x19\x0cy\xbfk&\x9b\xb7\x0ax\xe8\xe9Q\xc2\
-E\x18\xf95\xd0\xcc\xf9\x0e\x99\x07\x03Ui0|\xd3\
-m]\x0fz\xdd\xde\x98\x0f}(\xbb\xdc9\x80\xb2\xb5\
-\xc12:\xa3?M~\x8dU\xd9\x80\xac\x83\xd3\x05\x16\
-$\xeb\xe4\x980,\xb2\x9dF\xda\xda\x89\xed\xd7\x86N\
-\xea\x09\xb4Y\xde\x87\xd54\xb0\xfa\xb6y\x0bS*\xb5\
-@\x8f\xa4\x1fZE\xca\xe3\x05i\x8e,\x8ay3\x99\
-\xb9q\xc8\xa0\x97j\x18\x1el\x9d\xec\x1el=\xd9e\
-\x81\x87_\x91L\x09\xa9+8><<\xb5F\xd8#\
-G\x22\x04$\xce\xdb\xc2k\x01\xf4Em\xdf\xde\xda\xdf\
-\x7f\xb0\xb5\xfd9'\xe9P\x19\xce\xdd\x01\x1e\xc9\x93\xf1\
-\x05\xb9_U&\x90\xf9po\x7f7\xc4\xad\x09\x09\xe6\
-\x01w\x8c\x83\xe3\xaa\xf0\xca\xd9\x97\xa5(\x0e)\x05S\
-U\xa1\xbe@\xfc\x99\x8b\xe7r\xa8\x8f\x03\x15\xaa\xb3*\
-\xd0\xdd\xc6\xf8\xa4\xae\xa9[#\xc1\x97\x12%~kQ\
-\x15\xb4\xed\xe4\x86GYl\x01h\xb7\x97\xc09\x0d\xf1\
-mY\x8e\x9c\x10\xaf\xf2\xe01$\xc1\x7f%'\x83y\
-\xff\x16\x80\xa5C<\xa9\x94\x8f\xca\x1eZ\xee\x9c\x02\xe0\
-\x87]\xf9\x15\xa9\x94\x06\xd63\xea\xb1\xb9\x13d\xbb\x83\
-\x82\x8c\x95*\x13\xefg;\xa0\x93\x99\x95W\x5c\xb5\xa7\
-\x000\xfa\xb3)\xac\xf9\x0b\xfd\xba\xe4\xf0+W1Q\
-\x0af\x9b\xa4\xab\x18\xba<\xcc:\xe0.>$\xcb/\
-\x81\xe6\x22C\xa8\x18\x03\xec\xba\xc4\xeeJe\x8f%\x0b\
-W\xadzK\x971L\x90\xf6\xd2\xa8\xb7DOj&\
-\xe4l\xa9\xeb\xa8\xf8K|\xd1\xc2\xf3\xad@\xb6\xe6\x91\
-\x1eP<\xd8\xb5\xb8\xe8\x14\xcb:\x05%\x0f7'\xf0\
-\xaf\x842l\xdb\x81\xc4\xde>\xa6\xb0,%v\xed,\
-W\xb7e\xf9\xcf\xc6Ug\xd5@m\xf3arP\xb2\
-\x0c\x13N\xdb\xaa]\xba\x88\x8e\xe6\xf1h\x96\x9fjr\
-\xebPVyI\x83DPD\xacZ\xe1^+\xf6\xf1\
-F\x80\x87\x90j\x81\xc2\x12\x99\x98\xb8B7\x18:\x90\
-\x17\xfaL$0\x87F\xee)\xcaB\x0cJ\xcc\x96\x9e\
-\xe8\x14\xe9m\xe6\x80\x87\xce{D&\x05.\x99\xcc\x89\
-N\xc6lm=\xc4\xb4\x00\xfb\x5c\x8b\x06\x0c\x02m\x93\
--\x96\xc0G\xa6U\xff\xee@\x03u*\xcb\xb6:\xfe\
-}w:\x82r\xe855\x0f\xf7\xdf\xe8Y\xe4\x06\x08\
-\xcbP\x99\x08h\x02\xf2D\xea[\x97\x0e(\xc5\xc9\xce\
-\xe4Yqp\x22\x9d\xa0a\x0c\x81\xb4\x88\xd7B\xa7\x99\
-\x89\xbcd3\xbdG\xcbWP\xc2\xfa\x14a\x8f\x22\x06\
-R\xe0w\x1d-p\xa3\xfaQ\xf5>\xc6\xd7\x97\x02!\
-\xae\x90P\x8a,kz\xecv\xd2\x81\xca\xb0,T3\
-\xbfA+\xe3\x9e\x5cX\xc6\xdbq\xd6Rh\xbc\xa6C\
-\x0f\xc34\x06\xec\xe3\x8e{\xa5\xd3t\xd4\xc1\xb8\xef\x87\
-\x83\x14TB\x8c\xbe\xaf\x7f.\xc1V\xf8\x06F\xd6\x19\
-\x11tU.\x09\xbd\x13X\xd7\xc2\x8ag6\xeb :\
-\xf8\xa3u\xdd\x8aZ\x9fQ\xc6\xd0f\x05\xaa\x18E\xd3\
-\x85\x7f\x9a\xf3\x8f8\x8c\x16E\xb8\xac+h\xee\x10\xb0\
-e5'\xd0\x03y\x1e\x92\xa6\xe3fQsl\x00_\
-=\xe1%\xdf\xd1\x99\xfd\xd5\x94\xa7:tf\xd3\xc1\xce\
-\xf6z\x92\x826\x0fmq\xacL\xa3|\x81\xcee\xb4\
-\xc2\xf2\xa5\xa8\xa1\x9e\xbb\x8f\x16 \xd3/\xe7\xc6m\xb9\
-\x02\xa9zQ\xc8\xe1z\xe2\xb8v\xb4e\xab\xbco\xa1\
-l\xd8\xab'\xa9\xaa\xf6\x12\x89\x10K}\xd2O:o\
-p\xa3\x1a\xd0\xb8\xa2l0Wz)\x8c(\x8fP\xad\
-\x89\x17\xfc\xca:\xc4\x10sh\xe2;\x94E=5\xb0\
-\x22:9\xd7\x9e\x9d\x90>\x14\xa7\x88\xe6\x86\xf2\xe9\xb7\
-\x8d@\xd5\x9e\xcc\x0ct\xb7\x07\xbd\x86\xb5U<\x8d\xbc\
-JFN\xfc\x82\x05k>v[\xc5\x16\x801\xb0?\
-\xc9\xcb\xd4N8S\xc5\xf81\x11%;\xd4L\x9f'\
-@\x90d6\x8dR\x09|f\xcb\x12\x84\xb1\x13\xa0v\
-f~}\xef\xda\x15%9a\xd0/\x08ui\x09\x02\
-\xda\xf8\xde\x8a\x8d3\x1e`\x05\x0ci\xc9\xfalU\xdf\
-\x18c\x92\xee\x13\xe5\xa7OAL\xc82\xad\x91\x166\
-\xeb\x96\xfb\x9c\xca\xe61\x892Q:s\x04\x0f|\x0d\
-G\xb0t\xb48\x04]\xc8\x9d\x14c\x99\x97\xa6\x81\xc2\
-\x86\x08\xe7\x1dF3V9RR*\x01=^l\xa5\
-;\xb5\xb0\xdd\x9d`\xfcM\xb7~e\xd4G<~\xe8\
-\xe6\xf5\x95w\x8d\xff7.}\xe7\xaf\x11\xaa\x89\xda\x9f\
-o}\xdd?\xab\xe7\x17\x8d\x82'\x8cH\xa2\xa8I\xaa\
-'\xd1]fiO\x05\xf6\x9b7M\xd5\xab\xf0\xac\x0b\
-pw\xd2\xe1\x11\xdd\xea\xc2\x87\x9f\xbc\xf5j\x15\x1f\x8e\
-\x5cG8\xd8\xfb\xa67\xf1Ur\x1bx\x02D\x85\x22\
-\xc8\x90(#\x07\x16\xec\x9ao\xb17\x9e\x997\x5ch\
-\xabf^q\x91\xd7k\xe8\xde\x93\xe4Y\x82\x17}\x09\
-U\xe0\x07\xfc\x9d\xd7e8\x986\x9e\xbe\xc8\xab5O\
-\xf6A\xddo\xa3\xa6^\xf0\xba\xa9\x1bhT\x16\x02~\
-6\xaax%0b\x7f\x98\x11\xfb\xfc`dqh\x05\
-\xc6h\x87\xc4\xc0y(!\x06\xa5\xf8\xfc\xa8\xaewn\
-\xe8\x1d\xda\xa1\xab+hJv\xd1,\x8e\xfd\xaa\x02\x09\
-V\xe6\xc6\x8f\xfd\xc6\xfb\xc0\xb1*\xa8\x0fG\xa5=\xc8\
-N\xd2\x17I\xd2\x97]\xb6\x04\xcc3\xbf\xf9\x852\x11\
-K\xeeRx\xe6\x86 i\xaa\xb0\x87\x0c\x8bHe1\
-\xcf\xc6\x1bG(\xb9\x5co\xe2\x0a\xe1\xedz\xfe\xdcI\
-(\xd2\x8f_\xa6\xa5hB;:\xfe\x99\x13\xa2\xa8\xe9\
-\x84\xac\xa4\x16\xc1\xe6\xde\xa6i\x01\xbe\xb2cF\xbb\x91\
-h\xc1\x22KwN\xddWU\xdf&\x9c\xc2\xbc\xd1\x8c\
-\xf2<\x89\x8bHu\xbb\xd3\xebJW\xc2\xca\x5c\xf4\x11\
-\xdfl\xe6\xec\xb4\xbdi\xb7?\xd2\xc9\xeaF\x04\xae\x82\
-\x0eDv1x\x94@jE\x06\xa7\x9b\xbc\x02\x10<\
-\x9b\xcdj\x80\xf3\xf4?\x13D\xe1\x17Tx(4z\
-\xd2\x032\xec?\xac~\xeaVXa\x17\xa8\xf8,`\
-\xbe\xc8\x9e\x1e\xcd\x9b4:h\x17p\xf7\xe0\xcd\xa40\
-N\xa2\x1d\xf0 \x13\x84\x91\xac\xb8\xa6\xd7\xe6&\x22=\
-\xce\x8b\xfbV\x1a\x93\x02\xfd9e\x87\x03\xb6J\xd2\x90\
-\xf1\x8c*\xb0K\xea\xc7\x5c\xc5\xb3\x00\x9fS\xc5\xda\xf0\
-\xc0(u\xdf\x05%\xc7\x03\x83\x17k+\xf3`\xa88\
-o\xc4\xf2\x05\x08\xf5k\xd9\xaeKH\xcc\xb5\xf9\xa2\x18\
-\x91\xa5S`\xf4\xf6\xdcp\xc4]\x96o\xe1\xcaE\xeb\
-7\xacl5\x8e\x9a\x12N$\xdceX\x0ft,\x90\
-p#\xe0\x99\x10\xde\x0bX\xc4\x85\x1f\xcc\x02b\xcc2\
-\xb7\xac\xbd\x9d\xd5\xd5@]8^\x93\xc6\xaf\x89\xc2\xb2\
-\xb7\x03\xd2@\x96\xe0\xdcq\xe4\xc5sgq\xb7\xc2\xfa\
-[\x01\xfd\xd5\x14\x06h\xc7\xc2\xa7\x1f\xc6\x16%\xdd\xce\
-\x0b\x00x\x96W%,h\x8e\x1b\x93\xcd\xe7\xa01\xae\
-\xf0\xe5\xcb\xe5\x11\x8f\x0c_L\xcd\x0e\x8a\xb1\xe9\xd3\x0d\
-\x87!PX\x1e\xd2\xcb\xba\xda\xd8\xf2\xb4\xfcns\xd5\
-*-DYP\xc2}KL]i~\x8b\x9a\xb7:\
-\xa3w\xab\xdc}7\xc6\xda_\xc4\xec\xdf\x83\xad\xa0\x0f\
-;p\xa8\x09\xcf\x0a\xbbP\xbe&\x92q\x97#\x8d)\
-\x1b!\xd8\xb6D\xde*\xee\xad~X\xc5\xd9\xf4\xf1\xa0\
-\x01\x13O\xb4b\x88\x02\x06\x1ac\xc6\x1c\x9a\x95\xb6-\
-UQ_\xa5\x17m\xd1\xf0?\xa6+\xeeg\xcc\x05\x9a\
-bQ\xa4\x89%\xf5\xdd\xb4\x0a<\xa4\x00\x19\xba:G\
-\x1fu\xfc\x92\xf3+\x81\xbe\xa0\x1f\xd2\x9b\xec ]\x9c\
-e\xfcN|}\x17\xbb\xddlV\xd1\xcfK\xfaw8\
-\x99#[\x1c(2\x05Y\xfa\xb1v\xe7\xac\x0ef\xeb\
-\xf1\xe9\xd3\xa3\xc82\xf4\x06\xdb\x87\x07\x0f\xf7\x1eY[\
-\xcd\xe0\xf1\xee\xd6\x8eq\x08\xb8N\xe2\xf6t\xba\xc0g\
-\x09\x81\xe8\xf6d\x03\x0b\xa3n\xe5\xe0h\xe1U\xfc\x03\
-\xbaYWkr\xbb\xd4\x15\x00\xe3\x02\xa1~\x08zS\
-\xa7\xbf\xe0z@\x83\x22\xc6e\xc2\xfa`\x03\xc8Oj\
-\xd8\x8f1F\xc8\x9eu5rng\x0eN*\xb9\xb2\
-\x81\xae\xcbX61\xff(\x1e\x8d\x92A\xd7\x89d[\
-\xf9\xfet\xdd\x97Q8\xc7{5\x95\xf3\xf3M\xba,\
-@~]n;\xf1\xd9\xa3\xcf\xd0\x03um\xcd\x8a\xa3\
-E\xee\xff\xc3A\x8b\x1f`\xe2\x03x\xab:\x8eS)\
-cY\xcd\x85\xb86\x17\x07\x02nS\xf5\xdb\x1b\xda\xfb\
-\x8c\xbd.\x22\x9da<\xda\xf4\x0eze\xdd\xc7;\xc3\
-\xc1M\xa4\xae#\xb1\xe5\xf6\xf9\xa77tk\x98\xb8\xf1\
-\xf3g\x92\x8b\x17\x86\xc5E\xa0\x02\xbd\x8c\xf0\x9fu\xbf\
-\xf1\xf9\xb3M\xd5@\x81\x1bw\x93a+\xee'\x95\xcf\
-\x9f\xc1\x06\xddoFv\xc2F\xd3\x0f3\xf0\x1a}3\
-Z\xae\xcd\x98K\xf96\x83K$#\xb2\x80\xf2\xe7\xb0\
-\xfb\xff\xfe\xf9z\xf3\xfd\x8a\xd0\x9c\x03\x85\xea\xe3i\xe7\
-V\x84\x85\xd3\x82\x10\x0a\xb9\xad\x11\xc7:\xec\xf9\xd6#\
-\x0c\xb7\xd1\x8d_\xa6W1n\x97a\xe5\x18l]\xa1\
-P\x7fp|\xf8\xc5\xc9\xee\xf1\x09H\x88\xe1\x93\xb8\x85\
-\x12\xae\xe5\x91\x9b\x9e\x82\x85\x86\x8e0\x80\x8f\xf1\x16\xbe\
-\x07<1<\xda\x0e\xbd/\xd2\xee\xad`\xe9!\x5c\x0f\
-cw\xbfL\xbe\xcb\x96\x17\xe7\x1en\xab\x93\xf6/z\
-\xf1\xa0\xbd\x13\x8fb\x93\x03%w\xdbW\x18\xe6\xe4\xe4\
-Q2\x04I\x9e\xd0B\xe4\x16\xbd\x865(\xb1\x93\xd8\
-\x8fY$\x0bg\x93\xd6\x80\xceXC@\xf9\x10\xb4\xa9\
-\xcb\xde\xebpy\x99\xa8\xa2\x18\xe1Q\xd2z\xd1CK\
-\xcc\xca\x8a\x9b\xd1I_$K\x94\x8b\xd7\xd3\x86'\xf1\
-e<H\xc3\xe5\x8a\x0b\xb5T\xd9\x82E4\xf17\xbf\
-H.>OG\x88h:u!\x08Qzt\x0d*\
-\xee\x12\xe6:M\xe4v/g\xda\x0d\x0b3\xd6\xb9M\
-_aIg\x97\xe7t\xf6\x10t\xd88\xf4P\x95\x8d\
-K\xcbQnU\x96\x05(\xf4y\xaf\xfb\x83q\x82Q\
-\x91\xbc\x17\xea\xa7C\xf4\xcfwv={\xd8aT\xda\
-\xbd\x81ZX\xb6F\xfbI<\xb46\x84/\x8d_\xc1\
-\x85\xbc</\xa02\x7f\xbd\xaav\x1f\xad\xbc$\xc1$\
-\xd7\x9e^\xfa\x16\x84_\xe0Yz\xf1\x12f\xd4r\x84\
-\xff\xfa\xe6!\xd8a\xb2\x07\xfb\x15\xca\x03qT\xf3\xfc\
-\xcf\x22\x9dJ\xa0\xa2\x18\xc0\x1c\x0d\xf8\x95.\xcb\x84p\
-\xddK[x\x87\x9b\x9a\xcb\x8ek\x91$\x9e\xe1\x82#\
-\xcelZ\xb9\x10\x98M\xf9[\xb1`\xe4\xb5\xafY\xf0\
-\x9a' \xf3\x83\xb9\xeb\xfb\xa4\xf7U\xda\xe9\xc4\xe7\xeb\
-\x95\xf3\xf6\xeay\xd5_\x85?K\x99\xdb\xbf\xe4\xc1t\
-\xb6\x06\xff\xd6\xd6>\xa9~\x19.5W\xcf\xd7\x01\xee\
-\xec\xfbK\xcd\xf7\xd7\xe8\xdf\xf3*\xfb9\xd1?\xfe&\
-!I],\x8f`\xde\xf4zK\xd3\xa7\x17\xe3\xeeh\
-\xac+|\x1fa+\xe7\x95\xb3\xef\xfb\x80\xc6_\xf27\
-Y\xf6<\x019\xfc\xe408\xdd\xfd\xee\xf6\xfe\xd6\xc9\
-\x89^?T\xb0\xa7\x94]&\xa4\x9b\x91\xe5>a\xfd\
-\xb4\xc6\xd1\x93'\xca0:\x8bV?\xf0\xf52\xd4\xde\
-E\x02Y\xbf``\xd5\xef\xecnLZ\x00\xb3TA\
-\x9cI\x12\xed\xbe\xc8e@\x12\x8c\x10\xda\xe0\xd5G\xc9\
-6\x85\xc4\x00\xd2\xf5\x22\x80\x02n9\xda\xb6P\x98 \
-\x9e%\xdd\xb5\xfa\xa8\x8a\x98n\x90\xce\xf0\x0c~\xed\x1d\
-\x1e\x04O\xb6N\xb7\x1f;\x8bn\xf5\xfd\xca3\xa6\xc5\
-\xfat\xe9t\x90\xe2\x8b\xe7\xeb\xd5\xf7\x1bK\x83\x97\xa1\
-_\xa9l\x86\xe78H\xc4\x16\xf0\xc3\x9f\x02\xbc\xb7*\
-\xb5\xacz\xbe\xb7\x0a\x1d\x02\xc1\xea\xe9\xd6nzKh\
-jEC\xab]\xfc}.\x0e)\xb0\xd6\x9cW\xa6K\
-~\xa5\x80\xa90\xdf\x11a\xfez\xbe\x0d\xc0Rx\x0d\
-\xb0\xc2\xfc\x0c\xe4:\xf3@3\xe4\xff\xd7\x0f\xd4\xd1\xc0\
-6m\x8a\xb1\xef\xb7\x07\x9bb\xa2\x02,\xa5j\xb6\x84\
-\x9cp\x0f\xe3\x09\xd0\xaf\xfb\xcd\xc0.(\xcc\x22\xe56\
-4\xd8\x07\xfa\xd7\x87\xca\x81\x1c-\x12vQ\x9e\xd8\x95\
-\x89\x08l=\xc1\xd58\xd1\x04\x7fi\x04\x83;\x8c\xaa\
-f[\x00\xb1\x1e\xf8\xd9\xc7\xf7A-S`\xaf\x92\x8b\
-\x17\xe9(\xca\x96\x0a^~\x16\xdd\xbf\xf7\xf1f&=\
-\xf2>\x06\xda\x84\x94\xf9Q>\xf3#\x9d\xf9a>\xf3\
-C\x9d\xf9A>\xf3~\xb5.\x99\xf7\x8a2\xa5\xe4F\
-\x01\xda\x0ft\xe6\xfd|\xe6=F{\xbfV+\xca\xa3\
-\x82\x1f\x14\xe5mp\x9eC)\x9dY\x87L?\xc8\x10\
-\xd0,&\xb0\xe6\xc9\xb4P+\xa7ZRQh\xf9\xf8\
-\x8e80\x90.\x0f\xdaE\xef\x02\x0f\x00yI\x9b\x87\
-\x87\x01\xd7SSy\xb7gm\x83\xa3,\xcaY\xa0t\
-\x85<\xf3\xa0\xe2K\x8cn\xc9\x1b\xe9\xe1t\xca*\x88\
-\xb3\xfa\x0b\xa6u\xbc\x88\xe0\x916\x91\xd1\x9c\x06\xbd\xf6\
-\xb8%\xbb\xde\xc1K\xb7\xf0\xd9\xf9\xfaR\x13\xa4\x02K\
-\xed\xf3v\xf5\xfdM\xff\x0c\xc4us\x9dlr\x83\x97\
-~\x96\xc8\x83\x97@#\x8e_Ow\xaf\xd1\x10Z1\
-\xb5]\x8cao\xb3\x07{\x9e\x5c\x03N\xc6\x17\xbcd\
-\x1a\xe9\xf9\xb1\xdf\xc0\xf2\x9f\xc1\xb0\xd6\xea\xf5\xfa\xc6F\
-\xcd\xcb\x8f\xf8'8\xe26X\xbd\x10\xec\xe3\x0cX\xed\
-\x93\x8d\x8f\xbc\x92\x89`\x83}\x5c\xff\xd0+\x99\x126\
-\xd8\x87\x1bu\xaf\x84\xffm\xb0{\x85m\xfb\xc0\x05\xab\
-\xd5\xea\x85\xd8\xeeU?\xb4\xc0j\x9f\xd4>\xbcW+\
-\x04\xbbo\x83}\x5c\xfb\xb0\xfe\x91W2\x8b\x0c\xd8\x87\
-\xf5\xda\xc6\x07^\xd1\xac\xc1)\xe5\xcffo\xc1\xf6[\
-\xdd\xf6\xa0\x97\xb6\x81\xef\x993\x97]\xe6Zz\x98\xc0\
-\xde\xab\xc5\x1akA\xbe\xcc\x1a\xbcu\xcdjh~2\
-\xdcn:E\xcb\xcb\x05;\x10\xdd\x0c\x06:[\x82\x9d\
-\x10V\xc6\x9aky]\x8a0\x8e\xf2\x8a\x0e\xb1\xb4e\
-(/w\xcb\xd6\x90\x9a\x8e\xed\xa0\xbdK\xe1\xfc\x7f;\
-\x8c\x96\xe0\xda\xdb\xfd$\x82}D\xce\x98\xf0\xa4\xd7N\
-\xa6\xd3e\xd1\xce\xa1\x7f\x14?\xb5\xdb\xc2GS$\xf1\
-fxd\x92}\xf7\xee\xba>6|0\xbe\x8a\x96\x9d\
-\xea,\x9b\x88]\xd9\xa7\x9f8\xd7\x15\x0b\x83\x16Ee\
-%\x8b\xd3\xeb5h\xac\xbb\x1f\xad\x1e\xf4\xb0\x96\xa3N\
-\xfc\x06)\x88\xeb5\xaaC\xce\xb6\x90mJ\x0cR}\
-\x18\x93\xd5\x1b\xd6 C5P\x07\x0d\x04n\xb2\xad\xe3\
-\x06R\x01\xac\x81q`\xe5\x02$|\xf7\xb9\xac1\xf4\
-\x80\xfa0\xd2\xa7\x1c*j\x91\xdf0\xb0t@a>\
-\xbd\xc0\xca\x22\x9b6\xe6\xb7:\xf0'\xbc\xb7\xf1\xf0\xc3\
-\x0f\xb76jk\x1f}X\xff`\xad^\xdf\xf9`\xed\
-\xc1N\xbd\xbe\x06\xd2\xa4\xf6\xc1\x83\x9d{\x0f?\xf9\xf8\
-#\x8f\xacU8Sa\xdf\xc4\x11\x1f\x0dB+$\x98\
-\xb6\xe6\x0c\xf1^I\xc5\xbb\x01\xdd\xeaz4\xea\x87\xeb\
-\xeb\xaf^\xbd\xaa\xbe\xbaW\xed\x0d\xae\xd6\xeb\x9f|\xf2\
-1]\x11Z\x97W\x9e\x0d\xb1n\xfa\x07\x0a\x05\x90*\
-X.\xb80\x03\xc2~\xfe\x8d\x1a:\xd3\x18\xc1\x1c\xa3\
-a*\x01\xb2\x03\x97\xbd\x1a\xa4\xa3\xa4\xf2\x9dO7\xd3\
-\x9b~o0Z\xd2\xbd\x00\x12zK)\x9a\xee\x11\x8e\
-.UE\xde\xb7\xcc\x08y\x9f}\xc7n\xfa\x1e\x15O\
-\xda\x11\xde\xb9\xa3\xeb?\xe5\x84y\xfe\xfa\xcb\xbd\xdd/\
-/\xd3\xd7e\x14\xfad\xfdu'\xed\xbe\x00\x09j\xf3\
-\x0b\xfc\x9f\x93 1l\xd9\xa0[\xb1\xa3\x01\xcf\x9c;\
-\x0cG\x83D\x88V\xc9<\xa0,\xc73\xf8Z\xf5\xba\
-\xba\x180\x07\xa4\xd7\x1f\xe1\x0bs\xeb[\x03\xec\xf6m\
-\xa1\x9f\xa4\xc3\x16\x02\x9d\xbc\xb9\xb9\xe8u\x86[\xb7-\
-\xb7\x03\x0d\xbe\x88G\xb7\xae\xe7\x11\xde`\x8a;G(\
-\xfc\xc6|\xa1\xf4\x96%O`p0bv\xaf\xbd\x9f\
-\xa0\xf9\xefN];MZ\xd7\xdd\xb4\x15wn]\xdb\
-\xb8\xaf\x98\xaa\xc3\x94\xbc5I\x1e\x0d\x92\xe4\x05,\x90\
-\xdb\x90\x90\xb6n[\x8a;\x85\xf6\x1c\x19\x82\xb7o\xe9\
-\x83\xdb\x16}\x10\x0f\xd3\xd6>\x8cB\xf7.\xb4T,\
-\xd2m\xdf\x8d\xc5\xf0J\xc0N\x1a\xc322z\x12\x0f\
-^\xdc\x81e@C\x80\x8dT\xeb\xe4:\xee'\xb7\x1f\
-v\x00\xa0\x05\x1f\xe4\xfd\xdbN\x83\x07w\x19\x84\xb7\xaa\
-P\x11e\xf4\xb07\xb8\xe3\xc0\xd3\xc0\xd5\xcd\xf0g\xcb\
-\x95GN\xbe\xc5\x95\xd0[\xdcq-\x06\x19\xf5x\xc9\
-\x98\x03\xf28\xe9\xf4\xa1\xcf\x9d\xdeUQW\xe9\x5cl\
-\xfd4\xf9\xae\xf5J|9L\x89@\x94\xf0\x14@\xdd\
-\x9b^\x17\xf5\x8e9\xc8\xf2\xb0\xb7F\x1a\x8fG=\x94\
-\xda\xebq\xb7\xdb\xe3\xe5g\xed\xf5M\xe7\x8e\x85o\xf8\
-\xe9\xc9\xbb\x96J\xba\xadNo\x98\xdc\xb5\xd8U\xe7M\
-\xff\xfa\xae\x85n\xc6\x9dQ\xaa\x8el\xeeX\xf6\xce\x05\
-\x88\xbd\xefZ\x08\x1b\x88A\xe9\xe7\xb1f\xf2z\xa3`\
-h-\x08\xe4\xa8\xad''\xad\xf6b\x18:\x88^\x08\
-5,\x9e\xd2\x19@R\xb1\xe7\x83\x14\xb3H\x16\x08\xa8\
-\x01\xd5-j\xfd\xc5Eo\x11\x11\x10\x0b\xb7}\x01`\
-\x0b7\x0b\x0b\x81`\x8c\x06\x0b`J\xb89\x0b\xf5z\
-\xd4\xbfL\xd2E\x15\xe2\xe0\xb0}}\x11`\xd2N\xe3\
-W\xe9\x8bt\x0d\x98\xe3ek\x114 Mn\x16\x00\
-\xc1\xfe\xa3\x05\x0c\x1aw\x17\x0d\xc3\x18\x14\x12\x0c\xb7>\
-\x1f\x0av\xa1\x17\xb7\x9b\x0b\xe47Ke\xf0\x17\xec\xff\
-\xe3\xb7-\xb7\x06m\x18\xdc\xb94\xb0\xfb\xdaqr5\
-\xee\xc4\x83\xbb\x16\xdd\x8e;\xe9\xd5 \xee_\xa7\xad\xb5\
-\x07\x05\x0c\xbc\xa8\xfc\xc3A\xfcb4\x1e\xbcS\xd9\xb7\
-l:\x02R\xbd{\xa0\x7f\x15\xab{\xf3\x8a\x9f\xc4\xdd\
-\xe1I2H/\xdf\xaa\xed\xa6\xf4\xbb\xd6\xfe\x96\xbdg\
-\xa3\xc0\xdb\x96F\x7fh\xda\xda9\xd4\xf7\x0bB\xb8V\
-&\xde\xcbz\xb5\xb6\x86\x11\x1e`\x99\x85\xf5\xc1\x0b\x97\
-\xebv\x08X\xe3\x8a\x05:R\xc1\xb3^\x95\x89\xf1\xc0\
-\xc6v\xe1\xa52\xf1\x9a\xa3\xfbe\xe5\xeer\x05U\xd8\
-\xdesT\xda\xf1\x9c+(`\xe7\xab2\xa2\xc7\x95\x94\
-\xc8T\xa1\xb4>\xaf\xb4\xcf\xfa\xd6l\xc6\xd1\x9d\xecJ\
-\xf5\x82+\xe1\xb0\x0bG9\xe9\xd9Yx-\x82\xe2\x10\
-\xf3\xfd\x03\xf4\x0e\xb0\xf3B\x93\x5c\xd2\x08Z\x16\x0b\xbd\
-\xf1\x02]\x16\xe3P(\x07f\xfd]\xbd\xc1\x07*&\
-&Q\x1e\x84\x98N=\xf9\x85v\x82\x822\xfaf\x85\
-U(\xf2.0\xe6\xa6\x97\xa9\x93,\x17\x12{N!\
-\xf5u\xec\xbd\x02\xdc\x99\xeb{E\xd8\xf2\xe7\xc7\x1e\x96\
-\xf4\xa2\xa8\x08\x1c\x0f\x8a'Eh\xf2\xe1\x08\xd1\xedj\
-\xb2w\xf0x\xf7x\xef4\xf4\xbeL\xbb\xd70QG\
-_z\xc1\xd6\xd3\xd3CH\xc0\xc5\x1e\xbeN\xf6~q\
-7\x04\xb8\x87{\x07{\xa7\xdf\x0b\xbd\x14\xa6\x0b\x8c\xff\
-\x1b\xc8y\xb2\xb5\xbf\x1fz\xc3\x9b\xb8\x03\xdcvpx\
-\x0c\xdf\xa1\xd7E\x03\x1f|?\xd8{\x14z\x17\xe9\x15\
-L\x82\xed\xc3\xfd\xc3\xe3prz\xbcupr\xb4u\
-\xbc{p\x8a\x01\xaaA4p$$\x80x\xb6u\xbc\
-\xb7\x05\xc9\x93\x1c\x96\xc3\xfd\x1d@\x03\xa2\xcb\x0b\xf6N\
-\xb7\xf6\xf7\xb6\xa1\x05$\x8a8O\xa5!\xc4\x9a\xca\xd8\
-9|\xfa`\x7f\xf7\xe4\xf4\xf8\xe9\xf6\xe7\xa1\xd7\xee\x8d\
-\x81\xaf\xd7\xe8\xda\x05\x8c\xd8\xc3\xe3\xad\xcfO\x9f\x1e\x87\
-\xde%\xcbe\xc6\xa3S\x09\x91\xce:\xd9>\xde;\x82\
-\xd6\x8aW\x12\x81\xaa4\x82T\x19'\xd0\xb5\x13\xa0\xe4\
-C\x80\x85\x8e\xad\x0dQ\xe8\x09\xbc\xc9\xe2\x22V\xbe\xce\
-S\xfd0\x99\xba7\x1a\xc6\xee\xaf\x05\xe7t\xfd\xc9\xe1\
-\xc1!\xd0x{\x17\xa4N\xaf\xdb#\x83\x13P\x0e\x86\
-n\x0f\xc9\x8a#\x97\x22]O\xb7\xf6\xf6w\x81\xb2#\
-\xba\x88\xe5\x05\xfb\x87\x87G\xf8\xdd\xe9\xf5\xfa\xf8\x0d\xc4\
-\xdb=\xdd~\x8cI@\xb8d\x04z\x09\xa4\xe2\xf3@\
-\x8f\x8e\xb7\x8e\x1ec\x13P\xa3Yk\x99\x85\xd5\x0b\xb0\
-\xb3\xa7\xdf\xc3\xf8\x12\x94\x87*\x1e\x86\x18\x84\xf1}\x08\
-\xc3\x1aN\x8e\x8ew\x1f\xee}7\xc4\x87\x18\xc9\xec\x85\
-L\xf5]\xe6(\xf8::<9\xe5\xec\xdep\x84)\
-\xb3`\x7f\xef`\xf7\xc1\xf1\xee\xd6\xe7\xe1\x84\x99\x12y\
-\x12Xm\xf7\x0b\xcc\x09\xd1I\xbaC\xcfH\x1d\x1c2\
-\x18\xf0\x0d1\xb7\x17<:<\xdc\x91\xb4\xab^\xaf-\
-\xa9\x0f\xb6T\xe2E,iV-\xdc\xf8\xc9\x83]h\
-.`\xbf\xa0\x07j`><<\xdd\x05\xce\x88\xf1y\
-\x17`\xae\xa7G0\x02\xe8\x86\xec\xb5\xc78\xa9\xe2Q\
-\x22]\x01D\x16\x1e\xee\x17\xb6\x8f*R\xa4\xd8;\xd8\
-\x81\x09\x80\x84<\x08'\xfb\xbb\x0f\x81\x93:\xc9%\xb0\
-\xd06$c=\xad\xa4K\x15\x1d\xef=z\x0c\x99\x83\
-\xf4\xeaz\xa4&%\xf7\x1f\x9d:S\x9c\x10\x16*\xa8\
-\xadM&\x9a\xf4\xaa\xabk9y\xbc\x07\xf8'\xf6\x87\
-\xc0\xd1\x0d4\xe9\xfb)\x0c\xe7\xe7\x07\xbb''!\xde\
-\x1f\x07T ?0\xa0\xd4\xee\xce\xde\xd3'\xc0G\xa0\
-\xc2\x8eo\xbc\x80\xc0(\xb3\x85T;8<\xdd:\xdd\
-;\xc4N\x1c\x1e<\xda\xd9{\x86\xcc\xd3\xbdj\xa7/\
-\xa1\xb1\xdb\xa7OqF\x03\xc7\xc5h\x86\x1b\x10\xcf\x1d\
-o\xed\x00\xe1 m\x10\xb7\xd1T\x86\xd3\xe3\xbb8)\
-`\xf0\x8f\x0f\x9fB#w(a\xd0\x1bC\x1b\xdb\x94\
-\xbe\xbdw\xbc\x8d\xb4l\xa5\x83\x16>\xd4e\x13\xcc%\
-\xd0\xe9\xe1\x114\xae\xd7G\xac\xa7\xa7\x87O\x10\xf1h\
-\xd4\x83\x86?=\xda\xd9\xdbztx\xb0\xb5\x0f\x5c\xbd\
-\xf79`\x1b\xf7A+\xbf\xeau\xe3\x0e>\x87\xf1\x22\
-A\x91\xf1\xc5A\x16\x0a\xfd\x94\xb3p\x06\xd7\xd6\xf1\xf1\
-\xe1\x176\xaa\x18\x8dU^\xf0l\xf7\xf8\x14\xbb\xa9\xb0\
-\xc0\xba?\xc2\xde*\x0c\x8f\x0f\x8f\xf7~\xf1\x10\x87M\
-A\x5c\xf7\x06\xe9W\xf8\x14\x88\x869z\xbcur\x08\
-\xd2\xf2\x11v\xbd\x7f\x1d\x0f{ -\xaf\xb0\xffO\xb6\
-v\x8e\x9f~\xf1\x00F%n\x0f\xc6\xaf.` \x84\
-\x95\xca\xfb\x9fe,t\xc1\xe3\xf9s\x11\x0f\x13\x9e@\
-[\xdf\xdd;\x81\xc1z\x9d\x0e\xe7\xd0\x98\xd9\xe5\x04\xa5\
-4\xcd>|H)89\xdcG~\x1c\xf6:\xc8\x92\
-;['$4\xda\xf1\x10%\xc6\x0c\x96\x8f\x9d]\x97\
-\xcf\xdda\xc3\x9cC\xa0\xd9\xfe\xd6\x11\x03\xe0\x85\xa3N\
-\xdc\x178\x9dE\xe0*o\x16|\xb1\xb7s\xfa\xd8\x95\
-\x0a\x0fq\x19\xbbL\xb1\x99\xc0\x7f\xc0\x99\xa7\xdf;\xda\
-E\xba<\x222\x8ezWDAt\xa4\x7fz\xc2\xfd\
-\xc7\xcb6\xe3!S\xe0\xf4\xf0p\xfft\x8fh\xd8\x83\
-\xad~\x1f\xa7\x17\xde1\xe0\xdb\x11\xd8\xf7\xdd\x83GX\
-'\xb4\xe8{\xf8\x1f\xce\x95'[\xa7\x8fE\xdcB\xd3\
-\xde\xe0\x7f8yPI\x11\xd1[\x02\x99\x81\xca@d\
-ry&Z\xf9<%\xdd\xf2\xdb\x9f\xbb\x08Z/\xf2\
-\xadp`\xa4\x199\xb82\xd8\x22\xf8\x83\xddG \x04\
-\x9e\xed\x96\xd0\xa4\x9b\x5c\xc5x\x02SB\x1b\xbb\xf4\x9c\
-\x92%\xa5JJ\x94@\xe7h\xa8\xe0s\xb4\xb4\xf0;\
-4\xb0*(\xa5AY\x99[\xd2\xae\xb4lA\xf9Y\
-\x80s\xe3\xe1>\x08\xa1\x89ZxBO/7\xa4\xbb\
-\x1c\x92~F\xd1 \xbd\x00\xe6<LE\x0f&<^\
-\x02\x05\xe5\xe8\x80W1\xd0\x8b\xba\xbc\x88\x9d\x80\xd8\xc2\
-Y\x81\x91\xba\x01\xffS\xd0\x1a\xc2\xc9.H\x92\x04\xa4\
-\xc8.H\xe6\x04\x97i\x5c\xa1i\xf1\xc6\xa9\x01\xd2\x05\
-\xf2[\x90\xff\x04\x97\x0a\xf8\x8b\xaa\x11jD\xe8k\xdb\
-o\x01\x1a\xe5\x90\x17N\x0e\x8f\xf1\x86\x0f\xc8\xa9:h\
-\x87\x07\xe1Fp\xbc\xbb\x8f\x97y\x8ev\x0f\xc2\x0f\x82\
-\xed\xfd\xc3\x93\xdd\xf0~p\x04\x0d;\x0d?\x84\x0a\x0e\
-@j}\x14<\x13\xf9\xf5q@b\x07\x1f:Q(\
-\xd1i\xff\x04=\xfe\x8fw\xd0\xd9\xff\x08\xfe\x01\xc4\xf0\
-/ \xa6\x84]\xfc \xc4\xf8z*\x22\x86\xbf\x84\x18\
-\xfe\x0ab\xbc\xd4\xf0\x22\xedo\x81\xaa\x9c^\x8cG\xc9\
-0\x9c\x80\xf6\xb2M\xd7\x82\x96k\xc1x\x98<NP\
-\xf8\xe0\x07d\xf4\x07\xe8\xa6\x8a\x8by\x88\xae\x98x\xf9\
-\xdf.*j?\x03\xd4\xe5^H\x07\x06\xb1\x03_\xa0\
-[u\xe1\x0f\x19\xa2\xe0/\x9e\x85\xc3\x1f6\xbd\xe1\xae\
-\x88\xd2\xba\xa3\xcb\xf8&\xed\xbc\xc1\xfah+\x9b~\x95\
-\xa8\xdf\xaftK(GZ\x11\x90\xfd\x0b\x7f\xe0\xe5\xce\
-+Z?\xe5\xfdD\xcc\xa4\x9e\xd4\x83k\xd0\xba\xf0\xbb\
-\xa4\xed\xb4M\x00Z\xda\x1d\xf0\x94?>u\x00\xbe\xb0\
-\x03\x18\xd3\x18;\x80\xaf\x84\xe2\xad\x8a\xc03\x1d\xa04\
-\xd5\x01\xf9\xc0\xf6\xcbOn\xbeJ\x97\x1a\xa8\xf1\xf0\xd7\
-\xb4\x1d>p-\xf1\xa8\xe5x:\x0a-\xc7\xa6P\x81\
-f\xd0\xede\x89\xfe\xb3\x22\x1a\xfc\xc8R-x}\xd3\
-\xe9\x0e\x89|\x99\xb7a\xd5\xfb\x9e:\x8c\x19\xda\x09\xf8\
-A%>\x9b\xd5\xefe\xc2\xd6;*\x8c\x9c/7\xd8\
-\xe5U2\x9f\xda[\x0e\xf9\x90zl\xee\x05C\xc5\x18\
-n\x18j\xc5\x8d\xf2\x17\xe9\xe8\x1ao\x96\xe3#\xadP\
-\xe1t\x8aE|\x01\x90w\x9e\xb0O\xf8MM\xe2,\
-\xb4\x0bD\xf0\x1fW.i\xfc\x82\xa2\xa93\xa2\x01\x5c\
-\x13\x92/y\xab\x84\xdb\x0f\x00\x16\xef\xb6i\x92<y\
-\xb2\xefO0\xf6\xfa\x0dj\x1a\xe5q\xe9\x88\xf7I\x1b\
-\xc1\x17@O{/`\x9a,\xd7\x91\x92\xf1\xb83\x82\
-\x01F\xb1g\x0d\x13\xa2\x94\x9d+\xb95\xf0P\xda\xa9\
-\xed\xd4\xf9\x9e\x01\xd3\xec\xf1\x06\x17\xef\x0c\xe9\x0f\xcdD\
-\xce\x9c\xa7\xabb|E\xb9\x8d\xe0Z\xa8n\xf3\x83m\
-\xc9\x00[\x97\xb5\x82p0\x8fx\x14cx\x85e\xb9\
-M{\x99\x0c\x8e{\xaf\xa6\xd3b\xfb\x88c\x16!\xe0\
-\x01F\xa0\xe1\x18e\xe4iQ!\xea\x81bY\xf1y\
-D'\x0a\x0cy\xb1\xdb\x1b\x1d\xd1\x16\x1a\x1b\xed\x8b\x05\
-\x84\x0b\x16\xdbH@qJ\xed\xabow\x8d\x9f\xa7/\
-\x86\xea\x10x\xd6m5\xd0\xbb\xa8\xea\xa2\xc7\x87\x14%\
-\xc4*C\xc6c\x89\x1d\xa9\x13\x90\x08\xb9\xc6\xab\x1c\xfb\
-\xda\xa5~\x80\xc1XN\xb2\xb4\xd5\xf6\x12\xbe\x13\x9c\x8c\
-\xf0\x96F%[\xb7A\x8av\x13\xf4\xab'8\xd3\x81\
-4HG\xc9\x8d?a\x173\xfc\x0dD\xc0?\xf6k\
-k\x9a\xc1\xa7S\xca\x93\x9b\xd4\xcc\xc7\xfa\xc9\xc1\xed\xeb\
-x0\xdcD\xd8\x16\xfe\x22H\x9fx\xf4\x06\xbd\xcf\xf8\
-\xdb\xa7\xfa$B4_\xe1\xa6\x84a2\x12\x8eU\xe4\
-\xa4\x0f\xba\xcb\x98X\xa1\x17%]\xb1\x02\xd1.mR\
-\xc3g\x81\xb0JA\x9c\x7f\xab>\xa9\xbb\xc1\x7fVV\
-\xf8oUsZ\xc3\x17`\xc9\x10ps\x8f\x01\xbe\xe8\
-V\xae\xf5\xbe\x1cF\x1d\xc5\xe7\xdeh6\xc3/\xd8t\
-\x5cr|\x1a\xeb7\x93\x98\x18\x8cb\xf6\xfb\x16gq\
-JC1\x13\x9b\xf7L\x01J\xc8\x97\xb2\x92g\xd9^\
-rg\xf8z\xb8\xea*#\xe4\xaf3/n?\x1f\x0f\
-G\xe4\xe9\xf4%\x87\x17\xb5ok\x94\x81H\xf0(L\
-:\x92P\xea \xc7u\xe7\xcd\xad6\xbcal\x0fY\
-@FOHm\xe0\x7f\xe2\xe8\x1dw\xc6\x09\xa6\x99\xfe\
-\xb3\x97.e\xd0\xab\x7fB\x8b\x8a\x06\xb5i\x81w\x8d\
-\xe5\x8d\xde6?\xf6\xc0e\x8ctS\x0f&8h-\
-dN\xe1\xb3\xa2\xb2M\xf5>\xa3\xd5\xa6\xbcx]Y\
-Y.\xce\x90\x96r\x88x\x95\x1b9\xb0\x1c\xd4\x81\xc2\
-\xe34\x98g$c:5\xbf\xdd\xd1\xa7\xb6\xcc\x14E\
-\x91\x0c\x84RH=c,jH\xb4\x8cR\xcb\x8d\xbc\
-\x19\x11E89q\x87\xe92\x15l6w\x18\xd2\xc4\
-\x9e/(\xbf\xcc\xe5e\x01r\xd8\xd5\x05t\xb0\xbbY\
-\xe4(\x8d\xcf\xa4\x09\x08\x9b\xa0\x1d\x10'\xdal\x00B\
-\xfb\x19\xf6\xdd\x9d|&\xce\xb0i\x03\xccP\x9e\x98\xf4\
-\xee\x02\x8c*\x95+|D\x8a\xa89\xc4\x88\xbd\x0bd\
--\x03\x9e\xd9B\xb5ijsdm\xc3\x1e)X9\
-\xec\xa9d\xeb\xcc\x96$\xa6\x11s\xef\xf7#ZWC\
-e \x17\x9f\xa3\x92\xdf\x02\xa1\xab\x01\x17at\xb7\x01\
-\xb7@\xe9\x1408\xd1\xd9\xf3\xc9\xfe\x90\x1d\xcf\xf2W\
-\xe2\x97a\xab\xe3\x88\x92\xc27Z\x10\x80\x97\x0a\x11p\
-\x94\xe2\xca\xf1\x02\xf9]\xe1\x82\xfc\xe5+pwU\x95\
-\xc2\xd6\x8ai\x9fCX\xb9\xfc\xf8\x11aT\xbc\x9a6\
-\x1c\xce4+X\xe6\xc5S@\x04\x7f\xd5\xd1\x8bLQ\
-%\x91\x9cEmb\x7f\x91\xa8,8=)j\xab\xbd\
-\x16Z\x0a\x08\xddk\xd5\xcd*\xcd\xa0f\xce\xa8\x07\xa7\
-\xc9w3\xe1\x22\xf0U#w\xbca*\xe1\x03J\xa4\
-Krv\xc0q8T\x17\x95\xa2\xc9\xcb6B\xd0\xfc\
-\xd3\x85\xb2\xc8\xf1_\x15\xac\xac\xaf\x80\x22\xfc\xa5y\x8b\
-\x92\xd4\x0b|\x98\xb3\x8f\xb3\xc1\x82\xb1\xe7\x08\xc6\xd4\x19\
-SL\x9c|wZ\xbdA\x82.\xa5\x83$_#\xa6\
-\x9aOu\xa8\x95I\xcd\xb4@\xe7\xd2g\xae\x0c\xa7:\
-T\xe1\x22\x99\x8ea\x5c\xd6\xe4\xf5I~\x9e\xd0\xb2\x0e\
-\x88\x22K\xb2\xe9\xc6l\xba\x9f\xa4k)\xcbA\x15m\
-\x09\x884r&\xa9\xd47\x9d:\xb0\x87\xc7;\xa4'\
-`E,\xd5\x1d4\xa0\xe2\x01\x9e\x82\x0c\x99\x0a\x9e\xd7\
-(**\xe6\x07 4\xe5fk\xf4\x83\x02\xac\xa6\x0c\
-f\xe6\x8a\xf0\x85\x7f\xf2[\xa6nA&\x19\x93\xce\xb0\
-\x86\xe6\x19\x94Q7@+\xee@}V\x13=5\xcf\
--\x9f\xd5@\xf1'\x9c\x9fE5\x8c\x8b\xe6`f\xa3\
-(\x9d\xc8W\xe3\x8ba\x85\x00\xfd&\x99h,\x80\x10\
-\xef\xdcas\xf9\xb3\xea\xd8\xee\xec\x8c\x8c\x99.S\xc6\
-\xb2\x8f5u\x0d\xe1\xd9Y-X\xab\x07\x1b\xc1\xbd\xa0\
-F\xff\xab7\x833H\x80\xff\xaf9i\x1b\x00\x83\xbf\
-\xe5_H\xb9'\xf9\xf2/\xa4\xd4\x02\xe7\x7f\x94\x92C\
-^\x0f\x10u]\xfd\x8fR\x04H2\x9a\xb0a1\x8a\
-B\xf1r\xecy\xf8\x1c4ru\x82n\xb9\xc5\xf2?\
-\x1d\xee\xde\x5c$\x9dN\x8a\xf6\xf4b\x90m\x981%\
-\x11p8\xf3\xc9ai6\x89\xec\xbdn;ym\xdf\
-&F1ntr\xfe\xbe\xa5\xac\x85R\xbc\xb0D\x91\
--O\xf5\xaa\xc0-\xca\xd4\xa8\xa3\xaf\x94\xed\x15a\x03\
-\xc8\x0c\xeaWM\x8b\x19\x1a\xd1Q\x9c0XL\x0f\xf8\
-<\xb0p\x03j\xd3\x11\xe0m\x91\xcd4\x82\x1d\xb6A\
-Q1j\x9d\xbb\x91\xcb\xdb\x02|5\x12\x8d\xdb\x93h\
-\xce\x8ad\xb7A\xa1\xae5\xcch\xc7\xee\xe3\x0e\xee\xe2\
-\xa3\x8c\x03\x9b\x1aeH\xea3LH\x15?\xbe\xac(\
-=\x99\xe9U$<\x0c{w\xf5\xd2n\xc5\x0b\xf0n\
-\xae\xef\xd1\x22\xb5\xa5\xddP\x0b\xd0\xc8\xbd\xf1\x09\x8d\x10\
-\xa8\x06\x85\x9c}{\x1a-;d\xb1&\x8a\xa1K\xdd\
-\xba\x13O\xb5\xce\x9d+K6;\xb9\xcc\x95e\x0fA\
-7gf\x95p\xe9\xa6\x83\x95y3\xb4\xd3,\xcc\xa5\
-\xd3\xb2\x1c\x19ri\xa8\x15*RFo\xa3\x93\xe8>\
-\xf3R\xe3\xa0\xb5\xd4\x1aQW(\xdb\xd5\x10\x1cS\x8c\
-\xef\x07\xac\xb5@\xd1\x07\xf1P\x03%\xb96\x94)D\
-\xee\x8aO\xe1,\xf3\xfd\xce\x0c\x89\xcc?3`1\xdb\
-\xc6R\x7f\xf3\xddz%\x02\xc4\x0f+\xa5\x18\xb8\xc3\x11\
-\xc7\xdd\xd3?\xad\xf9^\x7f{\xf5\xd3T\xa2\x8d(\x8a\
-\xb8'\x09^B\x1b\xdd\x9d\xc0\xdf\x8cb\x9coY\xd1\
-\xb8H\xb99\x94\xe5\xb7&f\x14\xa1\x01\xc6+\xd2\xf6\
-\xb2\x9c\x05\xf8&\xb5\xec\xbft\xdaR\xa0\xb9\x81\xa2\x93\
-\xb1\x0c\xbfD\x07\x83\xee(T\xfbu\xb2\x09\xd3\x09@\
-\xd6P\xfcn6\xe49+:\xb9e\x99\xa6x\xfa\xd1\
-8:\x08H\xa3\x8a\xbb\x94a\x9c\x0b%\x90\x0dy\xd1\
-H|\x93\xca M\xa7\x1b\xf6\xe7\xca\x0a\xfcD\xcb!\
-Fm\xdd\x1aUj\xfeg\xd1\xfd\xfb\x1b\x9f|\x98\xcf\
-\xf8\xf4\xfe\x87\xf76jdj\x14\xbf\xaa\xaa\xb8\x0d\xd9\
-I\xeci53\xaa\xc8\x9c\xfdM\x19\x9b\xe9\x87\xfd\xb2\
-k\x86\xa7\xfbDO\x1bq\x17>\xab\xc3\xb6\xce~\xe9\
-H\x07\x00\xa9\xad}\xd2|\xff\xdb\xeb\xa9b&-\x1a\
-\xa2\x9c\x8e\xab\xf6%\x1a\xc4\x058\x0a\xb4\x91\xe6\xf0\x08\
-o\xe1\xb9\xcc\xd7\x9d\xc7|\xddwf>\x9b\x9f\xbey\
-\xfeS\x9d\xe8\xcd\xebD\xcf\xe9\xc4\xdfRS\xf9dS\
-O\xc7\xcb\xa4\xdbJ\xcc\xe7\x90\xc5\x9a\xa0\xa0\xa4\x0e\xed\
-\x1b\xcc\xf7 \xf3->ho\xac\x9477|i\xcb\
-\x9e\xf5\xafuO8!\xed\xba\x09\x1d|H\xb0\xd7\xb7\
- z/\xd1\xe9\xb5\x93\xde\xa4\xa3\xa1I\x8e[\xe8+\
-c\x95SJ\x1f%i\x7f1\x93\xd9I\xe8f\xa5C\
-\x03\xd7\xf3\xab\x00\x19^)\xc1\x89\xeb\x94\xb2\xdc\xb8\x0a\
-\xd2\xc9m\xab \x9d_H,Ct\x99\x0e\x86\xa32\
-le\x99T\xb2\x13\x97\x17\xcc\xe593\x06\xbb:S\
-\xfc\x07B\x13\x0fi\x85'\xd0\x19\xb0J\x0es\xc2\x19\
-\xcbu\x8b'\xe0\xc3\xe2\x86\xc2\xbd\x9f\xcd\x1e\xc5\x00\x9a\
-_\x10\xb5\xe6\x14\xf8\xb0y\x04=[\xab\xca\xb1U3\
-\x8bWCo\x07\xc5)X\xc4\xe1\x91\xe5\xba\xe2\x0el\
-\xe8m\xf9\xc2\xab\xa3\xebD\x86#\xb4\x83a~\xcc\xb5\
-_\x1f\xa3\xb2\x07\xdf\xaby\xee\xa0{^\xd9X\x1b,\
-\xd6\xef\xb2\xb1\xd7.\x82\xf6\xef\x12^X\x888\x03\x9b\
-\xc7[,]\x8fw\xf7g\x01\x8d\xe0\x97[\xa7\xa7\xc7\
-\xe1D8\xa1\xaeF|c\x86\xfe\x18\x96\xcd\xf4\xdeB\
-\x1b*o#\x9cR\xa2J\x22C\xaa\xe5\xe4\xf0\xe8t\
-\xeb\xc1\xfe\xee\x99\xcehR\xc0\xcf\xb3\xfc\xc2\xd6\x9c\xa3\
-\x07X\x07=\x1c\xc2$\xb9\xd4\x16\x7f:\xbb \xeb0\
-\xea\x0a\xe49\xa1\x94\x84\x8c\xf9\x10cUZ\x8f\xd7\x83\
-\xbc\xcf\xb7\x82$\xecP\xa2\xfc\x93\xd1\x860\xf2\x0aa\
-M0\xfd)\xde\xb5V\x029\xe36\xd5\x03|\x88.\
-\xab\x1e\xaa0,q\xe4\xd0\x88`\xd1\xb6\x7fv\xd3\xa3\
-#\x0a\x04\xf1'\xba\xb37\xf1\x8b\x04\xc8\xc3\xc9\xca\xd9\
-\x1cr\xf1\xc2\xbd\x82\xa1\x17^\x8f\xe3\xeeUR\xb9\xe9\
-\x81\x8a\xb8L\xce\x0b\x9a|\x9b\xfc\xd0[X1\xc5\xec\
-;\x1b\x12\xc8J=\xcfd\xa4\x8co\xde\xbc\xc4g)\
-U.\x1eW\x87\xe5H\xe8A4<\xf3\xc6\x9e1)\
-p\x9b3\xb3\xc7\xc5a\xa0\x95\xe8\xbfd\xb61\xbc\xca\
-\xa71\xf8\xdcC\xa0\x9f\xa6\xe3\xb4M\xfd+4\xfdS\
-v4\xd3t9\xce\x09\x0ce,\xd7\x92\x9e\x9c\x90E\
-7=W\xd7kt\xb5\x1a\xd8e\xbd\x0f8\xba\x1bU\
-\xbak\x94\xfa\xe9\xa7\xf5\x9a\xbfZqK\xd5\xfd5\x82\
-\xf4W?\xbc\x7f\xff\xde\x87\x85\xbb\x05t>\xdd=\xb1\
-\x18B43N\x87\xc1\x07\x02}\x1au\xd5^\xbd\xfb\
-i\x94\xc9\xae7\x8d\xed\xc5\xa4\xde\x93\xa3>z\xfd\x04\
-Y\xd1\xdcQ1/I\xd8\xe0\xab\x1e\xde\xd8i\xe4\xd2\
-y\xd3h\x0f\xe7q2\xc4@\xab[\xe8\xa5]\xfez\
-\xa3\xcf\x8f\xc0\x13S\xdb\xa2\x87<\xc9\xce2\xd5l4\
-u\xc0\xbc\xdc,\xa8\x92w7\xce\x00\xd6\xc6z\x98\xf1\
-\xbd#(H.h\xf8@,\x14\xd9\xc4\x8f{\x14,\
-'\x9677\x9c\xd9\xe1\x9e\xdeI\x96\xe5\x9eA\x13\x8b\
-\x8fBh\xef\xb0\x81{x\xf9\x15e\x18H\xab\xc4\xc0\
-\xcb\x08\x81\xf1\xc9*\xf2KG\xa9\x9d3\x09\x18\xd2\xf6\
-&\xaav,[2\x1b\x92e\x07\xd3\xa4\xe92(\xce\
-\xaeK\xb6V\xd1\xa5\xc1nbF\xb5\x07\xd1\xafd\xb1\
-\xb3\xe0Z\xdb~-\xfc\xdc\x0d\xc4*n\x1c\xd09\xc5\
-A\x9f\xd9\x16\xd0\xfc&\x13\x16J\xd7\xc2s4X\x8a\
-\x9dc4K\x90\x88\xebD\xc6u\xe0H\xfc\x06\xf8o\
-v_\xdc\xf0\x09\xa3 \x10\x9cG\xb6\xd3\x84\xc2*\x89\
-E.\x09\x1e\xba\xfe 3\xc9Y\x1b*\xf9++\xf5\
-e\x9dp\xd0c3\xdb>M\xd4\x0a\xc7\x0c\x94\xbc\x87\
-\xb8\xba+\x80\x8a\x8f\x07tx\xbc\xa3\xde\xcas\x17\x02\
-Sku?\xbeU1^Pf\xd9tZw\x16\xdb\
-\xadke\x06\xdb\xdc\xd9\xa9qi\xf5\x85i\x8c\xa2%\
-7A\xd8\xa8|+\xff\x96\xaccK\xce\x9a!\xe9\xca\
-\xda&v\xec\x95\x95e]@\x0cO\x185<\xeb\x0d\
-\xa3\xc70\xe3\x0f\x83\xd8\xdcwV\xe4\xdc\x95\xbc`\xe4\
-\xb7>-2CQb\xb5\xce\xb41\xb3\xf3\xa6\xa7\xe8\
-+\x95l{\x81\x93\xfc\xe94\x93\x0a;\xfe\xadQ\xef\
-&\x9f\xc1\xce\x81\x05\xe9\xfdk\xd8BB\x09 U\xdd\
-0\xa6e]\xca\x17\xc1\xeb\x1c\x03\xf4\xdd\xf7\x0d}E\
-\x90d\x09\xa8\x92\xdd\x8e\xca\x8ev\xd3\xaeLu7D\
-\xdb\xc5 \xb9\x89\xfb\xe4a\x15N\xbc\xf7\xbd\xd0\xfb?\
-~\xf57\xbc\xe0;\xdew\xe0\xd7/\xfd\xd0\x0b\xbc\xff\
-\xfdw)\xf1\xbf\xc3\x9f\xbf\x0f?7\xf0\xc7\x0f\xe1\xc7\
-=\xfc\xf1\x07\x98\xf9K\xbf\x8f?\xff\x18~\xd6\x15\xc6\
-L\x90wH1\xfc\x89\xaf]\xe0?&^\xe9\xda\xfa\
-U\x00u\xfc7\xa0\x85\x01$\x93\xa7R\x00\xf7\x1d\x82\
-\x83\xea\xacX\xa7\x7f\x97\xd3\xfe\xd0D\x8c\xe53\xbeQ\
-\x04\xa8\xf0\xe0n\xd4\xa4c\xc6\x11\x1d\x0b\x8e\xe6Zk\
-,\x9f\x0d\xa5R\xb2sGE9\xecv\xc4\x05\xdd\x1b\
-\xa8\x1f\xb4\x11\xf3\x5cC\x9f\xa3YW\xfc\xcdy\x86\x17\
->N\xe5wI\xb8\xee*\xa1\x84y\xe3\x94R\xdeE\
-\xacd\xcb|\xb6\xc4\xd0\x22\xf3\xce\xee\x81\x1f\x94!`\
-\x814\x1f\x03\xf9\x82\xfbY\x0bt\xd1\x190\x0c\xc7/\
-\xff\xa6g\x1fci\x96c\x83\xb3X\xd3\xcb-Q\x94\
-{\xd9\xb5\xecP\x99\x1a\xcd\xd9z\x9e\x964\x94\xac#\
-\xb2\xe7\x89k\xce\xd6\x0e)eL\xa0t\xaf\xb2\xf5\xd6\
-:\x9f&\x83\xb3:\xe0\xde\x04q\x84\xedf\x0b\x9a\xac\
-\xbe\x0a\xc9r\x06\x09(7\x19\x8b\xddr~Y\x07-\
-d\x1e\x9d\xe8\xa4\xbb\xc0\xb7A\x81\xe7\xcf\xe2o\xeb\xe6\
-\x10.$\xf2\xa2\xceI\xf75\x8a\xe5\x02\x22\x0a\x01J\
-a\x0c\x8dJA\x0e\x8f\x16A\x90v\xb4\x08\xc9\xee\xc2\
-\x8a\xe8\x06\x84>\x7f\x9c\xd7\xe4\x05\x03o\xdaS\x06A\
-\x13m\x01\x0c7g!\xabBs\xe6\xb9;\xcd\xf1Z\
-]\xb4\xd6W\xcaV0\xd6\xbb\x963z\x97\xb5\xec\xb2\
-^D\x07\xe3\xa0\xe8Y\x9eTA\xa1{\xac\xbd\xba\xe5\
-\xeb[\xabk\xef\xa9\x05\xf2\x0f&\xcb\x8c\xe3\xca\xb9S\
-j\x1e\xa7\xa3\xf7\x0a\x15\x99\x8f\xd8\xf1\xe4V\xa6fZ\
-\x81\xe6X\x9b1\xdf18\xcf\xf7g\xa8\xcd~\x8e\xcd\
-\xea\xbc\x99\x99\xd3YY+\xef\xd2\xdbw\xb8\xc1\xf0*\
-m\x8f\xae\xc5\x1ay\xcd7X\xe0\xe35>\x06\xdf\xe7\
-\x0c\xdb\xa2X`\x80$\x05{'\xbdA_\xdb2\x05\
-[\xf9\x8bV<\xaa\xceS\xa7\xac&\x9d\xab.\xc8\xa0\
-fx\xfe|5~Y\x15\x92v\xe8\xe3\xc2[k\xf6\
-zt\xe6\x8e\xcc\xcf\xf7\xc9M\xd0\xf9\xc1\xb87JB\
-\xd0G\x83\x81\xfe\xa9\xbbF\x01\xb3\xe6u\x8f\x00\xde\xaa\
-\x8bwju\xdc!c\xf2p\xd0\xc2?\xcc\x7f\xfa\xd4\
-BXP\x7f\xbfds5\xf1\xa7\xee\x09\x08\xcdy\xfd\
-\xa0\xfb\xd1\xf6\x9c1\xb09\x9f\x91\xc0\xdcs\xa9\xdb\xf7\
-\x5c\xea\xe5;Km\xc6\xb2\x01\x22,\xb1\xd0\xd7\xc4v\
-\xce\x16\x87\xa5\x8c\x97Nn+\x86\xcb\x96\x93f\x9cR\
-2\x0d\xa8\xa97\xd3\x07I\x94\xb2\xf4\xbe\x9b{\x8b\xdb\
-\xa3Y\xe0n\xfa\x8bH\xd0\x85\x1e\xdf\xe9\xec\x7fNk\
-VV\xba\xab\xab\xfa8\x97\xe2\x8b\x1b\xfb\xc0\xdb\xb9\xf6\
-\xdc\xban?\xe7\xc5\x926]\xbfb\xdbXQ\xdc\x98\
-lC2O\x01\xb9\x0e2\xef\xd4\x96\xb9\xeeBY\xdd\
-\xc3u\x0aF\xe6\xb0\xdc}t\x1aG\xc4Y\xe0\xc6\xf7\
-\xd6\xc8\x8dO\x11\xd7\xb2\xc8GL\xbb\x97yg%~\
-bM\xb1k\x9f<=\xda=6.\xff\xc6\xdb\x81^\
-\xa3V\x8fq.\xd8\xc4\xa6\x85l\xa4\xa6\x0e\xdeEU\
-\x03F\x17R\xa7S\xde\x96\xe9}\x17sA\x8ac]\
-\xc8\xf4Y\xbf\xa1\xb4\xc0o\xc8\xdd\x12\xbb\xcec\xf3|\
-\xa4\xd8E\xeaR=\x80]\xe0\x04\xa5\xfd\x96\x83o\xb2\
-\x85\x99k{\x8eS\xf3<\xd5\x92.E\x8b\xb7D\x99\
-\xa7\x9fs\x97\xa4\xbe\x9c\x1b\x9bM\xec\x8d\xe3\xedVu\
-01\x02\xbdZ\x5c\x0e\xe2\xd6\xbc\xe5\x02\xf3\xbd\xa0;\
-\xbe\x09\xd1\x91\x01/N\x17]\xc4\xace\x16\x84\xcc\x9a\
-be\xf1\xfc\xcc\xe4c\x9a\x9a]\x05YO\x0e\xdfe\
-E\xc5\xf6\xd2\xb5\xfdn\x22k\xb5\x13oE\xbc\x9d\xb1\
-\x8b\xe6\xf0\x97\xcfU\xd9\xcf\x1b\xbb\xdd+\xcb\xbb\xc0m\
-n\x87\x16\xc8\xdb\xdcw\xe9\xda.\xc3\x0b\xaf\xdbt\xe5\
-\xa9z\xda`\x97x\x86+W\xf2\xe5\x92\xab3\xc0q\
-\x1dv.\x07\x89D\xbfVW\x03\xfa{\xab\xdb4]\
-\xe3X\xaa\x8c0\xda\x0b\xb7\xe0RMF\x9c\x98\xb1,\
-t\xa4\xd3j\xe5\x0f\x06s78\x98\xef\x05\xca\xd7\x13\
-\xb9\xad\x98\x07\xcb\x15\xb2;4\xeaNT\x81\xed\x85Q\
-\xbbz\xa3\xf9zWo\xe4\xdd\xb9\xe1w`)\x14\x06\
-Q\xd7V\xed]F\xf8f\x19\x8e\xfc\xe4\xa0\xb6\x0a\xf3\
-T\xb4\xe1\xbf\x15W\xe1c\x86\xdf<?a\xd9\xb9\x0c\
-\xc57\xc0n\xad\x05\xffle\x9b\xcd\xd8F\xce\xd9\x03\
-\xe4nk,.\xb03$p/\xec\x9b(Ln\xbf\
-\x93&\x1cs\xb0\x8a\xf3\xa7R\xbd\xaf\x1e\x80\xd7N6\
-\x1fc\x88\x90w\xdeW\x15D\xd8r7\xc2\x14\x89\xab\
-\xca\x01\xbd\xa0\x83\xad\x14\x84\xa9q5\xf2\xaa\xde[q\
-\xa6\x05f\xee\xe4\xd2\xa7?\x9f\x7f\x95\xee/\x8e\x9f\x5c\
-D\x9ff.\xbd\x7f\xb6\xb6\xda\x5c\xf7\xb9\xbe\xfd\xddg\
-\xbb\xfb\x8dy\xf8\xc8\xd1\x00\xefo\xae\xea\xf7\xa0\x18\xa3\
-:\x93\x93Y\xe1\x5c\x16\xe7\xb0\x01:\x16\xc2M?n\
-\xb71\xca\x01o\xf70\xe0\x85\x8e\x96\xc1\x86\x06\x14y\
-\xec|\x03\xbf^\xf6./\x81\xff)F\x02\x87Q\x9e\
-_\x92\x97.\x14UNH\x05+^\x87g\xa2Jx\
-v\xb4\x0eJ\xffB\xe2\x85\x98\xb8\x1d\x94|\xc2sH\
-\xc7\xf9\xe0D\x0c32g\xce:\xce\xf2j\xbaR`\
-\x8ey\xd35Qo\xe9\xbe\xf5\x02\xa0\xaabB\xcf\xab\
-\x8b!\xdc\xca~N\xe4\xc4\xbb\xdb\xb1\x8c\x11K[\xb0\
-<\xc5X\x86\xafjw\x1d@9\x8d\x9cKV\x06\xf1\
-\xe6,u?\x87\x14\xbf\x1b\x19\xe8\xacm.s1\x84\
-\xf7.#I\xd1\x8b<\xd8\xe8q\xfc\x22\xcf\xf7\x8c\xdb\
-\xe60\x84\xfd\x1f\x0a\xd3\xf6\xc3\xf8EB/\x10g\xef\
-i\x96\x1cIfB\x0a\x19\x8c\x1eyB\xc8a\x1fB\
-E\xd6o\xeb\xad\xc9\xa5\xf3\xd1y\xf7|\xd0\xc4\x13T\
-O\x9f\x0e\x12\xbe\xc8\xfeXX\xc4T\x1d\xe5R\xca\x0b\
-\xe3\x0b\x81v\xcbD\x0bR!G\xa4\x7f\xec#d\xf7\
-F\xc5s\x11\x17\xd8Z\xe0\xfa\xc7\xf2qh\x19\xcf\x1e\
-\xed\x1e`\xbc\x17\xbbn\xd3V\xde\xf66\xf2}\xe0]\
-\xda\xa7\xb9-\xb5\x9f\x03]-\xa0\x00z\x90m\x8d*\
-eh\xd7\xea\xfe;\x5c\x88\xd1\xe4\x02\xbc\xdej\x9a\xa1\
-W\xbe\x15)T\xa7(h\xf9\x0ec\x14\x9c\x99M\x15\
-\x1a\xf9l\x1d\xc2kn\x1d\x94\xb8hP\xc4\x89\xb2x\
-T\xe8\xc8k&\x97\x95KFm\xe1-\x0b{\x06U\
-\xe4d\xb4\xec\x06\x15\xd1\x96y.c(\xe09\x927\
-\x15\x04w\xbf\x0e\xf6\x16\xa3*\x83XP\x81\xca\x99\xdf\
-\xb4\xb7\xb7\xcd\xa8\xf1\xce\x92\x83\x05@Y\xa5ev\x1c\
-\x9e\xa7\xc1\x22\xab\x09\x9bz\xb4J\xc1\xef\x0c\xccU*\
-\xba\xc2\x81\x8b\xd5\x8aw\x10\xd7\xda~\x83\x89*Zk\
-U\x82\xb5\xce\xd1W\xdej\xdb3\xbe\x18\x8e\xfbs\xf7\
-=\x04\xe1\x05\x98\x0b\x0b>|bt\xbcq?\xdc\xf8\
-9\xd6]\xb0\xd1\xbc\xb5a\xd7{\x0f[\x9c\x0c2i\
-\x05\xf7\x1e\x16\xdf\xfd\xd6v9q\x02/\xbc\xf3\xb8\xe9\
-^OV1[\xfc\xdc\xa0\xa1\xe2t\x17\x13P\xa5K\
-F\x99\xbf\xa1\xfd:T\xf6\xce\x06 \xd9y\xe1K\x9f\
-o\xb3cw\xef\xa9Zl\x1bY\xfc[\xc8\xb5\x9e\x01\
-\xee/\x02\xee{\xc4\xd8\x1b\xc4\xd8uU\xd0~\xdbf\
->\x06\x1b\xd2\xbb#\x89\xde\xdb\x88\xa2\xfa<\xe2h\x95\
-y\x908\x8d)\xd1\x9a5\x94\x22\x00\x86\xfb\x9dS\x82\
-\xa2\x01\xab:\xb4\xc7\xdf\xbc*4\x90\x96\x0a\x94\x82q\
-2!\x91\xa8h\x84\xc4\xd66\x9a=O(\x90\x84\xc7\
-7p\x08Z\x7fy\xcd\xff\xec\xcc\xc3\xd9kfV\xb7\
-\xac\xc4b\xeboN\xe8\xdcNX\xfd-\x88&5>\
-\x82\xcd\xbeg\xcc\xe780\xd8\xcd\xcd\xa2D\x17\xbd\xc2\
-\xe3\x87\xcb\x15\x87\x03\x96\x19\xf1t\xba\x9cAB\xd9M\
-?W#\xa7\x97`\xffy\x14\xa4\xa8\x86\xb6\xac[\xb6\
-\xdc\x0ddE}dYPy\xae\xdfT \xd3m\xc7\
-\xd9\xde\x12\xd9r\xbaC\xa4\x02\xcaR\x03\xec~\xda\x03\
-\xa0\x0c\xfd \xddU9\x1c\xbf\xf2bv\x89\xb7X\x0f\
-\x80\xea\xeah\x93\xc3..\x17q\x8f\xffM\xae\x14\xd4\
-\xd1\xc8\x95m%\x12M\x0bA#\xff\xe6\x14a\xf9G\
-\x02\xaf.\xf2O\x96\x0fYJ\x0a\x04_F\x026\xb5\
-\xb7\x16\x8e\xe4\x5cw-z\xe1\xe5\xdd|D\x5ci\x84\
-q\xe3\x83A\xefU6]\xc5\x98\xc7(\xbb\xe3\x9bn\
-\x89\x10\xc3j\xfb\xe2H2\xc1\xe0\xef3\x8fk\xa0C\
-\xe3\x16\xa8\xdf\x12\xa8\x17P\x18\x7f\x14\x8a\xfd\xce2\xaf\
-0\x11\xdf\x8c\x94\xeb\x80|\xef\x92\x11\xe8\xb4\xea\xc7\xe8\
-S\x05P\xb8^\x98c9\xf1\x09e\xe0\xc2\xac\xcb\x01\
-\x88\x99\xc2D\x8d\xbbV\xfd \xb9Y\xaaU\xefc\xbd\
-\xc9\x0f\xc6q\x07[\x83n+\xf4!-\xa1\xe0\xb6\xb6\
-d\xc1k\xaai[]K\xdd\xd9\xadR\xf0{\xbc\x93\
-\xda\x89A\xe8Z\xe8\xa9\xed\xe5\x96,\x13\xad\xfaV\x87\
-\x82E\x91\x01m\xc8\xcd\x5c\x8asm\xcd\xcdZ`i\
-&\x1e\x9fh\x8bp\xc0\xb3\x22\x9f\x92\x83\x13;\xb3J\
-1\xec\xa6yC\x7fZ\x0c\xa5\xac\xcf\xa5\xac\x04\x9f\xfa\
-\x87\xc52\x1a\xcaJ\xd0\xbc\xa23\xf5'\xf3\x84\xfaa\
-\x95\xb1\x06\xbf\x96\x19\xfcZf\xf0k<\xf8\xf07;\
-\xe0\xb6a\xd9\x89E^\x9f\xcdJ\xd4\x9d|\x0c\xde[\
-F\xca\xb5\xe33f\xa3\xdb\x8e@\x98\xcf\xcb\xa7F'\
-m\x04s\xe2<FR\xda\x0d\xfe\xe87\x8a}D\xe6\
-G.~\x8bm\xe9h\xae\xfe9\x1a\xbc\x93(t\xa4\
-\x9eJ\xcc\x8a;\x95n1\xa6\x13Rd\xee\x8c\x81\x1a\
-\xc2\xc9m\xb9\xddL\x94[\x97\xf8\x9be\xa1v1o\
-\xb4\xff\xb6xc\xae\xb9|\xd4\xbe\x8du\xe6\xe7wk\
-\xc1\x02\x8d\x1e\x1bP\xc2\x0c?\xbe\x11\x9e}\x0bb\x13\
-\x16\xc27\x8f\xe8\x06\xca\xfb\x99\xbaV\xbf\xfdd,\x99\
-q\x99i\xe5\xf4\xfa&\x1e\xbcX\xd8i\x04z'a\
-\x94\xb4\xaf\xfe?\xf6\xde\xfd+\xae\xe3X\x18\xfdW\x86\
-\xed\x18\xcd6{F\x03\x08\x09\x0d\xda\xe2\x22\x84-\x8e\
-\xd1\xe3\x02\xb2\xac\x83\xe7\xf8\x1b\x98\x0d\x8c5\x0f23\
-\x080\xcc]v\xfc\x90\x00\xc7\xce\xd3\x8e\x13;\xceC\
-\x08\x01q\xec\xbcN\xde\xc9Z9\xbf\xdd\x93\xb5\xee\xff\
-\xe0\xef\x0f\xf8\xfe\x85[U\xdd\xbdwu\xef\xde\xc3 \
-;9>\xeb\xfb\x94\x98\xd9\xfd\xaa~UWWWW\
-W1\xee\x01\x9d\xea\xb4\x8f\x1dB\xd5\xcc\x90x+j\
-\x1dod\x98%dn\x85\xcf\x87\x8e\x1d\xa3\x1c\x9f\x8f\
-\xdb\x8c<c\x10\xef\x18\xba\xf5\xc9\x0a\xaf>\x80\x8a\x15\
-\xe1,\x01\xd9\x1d\x118\xc6\xf2\x1b;a\xa9\xb2\x8e\x9b\
-\xe9/\x88gF\xd7nNM\x1d\xfbvU@S\xb5\
-\xc1A*f<\xae\xe3\xc8[\x8a3-\xd3\xceZ\xa4\
-\xac\x94x\x85r\x9cf\xa8Q\x00\xcf}\xc7[z\x92\
-'\xb5\xd0\xa9\x87\xd2\xce\xd7\xc6\x9f\xbc%\xf1#f\x7f\
-A\x0f\x19&\xc4\xc84\xa9l\x8do\xb4\x8d[>\xf3\
-Ut\x976\xdcTvW\x13\xc37\x83j\xb1\xd6*\
-/t\x92q\x85y\x1c\xcd\x91\xc2?\x8f\xaa\xc3\x179\
-\xe4\xab\xd7nNO\x91Y?/\xa8-\xd4\xc9bL\
-h\xe4\xaf\x8b[\xe0\xce\xfa\x9a8\xf0\x0a\xecT\xb9\xd9\
-\xd2\xde\xffK\xaf\xe5\xa1\xdf\xf5pL\x22x\xcc\x169\
-\x07\xd3\xadAP\xad~\xfdB\x87\xf0L%\x89\xeb^\
-\x15\x0a\xa1\xbf\x04\xd0k>\xafXU\xf0\xd2\x85\xda\xc8\
-KB\x9f\x9c'\xcf\xbd\x84\x8f\xa9B8\x16\xa5m\xcd\
-\xe8\x82\xc4\x97\xc8\xbfz\x07\x84\x892\xe1\xfe$\x9e\x1b\
-wqss\xdc4{\x0b\xe8#\x16f\xa0Z\xb9\x13\
-l 6\xe2\x91B\xbe\xc4`\x8d\x9cst/\xf0N\
-\xa1\xab\xb6R\xd6\x7fZ#\xe9]\xbc\x1f\xe9\xc2Y\xf6\
-\x85\xd6\xb2\xd3\xe1%\x8en\x9fN\x7f\x90C\x16\x9bX\
-\x82\xd81\x1c\xab&\x199\x1d\xcd2\x9f\xa3\xa4=\xe6\
-T\x90\xeb\xe7\x82\xb8\x5c\x5c\xad\x8d\xa4\x082\x16\x9d\x5c\
-\x09\x07q\xd5\xe2z\xa8\xcb\x82g\xd4\xc5\x0ap\x04\x98\
-]\xf9\xe1\x8a\xd4\xce\xf0)M\xb9\xba\x94'\x91\x0d}\
-f\xc4\xfb*\x1e#_V\xf1(\xf1\xa8\x86\xa2 \x06\
-\x1f\xd7\xe1\xe7B\x89\xf8\x0b\x1a\xec\xc7P\xb4[wN\
-\xa8'\x177\x5c\xa5\xd9\x9f\x12\xde\xf6\xba\xb4Y\xf5\xdf\
-\xc9&\x95M?\xd0\xf4\xf8\xd5\xdf\x8d\x00]\x13\xc3*\
-!\xba\xf4\x18\xacn\xb2\xb8\xbcV\x1a1\xb0/\xd1/\
-b\x0b\xf8\xa2T\xf6\xc9sM\x07\xa2C\xe9\x8e\xe5\xfc\
-\x18U\x8b\xce\x91M\xf7>\xdaQ\xee\xae\xee\xbf\x22\xce\
-\xc2\x85\xcf\xf0\x8f\x7f\xaf\xa2g\x97\x9d\x80z\xca\xad\x8d\
-\x0e\xbd\x10\x19\xfe1\xddp\x9eX\xd7l\x0a\x90\xca\xc5\
-\xea|\xb3\xd5H\xe7\xbc\x01w4\xd4\xe4\xb4\xe5\x18p\
-\xbd\xfe\xb3\x80+O$\x83\xe8?\x06D\xbf\xeb\xe2]\
-\xb1m\xe0\xc4\xbb1*D\x8d\x8f\xd8\xb2\xda\x05\x1f-\
-E\x0d\x8d\xca'<\x8bp@\x1a\x97\xf6\xa4\xd257\
-\x9f\xaee(\xc3Y\xcf\x96\x81\x0cQ\xf5\xa5k\x17/\
-\xf6\xe7\x5c\xb7\xcf\x9a\x05\xcdQ\xf5\xa5\xfbs\x03\x83\xbd\
-5\xd7\x0d\xa7j\x1d=\xad'\xce\x13\xedk\xa6\x17.\
-m\xfa\xcbw\xfdR}\x81\xe6$\xbb\x00+\xab\x15H\
-o\xe2\xb8\xf4\xee*\x87\x091Y\x03\xc2L\x924<\
-\xb6lD\xba\xb8)\xc9k\x9c\xc9\xeaJ\xbda:E\
-\xd1\xf1+\x8d\xb9\x95^L\xf9.\xb6\x08\xaa\xa6e/\
-\x92\xdamO\x80a\xeb\x9d\x9c\x9c\xa3M6\xd5\xef2\
-\xe5@}\x22\xc5\x0bY\x92\xa8\x1c\xaa\x12\x0b\x93\xae\x18\
-\xe5\x95\xbd\xea\x88\xf4\xec\x8e\xa9Y\xfc\x83\xee\xedE\x8f\
-)O\xd2\xe8\x86\xf9\xd1\xa9\xa0+_\x22Rd1\xf4\
-\xdag\x1d\x9f0\xd9\xcc\x8do\xed\xc2P\xb6\xb9\x02\xa4\
-z\xb1\x1c\x94\x94[\x9d(\x09\xcb='\x5c\x11\xa1\x1e\
-\x985\x81\xda\x8e$4tC\x94\xd6\xf3a\xb3=K\
-QW9!Don\xb1\x12hyM@&\xc6g\
-\xa1\xd9D\x93?\xb6&\xb8m\xea\x1ea\xb3V2\x8c\
-\xf1\xf5\x0cn\xf8lt\xd0\x9c\x8e\xad\xad3\xb1\x19\xb2\
-N\x0e6&\x9ck\xd6\x16\xd2JG\x94\x19\xee1\xe1\
-\x98\x08c\x00BcC\xd6\xaa\xc6\xebU\x1d\x0fd\xaf\
-\xe5s<\x85\x0ct*\x22M7\x13\x19\xc4hp\x84\
-\xe7\x8b\xc6(,\xc4\x86\x8aVa\xd4q\xbbH\xf9n\
-\x17{\x07\xac\xb8r\x0d6\xe1+\xb3W\xa7\x14A\x92\
-\xe6\x92:\x10%\xe0\x17\x8a\xa4m\x9c 1d2E\
-\xed\xd0\x99|\xa5\xf3\x98/;\xba=\xc4v\xe9\xd6\xc6\
-n\x16=\xd1>M\xcc<\x8d4\x92\xb7\xd2\xa8\xb7\xea\
-8RF)9\xbe(\x7f\x89\x067\xf4y(5L\
-`\xa9;\xd2\x8e\x9d\x1a!M\x1d\xcf\xbbz\xdd''\
-\xb3\xe4\xc5\x83\x0fb\xc1\x83?\xfd\xfdy\xf2\xdc\x11K\
-\x18\x80\x84\x01[Bn\x00A\x0d\xc4\x13\x86\x86\xf2s\
-C\xde\x90\x99p\x03+\xe0\xd9ox\x9b\xa1%\xd9\x9c\
-iI6\xc7M\xd3\xe6\xdaX\xfe\xe9\xc9\xe7'.\x9f\
-\x0c\x08\x94\x9b\xbc6;\xf1\xcc\xf4\xd8\x146\xb6?\xb1\
-\xa0Q\x99*4\xd0\xb9:\xa3\x14\x9a3\xcc\x93\xdb\x14\
-n\x9e\x85\xe2\xcf\xe4\xe7\xcexg\xe2\xf1\xb9~\xa3]\
-*\xc1\x1cC\x8a\x07\xbe}\x0a\x9d\x03\xc7`y\x9b\x91\
-Q_\xd9\x12\x1c\xefx\xb6\xcec\x85.\x87\xf5j!\
-\x86\xa2M\xec\x80(\xb3N\x882{\xa9J\xcf\xccN\
-O\xcc\x8e_\x89\xc3\xb6\xc0\x10W\xfa\xb6\xac\xca\xb40\
-f\xbc5yy\xc2\xdaZ\x96\xcd\xd3a\x93'e\x03\
-\xf9Q\xe98\xd2gf\xf9\xcd\xa9\x15\xfe\x97\xf5\xd2\x14\
-\xd7]q\xe1\xaeY/Nq\x05\xe9\xd1y.\xc7\xb1\
-\x86\xe2\x0a\x9e\x1a\x0as\xc1\xc6\x87\xa2\x8b\x9c\xfah\xb4\
-G$\xcd\x19[]\xa2\xddhS\xba\x0b\x126U\x9c\
-\x5c\xb6\x1f\xfe\xa9\xcf\xb3g\xcf\xc9\xcf\x01\xf8\xa7>\xa3\
-\xd8A\xf8\x07\x9f0\x7fd\x1e4?77\x08$c\
-\xe0\x9c>3\xce\xa5b\xb3\xbc0\x05G\xa7\x9a\x83^\
-\x81\xce\x02\xf5\x18\xd2\xc9\x84\xe7Pr\xff\xcc*0\x98\
-\xc4.a\xce\x81\xa1\xb3\xde\xe0\xf0\xa0AP\xe6\x06\x87\
-\xcfxC\xe7M\xca4wvx\xd8;w\xf6\x9c\x01\
-W\xfa\xc7\xbaZ/M\x05\xadV\x00'1\xc8z\xee\
-\xec\xb07|\xee\xbc\x91\x156\xe8\xf9\xcb\xe5\xe2B\xa3\
-\xdc\xbaZl\xdc\xa1\x9c\xc3\xc3\xb0J\x81\x037\xb2>\
-\xd3\x08\x82;c\xb0\x0d\xd7WZ\xe5\x05\x092\xe7\x9d\
-;?h\x92\xbf\xb9\xe1\xfe\xf3\x03\xde\xf0`\xce\x9cf\
-\x00\x12\xc0\xfeW\xac\xdc\xc0\xfdeUH\xd00\xff`\
-\xee\x0c\xe4\x1f\x8a\xf5\x0f\xe2\x10\xd0\xf9\xf3\xb1\x843\xb9\
-\x9c7|\xe6\xcc\xb9\x84\xfe\xa0u\xcf\x99\x8d\xea|\xbd\
-\x22\xbat\xe6\x0c\xf4~h\xc0\xcc.\xc6\x07\x05\xee<\
-\xf3\xd0\x00f\x8e\x8f6\xc4Ak\xce\xf1n\xd1\x5c\x8f\
-5\xf0\x96\x8d\x8a\x9e\xc3\x8e\x9c\x1f:\xaf\x93\x22\x07%\
-3\xd7W\x02\xf9\x9e\x053\x9e\x07\x8c8?\xd0o\xa2\
-\xc4\xd5rsa6XX\xae\x95\x17\x8a\x15\xccx~\
-\xb0\x7f\xc0;\x7f\xe6\x5c\xac1\x10\x07\x09g\x07\xe3\x09\
-p\x86\xf2\xce\x9f\x8b\xf5\xf5\x99\xa0.\x96\xe9\xccrq\
-%\xa0V\x9c?\x0fh\xd5\x9f\xeb?g6\xe32\xa0\
-\xcf|\xb1E\x990\xfd,\x22D\x0c#\xb0\xb1\xd83\
-9vc\x22\xf7\xc0\xc0\x19B\x9f\xf3\xc6(Ex^\
-\xac\x88\x11\x93\x05\xce\x9cG\xf0g\x07\x06\x8f-pI\
-\x148K5\x9c3\xd0%\xd6\x1e\x99\xfb\x1c\xa0P\x7f\
-\x7f.w\xce\x98\x13\x04\x1f\x9b\x17\xcc8\x0c\xd9\x07\xce\
-\xda:\xab:Z+ES\xde\xdf\x7f~\x18\x8b\x0c\xe4\
-\x86\xcd\xb9@:L6\x82\xf3\xe8\xbbo\xb1\xbc\x9e\xdf\
-t>\xbb\xff\x8a\x93\xbfz=K\xdc\x06Z\x89\xfc\x9a\
-\x1e|M\x0f\xde\xd3\x83\xef\x88\xe0\x0d\xfc\xfe\x06\xfb\xfe\
-&\xfb\xfe\x16}\xd3~\x8b\xc1o\xeb\xc1\xef;q\xde\
-\xc7\xdc\x99 \xdb\x8fT\xbd\x188\xa2\x80\xe2\x130\xe6\
-\xe7f\xcc\xee+Q\x0bv_e\xdf_c\xdf\xafE\
-\xdfo\xdd\x97\xdf\xb0)Ah\x87\x87>z\xa4\x85~\
-\xceC\x8fX=\x8fX=\x8fX=\x8f^g\xdfo\
-\x86\xdf\x7f\xfb\x19\x1f\xcb\xbf\xfd\x82\x8fK\x9a\xd5\xd1\xc7\
-\x132<0\xc7rm\xb2\xef\xad\xf0\xbb\xed\xad\xd4\x9b\
--1\xd3=4\xd2\xe6\x1e\x0a\xa3\xdb\xcb\xc6\xf6\x95_\
-\xaa@n\x00\x83\x7f\xa1`\xb4\xcd\xe1\xe0lS\x9c\xd8\
-\x81!\xb8\xab\x05\xdf\xf9a\xbc\xc4;\x1f\xc5\xe3\xde\xff\
-X\xab\xe8\xfd\x9f\xeb\xc1O\xb4\xe0G\x07Z\x1d\x1f}\
-\xc2\x83\xff\xf9f\x0c\xfa\x7f\xde\x8bGm\xc7\xa3\xc4,\
-\x87\xc1]=\xf8==\xf8\xbe\x1e\xfc \x06\xee\xef_\
-\x8bE\xfd\xed\x91V\xe8o\x9f\xc4r\xb8\xbc'\x05\x1e\
-\xf873\xef\x8bf\xd9\xff\xa1\x01\xdf\xe2\x85\xdb<\xf0\
-\xff\x18\x90\xdaB\xec\x0e(\x11M\xfc\x93\x8e\xc1<\x13\
-\xed\x06\x04\xf8\x89B\xb83\x18z(\xd7\x19>.r\
->{U \xb6\xe4\x8c\x85]\xd2\x08\x95^\xfd\x09\x0f\
-\xfc\xd4\xb1qH\xa6\xe3\x89\x22\x1aIw<\xed\xe1\x1c\
-6\xe3\xd5\x07\x0c\xd6\x9b\xdf\x08;Dt\xf9\xb37\x05\
-\xb9\x89\x98]\x8c\xfb\x96\x99\xe9\xdb\x96L\xdf13}\
-\xd7\x92\xe9]K\xdc{\x96\xb8\xefY\xe2\xde\xb7\xc4=\
-4+=0#\x0e\xcd\x88?\x99\x11\x7f6\x22\xee\xbd\
-bF\xbcjF\xbceF\x98\xc3x\xcf2\x8c\xf7\xcc\
-a\xbcg\x19\xc6{\xe60\xde\xb3\x0c\xe3\xfd\xfb*\x0e\
-\x03\xdb<\xb0\xcb\x03\xdf\xe2\x08\x17\xed\x16\x14\xfa\xae\x81\
-o\xf7\xdf\xd5\x92\xdf\xd3B\xdf\xd3B\xefk\xa1\x0fy\
-\x8d?\xe5\x81=\x1e\xd8\xd7\x0a=\xd2B\x07Z\xe8P\
-\x0b\xfd\x89\x01\xd9~\x85'm\xbf\xc6\x93\xde\xe0\x01>\
->\xdb_\xe7\x81o\xf0\xc0\x8fx\xe0\xc7<\xf0\x80\x07\
-x?\xb6\x0fy\xe0\x88\x07\xfe\xc0\x03\x7fd\x81\x9d\xaf\
-\xf1\x00o\xf5\xce\x9b<p\x8f\x07\xde\xe6]\xdd\xf9&\
-O\xfa\x16\x0fh\xb3\xba\xf3\x1d-\xf4]-\xa4M\xf0\
-\x8e6\xc1;\xda\x04\xefh\x13\xbc\xf3\x13^\x1d\x9f\xe0\
-\x9d\x90\x92\xc0\xf1\x07\x82|\x9cv\x1e\xb1\xc0\xee\xeb\x1c\
-\xe0\xee\x1bZ\xe8M-\xc4gn\xf7\xe7\x1a\xfc\xddO\
-4\x8a\xb9\x0b\xbb\xbc~l\x96'Q\xe7\xb3w\x7f\xc5\
-a\xbe\xfb\x1b-\xf4{-\xf4g-\xf4W\x1ez\xef\
-5\x1e\xfa\xf0{\xace\x1f\xfd\xc6X\xa5\x1f\xfd\xbb\x19\
-\xf1[3\xe2wf\xc4\xef\xcd\x88?\x98\x11&\xa9z\
-\xf4\x09o\xd1#\xad\xb5\x87\x9f\xb0\xf6\x1d~\x1a\x05\x22\
-n\x08\xb2\xfd\xed\xb7,\xf0\x1f\x1c\x07\xfe\x83\xa7<\xa5\
-\xbe\x07\x19\xcf\x04\xf1\x9ec;\xe1w\xbd\xf7d\x18\xa8\
-\xac}\x97<\xad\xa6\xbc\x1f\x98\xb2\xbcc\xc8\xadH\x10\
-\xe3\x8c|\xbeV\x5c\x88\xc6\xc6\x8f>/F\x9f\xa3&\
-\x1f\xad\xb8\xbb\x17^\x88\xb6\xce\x7fc\x0d}\x91\xb5\x19\
-x\x07\xf2A\xaco\xce\xdd\x08W\x9c'B\xe8_\x09\
-\xab\xc9&\xf4\xd5\xec\xd4\xff\xfb\xfb\xa8i\x7f\x7fE\xe3\
-f\xfe\xfe\xaa\x1e|-\xcen\xbd\xae\xe7xS\x0f\xde\
-\xd3\x83\xf7\xf5\xe0[z\xf0\x97q\xe8\xbfSCK|\
-\xcfw\xad\xdc\x8byJy\xe5\xbd\xee\xb2\xfd\x88a\xea\
-g\xaf\xfc\x98\x87^{Ok\xd9g\xaf\x7f\x931>\
-\xaf\x7f\x9b\x07\xbe\xc7\x03\x1f\xf0\xf3\xd1\x1b<\xf0C\x16\
-x\xeb\x0d^\xd7[oj\xa1\x9f\xf0\x1e\xbf\xf5S-\
-t\xa0\x9d\x8e\x0e5n\xfc\xedCV\xc3\xdb\x9ft5\
-\x04o\x7f\xca\x01\xbe\xfd\x0b\x0d\xe0w^a\x00\xdf\xfb\
-\x847\xf2}~\x0e|\x9fs\x9b\xefsn\xf3\xfd\x9f\
-F\x81\xff\xf9\x0a?\xda\xfd\xcfW\xb4\xd3\xcb\xff\xfa\xdd\
-ocS\xff\xbf~\xf7;\x93aF\xe7\xc1\xd2\x8b\x0e\
-\xa4HI\xbf<K\xfb\xb1\x0b\x04\x990\xa2;\xe4\x81\
-\xc5W\xf0\x19e\xd4R\xb3/\xda\x92\xc4!}\x8eX\
-\x14*K}\x88\xa7\xee\xd9R\xc5\xb9\x8f\x15\x16]\xb6\
-\xa4\xef\xb1\xf4v\xe8\xa1H^\x99\xe2g\xb5Zq=\
-{|\xb6R/\x96\xc6\xeb\xd5\x95J\xd0\x0a\xd2\x0ez\
-5z\xa9)\xbc}\xf9\xf6\x12x\x17\xa2;&\xf2\x12\
-\xeeL\xe2\xde\x80\xcc\xa1\xa6Y\x11\x02\x0du\xa4\xf9\xec\
-\xcd\xef+\xcc\x0d\x17\xd1\x9b?\x88G}`r\xd4\x1f\
-\x9a\x11?4#>2#~dF\xfc\xd8\xc2\xed\xff\
-\xc4\xcc\xf4S3\xe2\x81\x19\xb1g\x01\xb3o\x89{d\
-\x89;2\x81\xfd\xcc\x8c\xf8\xd8\x8c\xf8y|t>\xb1\
-@\xfe\xd4\x12\xf7\x0bK\xdc/-q\xbf\xb2\xc4\xfd\xda\
-\x12\xf7\x1bK\xdc\xbf\xc7\x9b\xf7\xdbx\xd4\xef\x18'\xf1\
-\xa6\xc9\xa5\xbc\xc9\xd9\xdc79\x9b\xfb\xe6_,5\xfe\
-\xd5r\xc4\xf9\x9a%\xee5K\xdc\xeb\xe6Q\xe8\x0dK\
-\xa67\xcdL\xf7\xcc\x88\xfb\x96R\xdbf\xa6\x1dK\xa6\
-]3\xd3\xd7ccu\xef\xedx\xd4;\xf1(\xcb\xb1\
-\xf7\x9e\xe5\xd8{\xcfr\xec\xbdg9\xf6\xde\xfb\xbe\xd9\
-\xb2\x1f\x98\x11\xe6\x9a\xbcg\xae\xc9{?dSw\xef\
-#\x1e0\xd7\xe2=\xcbZ\xbcg\xae\xc5{?\xb5d\
-2\x97\xe3\xbd=3\xc2<\xc0\xdf\xb3,\xce{\x8f\xcc\
-L\x07\x96L\x87\x96\xb8#K\xdc\xcf,q\x1f[\xe2\
-~n\x89\xb3\xac\xe5{\x9f\x9a\x8d\xfb\x05\x1f\xcb_\xf2\
-\x80e\xe9\xde\xfbu\x1c[,+\xf7\x9ey\xbe\xb8\x17\
-_\xb7\xf7~\x17\x8f\xfa}<\xea\x0f\xf1\xa8?\xc6\xa3\
-\xfe\x14\x8f\x8a\xc9I\xfebF\xfc\x95G\x88'2\xdc\
-G\x9f\xb6\xbf\xc5\x1c\x03\x0a\xb1\xbb\xd8\xf2B\x1d\x05\xc8\
-%\x94\x86\xba\xdc\xe9FN\xb6\xd3E\xa2\xfb\x8f\x1ej\
-\x82\xe9C-\xf43\xab\x10\xf8\xb3\x8f\xf6uQ\xea\x91\
-\x1e\xfc8\x0a\x9et,\xcc\xdb\x17\x1a\x95d~\xe2\x9f\
-?\x5c\x1f\xfe\xd2>$\x1f\xfe\xea\xf1;\xad.\xa6\xbe\
-t\x9d}\xe5]+#n;\xd3\x89C\xc9\xf7\x9c\x8e\
-\x17\xf4\x22\xd3\x07\xc7e\xd2\x06\xf6\xc4mx\xdf\xe9|\
-\xcd/r}xl\xae\x93\xceb\xfc\x16\xf8\xcb2\x9f\
-\xe1`\xfe\xe7\xd7\xe3\xf7\x17\xdf\xd7\xaf$>\xd4\x83\xbf\
-\x8d\x9fbN4(\xb1[\xfb/\xdd\x98|\xf6\xf6\xaf\
-\xe3\x17Ko\xff\xc6r\x01\xf5\x81%\xeeCK\xdc\x8f\
-,q?\xfe\x9c\xe3\xa8]\xa1\x7fI\xc60<-}\
-d\xe1\xea?\xb2p\xf5\x1f\xfd\xd1\x94\xf3\x99;\xebG\
-\xe6\xce\xfa\xd1\xe7\xdaY-\xb7\xf3_\xb2\xb1\xfb\xff\xc2\
-\x83\xc9\x89\xc9\x8d\xa6\xb9\xf2\xa5\xdb:\xdexC\xbb\xe4\
-\x7f\xe3M\x92\x0e\x1az\x8b'\xedsL\xb3\xe5\xcb\xb6\
-\x12\x1e\xbc\x12\xe3\x1e\x1f\xbc\x1a\x8f\xfaZ<\xea\xb5x\
-\xd4\xeb\xf1\xa87\xe2Qo\xc6\xa3\xee\xc5\xa3\xf8\xed\xc2\
-\x03~o\xf6\xc0r\xfe{\xb0k\x893o\xfe\x1e|\
-\xdd\x8cx\xdb\x8cx\xc7\x8c0/\x0b\x1f|3\xde\xd2\
-oY\xea\xb6\x5c\x17>\xf8N\xbc\xe8w\xe3Q\xef\xc6\
-\xa3\xde\x8bG}/\x1e\xf5~<*.\x13z\x10\x97\
-\x09=\xf8 \x1e\xf5a<\xea\x87\xf1\xa8\x8f\xe2Q?\
-\x8aGYN\xa4\x0f~b\x89\xe3\xd7U\x0f\xf8\xa5\xde\
-\x03~Y\xf5\xe0!\x0f\xec\xf3\x00\xbf\xc6zp\xc0\x03\
-\xfc\x22\xf0\x01\xbf\x08|\xf03\x1e\xf8\x98\x07~\xce\x03\
-\xfc\xc2\xe6\xc1\xa7<\xc0O\x90\x0f\xf8\x09\xf2\xc1\xaf\xe2\
-C\xf1k\x9e\xfe\x1b\x1e\xf8w\x1e\xf8-\x0fp\x09\xcf\
-\x83\xdf\xf3@\xfct\xf8 ~:|\x10?\x1d>\xf8\
-s<\xea/\x1c\xf0_Y`\xef\x15\x1ex\x95\x07\xe2\
-4a/N\x13\xf6\xe24a/N\x13\xf6\xe24a\
-/N\x13\xf6\xee\xc7\xa38e\xd8\xdb\x89\xa7\xef\xc6\xa3\
-\xde\xe2E\xf8\x8d\xf3\x9eI\x0f\xf6\xde\x89\xe3\xe9\x9eI\
-\x12\xf6,\xfa\x03{\xa6\xfe\xc0\xde\xb7\xcd\x88\xefXJ\
-Y\xf4\x07\xf6,\xf2\xa8=\x8b<j\xcf\x22\x8f\xda\xb3\
-\xc8\xa3\xf6Ly\xd4\x9e)\x8f\xda\xfb\xc0R\xeaCK\
-\x9c))\xde3%\xc5{?\xb2\x94\xb2\x90\x83\xbd\x9f\
-\xc4'\x89S\x83\xbd\x07\xf1tN\x13\xf6\x1e\xc6\xd3\xf7\
-\xe3Q\x8f\xe2Q\x07\xf1\xa8\xc3x\xd4Q<\xeag\xf1\
-\xa8\x8f\xe3Q\x16\xb9\xd4\x9eE.\xb5\xf7i\xbc\xe8/\
-\xe2Q\xbf\x8cG\xc5i\xcc^\x5cH\xb5\xf7\x9bxT\
-\x5c\xba\xbc\x17\x97R\xed\xc5\xa5T{q)\xd5^\x9c\
-\x0e\xed\xc5\xe9\xd0^\x9c\x0e\xed\xc5\xe9\xd0\x1e\xa7C{\
-\x7f}\x5cN\xd3\xa2\xb2\xfaec7\xb7\xb6\xcc\xe3<\
-=\x96\xe8\xea\xf2y+^\xb8\xdb\x9bkM32\xa6\
-\x1aI/>\x9cS\xda\x81\xba\xaf\xcf\xd2PT\x10\xc8\
-\xd8\xe3\xb3\xd9\xa4\xf8lt;\xf9_\xd6{\xc5\xf7\xf6\
-\xf8L\xbf\xa1\xb7\x97\xebS<e\xaa\x14\x88\xf6?\xc5\
-K\xf4\xf1@F\x0b\x5cT\x81!\xcf9}\xda\x0e\xeb\
-4/\x91\xe7\x81\x0b>+~\xe1\xa2\xbd\xb8\xcfK\x5c\
-\xe4%\xfe/\xae\x92\xb1\x15\xd3o8\xe9 ?\x96r\
-\xc4I\x17k\xf4D\xe3\xcbv6\xfa\xd8r\x89\xf5\xf1\
-\x9bF\xdc\xe3\xc8EL\x05\xf6/\x9d\x88\xe9\xef\xdfd\
-4\xe0\xa4=4\x1f\xb3|\xd9\xa6\xf5]M\x11\xe5]\
-M\x11\xe5\xddC-t\xa4\x85>\xd6B?\xd7B\x9a\
-\xbe\xc6\xbb\x9fj\xa1_h\xa1_jjl\xbf\xd6B\
-\xff\xae\x85~\xab\x85~\xa7\x85\xfe\xa4\x85\xfe\xa2)\xc3\
-i\xaa\x97\xef\xbd\xaa\x85\xbe\xa6\x854e\xbf\xf74e\
-\xbf\xf74e\xbf\xf7\xeei\xa1\xfbZh[\x0b\xbd\xa5\
-\x85\xbe\xae\x854M\xc9\xf7\xde\xd1B\x9a\xce\xe3{\x9a\
-\xce\xe3{\x0f\xc3\xd0\xc9e\xdc\xdas\x9b/\x9d\xd4\xe9\
-\xfe\xeb\xfa\xd3\x92\x1fp\x0a\xfe\xd9\xfd\x0f\xf4 W\xfd\
-\xb9\xcfU\x7f\xee\xff,\xf68\xe4\xe3X\xcc'\xb1\x98\
-Oc1\xbf\x88\xc5\xfc2\x16\xf3+-&\xdaT?\
-\xbb\xff\xaa\xa9\x05(\xf5\xe9\xefk:W\xf7w\xb8\xb6\
-1?\x8e\xdd\xe7\xc7\xb1\xfbok\x854}\xd9\xfb\xfc\
-\x16\xfc>\x97\x16\xdc\xe7\x02\x82\xfb\xfc\xc4}\x9f\x9f\xb8\
-\xef\xf3\x13\xf7}~\xe2\xbe\xaf-\xb4\xfb\xfc\xc8}\xff\
-\x0fZ\x12\xd7\xa8\xb8\xffg-\xf0wm\xcd\xdf\xe7l\
-\xed\xfd\xbf\xf2\xa4m~\xa4\xde\xfe\x9a\x16\xf8;?\xfb\
-o\xbf\xce\x03\x5c\x19y\x9b+#o\xf3\x03\xf16\x1f\
-\xe8m\xaeo\xbe\xcdG}\xfbm-\xa0W\xfb\x8e\x16\
-\xd0\xd3\xb8\xaa\xf36Wu\xde\xfe6\x0f|\x87\x07\xbe\
-\xcb\x03\xef\xf2\xc0{<\xc0Ux\xb7\xdf\xe7\x81\xef\xf3\
-\xc0\x07<\xc0\xd5\xdb\xb7\xb9\xce\xc46\xc7\x96m\xae$\
-\xbd\xcd\xcf\x99\xdb\x0f\xb5\x80\xdeW.j\xda\xe6\xa2\xa6\
-\xed\x03M\xe7\x5c/u\xa4\x07\xb9\xb8i\x9b\x8b\x9b\xb6\
-\xb9\xb8i\x9b\x8b\x9b\xb6\xb9\xb8i\x9b\x8b\x9b\xb6\xb9\xb8\
-i\xfbW<\xc0\xd1~\x9b\xa3\xfd6G\xfbm\x8e\xf6\
-\xdbZC9\xd6okz\xfd\x1c\xcf\xb79^o\xff\
-U\x0bh\x1d\xdf\xe1R\xa4\x9dW5\x85\xfb\xcf^\xd3\
-\x94\xe4_3\xc2\x1c\xedw\xf8\xcb\x81\x1d.!\xde\xe1\
-h\xbf\xc3\xd1~\x87\xa3\xfd\x8e\xb69\xedh\x9b\xd3\x0e\
-\xc7\xf4\x1d\x1d\xd3w\xbe\xa1\x05\xf4\xb4\xefkP~\xa0\
-\x85>\xd0B\x1fj\xa1\x1fj\xa1\x8f\xb4\xd0\x8f\xb4\xd0\
-\x8f\xb5\x10\xc7\xd2\x1d\x8e\x96;\x1c\x13w\xb8\xd0s\x87\
-\x0b=w8\x16\xeep,\xdc\xe1X\xb8\xc3\xb1p\x87\
-c\xe1\x0e\xc7\xc2\x1d\x8e\x85;\x1c\x0bw8\x16\xeep\
-,\xdc\xe1X\xb8\xc3\xb1pG\x1bY\x8e\x85;\x1a\xed\
-\xdd\xf9\xa3\x16\xd2\xb8\xa1\x1d\xed\xa1\xc0\xce_8\xb9\xdd\
-\xd1\x88\xef\xae\xc6\xd5\xecj|\xcc\xee\x8e\x16\xda\xd5B\
-\x1a\x1a\xed\xf2MkWcqv5\x16g\x97c\xd1\
-.'\x9e\xbb\xda\xf3\x9f]\xed\xa1\xc8.'\x9f\xbb\x9c\
-|\xeer\xf2\xb9\xcb\xc9\xe7.'\x9f\xbb\x9c|\xeer\
-\xf2\xb9\xfb\x03\x1e\xe0\xb4t\x97\xd3\xd2]NKw9\
--\xdd\xe5\xcfrv\xf9\xb3\x9c]New9\x95\xdd\
-\xe5\xbb\xf5.\x97\xe3\xedr\xcc\xde\xe5\x98\xbd\xab=Q\
-\xe1h\xbe\xcb\xd1|\x97\xa3\xf9.G\xf3]\x8e\xe6\xbb\
-\x1c\x99w9\xfe\xeer\xfc\xdd\xe5\xf8\xbb\xcb\xf1w\x97\
-\xe3\xef.\xc7\xdf]\x8e\xbf\xbb\x1c\x7fw\xb92\xe6.\
-g\x1dv9}\xdd\xe5\xf4u\x97\xd3\xd7\xdd\xc7\x16\x87\
-i\xcf\xab\xbft\x1c\xf0\xc3WN\xa6.\xf3\xf05\xae\
-\xf0\xf5\xf0\x0d-tO\x0bmk\xa1]-\xf4u-\
-\xf4\x8e\x16\xfa\xa6\x16\xfa\xb6\x16\xfa\xae\x16z\x8f\x87\xf6\
-\xffd\xd7\xb4:q\x0f_\xd7\xb4\xd3\x1e\xbe\xa9\x07\xef\
-\xeb\xc1\x1d=\xf8\x96\x1e|[\x0f~C\x0f~K\x0f\
-~G\x0f\xbe\xab\x07\xbf\xa7\x05\xf7\xff\xcc\xd4\xc7\xa2#\
-\xc0\xc3W9\x81}\xf85-\xf4\xbe\x16\xfa\xbe\x16\xfa\
-\x81\x16\xfa@\x0b}\xa8\x85~\xa8\x85>\xd2B\xda\xd1\
-\xfe\xa1v\xb4\x7f\xf8\x13-\xf4S-\xf4@\x0b\xedi\
-\xa1\x87Zh_\x0b=\xd2B\x07ZH\x13%<\xd4\
-D\x09\x0f\x7f\xa6\x854\xc1\xc2CM\xb0\xf0P\x13,\
-<\xd4\x04\x0b\x0f\xb5C\xc6\xc3_j\xa1_i\xa1_\
-k\xa1\xdfh!M\xe8\xf0P\x13:<\xd4\xceB\x0f\
-\xb5\xf7x\x0f\xb5\x0d\xf9\xa1\xb6!?\xd46\xe4\x87\xda\
-\x86\xfcP\x13V<\xd4^\xc6\xeds>q\x9f\xf3\x89\
-\xfb\x1a&\xed\xbf\xa6\x8541\xc6\xbe&\xc6\xd8\xd7\xc4\
-\x18\xfb\xda\x86\xbf\xaf\x891\xf6\xb75\x98;ZhW\
-\x0b\xbd\xa5\x85\xbe\xae\x85\xf8Yj\xff\x1d-\xa0\xb1\x8d\
-\xfb\xdf\xd0\x02z\x1a\xe7\x0d\xf69;\xbc\xcf\x0fV\xfb\
-\x9c3\xd8\xe7\x9c\xc1\xbe&L\xd9\xd7\x84)\xfb\xdf\xd3\
-\xda\xab\xad\xc9}m\x15\xeek\xabp_[\x85\xfb\x9c\
-'\xd8\xd7\x16\xe1\xbe\xb6\x08\xf79W\xb0\xaf\xbd\xab\xdf\
-\xe7l\xc1>g\x0b\xf69[\xb0\xcf\xd9\x82}m\xfd\
-\xedk\xebo_[\x7f\xfb\xda\xfa\xdb\xd7\xd6\xdf\xbe\xb6\
-\xfe\xf6\xb5\xf5\xb7\xaf\xad\xbf}m\xfd\xedk\xebo_\
-[\x7f\xfb\xda\xfa\xdb\xd7\xd6\xdf>g%\xf6\xb5G\xae\
-\xfb\xda\xf2\xdb\xd7\x96\xdf\xfe\xef4 \xbf\xd7B\x7f\xd0\
-B\x7f\xd4B\xda\x12\xdb\xff\xebcK\xcfLS._\
-:\xe6\xe1\x113f\xf2\xe8\x0d\xf6}\x8f}\xdfg\xdf\
-\xdb\xec{\x87}\xefj2-\xb4\xbe\xf1\xe8-S\xf0\
-\xf5\xe8\xeb\xf1Lo\xc7\xa3\xde\x89G1#1\x8f\x98\
-\x91\x98G\xdfb\xdf\xdff\xdf\xdfa\xdf\xdf\x8d\x83{\
-7\x1e\xf5^<\xea{\xf1\xa8\xf7\xe3Q\xdf\x8fG\xfd\
- \x1e\xf5A,\xea\xe8OQ\x1b\x8f\xfe*\xbf\x19#\
-\xf0H#\x17\x8f\xb4M\xfb\x91F/\x1ei\xf4\xe2\x91\
-\xb6i?\xd2\x08\xc6\xa3\x9fj\xa1\x07ZhO\x0b=\
-\xd4B\x9aE\x83G\x9aE\x83G\x9aE\x83G\x9aE\
-\x83GGZ\xe8gZ\xe8c-\xf4s-\xf4\xa9\x16\
-\xfa\x85\x16\xd2\xe4\xff\x8f\xb4\xe7\xef\x8f\xb4\xdb\x80G\x1a\
-\x9dx\xa4\xd1\x89G\x1a\x9dx\xa4m\xd3\x8f\xb4m\xfa\
-\x91\xb6M?\xd2\xb6\xe9G\xda6\xfdH\xdb\xa6\x1fi\
-4\xe4@\xbbS8\xd0\xee\x14\x0e\xb4;\x85\x03\xed)\
-\xfe\x81\xb65\x1fh[\xf3\x81\xb65\x1fh[\xf3\x81\
-\xb65\x1fh'\xf3\x03\xedd~\xa0\x9d\xcc\x0f\xb4\x93\
-\xf9\x81&\xe09\xd0\x8e\xe6\x07\xda\xd1\xfc\xe0\x1bZ\xe8\
-\x9bZH;\x9c\x1fh\x87\xf3\x03M*}\xa0Yq\
-8\xd06\xe1\x03m\x13>\xd0\xac8\x1c\xf0\x13\xfa\x81\
-&O:\xd0\xe4I\x07\x9a<\xe9@\x93'\x1dh\xf2\
-\xa4\x03M\x9et\xa0\xc9\x93\x0e4y\xd2\x81\xb6\xc4\x0e\
-\xb4%v\xa0-\xb1\x03m\x89\x1d\xf0m\xf9\x80\x9f\xd6\
-\x0f\xf8i\xfd\x80\x9f\xd6\x0f\xf8i\xfd\x80\x9f\xd6\x0f\xf8\
-i\xfd\x80\x9f\xd6\x0f\xb8P\xea\x80\x0b\xa5\x0e\xf89\xfe\
-@[e\x07\xda*;\xe0\xc7\xfa\x03\xbe\x17\x1f\xf0c\
-\xfd\x01?\xd6\x1f\xf0c\xfd\x01\xe7\xce\x0e\xf8\xb1\xfe\x80\
-\x1f\xeb\x0f\xf8\xb1\xfe\x80\x1f\xeb\x0f\xfe\xac\x054n\xef\
-\xe0/Z@O\xe3B\xd5C\xce\x1d\x1fr\xee\xf8\x90\
-_\x1c\x1cr\xb3%\x87\x5c~z\xc8\xe5\xa7\x87\xfc\x0e\
-\xe1\x90\xdf!\x1cr\xc9\xea!\x97\xac\x1er\xc9\xea!\
-\x97\xac\x1e\xf2\x0b\x85C.\x11;\xe4\x1c\xf1!\xe7\x88\
-\x0f9\x0b|\xc8y\xdeC\xce\xf3\x1er\x9e\xf7\x90\xf3\
-\xbc\x87\x9c\xe7=\xe4\xd2\xb0C.\x0d;\xe4\xd2\xb0C\
-\xbe\xd6\x0e\xb94\xec\x90K\xc3\x0e\xb94\xec\x90K\xc3\
-\x0e9\xe7{\xc8\xa5a\x87\x5c\x1av\xf8c-\xa0\xcd\
-\xea\xe1O\xb4\x80\x9e\xc6\x99\xe2C\xce\x14\x1fr\xa6\xf8\
-\x90\xaf\xbeC\xbe\xfa\x0e\xf9\xea;\xe4\xab\xef\x90\xaf\xbe\
-C\xbe\xfa\x0e\xf9\xea;\xe4\xab\xef\x90\xaf\xbe\xc3O\xf4\
-\xa6~\xaa\x07\xb9X\xf8\x90\x8b\xd5\x0e\xf9\xfa;\xe4\xeb\
-\xef\x90\xaf\xbfC\xbe\xfe\x0e\xf9\xfa;\xd4\xea\xe1\xeb\xef\
-\x90\xaf\xbfC\xbe\xfe\x0e\xf9\xfa;\xe4\xeb\xef\x90/\xb8\
-C\xbe\xc2\x8e\xf8\x0a;\xe2+\xec\x88\xaf\xb0#\xbe\xc2\
-\x8e\xf8\x0a;\xe2+\xec\x88\xaf\xb0#\xbe\xc2\x8e\xf8\x0a\
-;\xe2+\xec\x88\xaf\xb0#\xbe\xc2\x8e\xf8\x0a;\xe2+\
-\xec\x88\xaf\xb0#\xbe\xc2\x8e\xf8\x0a;\xe2+\xec\x88\xaf\
-\xb0#\xbe\xc2\x8e\xf8\x0a;\xe2+\xec\x88\xaf\xb0#\xbe\
-\xc2\x8e\xf8\x0a;\xe2+\xec\x88\xaf\xb0#\xbe\xc2\x8e\xf8\
-\x0a;\xe2+\xec\x88\xaf\xb0#\xbe\xc2\x8e\xf8\x0a;\xe2\
-+\xec\x88/\xa9#\xbe\x86\x8e\xf8\x1a:\xe2k\xe8\x88\
-\xaf\xa1#\xbe\x86\x8e\xf8\x1a:\xe2k\xe8\x88\xaf\xa1#\
-\xbe\x86\x8e\xf8\x1a:\xe2k\xe8\x88\xaf\xa1#\xbe\x83\x1d\
-\xf1\x1d\xec\x88\xaf\x9f#\xbe~\x8e\xf8\xfa9\xd2\x98\xc4\
-#\x8dI<\xd2\x98\xc4#\xbe\x84\x8e\xf8\x12:\xe2K\
-\xe8\x88/\xa1#\x8dA<\xd2X\xc2\xa3\xe8*\xe5q\
-42\xbf\x94b\xe8HJ\xfb\xda\x0ft\x1b4\xaf}\
-\xf0\x05\xe8@1\x03\xb8_\xba\x1e\xff\xed\xd3H\x81\xe4\
-o\xbf\xd6M6\xfe\xees\xf4\xdd\xb4\xa7\xdcm\xc7\xaf\
-\xdc\xbc\xe4\xa1q\x7fo\xec_\xc6\x9e\xf7\xc6\xd1\xdc\xdd\
-\xd8\xf8\xb3\xde\xd4u\xf8\x9c\xf0\xae\xdf\x9c\xbdqs\xd6\
-\x9b\xbc\x06\x7f\xc5\xf8<71=3y\xfd\x9a\xef\x0c\
-d\xcfe\x87\x1co\xe2\xf9\xd9\x89k\x14\x13V\xb5\xde\
-\x0ajM\x80\xed]\x9d\xf0\xc3d\xf2\xae6q\x17\xbd\
-|\xf8\x9bw\x83\x06f\xc8K mofbvv\
-\xf2\xda33>4G\xb9c\x83\xf6\xae\xce\x04-\xe8\
-\xd6R\xd3\x1b\xbf~\xed\xe9\xc9g\xfc\xcder\x8c<\
-\x94S>\x877\xd7\xf3\x83\xd9!o#?\xe4\xcd\x0b\
-\xc7T\xfd\xde\xbc\xf4\x88\xf5\xc4\xd8\xd9\xcb\x8e\xb7,\xfd\
-U\xf5\x0f\xa1\x13(\xe5-\xeb\x89\xe1\xc11\xa8w~\
-\xb5\xd5\x82v\x00\x94\xccY\x00\x92\x19\xf4\xd6\xe0s\xa0\
-\xed-\x16KA\xb96Y[\xc8g\x07(P_m\
-Q(7D\xc1\xcb\x01\xba\xc5\x1a\xca\xa9\xb4\x99V\xb1\
-\xd1\xca\xa3af\x19!2\xf4\x0f\x05\x83\x1eY\xdbj\
-\xc2\xdcg\xe5\x10\xbdx\x05{\xf1\xe2\xd3\xd8\x03\x07\xe2\
-\xe7\xeb\x8dR\xd0\xc84\x8a\xa5\xf2j\xd3\xc9;\xd9\x81\
-!2\xb8\x9dY\x0b\xe6\xef\x94[\x99\xc4\xf4j\xfd\xe5\
-\xe4\xc4;\xcb\xadj%1y\xbe\xbe\x9ei.\x17K\
-\xf55\x88\xcc\xad\xac\xa7\xf0?\x1c\xa3\x14\x0d\x0d\xaf\xfc\
-\xb8\x8c\xa2\x15\xc7\xe5R\xcd\xe9\x9cO4\x17f\x0bb\
-\x9a\xf5J\xb9\x94\xc2YL\xf5\xa4\x84\x9b\x96\x22\xfa}\
-7\x9c\x92e\x84O)\xbc\xfb!\xd7my\xa78\x0f\
-EW[\x01Lp4\xe6\xe8\xd9\xef\xc5K4\xdf)\
-c\x22H\x1f\xd4\xa1UjB\xf0\x16V\x1bMD\x98\
-\x95z\xb9F\xd6\xd2\x12jW\x0d\x1f`\x0d\x1f\x1b\xa3\
-\x81\xd6'\xe0\x0c\xa2a\xe2\xd4\xcaT\xdb\xc4\xca$\xfb\
-\xb4\x8a\xc4\xc5z\xad\x95Y,V\xcb\x95\x0d\x88;5\
-^_m\x94\x83F\xeaZ\xb0v\xca\x93\x01\x95\x0b\x1d\
-\xa3A\x9e\xf3+\xc25<\xad\x89\xa7s\xf8\xbf\x13\x8d\
-Z\x0a}\xea\xc2\xd0\x85\xa3\x22\x87\xc3\x89\x1c\xd1e\x08\
-\xbc\x83\xebq\xcc6\xc3\x961\x1a\xa4\xde\xd0\xf0*\x07\
-q9o\xa5X\x12\xde\xd8\xb0\xaf\xbc\x8d\xac9y\xa2\
-\x0f\xd0\x1e\xd9\xa5\xb5\xe5r+\xe8a\xb8c\x99\xa6\xf1\
-\xf1q\x96\xa3#`\xd5[k\xef\x0c8\xed\xb67\xf1\
-\x1c\x10r\xff\xeaD\x96\xe8\x9e\xbf\x89\x1ei/\xdd\x9c\
-\x9d\xbd~\x0d\xbaC\xce\xedeh\x00H\xe5\xb5\x9b\xcf\
-N\xdc\xce\xa3\x13\xbcg\x83\x0d\xc7\xc3\xc0\xe6\xf4\xc4\xec\
-\xcd\xe9k\xf9\xfeAobf|\xec\xc6D~\xe0\x9c\
-'\xec\xf7\x0f\x0ex\x08-?x\xce\xbby#?8\
-,\xc0\xe5\x07\xcf{\x97\xaf\xdf\xba\x06\x84\xa8\xed]\xad\
-\xaf6\x03Xh\xcc\x11Z\x80\xed\x08]\x9aP\xf3\xb2\
-W\x8a\xb5R%h\x884\xcf\x09K9\xe4\xd7\xc4\x95\
-pVWN\x0e\x05=\x18s\x18U\x18\xc2\x93C\xc1\
-R:\x1c\xda\x02N\x0c\x87\x10C\x87\xb3\xdaz\x0c0\
-\xab\xad\x10\xcax\xa5\xbcp\xe7D \xa8DX\xfe\xf2\
-|\xe5\xe4 T\xa1\xa8/\xb0DO\xd6\x08X\xff\xc1\
-z\x0b\xcb\x85@d\x16\x03\x8eGl\x0c\xfa\x95$w\
-Z\xc8\x22\x10\x1b\x82\xa6\x1a\xa4\xb3TW\xab\xe9i\xf4\
-\x1c(\xdb@\x86\xeb\x80q\xf1\x05\x131\x87`\xb2\x10\
-\x9e\xbc\x5cP~\x8a(\xe3\xd6\x96(\xe0\xaf\x95k\x80\
-xYQ\xda\xa3\x9fl\xb9\xc9Z\xebkMG\xf7o\
-\xd8<\x009\x87\x1f\x85\xd1\xf0K\xb6\x9e\x1a\x9e\xd7Y\
-\x90\x7f\xad\xd7\xab\xa3\xf1(9F\xb4Pc}\xcf\xdf\
-\xad\x03\xa1\x80%E\xddK\x1a\xebc;\xd3\xdb+\xd2\
-\xd0\x9a\x1e\xfeJ\xff\x89\xa3\xb6\xc8\xb4\x9b\x17\xd1\x028\
-\xb9\x8e\xf2{\xfa\xe5\xa84[\xf5\x95\x1b\x8d\xfaJq\
-\x89\x0c\x88\xf4\xf6Z\xa3\xd3j\x10\x17\xd0\x05}\xe5\xd2\
-\xea<p\x8b~O\xce\xf5\xd0\x83#P\x19\x0bq\x90\
-\x93}\xfc\xc4\xdc\x096\xd0k\x1dL\x82\x98y\xa0W\
-Y\x22M\xbd\xbd\x22\x82M\x95\x1aP\xb9j\xa2\x04[\
-\xe5\xdeb\xbd\xb1 =\xf6\x02\xbeY\xb0\x07g\xdcG\
-T\x5c\x0a\x90\xa1%O\xe5\x90\x9a\xa6\xa6{\xcd\xe5\xfa\
-\x1a\xbalK\x0b\xa7h\x98O2\x94\x98\xa2\xd0v\x14\
-\xe2\xf3\xc0l\xba\xb6D\x98(G\xee\x01\x88e\x8a9\
-\xc5\xac\xd8\xf2\xad-\xd1Dw\x13H{\xb5Y\x16X\
-siuIM\xb06`[[r\xdc\xe4\xb0T\x82\
-bcFy\xdd\x86)\xba\x82\x9eSE4\xed7\xb3\
-\xe5*,U\x17;\x99\xa5M\x07\xa0\x86\xdf\x80\x0eH\
-\x0f!j\x01\x0b`^ H\xb1t\xd7+\x05xL\
-H\xc5\x13\xa2\x98Z\x1dYU_\xf9\xbb\xc3\x1d(\xe4\
-\xe1q\x14<\x5c\xe9\xdeb\x0d\x07\x13\x13\x89\x04\xe0\x87\
-\x22\x01\x97\xeb\xd5b\xb9\xd6\x81\x00@\xfe\x9e4f\xf6\
-\xc5q\x82\x0a\x8aRb\x80i\x1d\xbb4\x90\x00\x16\xa7\
-\x15\xfe\x13N\xb2\x81[Y\x08|\x8a\xc7\x83@\xf6i\
-\x18\xd2\xb43\x03\xb3\x94\xc2\x92\xa918\xde\xa0?G\
-L\x1c\x11\xb9\xb3\xb0\xd7W\x9b\xe8\x9f\x0b\xfdu\x22\xa8\
-\xacH\xc0jf\xcb\xadJ\xe0\x99\x19a\x22\x01k\x8c\
-\xacOS\xe4\xd6\x96h\xe2\x94\xa3\x97\xea\x97\xe0\xe9L\
-4\x87%\xcb\xb5\x95UD\xc4B\xe7\xea\x86\x0aY\xe0\
-\x92\xf0\xc4V\xf2{l\xa5#o\xc5\x13\xd2\xe90\x0d\
-E\x14\xdd\xf45\x80\x03\x85\x11\x96\xc6\x80\xe7\x8cr\x93\
-\x98\xdd\xe7y\xe5\xc0\x09@t\xcc\xbc\x01\xdc[\xd0`\
-\x00c^\xb2\xc7\xe5B\xb18\xc7\x1e1\xdc?\xea5\
-\xdb\x9d@\xe2\x18\x1a\x19\xd1\x1d6\xc6\xc3\x18\x8f\xe0\xd0\
-4\xea\xf5\x96rn\xe8\xab\x08\x9bk\xd6\xd1\xb4} \
-\xfa=K\x0d\xcb\xe5R)\xa8A\xa2\x9b\xef\x90\x9aS\
-\x0e\xb2M\x14$\xecS\xe7RG\xb8\xb7\x11\x83\x07\x08\
-\xa9J\xa7\x9dk\x00\xf6n\x00\xc7t\xa4 \xd8vX\
-\xa7b\xa2{{\xf1\x90{\x09\x9f\xa0\xc1*\x5c.6\
-#\x08\xae\x17\xd5v\xa3\xde\x94;\x91\xdb\x8e\xaf:h\
- ,M\x9f\xb9\xed\x93+>\x9e\xb5\xddV\xbe\x0dO\
-\xb8\x7f\xdb\xb2c\xbd\xb4\xa2)q:\xf8\xeaj\xb9\x11\
-\xa4\x9d9\x89(\x85\xd3\x81:\xfd7O\x87\xfe\xd4\x85\
-\xc9:[kmUx\x9c\x08\xc1\x1e\xc4\x83\xfef\xdb\
-m\xb7\xc9\x99\xfa]\x7f\x136\xba\xe0y\xb9O\xd2\xb7\
-\x87\x7fo\xb3\x98\xdb\xdeB\xa5\x0c\x01\x95K\x86d\xec\
-m-\xf6v[\xb1%J\x0a\x92\xfd\xbfW\x83\xd5 \
--\xe9\xa07\xa7sN4b\xb0\x1b\xb2]\xab\xa0\xa8\
-<\x1fG8\x08\x8cUZ\xc7\xecz\x1d\xf7;\xdc\x9b\
-\xfc\xcf\xb1\x9f!!\xc60Q\xf0.\x80]\x9d\x99\x9c\
-\xe8\x08\x103x\x9d\xb6\xc8\xde\xde\x9e0\xaa\xba2\xae\
-\x22\xc3F\xf4\xc0\xceY\xab\xb31\x81\xddSn\x94Y\
-!\x93\xe9Q\x8c\x05;'I\x5c\x0d\xdd\x80\xf6P\x81\
-9\x91O\x9e\xa0\x0a\x09`\xa2\xb3\x97\x84\xa2&\x1b\xc7\
- \xce\xab\xd0\x9c\xc2\xd6\xd8F.\x9f\xef\xd8\xdcS&\
-t\xa2Y\x5c,6\xcazG\xa0\x9fAKm\xcd\x8e\
-\xe4\x05\x80j\xb1]?\x1bTWZ\x1bi\xd7\xf1\x80\
-\x1b\x0b\xfd\x866U\x06\x1dB<\x9d\x17o\xa3\xd7\xeb\
-K\x97\xea\xebQ\xcb\xf0\x94\xean\xe2_\xcd{(4\
-\x17\x18\xc4\xc9\xea\x92\xd8\xf0\x97\xfd0\x22[_\x5c\xc4\
-\x1a\xeb+^\xc9\xa7r\x22\xe2\x0a\x1d\xbe3\xcb\xde\x1a\
-\x8f\xbd\x85\x0255|\x14/\x98\x0b\xb3\x16os-\
-\xbf\xe6-\xe7\x97\xbdR\xbe\x84\xe7abu\xb0Vb\
-t\xfc\xcd\xa4\xd3\x5ct\xe2\x08\x91\x08h\xfa\x02\xe6D\
-\xc2\x0e;3\x01\xd0\x10\xefe`\xe2\xc5\x22B\xa7\xca\
-\xbe\xc0\x01\xfc\x94\x92O\x85\x16\x8d\xa0Rl\x05\xa5Y\
-\xf4\x8f\x08,i]\xe6l\xd5\x8d|-\xca\x80+\x07\
-\x81\xf4\xf6\xb6\xea\xc0t!\xe1.7%\xde\x93\xf7W\
-Lt\x01\xc9\xe2)\xad\xba\xbb\xb5\x85\xd1\x92K\x85\x1d\
-\x92g\x8eb!\xa3+Z\x8e\x0c\x109\x13\xb51\xb6\
-j\xc0C\x06nTp\x8e\xd3\x01\x0d\x06\xf2\x80n^\
-D1>\x12b\xc5hZ\x09S\xe2A\xf8\xff\xcc\xc0\
-\x09f\xe0f-6\x03qv\xbe\xc3\xf0[\xe4\x22\x9f\
-o\xfc;\xf7\x02\x80\x86=P\xb4\x10\xe2D\xc3+\xc5\
-f\xeby\xdf\xd7vK`X\xc2\xb4\xdbz\xdam\x83\
-\x98r \xfa\x8e\xcbAh\x10\xbc\x13\xe2\xac\x17\xe5\x8c\
-\x06-,\x22\xbc\xd3\xc7\x87\x9f\xa2\x97\xc3\x18\x9f\xd1W\
-\xb5\xdb\xa7\xe7\xe4\xa0RfO\x81\x84=]\x5c>\xc8\
-\x11\x93\x1b\x82\xad\x15\xb2\xf6\xa8\x1a\xf3\x9cf$\x87\xc7\
-43^v\xd2\xd6?\xdc\xf6\xe2\xe2\x8b\xad\xad\x1e\x9b\
-L\x83\xd0r\xb3-\x8a\xc6X\x0c\x8d+\x05.\x03(\
-\xb9:VS\xc9\x19\x88`\x931?__\xd7\xd2q\
-\xd3\xa1t,\xe9E\xa7\xef\xcf\xc3\xaax\xa5u_\x0e\
-7]\xf0d\xd7\xbd\xd2\x86\x1e\xb3\xe1\x95Jz\x8c\xb8\
-\xf9\x19\x91\xa7\xf1K$\xe2\xa5MJ\x9c\xc9!{\x8e\
-\x1d|\xfd\xcd:Z\x1bmm\xe4s^\xb9\x94\x0f\xcf\
-`\x93\x97\xfb\x9c\x8c\xc0\x80\xf6\x88 cxF\xc1\xcb\
-1u}\x96vH\x00\xecm\xcar\xe2 ].y\
-!\xe1\x11/K\xd0\xbb\xcaf\xc2E\x81\xb8\x8e\xcay\
-B\xb0\x8dr\xed\xf0\xd6\x81(#\x9c\x1a\x1c\xc0\xf2\xb9\
-9UW\xe8\xff<\xef\xd8\xee\x8fNR\xb7\xed\x82\x03\
-6\xeb<\xe1\xdf\x8d\xf5t\x06\xe78\xbb\x9c)md\
-J\xa5L\x9aB\x1b[[9\xd7\xf5*\xc1b+\xca\
-WZ\x87\x0c}\x22\xc3\xba\xc8 \xfa\xa5rP\xcaZ\
-\xdf\xc0S\xa5uWuUK[\xee\xa3\x9f\x12f\xd9\
-p\xbdhJ\x16\xcb\x95\x16J\xe8\x8b\x95\x95\xe5bZ\
-\xc6\xc3\x04\xc2\xa0\x14`-\x0a\xb6.aV\xf8H\x18\
-S\xd4\xe7\x08\xae\xdd2\x9a\xec\x8e\xc39f\x00\x9d\x97\
-3\xc0\xce\x05\xebN\xbe\xff\x0b\x9cHq\xff\xa4O$\
-.\xa7<q\xa1\xf5\xda\x02\x09\x89i\xf8\xa8\x00-\x14\
-\xe8\x5c\x1eW\x18`\x9fl\xb36Er\x02J\xeb}\
-\xfaD\xf5\xc9\x95#\xc61\x0b\xb3\xd3\x15\x02d\xf4b\
-\xdd\xce\x18\xeb=\xef][\x18\xd3(\xc0?wD\xb4\
-\x14\x07\x13\xd6\xaaX\xd0\xd4!\x11\xe7\xcb\x1a\xb5\xa8\xb0\
-\x84\xc7\xf3W\x81a(\xd7\xa6q6\xf4R<\xc1\xc9\
-8}\xb1\xf2\x8b\xe5F\xb3E\xeckR=\x12^,\
-#\x8e\xb9\xef8\x89\xe9\x0d\xaaT\x0d\xaf>\x88k\xeb\
-\xb0l\x88\x7f^)6\x00\x8f\x91i\x01R\x84\xba\x04\
-\x97\x028O\x06b4(\x8b\xa0\xacp.\xe8\x94]\
-\xc0U\xf91'5\x02\x865\x0ad\x15\x96\xfa\x11\x96\
-\xca\xed\x91s\x920u2\xa8mB\xeef\x5c\x14y\
-\x8c$\xd2\x8cI\xd8z%\x13\x15m\xbe\xd1\xbe\xcbo\
-\xd4eS)\xef\xd3\x10\x1fq\x0c,3]\xdc\xc3&\
-*a&\xf6@H@\xb7\xb6\x92@f\xf4\x06\x00P\
-\xa3It\xeb\xafvk,kT\x15\x93\xc2\xb6\x106\
-\x1b\x12\xb5Xpi\x00\x9a\xae\xa7s\x9e\xf8,\xd7\xd2\
-\xfd\xf1|}\x8c\xa2A\x0f\xdd$H\x8b\x95:\xb0\xb5\
-\xfd\xc1\xe0S\xb1\x0c\xeei\x88f\xdb[x\xb8\x84]\
-]\xd2\xd3K\x1b\x93\xa54\xa7\x9d!\xd5\xed&\xb3$\
-\xb4\xeeH\xc2\xd2R\x0d\x8d\xb5,i-\x0a\xf2\xe2\x1b\
-\xe4\xc5\xe9\xe3=\xcd\xe5,=\xeds\x5c\xb50a\x09\
-$\xad\xd0\xe4\xf6$\x95\x90\x0d\xe2\xa4GD\xb9^\xbf\
-\x14Tj\x804\x01\xbe\x8c\xbb\x98\x1bM\xc2:}\x8e\
-\xf3\x92$\xb25\xcfO\xdb\x94\xe8\x86\xbd\x94MN\xc8\
-,R\xe3K\xf2\xd85l\xe2\xb1\xcbq\xde\xc2\x8aC\
-\xc3\xb1\x0c,\xd7M\xad7>&\x18\xabak+m\
-\xc4tb\xce\xb1B\x8dFP5[[l]\x0a:\
-\xa1Z\xd8\xe9v\xb4\xd3-\x97\xe4\x91i\x92\xb0\xa6\x84\
-\xfb\xacl((b\xc7\x82/\x8ed\xb6\xc4)\x22!\
-\x7fK\x1c\x22\x92\x8e\x9c\xe6\xac\xb5\xbd\x1bLHT\x0d\
-\x87\x81\x16\x120\x84\x10u!\x9b\xcb\x9d\x1dE\xc5\x1c\
-'_\x85#\xf9\xd3\xe5\xf5\xa0\x94\x1ep\xa1i\xc0\x0e\
--\x04\xe9\xd3/dGs}_9\xed9\x0e\xac/\
-R\xc4\x00Z0Y-.\x05M~\x10B\x02CW\
-3\xd6\xf3+\xac\x88t-XKQ97\xdbl,\
-\xf8\xfa\xd6\x081\xb8\x05\xcd^\xbf9~\x05\x05F\xb3\
-\xf5\xd5\x85e\x7f\x13\x8f\x8f\xc0p\x94\xa4\xf2\x15\xb2\xbb\
-\xa8veN/\xdd/\xd09\x04\xea\xb8\x5clA\x15\
-K\x02\xa5pT\xe6+\xb3\xc5\x15\x1f\xd23\x04\x9e\xce\
-\xa4\x17\xc4'\x01\xee\xed\x15\x81\xd5\x95\x91(\x03\xe6\xf7\
-T<^,\x080\xd0\x11\x11\xd9\x12\x93\xc3QW$\
-\xe0 x\x0c\xba\xc7\xeeB=\xfb\xcd/\xe0RP+\
-\x9d\xa8Wx\x80\x0f[\x97\xdc5Ok\xac\x12\xfdk\
-\xd8\xa5\xe7P8\xa4\xc5zlXr\xda\xa0\xd8\xfb\xe3\
-Y\xb4\x10\x00\xb7`F\x03\xbc\x84\x0b\xe5=\x18c\xd1\
-o\xa8&\x8a\xcce\xfbO\xd6\xc6\x135F\x13\xf8S\
-\xa5\xed\xf6\x08\xbf\xbe\x112\xdd\xf4&J\xc4\xa3F\xce\
-\x8bT\xb9\x0c\xf0\x9a<\xdc9\xd5\xc7\xd5:r\x1ep\
-LiNN\x0c\xfb\xb2@V*F\x8e\xb5\xa6\x02h\
-y\xda\x19\xce\xe6`'\xb5\x1el}\xe7Rq\xe1\x0e\
-*\x84\x16[(\x07\x0akX\xa0(\x84\xef\x19\xf7\xd3\
-a5X\xe9y\x95:V)/\xd50\xb5\x87\xda\xb2\
-\xb5\x85\x0d\xbe0\xec\xd1\xcfy\xc0pS\x80\xee\xf7\xc3\
-\xac\xcc\x90\xe0\xdb\xd2\xe5\x04\xa18\xde\xa8y\xa4\x88l\
-/S\xc7\xa4\x1b\x927U\xf9\x9f\xad\xd7\xbe\xba\x1a4\
-\xea\x0d{\x19\xf3\x06\x01\xcb\xa0\xd6\xac\x92@\xfbF\x0f\
-G\xf5Sc\xb9\xba\xe4\xa0\xbbH:<uu\x9a\xf3\
-\x80.\xe1\xd9\x19\x05\xa6\xf3\x95b\xed\x8e\xd3v\xf3\xd6\
-\xa3h\x12T\xfb\xb9R\xb6\xda\x1c\x03\x18\xfbHD/\
-\x18\x0d\xa1\xbf\xe63\xed9*)$)\x92\x88\x92t\
-\x13u\xa1\xa1\x02qi+n-\x85\xf6\xad#yX\
-q\x09\x00\xe4\xf9\xe9\xe9\xb1\xab\x13\xbeA\xbb\x97\x8b/\
-\x07\x8a&\x0b\xfd\xd59\xbb\xfaja\x04\xb3\xaavY\
-\xc42\xb8KHU;\xa7OO'\xd5\xb9>G\xd7\
-\xeeDps\x5c=\xb5\xe0\x8b(\x8bBj\x98d\xa8\
-\xa0\x86\xf11\xa5\xd3\x82\x1fj\x9d\x1a\xadY\x96\xad\x8d\
-\xc5S+\xdb#\xc6\xa5 \x8e\xf1t\xb0Tn\xb6\x90\
-\x0a\xe06\xb4\xbar\xa5^\xbf\x93v&j\xa5\x94\x18\
-v\xc0\x03\x98\xd895\xc6\x05o\xce\x097KGl\
-\xdb\x187C\xe3\xebH\x0dl>\xe6\x98\x8a\xf7\xc0\x90\
-\x19\xaa\x93\xb5d\x9b\x80\xcd\xc5\x8a\xc7\xe645\x1d\x14\
-K\x1b\x0ef\xe7Z\xe2\x12d\xf2\xed\xac(\x8d\xf7\xb3\
-\x05\xa6+~eu>r\x88\x89\xaa\xe1\x5c\x0d=\x0c\
-\x8c\x17+\x15T\x83\x0c#\xa6\xea\x0b\xc5J\xf9e\xba\
-N\x0f#\xaf+\xf9b\x183)\xf5\x1d\x12u\xd0\xf1\
-k|f\xc6\xab\x85:\xf9\xa6\xceyg4G\xd1\xa7\
-Z\x81\xa8u\xfd\x84B[J\xb0k\xf9Z\x15:\xa5\
-:\xac\x87\xd8\x0e\xe7\x8c5(\xb0\xda\xaa3\x0d\xe0\x98\
-Ph0\xd7\x1f\xa9\xa9fI\xd1:\xae\xd0\x0c\x84\x03\
-K\x09\xa1\x04\x90\x04\xa1\x8f\xbb&\xf5\x5c\x9d\x1aj\x9f\
-TB5]\xec\x05\x8fEr\x97)\x22A\x83X\x94\
->\xa88lB\x8d\x14eE\xb8\xd5(\xd6\x9a\xa8\xdf\
-B\xa5k\x81\xa9P\x1b\x81\xac\x90\xbb\x94LS\xf8`\
-\xe2)k\xd0\xf8\xc4\xf8\xb5FqE\x8bD][\xca\
--\x1aL\xe9\x1e\x0c\x5c\xb1\x15\xb6@[\xc3\xe5\x97\x05\
-X\xba3\xaeQ\xa4\xa6NnO?.I)\x97\xa3\
-N\xf9P\xa8\x5c>F\xff\x92\xd4\xda\x93\xf2\xc64\xdb\
-\x932Z\x94\xdb\xedY\x95\xacl\xa5Q_*\x97\xf2\
-\x97\x9f'j0\xab\xe6*{\xb5\xbc\xd0\xa87\xeb\x8b\
-\xc0(4\xea+\x02X\xfa\xfa\xe2\xe2\xf3\xfe\x80\x97\x82\
-\xdf\xdb\xf8;\x8e\x18\xea\x9fZj\x147Ny)\xb1\
-a\xdc\x0d\xfcS\xad\xc6jp\xcaE\x15f\x0d\xe7\xaf\
-\x03\xfe\x02\xbe&\xa0>I\x0ds$\x05\xcci\xa8\x9c\
-\xb4Yy\xeaAE.\xf7\xa4\xa3v6\x19\x92\xd8\x1e\
-)k\xe7\x18\x9e[\xd6\x18\xe1\x8c\xd3\x95,\xd1\xe8\x94\
-z<a\xd9\xa6\x93\xda\x1dn\xc2rW6A\x125\
-\x9c%\xac>\xd9H\x0d\x1c\xf3(\xe0\x1f1\x1c\xc82\
-<=653!\xf6\x11\xc1\xd6j\xaf\x92\xec\xbbS\
-l\xd3\xf0\xd2l\xeb\x97\x1a\xeb\xe6K\x1e\xf6xG\xe8\
-\xb2\x8b\xaa\xbb\xc8(.\xef\xd4\xcd\x7f\xa7\xec\xc4T\xb4\
-]\xc1\x96\xfc\xeb\xf5\xebW\x13\xb2\xe3L\xc5^\x10y\
-M\xa9\x90\x95Oz@\xd4\x84uU\xa9\xcc\x94_\x0e\
-\xf2\xfd\xc3\x1e\xd3\xf6\xed\xa0\xf2,\xce\x17=\xe9\x1el\
-NVU\x91\x1d\x9f\x9d\x9eR\xe7\x84\x85V\xa3\xf2l\
-\xb0\xe1nm\xa5c\xf9\xc6\xa6fU6\xa1\xd5o\xcd\
-5~\xf5\xb2\xcaU\x0dZ\xc5\xa4l3\xcb\xe5\xc5\xf0\
-j\xbc\x89\x01\x95\x13\xf3\x09\xb5\xe7\xad\xad\xe8\x9b\x1f\x94\
-\xf0\x9f][=\xbaT\x94\xaa\xe9\xa8T\x8db\x8d\xb0\
-^\xbaU\x96\x07-J\xc1\xf1\xe7\x85\x13\xd5\xd8\x19\xec\
-\xcb\xf5U8\xf5g:T\xb1\xb5%3=~3\xae\
-$k\x92\x88\x82\xd1\x9dy\x1c6\xb0\xdaV\xb0B\xb4\
-\x83\xb1v\xc8Rp\x8er\x9b\x0e\xba\xbcv\xd5\xdf\x11\
-u\x1f\x1bc\x96\xba\xd6v\x1eaZ\xc2qe\x04\xaa\
-\x00\xb7\xc8\x22\xd0\xa4\x86\xe8\xf5b\x19}\xc1\xc9(\xa9\
-2}u\x8d\x8b\x8d\xb3\xc3CO\x85\x85\xe4-=\x1d\
-:!\xe3r$\xa9\x0e\xcf\x9b\xf3\xf5\xd2\x86\xcc&\xf4\
-\x85\xbc\xd8aW\x9e\x8e\xb4\x5c\xee\x88s\xb7\xdc,\xc3\
-\x94;=~\xa8\xaep]\xf2Z\xe9\xb0\x05.\x9e\x82\
-T\xbd\xe5Z\xdal\x9a\xac\xf3*\xa0y\xd8\xbe\xa8#\
-\x10M\xa3P*\xdfM\xbc\xc9u\xe2\xfb\x8avqe\
-\xe4P\xdb\xa9W\xafU\xc3'6\x0c\x0f\xda\xc8\x86'\
-\x94u\xf4\xdb<Q@\xdd\xdf\xd1p\x94+H\xf9\x1d\
-\xa1H\x0a\xfc\x02\xf4\x96\x88\x96\x81\xb2M\xe0\xb5\x03\xed\
-~\xed\x98\x8bK+w\x86W\xaax\xa9\x8a+\xc0\x87\
-!\x22y\x09\xc9\x8a\x856\x00\xc63\xf97q\xc2\x00\
-\x9c\xb2F\xd1#\x84\xadI\x97R\x90W.\xa5\x8e\xd9\
-H\x8e\x0ay\xe5\xc5\x15\xec\x97D\x9dQ\x0b\x19\x1d\xa6\
-\xca\x9b/3:\xedT\xf5\xf7JjH\x95V{p\
-Kt\x82i\xaemmQ\x0cCl\xd2p_\xcb\xf8\
-\xc1-\xc0 \xfa\xa1\x1c\xea\xf2p\x9d2\xf9W\xd7H\
-\xe0i\xa4\x09\xf4\xf3\xaf.\x8bD!\x13n\x96\x91\xa5\
-[Qr\x17q\x8a\x01\x86|\xa5;\x1c\x8c\x18\x91D\
-\x1csGp\x0e\xb4\x11D\xf8\xd48\xb7\x0d\xfd\x09\x1b\
-\xf2\xaf\x93\xc8\xa6\xf0V,\xdc\x01b@\x0d\xc1\xe1\x94\
-m\xd1\x96\xb3\xa7d#\xa6\xb8\xc33\x9b:+\xc0Y\
-\xd4\x1aN\x22W\x91\xddI\xbc\xa0\xf4\xa2\xd4\x97\xa9;\
-\xa6h\xc2\xca\xef\x16\xe6B&\xad\x80\x10|\xd9w\xd2\
-\x1f\x0e\xb5Y\x88\xe2kZ,@\x0f\x91\x9c\x8c\xf0\xed\
-\x06GR\x97\xcc\x84\xd1\xb8<E\x14\xc3\x0c\xd1]q\
-\x83\xfc\xf2\x95\x18\xe2\xb0\xfb\xe5\x97oQ\xaaX\x84\x9a\
-\xde\xe5\xc5\xab\xcbV\xa0\x0a\xd7\x12\xe1\x09Z\x112<\
-q\xf8\x84\xd0\x17\xaf\xae\xe9\xe0\xd7\x92\xd0\xdc\xe8\x8c\x15\
-\xbc\xbc\x98\xb5\x88\xb0\xe25(R\x0e\xe3,\x9b\xec&\
-\xb51\xb8\xd5\xdbkFf\x82[\x17\xb0\xed\xb1\x01\xa3\
-\x04c\xcc\xd4\xe1\xdd\x0fw\x1b\xd9R\xd5H\xcaL\xed\
-p\xed\xab\x17\xe7\x1a\x82\xfaX0\x12\x22\xea\x96\xcb?\
-\xca(\xfaj\x92\x9aX6R \x00\xa2\xd8\x0c\x9e\xc6\
-\x932o:&\xb9}\x0c\xc2\x14D\xc4\x00\xc0q$\
-\xa1<\xa4h\xc5g\xeb+|\x98E\xa6h\xd3A5\
-\x86cX$I\xff\xb3\x92*\x916\x15\xa3J\xa8\x04\
-Dwh&\x99\x1e\x8d\xd3\xedF@/\x90\x15\xd1\xc6\
-\x80\x87O2\x14\x84V\xab\xb8 \x8e\x06\xa3\xec;\xed\
-\xd4k\x96\x92n^,G\x95\xa8\xee\xf2T\xd83\xc2\
->/K\xb25!S\x13\x8f.\xe6\x1c\xa4\x02)\xec\
-sPr\xe4=#\x1dx\x94\x12\xa2\xa7\x90'b\x0a\
-#,\xdad\xa3+wc_\xc8?hGz\xfe6\
-\xaf\x1d\x98\xc3u\xff\xf9\xdb\xd9uo\x03\x7f6\xbc[\
-b\x99Uo\x8d\xd8\xc0\x08\x10\xa5u?s+\xc38\
-\x9dtl\x89\xdcrO\x0f\xb8\xa8:G\xd0n\x8f\x18\
-h\xc5\xd8\xb8u\xaf?\x97Ywc\x8b\x1e\xf1*\xca\
-\xb5\x81\xb96d.:\x99\x18\x14Q\x9c=\xb2p\xde\
-\xbau%\xed\xa2\xf6\x08v/v\x89E\x99\xd44\xf4\
-\xf6jA\xfen\x14\xc9u\x92\xb6\x81\x85_s#\xd6\
-\xa4\x9bBj\x87\x80\xc1\xdf\xf0\xa9\x0d\x90\xfb\xf9\xdbi\
-\xe2?\xea\xf3/\x898\x9dU\xc64d\x148\xd7\xaa\
-\x8a\x86\x5c+\x94u\xddM\xb5L\x04\x8d|Q\xb0<\
->\xa4)\x04`Ub\x89\x91\xf5\x8d\xeczF\xa0\x01\
-|nd\x04*\xb0\x8c\xe2\xea\x872{\xd6\xcc\xea\xb5\
-RXu4\xd5\x19, &NO\xc5\x19\xc6\xc4\x8d\
-\xe4Y\x1de\xf7\x99\xd1\xfcz97\xcfg\x1b\xda\xd1\
-\xf6\xe8\xdb\xbc\x02~\xbcY\xc1a\x96%\xd9`&-\
-(\x80\xed[G|k+\xe9 \xc2R\x90\xdd\x19\xd1\
-\xeb\x10\x94\x1brHp\x8cp\xeb\x19\xd5~\xcc\x8eD\
-\xb1\x83\x90\x84!\xcf<6(\xd1\xe2\x06~^\xc3\xb9\
-h4q\xe27\xf1\x91\x1d\x22'\xfc\xc7\xd8\xe8\x11=\
-\xd8\xdb\x0b\xe1\x1ev\x1d\x88\x1d\xec\xed\x0d\xb1\xd6O\xc0\
-\xda\x11\xd7\x02Z!\xd5\xfcKt\xcd\xaf\x0a\xe4\xa37\
--x\xd5\xb0\xda\x0aJt\x871\xaa\xb7W\x966s\
-Qb\xb8/\xb7\xf3\xb6B\xf8\x9d]Xm`K\xa8\
-\xd0\xd6\xd6f$\x86W}i30^\xb8J\x0c\x80\
-\xf4\x9a\x14i>\x9e\xd5k\xf9~\x0f\x88zy\xb5\x9a\
-\x1f\xc0\x0d\x04\x0eb\x83m\xc1\xaa\xfaI\x9d\xb2\xb6?\
-oi\xa0\x90\xf6\xe1&}K2\xbd\x22\x06\xf6\xdd[\
-J\xe2\xb8\xee\xf3{\xbc0/P\x7f\x1e\xafJ\xc8\x09\
-\xd8\x5c\xcfC9\xe8\xc3\xdczaT\xfe\xe6i\xcf\x9f\
-\x84-\x11\xf8\x96\x8d\xfc\x86H\xdf\x90\xe9\x1b,}\x03\
-5)\x88\xd8D#\x83\xc4\x8cFf\xdd\xcfA\xdd9\
-$z#\x0a\xbf \x91\x90J\xec'7\x08\x1dF\xdc\
-\xf5>?\x8a\xc4\x86{\x0aa\xb4|\x08DP\xf58\
-'\x18q\xf1\xb6k\xcc\xe4\xaa7x\xd5\xf8H\xc9Z\
-\xb3D\xb7\xee+\x87:qdq\xf4H\xdd\xd1j\x9f\
-\xe2q6#\xa4_\xe1\x08\xe3\x95\x16\x8ap\xe2B\x1e\
-l\x11\xeaJ\x94\x81\x97\x9a\x01\x84\x06NK\xca|L\
-Y\x8f%'U\x92\xc0\xb9\xac\xd6t\xde\x85\x8a\xdbU\
-\xc2h\xc7Kw\xddAu\xdcs\xdd\xde\xde\xe3\xa0F\
-\x131\x1d,\xc2\x0e\xbf\x1c\x9eA\xd5\xaep\xcc\x19\x14\
-\xa0Dr\x8d\xe8\xd8\xb8\x88:I\x864\xbe\xd3\x95D\
-(f\x1fg6a\x98\x90\xbd\xad\x1djIE\xe12\
-\xd4\x8cgRM\xc4\xc5;\xa8v\xa7\xb6$\x1a\x22M\
-\xe7y-q\x11\xdbK\x83\x13g{KA\xc4\xf6\xb2\
-o\xce\xf6\xb2\x92\xc0\xf6\x9a\x8c\xad\xc6P)\xed\x1d-\
-\xd2U\xac\x82\xc6\xd1\xfe\x03\xb4Z\xce\xfb\x98\xe7\xa2\x7f\
-~\xc4\xc6Y\x08m\x93\xf3\x11\xd7!\x8f\xd1\x89\xaa0\
-\xe7P\x15\x06\xd6qOB\xa5\xe7`g\xab\xd2\xd7\xb0\
-\xfcr#\xe0\xa1\x10\x84\x12.\xf8\xe7\xa2\xa4I\x92\x93\
-]B1Y\xa8\x09\x13\xcb\xc4\xcf\x83~O\xc2)\xc7\
-;^#\x07\xda/\xc4\xfa\xe1\xe9\xd9\x1f\x02>\x9d\x86\
-\x02V\x94\x98\xaeN\xb2\x0d\xa7 uM\x93\x95i\xac\
-\x04\x10\xdfm\xdb\x16\xa4T\x99\xa1$\xa94\xd3id\
-\xbe\xd4\x1a4\xf6}G\x1eLh\x16\xeb+H\x83\xd4\
-$\x1c\xafXc\xa8:H\xd5\x0f\xd4\xd8\x08o\xd4\x1c\
-\xcfv\xe7\x06\xa8\x00_\xb5\x94R\xed\xd8l\x7f^E\
-\x0f\x9c\xfc\xc7U\xf3\xa0\xc7`\x8f\xa5\xe4\x11mV\x0e\
-f\xca\x8c\xcf\xcc@\xf5\xb1\xd4lh\xed\xe0x\xcb\x82\
-B\xb1\xd6\xae\xd813\xf9\xcc\xb5\xb1)?6\xee3\
-4\x10i\xa7*4\xcb\xed\x17\x83\xc2>@\xecb\x90\
-\x8a\xe6\x05d\xf1\xae\xeb\xc5H\xd9\xa9\x5c\xd2\xb4`M\
-5\x96\xec\x8b\xf8\x80\xba\xb2\x91\xb6\xea\xb8\xcc\xcdEF\
-L`\x0f)\x14\xf0\xe2q\xa1\x08\xdbp!\xdb\xac\x94\
-\x17\x82,d\xae\xa4\x8b\x8d%\x22\x03M\xaf\x9f\xee\xe1\
-\xca\xcd\xb1F\xa3\xb8\x111\x04\xf3/\x01\xb1\xcd\xcah\
-H\xbe1\xeesb\x8c\x11\xf86\x08h\xb1\x11O\xcf\
-\xf0\x05\xa9M'\x91b\xf7\xe2\xb07}\xfd\xe6\xb5\xcb\
->\xc2\x19\xc5\x97y\xa4\x9bp\x9c\x16\x8d\xe8\xd5fI\
-\x9a1\xcc\xd1\xfb\x93\xe9\x00\xc8h\x03X\xec\x1e\x11\x8e\
-,W\xa8\x98\xa7\xe1\xecB*\xd7=\xfd\x14\x96\x0az\
-*x\x99)\x01\xab8\x1a\xd3@\x01\x10\xa1\x9b\xd3S\
-\x94l\xb15\x92\xdf\x9c\x0d\x9e\xcf\xcf9\xf0\xd7\xf1\x9c\
-\xa9\xa2\xf8\xc5i*/P\x8e\xd3\xeb\x99\x16\x89|q\
-\x19a\x0b\xf3b\xc1\x92\xe1\x8e!\xd8E\x10\x81a\xe1\
-\xe4q\xfa\xe0\x17\xc2\xe3B\x8dD\xd8{\xc9\xcbi\x05\
-l\x17\xd1\x06xd\xb1\xaa\x95\x8cT=\xe9[\xafV\
-\x00\x02\x10\xe3\x9a\xacK}:\x85\xb6\x94;\xa9K\xe8\
-<\x10\xb5bk\xb5\x89\xf7/\xf8\xf0\xae\x0e\xd8\xdd\x10\
-\x01 b\x04=\x8c@T\x0f\x03\xa5r\x03P\xa4\xde\
-(\x07\xb2,\xd0\xb8f\x1d\xf0:\xccA{;\x8d\xaa\
-\xb3\x81$Fl0\x90\xdc\x94\x11\x82\x8e\xa2\x81JI\
-IQ\xc1\x83x(:\xbe\x12\x83\x94NC\xb1 \xa8\
-\x89\x13p\x062\x93\x14\x09Y,K&\x01'3\x88\
-\xb9\x06\xdd\xb6\x17W\xb8\x1aC2\xef$\xf1n\xce\x10\
-\xb2g\x92s\x13\x9aU\xbav\xd3B ,.*\x15\
-\xaaA \xcd\x00\x108~'\xd2\xb2\xea\x0f\xaa\xa9\x01\
-a\xd1\xd2\xa2\xc2u\x99\xfe\x85\x16\x0e\xa5\xea\x95\xb2\xe9\
-X\x12\x1a\xca1\xc3\x89\xd5\xa0\xd9,.\x05R\xab\x88\
-\x9bK\xec\x1f\xc06wR\xcd\xfao\xa1\x86\x15\xea\xae\
-\x0c\xe4\xfa\xe3\xd6\x17\x85\xa5\xd4D\x13\x95*\xd9f\xa3\
-R\xa5\xd9\x8dT\xca\xd4\x98\x0d\xd0~\xfc3\x90##\
-\xa09\xfc_'\xf3\xa3\xd6\xccV\x13\xa4\xd6\x9c\x09f\
-H-y\xff\xd9\xaaZ\xb4Z\x22\xc3\x9b(`'\x96\
- \xbf\x09\xf1\x883r\xfaL\xf3\x9c'Pi\x94G\
-\x1f}5h+P\xad+\xda,\xd0J\xa6\xd4d\xc3\
-\x17!6\xe3\xac\xe3\xf4\x8fi3\xc6\xd6\x16\xae\x95\xbc\
-\xd8\xb9\xff\xbbk/v\x5c6\xb4\xc9&\xae\x1a\x95j\
-Y4*\xc9\xbafd\xe2\xffY2|\xc9h\xe8\x8f\
-\x96\xbbp\x09\x98\x88K\xbb\x82\xc0U\xda\x1f\xa2\xe5\x90\
-w\x08\xbb\x84\xec\x22\x06\xaf\x931\xe0\x86\x10,\x08\xcd\
-^GV\x99\x81\xfd12\xac\xacl\xe9\x9e\xa5\x7f\xe6\
-\xd6\x22x\xb6Q\xe7\xd4X\xa3\x5c\xac\xa4Vk\xe5\x05\
-`\xd3RWgN9yd\xcd\xf4\xdd&{\x0eA\
-\xc6\x1a\xb8\x80\xe3\x91\xb26\x9a\x9b\xbd\xb5\xf7,;=\
-;\xe5\xc8\xb7\xe2\xb2#\xb2WD\x00\xcc2\xe3\xcb\x01\
-\xd0\x88\x0e\xfa\x90\xd0H\x1a\x8c\x13u\xd3Z\x8bl\x99\
-\x1ac\x02+\xaa\xb0\xb6l\x1aVH\xfd\xd8\xe6\x09t\
-\xe8'T \x90\xc9`\xb4\xfac\xe5:5e\xaa8\
-\x1fT\x92p0u\x06\xd7Jvp\x90\xa3cj0\
-\x8a4\xd8\x89r\x0b\xe8\xe3B\xbc\x9d\xab\x15n+\x9c\
-pN62F\x8d5\x0a\xadX I\xa1E\x19j\
-\x93$\xebdP\x19\x1b\x14\xab\xf3\xb24\xa4\x17!\xd6\
-3\xb0(g\x81>' \xa5\xdd4\xb2\xa8\xf2\x0a\x8c\
-kE\x12\xef'\xce\xe6\xce\x0e\x9f\x1bP\xab\xc5\xc8@\
-\x15$!\xb1jS~\x11\xce9M/\x15\x9f\x08\x91\
-\x92d\xa5yb\x18\xff\xa7\x81\xd5L\xb3\xc9\xb2\xc9[\
-.\xcb\x9d\x8a\x11\xa2\xe4\xf2\xfa6?^\xa97q\xb4\
-\x90\xb5\x06\xca\xc1V!\x05\xccN\xeb\x15i\x853\xfd\
-\xb45\x0b\xec\x14\x81\xd8\xea\x92\xf9\xff)\xe6\xcd\xfb\x87\
-;3\x8f\xc3\x1d\x98\xc7\xe1\x8e\xcc\xe3\xf0c\x9a8\x1f\
-8\xd3\x85\x8ds\x1a\xa3\xcfa\xcc<;\xd4\xc1\x9c\xf9\
-?zL\x92\x0c\xa5\x0f\xe3\x0aO\x9dMB\x89/\xd6\
-X\xba\x01\xf6$\xa6\xd2\x93\xa1$\xad'S\xfb\xfd\xd9\
-\x89\xdb#\xc9/\xb2:\xeb\xbc\xff\x83T\xd9\xb1M\xdd\
-@\x85lJ\xeb\xfd\xda\xd8s\xa6Thfu\x9e\xcc\
-\xc6\xa47\x93\xec5\xa3\x0d\xcf\xcd\xe6Z\xb9\xb5\xb0\x9c\
-\xd6L3\xbb\x9b\x0bE\xc0i4\xcc,\xad\xc7se\
-eVzd\xbe\x11\x14\xef\x8c\x84\xb9\x85)y\x91\x19\
-q\xaaS^2BOY\xf1J\xb0S\xce\x9b7D\
-\xbe\x9b+\x9dr\x91\xf5z\xcaw\x19:\xdb\xb1\x95\xc2\
-6~\x18\x16v\xf1\xa9\xe8\x0cr\xf1\x96\xb2\xf2L\x92\
-\x97f$m\xf7 \xdeDs\xa1\xb8\x12\xd8G\xb9\xed\
-\xd1x$%\xe2\x08$\xa5\xdd\x5cIJ\xb9\x9c8\xa9\
-m\x8f:\x92\x90\xd8\xa6\xc7\x851\xab\xcd> \x11\xc3\
-\x1aS\x1cJ\x06\x7f\xf3s\x05\xf2\x94\x0e\xbbhO\xbf\
-\xd7BS\xc5\x82\xfb\x94<\xc2\x907Y+\xb3\xae\xc0\
-\xb8IMw*\xee'\xc97QU\xfeV\x19\x0e\x93\
-z\xc9\xf0\x99\xf6\xa20}+\xdd\xe5\x90\x11\x07\xcc@\
-\x9a\x5c\xa4S\x15\x1b>\xc1\xa3\x0b\xe3\xaaS\xb3\xd3\x9d\
-\x0c\x93om\xc1xt\xaf;D\x86\x9e\xe5u-\x14\
-\x00\x90X\x8c\xac\xe7^\x0a)VZ<\xd3\x97\xf72\
-\x93\xb3\x13WIC\x1aw\xfaX\xa4\xb0^\xc6\x8c\xf0\
-6\xef\x94Wn\xaeH\x99\xb6\xba\x9f]!!\xbf2\
-w]\x90\x06\x7f\xcbM\xe0=}\xa7\xd1\xaa\xe0\xbd\x91\
-U\x12\x8d;\xdae\x12\x03\x12\xd5\x12=ET0T\
-\x8a\xc5\xa5\xa9T\xd0[]\xc9\x13|\xe9\x8e\xc1\xab\xd7\
-J\xf3\x15\xa1\x7f.\xa8'D4\x8aK\xc2\x8a\x82\x8a\
-\x11VF\xf58i\xd6\x95\x9e\xe2\x8b\xb8\xaa\xe2xh\
-\x1a\x13\xacj\xa1\xfe\xf2\x1dI\xb7\xa8!\x92\x88y\x8d\
-:J*I(\x00\x93\xe60\xf0\xa8V%\x9f\xe0o\
-\xac\x04\xbd\xbdN\xa8i\xa8\xa7\xc0\x84\x91\x99\xe4\xb0\xe6\
->\xdfIYx4\xb4<,\xb1gk\xcb:\xb2\xcd\
-\xa05>3\x93\x16\x84B7d\x1d\xe1\xbci\xc3:\
-JA\xa3\xd1\xe3@^Z\x81\x04!g\xf4j}\xbe\
-\x8c\x96.\xccKn2\x08\xd1\xc1$X\xc4\xb1\x09\xcb\
-\x07r\x09@\x8f\xd0$\x81\x98\x16\xaa\x822\xa9x4\
-\x18\xa1&+\xd2\x18\xd7\xf2)\x8c\xa0l\xfc\xe5\x00\xec\
-\xbf\xff\xf1\x9eS\x90\x8a\x02\xdcb,uH(Z\x0a\
-z\x81\xd7\x884\xecL\xd7\xb0\xb7W\xcc\x04W\x9e2\
-\xf3\xf4\x0d\x08\xcd\xd3\x11\xa1s\xc2M6o\xf8\xdc\x5c\
-3\xa9e\xeb\xf7\xee\xa4\xd8\x03\x8b\x11X\x9aqR\xae\
-\x9a\xc6\xbbiW\xca\x9b\x13\xd5v\x12\xe2u%\x037\
-\xbf)h\x1e\xd1nGp\xcf\x980\x1di<\x13c\
-\x9e\x09\x95\x96sBgY(\xe72\xc5[\xd1\x9cl\
-\x04N\xd8\xbf_\xef\xed\xedA\xfd+i\x07\x13\xd8\xea\
-\x94r\x06\xb1\xae\x9b\xc8\xec\xd3\xbb-$\xf8\xa4\xf2\x9b\
-\xf8\x9e&\xca\x13\x0e\xa3\xb4\xaai\x05\x86\x0a\xc0\xc7\xc0\
-\x82,\xae\xa4\xbaJu\xaa\x14\xf8RTW]\xf3E\
-\x92f\x08\x18\x97\xcc\xba\xafa\xfd\xe8`._]\xcb\
-\x0c\xa0j\xd1\x88(\xd2\xdb+~Q5\xad|\x97\xd4\
-\x894X\xa2\x13F$\xea\xfaH\xedI\x19\xcf\x94\xd3\
-\xb4\x1a\xd1NxHI{{\xd73P\xbd\x89\x84\x17\
-\xa5\xc1\x1e\x9c\xa0\xad\xad\x1e-\x7f_,s\x88\x05\x19\
-V\x0c\xef\x8e\xc5\x88\x10V8\xdez\xa4\xfd\xc7\xb2y\
-\xd6\xfa\xfb\xce\xba.]\xef)\xdaE(3'\x8f\x0b\
-\xd3\xc4\xd4C\x8f\x9d>\xac\xa1\xe0\xcb\x95&3\xdd\xa2\
-\xb3\xc3\xa5n\xb2^\xad\xbf\xdcU\xbeg\xf1L\x91\x94\
-\xd3\x15V\xe3\x85\xd1\x99\x92\xf4\xc40.\x14\xde\xc8\xba\
-\xae\x1b\xb7\xd3\x9bv$\xb1\xc7]\x8c\x93j\xb1\x0a`\
-\xf0j\xc4\x97\x92\x0e\x10\x8d\xcb\xf3j\xf9\x12-\xb8N\
-q\xc9j\x9b\x1c\xdfE\xf9\xdb\xbc\xfc\xed.\xcb#V\
-\xe1F\xeack\x92\xc8\xcb\xc8\xba\x9f\xc6Lb\xf9\xf7\
-\xd1'\xad\xf9\xd3\x03}\xb2\xed\x80\xdd\x22\xcb|\xbd\xd5\
-\xaaWE\x1eT\xba\x0f\xb3\xdcnw\x8bXD\x0e\xa2\
-\x14\xb3\x90\x86\x83\x9e\xb1\xc3\xa4\x19\x12\x0e\x01\xea1\xc5\
-p\x13\xce\xe9\x01@\xc1\x8d\x8c?\x90\x93P\x04\x93\xe2\
-[\x9c\xed\xb4\x19Q'=b\xa9C\xcc\xa2Q\x81X\
-*\x0f\xdbl\x98'\xd9-ON\x91o\x22\xeb\x95\xd2\
-\xe7@\x8cJ\xe9q\xb1b\x84\xbb|x\x1aO\x9er\
-\x07\xb4\xe35\x99g\x91c\x18\x9a2G\x9d=\xe0r\
-p\xa3d\xba\xd3\xe9\x04G\x0d\xb6\xa2\xed\xd0\xf0\xa10\
-\xa1\x16\xbe\xaaP\xedL\xe3\xf8P?\xcdg\x09\xd3v\
-[\xd2t`\xd0\xf9\xd0\xd5\x9a\xc9\x89>\x1e\xeb\xacx\
-\xfb\xf2]\xa9b\xd9I#0|^Cf\xc54\xf5\
-\xcc\x04e7j\x9eTvs\xc3\xc6\x86~q\xf8P\
-\x9af\x1d=\xfd=\xac\xca\xa3\xc0\xdc\xac-\xf2\x09\x8e\
-\x9e\x11\x1aS\x1c\xa7{\xd9\xf9\xca*>\xea\xd5\x87\x1e\
-\x9d\x83D\x03O^I6\xf9\x032L\xbf\x96\xee\xf7\
-0\xc5\xeb\xa0 \x22 Mv\x01+\xd7%\xack\x0c\
-\x94(\x82\x7f\x9aB\x9f\xbc\x1b^W\xbd&,k>\
-Zj\x05\x18)j\x9bl\x1aA\x95eG\xf5\x02\xd2\
-\xdd\x8c=VvG\xb4\x0dmp\x89\x0f\xd1\xab4t\
-\x83\xce\xa6y\xad\xac\xc2;q\x99@\xca}\xd7\x17;\
-\x0d\x99\xcc\xa2f\xc0\x0d\x0bu\x1e\xe9\xb0X\xce(\x16\
-\x1b\xd4/|8\xcbz\x1f;H\x1e\xc4\x221%5\
-\x9d\xe4\x11T\xc2\x14\xd8$\x0b)B&\x80\xa6+|\
-#<B\xfb\xa7:\x08f\xe9\x0a\x00\x8fA\xa2(m\
-\xf5\x9d\xc4\x1b:T\xf6\x9c\xb8\x1b\xb0\x1d$#\x09R\
-.\x14\x98\x08\xc3\x10yA^\x934\xbe\xf9&\xa0\xf9\
-\x83\xc3\x83\xae#\x0a9\xdd\xf8\x22L\x80\x10y#\xec\
-\xc2\x11aG\x18\xab\xad\x10D'?\x8f\x9d`\x10\xc9\
-;\xde\xc9c'\x10\xab+\x08\xc0.\x9e<\x0e\x80,\
-\x85\x00f\xa3\xe3\xed\xc9`D\x05C06\xf3\x89]\
-\x00\x81b\x0e\x19\xca\xa87O\x86\x16\x84\xad\xd2\x8ep\
-\xb4\x01FI\xa3\x11\xfc<\xc3 \xab\xfd\x11\x92\x0f\x90\
-\x11\x12\xe9\x08Oy]\xd3x\x058QFx$=\
-!\x02\x8f-\x8aX\x04\x9b#V(\x92\xe3\xb0\x01s\
-u\xe3\x8a\x89e\xbd\xc4Zn\xaeP\xdb\x11\x18ZI\
-]XN\x9f\x96\xf8\xb2\xa5F\xe3\xb4\x9bT\xcd\xcd\x15\
-\x1dp\x9aO\xb3l\x22zh\xe3\xdb\xb6\x1c\x03\xbd\xa9\
-\x98\xe8\x86\xaa\xd5\x0c~\xbb\x83\xf5W\xe2\x85\x90>\x0b\
-\xda\xa4h\x91\xa2\xc8\x98\xd2\xdb\x8b\x7f\xa5\xe3\xc9\xe8\x93\
-S\x1cy\xd5}\xe9\x99\x99\xd9\xdb\xd2\x09x\xb76\x85\
-\x06r\xb9\xc74\xb3\x04\xf5E\x8a\x0e\x91\xb1\xd7\x90\xe2\
-\x86\x860\xba{wA(,{\xa0\xbd\x93\x88\x98@\
-\x12%%\x96\x09\xe5\x84\x84\xd7\x89&3\xd0\xb2\xff\x92\
-iWB\xf3\xc0\x86\x060\xc3\x9e\x89'=\xf3\xa1\xf2\
-\xb6\xfe\xc6\xc3W\x8aNa\x06\xbb\x0d\xe9\x9c\xeb(\x8f\
-k\x16\xa6t\x94\xf8Y\xf9\x18\x10\xbe\xe4k\xbf\x9c\xa7\
-?\xdf\xed\xe2u\xb2\x9b\x0f\x1b\x12\x197\x90\xaa\x90\x00\
-9\xfeX\xd6\xdddg\x07j\xa0zw\x99\xf0\xce\x12\
-\xc7\xee$l\xfb<\x0e\x1f\x8c\x9f\x0f\x0d\x8b\x06\xdc\xd5\
-\xad\x09,\xe9\xcf\x1cQ\xa9\x80\x0di\xf8J2&f\
-b\xef%M\x18\xb6\xec\xec\xfd<t/\xba\x97(\x92\
-J\x81\xb8\x98x& \x8aj\x18V\x0e9\x88Nv\
-\xc9#\xdf\x1e\xc6\x99\x85\xd8\x8c\xd0+\xc1(\x06\xf3\x14\
-\x17\x0d\x08\xec\x05\x11\xe7\xcf\xc7\x9cc\xa6l[t\xc2\
-@\x7fo\x15\x8c\xd2,\x22+\xf6\x10r45\xbf\x8a\
-\xe8\xcf\xb0R\x81\x10 \x13\xd6\x8f\xf7+\x1e2\x91\xe8\
-\x0bS\xfa\xc4$\x9e\x17\x99G\xca\x90]Ym.\xa7\
-\xb5\xca\xe9d\xc3{\xd6\x84V\xd0\x00vj\xba\x18b\
-8&\xe0QH\xcf($5,\x17IK<1@\
-trre9\x93\xcaP\x191\x8d\xa3\xf4\x1d\xb5\x03\
-\x0eO\xad\xe2\xbc\xb0\xe0\x91\xe9\xcfG\xa9\xa1\xf4\x5c\x88\
-\x17\xc2L9/:\x8b\x13\x00\xc9\xa9\xaaB\x1d\xd8\xdb\
-\x9b5\x5cC\x12PZ\xae\xf3P\x8a\x8d\xce\x01\x16\xf5\
-\xd6\xcbrI\xad\xf5\xd4:4aF\x8d\x8b\x9f\x15\x8d\
-j\xfb\x91\xd1\xba\x1b\x5c\xa97\xca/\xe3#\xdf\x8au\
-\xf3'S\x0a\xb8u\x1a\xc6\xbe6#\xf4\xa1\x86J$\
-K\xa3s\x96\x1aaIx\xd4XL\xe7z|\x1fB\
-r\x91\x04\xeb-\x81F\xf2:\xa8\x94&\xf6\x98B\xf2\
-D\x83(\xd4\xf4,] \xf0na\x04\x81\x00\xd0x\
-\x0e%\x07\xa1\xa9\x8b3\xde\xe1\xb1\xdd\xc4z\xe9}\x0b\
-\xe1\xc6\x86\x92EF\xde0\x91\x14\xb8\xe47\xeb\xb8\xd3\
-\x90>\xca|p#I\xccz\xb8\x16\xd6\xfb\xfa\xdb\xee\
-\xf1\x07\xa6\x13\x02\xcd\x08\xa0\x1a\x1e&\x13\x04cF_\
-2\xd7\xffK\x85\x91\x97`\xfd#ESHy1'\
-=\x0b\xd4+%U\x81\xcf3\x08K\xf2\x0c\x87i\xf7\
-\xf8\xc2\xda\x22\xbcbK\x8f\x07\xac\x0d\xa3i\xadZ#\
-\x95\x9b\xa5g\xd1n^+$\x1d\xb4A\xeau\xb2|\
- \xe8* n\xd4\xea\xa2W\x0b\x9f\x8b\x17\x9f\xac\xf5\
-\xd5\xdc'k\x91,\x80\x1e\xd3dW\x1a\xf5V\x9d8\
-\xd0\xb2\x88\x8f\x9e\xa8\x8f\xd1]\xb8\xb0 \x1fN\xda\x98\
-\xca\x97f\x89\xec\x89\xba^(:\xf1S\x04>||\
-\xc9\x1f\x8b\xce\xfb/\xa9\xf3>\xb1\x92\xbe?\x06T\xdc\
-<\xde\xe3\xa44\x8bw\x83\xf1z\xfdNY#\xd4\xc4\
-\xa5\x89h$;\xf2\xf5\x93`,\x16(Z\xf8~\x8c\
-\x97dY|\x0e\xe5\x99\x10\x8a\x8b&\x97\xb8\xda@\x16\
-uO\xe0?\xe2|\xf1N[`\x01}\xe9\x1a\x055\
-\xba\xadt<\xb1_\x92\xd6\x00^S\xd2\xd7X\xab\xd5\
-(\xcf\x03c\xdb\xb4\xab\x00\xb0\xdb\xff\x0eW\xd4]\xdd\
-H\x8b8~\xedi\xde\x8fF\x07\x06~I\x1a%A\
-(\xe9\xde\x9at\x8a\xc5%5\x8d%~\xe97\xdem\
-\xd2\x5c\x00\xfe\x80n~\xcd-\x10/\xfe\x84O72\
-\xe3&9\xef`QH\x85\xa2QB\xd2\x8d*\x8b\x22\
-\x9e\xb4\x17q\xbc\xa4\xd2\x8a\xfd\xe6\x988m\xccD%\
-Q\xacA\xed\x8f\xef\xf0/\x0a1\x13I\x97r\x05/\
-\x0a\xf4\x17:H/$\xc1#\xa2\x1b\x1de}I\xf7\
-\xb5\xcd\x91\x1b\x9d\x10*;AQm\xe6\xb1\xdcR\xfa\
-kHs\xe4v\x9e\xe8\x852\x12\xe80\xd8\xbc\xd0j\
-\x82\xc8\x8a\x0b\xf1,\xb2 /\x027#\xa4\x9016\
-F-nJ<\x11w\x9d]@\xde\x91\xa8\xa7\xd0\xb7\
-\xf1II\x04V\x1ff\x8a\xd8\x18-\x1f\x09\x0d\xcb\x89\
-\xee\xb2\x89\x82\x84\x12\xc3\xf0@\x1a\x9dD\x954U\x0f\
-I\xceCD\x02\xa5\xd6\x8e\xb32+\x1bYU\x81\xdb\
-f\x03\xa7\x06H\xe0\x1f}\x86W\x0d\xf6\xc1\x93\x99\xa2\
-!\xf4\xd3b\x14\xe9/\xbb\x899\xd9`\xbard2\
-\xfd#\xd5\x8b>l~\x09\xc3\xaa\xfa'\xfb\xdb\x9c\xab\
-\xb2\x11scQ\x11w\xe6\x85i\x09\xb7\x18*\x1d\xd8\
-\xd4L\xa6\x83\xc8\xca\x82\x84\x94\x97\xcb\x8d\xc4j\xd6\x84\
-p\x09\xb2\xab\x13B\x13\xf2\xb8(G\xa2\x80I\x03\x09\
-\x83\xa5\xe97\x01k\xa1\xa96\xc9\x9b\x10^\xa7\xae\xfa\
-\xc4d\x92^,+k\x9e\xf0\xf2\xd5\x93s=\xad>\
-\x22\x81:H\x9f\xa9\x9f\xd4\xe8\x811uJ\xbcaM\
-\xdb\xeb\xa0~\xa1E\x85\xce\x97a\x92m\xa8\xaaZ\xf8\
-\x84+\xbcp\xad\x84\xe3\xf1\xf5\xdbH\xd5 \xe9$F\
-\x89m\xaf\xd1\xaa\x8c\xe3\x96d\xc9&\xee\x0c0[\xda\
-\x1duR\xf4X\x81L\x06m\xb2\x15\x10\x95\xc3\xa5\x1c\
-\x96\xa5u\x1eu\x916\x7f\x1a\xbek\xb3\xd3\xb7\xa3\x9d\
-\x9e\xed\xf2\x91\x82V\x99\xf6\xc2\xe3vv\xdc\xdc,\xbb\
-;m0\xd1\xfeNz\xb1*i\xb5\xc5SV[q\
-\xcd\xa5pq$\xa9\x919\xc5F\xb9\x98)\x85\xcf\x14\
-z\xc4\xae\xab\x22\xc4&\xed\x85\x1b\xef\xcc\xcd\x1b\x13\xd3\
-\xd1\x15\x99\xcbvbq{\xa6OY\x08\x87n\x1a\x17\
-\xed\xaaf\xda;\x09\xaaK\x9c\xf1\x9e\x83a(/\xc4\
-Ox\xc4?\x8a\x13\x1e\xdfah\x93\x8d\xd13\x9aD\
-O)]\xd2&\x01\xcd\x9c\xa4\xb0*\x15\xd11\xca\x07\
-\xb9aW\xf0U6%7(\xb7$/\xb2\xb5%6\
-\x19\x12!\x94\x95\xa8\x93xn\xed4(\x80\x91\xfe#\
-\x1e'3\xe8\xd9\x8c\xb2\x89\xfd\x08O\x9c|\xb7\xf2\x88\
-L\x03\x82E\xed\x8a\x08\xf7H\xa9\xbe\xc9\xaa\x08\x8f\x9f\
-\x02\x1e\x1d/\xdbk\x90;\xdc\x800\xbe\x106\xb8G\
-\xc1V\x09\x88\x9c[[N3\x00\x94.\xb6\xea$\xb3\
-\xb6\xe5qGL\xd6\x81\x0d\xa8\xcahp$\x06\x1c\xe4\
-\xaf\xe2\xd7bbq\x11p>\xd7|\x8a;\x1d\x09m\
-wb\x8f\x0bR\x1e]\xad\x07b\x03f\xec\xecJP\
-\xa3\xdbC\xaf\x87\xd3\x98\x84\xf3p\xf70I\x1b\xc3\x80\
-\xd8Y\xfa\x11\xae\x0d\xa4\x83\x91\x0f\xb1\x0ek\x03Q3\
-\xb6\x10\x14\xb3*\xd8!]\x88\xd2\xdb\xcbH\xba\xc0\x86\
-\x1e\xaa,\x06\xa5G\x83bE\xa4P[4\x22\xadl\
-]\x9a\xa6\x9d\x18\xb7'\xd6\x8c\xcf\x8a)\xa6Or8\
-\x99\x11\xd1}M\xf9\x8d2\xce\x89\x1c\x05\xec\xb9\xd4\x89\
-\x0b\x09@\xc8\x02&$\xf8~\x9cjH\xd9\x86\xd0v\
-\x91\x8a\x7fB]\xbeme\x02\xa9\xe3\xed\xe3/`%\
-+\xa2o\x9e\x9d\xc5vV>_\xa7\xc4\x1d\xb5~\xd9\
-;4Y,\xce\xe5\xa7\x99H\x8ai\xf8\xf0\x03\x81y\
-\x10\xd0+\xf4\xf5`\xe4\x18\xcf\xd2\x0c\xf2\x92\xd7\x96Z\
-\xfab\x87\x1d\xbf~\xf5\xea\xd8\xb5\xcb~\xb4\xfd\xb2M\
-\xb7\xb8\xa0\xdb\x14\xc5'\x00\xba&>\xa9o\x88l\xb4\
-OmJ\xab!Bu\x01F\x07\x7f\xfd\xb9P\xcb\xa3\
-\xe0F\xe7>\xd2.\x10A\x01\xc1\x97\x80(\x0a\xf9\x9a\
-\xb48\xd3\xcaWtl\x9b\xd7\xb8&\xe1\x13\x11;\x9f\
-v\x0b'8\x86\xb19L8\x96\x19\xba\xf2\x0b\xf5j\
-\xb5X+\x09\x91\x87\xea\x89h3\xdb\xae\xc5\x8d\x9d\xa1\
-\x8e\xa3\x8d\xf9\xcc\xcdK\xe2\x99\x84m\xcc\xe5\xd2\x08\xdf\
-?\xdc\xc1\x07O\x9f\xbd\xfb\x07G\x06\x90gs>{\
-\xef\xf5\x93\xb3@\x829Y.6W\xea+\xab\xf8B\
-\x18\x1f0;\x8f\xcf\x93Xq\xe1\xb1\x90@\xec\xf9~\
-?>\x88\x81\xbd\x1fN0\xb5\x85\xa0\xbe\x98\x0a\x87L\
-MQ\x88\x14\x1e\xf2\x10\x02\x8a\xa2%\xe2j@X\xc7\
-\x81\xcfD=\xa4\xb2{<J\xa58dv\x1e\xe3\xa8\
-\x86\x9e\xb9\xbc\xb9c\x14\xe7\xc5;ha\xa1Z\xf1\xd2\
-xQ1\xa7q\xcfJ\x99RN/\x0b\x16\x0a\x80\xd1\
-\x86C\xd3\x18\x89\x1aW\xfe\x12Q\x0bL\xdc\x1eo\xe2\
-\xb9#\x1f\xe9\x8dyR\xa7;\xafix\xcb\xd8\xdbZ\
-\xec\xed\xb6\x18\xd7N\xaeO\xd5\xb9\xce\x8b0\x9e\x1aT\
-0T\x05\xa5\x13R\xa3\x03\xb2\xd96_\xa2Q\xc2\xb1\
-\xc7Or\x19\x8c\xea\x05\xe8\xe6\xd22_h\x82f\xb5\
-\xd2J\xc0j\x05[b\x0c\xf5#JV\x17W\x0a\xbe\
-2\xaf\x1e\xdb\x0c\xba~\x89\xe3\xca\xe6t%[\xd2;\
-\x22\xf58\xec\x1b\x11\x9f\xfbc\x85h\xc7I\xbc\x1e\x87\
-j\xeam\x1d\xed\xb8\xcdI\xab\xd8\x1a\xbej@\x88\xd0\
-\xf2\xd33&VZ\x8d\xf8\x06i\x12\xd8n\xb6r\xb3\
-\xe9\xb1\x11=\xc9Vn\xceQ\xba\x8b\x0d>z\x1c \
-\x84&4\x04\xac\x996>\xa0\xcb\xb3[\xc2\xc0\xc6\xf0\
-\x9e\x83\xb3\xe3~\xd7W\x82\x82)\x06\xb6O\xfd\xea\x87\
-\xddP\xafP\x1f)\xf9\x8aC\xc4\x09\x0e5Al\x86\
-Wnq^u\x84\x17\x95\x5c*^<iU\x89\x03\
-U.v\x98\xe2e!Y\xbc)H%/\x8b(\xd9\
-:\x90\xd1 %\x0c\xa5\xb6\xedO\x8f]\x9e\xbcn\xdf\
-\xf4\xef\xe2\xd6<\xcf^=\xe2\xae/\xac\x10|\xf6\xde\
-;\xb0U\x7f\xf6\xc1\xb7\x1dO\x97\x81\xe0\xa3\xebz\x07\
-.\x80|\xed\xa0\x1d\x09\xd8\xba\x94m?i\xf7K\xec\
->\xaa\xd2\x82\xb2\xae\x7f\xb7XY\x0dF\x05[\x90w\
-\x16\xf1u\xb13\xd2\x91\x99\x90\xf0\x9d\xbc\xfc\xf8\x82\x99\
-\x09\xd5\xc2\xcf\xc3Z*\x18~\x08\xcc\xe0$p\xc8\xf9\
-\x00(ZO\x01\x9f_Yt\xe2\x1b\x08\xa9\xd1EM\
-\x12'\xc0\xcc\x83\xc4\xd8\x015\xc8\x9d\xa7\xa9\xc7h\xa5\
-\xa8\xcet\xb3#\xdf\xa3\xbb\xd1{:\xf2#2\xa71\
-\x15\x1ez\x15=\x01\xdb\x1c_\xdc\xa1\xb0\x88VfL\
-f\x19\xbbI\xa0\x88\xe4\x9b\x04JN\xbaI\x08\xa70\
-\x1c\x00\x11\x861\x08\xcbE:2V\xc3\xecn\xdbP\
-\xeaeV\xce\xbdcVG4\xe8b1\x8b\x8bL3\
-Wg \xf2qKx\xaf\x9a6\xcf\x16\xb4\x9aS\xc2\
-\xdb\xb8:`\xb4;_\x1a\xf1\xf3Goo\x8f!!\
-\x8c\x1dN\x88)\x16\xef\x87\x93\x8f&\xe3W&\xc6\x9f\
-\xbdt\xfd\xf9\x13\x90)\x1bm\x22r@\xd6\xea\xbe\x00\
-\xf2\xf4\xbf\x1bE\xfa<T\xe6s\x11\x18\xe8\xc1?\x91\
-\xa6$0\x95I\xeb\xf48\x1c\xa16\xe6\x8f_\xcd=\
-\xdd,\xd4\x7f\xc8\x12\x8f\x16\x85X\xde\xae\xf7O\x5c\xd8\
-Sc\x97&\xa6\xec\xab\xda\xbcZ\xf9\xa2N\xf5'\x95\
-\xe3\xa4:\xdei\x08\x9bV\x9e!\xecy\x1c\x01\x9e\x8d\
-\xc7\xee\x80\xa7\x06\x13wsj\xa2\xc3\x05Ut\x05\xf0\
-\x98\xe2\x19\xb4\xa9Z\x13\x96e\x01\x9b\xefJN\xfds\
-Ii>\xd7\xb0\x93\x99/\xe2\x91\xc2q \x83Q\xbe\
-\xcd/\x01\xda\x84\xf0\xa3<\xc8\xd3\xa3\xfd\xdd4\x99<\
-\xa8\x16\xe3i\x18\x99&\xad0\x7fN\xd1\xb1\xecK\xcd\
-\xd4]\xa7O\x85\x16\xe1\xbc$\x8d\x86xs\xce|\xc3\
-)\x14\xc8\xc9$\xdd\x17\xe9z\xde\xba12g\xa9Q\
-\x87\x85\x95\x1a\xa0G\xa2B\x1b]\x18\xc5K\xe5\xd0\xd1\
- \xef\x0d\xb6\x06\x15^_\xb2\xf8\x05\x87Z\xd5\xa7\xe3\
-9O\xf6\xa7(\x94\x82`\xea\xee\x93\x03\xce\xb1p\x22\
-\x8f\xe3sN\xf8- \x89`\xf7\xa0\xa4n\x82\x80\x15\
-\x05\x040\x19\xe6\xd0\xfe)\xe3\x14\x9a\x12\xc26\xa9o\
-\xd9$\x15\x14\x0d\xa2K\xf6/\xa4MP\x952\xc6\xbb\
-\xd9\xf6\xe6\x98\x15\xea>\x07\x91\x87\x9b\xa5\x96\xc8\xd3\x97\
-\x1688\xea\xa4>{\xe5;\xb0U\xbd(#\x98\xc4\
-\xfc\xf4\x12\x0a\xc8%\xb2\xba\xb0\x99\xb8\x05\xbd\xfb6\x93\
-,Q\xb2\xb8\xbb$[\xf2\xb1'\x0d:\x10\xf5\xa6\x81\
-?`\x10\xc6\x89=\xa5q\x98\xcf\x99\x97\xcc\xa2\xb4\xbc\
-j\xa6G\x0e\xf3\xd1\xf0\x85~9\x85I`\xf4\xc4\xa9\
- ;\xb47\xb3%\xa5/'\x0f\x07\xa2f\x19\x06g\
-\xb5\x09\xdb\x1c\x8c\x14&\xbb*w\xf8\xd3\x9d\x9bO\x9b\
-\x81Un\x0cm\x98\xec\x17W\x8b\xeb\x91%\xd5\x81\x1c\
-\xeeB\xa6\x93{\xbb\xf1\xbc3\xf8?f}9{\x06\
-P${\xd6tt\x8f~)\xd1\xaeW4\xb8mr\
-E\x12\xebT\x11z\xb4\xdc\x08\x16\xf3\xcer\xab\xb5\x92\
-?}zmm\x0d\x1f\x0b-\x93vhc\xe94\xbe\
-.q\x8cH\x1c\xe0\xb9\xee,\xa8\xc4&\x5c\xc6+/\
-\xacl\xa2\xa5\xe3\xd0NH\xc0\x91E\xec?\xea\x00!\
-6\x93\x8a\xb0\x03\xf9\x22:S\x86j\xa8\xec\xe5r\xb1\
-R_\x82\x1c\xc2\xc2\x1ca\xab\xa2\xf8\xa9\x92Htm\
-\xd6X`)\x8c8RE2\xf6\xee\x9c\xc0$\xec\x22\
-\xa1\xe1`\xd7\x13\xd9\xa4\xba\xbe\xd7\xc9\xfaM1ZP\
-\xe8O+\xd9q\x16\xb4\xef\x8az,U\xae\xd5\x82\x86\
-x\xbeAJ]\x9a\xf3+\x11\xc3\x9fxlm\xe5\x84\
-\xdaI\xa4\x95\x8b\xefnh\x98\xe8\xbd\x8dh.\x7f^\
-\x22\x91\x93'D/h\xa2WT<=ro'}\
-\xe3\x1d\xf3\xee_\xd8W\x10\x10\x98\xa5\x04\xb4|.\xde\
-\xb0p\xe0\xa1S<\x09\xfb\x8aVP:\xf9:=\xe8\
-&\x9a_\xa1W.y\xad\xa7\x91\xc5\x18\x0e:\xde\xa2\
-\xcf\xd7 \xf9\xbc&\x86\xf01\xc6B\xa7\x9c\xa8\xfa\x92\
-\xe8\x05G\xcf\xeaj\xd6\xaf\xa2h\xadR\xb9\x92b\xb5\
-j\x96\xebz|?\xb2Z\x07-\xb0-a%\x9d)\
-\x97\x94\x1d\x12\xbd0\x99\x83S\xb7\xffz\x92\xb0\x1c\xe7\
-*\x931|4ds,\xcf \xc2U\xc4y~\xbd\
-ob\xb3\xf6\xf9\x1b%\x0f]_\xd0\x85P\xad>\x0b\
-?t^\x94r\x98\xdab\xdd\x9f+D\x16\xa7J\x10\
-\x85\xde\xa2\x5c\xf4J\xbb\x5cl^_\xab\xddh\xa07\
-\x93\xd6\x06\xfa\xa9\xe8\xed\x85\xf8\xb9r\xa9\x00\x03\xc2\x80\
-\x85\xd1j\x9b\xd9\xdaR\x11p\x84\x89R!\x90F\xe0\
-\x00\x07k\x16<\xc1\x8b\xf4:\x93\xb4\x83\xf1\xb7\xbf\xe0\
-\x85\xd9aX\xcb%\xcf\x80\xed\xba#T\xb8Yo\xa0\
-\x89\x14\xfd\xc5;\xa5\x18\x12\xa7\x90\xfb\xc0\xc4\xb9\xb2\xa2\
-\xfc\xe1\x85\x0f\xa4\x9bC\x88\x1c\xaco<o3\x1f\x8f\
-\xd4#\xb7$\x90t\xba\x8a.\x18\xa0\x17D\x9dp\xb7\
-\x93\xe0\xd3\x9b3\xcf=\x93w\xd6\x82\xf9\x14|\xc0Q\
-\xb5^\xad\xd6k\xc8*\x88H\xe1:\x22tlB/\
-\x10\xca\xd5%lAs\xd4)\xa3\xedj'O\x8f\x19\
- \xb7\x8c\x85/\xdcY\x91\x84:t'\xd9\x87\xe9X\
-\xe9d\xedf3h\xcf\x11\x90\x12\xb4\xc5YB\xa7@\
-\xe5\x05\xca\x86\x19\x9aN\xbc\xaf\xc4\xa6?~o\xc9!\
-e\xd8\x01_<\xc5(\xc3\xa9\x957\x1a\xce\xb4\xbcg\
-n4\xf6Y8\xba\xd4\xd7n\xc9|\x11KRo-\
-\x9eF;\xe9\x8b\x8b\xa9z#\x05\xa1x\x1f\xae\x04\x95\
-\x95\xd8*FO/\xb0\x92\xbe\xbaZn\x04i\xbb?\
-\x1a,'\xf6D\xf4H\xa3\x19\xe2\x8c\x1b\xcb\xc4\xccY\
-\x91;m^\xb1\xb6\xddv\xb8\xfef\x96\xebk3\xf5\
-\xd5\xc6B`',\x1d^\xf9N<\x07\xe7s\x7fS\
-\xf8\xb4P\xf7\xb52\xe4\x89\xdf\xdbZ\xec\xedv\xf8\xca\
-\x19\x1f\xa5\xe0\x04\x08w!\xa1\xd7\x5c\xc9\xcf\xd2\x5c^\
-\xbd\x1a\xb9\xb3\x89N\x10Y\x98C\x82ru\xaa\xb77\
-|F\x03\xa1lu\xbe\xd8\x0c\xd8\x06\xd9\xaa\x0b\xe0n\
-\xab\xb1\xb1i\xf45\x8b\x86\x92\xc3\x96d\x81\x85o\x85\
-\xf9\xd3Nd\xdbE^R\xbb\xed\x05z\x85\x1d4\x1a\
-B\xc2\x0c\x1f0\xe5\xe2-Kk\x19\xd8\xf7\x14\xc4\x8c\
-\xa8k\xe7\xec\xd8\x220\xfci\x12\x00\x98\xa3\xec\xd1\xa8\
-\x15<\x0eA\x5c\xde \x5c\xc2\x02tP\x04,\xe2\xac\
-j\xbfz`cIC[9f\xd7n\xd1D)r\
-LC\x146Lxa\xea\x02\xd7\xd4` \xa6\xb9\x9e\
-\xc5\x06\x8f\xad5^\xa7i\xc0=\xa3C2_\xc9\x88\
-\x9f^\xa7\xd1\x8bF\xcc\x99h4\xea\x0d\x13\x7f:\xcf\
-v\x80E0JN\xee\x88\x02\x16J\xcd\xe2\xaes\xe6\
-\x18\xf8\x82\xc0\xcfb\x98\xea\xeb\x88\x84\xafR\xc3\xb44\
-o\xd7HT&[*\xb6\x8a@\x8a\xa4r\xb8\xd9\xd8\
-xF\x18\xa9\x99V\x03F\x1b\xb5\x01\xc9\xc0\x18\xb4X\
-\xdc\x08\x85\xd5\xd7\x1be\xe0\x87\x8a\x15\x04\xa1\xd0\x86\x10\
-\xa0XA\xc1\x0dp\xd7\xd7\xea\xd7e\x1e$\xa0@\xc2\
-\xaf\xd5S\xaa\x14\xea\x10TS\xc5\xbb\xc5r\xa5H\xde\
-\xbe\xa5\xaas\xe2@\xf2\xea\xd4Bi'\xe0c\x8c\xba\
- \xba\x9bY\xd7\xa2\xe7>s\x05\xef\xf2\xc4\xd3J\x90\
-\xa9;\x0326~\xc8\xe7\xc2\x7f\xd6\x8d\x1f%Fb\
-\x17-\xf59\xbe\xd3\x07\xf9pW\x8e\xf7l-t|\
-\xbd\x12\xd4\x90\x048/\x0a'k(\x9a\xca\xbeT/\
-C\xa4\x07C\xd2\xe6\xaa\xe7\xbc|\xbc\xe38,Q\xb7\
-[\xd1 Q'\xd7\xfc\x8e\x0bw\x84s\x84\xbc\x1e\x0f\
-\x01\xf9\x04\xce\xc7?\xd1\xd6\xf3o/4\x9f\x22\xbd\xb9\
-(\x0ab\xbeBQ,\xae\x17\x0f\xcd\xbd\xc5\xea\xca\x08\
-\xcfy\x81b+--\xf2\x22E.a$Q|\xb2\
-w\xeb\x03\x1aM|U4\xc7\xf1\x14\x83\x99\x9a\xf8\xea\
-*\xe1kJ\xa6D\x16-\x94.\x81\xbb\x16\x9e#\xc4\
-(\xbb\x1e\x8bYk\x94[@\x8d.\xa0e\xbd\x8b\x17\
-\x96\x83b\xe9\xe2\x85j\xd0*\x92q$\xff\xd4\xddr\
-\xb0\x86V\xafO\xa5\xa4\xf7(\xff\x94|F\x1f\xdc-\
-/\x04\x19\x0ax\x80\x0ep\xc2)V2Mt\x85\xe5\
-\xf7gs\xa7R\xa7/^\xa0v_t\xfa\xe8\xb7\xcf\
-\xb9pZD\x5c8-\xaaA\xee<%<\xd9\x9e\x0a\
-O\xfc\xf9\xe1\xa1'O]t\xacm\x5ci\x104\x18\
-}\x04F!{_\x1a\x17/\xd0#\xfa\x14\xd2:\xff\
-\x948\xf3\x9eJ\x89\x0b\xdbS(\xd9q\xe4\xb1Z\xfe\
-\x02\xb3p*%\x8f\xd8\xd8CB\xc9\x05LJ\xbb\xd8\
-\x15{=\xa7\xb1\x07\xd8\x1d\x1c;=\x8b,K4n\
-\xf3\xc4\x13\xf0E\x0f\x5c\x0b\x09\x0b\x80\x85qiA\xf9\
-\xf88B\x0d%\xfc\xd3\xc0?\x94\xf9\xb1{L\x08K\
-\xb7W,\x91\x0eb\xccNF\x82\xa19,\x0bgu\
-\xe4\x1f\xd51=c\x1c\xda\x07s\xde-\x95C\x1c\x84\
-e\x06\x0aP\xfa\xba\xb7\xe1=?r+21\xd8\x7f\
-&\xe7\x85\xd6P\xd9\xd93;\xf4\x14w\x1f\xe6z\xd4\
-n\xcd\x00\xe6\xad\xbe\x81!\xd7\xf5\xaeD\xc0\x8e\x85%\
-\xc4T:0i1\xe2\x8a\x80f\x11)\x88\x0c\xc2H\
-\xc8\x95>\x7fp\x08\xc7VX\xe6\x98\xad\xa7oyW\
-\xdc\x11\xe4\xa7\x9e\xf75vO\xf1G\xb0wK\x13\xad\
-\xb83\xf5\xf8\xcf\xeb&\x16Y\x8b\xb5\xe2\xdc\xee\xe2-\
-\xf4\x9b\xa69S\xbb\x95\x19\xc8\xa1\xed\xc5c\xe1\xdc\xe6\
-p\xae08\xd2\xdf\xda\x15\x01h-\x8b\xe7U\xe8\x0d\
-\xcc\x8f\x8b\xac\xc6P.\xda\xb7\x88n\x18\x98\x00\xac\x8e\
-?\xe7DG ~\xf2\xf1\x1c:\x1f9\xa1\x1bG\xf8\
-\xbe\x81\xea\xeb\xc1\x1ae-\xc0\xf1\x8eX%\xf1\xd6\x03\
-\xce\xe5S\x13~\x7f.\xe7\x95\xe9a8\xeedp\x06\
-\xe4\x16\xce\xf0\x0c#<=\xce\xd1\x19\xb2\x00\xfc\x86(\
-\x86{\xae\xb0\xc3\x95%\xfa&\x95\xcd\xe9\xaa\x95\xda\x0d\
-SY]\xa1}\x9e\xfaA\xae\xf4<\xf1\x0d,@%\
-\x85\x92@`n\x90\xb7I\xa5\xc9\xb5j#(\xa5Z\
-\xf5T\x13\xce\xeb\xd2\x92g\x0a\x97\xa3\x9b\x9a\xdf\x80U\
-E\xd5\xf69O\x0abNu\xb8\xeaC\x19&\xc2]\
-\xe7\x85R_\xfa\x85\xec\x0b\xa5\xa7\xdcQ\x08=9J\
-\xdb\x8e\x1bf\xf5\xb9\xad_\x02B\xdb?}\x02\xf3N\
-\xb5\x085\x0d>\x14\xb6\x81\x90\xaf\xf6\xf9 \xf8\x02\xe2\
-\x08\xbb\x0d\x95\x09(Z\x8f\xe7\xb4\x5c~bF\xe5\x9f\
-t:h\x90\xa7Fr'\x8aoX\x889d\xfcS\
-\xed_\x83F\x9d\x86\x14\x86vv9\x10C\x9fj.\
-\xd7W+\xa5\x14pm\xa9\xf9 \xf52\xe4A\xfeI\
-/|#h\xe0]@ba(XL\xad\x88Lp\
-\x80N\xa5\x83\xecR\xd6K\xa1\x98\xfcI\xd7\x09\x8fl\
-\xe8\x93\xd4\xefx\xf8S\x9eK\xb7\xb6\xba`\xf5\xb9\x9b\
-SU\x85\xf2Vi;_\xe3h\xd9\xce\xd5#\x02w\
-\x81U\x8595.\xa0\xb3\x0d\x09P\x80\xb94}\xfd\
-\xd6\xcc\xc44\xf7\xc9\xe9I\xcf\x81P\xff\xcc\xcc\xd83\
-\xf2\xe6R\xb5#{U\xa46\xbd\xb5b\xa3\x16\x00\xdd\
-\x16^\x1b\x92\xabA\xe7\x06lQ\xe6\xcd\x9c\x02\xceU\
-:\x97\xc8\xe6\xa0\x11W8\xcbU\xd1t\xfa\xc0\x99,\
-\xca\xc9T\x8a\x14\xe2\xa0\xd6^\xb3\xd5\x00\xfa3\xe8\x8e\
-\xca\x06\xfb\xb2\xc1Y<\xdd\xdc\x0a\xe6\x9f-\xb7\xf2\x11\
-\xc0\x99\xe2b\xb1Q\xee\xed\xed1 \x85\xbe\x99\xd1\xab\
-f\x97\xb0\xc81\x94\x0a\x02\xb3\x1b\xb9\x10%e\x848\
-\x04,\xe0\xe6UJ\x04h\xa2\xb4\x14\x8cZ\xaabQ\
-s2wA\x0e\xb8\xef\x84\x03\xe6p\x7f\x12D\xfd\x12\
-\x06\x17\x92\xb6\xb6\xf4\xe6\xc3@H\x87\xcd\xb1\x06Cn\
-\xd1\xe06=L\xa2D\x22\x13*\xe3\x8b\xea\x0b\x85n\
-\xea\xb3\x1f\x1f\x14\x8b\xef>\xdfy\xa1\xf6B\xcd\x89\xc2\
-H\x07\x09O\xc6j\x1bk\xc5\x0d$\x85\x14L\x01\x15\
-L)T\x81s\x1c&\x8eb\xd94P\xeef3u\
-\xfdY\xa2\x89\x94\xd7\x83\xc3\xf3\xb5\xf1\x89)\x8cA\xce\
-\xb3\x5c[\x0dR\x90\x22\x80,\x089g\x08,\xb4\x8a\
-%\x09\x91\x8a\xf7\xc5\xc2\xc8\x96K\x16\xf2\xd3CD\xaa\
-Q\x0d{\xed\xf23\x86\x09)\x09\xe5\x93\xccU\x84\x19\
-\x84( V\xfd\x88\x98,e\x89FV'g\xdd>\
-\xb1~O.\xa1\x9bI\x8d\x8b\xf7\xba\xcd\x89.\xe4W\
-+\x9d\xe8\xae\x97\x08'\x227\x9e\x85V{v\xa2\xe1\
-o\x02\xda\xe67%\x96+\x83\xe0!q\xb8\x05\x9dB\
-?\x87\x9es\x1b\x8e.)\xe9\x0d<U\xaa\x07\xcd\xda\
-\xa9V\xaa\x19\x04U\xb1G\xae\xe0\x01$%\xe4\x15)\
-\xf1\xac\xba\xb2\xe1\xa5\x9a\x0aWh\xf7\xac\xab\x0c\x82F\
-\xc2\x9e\xbb\x91Z(\xae\x92vn\xa0\xed\xc0\xf5\x1aE\
-\xa1\xa5e,6\x1f\xc0\x8e\x1c\xa4Vk\xb0\xb8J\xc4\
-\xb2\xa1\xbb]t#?\xe7\xe0\x8f\xa5\xbd\x93x\xb1\x5c\
-\x0bZ\xa9\x89\xf5\x95J\x1d\x91\xb9!H}\x93 G\
-\x04\x22\xb5RYE\xa7\xda\xf0\x7f\xbak\xc4\xfa\x80Y\
-X@l\xd7\x9a\x9b\x15\x0ey\x1bE\xe1\x8d\xb7Q\xb4\
-\xd4J\xf1\xa7\x9a\xe1\x80\xc0\xc6\xad\x80\x94\x9b\xa9J\xb9\
-Z\xc67\x0d]\x0fK\x13{\x1d\xac\xaf\xe0\xd2\xc3\x0d\
-\x09\xf3\x8ayM\xad\x00#W\xd9\xc06\x09:\x8a\xee\
-\x88\xe9\xe3\x98\xb9\x83\xc6\x89\xe9Q\x95\xe2\x5c\xd2\xde\x5c\
-F\xbf\xdf\xa4|\x80\xfc\x10\x0e\xd2bP\x84\xc5\x06\xc9\
-\xf8`\x1a\xd8\x1eu\x1b(:`\xb6\x0d\x9b\x8dpT\
-\x03I\xd8 \x9a\xf84\x8c\xfbb}\x1d\xda(\xbf\xbe\
-\x84\x8dl{(\xd6\xdfdX\x05\xe1\xa8y\x10\xc0)\
-\xd4\xda\x10\x90\x8c%\x8ei+\x8dr\x9d\xf0\x08\xc89\
-\x8a\xba\xd7\x96\x03|-\x8f\xe5\x83\xea*:\xad\x87i\
-\x9f\x9c\x18\xc6\xb4\xf9\xa0\x02\xc7\xd8\xd4\x0cG\x07\xacK\
-\xe2\xc2Z\x19\xbai_#\x90\x11[#\xef\xec\xb5\xae\
-\xa8\x1b\x01\xe8tS\x0e\xb4\xaf\xbd\xe1\xf7\x94|\x95x\
-\x8e1M\x9e\x1c\xb2J\xbc\xf8\x08\xe6\x19\xe5\xf7\x07\x92\
-@\xc5\xf8\x8c\x22+5\xea\x8c\x95\xb8q\xd2>'\x82\
-)\xa4\xdb\x1e\xc2-\xb8y\xd9\x9e\xae\xb82\xde.\x12\
-\xf7\xcf9<J\x88\xa8\xc5\xb3\x8a\x1e\xd2\xf7\x96\xbab\
-\xf1\x1b \xdc\x17\xe0\xa42\x22Yi\xe6\x8d\x9eY\x93\
-WN\xb4\x81\xd2\xa2P7\xad\x00\x0a\x9f\xe26n\xd3\
-\xbc\x0a\x179c#E\xd7=At\x83\xceF\x15F\
-L\xd2 \x87'\x17\xa2\xba\x8b\xa5x\xfd\xd8\xa5\xd5F\
-\x85\x9du0\xdf\xcdi<x\xe1W\x8a<\x94V\x84\
-,\x0ae\xa7\xa9E\xc8I\xca\x9b)\xf4\x8d\x8el9\
-\x94\x87\xfd\x0e\xfe\xaaC\xcc\x0b0\xc4pb\xd9\xda\x0a\
-y\xf5K\x0a&r\xe9\xf0\xc5xt\xa4wE`\x85\
-\xef\x16\xe1xY^\x01\x02X\xae \xe6\x16[(\xb9\
-,\xd7\x82f\xa8\xa5`\xb6%\x9bJ\xfd\x8bQ\x8e,\
-v+\xe8\xb0`\x05sq\x0a\x1at\x0a\x9a\xeai\xa8\
-\x02-f\xb2x\xe1\x11\xdd\x95\x9e\xd1{|\xca:3\
-;6{s&{\xfd\xd9\xde^\xde\x97\xcbP9t\
-\xe6\xe9\x22TI'\xbeJ\xf2P=\xd9\xefxP\x13\
-\x1e\x8d\xc33\xc7\xd5\x1b\xc2\xf3\x9aoX\xc9\x10vQ\
-#\xcf\xf41\x0e\x80'\xea\xbc\xbd\x02\x19n\xd3x\x80\
- \xee\xd0\xed\xe1\xa5\xd0\xc4.:r\x14\xb9Q\xd4O\
-\xaa\xf6\xd2\x1eSo\xafYcuE\xbab\x08G@\
->yyQ\xd5\x9f\x85:\xd6\x04\xd1\x93g\xb4M.\
-\xfd\x0f\xe1\x90>\x08\xb0\xac\x8a?\xb3\x01\x1a\x0e\x01\xd9\
-\xec\xf1J\xfe(l\x92\xba\xe7Ol\xb3g-M\x0d\
-I.+\x92\x13\xd8\xbb\xc4\xaa\xfc$@\xd6\x96\xfb\x96\
-\x16u\x86\xa0\xf1\xb8\xf6\xe5\xaf\xd87}\xf5\x1b(\xc7\
-\xd8\xb8h\xb8a\xf7\x8a\x02\xb4Jay\xd3>\x22\xd5\
-\x8fC\x06\x08\x97!r\xc2\xc0\xe7\x97R/\xc397\
-\xdcL=|\xc4\x90\xda\xa8\xaf\xc2\xdeSK\x8dUZ\
-\x99q\x14\xbb\x22_\x06\xe1hC\xc5\xe5R\x9fo\x15\
-\xcb\xb58P|\x02\x0c\xecZ\x16O\x0f\xd3\x01l\xd7\
-\xc0\xd5,\x17kK\x81\xc9\x80\xa91\x1a\x05N!B\
-?\xea\xc6y\xde\x8d\x08\xbe\xf4\xec\xb5Z\xac\x88\xaa\xa8\
-w@~\x94~\xf5\x17\xd9|\xe4\x0c\xb8&\xe2\x0c\x99\
-\x88K\x0bF!\x5c\xf2\x92q\x11\xab\x1e)\xd2\x9d\xa6\
-\xef\xa0~!\xba\x89*\x92q\xe9H\x0aKQW\xd1\
-\xf0)\xae\xe9a\x7f^Wr\x0c\x0f\xc0\xc3x\x00f\
-;\x91\xfa\xc0\xa2\x17\xcf\x09\xb1\xce\xd8\xea\x12\xa9&J\
-\x8fS\xf9\x81\x9c\x173j\x9cO[Alm\xe5\xdc\
-\x0b\xe7=\x9b\x95\xe2\xbc\xe8\xc2\xd6\x16\x9dI\x87=\xae\
-Q%\xd3<M$\xda\xb1\x8a\xb6\xeb\xa9\xa3\xad\xb1P\
-\xc9\xbb\xd5\x9c\xe1\xc6\xd6)H\xcb\xca\x9e=\xb7\xee\xa7\
-^e&\xbf\x14\x82\xcd\x8c\xcfJ\xdc\xd0x8\xe8\x91\
-\xc7\x9b\xa4i8\x8b\xd3\xe0\xc5\x0d\x80\xc7@\x84\xca\xd5\
-*\x82Kq\xc2H\x91\xa5Vg^q\xb4|Z\x8a\
-\xd4\x19\x22{\x80b\xc3\xa7\xfcl\xd3WWI\xd1\xdb\
-\x92\xe8!}\xe8\x08\x038\x01Xy\xab\xa8z\xe2\xaa\
-\xf7\x95\xd2\x02P\xf4\xd4\xd2\x13\x0c\x09\x19\x05\x9a\xbaN\
-bU;GCw\xad\xe6U\xa3(\xe1\x8a\x1f\xeb\x85\
-\xa3\x04\xaf.\x1d\xdd\x11U\x9fJ\x10\x0a@^\xd4\x22\
-M\x93\x89\xd4\x81TV\xdb\x1b4q\x05'\x1a0'\
-3\xa2h\x94\x86a\x16\x13G(\xcb\xa8\xb8\xb2\xf1\x9d\
-T\xda\xe9\x8b\xf2\xf59\xae\x93\x170\xa2H\xd6\x18\xd1\
-\xee\xe8\x11h\x9a\xd5!\xdc]\x16<\xa1\xc2\x138\x9e\
-\xb2\xba\xc18ET,1\xa1I\x9bA\xcc\xe4Qf\
-\xa0\xe0Yb\xfb#\xe2/\x90!\xbaF\x7fL\x84\xc0\
-\x8bS\xa2x\xa91`2\x9d\x08\x1e\xc3\x90\xe8\xaa\xbd\
-\xe9w\xd0\x00\x08\xe7\xa8\x88\x88\xc0\x0a\xb9\xec\xdbD\x89\
-\x22`\x84up\xa51\x93\xf4\x5c\xd1+\x16bZ\x0e\
-\x9b\xc2~S\xbe\x07}\xa7\x84\xd6\xdb0(\x14\x09\xf2\
-E\x1cgA\xb2\xed~{'`\xb3\x1b'\xd9\xb7\xae\
-(Dw\x05r+\xf2\x00\xc5\x97\x96\x82\x86\xc9\x22p\
-\xc196^]\xbb{\xa1\xba\x8d\xb9\xef\x03\xf7\xba\xa6\
-\xa4.@\xffT2\x8b\xedX\xc4\xed\x0c\x19\x0f5\xc2\
-\x8e\x1e\x87\xacb;\x169\x06r\xc8(r\xc0I\xec\
-\x11K\x93\x140\xb4 \x9bf\xf6\x96\x09\x07\xd3\xdcz\
-\x0a\xb0:8\xb7x\xbe\xe6\xe8X\xf0tL\x90\xbaP\
-\x0b\xb0\xa3\xc8k\xf5\xabS)\xd4\xbdt,\x08bG\
-\x0b\xa5N\xd5vM\xd8J\xeb\x03\xc57J\xdd\x834\
-@\x8e\x85\xad`E\x9da\xabH[R\x05oS\xf1\
-&\xac\x1c>CJ\xab\xf6\xc87\x9b\x00\x04\x86\xf1J\
-\x19\xf9y9*\xb3\xc1\xf3\xa9e\x8c\xc0\xd5%\xbbQ\
-\xf0\xa2lq\x08\xe1\x22\xc5V\x94J\xa6\x1aK\x93\xad\
-Q\x84\x14ew--cS%\xe7[\xceA*\x0c\
-\x17\xcc\x9cxi2+\x96\x10d\xc6PJ\x05e^\
-IB\x9d+\xc2r\xa3\xfc\x85\xc6 \x1fj\xd0O,\
-\x1f\x8e\x99,G\x0c\x1d\xe9\x06\xe0o\xf7\xe5.\xd7W\
-a\x16Ti\x11\xca\x9c\x14\xc8\xb5\xfa\xbfRFT\x11\
-\xa2\xaf\xa8(\xe9/\xe4\xf12,pl\xf3LO\xf8\
-\x00\x84\x1c\x0ey|\xc5!\x951)\x15\x95\xc7\xc7?\
-\xfa\xcc\x1a\xecDqa\x14E\x91\x12\xdd\xe4G\x01\x18\
-g\xe0xq\xe6\xe1/4llj\xd6\x82\x22\xe3\xca\
-\x0cR\xf8\x05Y\xc7\xaf^v\x22\x0a\x1b\xab\xadm\x03\
-Sk5\xea\x15\x02#\xbe\x10\xcc,\x8a\x07\x14\x9cn\
-\xc0\xcc\xa0!5\xc2w\xfc-\xa8\x0f\xd7\xb5!\xd6\xd3\
-0=\xf5\x10\xafdHC+\xa7\x7f`\x08_\xa4\xbc\
-Lw\x88\x8e\xab\xa7\x0d\x0e&\xa7\x0d\xe5\x92\xd3\xce%\
-\xc3\x1c\xc8%\x97\x1b\xe8\x00s\xb0C\xb93zZ\xc7\
-\x95\x19]\x11\x88\x95\x19\x86\x0b\xd1tZ\xb6\x9e\xb6\xb1\
-\x16\xa3\x9b\xfbH\x12\xe69\x8d\x10\xb8\xb60B \xe6\
-\xca\xe4\xca\x00\x22\x90\x92\xf7\xfd\xc7\x81\xf2\xe4\xeaa \
-L\xe8\x5c\x81 T'8)|\x0e\xc4\xac@\x09&\
-\x9d\x88\xd2v\x095\xbaR5a\x0a=\x08\xfc{\xf2\
-\xe1\x84Cr\xb9\x16\xaa\x94QH\xe9\x91\x9d\xa0\xc3\x0c\
-\xc81\xbb\xcf\xd3p\xe6\x91\xe3CR\xb1f+\xa5\x82\
-\x05OK5W\xa7\x13\x9d\xe9\x93\xa9\x08\x9c\x9a\xe1T\
-\xc9p1*\xe4E[$/\xa4]\xe7\xb6u*z\
-\xf5\xc6\x15 ]\x15\xa2\x9fSA\x8bK\x15D\x82\x85\
-\x88\xce\x91\xccL\x8a\xcc<M\x80\x06\x1d\x0c\xa5:\xc6\
-\x88*\x91\x8b\xa7\xfaE'Z\x0b)\xa3\xe3a\x04\x1d\
-C\x1ax\x8ayl\xe0h\xc1\xa8V\x920$t\x94\
-\xde\xc4z\xd1M5\xb2\x96\x185A\x16\x11&y\x11\
-;\x80\xdf\x88\x00\x8b(\x91\x22\x9c\xb3\x11\x14\xc5T\x1a\
-\xd3\x03l\x94\x14\xb1\x13$!pG\xb2\x12M\x8bB\
-\xf31\xf1>\x90~\x0a\xe2u\xa1\xd1z\xac\xc3\x86\xbb\
-\x0a\x02\xb0It\xd0\xc2\xad\x148\xa64\x1d\xc5\xdcn\
-\x80E\x00n\x05\xf3\xaa\xf8Z0\x7f\xc2\xc2\x93\xf4\xb4\
-C\x16\xa7w\x1e\xeecvefv2\xec\x0b~?\
-Fg\xb0\x98\xe8\x8d\x00\xd0mw,\xad\x19k\x16k\
-E\x5cY\x02\x1e\x05\x05\xab~\xd2Azf\xa3\x11\xdc\
-\x80q\xa9T\x8a\x02\x16F\xa4d\xcccA\x9b\x0d\x1a\
-\xd5\xa0\xc9\x80\x89\x88\x13\xc3\x9a\xc2K9\x94X5j\
-\x02\x18E\xa4D\xcc\x89\xa1]\x0b\xea\x13\xab\x95\xa0!\
-@A(E\xc1.\xe0\xc4\xd6\x22\x93\x05I&K\x0a\
->\x85\xf0\xcb\xba\x1ae\xaev|c\x13\xef\xcc\xc3'\
-\xc5\x9e#%\xa9\x8e\xd1\x01I{!\xaf\xfa\xe2yc\
-G(\xa5\xb6%\xd4\xe9\xc6*\x15\x81\x1e\xd9l6<\
-D\x89\xab.\x86c\xc2\xa6\x84\xad\xf9\x97\xf9\xbd\x089\
-\x06\x99C\xa5su\xf1\xf1b\x03\xad\x19\x14,\xd4\x91\
-\x17D\x1e\xa6\xbc\xb4\x5cA\xf9$\xca}\xc3\xf3EI\
-\xcbt\x5c\xfd\x96\x19\x19[\xc0{\xb9\xf2|\xb9Rn\
-\xa1\xe2\x8c\x1e.\xc4Z\xa5\xdfMFAv\x94+j\
-Y4\xb4\xe0\xa5-]\x9e\xac)g6\xa4\xf3\xb0P\
-Y-\x05xL\x84\xd8\x94\x88\x06\xf0\xe5(S\xbc;\
-SRb\x15I\x08\xedH%\xf2y\x95V\x03O\xb0\
-\x1a\xa7\x1a\xe0\xf1\xa3\xa3\xe4\xab\xbb\x89\x17\xb9oNO\
-\xb1Y'\xb0\x10e\xcez\x88{\xd1U\xa8\xba\xe5\xa4\
-\x9b:\xbc\x97d\xf8\x17\xe5\xf2:\xd6\xdc\xb6\xf1\xd9Q\
-e\xf2y\xbf\xf8ME\xeb\x88\x99\x0f0\x8b\xe0k3\
-\xf6\x16\x80\x82\x85\xe8\xb5\x9b\x1bw\xbc\x1e\x0a\x9b\x0c1\
-\x8b\x97\x96R\xa9\x98,O?\x8d\x1b\x07\xeeP\x9c\xe7\
-F\x16\xf5\x14\xa7\xe5K\x882\xa5\x9f\xa5\xf4\xe4\xd4\xa1\
-\xbc\xc7\xf7CI\x0f\x9er{{\xe5\xa9\xbbG\x8fG\
-\xcbC<\xec\x8bS\xb0\xebi\x95\xe8UJ\x7f\xcc9\
-\xef\x8c\x0b\x93~\xb7\xbc\x84fW\xf0.\xf19\xa9V\
-(o\xa1\xe7R\xe9\x020>\x8dz\xb94\xe7\xa6\x0a\
-\xa7]\xf98\x88#\xb3v\x17BF\xad\xfe\xf6G\xa7\
-\xad\x06\xd8\x94\xa1\xa7\xdddqj\xda\x0d\x8bi\x92\xba\
-\xe8~\x19b\xe5\xad\x82\xd2\xab\xb5I\xf4x\x1c\x06l\
-\xb7\x7f\xc7L\xa5~\x9cs\xa5\xf9z\xbf\x07\xc1\xb5\xa3\
-&F\x8c\xefq\x8dd9\xad\x5c\xf8\xe7i\xa8d\xfe\
-\x13[\x19\x0a&\x8ficL\x80\xc9\xe3\x1e\xb3}&\
-#\x9b\xd8H%\xe4<\xa6\x8d\xa6,\x94E=f\x0b\
-\xcd\xcd=\xb1\x85|\x83:\xae\x99\x97m\x1a\x08f\xfc\
-c6\xd8\xb2\xc1\xeam>\x16\x82\xbe\xa7'v\xd8T\
-u\xb1wU\xe6\x8a\x91\xf5n\xbb\xc7\xae\xc8\x8cv\xb0\
-\x1bz\xfb\x9d\x82:\xd7\x90\xdd\x9e\xe9\xa0X\xda\xb0?\
-B\xbe\x1e)\x87G\x12\x16u\xa1@G\x06DSe\
-C\xe0\x04\xd8\xac\x9f:\x5cN\xc6\x89\x96\x19\xcf\x5c\xbb\
-\xbb\x1d\xd9\xc4\xb7\xa6\xce\x0c]\xbb:\xa4n\xe3iW\
-\xb1\xa8hJ6A\xe8\xb6E\x82\xc96\xcbK\xb5b\
-E\xcaO\xf0X*\xc6\x033\xa3f\x0d^\x88\xe3\xad\
-\xae\x04\x98\xacxO\x0e\xe4^\x82\xe3\xac\xdbN\xb3\x19\
-\x88fc\x16\x9f\xd5\xca\xc0\x187f4^\xacT\xf0\
-\x02<n\xbd\xc9\xb5\xcf%r\x07\xa2\xfbQkP\x9b\
-6\x10z~\xa8U\x8b\xe1\xd8\xdbr\xbc2znb\
-zf\xf2\xfa5\xdf\x19\xc8\x9e\xcb\x0e9^\xf2\xdbl\
-ofbvv\xf2\xda33\xda;|\xcbm\xd2H\
-\xf4\x1a8\xdc\xd2\xd4c\xe0\xe8r\xbb\x89\xbe\x12B\xab\
-\x0fA\xa3\x81\xdb9\x19\xaf\x90!ieN\xbam\xa0\
-\xd8\xe9\xfa\xda\x88x\x18K\xa5\x85\xfd\xd1\x85\xc0w\xd4\
-+\xc6\xe2\x92\x80A\xd6%\x8a\xadVC\x06e\xedE\
-\xe6d\x8e\xac\x04T\xa9<=2..)5\x1f\x8a\
-\xebs.8}\x10\xd9\x87e\xfa\x1c|\xa0\x17\xde\x13\
-\xa2B\x15\xde2\x939\x0d\xd9\xe8\xe6l\xfdNP\x1b\
-u\x9c\xbc(\x9eV\xdd\xc0('\x95\x02>B\x5c\x01\
-\x0bKz\xa81f\x5c\x02\x87\x09s\xe5\xc2(e\xa0\
-KE\x1e\x1d\xbdd\xa7\xaa]7\xcf+\x97\x16\x9d\xf1\
-\xadC\xb1\x81\x1e\xc5B\x18\x94\x1bzT\xc5\xf7\xec\xf8\
-\xd4pD\xf7\x9fd)>j\x1b\x85\x8bN\x1f\x01\x15\
-\x8ffQ!\xf2\xc2i\x91\x0eI\xf9\xb0\xc7,\xcf\x0b\
-5\xc7\xcd\xe7P}$\xea\xf1\xd6V\xbf\x1e\x01\x1c\x99\
-#c\x80\xbb\x1bM\x1a\xff\xbc\xb5IPC\x9fQa\
-\x1f\xfe\xedS\xb9\xa3\x16\xb6\xbd8\x22\x98N\xa3K\xc1\
-bq\xb5\xd2j\xfa\x80\x1bH%\xc2\x07\xe8\x88R\xa3\
-\x84\xd9\xf8\x12-zZ\xa7\x0a\x88\xa9P!:\x024\
-EI\xac\x0c\x0d\x12\xc1\x94`\xf9\x85\xfa\xcaFh)\
-\x8f\xe2=\xd4\xcb K\x07\xf8\x11Y\xd1\xf30\xab\x1f\
-+\xd3\x14\x98=W\x10(\x8cO\xc1zX#\xe5<\
-b\x1e\x18\xd8\xf5j\xa5\xd6t\xcar\xaa1rk\x0b\
-\xff\x0a\xc48E\xc9>74\xb56H6\xa6\xfa\xcf\
-\x9f\x1f&:vZ\x9e\xf3N\xb9\xd2\x15N\xd8\x1dW\
-\xd7\xa0P]w\xb1\x13sd\xed\x03\x9b-\xbezT\
-\xaaE\xb5bkK<)D\xe8\xc2\x96\x8b\xfa\x82n\
-\xa9rQ\x02=\x81(\x97\xc8\x1e\xa0\xd7\xef\xca\xae\x8b\
-\xf4\xa8g\xe5R\xdf)\xdf9\xd5g_\xffiU\xc4\
-\xed;\x05=3\xb44h\xee\xcc\xe5\x99FgO\xd4\
-!JF\xcd\x0cXb\x09\xbdRY\xd0\xb2LZ\xbc\
-\x09N\xb3\x09\x80\x9d)\x82\x22\x8d?+\x8b\xca\x91\xc9\
-\xe7(\x8b0\x10\xdd\xa3\xf2D\xbdT9,}\xfd\xea\
-j\x1d\xfaI%D'\xf5E\xaf\xb2\x09\xcb\x91\x08\x91\
-\xbc\xb67d\xb7G\xd1\x88\x0b\x85\xc5\xb2\x02\xfa\x85\x8e\
-\xd5<\xad\x18s;\x8b\xe5i\xfd\x8cO\x8d\xcd\xccH\
-\xdc\x14.W1go/\xc53\x8aF\xd1\xaer\x85\
-T$\x0b\x12\xc0\x03\x8c\xb5\xeaU\x183\xb5\xd5d\xd5\
--\xb1\x00>;\xf1\xbc\x84\xef\x5c\x9f\xbe\x8c\x97\x867\
-P\xc63y\x0d\xfeNOLQ\xc4\x04\x06\xc6\xa7\xae\
-\xcfL\xe0}\xc3\xcdk\xe3\xb3(Z\xb8vmb\x1a\
-~\x9f\x1b\x9f\xb86\x0b_\x05a\xf5\x01\xa0\x93u\xda\
-\xc2\x88\x82\x8c\x0a\x03QK\x9d\xab\xff\xf2|F\xb6*\
-\xe3\xf4\xa9L.U\x0c\xe8\xa0\x22\xe4\x92\xab\xd6\xef\x22\
-\xd7B\xef$`\xb1\x9b\x80\xc8\xb9\xbdH\xc4'\x7f\xd2\
-pmk\x99\xac\xb7\xe2\xcbZmbdls\xce\xcc\
-W\xd0\x06\x13!K\x93\xb7,\x8f\xcb\xac\xfc\xd6\xc8\xa2\
-N\xacPF&\xc2\xc6$R\x14-\xa6Y_\xad\x91\
-s\xa8\xf4)\x9a\xa7\x04\xe4\x12\xe5B\x04\x11hf!\
-\xb2\x11\x9e\x08t\x94F?\x1d\xa1\x89\x05\x14\x16\xc9V\
-}1%\xd1\x9b~b\xa6\x00\xc3W\xa9\xe9\xf4\x5c\xa6\
-\xaf\xe0\x8e\xa6\xd9\xdb\xd4-\xfc\xeds\xdd\xea\xeaWN\
-C\x0apF\x13\xeb+\xd9\xaf\x0clm\xe1.\x95\xee\
-?\xdd?\xfc\x94\x8a\x1ct\xa1\x1b\xa41\x98\x1e\xe4\x06\
-\x15\xb2\xa3\xb9>aR\xa1\xcf\x09\xaaN\xde>\x1b\xd4\
-\xb8\xc2h\xa7\xc4|\xe2:\x8c\xc6F\x15\xc9o:\x19\
-\xc0\xc2\x0c\xea\xa7-5\x8a+\xcb\xe5\x05'\x8fk\xe1\
-\xb9\xb1\xe9\xc9\xb1k\xb3\xd9\x99\xf1\xe9\xc9\x1b\xb3^,\
-Wf\xbe^)\xe9Y/]\x9f\xba\xace\x87\x1cb\
-\x0f\xd3\xb2]\xbb>}ul\xca\xc8\x92\x00N\xe6B\
-\xcc*\xb7\xf4\xe4\xc9\xd9\xb1\xa9\xc9\xf1\xa8G\xd4O\xc6\
-\xde\xd1\xdcrw\xd0HYe\xb4/\xed\x9d\xc8L\xd9\
-\xe6J\xa5\xdcJ\x931\x0b\x9bf\x5c\xcd\x17\x19\x91\x03\
-Z\x00\xe6\x04Ug\xc6Z\xe9\x1c\xf1p\xb5\x0b\xfe\xd0\
-\xd0\xc0\xf9\xa1\xad\xad\xa1s\x83g\xce\x5c\xf0k\xf8:\
-\xb9v\xb1\x7f\xe0,l,\x17\x06\x07z{\xfbQK\
-\xa8\x06\xbf\x83\xe2\xf7<\xfe\xb8!L\xdf\xe9}b\xdd\
-\xe9\xabEvX\xfa\xcf\x22\x8e\xdc\x5c\x01b>^l\
-\x92\x9f\x9d\x11G\xa8\x93\x93\xc9p\x7f\xd3\xe9\x05\xaeN\
-\x98\xda\xf0\x80!\xc9\x0b\x03\x1b\x1e\xb2A\xc2\xac\x86\x07\
-k\x01>qTF\x9c\xf6\x5cXYad\x01\xd9\xd6\
-\xb0\xee\x85\xc8\xe2M\xb9\xaf\xff\x82T\xbco5\x8a\xe5\
-\xca\x0c>\xdd^*\xb6\x02\x0f5\x87n\xc02k\x85\
-\x03\xd1\xd7o\x0cEf\xe8\xec\xe0@\xae/]\xcb\xe0\
-h\x9c\xbdp\xa1?\xe7\xf6\x9d\x1d\x1a\x1a<;bv\
-4\x84vL\x87=V\x19\x9a\xa8\x87\xf9\x10me\x00\
-\x1de5E\xc4\x85\x9c!\xe9\x92*f\xe9\xb8S\x00\
-\xbe\x977-\xef$\xf1\xf9\x98WX\xf2\xe26j\xd8\
-\x8e\x11j\x03\xa1EHf\xc8\xc7\xb0\xa8+L\x92\xc9\
-@!\x1b\xe5\x9c\xa8\xc1\xf8 V\x86LA- \xd7\
-K\x11#\x9eS\x9c\x882\xe0\xc3x\xd9\x8b\xfd\xdeI\
-N!\x9e~\x96\x90g\x87\xa85\xa3xt\x80Y\xa5\
-&P\x00-\xc2\xe6\x89HA\xe0\x1fr\xa6\xe8tn\
-\x004=\x197/\xcc\x01E\x1d\x92\x87,\xcb\xe9\xaa\
-C\xb5\xf8p\x98\x81\xd8\x14\xc3\x81\xfa\xd8XF\xedU\
-\x92\xe1O\xc1?*\x8a\xd6C\x22\xa0<\xf5\xb4L\x96\
-\xe91\x00\x17B$\xba(O\x96\xc0'O4\x17\x8a\
-+A\x09\xd0\xcd7\xd1/\xdaE\xe6z/\x5c,\xc0\
-\x86\x95\xb6\xfa\x9c\xddd\xf4\x81S\x8d\x88\x98\xb4Io\
-\xb6\xd0\x06n\xcdl\xfa)jz4\x0c\xa9@bj\
-\xc2\xee\xcc\x06\x0c6\xe6\x8b\xa7\xfa\xb4>\xe0\xc1(\xca\
-\x910T\x17N\xf3\x81hw8\x1f\x9f\xe8\x18\xa6h\
-\x03\xbe\xb9_]\xe9RH\xa0\xad\xaa\x11\xe60\x85\x10\
-Mz\xdeYAC\x90\x98\xd3A\xe0\x8e\xe6X\x85\xe7\
-\x9b\xe7\xf9V\xe4\x1c\x1f#/\x90\xda\xfc\xda\xc2WG\
-\xde\x98h\xe0\x04\xeb\xb2\xb7\xf7\xb8\x85\x19\xce\x87\x131\
-\xf1_\xd8$\xac\xa2l\x1e\x85\x98\x8f3\x0f\x1eJy\
-\xcc\xe1\xc5\xb8\xc2\x08\xfe\xed\xed%)P\x9c\xbf\xa7h\
-\x8d]\xee\xed\xed\xa1Hz\xdf.\x1f\x85\x0a\xe6\x05\xf8\
-9\xb2\xb1\xe4H|q\xec\x93J\xfd0\xa6\xd5\x9e\x13\
-;k\xe0\x89\x9bOw\x03T\xc8\x88\xbb\x81J\x05q\
-\xba\xfe\xb7E,9\xd9]b\xd51C$\xdb&N\
-\xcf\xfd=\xbe\x9f\xb4\xfd\x86\xc2\xa3*\xf9<d\xcd\xd7\
-J\xd8F\xc0\xe8\x90\xd8\x22\x84\xccIY\x07\x19p;\
-\x81\x09\x99\x1ed\xcc\x9a]t\x5c\x1ad\xa5\x908\xa9\
-X\xc8\xb8\x8c\x8a,\x04\xcaJ\x00t\xb9\xb5\xf1X\xb5\
-\xc0~\x93X\x93\xda\xb6\x81\x01|a}p\xa1'\x93\
-I\x85\x99U\x1b`\xbc2\x19H\x0d\xc2\xc9\x86\xad\xe5\
-\xf3\xf4W\x01&p\xc7\xdeV\xe0U\x01\xf2\x95\x0b\xcb\
-\xf5\xf2B`\xbd\xaf\x10\xf8\x17e\xea\xbaqb\x15\x8e\
-\xd7\x1bh\xdd8>\xbdt\xaf\xca\x1a\xa8_\x1a\x08'\
-+\x8e*&[\xa6\x15BA\x7f\x96\xdf#te\xa5\
-3l+Z\xd0\xa0\x8b\x03\xba|\x10\xef\xbe\xe5c'\
-\xf9$|b\xea\x86o\xb7\x19\xebo\xca\x97ay)\
-\xebo{\xa8[uszJ\x93\xff5[\xe5u2\
-j+L\xcd{\xc2K\xac\x84Ho\xba\xc8\xd8\xb3\xf7\
-\xec\xc4\xed\x91\xe4{\x18, \xb4\xf5l\xf3C\x10|\
-\xbbu#\xf94\x94~\xb2O\xa3\xb7%\xac\xaa\x9b\xcc\
-\x90\xad-)\xae\xb8\xe7\xa1\xe7.0\xd0\xf3\xe5Z \
-.\x85\xd2NdjW\xf9\x0d\xc03x\xf8\x82\x8f\xf4\
-\x1b\xf2\x9b\xca\x9ez\xde!\xa1\x8d\xe3\xa1\x01\xf5\xbcC\
-\xaa\xd0d\xba,\xf4\x08\x80^\x03(\x06X\xb8\xf3\xa4\
-\xf1\xacy\x1bP\x1e\x22\x94#\x80\xc1\x95u\xb4\x8d\x80\
-\x9e\x00\x22\x87\x01\xfdA55\x80&\xdd\xad\xfe\x05.\
-\xd3?\xc7\xa3\x88\xbc3\x0f\x8c\xe6\x1d\x08\xad6\x9a\x18\
-\x94\x12H\xe5\xd1`\xb1X-W6\x1ct\xa5CO\
-k3\xe4\xebG\xf3v@\xbe\x19T\x94\x10\x0f85\
-|eRQ\x8dG/\xef58\xee\xe7d\x98\x1e\x93\
-\xe3\xdb\x0bG\xbaa\xf2\x1c\xf2\xaf\x10zK\x08\x8b\x03\
-FCw3\xb8^P\xb2\xc3R\xd6`\x00\x12\xe3\xd7\
-\x1a\xc5\x15-r\x19\xb8\xe0\x8c\xb8\x9b\xc9;\x94\xea-\
-\xa2\x91\xb1\xb0\xfe\x97\xa9\x91\xebN~ \xd7\xef)\xb7\
-\x1d\xe8\xbfl\xb5\x89]\x1cB\x93\xf0Nf\x8d\xcc\xc1\
-d\x92\x92\xab\xf5\x97\x13\xd3\xee\xa0\xfd\xc1\xa4T\x18\xd4\
-Ls\xb9X\x82-&\xef\xe4`J\xfb\xf1\xcf\x00\xfe\
-yb8\x87\xff\xd3j\xef&\xb3hK79U\xcb\
-\x8e\xcf+^\x96\xe6\x9d\x95F}\xa9\x5c\xca_\x16*\
-\x9e\xb3j6\xb3W\xcb\x0b\x8dz\xb3\xbe\xd8\xca\x96\x1a\
-\xf5\x15\x01-}}q\xf1y\x7f\xc0K\xc1\xefm\xfc\
-\x1dG\xb4\xf3O-5\x8a\x1b\xa7\xbc\x94xd{7\
-\xf0O\xa1?\xb4S.\x10\x11}\xf1d\xe3.\x17\xf2\
-\x9b\x80\xf1\x880\xca\x89\x97Qd\x5c\x98\xfd\xc4|\xa6\
-\xbf\x8d\xae<wt\xe7x#t\xe1\x82\xab-G\xd3\
-h\xf1\xf8\xa1\xad\xe7\xc1\x5c\xe2\xa2\x9c\xa0\x7f\xf1\xae\x90\
-\xa9ON?\x22\x7f\x0c\xad\xfa\x0a\xfa\x8fA\x90\x0d\xac\
-S\x05\xd4J^A\x91\x0c\xd2\x8a\x047&\xaaK\x03\
-\xd0%\x80Y.\xa5\x9e\x18\x1b\x1bs,\xd8?\xdc\x19\
-\xfb\x87;`\xffpG\xec\x17\xa9:\xa195^_\
-m\x94\x83F\xeaZ\xb0v\xca\x93\x01c\x9a\x06\xce`\
-AI\xc0\x9ex:\x87\xff\xb3\x8f\x1dy\x96s\x98+\
-\x17\xe5\xc3\xc56\x09\xd4\xfdp\xa6\xb3Cj`\xfe\x0b\
-\xc6D\xa3\x87\xb9\x08%!5\x95K\x9d\x85<\xd6\xee\
-\xe6\x97\xe9H\x91\xdf\x94cC\x84\xaf\xa7\x5cE\xebK\
-(\x9b\xb7M\xfa\xf8\xf88\xcb\xd1\x01\xac\x1aK\xeb\xd8\
-u\x0d%O>\x1e\xe2\x8b\x18\xb8\xa1\x11\xe46\xa4)\
-\xfa\x98\x15h\xf9\x92\x1ay\x9d\xcb\xf5j\x11\x8f\x0d|\
-\xef\x0dU/\x00\x840\x9e\x8c\xd6a\x08 &\xc4\xc0\
-I\x07tq\xd7G\xe4t\x8e6\xfdedrL\x9f\
-G\xaa\x9c\xcd\xdb\x91\xd0m\xb4:;\xa2\x86\x84n\x8e\
-d_^4\xbap\x9c\xf3\xa3\x04\xedI\xf2\xd4co\
-\x8d\x22\x85\x9a\x93 \x80\xb3\x22|Lq-\xe8\xa7\xe4\
-\xe7Sh\x97\xa9H\xc6gf\x84\xf1\x99Jy\xbeQ\
-ll\x08\xbb5\xe4\xcc\xa0)L\x91\x01Q]\xae7\
-\xc8\xf4RY\xea\xdar\x8bLh\x9eF\x98\x92(7\
-R\xe8\x0a\x02\x0b5\xb3\xa9\xd4\x18V\x80\xb6\xcb\x82\x86\
-Gf)Ju4\x9fV\x0b\x84\xc1\x99R\x1d-\xed\
-\xb5\x94\xf9\xa7j\xf1\x8e\xb4\x99\xb3\x5c\x5cY\x09jY\
-\xd9\xe3\xb0\x0fR'\x1b\xf5\x80\x9eR\xdfO\xe5C\xf3\
-\x15\xc0\x11\xdc\x11\x8d\x11\x96M\x85\x0e\xbb4V\xd0\x94\
--\x17&\xa8\xce\xf6y)i5!5\x08\xdf\xc2\xc8\
-c*\x97\x1d\x80\x80\xb0'\x96\xc2O\xb2k\x96:\x9f\
-=\xdbG\xafM\xaa\x80`\xf0\x07\xf5UC\xb8\xb1V\
-J\x95u\x1afRhcM\x04\xfc\xc2!1\xedx\
-@\xe7\x03i+\x1b\x87m\x9aL\xd3.\x08\xd3\x1d\xc0\
-\x93\xceNO\xa9\x10>3\xdf0\xcda\x15I\x13[\
-\x18\xcaB\xe5!\x0dS\x94\x872\xb1\x8beh/\xa4\
-\xbdLbZ\xd8\xee\x19\xa9\x0e\x89m\xe7\xaf\x92\x9fR\
-\xa8\x80\x13\x08\xb5\xd1\xc33\xb2@\x06\xac\xc0j\x85\xcc\
-\xbe\xd1\x0b\xab\x14\xaa\x9f\xae\xae\x901$\xbc\xefN\xf5\
-\x02\x22\x00\x87\x9fJ\x17#\x93r\xa8\xb4\x93*\x03w\
-\xaf\xbd\xcd-\xb6\xdc\xd882\xad\xaf\xa7\xd4\xf7S\xa9\
-%\xe0!DS\x16\xc4\xc3\xcb\x14Q\xac\xd0\x1aZ}\
-\x91\x19B[]X\xc6W\xbf\xd8X\xdcP0\xd1\xb0\
-&\xe6\xd1\xbc\x8a\x91C+-\xe5fU\x18TC\xf4\
-\x94\x16\xc6\xa2\xa91\x9b\x18j\xceA\x13\xd5\xf7S)\
-\xe0eE\x0b\x9bd2\x85\xa0Wd\xaai\xad\x8d\x06\
-\x0b\x87\x83\xdc\xadSc\xa4\xe9\x97\x94d\xc4E\xadz\
-\xbd\xf2\x15\xae@1\x0c\x00\x8aM.R\x9d\xc5F\x00\
-\xcb\xe7.\x02(\x95\x17\x17\xcb\x0b\xc0\xe3o\xd0\x1a\xc4\
-(\xb4\x02#{\xe3EVe0\xb6V\x01\xfc\x08\xd0\
-Z\x1b\xf4\x1c\x09\xa2\xec\x01E\xcd\x13w\x1e\xeb~\xf4\
-\x02\x80\x1e\x04<\xa5\xbd\x08\xe0\x0b\x13\xcd\xd4 cF\
-cN\x16qp\xad\x8a\xa5*\xec1K*\xd1\x0c\xe9\
-\x00G\xf1\xa2\x84[!\xa3\x888\x9cw\xcb\xcdU\x82\
-\x03;Q\x11\xd6q)\xd66\xf2\xc1\x82\x8d\xa2\x0f\xb3\
-1\xf8|l!h\x90\x05\x1c\xacIxcI\x95\x09\
-?6h\x10\xd1\x0e\x0eT\x01\xb3\x05\x8bn\x03\x8d\xf4\
-\xa1\xfd\x1a4\xed=\x92\xaaC\xae\xc6Z\x19N\x988\
-:!D }\x19\x94E\x96\x048$\x80\x15 \x9c\
-\xabK\xcb\xd2\xf6\x1e=p.y)R\xee\xc7\xd6\x87\
-u\x88\xfa\x09Rs\x05\xc9#\xac#\x14^J\xc5r\
-\x00u\x0bpxu\x09\xf0\xa1\xa5\x8a\x11\xd9\x84\xc1\x98\
-\xa3\x97N\x04\xa1\x90~\xb2\x1fV\x92:\x9f+\xc4\xf9\
-\xfc\x8e\xe1b\xfb\x8d\xee\xf9\x8dv\xbd\x98\xcf7\xbe\x17\
-v\xe9\xed-\xdc0\xe7\xb4\x1dS\x98\xc2\x97\xa1\x82r\
-\xffFhj\xf7\xfa6\xa7\xdc\xbe\x15\xdc\x0e\x8e\xdf\x10\
-\xc0\xf1~\xdf(\x97rX%\x1b(\x1d\xbda\xd2\x7f\
-\xb5\x9f7j\x9e\xc5\xcd\x1b\x8b\xb7yyc\xc9\x8f\xe7\
-\xe4\x8d\x00X}\xbc1\xd0q\x8fj\xacX\xf7\x1e\xde\
-\x18\xc4\x04\x07ofk>Oc\xa4w7\x86\xd41\
-\xae\x92\xd2\x8e\xf3\xe8\xa62\x85\xbe\xdc\xc2\x08\x09\xfc\xf3\
-\xf9o\x8b\xd6\xe1\x17\xe2\xbe\x8du\xf71\x1c\xb71\x15\
-d<5\xfc\x13\xf5\xad#:\xf18\x1a\xd7\xba\x07\xad\
-\x93\xeb\x5cG\x0erm6\xa3\xdc\x98C^\x14/\xc7\
-t\x0a\xd2D_\xc9\x81\x9a!j\x853}#@C\
-\x0f\x1b\xf9\x18\xa40\xa9\xcf9Me\xc3n].7\
-\xe2\xd9y\xaa*!\x94\xb0\xf3\x9b\xb3\xc5\xa5\x99r\x09\
-\x882\x09\x18\x1c\x0f\xc2\x93$\xcb\xcb;\xb9\xec0R\
-\x93\xab\xc0GL\xc1)\xee\x96\x10b\x0e\xa3M\x08\xc5\
-J\x5c[\xad\xceC\xb3\xf3\x9b\xb8\xc7\x8b\x80\x92\xb7\x09\
-\xe6N\xc6En\xb9C\xa9y\xad-\xb3@\x8d\x96t\
-'\xed\xf4\xd5\xd0@\x95\xca6y\xd9\x96\xab\xfa\xd2z\
-&\xf8j-\xe3\xf4\xc9\x0b\x81\x9a\xe6\xf0\x06\xf5\xc0^\
-\xc4\x15-`\xa0\xc9\xcf\xe8\x96\xbdDW\x91a\x830\
-\xd0\xe7<\xe1\xf4\xd1%ypsz\x12\xd1\x08\xfaR\
-C\xddQ\x80\x01\xfb\x02\xf9\xa4\x9e,5\xf1A`\x1b\
-M\xca\x06\xad\x09c(\xb8\xeb\xaa\xb6\x1d\x0b\xc2\x85!\
-TqO\xc3\x89\xc0I\xc8\xa9\xcb\xfd\xa5\xe6\xbc.\xe0\
-\x9f\x9dx\x9e\xccd#\xaa\x87\xce\xd2\xbck\x97fn\
-\xf8\xce\xdf~\xe4x/23\x9d\xa5\xb0\xb7V;g\
-\xca\xa6\xa5-\x117Y\xc2\x9cr\xa9@\x0f8\x16\x8a\
-\xad\xf4\x5cA<g\x13\xce\xbbC\xbf\xde^?\x19\x0b\
-\x95\x9e\xd7C\xa4\xbf>\xff\x12\xa0mVF\x03\xab2\
-6\xfe\xac\x99\x18y&\xd7\xfd\xb9\x07\xb5\xbb\x1e\xed\x9f\
-\xf2\x5c\xbfT\xa9\xcf\x17+\xfef\xb99\x89\xb1yJ\
-k{\xe1\x85\x94?G\xe0\xe9\xb5\x1c\x19\xdaM\xb3b\
-n\xc1\x03xx\xf3\xca\xaf\xe6 \xca\x87\xff\xa4\x22$\
-\x86\xcc\xe4\xb6wc\xb5\xb9l\xea\x7f\x97\xbd\xaa\xb0\xbd\
-\x0b\xbb\x8c\xf2\xe1\xe1U\xfdp4\xcc\x0bW\xd4\xdb\x82\
-\xecQ\x06\xd4\xfa\x95\x91\x82\xc3\xab-\xa0nc\xf8&\
-\x02\x1aJ\x05\xa2\x1eU\xab\x15\xa1%\xe2R\xcdj4\
-X\x17\xbd4\xeey=\xe6\xad\xafT;\x85\x0d\x16(\
-\xfa\x02:\xbe\x9c\x84\xf2\x12\x16\xab\x9bfH\x5c\x0d\xdf\
-\xc0\xbcbL\xb0\xf7\x12E\xc8!\x1bT\x119L\x83\
-\x00o}\xd8X+\x94\xb4Y\xd4U\xca\xbf\xd1\x054\
-5J\xf4\x0f\xa7\x85\xb4\x82\xf0\x22\x97b\xf0\x989\x01\
-\xb1\xbaB\xb9\x9a9W}X\xcd\xf2\xa5\x15LT\xe7\
-\xf6UV\xe1\x0a,\x9c{\x95G\xea\xda\xc9P\x98\x1b\
-P\xa1\xbe\x12\xc3\x04\x9c%\xd6\x0b\xec\xb3\xba\x88&\x08\
-\xe5\xe6\xf5\x15|6!\xb9\x02\x05\xd5\x82q\xear\x9a\
-M\x17\xa4\xe7\x81\x9d\xc4Bmo\x96\xd7\xce\xa8*\xe9\
-\x19\xd4\xd0\xb7\xa9\xdf\xefz&\xb8\x0b\xb5Q\xcc\x917\
-\x14\x11X\x8eL\xad\x00]k\x04w\x19\xf4:tU\
-jr\x00NE-R]\xa3\x0c\xa3\x90&A\xca\x8f\
-\xc8\x92_\x1e\xa3\x08\x03P\xf9SPj>v\xa1r\
-/\xf0\x0fs/\xd4R)v\xf7\x1e\xea\x0f\xa8\x0b\xf7\
-\x02]!\x87\xe8%VE\x16\xd18\x99\x96\x90\xcfK\
-\x07\xd7\x12\xec]\xb5\x12\xf9\x09\xcc\x93\xdf\xf7F\x11g\
-\xe4j\xb9\x89N\xc3\x95\xfb-\x8aO\xa1W\xac\xd4|\
-\x03\xb6\x12\x14^TE\x96\x14y\x94\x12\xd1\xc0oP\
-H\x03G0$<\x04\x1d\x82c\x059\xbc\xa8\x16\x00\
-G\x9b\xb0\x02'\x81 \xc3K\x10\xa6\xc5\x0e\xad\xe2S\
-/\xbc\x80\xec;\xc2\x0a\xa8\x82\x17^\x10{x\xc1\xd3\
-I\xa7\xa4\x98\x02\xf7\x14\xd1CdC\xee\x8b\x11\xcc\x82\
-}\x91\x87d\xca\x8d\x93?}\xc5\xb2R\x14\xa9\x17\xd5\
-\x97\x0b\xbf;\x8f\x16K\xdb\x03\xca\x86\xe6\xa9\xd96-\
-\xd5Zp\x0b_\x08\xa6\xf1\x19\xa4\x86\xeb\xd1\xdb\xaf0\
-+\xb9\xa4\xd0T>B\xea\xa7\x80\x88g9\x0d8\x94\
-\xc9\x1d\x0f\xb6\xcc0\xb7|\xb0\x1f>N\xdaT_\xb8\
-\xed\xc3\x12t\xf3|ch{!\x1d\xcd\x1b*|\xf8\
-\xd8\x86\xa4\xf5\xcaN\xb58}\xea\xd3!\x0cX\xafJ\
-\xc2!\xfb\x0f\x94N\x9f\x1b\xd7s\x16\x82J%\x19\x12\
-\xd5FI(r'\xa7,Rq\xb2\xa7\x1f\xdf*d\
-\x09\xad\xd2\x84V\xc4\x1f\x95\x04*\x89o\xb2\xf3\x1d\x9a\
-\xd2.\x84\x8a{\x92j\x11R\xabG6\xaa\xfa>\xe9\
-o\xb3\xd0\xdb\x1b\xc1O\xc8\xe2z=\x12\xd4\xb5zk\
-\x06\xd79\x9c;\xa2\xdd\x80\xd2\x94\x1e\x89\x07}o{\
-8\x05\xd1x\x96\x82E\xa6\x18\xae\x1e\x0f\xb9\xe8\x8e\xd1\
-J\xe1\xd5c\x1d|\x0c$\x08;C\xb8ND(\x15\
-*\xaa\xf59sq24BD\x88H\xd0\x88\xc1`\
-\xb0\xed\xd9$<\x94\x0e\xe3K\x13\x85&\x1a\xf5\x05*\
-\x99\x12\xb1\x9afn\xde\x98\x98\x8eX)\xf7\xffg\xef\
-M\xba\xdbH\x92\x06\xc1\xbfBEV1\x11B\x00\x04\
-\xc0U\x80B|\x14\x97\xa4\xba\xb45I\xa5\xf2+\x08\
-\x95\x8d%(D\x09\x08\xa0\x00P\xa4\x12D\xbf\x9e\xcb\
-\xfc\x85y}\xeb\xdb\xdcg\xe6\xd0\xe7>\xcf\xaf\xe8_\
-2\xb6\xf9\x16\x0bHeVu\xcf\xbc7\x95%\x22\xdc\
-\xdd\xdc|77777\xab\x22,\xf3Wto\x11\
-\xd8\xec\x0f\xff\xac\x99\x81\x9a\xb2N\xa6\xce\xd49ty\
-\x09g\xea\xa97\x82\x99\x9a\xe8RLuh\xce\xf8\x0e\
-A\xaebak;\x03\xea\x12\xc8\x9cb\xdb\x90\x06\x18\
-\xa9\xe1\x9a\xbc\x13\x22\xa8\xa6\x1f\x11\xd7?\x91\x98\xaf[\
-\xc7\x04\xea\xf4\xa1\x98\x9a\x1d\x8f\xdc\x95\xab\xa7\x9a\xdb\xc5\
-\x96\x82[\x09\xc2\xc6y\xe8\x1f\xeak\xaa\xd5\x9a\x0e\xe3\
-Z\x17\xf5\xf6t\x16\x8f\xd7\xe5\xa6t\xef\xc1\xd9\xa5\xb4\
-,\xd3Jv4\xd1\xda\xa2\xb7;u\x98mC\xdb\xc8\
-k\x13i07]v\xfc2ZP\x7f:\x91\x80'\
-\x95\xb5\xed\xa0%D\xe9\xf9H\xb5[7#EI\xd4\
-\x9eM2\x89\xf8~\xcc\xdat\x01\x10Ny|k\x06\
-\x13\x09\xb3r@\x8d\x1d\xcc#\x80I\xa1\xc1iy6\
-\x99]\xdeL-T\xd6\x94\xbc&T\x1a3\xe1\xe8\x15\
-\xe1\xe8\xad\xc3\xd1\xd3\x18\x1e\x1a5ZK\xf6|\xbe\xbf\
-g}\x097\x0e\xce\xa8cw\xdb9\xe4!\xa1\xc9\x81\
-O&\x1aj\xdc\x95\xb0\xf10w\x1c\x1b\x81\x95\xcdo\
-\xda$?T\xbb\xb1\x8dY\xac\xe6X\x0f\xd2x\xfa:\
-{\x85\xb5If\xe6\x8c\xaa\x8e\x9b#0/G\xc9\xf5\
-#t;\xf4Z\xfa,hR\xd2\x90\xf6\xcc\xd2\xa4S\
-W\xa7\x89&\x86K\xdf\xb9\xa43\xfb'\xd9\x01R3\
-\x80>\xa7\xb2\x8f\xb6\x9d\x96\xa1\x8c;\xcbZ\xb9\xb3\x9f\
-L\xbf\xaf\xa1\xa8d\x8c\xd6\xd0\x076D\xe4}\xfa\xc4\
-\x09\x05\x93( V\xbd\x90\xc1\xb1\xd9\x8d\xa3q/\xfe\
-|3\xb9\x99\x7f\x98G\xef\xae\xd1\x92\x90\x8a\xa0\x9b\x13\
-8)\xa6X\x8f\xc0\xe69\x0c\x8d\xa5)r\x0d3\x9d\
-{\x17\x18\xa6 \xcd0\x99\x03\x89\x19b\xf8\xd3\xff\x92\
-D\xf8\x9e\x14\xc9.1G:.\x05\xe2\x07\x8c{2\
-\xd5O\xdb\x89~\xfa\x92w\x11\xdd\xe1\x9c<A\xfd\xf3\
-9\x9a\x0b\xc2za[I\xe3\xef\x0c\xcdR\x18\x04\x98\
-\x18X8\x80R\xb9\x13\x077\x01\xa6W\xbfw'X\
-w\x96\xc2QQ\xfc\x0b\xf4\x15>\x98\xd9X\xcb\xceX\
-S\x86n\x05\x8a\xa7\x0c+U\x99Mx\x80\xfd\xd1\xf4\
-J^v;\xc6\xb3\x8b\x90*uz9\x95\xb3\x8a:\
-\xbb\x8c\xf5iF\x9d^\x1e\x22\x5c\x0c\xb7\x86\x9b\xa1!\
-\xc1\xd1\x90\x95H\x15tg\x8b\x22#\x98\xf2G\xf9\x1d\
-\xaa\xcf\x9a\xfe\x12\xc9\xaa\xb5\xc6\xa4\xc7|\xcf\xc1\xd3\x8b\
->\xc7\xeb\x98\x1fJ\xb7;\xfe\xa1\x8e\x82\x93n\x8ap\
-\xebe\xa6H6~\xbb\xeb\xf54\xf9\xfa\xb2;8%\
-C\xc9\x9f>Q\x99\xcb?\xd7W\xe8\x8d(\x12\x7fD\
-\x9f>A`\xf9\xe7\xc6\xca\x0b4\x12g\x05\xcb\x09s\
-p\xa8\xccq\xcc\xa3\xb6\x8a\xeb\x98\xce\xe4\x94\x80EI\
-\xfa\xf0\xd5\x5c\xcb\x9a\xfa\xcdR\x96\x9b\xcd\xb4@\xe6\x1c\
-\xb7\xc2\x9c\x97\xa9\xdau\xbb\xda\xaa\xb2\x8f\x1f\xfb\xd4\xe0\
-\x03\xca5C\x86#P\xc4|\xb1\xab\xecu|2*\
-\xda\xaeeJ\x9f8\xa4\xf2\xf7Q\x91\x96C`\xf9\xba\
-\xac\xf8L\xcc\x8f\xa1\xe8nFQ\xdbb\xb2\xe6\xf2\x9a\
-\xea&r\x0d\xbb) \xeb\x1b\xed\x1eIS'[\x1c\
-\xe8\x97\x93\xbb3\xda6\xd5\xc0\xf7&\xacm\x81\x1b\x8d\
-=\xf2\xa9\x13\xa9\xd9k(\xc1\xf0\xf3\xe2_V3\x02\
-\xe2P\x16(,)5xM\xe9y\xdd\x8b\xa8\xcb\x07\
-\xc4\x07\xbbB\xd9\xfe\xa3;F\x91\x1b\x0c\x81\x00L\xe1\
-t\xcb\xa1A\xf0\x95\xef!U\xea*w\xab\xe8\xb0\x8b\
-\xd5\xe1d\x16\xff6I\x16\xa6\xd8v\xcezA\xe2\xca\
-\xed\xcb\xe3V\x88 \xf90>\xff\x8c\x13H\x97D\xfc\
-\xc5\x83J\xe9\x0e\xd5b\xc9m\xf3I=\xa048\xa1\
-\xa3X3Wf\xc5.\xdb\x95d\x0a\x18D\xfd\x0d\x9c\
-\xc0\xd8\xa4\x0c\xaf\xe3\xd1H\x87\xf2\x8f\xd0\x05\x22\xad\xc7\
-O5O\xd9\x06\xb4N\x80\x06\xe84Y\xcc\xbe9k\
-\x10\xa8\x0fE*\xb9w\x7f\x14ug\xd0r\xf4\xf2Z\
-oY\xe8/\xd6f\x83\xf0\x05p\xc6\xb9H\x14\xc0\x15\
-\xf6S\x16\xa4\xc5\xde\xc0\xf1@0\x8a\xbeFrPU\
-\xbd^\xb5R\x9c\x17e\xb9\x00\x0e\x99`/\xf2)2\
-A\x916\x9dPx\xe8\x0d\xf0\x8e\xb2\x8aC#\xa7\xc4\
-\xdb\xc8V\xf1PZi\x83\xee|\x88O\x97\xf9\xd7\x03\
-RH*\xba\xcdLv\xe1\xcb\x86\xdd\xf9\x19\xe1\x80\xd9\
-\xe56\x00f\x0c2|s\xc5\xdeg\x12\xc2\xfchs\
-\x87\x88\x97\x99\xa5\x0d\xfc\xeb\x93\xa9\x07\xba\xdc\x04fN\
-w\x05\xf0\x198=\xec\xc5\xae\x9e\xc8\xda\x15\xd6&/\
-`%Pey;`|a\x98\xaa^\x7f2\xba\x19\
-\x93*\xf7\x1cNe\x5c&L\xc0|`Ui\x0d\x89\
-\x1e\xa0\xa1[D\xa38D7\xf7\xd6Hr\xa7Y\xe4\
-\xde\xae\xba\x05\xd7\xb4\xbe\xf1=\xd2Z\xde8L\xf3\x5c\
-\xf9,0B\xe6l\x17\xbc\xbaYIJ\xd8\xfe\x02\x91\
-\x8b\xa1\xb4\xad\x1c\xcaOy_\x924\xc7P\x7fG\xc6\
-\xa3\xa4.m\xac\xda\x1fc\xbe\xd5:M_\x02\x8d\x17\
-\x03Y$\x83\xdc\x8d\xb4e(\x96\x99\xc65\xb5:(\
-\x9e\xcc\x05\x94\x10\x01O\x04z\xce\x10\x0a#\xe9[$\
-\xaf\x9d\xc1U\xa9w\xc2\xac\xe0;\x07[*|\xa8\xde\
-\x1d\x09\x7f\xafN\xd6(\x22\xa7\xdb8\x80\xcf\xbb-P\
-\x94\x97\xfa\x03\xe8T\xb67f\xd2\x1b\xb3\x96H\xab\xf9\
-\xa6\x1c%\xf6\xdb\xaa\xaaX\x8a\xae\xa9\x8eQ\x8f\xecM\
-E\xf0\x8e\x00f\x91\xc2I\xaac\xd1\x00\x0d\x11\x19\x0a\
-\xa4\xaa;K\xf7>`\xb0Z\xa5\xeaL\xa4\xd3\xaeu\
-\xa9\xe0\xce\xd4\xd4Q\x09\x98\x0bI\xb5\x22\xc48yP\
-ub^R\x1b\x0d\x85\x9a\xae\xef\xaa\xfc\xd5\xcc\xdd\xb7\
-\x96H\xb1\x0d\x94\xad\x8d-\xbf\xc5\x11\x5c=m~\x8c\
-zC\x08m\xc9\xa2El\xd0\xa77Y,&c\x98\
-N\x9cwj.h\xb3T\x92A\x8c\xd9\x9e\xa6]\xde\
-\xf3Li\x95z!\xc1EU;\xa6R+\xd5tT\
-\xa7\xe6W^F\xc4\x8fq\xd9f\x0b\x98\xddp\x8c-\
-\xacG\xcb\xa7d\xf3\x9c\xd9\xe0 \x83=\xb2\x16s\x8a\
-\x08)\xa3n\xf0\x0a\x86OvU{\xf0~\xcf\xe5\xb3\
-\xbd\xd1\xca\xadsJ\xa4\x1b\x8dF\xeb$\xbax\x0bT\
-t\xa6p\xe9k:+\x0a\xf2\x02\xc3\xef\x223v4\
-\x18\xac\xbf\x95[\x7f\xadG\xf3\xc5\xad\xfe\xf5:\x0e\xff\
-\xfa\x01\xde\xde\x11\xa6Y\xcc\x15]p\xc9mV\x8dl\
-\xd8\x01\xa6\x0c'F\x0d|\xe2H/\x9f8\xb2?\xa1\
-\xfdY\x89\xb1\xe6\xc6\xf4cz\xb1?\xc0\xd6\x1e\xfd5\
-9\x9d3\x83$!:\xdc\x81\x81+\x04R7\x1a\xc5\
-\xc8\xc7\x94\xd4V\x89)\xf8\x5c\xf8\xcd;\xa4\x14\xedZ\
-P\x0b\xea\xf0\x9f\xfa\x0b\xffup{b\xbb\x06\xca\xde\
-\x98\xe7\xaf\xa9\xfe*/\x85\xaa?)\x99\x87\xdf%\xef\
-\x87\xbbFm\xaf\x8e6\x93x\xb7W\xc8\xc9J\x93\xb2\
-LV}\xfb\xee\xed\xe9\xea;ES\xf9\xcc\xb531\
-\x80+Z33 u\xcd\xd4\x90N\x0e\xfa\xad?*\
-\xbc\xde\xdct\xc6\x99\xb5j\x95\x99\xb0\xf1\xe4~\x1c\xdf\
-\x8f\xc9\xab\xdb\x9f\xd0\xe26\xda\xa9)\xf5\xc3Rz\x80\
-\xfd\xaac\xd4\xd2\xd7\x9b\xd7\x13\x1c8[\xac\x8c\x180\
-\xce\xd6\xe9(\x01J\xa7_Pw\xb4;m\xf7]\xfb\
-L\x1d\x9f\xd8c%\xd3\xae\x19C\x01%\x16\xfbU\xd1\
-\xee\xfb\xb1d)\xf5Q8\x82\x19\x8e\xf0\x09\xcd\xa0d\
-\xa0\xbd\xff\xfb\xbfz\xa2)\xe47K\xe9S*\xef\xce\
-\xd0\xe4\x92\xf7\xdf\xff\xf7\xffj&\x07?ZF\xfa\xd2\
-VY\xec\xfb\xab\xb5S\xe8\xe2\xf4\xb5\x9aA~v\x1a\
-ps\xc3\xe5\xc1\xee\xb3F\xf3`\xaf\xd6\x08\xe0k\x07\
-\xbf\xb6\xf1k\x0f\xbe\x1a\x10\xb7\xb7\x8b_\xbb\xdb\xf8u\
-\x80_\xbb\xf0\xb5W\xc3\xaf\x9d\xe0`\xbf\x0ey\xf7\xeb\
-\xdb\xf8\xb5\x8b_{\xf0\xb5\xfd\x0c\xbevj\xf0\xb5S\
-\xc7/\xc0\xb2\xbf\x07\x98\xf7\xf7\x9e\x05\xf5\xc6\x1e\x7f\x1c\
-\xec\xefc\xe2>&\xeeo\xe3\xd7.~a\xea\xfe>\
-|\x1d@\xea\x01 \xde\xc3\xdf\x1a ;\xa8\xd1W#\
-\xc0\xc2\x0f\xea;\xc1^\x03\x7fw1e\x07\xbf\xf6\xf0\
-k\x17\xbf \xffA\x1d*{\xd0\xc0|\xf5g\xf8U\
-\x87\xaf\x06\xe6h\xec\xe0\xd76~a^\xac\xcf\xc1v\
-\x03\xbf\xf6\xf1\x0b\x9ar\xb0\x8d\xf8\xb6\x11\xdf6\xe2\xdb\
-F|\xdb\x88\x0f\x1bu\x80\xcd;\xd8A|{\x98w\
-\x1f\xe1\xf6\x113\xd6\xfb\x00\xdb\x02\xb5\xc7/\xcc\xbb\xff\
-\x0c1C\xdeg\x0d\x8ck<\xc3/\x8c\xdb\xc1\xafm\
-\xc4\xb7[\xc3/\xc4w\xd0\xc0/\x84;\xd8\xc6/\x84\
-;\x80\xba<\xa3r\x0fv\xf1\x0b\xe0\xf6kP\xd3\xfd\
-\xda\xc1\xca\x1a\xd0\xc1d1_\xb3\xb01\xd9{@E\
-\xe21\x8b\xd9\x90\x7fV\xba_\x08\x7f0\xc2\xcf\x96\xa2\
-\xfek\x96z\x8a\x18\x8bB\x13\x1b+t\x00\x15mN\
-\x13\xe0\x16\x03\xc3\x06\xe3\xcc\xf5\x97\xaf\xdenn\xe6'\
-\xc12\x00\x1ad\xea\xda\xc7O}\x04\xc1\x80\x96\x94\xb5\
-\xc4X\xe5\xc9\xe9Y\xb8tv\xe5\xf9\xac\x1f\x0c\xe6\x8b\
- \xc1\x87\x09\xb3\x8c\x16\xc4\x1c\x8dg\xc3\xdf\x90\xb5\x03\
-\x00\xda\x87\x7f\xf9Z\x11\xde\x84\x14\xa3`\x8f\x14\xf3\x89\
-\x00\xc9\xc6VE'\xb3$\x11p\x84\xcc\xc0B\x19l\
-1\xd5SU\xcb\xa4\x1dj\x18\xf9\x80N\xff0G7\
-\xa0\x5cy\xae)\xe9e\xa8\x82\xf8\x8c\x0c\x0dVE\x07\
-\x02\x11\xa8\xb0\xb4[_\xee@\xfa\x8a\xe6\xdf\xc5\xd5\x87\
-\xf7i7\xb0\xc5\xa6\xa8Q\x81\xfcU2G\x1f\xf0\xdc\
-\xcd\xc1\x92M\x0f4\xb7\xda\xdd\xcao\x9d\xad8\x18\xc4\
-\x9f\xe3\x05\x04k\x95g\xd5\xceV\x90\xb0\xee2\xec\x0b\
-\x87M\x8c\xeb\x94\xe1\xe3\xd32\xf8\xb4\xa2\xd0r{\xe5\
-?\xc5\x98*\x05\x9f\xfaO\xef\xe5\xb3\xeco\x05\xf3i\
-\xd4\x8f\xbb\xa3\xe6\xd2\xfb\xf4\xc9k*_\x81\x97p\xc6\
-\x15\xeb\xe5K\x88\x15\xfd\xb0\x15\x02\x88\xb6\xc2\x7f\x84\xef\
-\xabxDn?\xff\x06\xdf\x97\xd6\xadp\xf0+\x86\xd5\
-\x0do\xe0\xa1e\xb7\xcb)\x9fv?-\xec\xc0\xcc\x0e\
-$V\xe0G\x0f}\xc1\xd1\xad\xbe\xf7g\x8f\xfd\xce\xd1\
-\xebQ2(F\x87\x19\xf8\xfe\x01\xbe\xcf\xbbs|\x10\
-\xf8\xdf\xfe\x8b\x95\xfb\xbf\xff\xa7\xff\xac\xf3\xa3\xfa3P\
-q\xb4F\x89\xcf\xb5\x1b\xf5\x06\xbe\xb9\xe2\xcf}\xf8\xfc\
-\x0f\xf4@\xbe~\x00\x80lT\xa5;\xab\x8d\xe3\xe6\xb2\
-;\x9a\x0e\xbbM\xaf\xb6\xfd\xb2\xee\x05\xbdh\xc1\xdf\x90\
-\xf9sw<\xe6\xc0\xb6\x877$\x92\xb2\xe3\x05\xd1t\
-\x1e\x8fP3\xbe\xb6}\xb6\xeb\x05\xbf\xa9L{\x90$\
-\x9f\xfb(\xd9U\x81\x03\xe0r'\xf2\xfd\xcc\x0b\xbe\x00\
-s\xc2\x81#/\x18u\xc7\xbd\x01\x87^z\xc1\xf8\x86\
-\xbe\x8e\xd1@\x14}\x9dx\xc1]L_\xa7^0\x19\
-\xa3\xb5\x03*\xf7\xe5\x99\x17L)\xe1\xb8\xe6\x05\xb3\xe1\
-\x84>\xa1\x05\xf3\xf83\xd7\xfax\x1b\x9f\xe0\x12\x96c\
-\xa8\xf3\x8d\xa9\xf31\xd4y:\xa4\xcc'\xbbH\x0a\x19\
-\x0fT\x19`\xe8\xf3\x00\xcb\x8a>3\x1e\xa81,o\
-\xab\xcd/w)F\xb7\xef\xa4Na\xae\xce\xc9\x1e\x05\
-\xa4Fg\x9cd*\xd5`P)\x12`/\x9bm\xaf\
-V;\x82\xc2\x97\x96\xf1\xd7\x1ck\x9f\xabN\xd0\x1dE\
-\xd3!\xc07\xea\xdb\xbb\x8f\x81\x1f\xf6\xba3\x02\xaf\x9d\
-\x91_P\xe7\xe2\x1eXUD\x00\xf5\xa8oC-\xff\
-.\x81\xc66T\x05\xa82L\x96z\x1d\xba\xf0vJ\
-\x18`\xde<\xa2\xc0\x8b\x88\x81\x8f\x1f\x03\xfcj\xcc\xc0\
-\xf5\xc7\x00O\xa1\xbfq\xf9B\x8eF\xad\xf1\x98\x1cq\
-r\xbd\xf8F\xf0\xf5\xd3G\x95\x80\xab\x08\xe1k\xdb\x0f\
-\xe3\x0f2\x9d\x19\x8d\xa7\x8boxi@5|\xd4\xf0\
-$p2\xee2\xfc\xa3\x86\x1f\xadO \xf4\xd1\xcec\
-\xa0{\x13\xae\xcb\xd1\xa3\xea\xd2M>\x8f\xa8\xf5P\x99\
-G\xd5\x05\xd3$\xcb.\x12\x88GT\x08\x8e\xb8s\xd8\
-\x95\x87<({\xbf\xa3\x93a\xab\xed\x8ed\x12<\xaa\
-\x9a\xd1]<_\xcc9\xc3\xa3*\x99D\x9fyA>\
-j\x0a\x8f\x12\xea\xe4\xc7\x82_\x8f\xba4&{{'\
-\x8f\x9b\x1f\xb0\xbf\xf2\x9c\xdf\xdb{\xd4\x1c\x9e\x03Q\x9f\
-2\xfc\xd9c\xe0\xfb#\xd4\xb4\x8a\xa5R\x8f\xea\xa0A\
-\xdc\x1dO\x92\x81\xc9\xf5\xa8\xc58\x8c`\xfd\x9a<\x8f\
-Z\xf2p\xd2\x1fD&\xcfc\xc6\xdb\xde\xda&\xcd\xe5\
-\xfcf6\xa0\xfd\xef\x08\xdfWMg\x93\x01O=D\
-\x95\x7fNz\xf7>0\x87E\x9es\xbd\xf8\xf3\xd7\x88\
-\x97\x06\xee/\xdf\x95\xf16\x1a|\x96\xac\xdf[\xe6\xcd\
-ttC\x13\xf7\xa8\xb6\xf3\x9dY\xfb]\xa6\x13\xb8\xd9\
-|_\xc6\x1b\xc9\xb8\xfd=\x19\xe3\x84\x09M\xe3\xe5\x9a\
-\x5c\x0c'\x04l-\xa4\x8b?p,LJ\x81\xba\xc4\
-\xe3\x07J4\x90'\xeb!\xf5\xdc\xa0\x9d\xf2\xd1M\x9f\
-\xdf\x8cyF}\xef\xc4\x98,P\xa3\x8e\x87\xf7{G\
-ibf\xc6w\x17;\xe0M\xe1\xa8\xf6]\xd3q\xa2\
-\xbb\xf1t}7B\x11\xf3\x7f\xc8,:\xaa\xed}W\
-W\x8e\xe9\x1d\xbd5\x95\xc8\x0c\x02\xcc\x98'uk\xbf\
-a#n\x8d]\xe2\xee$NL1\xc1>\x04\xac\x1a\
-TA\xc5C=ds\xb2\x22\xe99<F\xc3\x8c\xe0\
-\xe5\x89\xe5\xed##\x9a\x0c\xd47.x\xfc\x04\xa6\x87\
-l\xfa\xf0'\xae+\xfc|\x86\x06\x9f\xf8\x13\x08\xcb`\
-\xd0Egr\xc8\x5c7`<\xac\x10\xf41\xf4\x06g\
-z\xb6M\x01\xce\xf6\x8c\xf8Q\x1cE\x08\x1c@\x9fv\
-\xa1\xf1\x9f!p\xb4}\xe6)\x0a\x8bi\xc8\xb8\xf6n\
-Fp.\x222\x06\x05\xdfRmvj\x08\xf6\x15\xd8\
-\xb5\xda\x19TW\x0dk\xe3\xd9\xb3t\xbfM\xcc\x8e\xfb\
-\xec \x93\xa8ga\xe3\xd9~&q\x1c'7\x92\xb8\
-\x97ITs\xb0\xf1l7\x9d6\xa66\x22\xef8\x1d\
-c\x0d\xf1\x5c\xd1\x8fg}\x8a=\xa0\xc1\x90\xe0\xee)\
-4\x17x&S\x12q\x05\x99m\x1f\x8f\xe9\xd4\x1dP\
-Vw\xbePG\x1a\xae=\x94p\xb2\x8f\xaan]\xea\
-\x1a\xe4\xa9a5O\x17\x13\x02;\xc1nG-\xdch\
-\x11\xfd\x83\xfa\xbe\xce1S\x13\xd3@\xfbc\xc8XD\
-#\x1aT(e\x1c\xf3\x5c\xc0\x93\x0f\xf4\xdfW\x0c\x1c\
-A\xe0+\x86(\xd0@\x83\x82\x94\x7fo\x07?\xd5\xd7\
-g\x89\xdc\xc5O\xf55\xc2\xd7\xbb\xc0\xefC\x1c\x7f\xc1\
-\x98\xcfo\xfa\xd4%\xfb/\xb1\xc2\x11\x7f\xc3|\x82\xc3\
-\xd1lrG\xa3|\xc0P\x84\xf1\xe8e\x8d\xe18t\
-\x84=G\x8d\xa09\x84\xb3\x8b\x1aI\xa1\x86J\xe3\xba\
-\x1c\xec\xabT\x09C\x17\xa1\x155\xa0vPB\x12\xd3\
-\x17\xd4\x02\x98\x19\x89\x86i\x04\xcbd\xae\x12>\x7f\xa6\
-\x86\xc0\x17\x9d\x0b\x1a{Gx\xce\x1a\xe3'\xb6\x09>\
-\x19\xf1\x0e\x8ey4\xa3\xf1G\xb6\x13/\x90\xa9\xebp\
-\xc3\xef\xce\xbf\xf1\xcc\xd8\xc11\x19\xc7\xd4e\xdb\xd8\xc3\
-\xd73^\x93\xdb\x0d\xa8x\xc2\x9dV\xc3\xaf\x7f\xa8\xcf\
-\xfe$\xa1*\xec\xe03\xec\x894c\xb7\x86\xb6\xb5n\
-\x171\xe5\xc03\x1b\xda\x19\x1aQ\xad\x8f\x0e\xa89(\
-\x8b\x85\xe0\xb33\x08\xa2\xea#Q\x0a8\x9c\xa1y:\
-\x98\x1b;\x1ck\x22\x00\xe3\x85\x0b\xd2`\xbb\x91n\xc6\
-g;\x1ck\x22j8\xda\x8b\xb9\xfaN\x817\xd0r\
-\x9c\xfa\x823\xfa\x9cCG{\x8c\x06\x99\xb6\xc9$!\
-\xdaP\xc7\xb3\xaf\x15)\xe4\xaa\x8e\xe4\x8a\xb0:\xc0\xc7\
-57VA#\xa3\x92D\xa6\x028\x01\xac v\xce\
-\xad\x09B5\xe6V\xf0\x99\xe0\xb4jA\x0d;\x86\x9a\
-\x0d'\x93/n\xe3\xd0~\x1b\xc6:\xfdq\xf4\x0c\x09\
-'\x92[\x13\xb9\x8f\xa2\x82\xd7\x99\xc8\x03\x86t\x90\xee\
-\x9f\xed1h*\xf6\x99A\x90J92\xe5\xa5R\xf6\
-9E\xf7\xfa\xfe\x19v0\x8a\xfa\x88FCA}\x09\
-4\x90\x1a}\xd5\x81S$\xed\x12\xc0c<~\xf7U\
-\x1e\x0c\xf4T\x1e\x0c\x8c\xed@l\x07&*\x0f\x16:\
-\xa5\xd3\xc2\x9am\x94\xbc\xdd\x08\xc9\x13fl\xf7a\xe0\
-\x09J&\x10\xf3\xf6\xd1C\xc0\x86E\xdeo.\x7fR\
-\x22\x1e\xdc\x9eN\x94\x88\x07\xa7\xf7\x95\x12n\xe0dy\
-\xade4\xcf\x80\x06\xfcB\xb2\x8bg\xd0\x86\xf7\xf4u\
-\x04\x93\xf0R\x098\x90H~0\xa2\x12\xa4\x02\xefY\
-\xd8\x81\xb3\xfd=\xcbWpu\xbeS\xf2\x15\x9c+\xbf\
-\x22Q\xdc=\x13I\x17t\x10`\xf9\x13}\xec\x88\x5c\
-\x0c>wE(V\xa3\xde<\xc2\x1d\x92>W\xac\xbe\
-\x1b\xa3\xe8p\xe9\x95<\xd2|\xf6|\x0f\xf5y\x03\xaf\
-\x0d\xbfm\xf8\xed\xc0oGL\xf67\xf6O\x0f\xc4\xd1\
-\x07|>#\xc5\xda\xd1\xc2$|\xfa\xf4ya\xd2\xb6\
-\xe0s\x0b~\xef=\xe8\xe2\xfbb\x9e\xe6\xe2\x04\x86\xc2\
-\xab\xa2w\x07DAbF\xf8C\xc8\xd1\xec\xcd\xa2\xdb\
-\x1f\x92%\xc5m$\xe5\x10;K\xc5\xd6\x19\x16\x8d\xe2\
-M\xb9\xf8S\x86\xb3b\xce(\x86\xa67\xaa;R\xc6\
-\x13FwdG\xd6p'E}aT\xb3\xd1\x90d\
-k\xf2\xd3\xa7\x9f)\xdc\x16\xa8\xf5\xed\xf9\xf4\xe9\xfe\xf1\
-\xa0_\x05\xf1\xfd\xc3\xa07Sj\x84G$\x87[\x8e\
-\xd4\xcb\x8a\xdc\xf6\x18.\x15\xbdK\xd1\x1f\xac\xec'\x9c\
-\xfd\xc4\x81;\xd9\x1687\xfb\x09g\xd7\xb2\x083F\
-3b\x0f\x9d)a\xc5\xf0\xb4\x98\xb1\xd6R\xd3[1\
-\x80\x0a.)\xb8\xd2\x09K\x1d7\xebG\xf1\x88\xfa\xbe\
-&HM\x84\xe0$\x138\x1c\xf3\x92A\xac\x98#S\
-\xd0\x17\x99\xc9R\x8d/4\xa1q9\xa3\x05Xmn\
-\x93\x8d\xcc\x91\xcd\xb6KVX\xf6`\xebx\x82\x97\xd8\
-\x01^*\xe6\xa4_Az\x1d\xd3Y\x90\x9d\x03qI\
-\x10u\x0dQ\x08\xc7\x80\x8dN0\x1bs\xca\x19\xb9\x99\
-\xcf\x9e\xd5\x81M\xa4\x83}.\x08\xfb%\x02.S<\
-\x1b\x15\xc1\xa1\xb3\xa4\xab\x7f{}\x0a\x14\x90\xc4$\xb9\
-@\xc7\x80\xeb\xa7\x8b\xa3\xf7\xe7\x88\xd1-\xd3\xf1\x8c\x04\
-\xa7\x97\xeb\x22\x1c\xe8G\x09\xd2{\x98R\x04s\xf2\xee\
-\xc3\xcb\xd7\xa7\x97W\x17\x1f\x8e\xffB\x1dU\x04\xc8\xfe\
-\x9d:\xc0\xf6t\xbf\x14\xc1\x9c]\x1c\xfd\xe5\xea\xc3\x05\
-\xe0)\xac\xd3\xe5\xd1\xdb\xcb\xcb\xd3\x8bWg0\xae\x85\
-\x95z\xf3\xee\xed;29\x04@q\xf2MF\x0b-\
-\xba\x06\xd5\xddNp\x95\x8e\xdb\xd3C\x8cf0\xed\x94\
-}9\xa29\x91\x07\xbbx\x1d\x84\x16\x9f\xd3\xf00W\
-\xe8P\xe0\xc4Uab\xbc\xce\xc6\xee\xec@\xf4\xd1\xc5\
-O\xa7n\xf4\xfev'\x18\xde\xb8\xc0\x8dj\x0d*r\
-\x9e\x89\xddy\xd6\x09\xba\xb3\xfe<\xc6m\x10-\x88\x0d\
-\xce\x12\x8f\xa2\xfa\x93y:j\xd1MC}v\xc2\xe9\
-,\x10\x1e\xa6\x22\x16\xe9p\x0a\x008\x05;<\x88>\
-\xa7\xc2\xc0\xa8S\xf0\xdd\x14Orc'5\xba\x9b:\
-\xe1\xcf\xfd\x81\x05=\x9c\xb8\xd0qrm\xa5\xa2\xd3q\
-;u\xe4\x16L\xcf\x5c40\xee\x9a\xc9\xb5\x02\xc0\x18\
-\x0f\xa2\xf0Uy2\x9f\xb6 \x89s\xcco\xa6E0\
-\xf8L\x13\xc5\xa0n!\x13\xb7\xd0q\xf7\xce*t\x8c\
-g\x0c\x1dz?\xb3\x02\xf3\xc8\xed\xb6\xf4pB\xd8\xed\
-g\xac\x99\xc9\x9e\x1eW\x08\x0f\xd3\xad\x8fI\x1a\xfc\x9a\
-=\xf8\xe1,M&\x99X\xa0\x84\xa8YN\x96r\xdb\
-\xde\x07t\x03\xf2\x8e\x1e\xdf\xa1\xa0\xf7\xcc\x13\xaf\x95\x9d\
-\x80\x1c\x84\xe4B\x01+\xc38h\x83H%\xc3\x86}\
-\xea\xe9\xfc\x05\x10g\x04\x81(\xc8yn\x16\xe0\xd8\x13\
-\x04\x05\xe9'R\x03\x8b\x1dN\xc1\xe0iDp<\x04\
-D\xdd\xa1\xd9\xf6\x0cHM\xe1y\x00F\xa1YW\xdc\
-\x8e\x8d\xeb!@DH\x87\xdew\xfc\xe1qV\x8a\xfa\
- _\x1e\xbf\x8d\x9cEH\xba\xde\xe0fI{(R\
-}\x88[\xf2\xd7d\xba\xfc\xa1\xb1\x82\x8d\x96\xa6\xc0\xdf\
-\x96?\xd4W\xb0\x937\xb8\x04F\xef\xd17\xbe\xb7\x22\
-vs\xaeb\xbbd\x14\xdc|\xe7@\xf4 \xa7\x13\xc8\
-\xc2\xa8i \xed[\xd2-t\x87\xa2\xbf\x98hfd\
-\xf1E\xde\x04\x95\x0du<3\xbc\xb4\xa5\xc0\x11\xe5\x0c\
-\xfe\xa2\x90c\x06\xbdp\xf9\x0f4t0\x9b\xa0\x00\xe5\
-b\x82:]7S\x0aA_@E8\xca\xbb\x99\xd2\
-G\x87\xcf\xba\x99d\x8c\xb5\x00\x9a\x1e\x9e\x9a\xe5\xfd\xa0\
-\x08\xdf\xac\x98q<\x18\xe0\xe1\xfe\x0d\xfd\xa2\xcc\x00E\
-`\xaf\xd1\x01\xc0\xcc\xfa\xec\xc6\xd0\x02\xef\x02\x7f^O\
-n\xb1\x19#\xfcq\xa3PJ\xc8Ebu\xecBp\
-0\xb8\xe8T\x0a\xfc\x87{\x03\xde\x90\xcfx3|}\
-\xfa\xf6\xa7\xab\xf3\xea\xd5\xf9\xab\xb7o\x8e\xae\xcee?\
-\x04\xf6)\x1f\xee\xcd\xe9\xc9\xab\x0fol\xc8\x17\x8f\x86\
-l\x15\x97}\xfc\x17\x1b\xf0I\x01\xe0\xdb\xd3\x9f\x8e\xae\
-^\xfd|\x9a\xaal\x94\x90\xde\xa3\x95\xc7\xab\xeeFc\
-\x18\x90\x7f\xdct\x07vt\x9dc\xd3\xd1\x0d\x8af\xaa\
-\xed\x22*\xee\xa1$\xfa\xfc@\x86\x82\xda\x0e\xd1}p\
-\xd3;\xc7\x1f\xd8\xb0\x18\x81\x0a\xc2\x0e\x95\xe8\xc0\xd8\x81\
-\x1c\xbb\x90c\x07tv\x83\x93\x0a\xffz\xc1\xc5\x0d1\
-\x85\xf8\x03\xad\xba\x94\x0aR0@\xef\x1a\xc9\x17\x8f\x84\
-\xd1\xb4\xe2\xbfD/\xd1\xb4a\xfa\x18\xc2\xdc\xcb\xcb\x07\
-\x80\xea\xd5\xfa.\xa1z\x08l\x87\x91=\x04\xb6\xcf\xd8\
-F\xc5`\xefO\xdf\xea\xaa=\x00f*\xf7 \xa0\xaa\
-\xde\x83\x80R\xc1Y!\x1c\xf9\xe5\xd55|\x08\xceT\
-\xf1aHU\xc7\x87!\xa5\x92\xe3B\xc0\x8b\xd3\xd7\xba\
-\x8a\xeb\xa1L\x05\x1f\x82S\xd5{\x08\x0e+G{\xca\
-\x0cW\xa0\xa8hf'\x83\x00M\x8ba\xde+\x10\xda\
-\xdf\x8b\x80N\xdf2\x18=\xab)\x84\xa3\x9ec\xc0^\
-\x5c\x8c\xee\xe5+\xc1\xc6\xdbe>\x104\x93\x81\xa6\xa8\
-\xebU\x08F\x02'\x06$c\x80\x85\x80\xe4\xd9\xb9\x13\
-|\xe5\x07/\x85`\xe2\xf8YZK>\xa1\xf8Y;\
-\xdb\xd2$\xc7\x1f*\x01\x97\xffM<\x1a`3\xbc\x97\
-\xf8u\x11\x8d\x80\x14\xf5&w\x90\xe7\xfc%z\xd4\x91\
-\x03qS\x82\xe3T\xda5\x86\xbd3\x0a\xce\x17\xb3\x1b\
-\xdcL\xf1\xc7\xa3\xf29\xc6f(\xbeN\x87\xdd\x04j\
-\xbd,\xe1\xc6-\x81\xa6\xf7\x9e?\xbc@\xa5C&\x1d\
-G\xa7\xeeaNB\x8d\x0e\xdbc\xbal\xb8\x1c\x93\xe6\
-W\xb7\x8fn\x98\xd9\xd47\x1d^k\xb5\x97\xc8\x03}\
-\x9eu\xbf\xa6\xe2\xf7\x90\xd9\x1a\xf0\xa5\x90\x15}t\x80\
-[\x00\xea\xb2\xb9\xf1\xfb\xa7\xd8]\xa4*dC\x9f\x11\
-\xff\x11\xa5\x907N\x0e\x94I\x007\xfex\x1f\xe2\x87\
-\xddT\x99\xbb\x88\xfb+\xf1\xf5:V\x98\xcat\xfd\x1a\
-'\xcf \xf66\x86\xc3Qn\x1d\xb1K05\xaf\x0c\
-L\x83a\x99\xc5wd\x1c\x1b~=~\xccj\x82S\
-Io\xeb\x18\xcd6\xe1C\xde\xb9\x9d\x80\xec\x97\xf0=\
-\x1bl]\x81x~\xaf\x8a\xbb+\x7f?\x81\x91\x8b\xfe\
-AO\xb5\xac\x9c\x94\xc4\xb0\xc4\x9dH\xeeBN@\xb6\
-q\x94\xd1t\x94\xd3\x18z\x96\x93\x8fS\xb9\xa2\x92\xda\
-\x98\xac}\xe0\x9b\x8eg4\x0fQ\x89p\xf6\xbaK\xa6\
-A\x93\xe8\x96\xfd}`\xdaP\x8e*\xe7\xf8\xe6\x09\x8d\
-\x98\xd0#N\x183\xbc\xd3J\xa5\xc9KO\xdd\xc4d\
-\xf2\xcfi\xa4\x9d\x8d\xb8\xc9\x7f\x09z\xca\x00\x0d\xc3\xa7\
-p\xb0\xbc\xcfb|\xa1\x83!'`\xa5\xf5\xc6t\xfd\
-/\x8b\xf9G8\x13\x8cGW\x93/Q\xb2\x1cOV\
-\xed\x91x.&\xbb$\xb4\xf8I\xfdrc\x96\x1f\xdf\
-\x81L\x83\xd5\x8f@\x03\x1c\xac04\xd3\xc9`i\xe3\
-\x8eW\x04\xfa\xe9\x132:\x1b{\xe3\x9b\x8d\x1f\xd0\x18\
-\x02\xce\xe5TNC\xd9\x96\x0c]?\x18\xdf\xac\xd4w\
-c\xcdwny\x01\xfc\xff\x87:\x954\xfd\x9e\x92\x8a\
-?K?\xd4}\xc2\x17__;\xf8Z\x9f>e\xef\
-l \x1aO\xef_\xa2[\x0bv\x09G\xb0\xe5\x0f\xdb\
-P\x05D\xfaC\x9d+\x8f\xdf\x15\x0a,\xf1H\xb6-\
-\xe4\xbfk\x9f\xe6\xa0\x1e\x10a:\x0f\x87\xa2?s\x01\
- \xc2\x01\x98\x8d\xdd\xf4\xd9\xd8I\xee]\xbb\xc9\xbdk\
-7\xb9\x97J&\xd1\xa0\x06y\xf9@:\x8b\x1c]\x90\
-\xd8M\x16\xe9\xa0\x05\x801n\x1bSu\x9c\xbbu\x5c\
-\xa4\x0aX\x98\x02p\xdfs:@N\xc1\xb3\x01\xf5\x04\
-\xc0\x02\x80\x1c\x82\x05<^\x14\x80\xc7\x8b<\xf0\xdeu\
-\x01x\xef:\x0f|^\x04>\xcf\x05_\x14Uf\x91\
-\xa9\xcct\xdcs`\xf1\x08\x8a\xa92\xb9\xa7wK\xd5\
-)@1-\xc8+\x06\xa8T\xeb;\x11t\x08\x9dM\
-\x81\xce\xdc-OW:\xa5\x0etg\xe3\x17\x0f\x85\x9a\
-n\xe6\xd7\x0ad\xbb\xb1\x8b\xb9\xe9\xb0[m\xc0\xee\xc1\
-3QI\xcf\x97G+\x83m\x1f!\x91lwH\x93\
-\xdc\xae45i\x03\xf9\x0aT8\xf4\xde\xe2\xa9\x9c\xef\
-&O\xe85\x87\x9c\x9b\x94\x9e:\xe9\x88K\x80\x0c\xc6\
-\x00\x0f\x84?d~%\xc2\x8b3\x13\x84-\xa2?\x19\
-\x8fQ\xf9\xc5e\xa6L\x02\xdaA\x8d\x1e\x07\x07\x81(\
-\xf9\x1a\xcf&\x09j\xb1?\x88\xf1\x91\xb0h\x91bM\
-\xf2(Z\x9b\x1b\xc5p\xa9t\x8cB\xee\x06/\x18\xbe\
-\x01\xe37J\xa5\x9b\x04\x12#~N%\x1f\xbd\xb9\xc4\
-)\xc7\xc3\xb1&\x95\x9eC\x17\xa6\xce2\xad2i\xd1\
-?\xd6\xa5&\x13y\x0aa\xcf\x11\xaa\x0a\x09\xcfb4\
-\x97\x9e\xca,\xb1^G\xb9p#\x9f\x80\xb0\x11f\xcb\
-A\x0b\xfbdI\x17/\xefr\x93\xd4\xa5L^\xae\xf9\
-\xfc\xd5 ?\xa9\xc7\x0c\xb6\xd3\xcf\xe8\xda\xb2\x13\xa8\x1d\
-\x0a\x985\xf9\x82\xe3>[\x1fhz\x17\xfc\xe1\xad\x02\
-{\xb6,\x99\xbb\x03>\x10\xf9\x87h@\xafe<\xcd\
-\x04B<\x9b91\xcc\x84pP\xc8\x9b\xe7\x02\x097\
-\xc8 \xbd|\x10\x96\xbf1\xc8\xcb|\x10\xbc\xfc\xe3\xcb\
-@\x06\xfbZ\x04Fw\xa5\xd6\x07\x02\xff\x5c\x04\xfc\xb3\
-\x02\xfe\xd9\x00+\xae5\xa7\xf8*2\xaf#\xcd'\xb2\
-c\xd2+\x9aWl\x1c\xbf\xd9\xe6$e,\x1fi\x8e\
-J{\xea\xe5\xa4F\xffHT\x8f\xeb\x01<M\xbe\xaa\
-\x22\xcc\xdc\xf4\x14$\xa2y\x00Vq\xcf\x0f`$\xb0\
-\xc7\xa2\x8b\x06\x0f\xc2\x8doF\x0b\xe1w\x1f(YA\
->\xa2pz\x02\xff \xd4g\xf4\xa54{\xb8`\x86\
-{D\xb1\x0c\xf8\x88FS\xe7t\x17\x8f\xec\xed\xee\xe2\
-\xf1\xfd\xfd0\xd2U0\xfdU\x0c.\xd5\xab\x8d\xad\xea\
-\xc1\xae2t-\x0e\x14\x88\x8a\x89\x85\x857G\xc7\x17\
-\xef.\xc3lr\xcb}h\xc7p>\xff\x14<\xaf\x9b\
-\xd3\xb3\x5c/T\xcf\xe2\x18\x98^\xc6\xf1\x9b\xb3*\xdf\
-\x9e\xd3\x0b8ML\x0dT\xa7Y\x0c\xa6}.\x18p\
-?\xc8\x80\xcb\x83;\xb4\x80\xbdZ\x05\xef\x8f.,\xa7\
-\xc9\x0fxX\xe0\xca\x07dj\x1f\x9b}\xfa\xf6\xe7\x96\
-z\x92\xcfi\xa1\x80\xb0\x1d\x8fP\x8c\xedP\xe1\xc7\x93\
-\x9bd\x011Q\xc6$?\xa0\x09\x97DL\xfdB{\
-\xfc\x00Cmu\xad\xf0\xd3=\x0a\x19\x96!s\x05\x08\
-\x15<yb<4\xbcG\xebq\x8eS\x01\xd7\x06q\
-\x89lc\x22P\x9e\xcd\x86~\x90\x88A\x92\xe7V\x13\
-\xb5\xe1\x88R\x82\x0f\xbf\xed\x14\xd4a:\x12c$\xe8\
-\xc6\xc1w_k\xfb/\xc2\xdd\xdd\xc6\xb3\xbd\xcd\xcd\xe4\
-\xf9\xee\xdev\xa3\x06\xed\xea\x97\xd7cP\xe3'\x8f\x05\
-\xd3\x9d\xd3\xf7\xc9\x80^\xdb\x85j\xf7;\x1dHRS\
-\x85\x1f1V\x17\xd1|\xa12T\x7fF\x8dV\xb4\x08\
-e\xc0\xe8m\xa3\x0b\xc5vX\x10\x86\x82\xefpeC\
-\xa8\xc0\xca;\x8dF\xda8<\xc7:\xf6\xb4`s\xcd\
-1G)\x96\x19,L\xec\xd3\x80\xcc\x12\x1a\x97\x04v\
-\x926\xaf\xae\xb7k\x8dv\x81Ac\xad\x02C\xab \
-\xf5\xc4\xd2@\xf7y>'\xda\xca\xd4O\xe8\xc2\x0b&\
-\x0e\xcd\x5cY\xf9\xf3\xb38\x19\xd0J+! \x99\xac\
-\xa2t\x7f\xa9\xde\xc6r\x10\x8d+Q\xbe6\xfdt\xf8\
-\xe5\xeeu\x12R\x10\x8d?\x5c'\xb6\x1f\x8c3\xa9\x06\
-\xe4\x03 \x1a\xcf\xeb\x04\x96\xeeub\x1bMh\xf7\xcb\
-d\x94N-rB\xc6\xbeUJ\xe4L\x85\xbcP\xe8\
-\xe5\xae\xdfS\xa6\xa7\x0c\xd5\xfdP\x9a\xf4\xc6\xc0QB\
-\x90\xcd\xdffSx\xcdL\xca\xe4\x91\x98'\x05\x98'\
-\x05\x98\xf7\x1f\x85w?\x17\xeb~\x0a\xa7\xd6\xc3K\xe3\
-D\xb1T\xd9A|\xa2@\x1d\xc4\x1aA[\xe7P/\
-\x92\xfbs\xbc\xd0\xbd\x86\xcdxP\xe2\xb1A\x13>f\
-\x96X\xee10M\xcdE\x87 \xe77\xd5\xa5\xd9T\
-f\x13W\x00\xa2\xb7F\xcc- \x18c4Od\xa8\
-VX\xf84\x89u\x99V-=i)\x1f:+\x83\
-\x5c\x14h\xe3y\x1d?$X\xeb8~Y\xc4\xdc&\
-\xad8\xb6\x0d\x11\xa7l\x88xeF*& \xd0\xc0\
-\x9b\xef\xbb\xb5\x9f<P{ \x88\xd1\xa2?\xfc\x86\x1a\
-\xfc\xd9\xaa:u\xf5\xab\x0a8|R\xff\xbe\x8aO\xbe\
-\xb7\xe2\xfb\xbf\xb3\xd3\xe5=\xd8\xef\xe9t\xa6x\xb83\
-\xa2\x1bG\xceR\xb5\xca\x09s\xa0\xfeY\xe3\xa5\x17E\
-\xaa\xd9l\x15\xd74\xdb4\x8cS\xa4a\x14\xc0\x86\xd1\
-\x87\x04\xb1a\x1cF\x83\x7f\xf4\xa5\xcc\x9e\xa4k\xc5\xc8\
-\x9a\xc6N\x09G<4\xa6\x0c%\xe6G\xc8\xe4\x1c\x9a\
-\x92\xb4gT\xa6\xa1z)\xa7W\xadmCN\x03e\
-\xdf\xea\xeb$\xedzv.\x89dST\x5cf\x04j\
-\xdb\xcdl=\xd2\x8b\xff\xda\x01\xe7>\xec\xa7\x879\xed\
-\x81\xado\xac\xe9$\x0ew\xc2\x9b\x0d3'\x95\xba/\
-Vq\x84Z\xb1\x00\xc0o%\x87\xc6~\x0ct\x22\x9a\
-\xcb\xd0\xa6\x12\xdb\xcbU\x07\x1d\xaei\xdbqq9$\
-\x08e\x14\x8c\xcc\xd3\x84\xd6\xd2\xd4U.X\x0bdL\
-\xe7\xf7v\x0d;Y\x08\xc8\xec\xa8\xdd\xfa<v\x11\xef\
-<\x89]d\xabZ\x0f\x81\xb3\xc5G\x84'\xa9W\x01\
-\xbc1\xacc\x99\xe2\xf9o\xff\xc5\xa3aa%\x02;\
-#\xc4\x19[\x0fY\x94\xc0\xb4\xbcE\x5cj`\xb6>\
-\x0d\xb6\xb4!:\xe1\xcf\x9d\xe1\xbc\xe9\xc1W\xa9\xa6\x86\
-\xa2\xee\x97=e\x01\xdc\x05\xd1\x00\xcc\xca\xb0\xf5}\xf2\
-\x8d\x17h\x7fO\x16c\xd6\x12\xb7\x10hfn2\x15\
-\xc3\xd2\x08\x1dj\x0fP5y\xde>7Q\xf5\x8e=\
-\xc6\xe4\x0b\xcaoJ6+~\x16}\x85\x04\xe0\x95(\
-Ef7\xcd(\x8cpm\xb8|\x9c\xa1\xb3\xf0\x19\xf4\
-\x01\x01\x13\x80\xb2\xe1\xa2\xec4\xb1y.c\xcc\x9f\x80\
-L8\xd0V\x89)\x01\x22[%\xed\xce\x02\x1aH\xb1\
-lK\xc6\xa0W\xa0\x9d\xfb{8\xb1\xa3\xda\x972\x81\
-_\x0c\x8e\x10\x9d\xcd\xcd'\x92\x17\xf1\xbf\xfb\x8b\xef\x9a\
-/>\x99\xdc\x00\xf18\xbdc\x9f\x83x\xc1D\x11\x1b\
-\x91\xc44\xc9`>in\x91\xb7d8\xc5\xcd\xe2\xeb\
-o\xe8\x5c\xc7v\xc1aU\xa2dZzX*\xd9\x95\
-\xb5\xe1\xee\xef\xf3*\xebK\xbfV\x9d\x17\xb1\xd20m\
-\x1e-V`\xe2&!n\xc0\xd2&\xb7\x8a<b<\
-\x84\xba\x5cJ2\xf21E\xc5\xdd\xc7\x99\x90\xd5\x1d\x16\
-\xcc\xe97u\x9c57\xb8\xd5i\xac>\x8eN\xc1\xb9\
-\xd0dP\x85+\xbc\xba\x00\x99\xbbMY\x08V\xe5\xcc\
-\xe7\x8a\xd6\xb0\xb2\xc5\xf2\xff\xaf\xd6\xff9\xab\xb5\xf7\xf8\
-\xd5\xda\xfb\x9e\xd5J`\x8f[\xaez\x0e\xcc\xcd\x82\xd5\
-^X\xe6\xff\xc3\x96,\xd7\xf8\xffEk\x96\xb2\x7f\xef\
-\xa2\xed\xfd\x0fX\xb4\xef/^\xbd9mz\xff\xfd?\
-\xfd\x1f^p\xf9\xe6\xe8\xe2\xea\xdf\x7fxwE\x11\xff\
-\x19\xd5\xc3\xd1(K\x9aW\xca\x9f\xf7-\x8cN\xcd}\
-\xdf\x1a\xd7\x07\xb7\x8fu\xd4_\xd9h\xa2\xdf\x8d~\x17\
-\xa6\xd1|c\xf0\xd8\xfd\x80\xed~\xdfLC\xcf\x13\x19\
-W\xa5\xd2\x1aL\x96\x10%\x12)\xea\x05El\xcaA\
-?t\xa9\xd6\xeav\x18\x8f\xa2\x92\xf7#\xb6\xa2\x7f\x7f\
-\xdfW6eM\x8f\xf9\xa8\x8c\x1f\x92\xa7\x1a\xeaK\xf8\
-\xfb\x7f\xd2\xdf\xff\x0b\xff\xfe/\xff\x9b\xd7i\x03\x80\xf0\
-~\xb0\xf8\xb4\xe7\xa6\xd4\xe0\xd2\x80\xf1d\xc8e\xf7\x91\
-\x94\x13\xc7D\xf3\xd4\x8c\x0dLcfd'\x8a\xa3\xf4\
-\x83x\xc0\xfeWI\xf08\x9e\x88%D\x91\xb3\x8c'\
-\x80\x82M0\xc3\xf4\x80\xb3\xffu\xf7f\xb4\x98\xfb\xd6\
-w\xaet\x92\x9d\xc9\x8cc6l\x06hHT\xc9a\
-\xdf*\x8f\x98\xbc\xc9\xf4\xdb\xd1\x02\xe8u\xeff\x11\xcd\
-\xfdl\xd4\xef(A\x99\xbc\x9eTE1\x04\xbe\x94*\
-H\x0d5\x93\xab0\x0d\xa0$\xb1\x5c\xbb\x19\xfeG\xc0\
-\xc0\x8e\xbf\x7f=\xba\xba\xba\x90l\xf7n$c\xc0\x9e\
-@\xc9\x19\x19\x01s\xe6=\xb6\xabX>\xba\xb9\x89f\
-\xc5\x9e\x14K7\xfd\x96\xaf&\xd7*@Sb\x0er\
-{\xde\x1f\x03c\xffa\x1e!\x0c\xbe\xab\xfb\xb7\xc9\x0d\
-L\xf7\xe4\xc7\x05M\xee\x1fIJ\xb2\x81\xcf\xe5\xc7\x11\
-\x1cT7\xb0\x90n\x1f\xbf~\xf8\x91\x06\x19N\x07\x1b\
-c\xbaiD^\x9fn;rN_\xd0\xcc\xe2\xd3\x97\
-{\xae\xcf\x01[iA-\x99<\xcb\x11\xd3\x96\xfa\xa1\
-\x0d\xd1\xeew\x94\xf3cH\x95R\xfa\xb8\xab\xf6\xe1\x07\
-\x8f\xc8f\xd6\xa6O\xc5\xee\x01\xaei\x00\xfbV<\x8e\
-:\xba\xdc>\xe1\x89K7\x0ft\xfc\xc5\xa7wdg\
-vb\x8bM\x80*\xc1BN\xe7\xd1\x96\x0du\x1e\xd7\
-\xc8\xe7\xc4_s\xb8\x9a\x10\x03\xc4o\xc0R\xe2\x03:\
-\x96-s\xfa1\xa4\xce\x0c\xd4\x03\xbeT6\xa8\x0eE\
-\xf3uo@v\xe73h\xd8i\x8a\x06M\xa5\xb2\x93\
-\x03\xfa[p+\x80\xe6\xee\xb5\xad{rc\x92z\xc9\
-\xc8\x85\xdbf\xf0\xd9\x00\xfeJ\xda\x8b/\xc0R\x15\xc7\
-\xb7h\xd9\x8aBd\x88\x7f\xbe\xa3\x22\xa4d\x83\xf8\xf1\
-\x0f\x19\xa8\xe6b\xe9\xee<-\xba\xa0;\x0cL\xd0\xa4\
-\xfbH\xa4\xf0\x0c\x80\xaf\x19\xd3\x07f\x82o\xe5E\x86\
-\x9cD\x04\x15j\x11\x9a\x0b\x16\xc0*\x12q@x\x98\
-\x97\xb7i\x9b\xb4N\xa5\x05\xa9\xe3\xb08\x1c\x80\x224\
-\x1f\x81\xb27BC\x7fW\xfap\x9c\x96J1\xc1J\
-\x9f\xaf)\xb6\xe4\xda\xac\xa5\xb8@\xf7&\xc2]\xbe\xfa\
-\xeb\xa92\xf3e\x0fn\x8d\xca\xd3\xcf9\xd2\x9d\x9c3\
-v$\xb1U\xccx\xdd\xef\xe8\xb2\xd9\xa9\x93\x1a\x0cW\
-\xe0\xecS1\xfcB%o YbV\x90\xb7\xe56\
-Y\xad\xcf\xf5\x16xI\x01\x1b\xd92\xd6N,\xba{\
-\xc98\xd0aw\xb0\xea-\x8d\xf7\xe7\xfa\xc6\xf8f\xbe\
-\xd8\xe8E\xe4\xfa\x09(\xaex\xee\xea&\x03\xed\xb2+\
-\xb0=)\x99\xa1I\x89\xea\x8c\x84\x8e\xd8\xc5\xdf\xd3(\
-\xd4>\xa7\x9e\x947v\xa9\x19\x82\xee\xed\xe3\x01\xb0d\
-\xf1 tG)\xe5\xe5(\xc6}\xf7\x81\x92Vv\xbf\
-\xdb\xe6\xcd\xf3\xc4L\xaaJ\xef\xa6\x8f\xaf\x12\xa4\x85\xf1\
-\xc0\x88\xcf\xd4\x1b\xc7-d\xa2\xfeW/U\xe5\x89U\
-\xe5\xb4\x8d\xaa\x94\x09\xabk4d\x83\x99\xce`\xbe\x03\
-\xa7wz\xf6\xea\x97\xe0Q\xcd\xcc\x15\xa0\xf13\xc5T\
-\xbb\xb8l\x9e\xbc\xee\xa9\x93\x98c/\x99L'Sh\
-C\xe9\xc9dz\x7f\x0f\xc7\xca\x94-\xdd\xb4\xa5\xdcw\
-\xef\x99\x0d\x0aC\x80\xb5\x9c-\x16\xccO\xf5t\x12\xe7\
-g<\xdf\xe8\x8eP_n\xb01IF\xdf\xe0\x0fz\
-\xc5\x9cu\x17\x93\xd9\x5cM\xcd\x96\xe3\xbc\xdc9\x1e\xbb\
-',9\x22\xdf\xdfs\x03\x0fmn^\xd267\xd5\
-\xb1\xaa\x84\x08\x8b\xbd\x9e\xa7\xceQ\xc6\x1dEU\xc7\x05\
-\x92\x096\xfa\xc7\xe0\xe2\xbaX\x888Bc\x09\x9c\xce\
-\x0b\x9f<\xe1\x9ab4\x1a5Fi\x84=u\xf0B\
-\x85s\xd8\x87\xc5R:*$\x7f\xcc\xf8\xf4/5\x09\
-\xc8\xc7K\xdfu\xd3\xe8:\x9e\xd4\xeb\x99\xbcJ\xe2\x1f\
-\x98o\xecB\x86\xf2\x914\x99\x9d\xfe*\x871\xe2\xd2\
-\x96\xd1R\x16%B1\xaf\x18\xc96\xbb\xc9Z@7\
--l\x05\x10~`\xe3\xff\xdb\xa7O\xf4Zr\x8b\xed\
-\xae\xa7\xbcDbn8\xa9\x08\xd5n\x96\xd29a\xcc\
-\xb6|\x9c\xea\xbaq\xdam\xa4FT\xb3\xc9\x1e.\xaf\
-U\x80\x8f'\xf3v\x04\xed\x10\xdc\xdd\x84\x83\x81jo\
-jsN\xd1^r\x94\x89>2\x01\x9evT|\x9d\
-\x99W\x8cn\x1c\xba\xcd\xf9\x12-\xe6RNw\xf6\xb9\
-\x80\xb1hy\xa4\x1b\xdc\xc7%\x01P\xd0H\xf8[\x0e\
-\xbd\xa5\x88\xab\xec\x0c\x90\xe2\x97\xbd\xd5\x9a$\x8b\xce\xe1\
-Jg\x9d\x0eHK\xb1v>9\x0b\xf2[\x08\x97(\
-\xe7\xed\x93EI{\x18\x22W\x82\xf8h\xb4\x04\xedm\
-\xf2j\x816[>`p(HS\xac\xe4g\x87\x01\
-s\xae\xef\x9f\x0f\xd3+\xb9\xebF\xe7\xa8\xd7\x9e\xd5E\
-\xeb\x87\x82\xea\xa9[\xe4\xd4\x13\x0a\xd6a\xabt.\x1a\
-Z\x9d\xe2\xdf\x828AHT\x93\xa9\xf2g\xcb|\x86\
-b\x19\x9d\x10\xce\xac\xceLH\xf7\xa6\x95\x84\x9c\x22\x1d\
-\x89\xa0\xe2D\x5c\xe2\xb9\x18\x8e\x93C\xa7x&\xaf\xaa\
-\x07\xb9\xf7\xf7\x12\xc1\x0fxq\x82'\x8e/\x81\xc4\x0f\
-RY\x10\xa4JlY\x98J\xd1\xa0\x8c\x8c\x00\xc5\x13\
-^\xe8\xa4\x04I\x95\xb5\xb9\xdch\x18E\xab\xf5\xfc\x13\
-$\xc0e\xc9C\xe2\x9c\x9d8\xc5\xa1r\x9e\xfb\xfb|\
-\x16\xc8\xbcG\x86M\x06\x8e\xa4\x1b(\xbf\xc4\xed\x0e7\
-\x19a\x86\xba\x1b3\x02\xb1\x19 \xbb\x1f\xf9D\xef\xe0\
-\x87\xa3W<\x1dE\x16z\x15e\xfb\xc3\xb5\xb6\xad\xa4\
-h\x1d&\x8a\xfcT\x0e\xd9\xec8\xd2\x1f\xbb\xacW\xc9\
-\x22\xfa\x1c\xcd \x1b\xaac\x0e#\xed\xa3\x1a\xa5E\x16\
-g\xd7E\x85\x15\x02\xd5-\xf1*\xb8\x1b\xc2\xe8&[\
-\xf5]\xf6\x95cd\xd4u\x1ex\xaf\xec\x95\x93\x82F\
-\x870\x10\xfcd*5\x0c]\x8a\xd4\xd7\xb5r\x8e)\
- up4gx\xe4\x19\xff\xc0\xf5i+\xed\xa8}\
-\xad\x92\x00\x17\xe9\x1c\xc3\x91\xeeX\x07\xea'\xeaS\x04\
-\xd6a?\xed]\xe0\xb0\xaf\xdd\x084\xfb-8yk\
-\xe9\xebD\x8e\xe7\x99-\xb6\x80#N\x09c\xfb,2\
-\xb5<p\x98\x1e\x22\x82\xa2\xcd\x16\xa4:\xbe\xcfv\x09\
-\x82d\x22\xed\xa3\x9e\x9fN\xe6\xe1r\xa2\xdc@\xdf4\
-=*\xc9[\xf1)GD:p\xca\x09\x8c\x0c4E\
-\xedH\x9cI\xdc\x9d\xd3\x22/_\x16M\x0du\xc5\xd1\
-\xbam\xbe\x16T\xa7\xbd\xe6P\xb4p0\xdch\x96i\
-5k\xc1L>V\xb6\xec\x1a=\x89+\xa1\xa0dH\
-\xc1\xa5O\x04\x85\xd2\xee\x96\xed\x82\x05\xbe\xdb\xd0c\x9d\
-\xe0Q\xf3HKr\xec\xa3O\xa0\x86K\x8d\x03\x8e\x1a\
-\x0f\x8d\xe5\x98\xef\xd1\x8eV2\x96M\xd3{\x9b\xaa\x81\
-\xdca0\x08ssh\xb6\x22g\xcb\xd3lrj9\
-\xae\x9f\x01\x19\xc62}\x18\xd4}\x0b\xf8\xf5<-\xa8\
-Bo\xb2\xf8\x17T\x81\xc6\x98\xeb\xd0\xc3\xedc\x15H\
-7g\xb4~\xb0\x9f-\xcd\x0d\xdd\xf5\x9cB\x1a\x89\xa4\
-\x1f\xc8\xceC\xd2'\x19\x7fI4\xc9\xf0\xe1\x12\xb4+\
-\xc7{u1\x93\x15\x10iG\xfe\xca\xf0\x98\xf3\xa7\xf4\
-Xj^.\xa1\xc3\x8a\xa3\xca_\x81\xe8ot\xca\xe8\
-\xa9\xa8E@\x87\x19b\x98c\xe4\xdce\xd23\xc7Y\
-9\x1f\x13>\xd2\xbe\xb2\x94IX\x7f\xc3\xc9lO\xd6\
-G\xf0o6:ViL\xcf\xf8\x9c\xd1\xb52\xb5\xd2\
-|\xdb\x9b\x8cn\xa85\x91\xe1\xb0V\xd4\xbd\xdd\xc5b\
-\x96\xcf\xfa\xa2\xfe\x8a9\x94C\xaf\x97\xb70* \xaf\
-\x87\x05\xd8x\xa7\x02\x94(\x04\x987\xdbl\xf5\xb0?\
-\xa4\xdb\x01h]\x1b\xab\x02\x8c\x80\xfe\xacNg\x93\xc5\
-\x84\x9cO\xc5sj\x80\xbbs\xbf\x9d,P'\xed\xcd\
-ky\x9d\x22\xe7\xdcd\xb2\x00\x96\x83\xf4]7\x22v\
-o\xe2\x05\x84\x10\xb8r\xdc\xb0\xb1\x0e-\x7fY\x92\xd9\
-\x03!\xe3\xdc\x8a\xbc\x9c\x94}\x98F!\xfc+\xfd\xd8\
-\xfe\xdb\x8f\x9d\xa7?\xde{\xed\xbfy\x9d\xa7\xde}\xfb\
-o\x1bA\xe7)&\x07\x87\xf0g+\xf63\xdc\xc4\xd7\
-\xee(\x1ep\xbd\xf0F\x03\xaa%q\x1b\x1c\xb9\xd1U\
-\xf7\x1cMbb0\x08\xbc\x04_o\xe4\xb5]\xdd\xbb\
-\xb4\xd5t\xeb\x88\xafE5\xacGx\xb0\xb7S]\x85\
-\xad/\xc9\xe46\xc1\xaa\x9cMf\xa7\xaa?\x9c\xbe\x9a\
-E\xfd\xc9\xe7$\xfe-\x1a\x98\xca\xb1/h2\x8d\xca\
-xU\x17\xe2\xa4\x81\xf6\xdc\xc8\xac\x81J\x9c\xc5#8\
-,\xea\xeb\x1b\xbd,$k\xc3\xd2~\x82\x0e\xfe\xd1\xeb\
-\xf8\xa5*\xf4a\x1d=\xc5\xfe\xa9\xe1\xd1.\x03\xf8\xf0\
-m\xc0bvC\xb7\xf0\x14Q]L\xc8\xe2\xccq\x17\
-\xf5\x88\x0e\xb9\xd0'\xb5\xa6w\xdd\x1d\xcd\x8b\xc0\x00\x8b\
-\x00\xd6i\xca\x99~ah\x8c\xab\xeaY(n0\xd5\
-:\x96)OSB\x189N\xd3\xfaY\xfej\x8d\x92\
-\x19\x0f]\xc9\xf2\x04\xae\xf4\xcb\xb2\xbd\x94\x22\xa7T7\
-\xad K!\xb3ni\x80\x9bK\xe4\xd2\xae\xbb\xe3x\
-\xf4\xadY\xa7\xfb\x03\x12\xdc\xf2\xe7\xad\xbc\xe4\xe0x\x12\
-\xd2\xd7\xe5UY\x9d\x9c<\xa0\xb9\xcad\x00\x81\x18\xff\
-\xf0;\xb2:\xbf4\xab\xcb\xdb\xb1:\x9c\x80\xc9\x82B\
-\xa1|7\xe3\x11mF\x8e<]\xf7\xdd\xdeAu\x0f\
-=\xef\xb0\xfbno\x1b\xbf\xb5\x9b4\xbc[\x16\xcb\x0a\
-\xa9\x0e\x08\x86j[\xbb\x93\xd3\x12\xc3\xe5\x12\xbbV\xe9\
-\xeb\xfd=\xb9\x185\xe0\x5c-\x08\xfb\xc1\x90\x13\xd4\x89\
-\x08?\xa96([\xf8*i|\xdc\xaa\x15\x0aY\x11\
-\x11\xca\x04\xc6\xce\xbd\x9c\xb5\xfd\xca\xee\x0b\xe39&Q\
-\xfc\xbcTH*}6\x1b\xe1T4\xb7Y\xe2D\xbd\
-\xb7\x10\xef\xe9=\xafI9U\xf5[\xbdY\xd4\xfd\xc2\
-N\xce\x17*MZ\xa9\x12\x85^\xb8\x89\x0e\x96U~\
-\x8b\x09\x86\x84\x99\xddi^\x8b\xd3>\xf1\x8aw!\xe3\
-\x16\x0f\xe5 hk\x0aW+B\x88\xb4G\xbd\xde\xaf\
-\xd4\x09\xd2+\x1a\x04\x91\xae\x1a\xebSy\xf5\x1a\xe6\xc9\
-\x9e\xc8g\x98\xb5\x0d+\x15\x88\xac\xb0\x8dx\xc3\xa6q\
-T\x8f\x95\xae`}\x87\x8a\xb5\xa7\x8b\xbf!\x84\xd5S\
-\x03:\x00\x86K1\x97%\x0f\x91\xb5\xad,yZ\xac\
-\xce\x07\xe6\x16\xc4\x0f4\xact\xc7\xa18\xd4\x1cBW\
-x\xe5a\xc0\xa1\x01\x9d\x1a\x87~\xd3\xa4\x96\x9dT\x84\
-\xb5\xbbL\x9c-;F\xb7\x1e\xdfS\x09\x95\xee6\xf8\
-\xd04\xb6I\xc5\x91\xf3\xb8O\x9f\x94\xed/\xd5\x00a\
-\x22\xc6\xd3p\xd8\x1a\x86\xc9\x10\x91Ah\x95\xab\xc4\xf0\
-\xd0\x10\x0c'\xb3\xf87\xa0_0\x08l\xd3\xac\xf0\xf2\
-jXxq\x05G\x176AV\x987Y\x97\x99(\
-\x14\x19\xb7z\x80\x0a\xe6a\xce\xeb\xdc\xe2\xa2p^\xdf\
-d.x\x89\x14s\xaf\xde\x06\xc3`\xc0lS1~\
-!\xbayIL\x80sRV-\xb1\xc7\x05\xcc\x10\x95\
-gI\x08\xcc^\x91{/z\x7f\x8fY\xfb_2+\
-\xd6\xed\x10\xe6]\xd9<X\xce<\xfcZ$P\xbd\xcd\
-\x9d\xa0\xf9\xd3\xd6\xf8g\xcf\x19\x8a[\xd51<\xd8\xd6\
-\x0e\xb8\xb6U\xe8b\xd0v\xfd.\x94\xce:a\x8a\xf0\
-\xad\xf9\x15&\xdaWs\xec\xa8l\xf9,\xa6\x17z\xfb\
-\x95$\xa9Loq\xf1~\xb5\xee\xb4\x9a\x16\x1c\xa5e\
-%\xadb\xca*\xf7\xcc%W\xe9\xf8\xf7\xa9R\xa8P\
-O9)-d\xc7\xa7%\x823\xbcW\xe9S\xf5\xd3\
-\x00\xff\xf3\xab\xc8\xad\xff\xa9\xee\xf9$\xb3j=t\xb7\
-\x8a\x9a\x0f\xad\xdc+\xea\x8c\x08&u\x9b9\x8e\x13}\
-U\x8f\x16GM@\x9e$\xd4\x02\xfb\xd4?\xff6\x1e\
-GP\xf7>\x1f\xc0\xd3gz9X\x1a\x81A\xe6\x8a\
-Z\x19\x95z\xf8\xc4\xee\x0a\xaaQ\xae\xe3\x07\x05\x07\xea\
-\xd6\xa3DN=\x94\xab\xa2@\x84N\xee\x0f\xfb}E\
-2\xf3rr\x97\xbf\xfau\x89\xf6\xeb7\x8aDi\xe5\
-,\xe9\x8e\xf0,Q*8h1\x12\xbc6\xc9\x14\x90\
-!c0\x0cx\x0b\x93\xf6\x02\xff\x88bt#\xd1\xc6\
-\x01i\x19zh8\x80o\x9e'\x8fQ\x12@/\xb7\
-\xf4>\x00\xede<\x06\x1e\xadk\x18\xe1\x16\xd9\xdax\
-\x84\x8c\x89\x0c\xfd\xe7H\x99\xea(\x06\xea?\x1a\x0b\xfa\
-\x0e(\xc0\xc2\xb4\x5cl#\xe4L\xbd\xebxTt\xc6\
-6\xcb\xb3\xfa\xf4\xd3\xd6\x96{\xaen\xff\x0dN\xa3\xb5\
-\xca\xb3_\xab\x95\xce\xd6\xe7\x18\x13y2\xea\x87\xdd%\
-\x9ar\x88\x1fj\xa0c\xd3\xaaF\x90\xcc\x86\xb7\xe0\xd0\
-Ku\xc1\x03b\xa4\xa0O\xe2Y\xd9\xdb\xf2\xca\x84E\
-kbW\xff\x8e\x17\x88\xf8\x1e\x13\xa2\xcb\xa1\x07aX\
-\x22G\xff\xee\xe8\x97\xeah\xd2\x05\xa2\xd8\xa6oL\xfd\
-p\xf1\x9a\xa0|8z\x96\xf8\x1c\xcb\xac\x9e\xa8\xbc0\
-\x8djS\x0dP\xbf\x98\xde\xf4y\x1d\xe6\x8e,!\xc2\
-'j~\x87\x9c\x90^D\xe8;fqt\x8dD\x88\
-J\x92\xfe\xe5\x92\xe8L\x95}a\xc8\x8fU\xf1\xce\xa9\
-\x8fO\xadq\xef$\x8f\xa7*\x82\x87\x03B\xf3\xb0M\
-\xfe\xc7\xb9\xb6\x04\xc6\x97\xf4\x88\xaa;*\xd8\x9eZ\x98\
-\x93\x8f\x8c\xea\x1a\x9e\xe1\x0f\xd1\x18\x8a\x0a\xf8+\xfd\xb6\
-;\xa4\x0c\xf2Z:~\xae\xaa\xd1\xc2w\xcd\x06W\xc1\
-\xfajY/oQ\x81\x1af\x22\x9c\x1b\x01h\x8e\xed\
-\x99s[\xe5<j+\xcb\x1f\x0d\x06\x04\xc4}Q\xf4\
-xI??\x0akA\xb9\x9cz\xa3\xfe\x02'\x88z\
-\xe7\x7f\xf4\x0b?\xa6O]\xd1t\xefh\x00\xa0f\xa8\
-\x91(\xcf\xe77\x80\xc8\xc7\xe3\x9b\xf1\x06\xab$\xceU\
-\xb5\xa1c6\xa8\xe9\x1b\xd1]?\x8a`\xfa\xb4P\xfc\
-@f\x12X\x00q3\x9b\xc7_#\xc9\x07l\xf8\xe8\
-\x90\x94\x15\xd9\xfeX\xe1\x95:\x9b;\x08D\xab3\xf8\
-\xaa>XA\x8d\x8cq\x88\x87\xdah\xe0\xdc\xa2h%\
-\xde\x96G\xda\xbb\x19\x15\x8a9\xa0\x81n<C{,\
-*l\xae\x86H8R7\x17AKBr\xa8\xb49\
-\x9b\xce\x13\x86>\xde\xe0\x96\x8b\x06\xa2\x5c7#\xe1\x8b\
-\xc0\x13\x16\x8aut\x91\xfbX%\xa3\xe7u\xc0o\xb0\
-PT\x8e\xa98\xff\x96p\x18\x97\xf67UG\xc0r\
-\xdb\xc1\xf37p97\xe3D\xa5\x9a\xc4:\xab\xcf\xd1\
-\x81rN\x97\xd4\x80\xac\x1a\xcfQ\x96\x82\x02X_\xf7\
-\x9e\x95\xf8V\xa2BUzU\xd5\xa1:\x8f\x07Q\xa8\
-;<(\xa5.\xfa\x19\xdah2p\xd8\xd6e@\x83\
-q\xa1\xe1JS\xe8m%D\xa9\x1d\xae_\x9a\x04Y\
-hn4%2\x88\xcdg1=\x04\xa2\x89\xde|\xd3\
-D[YtH\xbfh\x8bF#=\x0e\xf1\x9c\xb3B\
-'Xz\x1b\xceM\x1fk\x90Io\x1a\xa3\x0a\xd9\x97\
--liz\x0eK\x91\xfb\xa2R\x0fbN\x8f\x83q\
-\xe8\x1a]\x88\x9f\x8f[j*\xbbJ\xc51Lf\x99\
-\x88%FX.\x07Hj\xd0\x03\x06E\xd7P\xdd\x9e\
-R\x0e\xc7a\xadY\xc2p\xa5\xc21\x9b\x9bT\xf6s\
-2\xc9@\xb5\x88+B*\x04\xc9\xa6\xac\x14\x0b\x8b\xbd\
-h`\xfb\x99u\xc9\xf2\xcfU\xb7\x07\x8b\x86\xc2\x1b\xd4\
-\xf1|\x9d\xda\xedm\x90j\x1cM\xb6\x0d|\xf3\x07K\
-\x9c\x5c}P\xe5\xdc\x17<\xb1o\x84\xb2%\xc83\xf3\
-i7<\xaa\xfc\xb5s\x8f~\x5c|T@\x816\xc4\
-\xe5\xb0\xd1D\x05j\xe2\xf1\x00g\x98\xf7\x12(\xd0m\
-i!\x8c{]\x801\x1a9*\xcdp\xf3\xc3\x90@\
-\xf5\x06\xf5i^\xfe\x13o\xd0J\xe1\x08\xb6\xbb\xc7r\
-j\x80)\xa8\x19\x9a\x1b\xa3\xe1\x91\xe3\xd9c\x98\x9e\xd4\
-\xa4;\xbeH\xcf8D\xc4\xb6\xce\xf2T3Z^\xdb\
-\x0b\xc35:\xe8tK\xfd\x08!\xff\x06\xbfZ5\x11\
-\xc1\x16\xda4\xf2\x01\xc1\x13\xd9>\xa0O\xe5\x80\x96R\
-I\x13\xb4on\xe6\x8b\x97\x11\x81\x88\xad)I(\xbc\
-s\xdf\x18\x18\xe0\x8c\xfe\xe4c\xfb(@kA$\x1b\
-\xe3sE\xb1\x9e\x1b\xae\xfb\xc9\x94n]S\xe4\xd7'\
-\xa2\x00D\x06\xd35\x851\x14\x97{\x1b\xc3a\x01D\
-\x95\x8c\x11a?\xf2{\x08\x043\xa98\x95\x9c\x08\xae\
-\x1c5\xbf\x11\x8dK\x98\x80:\xf1~\x0b\xbfd\x06>\
-\xa7\xc7jxc\xa6-\xb2P\xaa\xe1*N\xc7)\xb4\
-\x82\xa0\x9d\xce\x89\xdas*\x07\xceX\x18\xcd;|h\
-\xe7d.\xbbuB\xdd\x9c\xa0\xa0\xb5!U\xe4\xef\x93\
-8)y\x1b\x1e\xccv\xba\xc7\xc2\xfe['Fa\x89\
-E\x92\xd5|M\xc1\x99\x01%\x03\xa4\xaf\xde\x9e\xbe\xbc\
-8=\xfaK\xf5\xed\xe9G\x0c\xd0\xa2\x88\xc6\xef\xa3\xd9\
-\xab\xa4?l\xeeW\x1b\xc1\xf4N\x87\x1a\x81\x99\xa9f\
-\xc9\x0c\xf01\xbf\x88\xdf\xe1\xdb\x10\x9f\xca!\xb9\xaf\xff\
-4(\xdf\xc3?\xf9~\xea\x1f\xfa~izw?]\
-\xdcG\xe3\xfb\xe8\xee~|s?\xed\xdf\xc7\xc9\xfdx\
-|\xdf\x1f\xe3u\xe3*P=\x95*E\xf4\xc7\xfb\x22\
-\xd6\xb0\xd6\x0d&\x03\xc1']\xa33`\xb3\x17\xfaj\
-\x02\xf7j\xe0\xbfo\x92x\x11\xaak\x15\xd1?\xc23\
-<\xacpL:\x1c7\xbd\xe8N\x87\xaa;\xdbO!\
-f\xba0\xe9[\xf5\x1aD\xf4uD\xbd\xda \x10\x93\
-i\xfc\x94j\xa5\xbbo\x8b5\xb2t\xffyqR\x08\
-\xdb\xf4\xfa\xe3bD\x8d\xea\xeeN\xd3\x1b\xaf\x83\xd8\xad\
-\x22\xc4\x8d]\xdf\x038\xdb\x07\xa7V\x1f\x9aq\xa2\x89\
-\xda\xed\x01\xab\xeb?\xdf\x8b*;\x87^\x0d\xfa\xa29\
-\xae.&g\xf1]4(m[\xe4\xeaS\xf5\xb0&\
-\x04\x9c_\x0d\x04dW7\xff\x00\xce\xec\xbd\xe2B\x98\
-\xdf\x10\xdb\xbc\xbf\x8f| \x91t\xf5U\x0b4\xaa\x98\
-\xdb\xe4o\x9b\xc5\xac\xc9\xd3Tk\xcd\xfa\x18q\x8d\x8f\
-~x\xc5{\x0b\xd2&\xc6\x95\xa6y\x0d\xb2[\x9c!\
-I\x14{\x98\x1bk\x91\xa9&\x9c\x918\xae\x90\xdcp\
-2\x97\x9eL\x92\x08\x8a\xa7\xa8\x5c\xfa\xc2Lyn\xa9\
-!#\xb2\xe8E@V\x80\xd7\x0ar\xec\xae/\xeaw\
-j$\x19\x16\x16\xaa\xe8\x0e\x02Y\xc9\xb1\xeeJ\xe77\
-\xd3\xe9d\xb6\x88\x06b\x83\xd8\x8e\xcaj\x9e\xad\x02e\
-\xb23\xaf\x9eZ51+\xa1A\xde\x11\xd8\xe7:i\
-&\x1a\xf5\xd8(\x19\xc0!\x18wd\x01 Sa\xa4\
-\xc9(\xdc\xcc\xae\xe8\xf3\xa9S\xfa\xa7\xad8\xb5\xd5\xca\
-e3Y|\xd37\xcf\x96\x91F\xb2\xf0\xb4\xf1\xe3\x9f\
-\xeb?\xa2\xd5\xd1\xafr\xa1\xdb\x1f\x8b\xb8\x17\xa2\xd0z\
-\x0f^\x8e\x96H#\x12Rr/\x94\xb9\x00\x098\x05\
-X\xb8\xcd\xfb\xae\xf1\x00e\x09XL\x1b\xfeH\xa9\xd0\
-\xde\xd0\x82\xc0\x1b\xd8C\xfe\x85\xad\xae\xc9_)U\x0c\
-\xb2\x9c\xea^ \xa0\xce'\xdaO\x85\x7f\xac(J\xe2\
-\x1c\xbez\x828}\xd5\x82\x88\x9eP\xc7nn\xa6J\
-\xe5m\xa9-e\xd7;\x9d\xc3T\xd8\xb1B\x05\x88\xb4\
-\x09*\x00\x91\xd3\x5c\x03U?LE\xa1\xe4L5W\
-~\xb3\xf4\x07\xcf\xda\x8d\x9c\xb3\xf6\xf7\x9f\xb2G]`\
-H\xedA\xc3\xc3v\x80\xcd\xadu\xac\xbe\xa8u:\x22\
-\x0c\xb7\xa3\x1e\xd9\x179\xfa\xc3\xd6\xe4Zo\x19\xca\xaa\
-\xd9Z\xf3P\x16\x9cc#J\xd9\xc84\xa5\xd0\xbc\x09\
-\x80\xdc\xe8\xa2\xe0\xdb\x12\x99\xc1tN\x03\x93\xa0i\x99\
-\x92\xb7QR\xd5\x88\xd5<\xab\x0a@\xb6\x02\x9aVi\
-L\x8f\x95W\xcc\xd0M\xf5\xe0\x9c$\xf9\xfe\x92@a\
-\xd1\xf0\x016CI\xd0a\x22b_zeS)\xd2\
-\x15\xe7\xc5\xc5t\xb5\xe4\xf5\xbd2\x1f~m\xb9b\x7f\
-4\xbbov\xd2\x1c}\xfbo\x10Yj\xc3\x1f\xbf\x8c\
-ixE\xd0\xe2\xe2K\xd61:\x85H\xa1\xe1\x8d\x03\
-\xbf4\x19\xb7p\x8f\x10\x8an\x0e\xad\xc8\x19F\xf2\xf3\
-(+\xb6\x8f\xb1bU\xff1\x12\x11#\x01\xb1N\xfc\
-M\xee\xe9u\x82\x8f\xa0X`\x822\x11\x99'\xbc3\
-\x09\xc1\xc5\xbe!\x02\xcd\xb1\xfa\xba4\x93\xce\xa2\x08{\
-s\xe6\xb6\x07v\x02\x1b\xf4\x0f\xbd&\xd2\xa8\x14F?\
-p\x22\xec}\xd8\xd8\x1d\xd2\xe5e\x8b\x93^\x0d\xec\xed\
-U]A\x05\x0e\xb6\x86\x1f\xe4\x0aN\x9c\x9c\xd9\xb1u\
-\xa7\xcd\x06\xcd\x02f\x01,\x9e\xeb\x1ec\x85o2\xd1\
-M\x8c\x15o\x06\xbeO\xcb\xc3\x15\x0e);\xa3x'\
-o\xee\xa20\x09E\xf6\xb8\x904\xbc\xf5t%\x93\x81\
-EJ\x8eL\xe9p\xbdD\xa9\xf9(\xc1\x13>\x15\xbe\
-\x5c#\xa6\xb2.\xa6B\x80\xb5\x97u\x16\x18\xb8\x0aN\
-J\xa97\xd3\xa2\x96\xa1\x01\xbabYTN\x91\x17\x11\
-j;TB\x9f\xe3\x8b\xa9\x84\x9a\xdf\xccJ!a\x01\
-\xd4T\x0c\x1f\x1d\x8f\xb8\x9a\x86\xd6\x1b\xfb\x95L\xc5\x80\
-\xda9\xd9L\xb5\xa8\xce\x02\xa4l[\xd2\x19\xc4\xa6e\
-\x96\xde\x8cP:T\x94I\x8f\x0fg\xf0P\x1f\x15g\
-\xe2F\x1d\x16K\x8f\x1e\xd5`\xc2C\xd0\x15\x04\xef?\
-\x04.\xa4\xa6Y Ft\x04\x882\x1c\xe9\xa9\xe6<\
-\xa7\x97\x8e\xed\xa3 -|\xc8\x0ac_of\xc6\xce\
-b\x9f\xf71\x16o\xa2h\x8cl\x7f\x96\x9c\xc7\xf2\xea\
-\x8d<\x1a\x90\xebk\x83\x03\x10\xcd\x97\xbf@\x0b&\xe3\
-c1\xbdZ\x22\xb6\xe8\x15l\x1a\xfd\xa0\xbe\x87;3\
-\x1a05\x03`\xd9\x0c\x8d\xee\x16$\xe9PVz\x9f\
-(+\xbd\x94\xa2\xa6\x0c|\x13]\x86\x9a_\xa5\xa4d\
-\xa8\x0bzO\xa22\xda\x15Zfc\xbf2\x5c+=\
-M\xb3\x05q\x1b\xfcX\x0d\xa1\xca!R\x17\xb4%p\
-\xb5\x0a\x12\x80y5O\x99\x0136M\x0b\x85Z\xba\
-\xa89\x9e\xc3E\xd8\x9f6p\xcbwiV\x11%\xcb\
- C\xeb\xc12\x08\xef\xf1\xa5\x8d\x15\xfb\xe4\xf8\xb2\xd0\
-`\x9c\x9f\xd63\xbd\xaf\xfa\x1b\x87\xc0\xc2\xab\xc2\x8e/\
-\x0f\xd5\xad@x|\x09\x8c\xa7\x0cl@\x01\xbf\xa9\xad\
-\xe2\x06tH\x0a,~ u\x8eEJ\xfc\xee/\xfe\
-R\x14\xca\xdc;\x0fQ.\xf3\x9aR,\x03g\x0e\xa4\
-\xdfu\x05\x82S\x94\xf5\xd2Vk\xf1\x92T\x98./\
-\x04#\x9a\x9e\xd3\xd2b\xa2\xd8l\xade\x03\xf0\x8f\xa5\
-P\xa4\xfc\x1c\xeb9E\xa1c\x1d{\x9c\xa8g\xd0H\
-\xa9m\xc1\x96A\x97^S\x9d\x89\xff\x1e\x0a\x13\x1e\x07\
-\xe4\xa7s\x1e\xd6\xd7\x199\xb6\xbb\xb0\xc8F\xf1RW\
-G\xcf\x1fKS\x0f\xca\xe6\x82\xdch\xe8(Xi5\
-\x14\xc1s\xb2\x9f3\xe7x\xfe\xfc=\xd0&\x07W9\
-\xa3D\xfd\xf9\x92\xfa\xc7\x8c\x94\xd5\x97x\x95\xf6\xd0|\
-\x86f\xd0\x84R[G\xc6\xdc%_\xa5zme\xd1\
-\xc4L'%6\x8b\xae[\xc5}\x5c\xfb\xe7\xf4qA\
-_\x16u\xfdJ\x81W*\xcf\xc3\x9a{\xac2S\xf1\
-\xf5d\xf2\x05\xa9]\xde4$#?\x1b#\x86\xd0\xb3\
-\xde\xfb\xb1\x83\x8a\xccvQ\x1d5\x9c\xff\xac\xc1\xfc\x82\
-~R=8$\x8e\x06h\xea\xe5\x1a\x8eNT3\xac\
-\x07\x14Ouq\x05\xe7F0a+\xf1\xa4F\x92\x9a\
-\x85\xb4\xe1a\x1ah]\x98\xe6\xdb\xafQ\x17e\xb8\xf0\
-dx\xc3<C8%\xbe\xe5\xe9\x1f*c\xdf\xbc6\
-\xf9\x95\xb0\x5cZmnJ\xcd\x94\x05\xb8\xb8R\xb1l\
-.\x15\xe9M\xe8\xc7\x07975~\xf0\xf0\xf6\xeb;\
-\x03\x95\xe5!\xfdV\xce\x18\xbd\x9b}H\x8c\xd6<A\
-[+\x0f\xc6\xe5\xc6J\xde\xd0\xa5\xa7\x88&\x0f\x93+\
-\x87\xb6\xcc]`\x82\xeeag\x88D\x8cN\xe4\x0e;\
-\xafx\x84h\xcd\x96\x08UAO\xfa\xf6eX\xa9]\
-)w\x0eK\xedj\xd0Q\x02o\xfe&\x817\x028\
-\x02\xef;\x96v\xa3\xd8{\xda\xc7d\xd8\xc6}#D\
-\x8f\x92\x87\xaf\x8f\xe8b\xc0\x12\x89\xdbu\xcdU[p\
-\xaa\xfb\x87\xea\x8b{\xaf\x980\x07\x8c\xbe\xbb\x91\x84)\
-\xc5\x7f\xfd\x0e\xe2\x11M\xca\x9900\xca8g\xd8\x1e\
-\x83\x9a'\xfar\x0bg\x0c$m\xa0\xcc{\x9e7I\
-P]-m\x09\x88\xcd\xbb?\xbc\x88\x0dI\x16\x82\xfc\
-%\xe8?\x8a(+\xe6\xe1\x8b\xca\xf8\x80\xa9\x7f\xb3\x09\
-\xba\xab\xdc\x7f\xdc^\xa8)\xe7?\x8fJS\x1f\x01\xc7\
-\xa0\xb6\x80\x95M\xa077\xfb(S\xc7^\x5cC\xaa\
-\xbf\xb8\xc3I\x1abo'\x8b3\xd4%\x05\xce\xe8X\
-<\x1a\xa5\xe9\xf4\x9f\xeb\xfa\x01\x0d\x15\xa1\x07S\xe9\x16\
-\x16\x0b\xc0\xe4yX\x81\xe88\xf7\xc5\x98\xa0-\x9e%\
-\x85\xd8\x8d\x1e$C\x16\xe1\xb7o\xb3\xdd\xe3\x82\xb2A\
-\xa5\x1e\x02\xe6<->|\xd0vXsI\xef\x05\xc3\
-v'@\x85\xa4/\xa8\x09!\xaf\xfb<OkG\x10\
-1\xb4N\x0d\x9f>\x1d\xb6\xff\xb4\x5c}\xfaD*\x01\
-%\xf8S\x8a\xfe\xe1\x1f\xce\xa2k\xbc\xd7_\x02-\xe2\
-\xe5\x01\xd3\x1bs\xa9y\x8d\x5c\xcc\x9f\xe88\xda\xe7\xc3\
-\x8b\xd2\x9f\xc0I\xecs\x12\x95\xe0\xa8:\x90v\xef4\
-\xad\x05j\xf5(b\xe2Y\xf3%\xc0\xbd=X\xae\xd4\
-\x83>\xdf\xb4\xe5K\x18\xc3\x8eg\x15Q\xfa\xf2\x1c\xa0\
-775zG{\xe0\x0a9\xac,j\xd2\xafVH\
-\xff\xc4X\xe9\xe2g\x03\x1b\xa7\xf6Sz\xed\xc6\xc4M\
-\xe9\x83\x18 V\x09\xf1\xf9\xf7\x8f6\xd7j\xac\xfd\xf0\
-)\xd3\xec'\xba(\xa5t\xc2\xbf\x95\x8a\xa9\x98\xe8\x83\
-\xd00Yu\xe3\x02\xb3\xca!\xe9\x11'\xd9'\xec \
-\x17\xd1\xe7\xd3\xbbi\xdb\xfb\xd3\xa6\xa7hx\xeb\x0fw\
-\xf5\x8aZ\x82\xea9\xe5\x10p\xd2\xe6\xe5\x95\x8a\xe6\x12\
-\x8e\x80j\xc0!\x8ds\xe3{\x0ao\xa4\x0a\xf7U7\
-\xfaj|\xfd\x7f\xcaTm\xac\x9b\xaa}-j\xe4\x95\
-\xb6\xe5\xb4\x0a\xaf\xaa\x80K#\xbd\x1b{\x80j\xd4w\
-ew\xcc\xe4\xf9\xa5dt/8\x16C \xaaW\xd1\
-l\x1c'\xdd\x05\xdf\x82\xa2\xd1B|\x9f\xb8\xd0\xb1\xa8\
->\x84(7\xc8C\x99>\xd2|\xb1\x97\xf7\xa3;X\
-u.\xab\x90\x11\x11\xa3+\xa2\xb6\xd1ow\xed\xa2h\
-%\x05\xdb\x12\x1e\x1a\xd5\xcf\x98\xc1\xf3;\xa4\xe2\xcf\x15\
-zQ\x97;\x94\xb6z1\x97B\xdb\xa1\xa7\x0c\x86\xc4\
-^9\xa2\x0a\x22\xb1t\xf8\xb2\x84/92\x97-\xf2\
-0\x98e\x8212\xc83\xb2N\x02\x1dk\xb5\x924\
-\xef$\xba\xce\x7f\x98\xc8/-\xb5\xdf\xa4 \xc7?G\
-(\xaf\x16\x01\x8ds\x9b\xf2\x084\x99{\x1c\x85\xcb\xd5\
-{\xb5%\x8c\x9f\xe7\x01\xef\xd4F\xaf\x8ez\xc6#\xef\
-\x89\xa2b\x07\x81>n(\xb0\x03\xa4x\x1b\xa12\xa5\
-\x8c\x0e\x1d\xae\xdbC\xc4T\x0e\xfb\xe5lZ\xd3\xfb\x81\
-\xb5\xd5\xf8w}\xfef\xa9\xf4\xc4\xac\x9fz\xe5Y\x07\
-5\xaa\xfb/,\xad\xe0\xf4\xed\xedh\x14}\xc6]\x16\
-\xba\xf5=\xda\xf3\xc4K\x5c\x8e\xdbH[\xf9\x04\xa2\x17\
-\xcd\xc8\xf7\x02\xcaDt\x9b\x1d\x1d`'\xa0ah\xbd\
-\x92i\x9ey\xbb_\xa9\xa3R\x15w\x9d\xdf\x94\x9a;\
-\xd2\xaf\x82\xfc\xab@\x12,\xefX\xb0\x1a\x1az\xa6\xce\
-\x1b\x9aJ\x93\xb8\x8b\xee\xaa\xe7u\x15Y\xfa\xdb}\xfb\
-o@Q\xfc\x12\xe9\xf3=\xfd\xf4\x89\x85b\x7f\x228\
-\xc0%\x92@\xc8\xc1}U\x06\x84\xb2\xa6\xdc;\xd3\x97\
-\x1f\xce\xceN/2w\xa6/o\xae\xa1\x87\xd0\x16\xa5\
-ui\x1a\xcb*\xdb\xe8Q\xea\x06\xbeF\xf9>\xa5d\
-\xa8\x10\xd4\x04o\x88\xb0\xbc\xa3\x9b\xcf\xc4\x9d-\xc9\xfd\
-\x16_\x00\x8b?-r,\x16\x9c\xa0S\x0cz\xf76\
-\x17\x97<\xc1%\xaa\xb6\xdfL\x11\xf8\xe2\xea\xc3\xfb\x80\
-[\xd2\x5c\xea\xeb\xdff=\xda\x09t\xc3\x9a\xbb\xf5F\
-\x0d\xd6\xd5\xe4f\xd6\x8f\xdeD\xc9\xcdU\xbc\x18\x89W\
-y\xe1?\xf1T\x01\xa1\x0d\x1d\xec\x04\xddD=\xcc8\
-M\xfa\x93\x01^ryHx\xe2>En\xddU`\
-\x14\xbd`\x0a\xd3\x88^&\x9f\x03\xef<o*7h\
-\xc7\xd0X|4U\xa5\xe8\x12\xea\xdaN'\xf3\xc5#\
-A\x8f\xb9Ai\xefX\x97\x1f\xde\x9f^\x94\xcc=B\
-\x95\xe1\x0a.\x19\xf86I\xd9d\x94\xd1V\xfe\x10Y\
-\x07yN\xb6Z\xf9[I\x0d\x14\xa0\xba\xb2\x9d+-\
-\xcdL\x02p\x9b\xae\xc7;\x93$\x97h\xe2,\x8f\xde\
->\xa0%\x8cY7\x99\xe3\xdd\xb95\xe3\x89\xf8\x1bo\
-!\xf1\x9c& y\xe1A\x13\xa1\xaa\x93\xd0\xddf\xf5\
-s\xb4\xb8$x\x95My\x17\x0fy\x13\xe2X\xb2\x9f\
-g\xd1\xf1\x04\x8f\x99x\xe1\xa6\xd6M\xeb\xfe\xd3\xfc\xfe\
-S\xe2\xa3E_1T xT\xd2\xfd\x9f\xfc-1\
-\xc6@\xacw\x13\xff\xa8\xc2\x9a\xf2+\x1bW\x93\x7fV\
-A_\xc6\x91\xfb\xdb\x9d\x17\xd5\xd3\xbb\x08]\xdd\xf3\xdb\
-v\xe4\xc3\x15\xb4:;\xa9p\x8b\x9aM*6\xf8\xd5\
-Z\xcc\xbe-]\xbbel\xd7\x94\xcf\x15}jR4\
-\x9b\x91\x9c\xe2\x09|TaVR\x17\xc2\x01\x16\xf6\xca\
-\x0d\x88ji\xa3Dh\xb4\xb1\xbb\xe0%\x0e\x09\x81\xdd\
-\xac@\xf5\xa9\x1e\x82\x9ab\x10p3\xd6\x96tH+\
-\x09\x99\x988\x81\x85\x1e\xd3\xbd\x14\xbd\xd5\xb3\xb6uy\
-\xa5\xec\xdc\xfaI\x80\xdf\x1d\x12\xc6\x04\xe8\xc7,\x1a\x90\
-\xa15\xd9\xd2e\xb4\xc5\xcc\x02|\xf23@\xec4T\
-U$=\x08Ua)\x04mc\xa9\x92B\xaf7\x9a\
-\xd0\xe3Ji\x842\x8e'}B:\xef\xbaoCc\
-\xd7\xcd]\x9a\xeeh\xdd\xdf\xeb\x1c+\xb3\xdc\xdd\x83\x9c\
-\xdd\x91\xb6q_M\xcb%\xb7.\xe7;\xb3\xcb*\x1b\
-\xf7\xe2$\xba\x88F\xb4\x84\xe7\x94\x8d\xda\xcf\xcfdW\
-\x815\xbe\x06y\xd1@\xf3\x9a\x8b\xe6\xf3\xee\xe7(\xc4\
-\x99#\xdf\xf6\xd2\xa9>\xdd\xb2o\xa1\xf0e\xd1\x1c=\
-i\x8e\xaa\xef\xa1)%\x22\xa1\x1b\xb8-T\xd8$\x1c\
-N7\xbc\xee\x10Ty\xe5v\x98\x9d\xe2I(p\xf8\
-\x8e\xc0\xad\xb4JX\xf2,\xd6>\xaf$\x1a\xc7Uj\
-\xfe\xab\xcc\x9d_U\xa1\xc0\x93b=_%\xc0#-\
-Jn9\xc1RM\x05Re\xce\x7f\x04\x85\xa6\xbc\x81\
-\x8e&dB<\xc3\xa5e\x5ce\xb6;\xcc\x12Wq\
-\x09\x1b\xea\x1c\xd4}?\x8f\xcd3\xdc\xdb\x8a_qZ\
-\xcao\xca<\xa5c\xef\x12\xdao\x0cN)&\x1a!\
-\x9bF/\xa6\xc9\xda1\xf9\xef%_\xbd}{za\
-\x142\x88\x85f\xa3\xf5\xea\xa9\x1ei\x06\xb8\xce\xae\x8a\
-_\x96\x06k\xcd\xe6\x06\x1e\xe2WD\x81M\x99:\xab\
-\xdd*^\xd9\xcc\x87\x18k\x9d\xdb\xf5\xa3\xf5\x9eSa\
-\xee\x9f?Xcm\xbdxL\xbaL\xd7\xa8\xf2z\xe6\
-zu\xfc\xd7\x0c\xc8\xbb\x8b\x133\x1c\xac\xbda\xb7Q\
-i5\x0f\xdfw\xc9\xef&\xd7\xc2\x1byy\xbd\xfb;\
-\xfaS\x14@\xd6\x16\xc9\xd5\xf7f\x9e\xee\x1e+\xd5\xf4\
-\x0fu}\x80\xaf\x96\xfc\xa5\xb7Df\x83b`wX\
-\xe9\x00\xbe\x81\xc4\xdf\x90n\x16\xe9\x93\xb5\x92NBo\
-\xf9\xe9S/\xfe\xfc\xd9+#\x0arFC\xe9\xa8`\
-\x11\x5c\xa9\xe4\xbc\xd4VF\x22\x87\xc6\x15\xc8\xc3\xde\x04\
-\xd6\xa2W>)_\xe1\x7f\xe6d\x8eJ\x07.\xfd\xb4\
-\xa8\xcdX\x04pq0\x0e\xc6\xc0z4\xd8\xe5BX\
-\x0b\xc6\xa1\xeaI\xfb\x01\x11\x1eSP\xf0-I\xed\xb8\
-C\x1b\xb0\xb3Q\xa2\xb2\x9c\xcf\xf2\xb3r\xfd\xf9\x18I\
-V=\xb4s`L\xc3\x8a)\x93&\xe5\xb8\xee\x9a\xf1\
-\x1b7R\xe1z\xda\xccq\x982\x0evq\xfa\x9a\xb2\
-=\x0c\xd6\xf2\x01\x9b\xc8\x15\xcf`\xefx\x12B6+\
-|\x7f\xafJ\xb3\x04\x90hWYaw\xa2\x09\x9a\xb6\
-/\x02\xa0/\x8a\xa3w\xe7\x14G_\x14\x87\xf6\xaa\xb1\
-i\x83C\xe8\x16\xe5j\x02\x22\x94e\x93\x1a>\xbb\xa3\
-\x13#\xa6\xbb\xf3\x1b\x07H\xf9\xd8P\x83\x83\x1aV\xb0\
-gA'\x02\xe1\x0d\xc6\x95\x0a\x1b\xd5\x93\xbe6\x06\xb0\
-\x0avRkXV+v\xc5\x90f\xe1\xe0\xb4V*\
-\x99\x97\x08X\xfc\xd2\xf0\x12N\x06z\xb3\xa4\xd3\x98\xe3\
-P\xbb \xd7\x96\xb7\xe0\x95/%\xa5\xf8\x8fG\x14\xe5\
-p\x12\xdfS\x16\xbe>\x86c\xce\x14\x9f\x16\x97\xbc\xbf\
-\x03\xb7\x85\xdc\xf9J\xf3^\xaf\x92\xe9\x0dr^(\xf7\
-\x0a4\xfb}\xd3\xd3\xdfG\x90\xc7\xd7\xa1w7\x0b\x81\
-\xc7\xb3\xd3$AF=\xcc$\x96\x96\xf1\xa0\xe9\x19\x08\
-/@\xd3\x80\xf4\xe8\xbdQ\xdd\xaf\xeez\xc0$\xc0y\
-q1\x99}kf1\xeb\xb4\xb2\xb7e\xe3\xb0\x9f`\
-\xe7dK\xbd\xd0\xb6s\xe2\xb1\x07;\x22?c~y\
-[*\x93GF\xa2\xbe++Y\x95\xf2\x82\xdb\xa8W\
-\x9cUR #f\xa9\x1c_^z\xfadKG\x17\
-\xf4\x82\xc1\xaan\xb4\xc1\x01\xbb\x115\xeb5 Qq\
-r\x89\x81\xa3\xc1\xdfo\xe6\x8b\xe6.\xc4\xa0\x80\x01\xc1\
-_1\x8f\x8eb\xb6\x1b\xe5^\xf2\x8cM`y\x97W\
-\xaf~\xf9)J\xa2Yw\x14\xfcx\xdc\x1d\xf7`\x19\
-\xd3\x93\x90\x1f\x83\x1f\x8f\xe0{\xb4\xf1!\x89\xe1\xe4\x1b\
-m\xbc\xb9\xfc1\x00\x96%\xbe\xf6\x82\xd3\x7f$\xc7\xc3\
-\x9b\xe4K\xd3\x9a\x19\xd5\x97\xa8\x08\x1a\xcd`\x91\xbd\x99\
-\xf4\xe2Qt\xd8\xa8Q\xc5\x14\xf0Y\x17\xbb\xa4Y\xaf\
-\xee\xea\xa8\x93\x08OR\x08\xa4\xdf\x22\xcd\x9bK\xeca\
-h*n\xdau\xb1y\xe5\xa13\xcc.\xc0\xcc<Z\
-\x98v\xb9r\xec\x1c .\x88\xbb\x88>\xc7\xc0\x02t\
-\xd9\x11\xf2\xba\x09Ze\xd0hF\x0b`\x0b\xfdF\xaf\
-\x9f\xd1\xa9U#\x05\xd3\x93~\xbdL\xf1\x95=r\x9e\
-\x01f\x08\x8e\xf1\xaf8\x7f\x87\xa00\xb0i7\xe9\x12\
-\x1d\x9c\xfe|\xfa\xf6*\xb8z\xf7\xe1\xf8<8\x7f\xf7\
-\xf3\xe9Epyu\xf1\xe1\xea\xfc\xf4\xd5O\xe7Wa\
-=8=\xfb\xf0\xd7\xbf\x86\xd5zp\xce\x1f\xb5\xc6n\
-pb>/\xaf\xfe\xed\xf5\xe9e\xb8\xf4\xaa\xe3\xbf\xdf\
-U\xfa\xc3\x054H\xbb\x1c\xc1\x17G\xd8\xc9\x15>\x1b\
-\x01#\x81\x01\xb6w\xe25k\x01n\x11\x8bJ\x0c\xd3\
-#\xb1\xc2\xa4\xaf\xe75Y\xedV\xe2\x16x~\xc73\
-\x06\xc4\x93p!\xf0p\xd2V\x88\xd2S\x1c\x1c?F\
-*\xf6VJHE\xa3\xc0\x08\x22a\xe8\xfflGU\
-\xba4{\x0dfv9^\x11\xbdb\x1b\xcd\xedd6\
-\xa8\xdc\xce\xba\xd3Ld\x1e\xf00^D\x94\xc05\xa4\
-|\xc15>\x0eSE\xf1\x9a%b4\x22\x83\x83\xe3\
-\xee]\x85\xedj\xe9\xda`\xd4\xd04\x88\xe3\xe2D\x81\
-\xd58d:\xb5\x07\xd5\x89f\xf01\x86\x03A\x9c\xc0\
-\x07\x9a\xc2!!R}z\xb7Q\xf3V\x81W}\xf3\
-\xef~\xe9Wd\x94\xec\xf1R\x03\xe5\x0c\x84hY*\
-\x84\xa8\x81\x0dh4\xda\x1a\x22\xd4\xa3\xdf\x86S:\x8e\
-\xe8]\xa7y=\xe9\xdf\xcc\x83\x8d\xded\xf0m\x83\x03\
-\x1byp9\xf3\x85N\xfa\x9e\xc2{}3\x1a\xa9\xe6\
-.\xf3\xab\xa6\x11P\xce\x0a\xbe*}\x12\x8f\xf1\xf5\x0f\
-\xf2\x07jA\xc3\xc8\xd7j\xf4\x80\x8c\x11\xe3\xb6\xb5f\
-\xb6rOV\xfa\x134\x836\xc7A\x9cG(\xc4]\
-D&Q\x8f{\xcdF\xba\xf1t\x0dZ\x98\x9e\xbd/\
-\xf1\xa2\xd2\x9b\xdc\xe1\xfc\xe3Y\x83\xb4\x06\xda\x82\x91v\
-\xc5\xbd\xcax\xf2\xdb\xe3 \x1f\x05\x94]`\xaa\xda\x09\
-\x9c\x1d\xc9\xa9\xc4c\xa7\x83\xca\x08\x8bwB\xb7<\xdf\
-\x97\x95f \xdd%G\x03\xc8'6\x9fj\xda\xcd^\
-\xd3\x9b\x11\x8f\xf45\xca\x80o\xbc\xa0\xfe5\x90\xdd\xde\
-|2\xbaYX\x90=\xbc\xcd\x19i\xd0\xfc\xa1P-\
- \xb4\x0fBM\xa6\xd9\xe6\xa94\xb6*m%\x9bi\
-h\xf2\x7f\x8df\xc5\x180U*\xeb\xc9\xc2\xaa\xd0\xf8\
-4\x81\x1fu\xc7P%\xcf\x84&\xb8\xe9N\x95\xfe\xa9\
-\x18\xa9\x9b\x00#\x07n\xd6tG\x0a\xb2W\x0c\x09|\
-\xab\x03\x8c\xe1u\x98s\xe1\xd7\xe0'\xfd\xad\xcaP\x81\
-\xe3U\xcf\xc3\xd3\xe1f\x863R\x9b\x15\xd4\xb3\x17\x1f\
-i\xeaU.6.\xa9\x7f\xbf\xc6\xf3\x18\xb8\x8fx\x01\
-(\x87\xf1\x00V\x84\x81c\xb1\x14\xa03\x86\xcc*d\
-\xb9\x0c\x10\xfep\x06\xff;8\xf0\xc4\xdc\xa7\xf7\xc3\xf1\
-1R(O\xd1p\x22\xd8\xf4\x06cC'ib\xde\
-\x80\xb4\xed\xe9\xdd\xfa\x9dP\xb6\xbcg\xb0\xe3\xa9\x1a\x99\
-\xdb\x85\xca\x1dm\xd6\xee\xae\xac\x10\x98\x06\xb0\x9d)\xe8\
-\xc2\xf9W -K|\x91\xa96\x22\xe0y\xe0l\x03\
-\xeb\xfaf6\x83\xa5M\x8e\xbcL\xceE\xce\x92@\x19\
-\x82\x06\x18u{\x11,\xd2\x07\xe1\x16\x83\x82\xb5\xb5\x9e\
-2\x11\xfa\xf5\xa8\xf1:\xfa\xa1\xf9\xc0\xa1\xe2\xc9>\xed\
-&Y\x1c\x9e\xd9\x14\xbb\xb9t\xd1\xe5\x0e`\x1e\xeb\x1c\
-1\xef~E\xbb\xa2\xda\xcc\x90c\xd5y\xb0Mk\x1b\
-J\xdd\xb5\x9e@e\x8au\xcb#\xb6Iw-61\
-\xdb*E\xc5\x0d!\x98\xdd\xc0\x9cRFE\x0d\xa5\xc1\
-\xa5\xd4d\x1b6\x02\xfa\x95\xa7\xaa\xb6?\xaai>\xf6\
-P\x1d\xa7)\xb3\x1f\x8a\x86U\xeb{\xfb\x92\xdd\xc05\
-r\xe0\x1a\x8dF\x06n;\x0fn\xff\xc0\xaa\x0e\x0e\xdb\
-\x22B\xae0\xd3\xc8\x9c\xd5\x1e\xe4\xecE\xf8\x5c\x1a\x9b\
-\x9c\xbb\xba\xdc\xe5\xb9kw\xad*y\x1d\xc5*\x00\xe6\
-\xd9\x9c\xeed \x1b@&t\x07Lg\x93~DZ\
-\x8c\xf9\x94\xcbj\x0b\xc9%\xb5\x09`=\xba\x01nV\
-\xd7h\xd8\xd8\xa6v6\xf2\xc8Y\xb0D+\xf4,\xe3\
-N\xfd\x17\xb2\xef\xb9\x87\x8a\x9c\x03\xc4\x03l~6>\
-\xd3l\xd5#H\xa7\x9d\x06\xea\x8f<\x1e\x9b\x96U\xce\
-\xfe\xeaf\x94\x81\xce\x0c\xbd\xb3q\xcb\x14V\xfbve\
-M=\xd8\xb4pf:\xdb\xe8\xfa\xa3\xa8;C[\x80\
-\xc0\x15+,\xd1Z\x1ai\xe7\xce[\x02\xd9\x1eK\x1d\
-V\xf2N7\xfa\x5c\x91s\x94Q\xb4\x08\xf7=\xd5\xf9\
-{\xb5\xc8m\xb5\xf4\x1d\xaf\x09\x5c\xdek\xc9\xbc\x9e\xde\
-r2s\xb8\xe2\x0c:\xea\xea\xef\xc2\xc7\x83\xe3 \x94\
-\x8ck0>\xe6\x18\xe3\xce\x04\xf7D\x989F\xae\xe9\
-T\xa8\xda\x0f\x22\x1c\xf8\x95d\x07\xbf^M&\xe8\xb2\
-\xa7\x80ky\x95\x5cO^\xeah\xcd\xbc`4*@\
-\xe5q/l\xa2U\xce(\xc3\xee\x00w+b`\xf0\
-\xdf.\xfc\xfb\xe1\x88\xfe\x97>\x1d=\x00\xaa\xcfF\x0f\
-\xc0}\xc1\x03\xe7# 5o\x05|\xd5\xc6\x0e\xf1V\
-\xbf\x11%\x81\xb1\xd9\xa9\xd5s\xa78Y;\xae\x09\xb1\
-\xb7\xb7f=?9\x94\xa2\x86\xab\xe0\xe5\xab\x9fN^\
-\xbd9}\x1b\xd6\xa3=\xd4\x18\xb98}s\xf4>\xdc\
-\x0d\xb4M\x9c\xcbp\xb9\x0a\x8e\xdf\xbd={\xf5S\x98\
-\x95=\xb5h\xa8\x8c\x12\xcb\x1c\xa8\x19\xd4}\xde\xc4\x1b\
-H\x91\x12A\xca\xcd\xa5\xc4k\x81\x9exce\xc1\xcd\
-\xaaH\xe1Cl\xd5)\x0d\x0c\x09\x1a\xbd\x8b\x22\x85\x10\
-\xba\x89D\x08q\xd2-\xa5\x87\xea\xad*\x85Z\xea\xa3\
-J\xa2\xc4\x94\xfe\x07\xc5\x85.\x88\x94*\xd5\xb0\x94\x04\
-\x8d\xe8\xf2*\xfa\x85\x84\x9d$y&\xf9X6\xcb\x83\
-\x92Z\x048\xfd\x8a-b\x14\xd6`\xd8U4\x92\xc3\
-\x95V\x09\xb2z\x90djz\xcc\xb4\x09\x82\xaa\x85\x9d\
-~X\xec\xb6\x1e\xf0jr\xd3\x1f\xb2dn=\xe09\
-9\x5c\xa4Z\x1e\xe3\xe9\xffn\x81\x0aG!\xd5\xc5\x8e\
-a\x907\x93\x1b\xd8\xa5'\xb7\x89\x00\x1c\x8d\x16\xf90\
-\x885\xa4\xe2M\xd8N\xbeY8\xa97\x0b+\x11m\
-\x83\xdb\xa9\x18f\x9b\xc5\xf1\xd7\x90\xe7/\xac8Q\xb9\
-(\x0d&}\x9aLU\x14\x18\x01\x0d\xd3\xacw\xc0s\
-6\xcb\x89\xc9r\xdb\x8d\x13\xfb\xd9\xbfk\xf5(\x84\xb2\
-\xaal\xf9\xf9#\x82o\xed\x06\x18C\x0f\x09\x16o'\
-\x03T:\xc0z\x1d\x0f\xe3\xd1\xa0\x04I2o\xae\x80\
-P_\x02k/\xf5T\x95\xf44\x0f\xa3kE\x14@\
-\xec1\x06\xed\xb6\xe7\xec:\x9d\x80#d\x1fUAC\
-\xf4;\x1d\xb1\xcdJ\x1e\x9f\xe7\xeeJ\xa0\xa8\x00M\xc3\
-\x00\xdd\x81S\xceo\xd11\xdf\x22 T\x87\x94\xfb\x9d\
-\x04{\x12\xaa\xe7G\x9fI7\x147\xff\xd3\xbb\xd3q\
-\xc9\x0f\xd8\xe6\x9b0\x04\xa7b\xd5\x0a&\xf3\xc0\xc8\x88\
-\x95bXIw*Uq\x11\x8f\xd9\x91\xdel\xc12\
-gsS\xd4\x1fF\xfd/\xfe\x92~\x08\xaeD\x18\xfd\
-\xc3\xac\xe2\x86\x91m\x8b\xfeF2\xd9\x90\xdalDc\
-R\xebC\xeb\x82\xa5c\xa5y\xe5V\x9f\xa3u\xf5\x0f\
-\xa9\x9c\x92\xdf\x84\x01\xbe\x82ra\x06re\x02\xae\x0b\
-\x89\xe8\xd1\xd0o\xe06\x9b\xae\x01Rq\x92\xdf\x0f\x08\
-'\x8c\xa6\x0bM\x97\x06i\xe0f=\xda\x0e\xdcJ\xa6\
-\xdf\x15\xe3t\x09\x9d\xd9\x8d\xd7\x89Q2\xe09\xe7L\
-7\xb4\x8a\x90D8/Q\x1d\x0fm\x1e\x02\x17Gw\
-\x97h{\x05\xf5*\xd3lI\x86\xc5K5*T\xb3\
-\x00oeP\xa5\xb2\x84\xd0\xa9\xee\xb8\x0b\xb9 \xac\x10\
-\x16>\xc7\xe7R\xbcj\xf8\xdegk\xaf\xe6\xe4\xa0\xb5\
-\x14\xda\xf6\xe60?\xd4sA\x8d\x92\xbc\xe8\xd2\x80\x19\
-\xd1\xebx\x96\x93\x84z\xf2N\xbf\xd8k\x91\xaa\xb9\x0a\
-\xac\x9a7oa3\x9e\xdcbc\xf0F\x04\xf6\xdf\x01\
-\xad\x9aC\xa3E3\x19\x88\xae\x04\xab~\x15d`8\
-5\xb7-\xa3m\xac<~-\xe5\xf9\xabf\x0a\xb3~\
-\x1e\x0dt\x83a\xa7pF\x1aac\xa8\xa6o\xbaw\
-\x1f\xd9\x8a\xfd\xbf\xa2\xa6Z\xaf\x92\x8b\x1eKa\x87\x99\
-\x06\xa8\x14\x1f\xb8\xbbfN\x91\x90\x1eR\x1bDps\
-\xe9\xe4\x22\x87\x11\xaa(\x88d\x05\x03 \x0b\xea\xf1\xce\
-\xe0\xe9\xf4\xce<\x17tl\xde\xdd\x89\x09\x1b\xe8\x90\xd0\
-\xea%\x0c\xb7\xb2\x9dG`c\xd4\xb5S\x15Juj\
-\x90\x06\xc6?\x08\xad\x14\x04\x81{\xc5\x0b2\x9c!\x96\
-n\x08:E\x5c\xae7F\x9d\xe2\x1e\xbc2e\xf2W\
-t\xc3\xfa\x9a\xecd\xa7\x11\xe2_\xed\x93\xf2^\xf1\x1a\
-lj\x1b\x02\xb08+\x17\xd1\xe7\x9bQ\x17M\xd2\xdb\
-\xc0\x96In\x86c\xe6\x22\xa3\x86\xfb\xefo\xa2\x9b\x08\
-($\x12J\x8fT\xc9\x84\xb9\x10\x0a\x1a\xd8\xb4\xb3\xb2\
-\x81\xc86\xb0\x0a\x1bl\xd7\x9b\xde\xadqCp\x9f\xb1\
-/\x0e=\xdac\x82\xdcF\xe3>\x22\xdb\x9b\xf5x\xe1\
-\xdb\x94\xd5\xd1\xe4&A[\x03ArCfIQ\xd5\
-U\xbf\x19\xd9\xf1\xd9\x11\x054\x91\xbc^\xac\x94\x05\x0c\
-4\xc3\x11\xcf\xa5\xa5\xe2\xacB\x87Y)\x12\xcd\xd6(\
-\x02w\xe8\x84\xa8\x10\xd2\xbeq\xa2\x9bY rq\x15\
-z$\x8b\x13\xd2\x86\x9d\xa4v\xedLkV\x81a<\
-\xdc\x05\x12\x14\xb5\x9c\xe7m\x86p\x17\x16\x81n\x02L\
-\x15\x9a6\x17\x11\xdc\xf4\xdf\xe0\xcc\xe0H\x09\xe0\xeb\x0b\
-\xd61\xe6h\x1dD\xba\x8249\xa7\x9e\xe6\x05\x05\xb9\
-\xb5\xe1\x87Sd9\xc6+s\xdf\xe1\xa7O\xab\x88\x0c\
-\xa7\xe3G\xcb\xe4b5#\xa6\x04\x9a\xf4\xa7\xb5\x8d\xd8\
-b1&\xa7!\xdb1\x99b\xa7\x08\xb6\xb2\x8aV\x8c\
-\x90ns\x9c\x19$M,(^,w\x13H<\xd8\
-\xdc\xa4\xea1\x87\xce\xb8V+\x8c\x0a9~>\x8c\xaf\
-\x17%\xfdf\x88\xed\x84MgQ\x9eN\xf7\x02\x82B\
-U\xa9\xef\xe6!EU\xff\xde\xbdk\xf3s\xd7A'\
- \xcb\xcc\x9c\xac\x9e\x08s\x10\xb1~\x0d\xb8w\xa1\x11\
-\x01\xe4\x0a\x22\xf8\xff\x98U\x1e\x90\xee\xb0\xef\xa9z\xb4\
-\x0b<\xc2\x88\x03O\xeaA_\x5cR\x19\x95\x82\xd0\x9c\
-\x1c\xaaZ\xb7\x80\x19V;\x89\x22H\xe3K\xe7\x84E\
-R2\xb8\x9f\xd0\xaf\xf3r\x1a\x9fJ\x8b%\xd3?C\
-\xd8?\xd4z\x0a\xf2\x8c\xfb\x90\xf3rN\xebU\xd1S\
-\x1b\x90\xb4k\x9b\xbaE\x99\xbd=\xa01\xa2D\xa8\x11\
-\x03\xb1\xec\xcd\xf7\xe5a\x8eVF\x13\xa5x\xd5\xa9\xa8\
-\xcad1\xd8\xd8 \xecX\xa5$\x8f\xdf1\x1c\x07.\
-\xe3\xde\x08_\x01mnb\x8c\x99+\x9b\x9b\x9e\xd1%\
-\x80:\x88O\x14\x17\xc8r\xd7\xfbLa(\xe0\xe91\
-\xcd\x97\x11\xae*\x9aK\x95\x88n\xf1\xb5Jn\x82\xec\
-9Z\xbb\x9b\xedc\xe1\x8c\x08S\x19\x22\xad1\xceO\
-\xf6Q\xaf\x89x\xd40}^\x81\xb6`\x22\xa9\x8d\x93\
-\x0e\x9b\x12\x0e\xfa\x81\x94\xda4\xb9\xef\xefQ\x7fP\xe2\
-W4)\xf3\x8e\x22\xdcK\x01*9a\xd6\x18U\xa8\
-^\x9d\x94\xbd\xca\x19>6\xf2\x02C4=G\xc6\xe3\
-\x05\x9a\x0a\xa3J\x0f\xe4}u\x22f8\x06\xc1$\xe9\
-\xf3Y\x10\x05\x08M> \xd2\xb1p\x92\x8c\xd5\xb9Q\
-E\xab\xb0J\xc3\xf3\xa1\x9dF\xe7E\x95\x06\xec\xb2\x9d\
-\x04\x87EI!/RV\x12\x86\xb1\x1a\xa3\xb8\xffE\
-\xe2\x8f\xf1\x1b\xe2\x06\xbd\x91\x1d}\xd2\x1b\xa9\x94/\xd1\
-7\xabf\x7f\xe1P\xb0\xe8\xf6^\xa1\x08\x87\x04#@\
-J\xaf\xba\xbdw(\x9f\xc2\xae\xc6c\x81\xeeq5\xd8\
-L?\xde\xbe;9]\xd7\xe1v\xc7\xda\xca\x14v\xbf\
-\xd6\xe1P\x8ax\x9c]\x83\xb80\x1eOL[a\xb5\
-\x94\x1aS2\xb1\x0e\xe1h\xde\x1b\xe72\xc4\xa0\x0c\x80\
-\x18\x99\x90$\x06|\x04\x0b\xecT4\xc8\xc9i\xf0\xc5\
-\xe8\xddcCZ\xf6\xaf\x16\x84\xb5hb\xd2[\x7f\x19\
-]\xa3'b\xa2\x82\xeaa\x06\xf1\xe2\xe1\xba\x83J\xc1\
-\x19\xc5+\x972\xfd{\xa8\xe7\xbd\xbe\xce\xf0\x1f\xaa\x0d\
-\x91c\xa5N(\x0a\xb2\x9a\x02=H~\xa8\xf6\xf9\xd4\
-'(\xad_\xd2\x90;\x1a\x87\xfa(\x9a:CE\x8f\
-:7\xc9\xee`\x1d\x96\xb2}\x92{|\x22B\x5c\xa9\
-7\x7f\xef\xd9\xaa\x06\xfc{\x04\x5c\x97\xf7\xb6\xfb\xd6\xa3\
-o\xe0\xcf\xb0\xce\xce\xd1O\xd5/\xb3\x050\x02N\xbd\
-\xbf\xcf\xd4\x19\xad\xc2\x16\xe6T;\x18j\x1a\xab=\x86\
-\xa1}\xdeL\x1dyZJ\xc9\xf00\xbac\xdb\xd5\xa8\
-5z'\x0e\xb2\xb6\xa21\xfa\xbb\xa4\xbc\xd4\x95\xd7\xa3\
-\x09\xba\x9fU\xbd\xea\xe0s\xf4\x12\xb7\xf0\xdc\xceb\xc4\
-\xa7\x19A\xa3M\x00D\xf2\x88\x7f)\x8fIQ'B\
-N,{\x7f\xf6\xacD\xa0c\xd1\x0c\x0e\xda\xc0'\x98\
-\xc8H\x0e\xde\x11\xc6?\xcd\xc3\x09\x03\x01\xcc\x85\x09\xf7\
-\xed^\xda\x92\xccV:\xae\x14>vk^\x81\xdd\x96\
-0\x0f\x83v\xdd)\xabfS4\x8e\xba\xd9\xe8}\xbf\
-\xf5\xdd\xcb\xe7\xc1\x15\x92]\xbc\xf6\xfe[\xb0\xed\xff\xd1\
-\x1d\x19\xad\xa52sG\xdd\x13\xfd#\x09\xad \xae\x96\
-\x10\xdfe\xe8\x98\x18}sX\xe1>*\x83:\xb3P\
-i\x88\xdaP$>\x02\x16o\xcd\x13\xc2@\xb8N\xd8\
-\xfb3\x1d\xe1/\xd3\xb8\xc8(y\x06}\xd6sR\xe6\
-pH\x22\xa8R^}OX\xc4\xc5'\xef\xb5\x83\xc5\
-/\x1b\x15\x13\xc2\x9b\x90\x16\xc0\x00y\x93\x9d\xee\xe5\xb7\
-W\x83R\x1e;A\xef\x07Y\x8c\xa0\xa4Jo\xe8\xa9\
-\xcb\x9cv\xd3\xa0\xae\xde|*\xb9\xbeu|\xd7K(\
-\xbb\xaa\x94s\x8d$^P\x02\xbfJ\xe3\x8d\x92\xd1u\
-\xbfF\xefy\x1a\xe8\x07\x98,\xe9Fp}V\xe0'\
-\x8bH\x10P\x18\x18\xfdB{R\x89\x9f\xa8U\x17\x13\
-sx\xe66\xd8o\x18\xe9\xb5\x04\xd5\xd6P\xd3\x96\x9f\
-\xa4\xe7r\x0a\x02\x9dz\xe1#1q\x97\xe5VI\xdd\
-?\xcc\x17\xb0\x83\xa5k\x0f\x85\xae\xbe?W\x86\x06K\
-\x17\xf3\xc1\xcc\x9av)\x06 t\x83\x96!\xa4\xf6\xdf\
-6:br\xeb\x01\xa6\x015\x01\x0a\x97\xac\xa9\x98\xc4\
-\x85\xf9\xa0\x81\xb49?\xd5\x0f\xdc\x05]\x96\x15\x1dW\
-\xecu\xec.j\x81H\xe5|\x91\xa6\x05\xe5\xf4\xcaW\
-\x97N\xf8\x9cA/m9@f\xc9\x84\xb5\xe1\xa4\xd3\
-\x9e\xe6-I\xd6;\xf7s(I\x0d_y\x04z\xaa\
-\xa7^b\xf2\xdaZ\x05\xd6\x84\xcf\x7f\xb1\xbc\xbe\x9b[\
-zd\x14\xf1t\x08z*\xd3b<\x95\xb2\x0c1\xe8\
-\xc3\xf6\xb2\x884\xe7+\x82\x95,65\x95\x1cR\x9f\
-E\xacr\x92kQgn\xe77\xcf\xaaR!\xce\x96\
-\xf9\xc4\xc1\xd4\x81\xc7\xd6NMI\x93\xd3/\x98\x9e\x16\
-\x04Ky\x99\xe6\x99\xaa#\xf1c3J\xf8p[/\
-\x066\xd1\x85\x14\x19%\x09\x8a\x1d\xa0\x0bJ\xd8\x95)\
-\xacx\x07\x8a\x94@`Hh(\xefhP\xfa\xc0\xf3\
-\x8c\x99\x04\x8a\xe6o\x8e\xd7,\xc1G\x93\xae\x19\x06~\
-\xfe[,/\xd1\xee\xad\xd6\xc8L\xd2\x0b\x8a\xbc[\xd9\
-K\xce\x95\x17ex\x8a\x96\xde\x1e77\x8b\x99\x89e\
->\xb3`Q\xb2\x87\x00\xf2i[K\x0fNa\xd92\
-d\xd4s\x86\xb0\xd9A\xd8\xa0\x92hFG{\xaf\x88\
-\x16\x86v\x065\x9d\xec8X\xfei6\xc5\xedG\x9a\
-a\x80\xf1l6\x19g\xdfj\xfb\xbc\xbfYS\xdc\xb4\
-\x5c\x84D\xf6q\x94l\xf3\xf2\x8bs7\x9b\xdf\x1aL\
-\x96&\x01-\xd0IW\xae\xc8 \x1be\x82\x93\x03\xb7\
-R\x8c\xff\x00\x1cd\xa5\xb2\x16\x13r\xea\x8d\xfe\xd1J\
-\xbe\xf3J[j\x8fO\x9f\xb1\xbe\xd4\x1c\xba\x9b\xc6S\
-\xa3\xb3d\x02n\x90\xe4\xd5\xa2\x11\xbd\x15*\xeac\xe1\
-x\xe9\xf8EE\x1cH\x99\x04\x11\xf9vG\xaf\xf2.\
-\xaa\x00\xd6\x5c\x86Y\x0f^\xbe|\xf7K\xb8\xbcm\xf6\
-\xc8\xa3\xfcSX\x8fC\xfe\x1e\xe2\xf7\x80\xbf\x07\xf0\xbd\
-R\x8d\xebi\xdf\xf3\xd0\xa7\x98]\x1c\xd1\x9bx\x9f\xb0\
-\xae\x82\xbfN&\xe3\x82Z\x06on\x837\xc3|\xf6\
-\x89&\xa9%\xe8\xb1\xee\xc6)\xbf#\x7f\x90\xcbg[\
-5\xce\xda\xa4\xe0\xa4\xf1\xd4:\xd3\xf8xbY\xa5E\
-\x13\x0c\xe0\xb2P\xc2\x89\x0d\xde\xd3+\xbf\xbb\xd0\xab\xfc\
-\x06\x8d\xe1\xd3\x0eui\x96\x8d\xcada\xbf\xc4|\xad\
-e\x18\xc0 ghZ\xd4w\x8b\x17\xdc\xf1\xca_O\
-\x955\x93\xae&S%\x80\x19\x97\x18\xb0\xc2\x80\xbeO\
-\xc8\xaa=\xce8He|9Y,&\xe3T\xde\x1e\
-\xe7\x1d\xa8\xbc#r\x97'\xd7M\xac\xf7\x83\xc7f\x93\
-\x8b\xe1G\x0a~\xc6e\xdd\xa6\xca\x22\x87\xed\xa9\xa2f\
-\x9c\x156\xbb@\xf0\x8b\xdePh\xf4\x86\xa8\x8b~\xfb\
-\xc8\xfdc\x9d\xf6\x83\xdf\xce\xed8>\x0f\x07\xe3s^\
-~\x99\x93\xbeJ\xffX\x90\xce\xf7y9\xb7\x96\xbaF\
-0\x95\xfe\xadYa\x91\x19\xccG\x5c`4\xdb\xfc*\
-\x1c$?6\xc7\x1f\xa1\xf0\xe6\xf8<\xf8\xedc\xf3\xb7\
-\x8fP\xbb\xe6o\xe7+t\x99K\x12\xbb\xec\x06\xf8;\
-\x8e\x14\x091%\xdf\xc7\xda\xf2\x9dA\xd1\x89\x93\xa7\xa5\
-\x10_\x8dx\x15\xbc:i\xd6\x02=Q\x9b\xd0\xf6\x9f\
-\x22\xa8K\x91}r\xa8\xa5\xd8\xc6}u\xb2\x0a\xde\x1c\
-]\x9d_\xbe?:>m.\x81\x10}\xc3\x7f\x90\x96\
-\x90\x97x\xb2r^\xdf\xaa\x1f\x04\xd9\xe8\x06F\xbbQ\
-\xdb\x185\x8e\x06\xf1\xcd\xd8D\xee\x08\x5c\xff\x8b\x89\xdb\
-\xb5P\xda\xf1{*>'m\x1f\xd3\x92\xe83\xbd\x9d\
-\xc9\xafi\xa5\x9e\x86I\xa57\xec\xf4T\xda\xb6\x9d\x96\
-nDe'\x95\xd3\xaeYe7\xa7X\x07`\xaf\xa0\
-\xee\x0e\xd0\xbe\xea\xd0f\xb5\xb6#\xdd\x08\x9f{\xdcy\
-\xcdj\x1d\xb8k2\xdc\xf4\xadY\x8f\xf6V\x01\x0d\x1a\
-=<o.\xdd\xb6x\xb6\x86yf@<[\xaf<\
-=2\x9e\xadL\xbe\xb2\x9c\xd4=\xdb\x0bPP\xb5\x87\
-R\x98K\xb1\x0a\xf1\x1eN\xf5sR\x149{\xf7\xf6\
-\xea\xe4\xf4\x0c\x8df\xb2\x81\x8e\xe6R\xc9\xb7\x9a\xd5\x9d\
-\x9dF\xf0\x8f\x9b\xee\xa0YG\xdf\xad\xf5fuo\x7f\
-o\xb7v\x80\x81F\xb3\xba\xfdl{\x7f\xbb\x81\x81m\
-\x04\x85@@O\xaf\x10\xee`\xf7\xd9n\x9d\x83\x08\xb9\
-\xb3s\xb0S\x0f\xe67SH\xdb\xa97\x0e\x9e50\
-\x80){*\x008\x1a\x07\xf8?\x08\xf4\x00\xac\xbe\x8b\
-\x1f\x00\xd2\xd8\xd9o\xd4\xf7\x11\xe4\xd7\xc1l2\x85<\
-\x07{\xf5\x1a\x81IDm7\xa0g5\xf5f\x03*\
-\xc5\xdf\x0d\xa8s\xf7.\x9e\xeb\xb64v\x83\xd9\xcd(\
-\xfa\x95\xba-\x81\xe3#\x8dP/\xfe\xfc\xebd\xfa\xab\
-\xa8Vc\xb1\xf4\xbfT<\xd4\xa2\xbe\x87\xffK\xc5c\
-\x9dSQ;\xd0\xc0\xddT\xdc.N\x01|\xc4\xa3+\
-S\xdb\xdf\x15v\x8d\x07\x0f\x9b\x80\xd7\x88\xda\xba\xb3D\
-\xd7\x1b\x81\x8e\xba\xe6\x97\xc3\xcfju\x137\x1fNf\
-\x8b\xeb\xeeh\x04\xbd\x82o\x9f\x7fM5\xb1\x0e\xcd\xc6\
-]\x16\xbd7\xe4xf\xa8+\xc7\xa4b@\x8ei\xcd\
-\x132\x8e\xdax\x92\x9bVg\x9e\xc0\x18\xa8D\xa7\x10\
-\xe4eF\x13\xf5\x17\xe1\xeen\xe3\xd9\x1eP\xc4\xe7\xbb\
-{\xdb\xf5g+t5\x88\x8f\xa7\xddZ\x18S\xb2\xc9\
-\xf3\xbd\xdd\xdd\xed\xdd\xc3<w\x13\x89\xdf,%\x95\x10\
-\x01\xf6\x82<\x00*\xab\x5cJ^\xbc\xa8\xd7|\xbf\x9c\
-\x0b\xb2\xb7\xdd\xa8\x95\x81\x05ilo&\xe4\xef\x1b\xb6\
-\x01y\xd0m\x1f=f\xda\xf9f\xa2L\xf1\xa5\x9b)\
-\xd1\xc6\xcd\x82\x8a\x00\xc2\x9ci8\xb9C\x85\xdaS\xec\
-\xf3\xe7P\xbfr\xe9!\xbc\x15\xaa\xac_\xe6\x06\x1b\xec\
-\xb0\xcbP\xb5\xb1Q\xaf\xe3\xb9\xa5# 6'\x02q\
-\xde\x12\x0f\x827A\xbf\xdb\x1fF\xa1\xa4T)\x14$\
-I\x98\xb0\xb5-\x08\xb5\x93\x8e\xb1\xb6\xc5a\x92\xa4\xbd\
-\xa0\x91\x10\x9b\xe0D\x1b\x8e\xae\x8e\xaa\xb0\xb9v\xa7\xef\
-G\xdd$\xaaK\xff\x88;\xba<\x88R\x12H\xc1\xb0\
-\x93\x86\xc9\xd7\xaa\x0ec@>\xc9\xc5\xee\xc5\xd1\xdb\x9f\
-N/\xd3\x98(2\xf8\xf9\xe8\xe2\xd5\xd1\xdb\xabT\xa2\
-\xc4rUC\x06%\xbb\xda\x93[\xecu\x15\xc3?\xc6\
-]`u\x08\xcb\x8e\xec\x8f\xc4\x83\xb0\x16\xbc\x09\x1d\x80\
-V<x\xfe\x06\xfe\xf0\xd5\xb1\xd7\x1dM\x87]<_\
-\x0828l\x92\xa7\x9b\xfb\xfb'\xaaC\x13s\xd6\x90\
-\xbb9\xd5\xd7m\x8f\xd9\x1c\xafl\xe5\xe6(\xea\xe0\xb7\
-P\xcd\x176\xe6T\xcd1\x8a*\xbb\xb4\x22f\xd8\xb9\
-\x9b\x9b\xe9\x18\x18\xb3\xc3$|[\xce\x89\x875\x13&\
-\x15\xb7\x98\xf2\xdb\xc0\x8a\x00\x06\x13\xa7g9t\xe3\x80\
-C\xd4-Q\xc6Lr\x9a\x02Y\xd5\x98\xca\x90\xb4\x1f\
-\x93M99X\xad\xdc\xb9\x97\x88\xc3X\xaa>\xcep\
-3\xa9\x83\x9a\x1fh(\x14\xd5\x08D\xce\xfc\x0f\xde\x8a\
-\xc5^X\x1eh\xfd\xf9\xc1)\xa4\x86S\xfa\xd7\x09b\
-\xe7B'\xa6\xe3\x02'B\xcd\xe6\xe2\xeep\xe1:\xbe\
-\xdfL\xcdv\xd4\xb1\x07\xbc\x9b\x9b\xd6\xe4\xba\xe0\xfa(\
-_\xca\x19`\xe3\x0b1!\x97\xcb\xed\x06\x0e\xc8\xdbp\
-W\x0f\x9e\xaeF\x82\x1e\x07\x03\x98\x0c\xe4\xe0Gy\xe2\
-\x09\x95'\x9e\xc4O9\x12G\x9b`\x8bf\x12\xc4\xc0\
-\x97\xf2\xeah&\xb2LV-E\x8d\xd2\x06P\x97\x89\
-V\xe9\x14\xaa\xaa\x88){}@\x1b\xb1\x1aB\x110\
-\x8bn\xb5\x08bs\x13\x07\x8e\x94n\xc4\xb8\x0d\x86\x03\
-Jc\xd3\xfe\x1b\x0eA\xc3\x11\xa2\xa1N\xc76\xd3\x11\
-!\x81\xb1Tj2\xf9r\x93\x9ebo-\x07m\xf3\
-\x05\xea\xef)\xa0\x82Y\xa6:M\xcd0Il\xa9\xdf\
-\xb4>\x93\xaa\x10\x99>\xc9\xd5f\xc2\x94\xd4h\xe3\xc7\
-e\xdb\xc9\xda\x8e;\x9dVf\x101I(\xb6\xd2<\
-d\xfd@\xea\xfd\xe3\x10\xbf\x85\xbe\x1f;\xe6\xe9\xe1\xc8\
-A=q\x0cc\x10\x1c\xb7w;Ub;\x0e\xdbK\
-\xc4\xdc\xf4\xf8-hp\xdb<\x86\x19F\xfa\x83M\xb2\
-\xb0\xdei*\x08z\x0chR\x82\xa4\x99\xac:-\xd2\
-4$\xbb\xfaR-4c\xff\x125NJ\x0c\xe5\xa3\
-\xf1|\xbddr\xd7\xa7n8\x14\x11'h\x0c\xea\x81\
-\xd5\xba\xb9\xf9\xb6\x5c~\xbe\xeb40\x8f\x9e\xbcUz\
-[,J\xbca\xaf\xa3\x04$EC\xfd:d\x02\xcd\
-\x9d\x01\xd8K\x8ac\xd9\x05\xc6\xe9\xd8x$\xc1\xbe\xb3\
-T\x0c\x8f\xab}\x8a\xacu\xb6B\xe4\xb1\x8fa\x11\xaa\
-\xaf\x86\xfe\xda\xd6_;\xea\xab*^\x11,~\x09=\
-c\x07\xc7X\x1d\xe9BW\x074H\xcc\x5c\x8b\xb0\xc7\
-C\xd3\xf9\xe4'\x80\xc3\xe4_\x92\xfe\xf0\x84$\xd0\x1c\
-#^^B\xf6O\xcd\xdc\x22@e\xd2+\x09\xc3\xd0\
-D :\xf2\x86\xaah:y\xdf@\xb0\xe7\x0a\x08\x89\
-\x0e\xf7\x18\xed\xd8\xcfun\xf4@\x95E\x80\x11\xa4\x91\
-I\xc7d\xab!\xee\xdcfW#\xc8U\xea\xa1\xcb\xe5\
-\x86\x1e\xa1\xe8/(6x\x1ekFE|\xca\x02\xb3\
-\xc0\xa2#\x9ah\xbd\xc9\x08\xb7L\xe0\x13B\xef\xa5\xa7\
-Im5^tGq_\xa5\xbc\x12\xd1\xae`NM\
-\xee\x0fo\xff\xf2\xf6\xdd\xc7\xb7m\xb4\xf8\xe5]x\xca\
-\xed\xb6\x82\x86i,V\xb9\x88\x94\x9a\x99)\xe9\xb8N\
-e\xe5I\x8c\x87K\x8e\x17\xa0\xc4\xac\x84\xbb\xcd\xe9\x1b\
-\x83eiy\xe3q'[p~\xf2Q\xd3j\xf8.\
-\xf5U?[\xaan-S\xdf\xb0]=\x08\xe0\x14\x04\
-\xa0\xd5\xdb\xa0&\xbf\xcbn\xd3R.)a\xe4\xb0\x82\
-\x7f\x07\xfeV\xc3\x0f\x86M\x8a\x09\x06\xf4;Xu\x02\
-\x83\x10\xd6@\x7f\xc5b\xaa\x81k\xbe\x5c\x0d-\x1f_\
-\x1e1\xba\x8c\x84ly{\x94+5\xbe,\x10T\xe3\
-\xc82A\x1c\xf3_\xbd2\x8b\xd4\xda,\xcc\xbc&+\
-Q\x1e\x8c\x8d&J\xaa+\xc8\xd3`\xcb\x06\x96\xb7\xc2\
-\x1d5!\x00Y^\xb2H\xe2\xda\xf6\xb3\xe3\xa2<\x92\
-\xaa\x1e\xba\xe1;\xb9\x13\xf4i\xa7\xde\xc2\x99\x18\x22B\
-\xa98d\xc0\xb2\x90\x18\x1bZ:c\xb9-[\xe5\xcc\
-e\x17\x05\xae\xeb'j\xf0\xb0\xde\xd8\xcd\x1d\x9e_\xe9\
-\x99d\x8f\x80[\x8e\xb8Joe\x10\xfd\x93g\x97\xc6\
-[e\x0f\x0b\xb2\x13d\x97\x94\x02tV\x16\xd7\xb2)\
-\xfeu\xd9\xe6\x98\xde\x85(\xc8k\x0fJ\xb5|8\x06\
-\xc6\x17\xfc\xdc\xbc\xbe\xa9g%\xea)\xe1\xb7\x12\xae\xcb\
-\xab\x7f[\xbf\x0f1\xea\x87]L\xba\x96V\xdd\xe6\x90\
-\xd6\xeft\xc8\x14\xfb|\xd1\xf8W\x97$\x0f\xc8\xf8\xe9\
-\x18\xb2\xf8\xd4>[\xf2\x9bR\xb7\xa0Z\xadI\x17q\
-}4\x0ew\x9f*\xd5\xa5\xe0\xbc\x1e2^G\xcc|\
-\xde\x10lN\xecG\x07T\xbf I5;\xf3\xb4\xa7\
-\xae\x9er\x15\x83\xa0\x0a\x1bl\x82\xe7\x0d\x7fiUO\
-\xbflj=\xe2qU\xd1\x85\xf6 \xfe\xea\xa9\xe7U\
-\x8eN?\xd7,7\x1e\xaa\xf3\x07\xfb\xe5\xc1\xd7Nt\
-M\x19\x96\xce\x1b\x15\xe0P\xfc-\x18\x89\xdb@\xc9\xef\
-\x97\xb0\xd2\xea\x10U\x19\xc0Z\x1b\x00\x9f\xf8\x11\x02+\
-z\xc9\x90\x15S\xd0L#\x8e\x1e\xef\x22\xac+^\xbc\
-k\x94s\x87g\xab\x07#/\x15t\xf158\xf3,\
-t:\xc8\xe3\x9d\xe3E\xc4\xa9x\xa9\xcbw\xd2Rz\
-\x1b\x93\xc84\xac\xb8\x22\xcfK)\xe1'\xeb\xd8c\xcd\
-XC\x22\x18\xfb+\x8f\x1f6\xe1U(\xd6N)\x0f\
-e\xde%\x1c:\x98\xab\xd7#8\xc1\x90\x8b\x10\xd6X\
-\xa5\x1b\xedfI-\xc2TJ\x95\xfd'\xb8\x9a.\x87\
-Y\xc5\x17O\xf4E\xac\xfeq\x15jR\xc9\xfaFJ\
-\x12\xa8V\xd1\xe0\xb0\xc6\xf7\x88\xddU\xa0*\xdc\x5c\xf6\
-\x1d.\xa1\xa0;\xcc1\x85\xba\x8e\x98O\xe2\xafCb\
-D\x85\xd7&c\xa2\xe4\xfb\x1av\x22\xee\xe4D\x0e\x04\
-\xa6\xaaa\xba\xb2\x87\x8c\x88]\xd3\xa6\xd2\xee\xef\x85\xe1\
-O\x0d\x87r\x5c\x97\xdb\xdd\xd2\xb7]\xd8\xf7\xe4\x8b\xf9\
-`\xb6\xc7\x83j\x08[8\x9d\x15\xd8\x0b\xbe&\x03\xf0\
-\x1a\x1e\xa89 eu\x15\x94\xa9\xbf\xdb\x1c\xfb\x94\xa5\
-\x1a\x0c\xd4\x86j\xcd\xbd\x86\xec\x1f\xa5\xb7\xd4\xb9\x9d\x13\
-\xa1(Jb*\x92:\xf8\xf1\xb9\x06O\xef\xdc9\x1c\
-\xaeu\xb2\x87x\x84\xdf\xdc<\xd6\xb6\x19\x89I\xc6H\
-\x98\x03\xf8\xa3j\xa5`\xd4\xb1\xcfN\x0b\xf8\x17(`\
-\x98\x03DeKE\xb2\xdd\x81 &\x88G;3J\
-e<\x0c\xf1L\x1c>\xc7\x13Q\x19\x8d4\xaa>^\
-\xf0U\xf50\xd4)2k\x07\xcf\xf1\xcc\xe4\xc0\xf6\x18\
-v\x10\xea\x14uo*\xf7\xa0e<R)\xe8Qh\
-E\xaa\x0b\xd3\xe7:nG\x03\xceB+R\x00o\xa1\
-\xd6pP{JKA\xb6\xf6\xfb{ \xc2\xf50\x1c\
-on\xd2\xf0\xcf\xbf\xa06\x86\xfe4}\xcch1.\
-\xcc\xa4\xf2)\x1b\xc6\x01\xcf\xda3\xe8b\xa5\xf3\x95;\
-\x89\xabk\xaeu5\x06\x9a\xc7~`\xcd\xb6\xfep\x16\
-\xaeY\x19\xb3\xd0\x19\xf8\xfb{{\xe2\xfa\xd0\x09\x95\x12\
-vE\x05{\x00%33\xa7\x1a\xa9\x1bi\x04\xaa\xcc\
-\x00)\xdd]\xa7\x81Su\x06@\x1fv\x87\xb9\xeb\x81\
-9\x8f\xdc\xc0i\x13\xeb\x83W\xdb\x9e\x17\xa6\x88pz\
-\xfaird\x11\xbf\xe0\xf7\xf5*\x97jf\x81\x84\xf5\
-Q\xf3\xa1Z\xeb\x8d \x9f\x88\xd6\x94DFWY\x13\
-\x0c\x1a\xcf\xaen]7\xe4\x88\xa0\xc4\x12\x05E\x9e\x14\
-\xbd\xe2p\x0e\xad\x92w\x1c\x85\xcd\xe7u\xce\xec6I\
-#\x9eo\xbbJ\xb1\xacAb\xcd3\x98\x05\xf8\x06U\
-\xe1Jm\xe8\x8c\x94\xf1\xd9\xcf\x12\xb3L\xa7\xcbi\x22\
-\xb7h3\x9a\xa9A\xb5Ym\xe01\xcd\xf8w4\xcd\
-v\xab-\x0a\x13iE\x0b\xd3-\x06\x05\xa9J\xa5\xe6\
-\x10\xf1\x1a\xaa\xeb\x95\x92\xb6l\x99\xe8[\x0aK\x82\xa9\
-;\xec&\x83Q\x94\xd3\x0d\xf6\xd1F\xf8\x1b\xe4\x13\xf3\
-\xf9\x05\x94\x0d\xad\xef\x1d\x8f\xa7\xa0\xb4\x834{\xa2\xf1\
-t\xf1\x8dF\xdb\xcf\x91\xe3f\xe5\xd0k\x85j\x1d-\
-\xbd\x80\x0dr}\x0e4\x93.\xdf\xd5\xb7\xef.\xde\x1c\
-\xbd\xd6\x87gK`L\xed\xb7d\xc6\xd6\xc5\xe1*\x10\
-y\xbc-q\x17\xcf(\x8e\x1c\xd9\xd7\xe2_\xe5\xbbY\
-\x89\x00\xdc\x93\xbf8'$\xfd\xe8B\x89\xb4\x5cR\x16\
-H\xa5s\x05\xcdk\x04\xd4\xfa\xa9\xa7\xc5\x83\x0a\xfba\
-\xf1\xbai]l\x8b\xdbe\x8a\x82\xe6\xac\x92\x92\xde\xe2\
-jj\xf9\x9e\xc8\xd6&\x09aM@\x86\xac\xb6\xa3\xa7\
-z\xfa\xc8\xd4v\xa0\x9e\xd7\x0e=\xad\xa7\x84\x16\xfcx\
-I`@\xaeWN\xc7\x17h )\x1a\x94\x9c\x8c\x8a\
-U\x1c\xbc\xe0\x88^Qy\xa9U\x96\x87sPf\x14\
-\x82\x13\xb8L:\xe5\xe4\xf9\x8f\xc6\x19\x8f\xa3\x12\x9c\x7f\
-$-\xb5\x80\xdf\xb4\xa3@\xa1\xaf\xed\x02\xd02\xa0\x82\
-h\x15\xfc\x16\xcd&\xc6\x04\x08\x93\xe9P\xf6q\xfd>\
-'{\x91\x1e\xacYoL\x89Dy\x8d\xed\xb70^\
-\xb4\xb0Mm8\xff\xb8\x11'@\x12\x92>.5b\
-\xe0`\xd9\x9c\x7f\x0c\xdbP\xf3\xf3\x8f\xb2\x1e\x86\xb7\xe1\
-\xf9G`MZ\x90\x00\x1f\xb5\x8ev\x96Ku\x09\x97\
-\xddQ\xdc\x9d7\xb1i\xab\x16EU)\xa6\xe5\xf7I\
-C\xc9\xc4\x04%\xce\xe1.\xc8\x93\xd3\xd7\xaf\xde\xbc\xba\
-:\xbd\xb8lc\x86\x8eO/\xdb\x09\xf3\xf9\xc7f[\
-\x8ca<f\xfdvV\xbeT\x00\xb9\xc5\xcd\xcd\xef2\
-K`\x1b5\xaa\xe03x\x85\xa7\xcc6\x04\xfc\x96{\
-\xf5\xc1\x00\xe7\x1fs\x84\xcd*\x89\x05\xc5/\xa0\xd7*\
-\xd5Z\xfd\xfe>\x06.\x0b]k>a\x00\xf1db\
-<\xc3\x9b\x5c\xc4\xefY\xdd\xa7b\xfd\xa0d&\x0e\xcf\
-@\x16o\xe2\xa8S\xf7\x05v\x06d\xb2\xedp\x03\xb8\
-\xa2:OG_\x0e\xcbau\xef)O\x0b\x9a\xab\x9a\
-\xcd#\x95h\x9a\x9a\xac\x12M\x9f3+z&o\xba\
-\x10\xbc\xe54A\xdaE\xa7\xc7\xb6Gf\x9f\x06z\x9d\
-\xa8\x9e\x1d\xc4\xb3\x0eW{x\x1b8\xf9\xac5\xd3\xe4\
-\xa5\x96B\xf1sj\xad\x9ds~{\xad=\xb4S\xb3\
-\xb1\xda\xaf\x22\xd2^\x8c\xa7\xe9\xf7\xa7\xca\xbc\xc1d\x1a\
-\xf4&\x8b`\x1c\x0f\xb0\x16\xc1\x02y\x1eb|\xc6\xf8\
-'\xc2?_\xc2z\xd0o-\xf2\x86\x05\x10K\xdb\x00\
-\xd1\xfd=\x7f\x22\x1e\x19\x04\xc4\x1f\x02\x90+\x9e\x80\xb0\
-\xf5\xee%\xe8\xad\xc7\x0c\xd5\xcb\xc3\x0c\xd1\x0fb\xc66\
-\x84Qj?\x16JD+?\x5c\x109-/,\x0a\
-8\xe4\x9fA\xa5ZWO\x94\x5c\xf1\xcdd\xeaK\xd5\
-\xc6hq\xa04^_\x7f\xecZUi\xf8~\xb0\xd2\
-\xc3r8\xe6z\x8cyo\xf9\x126L\x81\x09\xac\xfa\
-\xe7\xc3\xa7V\xb0t\x1eZa?8\x7f1\xf4\x97\xd1\
-\xfa:\xd9\x1dI\x9eD\xd7\xd7\x89\xa5z\xe7\xd4\x95P\
-\xaf\x88\xeb\x15\x0d\xc3\xe8\x1cz)H\xe4=j\x9c\xf0\
-\x13\xca~\x14\x8fJ\xa5\xf3\xca\xd0\xdf*}y\x1a\xa1\
-\x8e\xad\xb8\xe6q\xd5\xd8\x141C\xa3\xecd\x87l\x00\
-T\xff\xf0<L\x9eb\xae\xf2\xb0\x09%h4\xd0\xb2\
->W`\xc0\x15\xe8V\xa2\xf3\xadF@\xce\x5c\xad\x83\
-Ah\x22d\xd3C\xb6\xd1D\xa2\x08\x81\xa5j\x86\xd9\
-\x84*f\xf0\xa4\x19\xd2>\x90\xb8\xdd\xad/Y@G\
-\xb7\xb8\xa2\xc041%\xe1>\xe6A\x16\xe8\x98\x0dz\
-\x88\xa7\xcdO\x89W\xc6\xe4V\xa5\x92\xbc\xa8\xb5|\xfc\
-.\x93x\xbb\x95\xca\x80\xdeR\xae\x82\xccT$\x01\x94\
-=\x153\x10\x10\xed\xe7\xe6K\xbd\xb9\x96k\xfa>\xf5\
-7\x8c\xa9\xbf\xf5\x05\xd7\xee\xfa\x1e)[\xe6z\xf2\x81\
-\xef\xef\xbd\x1a\x1ay\xb0\xea\x98_EX\xcd\xc5\x9d\xea\
-\x14\x94\x03)\xa5\xb42\xa8\x01\x96\xe7\xeeW\x97\x06\x94\
-\x96\xb7\xe6\x1eb\xc1\x9bC\xc4?\xb2U\x8cY\xeb:\
-\x185\xf5\xd4&\xb8\x11\xc3\x8dD\x80\xc1p#8F\
-\xa7\xf0\xcd\x18n&\xf2\x0b\x86\x9b\xd1\x0d\x87(\x8f\xeb\
-w\x01\xc1\xc2\xc4\xf5$\xceX\xa0\xc3\x9a\xeb\x9dl\xf7\
-\xe9Wg'\xfb\x9a\xbb\x93Ql\xdeN\xf65o\xb3\
-9Om6\x1f\x7f\xeff3|p\xb3!\x83K3\
-\xd62\x97\xfd\x06\xfe5\x82\x11\xee2\xb3\xcc\xa6\xd3\x1a\
-\xad'b\x88N\xed\x0c\xb3h\xaa\x09\x1a\x19wz\x88\
-\xca\xce\xd6\xe3\xa6Z\xe6!\xa7\x84\x07\xb1?@~m\
-\x84\x8f \xbf\xd4\xa2u\xc2\x9c\x91\x9a\x85X\xb9ub\
-\x92\x19\xbf)\x98\xc9\xec\xce,\x18,H\xb6\xc6\xfc]\
-s\xc8R?=\xd9\xa9\xe4!\xf5&\xfc\xf0\xfe\x00\xb3\
-\x9cOC.\xd4\xc9\xfd\xfd\x88g\xf9L\x823\xd9G\
-$\xc8\xc4\x9d\x8b\xbf\x0dG\x5cUnZ\xd9\xa9\xf9\xc8\
-\x97\xbd\xf9w\xee\xc2\xa5Gl\xc3\xae\xb4i\xe4\xf6\xb7\
-Z\xf5\x80g]o\xf3\xa2\xaf(Zr+\x1b\xbb\xc4\
-\x8c\xca\xb0u\xc2\xde\xce\xb4a\xf8b\xa8\x1e\xaeH\x1f\
-\x8f\xa53\x99\x0b\xe0\xe4\x81J\x1ep\xf2\xc0w8\x83\
-\x8f\xcfo\x1d\xce\xe0cxks\x06C>u\x0d\xf9\
-\xd4\xf51\xf8\xf8\xe2\x96\xcfj\xd1G\xdeYg\x15\xa1\
-n\xd1m\x18},\xde\xda?Vnyk\xbf\xfd\xbe\
-\xad\xfd#o\xed\xb7\xe5\xdb&\x94\xa0\xd1$\xa2m\x16\
-\x96\xa0PH\xad\xd6a\x03\xddj\xb4\xd2;mj\xd6\
-s]+\xfd\xec\x96\x9c\x1a\x07\xbbm\xb7e\x07\x9e\x0d\
-w_\xb2\xb6\xb7\x85\x9b\xf3\xdcV\xa8\x85\x99\xe5\x97\xc2\
-oO\xd5\xdb\xbcU\x98\x9a>2\x89\x1f\xc1\x22\xfc\x8f\
-\xe0\x0e\x90\x04\x87\xdf\xc5\x22\xc0\xb8Ud\x8c\xbe\xafo\
-\xb0\xef\x1fd\x05\xb2\xdd\xf7:\xaf\xfb\x00W\xab\xc8\x9a\
-\x1a\xa1\x90\x99\xc9&\xdd\x99\xe3\x9b\x97\xda\xb4\x07\xe1\xce\
-#;P\x83\xcb\xeb\x04\xed\x91\xde{\xcc.\x84Eu\
-h\xdd\xf8j\xcf\x1d\xe6\xee\xb9\xc3\xa2=wH{\xae\
-S\x09w\xc3\x9d\x07\xea\xc8\xc5k\xf1JnV\x82\x97\
-\x22[jYB\xa7\x97a\xc5\x168e\xc5O\xad\xac\
-9\xb6\x8c\xdab\x22\xf6\xd6dF\xe0\xa7\xcb0;\xcc\
-\xd7\x15\xcaY\x10\xa4+\xb6\xdf2\xe0i\xbe\xf0e\xb9\
-0\x87a\xeer\x13\x04S\xcdW\xd2\xa7\xd4\xbb\x03:\
-\xfew\x17]\xb1\xa1\xc6\xdc\x09\xdf\xdc\xb3tXID\
-\xc9\xbe\xe2\xbc\xd9&o\x88\xa4G\xcb\xaa\xb9h\x9f\x8a\
-tK\x9b\xcb\xd5\x0aw\x10\xd6\xc0\xa4\xcbQv,\xa9\
-$./\xdf\xbd>I+\xd3\xf3\xf5\x9e\xe0,{\x95\
-\x97\x93\xd1\xc0\xb34\xaaY\xd53LC\x04\xaa\x16F\
-\xfc\xfbD\x89\x7f%\xc9\x12\xffJ\x0c{xn\xd7:\
-i\x01\x96\x9f\x92\xd20Tz\x8c\xf9\x06/\xefI\x85\
-d@E@\x16\xc7R\xdf\xad\x81\xf4\xe9\x1d3_\xbc\
-Q\xbf?\x0d%\x82\xc9\xb69\xbe\x1b!{V\xb6.\
-ZSa\xaexR-d\xb4\xf9\xa1\xcc}\xa4UO\
-\xb0\x80\xf7\xd1\xacOOXimI\x17\x91\x0au\xf6\
-\xf1\xa5\xc88K\x02c\xae\x86$B8s\x1d\x16l\
-\xdb\x06\x9br\xdas\x84.a\x5c|\xfafr(\xf9\
-\xb7;\xea\xaaT\xcb\x86\x870\x8f\x05\xe9n'\xe7=\
-\xaa\x83p7\x8dpW\x10.tXp\xedu\xf2\x9f\
-\xa8:\xe8\xf6\x14\xba\x81d\xdf\x13t=\x1dVb^\
-m\xf1\xc7\xac3e\xc8\x10\xfa]l\x1d\xa1l73\
-w\xf5\x9d\x08\x7f\x84\xfcS]L\xc4\xca\x1e^w\xe0\
-\x1d\xa0\xf3\x0c\xc9\xf3p\xd9I\x0e^r\x97\xaf\xfez\
-*\x12N%*\xac\xe7\x03\xbd|\xf5\x93\x82h\xe4C\
-\x5c\x02\x12\x85\xa5\xbaOh\xd8\x86\xb8zq\xd9\xe6<\
-\x1dG\xdb8\x93\xdab\xcb\xb6\xc0\xce\xa8V\xd9V\x13\
-\xdb\x95r\xe7\xb0t\xd8D\xcb\x89\xe5{\xb4\xa1\xc8\xdf\
-O\xfdC\xdf?,M\x17\xf7\xd1\xf8>\xba\xbb\x1f\xdf\
-\xdcO\xef\xee\xa7\xfd\xfb8\xb9\x1f\x8f\xef\xfb\xe3\xfb?\
-\xfb\x87[\xc0\xd1\x85\x8e\x9d[@\x0c\x0b\x1e\x0e\xb1u\
-8#\xdd$1\x9a\xb1\xc5\xb8\x86V2\xe5\xabD\x1c\
-\x0f\x1c{\x5c\x0eu1}\x85j\x12\xb4\xe9\xa8\x88\xb0\
-\xaeL5m1\x91\xf4\xa21\x0e\x02\xe2=\x1c7\xbd\
-\xe8\xce\x84\x9ef\x0cc5\xbd?\x9bd\xb41\xf5\x14\
-KkzS;\x17\xeb\xcfy\xd3\x85\x03\x0a\x11}\x1d\
-Q\xaf6\x9e\x8e\x9b\x8a\x5c\xb8V\xd4\x03/N\xb2\xd8\
-\xfa\xe3t\xdcV\xa3\xba\xbb\xd3\xf4\xc69\x09\xbbUL\
-\xb8\xb1\xcb?h\x8e\xa9\xae\xb0u\xe8Gt\xb9\x93\x9a\
-\xe73m\x1a\x08'\xdb\x16v\x82\xfb\x02o\xab\xa4\xb5\
-\x07\xf4\x1b\x03{\xba\xa1\xe5\xcd\xab\xf3W\xc7\x7fy{\
-zyY}sz\xf2\xea\xc3\x9bC~6\xba\x06\x0e\
-\xbe\xde\x1eV\xf7\xf6\x9f>\x06\xf2\xf8/\xd0\x91\x1a6\
-e\x9fK\xdaCi\xd2\xaaU`\x1b\x0c\x1f\xebk]\
-\xe2\xdc\xbb\xbd9D=\xaf\xd6j\xf5C\xaf\xe65Q\
-d{\x86NyJ\xdb\xbee\xd9\xb3zX\x13;\x17\
-e\x8f|\x18\xe9k\xa2<\xcc\xe3\x90\x8f\x05\xe4\xbe\xa3\
-4\xd6J\x7f~\xb9Z\xdb\xf5\xb7\xb4\x0e\xa0]\x83\xbd\
-\xa8\xb2\x035\x00\xe4\x8f\xae\xc3M\x92\xdf0{\x19A\
-\xeb\xdf[\xf6\x1c\xa0LS\xcb\xa7\xca~Z\xf0fs\
-s\xfc\xfc\x0d\x1e\x17\xc37\xbeS\xadj\xba[\xeaN\
-\x95j\xaaB\xe4\x16G6\xa2\x9c:\x91\xb9\x84\xb1_\
-\x80\xc5j\x18\x1aQ\xb8R\x9e\x84\xd2\x97\xd2\x18\x1fL\
-\x803\x8d\x13\xdb\xb0\xb7\xb96g\xc5\xe5\xaavE$\
-f\xbc?\x92\xc3\x93\xabT\xec\x9b\xc9o\xa9\xa8\xb6W\
-\x19\xcf-GF\x9d\xd0.Ro0\x1a\xe0\x1d\xc5\xe7\
-\x17\xe2\xa4\xd9E\xd9\x09\xa9\x02+\x5c\x10\x94+\x8d\x04\
-\x16\x19\x99\x9b\xd3d1\xfbf:\xa3\x1b\xc4z\x10\xbb\
-mKsX\x1fJ\xe3\xa0\xab\x1f\x0b\xfa>?3\x83\
-#=;@h\xb2\x166\xf2\x0f\xe2\xe5\x89\xbd\x06K\
-\xe0#+ts\x80r\xc8\xf7\xcf\xf2\x0e\x8eC^g\
-\xa5\xd4K\xc9\xd0G\xca\xf9\xed\xe5M\x8fm\x83-\xd1\
-\x81\x82\xa9\xfb \xba\xb6\x1e\x13\x0d6b\xbc=\xba\xf6\
-\xd1\xde\xf4\xb0;\x7fw\x9b\xbc\x9fM\xa6\xc0a|+\
-\xc1\xa1G\xb4\x89H\xb5\x1b \xf0\x17y`\xbcu\xb6\
--\x0aT\xea\xd1^(f\xd1\x86J\x03\x09\xf9\x8c\xc0\
-N\x19\xa8\x14\xba\x8f\xb6\x12F*a\x94\xce2S)\
-\xb3t\xcaB\xa5,\xd2)=\x95\xd2\xc3\x14\xfaR\x1c\
-\xf3\xe0\x05pA\xb6I\xb2\x132\xd5D\x94\xde\xb2\xd1\
-D\x94\x98\xd2o\x9f\x86\x96a\xa2\xa1\x13\x1a8\xa1\x91\
-\x13\x9a9\xa1\x85\x13\xea9\xa1\xd7\xaa\xb6\xaf%Z\xaa\
-|\xa1\xe2/\xdc\xf8\x13\x15\x7f\xa2\xe2a<\xd8\xe1\xba\
-\xa5\x22\x8eG\xb7\xbb\xe0\x9b\xbf\xc4\xaf\xea/\xe1]@\
-\x1f\xff\x16~cM\x0b\xda\x91\xfb\xe6l\xd8\xba+\xf3\
-\x9e\xc8q/\xd2\x9d\xef&\xfb\x81\x13\x1e=O\x8f\xa2\
-\x9bl\xc0\xa9b\xc0\xeb\xf2\xefkT\x8e\x94\xef\x0b\xfc\
-\xf6\xb9\xdc[\x85\xe86|lF?\xf8f\x179|\
-\x91\x9e\x8an\xb2\xcf\xdd\x81}\xc9,\x0c\xf7\xe8\xfd\xbd\
-\x05tR\xf9\xc6XN|\xb4\xe6d\xe29v\xc0:\
-\xba'\xa1\x9b\xa5\xc9\xf8\x14z5d\xce\x9c\x0b\xac,\
-\x03U\x8a\xb58\xdc\xe4T\xd3\x16/\xd2\xd3\xdfM\xf6\
-m\xec=\x85\xddZ\x13n2\x128\x12P\xb8\x93G\
-\x19\xb8JM\x93@\x0eT\xb7\xff\xe2\xf9\xc2\x85\x94\xc3\
-\xc7\x0d~\xb0v\xe4\xbf{\xdc\xbf{\xd4\xbf{\xcc\xd7\
-\x8e\xb8\xd3\x9c\xech\x17\x8f\xf5\xda\x91F\x8d\xc3)\x9c\
-\xb0\x224\xb9\x95\x1ek\xe9)\xee#!n\x1c\x1a\xc8\
-Pp\xe8V\x88\x9bL\x09!|\x1c\x1a\x09\xa9\xe3\x90\
-\xe8>\xf58\xd4\xe3n\x9f*\xc3R\xccw\x8b)X\
-\x93\xa2FG\xf5\xb1\xf4n\x8a^\xb3\xc8\xcaf\xa8\xee\
-\x82_\x90\xa9\xa2\x8d\xea\xaeS\x16\xce\xd9p\xa4\xe3\xa0\
-n\x99\x9bSO*\xdf\x1cJ\x06\xea\xb7\xf6/\x1d\xb5\
-\xd7\xfd\xc2\xbaM\x90\xc2O\xab!\x8283\x95\xf8\x06\
-UN\x97x\xef\x90cT\xc7\xbe\xcbC\x07y\x03\xf4\
-\x98\x86Zl\xf0\x0f\x1d\xd2\xa1\x1f\xb5^SL\xf56\
-\xeb\xea\xd1O}\x05\x03D\x0ay\x06'\x8b\xde,\xc5\
-$8S\xf5ro?\xd4\x11]\xe93\xdbj\xc8\xa2\
-\x10\xdd\x0bq\x8b\x14YCX\x93kB\xf2\xcb&\xfd\
-\xdb3\x03!'pb\x90\xd8\xbcp\xb3\xdd\x16o\xe0\
-W\x93)=\xf3\x00&\x04\xff-\xc8\xdd\x13'\x91\x84\
-U%\xde\xc2\xbf\x99\x95\xc8\xd2\x00\x95:@GyV\
-*JF\xec\x9c#/\xa8a\xaa\xa5qf\x97'\xd1\
-\x17\xc2'\x99\xb2\x1c\xc9\x9fS\x8e%\x82\xb1\xcb@\x1e\
-\xcav<w\x11}\x8e\xe7\x8bh\xa6\xbc\x92\x9cO&\
-_Jp\xd6\x1b\xd1\x03\xc0\x0b\xf4\x99\xe4Y.\xa1\xfc\
-e\x09NH\xc6i\x99\xb1\xb4\x07Y\xfc\xea\xb8\xd7\x9d\
-G\xc6\x7f\x9dmW,\xc5YO\xa6\xf8=w\x8d3\
-\x89MMz\x0aD\xe2n\x07t\xc5\xcc\xdf\x18\x12\xe3\
-\x91\xb3\xfd\xfbK<\xb6q\xe1\x04\x83\xde\x19H\x8f\x1f\
-\xad\xdey:\x87\xa7pXe\x14\xd5K>`\x0e\xca\
-\x17\xbfN\xd6\xaa\xc1l,\x94\x84\xa3\xba\xaa\xb6\x01\xdb\
-\xac\xe6\xa9\x9d\xca\x12:\xcb\x1b\x90\x18\x5c\x9b_M\xbe\
-D\x89\xd0T\x82\xfc\x1c)68\x0f\x01.&q'\
-\xa4X\xdc\xb1\xb9\xee\x93\x9a#\x83NB\xbeY\x94\xc0\
-\x06\x22\x04\x8f\xacI\xb2D\xc8\xf1\xfd`\xca \xc5L\
-e{+\x88u\xdf\xa8c\xb8B\x9fL\xd0\xc2\x98<\
-\xbb\x15\xbb\xd7\xa2\xa7\x99\xa90\xea\x12f\xfa\x8a\xd3\xc8\
-LY~\x129\xa1\xb6\xac\xec\xcb0\xaa\x0a\xa6\xc6\xd0\
-\xd4\xd4rs\xa2\x1b\xdd\x8e;A_{[\x09U#\
-\x8c\x8e1\xc9\xaa )\xa3\xb2\x884\x11\xb3\xe0\x1f\xc0\
-r\x7f\xaf\xee\xd3\x8d\xb3\x14LRF\xce\xf2/\xea\xc9\
-\xc5\x8b\xcf5\x10w)\x19\xf3{\x81S\xa9w\xd2\x98\
-\x80\x91\xa3l\x96\xf3q\x01\xb3uv\x99\xf3\x95PU\
-r\xb0>\x19\xedq\x07O\xdcQN\xeb\x94\xb25F\
-\xdc\xb9\xecJ\xf1U\x093Z\xbc\xe7\x06u}*2\
-\x13\xef\x90\xb9\x1az\xfa\xdd\xe3\xafPbdo\xe47\
-\x22\xd6\x83\x10\x1d\xeb\xfb\xcd\x92M\xc9\xe3\xbeC\xd8\x09\
-$\xb5\x0d[\x14\xdf\xd9\x86\xf9\xdd\xbd\x9e\xce\xb0\x90\xc4\
-\xba,\xaaF>0\x940\x09\x94\x0a\xac1\x99\xd9\xb7\
-\xe6\xa8\x9eW\xe9I\xaa\xbd/uQ|f\xd9\xc5s\
-|\xf1\xf8\x05\xe69\x1dKz\xb6\x8a\x82]\xf4d\x16\
-eKvIn\x9c\x5c\xc3F\x86\x16t\xcc\x02\xa9u\
-\x0e\xed@\xd5A\x961\x97\xdd\xb4\xc8\xa1\xaay\xc9\x98\
-\x9d<\x86|\xe4\xab\xa3\xe4+\xea+\xea\x97\x94\xddR\
-\xb1\x8c\x83\xf3\xe0\xc42\xb9k\xafXR2\x80\xcf\xfc\
-\xe97\xc00\xcd+\x9e}\x08L\x93\x80\x0b\xba\xbf\x17\
-\xbfUV\x1c\xb0\xab\x1a\xbe\xdfM\xe4\xce\xbc\xe4\xfd,\
-w\x0d\x1eU\x86\x8b\xbb\xe5\x9c\xb7\xadT9\x82\xea\xe7\
-\x12\x82\x9ak\x0d\xbe\xb0V\x1aL\xfc\xd0d\x96~,\
-\xe5S\xa5\x81}\xd7f2\x85\xa5\x19\x08\xe3>`\xce\
-Y\x1b\xc3\x14Vg <\xf3\xc02\xb2\xb90\x8f\xc1\
-\x06\xc2'\x0f,S\x9a=\xf3\xfek \xbc\xf1*g\
-$\xce\xed\x91\xf8\x18\x18\xc7r\xff\xf3\x06\xe3|2\x8b\
-\x7fC\xffF0\x1c\x1f\x1f7\x18\xe7\xa5\xc2\xe9\x18\xfb\
-\x80\xe4\xff\x93\xc3\x94w\x92\xe9\x99\x93\x0cS'\x03\xc4\
-i\xc1\x9a\xf5]\x90E\xd1\x0d=\x04\x96\x14-\x9eE\
-\xf4e\x16\xa9\xf4x\xf8\xc4\xdc\xee\xc4\xf3\xd3q/\x1a\
-\x8db|\xf5S\x92\x11C\xca\x11jZP\xf2[\x18\
-\xb1\xb9\x89\x7f\xc5\xb5\x00\xc99\x19\x19\xc6f&\x82[\
-\xb8~Jb5^eW\x9a\xdd\xf2\xebNs\x8b\xd6\
-\x0c\x83A\x0e\xebi\xf5\x87U\xdf\xd4b\xc7\xac6\x87\
-\xe2\x96\x91\xd6\xe2\xbb}L1\xf6R\x84\x22\xcfU\xd6\
-\xe2b\x08\xec\x81\xa2\xb2\x95w\x16\x87M\xcf\xfd\xe0V\
-\x0f\xbefi\xd3\xdb\x86\xc9\xabla\x88K\xacU\x11\
-\xdf\xcb\xa75\x91%\xce\xa2\xeb\xf5\x9c\x11l\x84\xc1\x12\
-\xc1\x9a:\x83\xe3\xd0j\xe5\xa7\x1dD\xbc:qj\xc2\
-Q\x82\x9d\xac\xc0\x96|m\x86F&(Z\x8d!3\
-\x9f\xd8\xc2\x8aWN\xe7\xf6\xcb\x9c][\x94me\x86\
-\x8fY\xd2\xa3\xc5b\x16\xf7n\x16\xd1|\xddS4)\
-\x80\x1c\x09\xa2?\xafx\xb0\xd2\xdb\xa0e\x0e\xbb\xc8Z\
-\xadU\xb1\xc3\x22\x03\xbc\xbf\xb7a~\x93\xbd\xee\xb1\xcd\
-\xf2\xb5\x97\xcf\xa9\xd3~\xe6\xee\x8b.\xa8\xed\xd5(r\
-\xda\xdc\xeeJO+E;Hx\xaf-\x04\xac}\xc7\
-o\xe0\xd3O\xf8M\x8a\xd2:\x82r1e\xae\xd55\
-\xfa\x93\xe9\xb7\xd0M\x0b\xe6_\xe2)]\xfd%\x13L\
-6\x95\x0d\xe2\xcf\x09\x92/\xcb\x01;\xc7\x00p\xd7@\
-\xc9yr\x1ezc\xb64\xa3\xa5\xf60\xf0\x87t8\
-%S\xed\xb3\xc9bBN6U\x86\xa6\xedfi.\
-f\x1a\xb0\x0a\xf9f\x1a\x06\x94\x86[p\xedI\xc8\x15\
-\xc1+\x0a\xa4\x9f\xd0\x026Sc\xa2y\xab}\x12*\
-\xf4\x1c\xf7u\x12\x0f6\xd0\x09\x14v\x1d]p\x00\x1c\
-\x1d\x1d\xa2\x85nx)\x1e\x98\xfe\xe3[\x10K\xc7\xcb\
-\x19\xd9K\xf76\xc1\xf2\x81\xcb\xd7\xe0\x01\x1bt\x96\xcb\
-g\xfa\x0e\xa6\x9c\xc6\xa1C\xfe\xb1\xe7N\xb3\x1e|\xed\
-\x8en\x22c\xf3\xeeg\x0a\x96\xc4v\xfd(\xfa\x1a\x8d\
-\xe4Z\x88\xec\xa4\xe32G\x00\xea\xe7\xb9\xd6S!\x8f\
-|*\xca#A\x98\xb8\xca\x96\x936\xbb\xc3\x92\xbc\x16\
-n\xd2\x03JG\xbeh\xe4F\xe3\xab\x10\xcb\x85\xd5t\
-r[2\x85\x8b\x89Z(\x9e\xa4\x10\xd3Q\x1c\xcd\xc8\
-\xf2U\x1aK*\x0e\x8e\xec\xd4\x8c\xf4\x8aKc\x168\
-@Y=\x08\x94\xee\xc1\xf3<TJk(\xccKT\
-\xa4\x95o\xed\xd8M\xf1\x5cx\x06'N\x1f\x0e\xc9\xdc\
-\x22!R\x83`:G\xc5\x84k\xf2\xeb\xf6\x9a\xecO\
-D\x83\x95\x87\xcb\xa0\xd3c\x9a\xca\xc1\xbe\x89R@F\
-9*\xddu)\xc0\xa0\x0e\xfd%\xaf\x12\xec\xf7\xbb\x94\
-M\x99!T\xca\xff\xeaqp\xea\xf5\xad\x13L\x99\xba\
-JW\xc4vP\x86\x1a\x1d[6\xad\xccPO\xb92\
-\x9bZ~\xd5\xec\xe3\xbe84\xe3ds}\xce\xe1J\
-\x9d\xd5\x0b\xa0\x06S\xad\x94\xc2\x16\xd6\xb1\xc3\xa6\xeb\x04\
-\x06\x5c\x88\xd2\xef\x9a\xfe?\xec\xbdY[#I\xb2(\
-\xf8W \xba\x9aV \x97\x90\xc8\xcaZ\xa4\x8adH\
- \x0b\xba\xc9e\x80*\xaa\x86T\xd7\x08)\x00ej\
-KI$d\x81\xbeo\x9e\xe6\xbb\x8f3w^\xe7>\
-\xce\x1f;\xbfdl\xf3-\xc2C\x88\xac\xaa^\xce=\
-}N%\x0aw\xf3\xcd\xdc\xdc\xdc\xdc\xdc\xdcL\x1bx\
-\xb1o&\x95\xd5]\x15\xf1ry\xcd\xbe\xe0\xc2\xbc3\
-\x9d\x9e\x90\xc5\xbd\x01\x0f\x10 \x88\x16\x19;J\xc1\x81\
-s\xb7\x5c\xc4(\xf3\x90\xc86y\xa2\x98e\xe6\xdb\xa3\
-k_\x03\xa2\xcc/T\x84\x18a\xdc*\xabBL\x8f\
-n\xa6\x9d\xd3Pn\xf8\xdagtF\x15b\xeeF\x5c\
-\x01]\xe2\x85\x92\x96b\x8b\xc3S\x8c\xdd\xe8|\x9e0\
-/\xaal\x82\x1a\x14Bq\x8er=\x15H\x04\xd8\x86\
-S\xbf46\xc8\xb82\xe0\x00\x19qq\xe9\x1b'\x00\
-\x83d\xd7\xc6\xb7\xe2\x9c,l\x97,u\xea\xa0`D\
-8\xa19g\x1b_\xab\xa1\x0f\xce;\x1dU\xc3\xf08\
-\xfb\x98\x8dO\xe6qZ\x05-@\x08\x04\xc9\xb7,%\
-?O\x1b\x8cj\xfbFm\x99\x18\xfb\xb4@\xda\xc9\xa0\
-\xb4\x8c\xbc\xa6\x83\xb9[\xceZ\xa3\x84\xc4\xcfoH\xc0\
-)\xf8\xe9/L\x07\x98~\x1a3\xff\xd9\x15F\x90\xbb\
-$\x83\x1f\xb7v\x9b\xba\xe3\xb7c3\xb81\xfb\xed\xb7\
-\x18\xac\xc0&\xfab\xdd\xb1\xef\x89\xc4p\x01f\xe5\xd7\
-S\x94\x93\xc4\x85\xbb\xb0\x03, \xb2Qz+\xf6\xfe\
-p&d\xd7D\x98\xa9W\x02O\xe3\xa1\xb3\x98,+\
-'\xc0Pp\xb3H\xa4\x5c\x1b\x1f\xe0\x8c`\xb3S\xf6\
-\x80\x03\x0a~j\xe5h\xb9\xf4\xe6DUx=\x0c\xe8\
-\xf9\x03\xc7\xa1E\x16\xb9\x0e\xb4F\xaeU\xfa\xbb'\x03\
-\xde\xaa\x82b\x11N\xf0G\xcfZ\xe6\xc2\xb5\xb0\xb9q\
--lXB\x95U\xac\xe5\xa6\xab\xf6\xf4Gw\x174\
-\x92\x93\xa9u\xb5\x16\x96\x11J\xbch\x02{}\x5c\xb5\
-\xa6>\x8ep@\xdf\x89\xddw\x18@s\x15k\x10d\
-\x8bp\xf7\x93,\x80[\xe4\x987d#\x9eQ\x972\
-\xd9\xb1\x919\xech\xc9{\x87\x91*.\xc2}\xcdA\
-x\xc2\xcbM\xb8\xb79\x08_\xe2\x09\xf57\x9bo;\
-\xac\xdb\xf0>\xad-l\xb7\xfc\x05E\x85\xf2{@V\
-y\x07\xc3\x99\x9f\x1c?\xfb\xaaV\xdb\x8a\xd0\x17k\xd4\
-\x88\xe0\xac0h\xf7#_\x0er$%-\x08\xe9\x9d\
-]\xbe_@1\xc7V>\xaa\x9c\xa4?U4\xa9\xd8\
-\x81\x0a:Wsh\xd7\xb1\x10\xc2\xc3s\x1a\xd6c\xc4\
-\xee\x06\x86\xc8\xc3\x88\xd5\xaa\x8b\xc7E\xf5\xb0\xabY\xb7\
-&F}\xc4\x19\xd8w8\x1f\x95r\x92\xa0y\xc9\x10\
-|\xc2\xa0\xbc\xc8M\xb2\xf4\x1a\x1e\x16\x94\xe7\xbc\xb4\xe1\
-\x0d\x03\x8e\xee2\x0f\xcauW\xdap{ha\xe6s\
-`\x974\xee\xc4H\xbf\x5c\xcf\x96\xe9,\x836\xb2\x0f\
-)\x14\x8f2\x97~p\xb2}x\xb0\xa3.&\xed\xf7\
-0-\xb9\xec\x17G\xdb\x7f;\xf9\xe1H\xe2m\xe4\xb2\
-\x8fw\x8e\x0e\xde\x9c\xa8h\xda\x1eN+\xd3t\xd2\xbb\
-\x88\xf20\xdb\xaf\x8e\x8f\xf7\x8e\x0e^\xb8`\x15A\xba\
-\x07m m\xc7\xe6\xc6\xeb\x8e\xf1\x1fk(7\x8b\x03\
-\x87*\xef\x10I^\xdd\x5cF\x11\xf6\x82\x8d\x0b\x22\x18\
-@\xd0\xe1Ch\x5c0\x88\x84R\xf3\x07 \xe8`\x80\
-\x02\x9c\x84\xf1Q\xd8/\x03^\x88\x90Xi\x12\xb6\x18\
-!\xc2YH\x142\xde\x1c\xa2\x1c\xa2\x88\x1e\x1c\x82\x87\
-\xb4\x07\xa1\x1f;\xad\x96S\xca0\x024\xcc\x8f\x16\x16\
-\xcc+\x11\xff\xd2\x94\xb7\xdc\x9cxd\x1d\x9c\x91<\x17\
-\xc9\xf8)\xcc:\x95\xba\xbf/\x00\x08\xf8\xa0\x11Q\x01\
-\x15\xf7/F\xc1\xa00V\xfc\x1f\xb6\x5c\xfd\xffP\x0e\
-\x03[\xf9\xa4FN{\xab-&&\xed\x9b\xfc\x99G\
-\x9e\xcb\xb9\xc6:\x8e0\xc3\xaf\x92\x8c\x01\x8fy\x85\x9e\
-\xf3\x194B1p\xf6\x89\x22\x0c\x89\x03\xa6\x0a\xbe\x0f\
-\x8c\x1a\xceCP\xb9\xb8\xe1\xbfb\x0597\x9eu\xbd\
-\xfa\xe4\x0d\x85\x1f\xc1\xed*V\xec\x9b\xc8O\x86\xe3L\
-d\xa5\xdb\x0a\x09\xd9\xb0/N\xd2.0\xda\x96Z\xb6\
-\xf6nq\xed\x05\x032\xf9\xfayS\xa5\x8d\xef\x9br\
- \xddp\x07/'i:\xc4.\xb6\xc4\xdf\x82\x13\xee\
-q+\x1bH\xad7\x04Z\x9e=O/\xf0N\x00m\
-e\xb3%\xe2F\xb6\x88\xef\xbe\xe1\xd6*\xadg{\xbe\
-\xd9\x16\x1a\xfep\xa8e\xf8\xb5\xb6\x06\xff\xb8\xe7\xda\xef\
-Pg\x16\x0d&\xa3\x1b\x5c\xd2\x98)\xb7\xe6 \x01\xb7\
-\xd1f\xc9I\x8d\x9b1\xfcLt\x0d\xe8\x00J\xc4\x84\
-UHC#4\xcf\xb8\xc7\x15\x8du\xbc\xde\xe9lr\
-\x8d1\x9e\x0al\x90\x8a\xcc\x84\xda\xbd\xbe8\xea&\x8f\
-\xfa\xa2\xd0\x97\x5c\xf6\xda\xe4h\xf2\xd9OSs\xb1\xd3\
-'\xac\xc8\xa8\xfa\xdd\x86\xfcnc\xa4\xe9\xbd\xc9\x04\xd0\
-\xe7:_\xef\xb4\x87\x7f\x99\xad\xe8R+\x7f\xf1\x1a\xff\
-K\x94\xad\x96}\xd0f\xdb\xeay\xfa\x19\xf4\xe9\x88'\
-\xb3\x02\x14\x90\xdf\xdd\x8c=<G\x09X\xb2\x8f8^\
-\xec(\x16\xa2>6\x17\xb4t\x86P\xadd\xb5\xf6\x10\
-\xce\xb9\xb6\xc7\xa2{\x99\xfb\xbe\xa2\xab=1\xebtM\
-r\xfc\xab\x14\x13\xc1\x14\x19\x02\xdf\x92\xe2\xdd\xd4?\xf4\
-F0o1T\xd8\x17\xb4\xf7C\xed#\xc6\x80y\x9c\
-e\x9es\x88%\xc59\xdf\xdbK6\xacj\xc7.\xae\
-i\xde\xfeJ\xf7\xf4\xcb\xc3\xa66\xaa\x11\x0f\xc4\xe4\xc1\
->\xf1\x12\xd9\xa9\xbd\x97\xc4\x01k\xf2f`\x99\xf3\xb3\
-.c\x1c1:W\x0c\xde\xb6\x1bk,@\x06\xec3\
-\x8fC\xc3o\x1f\xb6\xc4\xe6\xf9'\x8f\x9dn\xa0\x96\x18\
-\xb9\xb8\x99)6\xc8\xf4\x94\xd5\xac\xf1\xcbn\x1ey\x0d\
-`\x18\x22\xa8\x11tk\x17\x05}\xbb?\xb3h&\xd5\
-\x84\xa4\x00\x9b\x01\x9e&\x1fp\xd0\xa4f.\xdd\x8b\xac\
-\x08\xd1P\xe9\xb7\xcfS8\xe5\x8a\xab\x83i\x11\x80\x92\
-\x9a\xbc!\x8a\x95X\xc1\x08z\xc3S\xabkuu\xac\
-Z\x96\xcb\x8e(\x87\x0a{{I\xb2\x06z\xea\xa8P\
-\x0d+\xc0\xff\x8a`U\xce\xe1l\xae\xc7\xfc\xaa\xdc(\
-\xe3z\xd3\x97\xda\x0evm-:\xc7@8\xe6\x9a\x92\
-P*1Z\xa3x\xa1\xa6\xa97\xec\xa6h\x91\x03\xa2\
-\x0a\xa9\xc7\x22%I\xd3\xab\xde\xc5\xccOb\x81\xc6\x03\
-\xb07u\xd9\x8aV\xf9\xf1\xe5\xc1\xab\xdd\xbdWx<\
-\xf8\xfe\x95\xfb\xdb\x9e\xd7\x9drIAUF\x01\xe1\xc2\
-\xe6\xab\xdf\xfe\xe1\xe4u\xb8\xde\x9d\xd7\xaf^\x1c|\xaf\
-\xa3\xd6\xd2\xbb\xf3L\x9dv\xb4^\xbf\x8f\xf7\x0f^\x9c\
-\xb8\xbf\xb3\xf5S\xb9\xa4\xa0*\x90\xf4p\x03t\x0e?\
-\x0eD\xb8&t\xb8\xc5O\x9c\xe83\xa4,\xcd\x97\x92\
-Wt\x1ck\x9eV\x10T\x03\xe3\xf0\x87}@\x05\xe4\
-B\x85~\x07\xab\x0f\x15\xca4@\x8d\x96\x93\xa5&\xe5\
-\xe8\xe0\xfb\xfd\x93\xad\x0a\x035\xf8\xcf\xdc\x5c$M\xb3\
-\xa1\x83s+\xb2\x19^\xa7\xb8\xaa\xd9\x7f\x00\xd7\xe3$\
-\xe4\xbb\xa54\xc2\xe9\xaf\xbe\xc0K\x07\x1b~\xb8q\x94\
-H\x0eH\xb2f\x15\xe8T\xdd\xa1\x90\xdf\xb8\xb3\xdeR\
-\xac0OU\x81\x80B^N4\xc8\x91\x7f\x92\xa8h\
- v\xb2\xbf\xa8\x22\xb5\xb0\x02<\x8df\x07\xd5\x8a\xfd\
-;|\xbd-\xf4~\x9fM\xa1\x19\xb2\x05\xb4L\x9b\x8e\
-\x04\xefF\xbda\x09\xa3\xfdx\xcf\xe9\x8d\xbd\xae\xe6\x98\
-\x1cl\x95c\xac\x92\xeb/\xcf\xaa7\x1b\xba;_\xc6\
-S\xd6\xdb\x98\x80\x07;\x8e\x99\xb1\x17\xd4[ynp\
-\x99\xb5\x02\xa3\x0d9\xee\x0d\xc5\x06\xefu\xc4i\xb8\xc1\
-\xe9\xd0\xe2\x94@ig\x7f\xd9\x1b^O\xb3!d\xb5\
-(\x88n~\xcc\xfb\xe4\xbfW6T\xf4\x1f\xff\xed\xbf\
-\xa3\xa0\xff\x1b\xe6D\xdd\xb9\xf6\xe3\x8d;\xea\x85c\xae\
-k{5\x9f\xff\xd7\xfc\xb9\xf37\xfa\xac5\xb1\xe05\
-H\xc1{\x8fG\xbd\xf0P\xb9\x9b\xa6\xac\xae\xa5`\xcb\
-\x16\xd6<\x95\x97\xd5}\xe0\x1c\xe9h\xcc\xa2\x93\xf0\x89\
-B\x0b\x08\xbd\xeb\x15P\x029\x16q@\xf8\xf5\xc8E\
-:\xec\xa4\x8b\x9d\xe2\x1bg\x0fyW\xd3\xe2\x9e\xfc\xce\
-}\x88\x82\x97\xb3\xdb\x1d\xb2I\xe0\xd6\x5cLq\xb6\xc6\
-\xa1\xe4g\x0c\x07\xb2\xf7\xedK<w\xc9\xac\x1e\xad\xa1\
-\xcc\xdf-(ga\xd1Oe%y\x0dnSp\xad\
-y4\xef\xa2o\xab\xa6E2\x11\x17\xdd\xa7@\xd5>\
-\x0a\xdb\xf6\x1b\x03\x8c\xe8h1\xc69s\xec\xbd\x1f\x14\
-\x8b\x12\x5cv\xd2\x8c\xcc\xbe[\x0f\xef6\xaf\xc7\x5c>\
-`][\xf4\x9ag\xc1\x8b\x9dE\x0f}\x0a^\xf3,\
-\xbeQ\x16\xc7FS{\xa1\x5cZ,\xa8\xfa\x96b}\
-\x89\xc4\x191\x8dY1\x943\x12\xc7\xa7\xc1\x02\x19\xaa\
-/\x04\xaa\x919yL\xe1I\xa6\xb0kYV3\xef\
-w\xf1\x8a\x0c\xb2K\xba\xc7\xb1\xbd\xa1\x94\xaeV\xebO\
-\xb5M\xad\x01\x9e\xe4\x80'\x16\xd8\xae\x05c\x8a\xed\x19\
-\xe5\xbd\xa1\xdfpj\xe5\xc4\xb559Ff\xac\xb9M\
-:\xebN\x80P\xb1:t\xbe>\xd1\xa6|\xbaZ\x01\
-\xd4\x15\xf3\xb39k\xda\xed\xa9Q\xfc\x89\x08\xc6\xa4\xf0\
-\xfd\xce-\x9c\x8b`\xf9\x0c\xd3\xcf\xce\x87gn\xe0\xd5\
-\xeef\x1d%^9~3\xc4\xf1\xfc~x\xb3wT\
-\x82uE\xf6\xb9\xd38\xb7\x0e$F\x02!\xde\x82\x99\
-Gl\x96\xb99\xf6\xf6\xe6}\x85;S\x88y3[\
-\xf2\x0a\xa3\xea\xe1\x5cy\xac\x85\xf2eO\xcdMn\x9b\
-u\x81\xe8Sf2\xfa\x98Nd9\xe1O=\x81\xa4\
-\x86\x95\xdf\x98\x8eq\x00\xbb\xe1l\xcah5\x11\x8ay\
-\x0b\xd0\x07~P\x9f_\xbev\xc8\x87\xcf\xef4\xde(\
-\xde\xa2.Z\xee\x98\xbd!\xa1\x80\xcd\xdb;;p>\
-hP\x13\xa6r\xfaZX;A\xe0\xa1\xbf\xb4|#\
-?\xc0Q\xe4\xc8\x18\x8bx;\xcb\x82\xc9q\xe6A\xf5\
-\xa6\xc7\xb4\xb0\x93\x22\x84O\xaf\xcf\xa7\xd7c\x09\xbe\x85\
-\xf6xyd\xa2\xd6\x94\xcd\x95,\xbf\xe6A8\xdb\x0e\
-\xb7\xean\xee[Q\x85\xc0_c\xf0\x8a\xcat\xd0\xee\
-\xf7\xe1gl\xba\x14\xc0\x84\x1f\xe4w\xaa\x0c\xc5\xe8\x0b\
-\xf3\xb3\xbf\xfc\xef\xd1\xdb\xebZ\xed\xf9\x97o\xaf7k\
-O6+\xf4\xe7k\xfc\xf7\xe9\xd7\xad\x8d8\xd4\xb1\x8c\
-9\x80\xa6\xf4\xec~\x15\x14\xa72\x867Mk4\xf4\
-\xd0-\x12\xdf\xbfD\xd5\xcd\xa7)>\x85\xf6\xae]\xa2\
-\x0a'\xe3\xe6;\xcc\xdd\x88\xf0Z\xcf>l\xd3\x0f\x22\
-dw\x0cY\xfbe\xe5\xe5q\xe2\xc5\x05\xc1`\x9a\x15\
-+\xea\xb4o{S\xf1\xef\xd5\xb4&\x9b\xf13\xb1\xd5\
-t\xf8\x96\xef\xf1\xce\x1e\xef\xc6\xe6\xe9{%\x19\x1b\xc7\
-r\xe3\xacH\xbd\xbc\x94\xbc\x94l\xbc\xfc\xb3 \xa3l\
-b\x0beqD\x0b\x14 \xf78\xf5\xa6\x135\xd7?\
-R`Q\x8fwu2\xa5d\x9b\xe7h9\x9dy\xf3\
-\x01\xf10'w\xe1c\xce$\x97z\xd6i\xdd\xdfw\
-L<\x1ezD\x04p\x19\x06\xe1F\x0e!U:\xfa\
-e\xdc\x9e\x95j1\x86\xd5\xee`\x8c\x09\xe0H\x06\x19\
-U\x5c\xe2\xb3\x09\x88\x03\xd6g\x99y\xeaf\x9e:9\
-{\xcb\x15\xb0\x81}\xef\x01u\x17Rv\xef\xefW\x1d\
-tjSo\xb4\xc4\xca\xe4\xb4oMN\xec\xdb\xcf\x99\
-GZ\xb5x\xb9GQ\x14\xf6\xc7?\xd7\xf8\xb7\x1eY\
-\x9a/\x12\xbf>\x0d\x06\xe9l\xd2\xeb\xd0R\x94\xfeE\
-\xd6\x5c}_\xb5\x93\xf0\xd2\x00J\xd87\x97\xff\xba\x96\
-\xad\xcdu#e]U\xda\xaa[n\xc7\x8d\xabrW\
-\x19q\xfc\xd6Z\x9c\x87\xe5/\x01Q^p\x09C(\
-\xda\xe0~Q\x05\x0c\x92\xad\x00zk\xba\x96\x814\xee\
-\xb12]\xd8\x8f\xe3xU\x9f\x9c\xf7\xf9\xfat\x7f5\
-\xf1KSD\x09\xeblk\x7f\xdd\xa2\xcb\x1c\x98.\xda\
-x\xdb\x89\x11\xec\xd4~%\x90?\xbd\x1aMf\x17\xb0\
-\x0f\x00\xc2\xf5E\xb1\xc3\x5c\xe3\x5c\x88\xd6,\x13t\x96\
-Y\xe28\xe3\xc8\xc4$r\xde\xfbz\xab\xda_+0\
-\xe7N(\xa7\xe9~\xb2\x9f{b\xbf\xb5\x7fVo5\
-\xf6U\x80\x00J>\xda76\xcb\xedF&m\xfdj\
-\xa3\x044\x01\x0dU\xb4\xf3^\xc3g\xf7\x91\xcf>]\
-\x8a\xcd\xee[\x17\xa0\xfb\xc2d+\xfa\xd7\xcc\xa4\x9dC\
-Z\xe0\xb0\xb4\xf8\xf2\xef4\xbco\x14Zuf\xd7\x8d\
-\x0aXz\x8aI\x19\xb1\xd0R\xd60\xcc\x02\xdc\xdf\x9b\
-\xbc\x80\xe9;\x9b\x9a[\xdb\xca\xfb\xfb\xac\xf5\xa0c\xc8\
-\xf8,\xf9\xaaV3j\x9a\xa0\xa9\xa8\xffzC\x0b\x06\
-Y\xf3\x99\xf8s\x97\xef\xcdg\xaf[(Y:}\xf4\
-\x82=u\x17\xec\xa9\xd8;\xfc\x93W\xd3)\xc7\x07\xca\
-\xa3Y/\xb0\xd3\xe44@\x9fZ\xc7EB\x9e\xaf\xa6\
-\x0c\x9b\x1d\x9b\xb8\xcf\xf2\x82\x85Jb\x84\xd4\x83\xe1U\
-:\xe9!a\x0dR4\x0f0\xd7I\xfa\x88\xc2V\x1d\
-\xcec\xb0\x87_\xc2X\xcf\xd1\xc6\xb6\xd2\x18^\xdaX\
-\x87\xfc\xd2\x91L%{\xdc\x89H{\x16\xe2Z<{\
-LZ9\x0d\xffe\x8b<Q\x9cSl\xf1\x02\x93g\
-\xe0\x97\xe8w!o\x81\x9a\x7f\xf4\xa3c\xd2\x1b\x83T\
-\xb7$\x1b\x8f\xddW\x00o\x15\xac\xbf7+\xacG\xe2\
-\xd4;\xe6\xa8\xd1`4\x1c\xf1\xe9\x1e\xc3!B\xb5N\
-Q\xcf\xf6\x9dpb\xa0\x09;X\xbe;\xba>\xef\xa7\
-\x15\xb2\x8cy\xbfT\x1d^\x09]\x8f; 1\x8c\xf4\
-F\x91\xafF\xa0B\x15X\xf3\xba\x07\xeap\xec\xf0B\
-\xd5\xd0\xa9\xe6\xa1*\x08H\x17\xcf\x9b\xe4\xc9\xdf\x07\xcf\
-\xf3vqT\x81v\xfa\xc4C\xed\xe5:-\x80?\xee\
-&\xc5\x8b\xd7'\x1e\x1cK\xd5o\xedF\xf5\xc4\xfax\
-=w<\x16\xcc\xb2q\x82\xad;\xeal\x89n\xce\x0d\
-\x81\x16p\xb4\xcb\x84o2%\xb4\x93\x04\xed\x5c\xab\xe6\
-+\xd1\x89\x0c\xff\x91\x8a\xf4\xbcO\xa4\x05\xea\xc1+\xfd\
-$\xa2\x9b\x8e\xd9\x0d\x17\xb9\xe3\x8a\xd5\xcd\xa2\xadD\xfc\
-\xb6]-\x82\xb9\x12k\xff\xee\x22 j5'L\x87\
-\xc32\xdex\xee\xcef\xc9\x95r\xfd\x9e\x9d'];\
-\x01\x8e9\xc6\x02\x0b\x0b\x8c\x81\x82\xbeB\x8b\xf5\xf37\
-^\xe6U&L\x97\xa3\xefDq\x0b\x86\xba\xdc\xf1\xb5\
-\x1b\xff6\xafO\x9a\xb2\xf0\xbc\x9av\x1fg\xc6c<\
-A5\x8d)\x8f\xb6\xa1\xd1a\x04\xd9QT\xd8\xaf\x8e\
-\xf3\xbbQr\x01\x1f\xbc~#O>\x0d\xab\xae\xb0\xee\
-\x85\xd8\xa7\x81\x1b\xee\xb4\xf4P\x84'6\xdb\x80B\xae\
-y&\xbb\x9fZ\x14\xa1\x13Y9*b\xf8\xf8\xed\xd3\
-\x9c\x18\x10\xa3DQ\xb0Tn\xb4\xff\xbb\xec\x921J\
-\xf5\x8f\x1c\x18\x0bV\xcf-\x10\xe1'$D\xedA\xd1\
-\xb8Y\xd4\x1e\x16\x9b\x1d\xe7V\x8e\xc9\xae\xa6\xdc4\x09\
-\x1fg\xc9\xe6*.G+5\xf3\xb6\x8b)I\xd1\x8b\
-1wY\x02\x0d\xbak\xb7\xdb\x03$x\xeb\x96\xdc\xe0\
-\xdd\xa8Z\xec\x17\xbe\xd2\xef\x06\xae\x8aJ3\x049\xe4\
-\xbb\xca\x15'd\xa0\x16\xac\xa84\x01\x90k\xben\xae\
-\xb0 \x0e\x8a\x7f**. t\xb0w\xd14\x1eM\
-{H\xbfI4I\xfb\xedY\xef#L\x84\x9b?\xf3\
-\xc2\xe1}\xca4l\xb4\xed\xb7E\xedj\xfd\xfa#\x9b\
-\xf5C\xec\xdc\xc6\x01.SS9\x06\xe5E:A\x17\
-\xd2\x01\xf5T\x12y4p\x83T\xe1|w\x89J\x22\
-\xbb{\xfaa\xe6\x80\x12\x1b@\x84\x8d\xae\xb8\xa6\xbcQ\
-3\xf8>\x87o\x96\x1b\xb3\x0f\xb0\xb5<\x99{z=\
-\xf7\x83\xe7\x8a/b\xeb\x82X\xab\xd9\x0c\xd76\xec\xba\
-\xab2\xe2\x7f\xd6\x14,\xab\x99\xc9X\xd0\xea\xf4\xcc\x09\
-3\x0c\xb5\xaf\xec\x94\xe6\x9czt\xd5\xae\x1ah\xd3\xc6\
-\x01yaGw\x99\xb1\x13nA\xc7t\x10\x93F\xf1\
-\x14\x18k\xd1\x8bM\xdcxa\xdc\x13\x85o\xc4\xe4\x07\
-\x84c&l\xd9\x91\x9eq\x10\x85Z\x8b\x8e/\xac4\
-kt]\x80n\x0b\x1d\x87bG\x83;\xa6\xeb\x88\xe4\
-\xfe\xbe\xe6\x07\x010o\xe00\x16\x04J\x82\xec\xf2\x02\
-=\xdeR\x8d\xe5d\x97\x1d\xa0\xae\xd28\xb9\x15\xb3\x7f\
-\x0d\xb8Y\xdc\xc1\xf0\xaf\xd9`\xcc\x9d\xc8\xe3\xf7\x98\xe5\
-\xee\xe0\xe5\xfaCy7\x15\xf0E\x06s@B0\x9b\
-\xce\xebmy\x82\x8bw\x02\xa8&\xd5|\xc5\xa9R\x8f\
-\x1b\x81P\x80Cj\x80ch\x1b\xe4x:T\xc2\xf9\
-\x9e)D\xaeK\xe4\xb0\xe3B\xc0\xf6\xa0cq8\xd7\
-\x14\x8e\xcf\x12\x17\x03V\x04V\x12\xc4\x9e#\x0c\x13\x01\
-\xd1h\x14\xa2\x8f\xc3\x0e%g-\xe5;\x8b*\xda\x82\
-\xe3\xd0\x98e<\xb2\x9e\x01\xa7v\x87\xa5\xcd\x0dM\x19\
-b\x95)\xc9\xd7QP\x94/\xac\x8a\xca\xca\x15Q\xae\
-8]v\xa1\xb1\xef\xc7\x05\x8513\x8aul\xa5Z\
-\x8b\xb0/_\xf5\x16_P\xdd\xdf[<\x9cm\xb6\xe8\
-J\xcc\x22\xa3\xc6\x96\x0edF\x0c(\x06L\xe9\x11\xb9\
-\xddsZk5\x8d\xf3\x00\xbei#\x8f\x93\xd4\x1c\xff\
-\xc0\xf89\x8f\x91K\xa8\x94b\xdf\x8e\xf8\xa2\xd1\x93N\
-\x94\xe38\xb4\xb19\xcf\x8c4yP\xdd\x91\xc1\x05\x0d\
-~\xc9R\xde\xdb\xeb\x92\x87\xbe\x87k\x88\xe7\xf2\xf2\x88\
-i\xef4\xf1\x8cmp\xa8\xb0$)\x9b{\xa8\xf4\xa5\
-\x01\xed\x1b\x94\xe1\xd0\x9f\xca\xf8th\xb2\xcb\x82\x84c\
-\xaek\xb1\x5c</t\xbdH`W\xdfU\x9f<\xd5\
-\xeb\xb1p\xbf\x93\x1b\x1d\x00\xb5\xb7\xd9\xcc\x17\xd6\xd6\xa4\
-\x1a\xab\xda\xd5\x11b0\x08\x195_N\xf2\x99\x15\xe9\
-\xd2\xe2v\x03\xe5\x0cg\x94\x0a\xb8O\xb2\x91\xe5\xe1\xf5\
-\xbdI\xbb\xf3\x9e\x89\xbf\x9b\xf6g\xed\xa4\xe6\xed\x90\xe4\
-\xde\x933\xea\xd5'\xeb\x92F\x81I\x8a\x96\x1d\xd7\xe8\
-\x99\xe6\xbc\x86,>\xca\xd3\xa2T<}\x8c-n\x96\
-Fk8Q\x01G\xd8\xf2*\xfd\x81\xc2!r\xad\xcc\
-\xb5\x02\xd5\x0a\x83kcx\x17\xa9\xbca\x9d\x19f\xdf\
-J\x11\xa0{\x96!\x9b>!9\xec\xa0\xc3\x1d\xa5\x19\
-j\xd33\x851T\xea\xfb\xfb\xf3\xa9\x95\x0ds\x03\xb6\
-M\x12\x95\xed\x86]`\x9f&7d\xff\xe1\xfa\xf8=\
-\xe7\xc0p\x81S@\x8fg\x1b\x03\xc2\xdd&\xfa\x17\x0a\
-\xf4\xae\x03HQ\x11p\xd48\xe72K\xb2\x17:r\
-\xd4\xced\x92\x9e\x89_\x01X\xd9\xaa7t\x8d\xe2y\
-\xbf\xb7\xead3\x01i3B\x84:T\x99\x84\xa3X\
-9j\xddS\xf1\x14o\xfa)\x0f\x07\xa9(;\xd47\
-\x05%\xa0\xc2jfHkk\xa7\xcfn\xe8Lq\xca\
-\x064\x12sC\xa7\xa9\x00B\xab\xce-\xdf2\x83\xf4\
-\xe6\xc1\xc3\x9e\xf1\xd8g\xe2\xf39\xc7\xc4\x9b\x0d\xf1\x1a\
-\x14\x9e\xaa\xdf\x84\x07O\xbau\xb8\xa0\xbc\xeftR\x82\
-\x9e/N\xadkf\xbbb-\x15/\xb5t\x83\x8et\
-~\xad\xab_7\xd5\xafO\x1c.t\xde\xbb\xfce4\
-\xfeE\xcc\xc1\x9e\xaa\xf7j\x94\xe1\xdfl\xb3\x12\xe6\xea\
-<A#'&\x08\xcaV^\x1f\x98\x0d\x05\xec\x0e(\
-#\x8a\x9b\xf4\xd7[\xfedH\xa3\xf2\xe9\xd8\xa6\xb9-\
-\x1a\xe9\xa0\x0c#>\x18\xf0w\xacF6\xc0$\x09\x9f\
-9\xcf\xcc\xbeb%\x9a\xa1\xa0@\x90a=\xcd\x88\x95\
-\x83#\x1d\xa1\x96~\xe0\x09\xdd\xdbd\xb6\x18\xeeF\xfb\
-\x8cb\xa8r\xc2?&\x95\x11\x07\xa9\xd8\xd8\x8cUq\
-\x94.\x9c\x19\xf1\xb2/>\x9bu5L\x80\xd6\xfc\x97\
-\x1d\xf3\xa0/\xe7l\x8e\x94\xe0d\xee\xd33\xdek\xf5\
-f\x87`\xd01N\xac\x94\x02\x05b\xec'\xfa\x86\xfe\
-\xb5^H)HI\x85\x99O`\x90f\xf9\x10\xd1U\
-\x1cu\x97\xd3T76\x18-'D\xc5\x1b\x9b\xfc\xfd\
-)\x91\x9d\xf9}\xf9\xd7'n\xef\xba\xea\xbd\x9e\xda\x85\
-\x81;\xdfoh\xbf[\xbf>\x09\x16\xf0\xb6\xf1_\x9f\
-\x18p\xa2;\xbb\x02\x9d\xed\xcd.\xc1\xc7\xecs\x9f\xbf\
-\x12\xaf3k\x8ew_Yt\xd7\xce\xa23;\xe9\x22\
-7\x9a\xbd\x19\x9eS\x22ug\xde{\xe3\x83b\xe7\xb3\
-\x93\xf6\xfbQ\xab\xa5\xdfkcn\xab\x95\x93$\x0b~\
-\x06\xb6\xeflAkM\xee\x02\xd3\xa0\x00\xed\xd7z=\
-_\xf3z\xbe\x96\xf5|m\xd73[\xab-\xb5\xa0\xc3\
-N\xd9\xbd\x18\x93f\xee\xaf\xf5\xd2\xf6V45\xb6U\
-z\x9fl\xae/\x5c\xaf\x8b\x97\xc9\xe6\xa2e\xf2e~\
-\x990\xa1_\xf35\x83\x0c\xfe6\xa9\xe8\xa5q\xcdK\
-\xa3\xc2\xab\xb7\xeb.\x0e)C\xab\x83\x11UL\xed\x99\
-\xb5\x11\x00\xcf\xe2\xc8\xae\x0fY\x19V\x22s\xc4\xabE\
-\xa2\x19-\x83S\xcf.[\xa1\xe0E\xb9\xbe\xd0E\x8b\
-%\x1f\xae\xddF(Nr\x8a&'Lq\xde\xd1\x9f\
-\xca\xee[\xd5\xfcV\x86\x9b>\x09\xe2\xdd[\x0cp\x92\
-\x93\xf6\xc4ov\x91HB\xb5\x19\x99$^/\x99\x14\
-\x14\x16\xf4o--\xe8o\x16\x17\x9a\xe6\x1b\x98 \xbf\
-~\xaa\xe9\xd7K\x1cV\x5c\xe2:7\xe0\xc3\xbcJ\xe2\
-\xf7H\xca\x96\xfd\xae{\x8b\x22\x9e\x1e\x1a&\xc5\xf3\xec\
-0\xb4\x11\xb8\xc8I\xd6T\x097\xee\xa5\xc6\xe6\xb4X\
-\xe9\xde\xc6%\x1f\x1c\xffi\xf4\xdc\xe3\xf5\x16\xfe\xc3f\
-\xa7\xf1\x22\x8b\xe4\x92_\xaf\x90\x1bO\xba\xd6\x0fj\x10\
-\xbf\x0f\xf6\xebS<w\xb4\x83X\xf4\x0f\xd0\x06.\x08\
-F\xf0\x18\x1d\x84\x0e\x0e\xfb\xb0*\x22\xa0:\xe1\xcc^\
-\xcb\xde\x9d\x8a\xa6\xe9\x0fR\xb5a\xed\xec\x84\x95\xde\x9f\
-b\xc2X\xef\x8a:i\x96\xde\x8e'\xbdA\xaa]\xa3\
-\xb18z}\x0e\xff\x8d\x7fw}\x15f\x06TN\xd0\
-\x1c\x1d}\xaf\xcf\x0bKB^\xb0\xe0\x98\x0b\x8e\x17\x14\
-$\x1d\x99+\xcf\x06\x80D\xa8\x0d\xaa\xa4\xa8\xd3\xb6\x17\
-\xb6\xda\x96\xe7\xd1\x12R\xc2\x84@\x18)\xfd1\x9a\xa9\
-'x\x8b\xe6D\xcdp\x85|\xc0f6\xa8\x86\xc16\
-\xcenQ\xee\xb8\xe5\xf9\x1ag\xa7'\xa5\xc0\x94\xe1\x93\
-\x8b\x9cB\x0a2bn\xfb\xba\xdf\x8f\x97\xaai\x5cT\
-\xd38\xe6~RMO\x92$\xdbc\x1d\xc4'wb\
-)\xb8\x09,:\xb9pK\x81d\x0cD\xa0\x1f\x90\x18\
-\x9dZv\x9f\xcb=HS\x0f\xbc\xbb\xd2\x8c/\xa8\x83\
-\xb0\x978\xd9\xbdN\xbf1\xf4\xe2*M3\x904\xb9\
-\xc7\xb9D\x98\xd3\xa9x\xcf\xbd>\xdf\x9aZ!\xb4Q\
-W\xc7:c\xbcu\xecfd\x988*aj\xaa\xc6\
-\x1dLo\x03*15u\x12\x85\xcb\x90y\xf9\x077\
-\xfdz\xfcKw2\x1a\xaf\x1f\xcb]\x93\x97w\xcey\
-\xdcWu-\xfa\xc5\xca\x07\xf5Q\x94\x8b\xe5\x89V\xb4\
-\xa9q\xd3\xea\xd8\xe4X\x94\xe8x89\xed_\xc6\x0c\
-\xa0\xa2-\xbcUX;\xc7\xb3\x80.y\x82W\x11\xe7\
-\xe4\xefG\x9c\xfb\xa0q\x9c\xf6\xe3\xb3\xb6\xa6\xdd\xa0\xbb\
-\xa9\xf7\xf7u\xfd\xe9\xd0\x03\xaa\x15\xb0\x85s\xc7\xeb\x0f\
-\x1a=\xf5r5\x8e2\xb5\xf9\xd6\xe2\xb6^m-\x17\
-K\x83v6\xef\xef\xc5\xf0\x14~ 8\xdd\x81\x98\xd7\
-\x90\xd0\x93\xeb\xe4#\xc5\x8a\xd7\xb6\xa7\xde\xce\x91D\xae\
-S2/k\xab\xd6X`\xea\xe1\xc3:\xb5\xfb\xdbP\
-\xa6~?\xf3\xa1\x16|h\x9e\xb9[>\x86\xde\x90x\
-t\x8dv=S1\xe4\x99\x12K\x81\x84c/!f\
-@\xe0$\x8e}\xa4\xf2(sS|\x9e\x14\xea\x01\x9a\
-\xd7\x15\xa6\xe9\xf5c6\x9c-1\x19\xafO\x99\x88?\
-\xc6\xdf=Y'_\x06\x09\xfc\xad\x5c\x97=\xe8\xb2\x07\
-\xacJ\x1f\x92\xea7\xeb\xe9m\xa5\x94\xa95\x8e\xe9\xc5\
-\xdcu9\x81EQI>\xe0q\xc3\xf6\xf9\xba\x08\xc5\
-\x80{wd\x05\xf3\x03\xdf\x0b\xdfEL7\xa6\xa2~\
-C\xa9e\xe1\xd1\xe3z\x83\xbb]\xfe(e*\x82\x15\
-\x1e\xa0$\x0a\x17\x08\xd4\xe7\x8b\x99|\x92*\x04\xceu\
-\xd3@\x12S_l\x9a\xf31V\x1e\xa7;\xa6\xeb\xec\
-2k\x06\xae3\x99S\xbe\xeb\x86Bl57\xb6\xe4\
-p\x16\xb8\x9c\xdcB\x91\xabn\xdcYz\xc2\x16\xe5=\
-\x89\x1a\xf8g3j\xf9\xd38V>uT7\x9f\x02\
-5\x14\xcf\xaeEI\xc10\xaf7\xfe`T/\xc2!\
-\xfbc\xe1\x95X\xbc\xc2\xea\xca_0\xb4\x00\x1e&\xd5\
-\xc2yu\x88uY\xb2.\x98k\xa3\x19\xe6|y\x13\
-<\xfcc\xec\x16\x1eqRY \x9a\xfe\xce\x07\x95\x8b\
-I\xbb\xf3\xbb\xd8xz\x82.\x8fbx=H'\xed\
-\xd9H\x1f\xb5\xba\xe9p\x04B.\xa5\xb4\x94\xff\x14\x1d\
-\x9d\xc4\xf0k\xb7\xd5\xda<#\x18[\x819sy\xbb\
-\xc8\x18\x12\x9d\x02\x19\x16\x8e\x06^\xfe\x11\x0a\xfa\xa6]\
-\xf9P\xb7\xf4\xc79\xbe]\xee\xa7]zb\xb8\xcbe\
-\x92\x00\x03PPA\xd6\xa2NQM\x89\xef\xab\x01=\
-\xd0v\x16\xda\xbfa\x9c\xbd&\xcd\x83+\xa4B\xfd\xb1\
-\xca\xa5R\x0b\xa2\xcbs\xd3\x11\x10d\x0cVS86\
-Qz\x98\x14-y\x90s\x1c\x93\x81\x0a\xd5`\xb1C\
-7V\xf0QT\x8b\x85\xe4\x89\x19\x16\x1a\xe5u\xc39\
-\xf5x\x09\x19|\xc8R\xed\xd0\x89h\xdd\xe5\xa4\xae\xa3\
-\x82\xd5\x06_.\x11\xb8o\xda\xb9\x09\x93\xe5\xbe\x87w\
-\x8b\xdc\xdfG\xb5HYM\x97\x98\x1b\x0e\x5ca\x01h\
-\xf2\x17_`\xb06\xc5\x05\xef\xc1\x94q\x97\xe4\xb5\x06\
-\x9b\xc3\x07\x05;\xbd\xe3\xc4B\x93c|G\xa4\x907\
-\x057\xf4\xca\xda2\x12z\x0d\xe1nU\xbflT\xeb\
-O\x95\xf3\x9ak(\x97gC\xbeG\x19\xea\xa0n\x92\
-\xcc1\xe0\xca\x12\xeb-.o\xae\xcbe\x16E\x85\x09\
-=W%g\x04B\xbf\xbeON\xcc\xe1%\x11g-\
-\xd8\xb2\xafC\x18\xf6\xcb\xaf\xd5~\xdc\xbcN\xbc>v\
-+\xdcUz\x1d%\x1b\xcf\xc7\xc4\xebo\xb7\xd2\xb5 \
-\x15\xd9\x9b<\x8a/\xdc;\x87Z\xf3\xfa1C\xdd\x05\
-%>ntu\x09\xea\xb3w\x16\xa1\xfd6\x9f\x9c=\
-\xa2\x88\xf68\xb3)\x0d\xf9\x1c\x96\x95K\xf8\x8e\x9cG\
-;\xe4\xf8~Z\xfb\x5c\xcb\x80vs\xa0\xfc\x88LJ\
-(#\x0f\xf16Gr\x0e\xbe\x84)\xa0,\x12\xb1\x80\
-\xb0,\x1f\xdc\x82\xd3\x84\xeb\xe5dP\x87\x99p_\xe8\
-\x01\xfa\xeaq\x03\xa0\xc8\xe5\xc7\x96\x07\xfb\xa4\xe1}n\
-\xe6\x8b\x02F\xa8\x5c<\xb6\xe4Z\xb2\x8d\x7f\xddx\x12\
-\x17\xeb\xfe7\xd7\x07 <\x80t}\xcd\xf4\xd2]g\
-LT\x84\xa4\xd7y\xdep\xcf\xffn\xccrvi\x5c\
-\xf9\x80\xca\xdc\x8f\xe6\xa7(\x8a\xc2\xedo6j14\
-R\x86\xd5\x0btV\xaf>\xa5\x16g\x16v\xa6\x8a\xba\
-\xd0.\xcf\xf0\x0aO7\x8c\x8d!\x5c\xbb\x02\xc9E\x1d\
-\xfc(pT\xd5!\xf3\xbb#\xe6q\x87\xfc\xe7(\xa9\
-\xf23bDE~\x87\xc1i\xe5\x1d\x86\xe2D\x9b7\
-\xe5\x12\xae\x1b\xf6\x1d\x0a\xb0\xad\x1f\x11A\xff\xd7-\xa3\
-Su4=\x9d\x8e\xfa= \x80\xd9h\xec\xf8\xe3\xc2\
->\xb7Q\x80\x98/C\xbf]N\xaed\x88\x8fw\xb6\
-\xa0\x9d\xbe\x8e\xc8bWo\x10@/]\xe5\xae\xda0\
-\xa4,Y\x85x\x02\xcc\xe2\x1f\x0f>\xdb\x17\xb7m\xdf\
-\xe4\x98/A\x83M\x9fg\xceI\x0c\xdb5\x8d/\x90\
-\x00>\xf2;\xc8\x22g\xccr\xf3\xca\xf5\x01\xa7r9\
-S#\xdb\x1eM\x8cy\xb3\x0e{\xf4iovE\x8c\
-v\xeaF+Y\xe4\xac\xa8\xe9\xe0#l\xa7,\xb1J\
-\xa8\xc5~\x99c\x9c\xc8\x9d\x8f\xf7\x05\xc7\xf0\xcduv\
--\x92\x0f\xb5\xb6\xf0\xed\xbd\xf6\x22\xb6Z\xb7*\xf5\x0f\
-\x93\xd9r\x92*m6\x8fV\xce:n\xb1\xe5\xc2u\
-\x84\x91\xea\x0bDQ\xff\x95\x83q\x8c\x99\xf5\xe4\x00g\
-\x14\xe8\xf6\xc3\xe2\x1f\x0d.g\x5c\x11z6\xe5\x88Q\
-\x0f\x0bK\xc5J\x0du\xe2\xe9\xe7&]-\x9a\x8c\x93\
-\x19H!\xfb\xcd\x9c\x13M\xb9H\xc0\x08\x5c!\xb39\
-\xf5!\x99\x95\xc7\x1b_\x82\xb0\xe1\xbd`.\x7f(\xcf\
-\xd8\xa4\x0e\x1a\x09\x1a\x9e@\xba\xc6\x80\xef\xc2\x022\x94\
-\xc5\xc3\xb4X| \xc8o\xbe~RSg\xfb\x95j\
-\xedKz\x18\xce\x87\xcd\xf2\x94\x1f\x82\xedC\xbf?$\
-%/\xb1R\xda\xaf\xcc\xc8\xba\xc2vZ\xf7\xf6\xd67\
-\xd5;\x02b\xe0I\xa3\xc3\xa3_\xcd\xbe50\xb2\xea\
-\xc9\xd0E\xef\x87\xd8U`2\x1f\xb6\x00\xc0\x82O\xc4\
-t$\xc7\x82\x09;\xc5\x15o\xae\xcf*'\xf6\xe5\xdc\
-\x07\x90\xdbf\xc13\xef\xbe\xa8iBR\xc6-\x8f\xe7\
-\xc6\x0a\x16\xf9\xf3\xb0\xa0\x22\x10\xdc\xb3\xb6T,\xb1B\
-bn\xba>\xf5$\xee\xd7\x83\x9e\x88\xb0\x95\x02GD\
-\x9ak\xe0*^\xe49\x9d\x10\x1b6\x08\xcf\x8d'T\
- \x03S\x80%,\xc4\x94\xd3\xb5\x9e\xbf$\x12W\xd8\
-\x22\xc5\x22J\xc0$\x1d\xc7\x93P\x1f\x9cs'\x9f\x7f\
-\x1c\xb5\xb0\xf7\x9a\x0f\x8b\xec\xd3\x22\xe5yf\x0a\xa6]\
-\xa9\xd2U7\x89y \xee>}\x9c\xc0\xeevke\
-\x9b\x1b&y~\xb7\xa3/\x83e\xe6\xd14\x90\xd0\xbc\
-Pr\xbe2F\x0e\xdd[2B\xa4\x229\x9b\x90\xb0\
-\xea\xea\xb6rC\x05+I\xae\x1b\xcai:\xb3\xfdw\
-oCd^S\x18\xe3\xfav\x9d_\xbe\x08\xd5Z\x1c\
-e\xccS\x1dd\x09\xa5W\xbf|\xba\x9e\xe1#\xd5o\
-\xe3\xb2\xd3\xb1\xb2s\xd0\x14_\x0b\xd5\xda\xd7O\x1d\xa5\
-\x0b:\x13\xec\xfeS\xdf\x91\xaa\x22'\x81\xd1\x086!\
-\xb4C\xfa\xcd\xee\x06\xa3i:\x8e\xca=\xe5\x07S\xce\
-\xb9$\x9c\xc7\xcd\xc2\x1a:\xfd\xd14\xe5\xce`G\xf6\
-=\x073j\xd7\xfd\xecRw\xf3\xae\xe6\xb1\xb6\x1fK\
-2*\x8aj\xbf\xf4p2U\xc8p\xa8\x8e\x22 \xce\
-\xce\x07X\xceT%\xe3\xcaT\xf5\xb0\x9b\xc1\xcfyY\
-:\x19\xdd<\xce\x0eA{\x83\x97\xbf\xe8FC=\xf8\
-\xc0\xdb\xdc\xa6f\xdc\x80\xe8\x8d\x15&K^\x11\x5c\xb5\
-\xa7\xaf\xd2Kzf\xf7\xb9S\xe1N\x82\xb1\xdf\xce\x1b\
-\x1c\x87\xd2\xc4\xbb\xbb\xd3\x09\xf4#\x94\x9f0<3=\
-\x87\xb5\xf6~Z\x8a\xb7\x1c\xb2\x1ah\x87\xe3\x82jm\
-=a\xf4\x97!\x1f\xa1xu\xd7p\xdb\x94G\x107\
-\x0b\x1d\x8af\xb9\xc8M\xac\xdf-,\xf7$\xda\x16r\
-6p;\xae\xfc\x1e.\xfe\x97\xc4a\x1bB\x9e#\xe4\
-\x0eZ\xb9\xc3\x07\xaa\x99\x0f\x0f^\xed=?\xda\xdb\xfe\
-\xdb1\x8dx\x00\xa3\xe9x\xfe<o\x9e\x89_O]\
-\xfa\x94\x1d\xc7k\xe7\x8e\xaf\xd2\x1b\xc2\xde\xa3\x02[\xe4\
-)\xc0\xb8\x0eD\xe7\xdc\xb7 \xa3\xd88\x17\x9f\x19\xaf\
-\xc2\xad\x7f?_\xff\x8d\xca.;\xbd\xc0N\xd2\x9f\xb6\
-\x01\x13\x8f[c\x0b\x0cp\xc4db\xd1j\xd3!3\
-\xd2\xdb\x1dT\xdb\x88\xcbq\x10\xc7)<d\xf5G\xf4\
-\xfa\xb7w\xc4\x82E\x91\x0a2+p|L\xda\x95\xcc\
-QscS~Y\xd7n\x1f\x1f\xe1\xdaM\x1f\xf9A\
- \xfd\xc8\xbff\xe6W\xb7\xa2\x7f\x9d\xc3\xafP$\xee\
-e\xe9\x22\x17g\xa4(\x0a\xca\x7f\xd60(\xd3t\xd0\
-\x1e\x02\xfe\xa7\xcb\xc9\x13\x0e\xa6\x1f\x14+\xc4x!\x1b\
-\xc87\xd7G\xb7[\xd9\x01{\xb1z\x17\xedh\xfe\xb6\
-\xd5\x1e\x0eG\xb36y\x9e{\xcc\xb0\x8aG$\x15\x9f\
-E\xb6\xe6\xca\xed\xa0\x1f\xb5\x1e\x17W\xc9h#>\xaf\
-\xd8e\xff\xd3\xf8\xea\xf3\x8a\x82\xcc\x88R\xc3\xe7\x15n\
-w\x16\xa0\xf2\x81\xb2\xb4\xe5\xc9\x1d\xed\xe7\xd5@\xa6\xee\
-\x8f/\x0aL\xe7\xaf\xed\xdb\xea\xfe\xf5y\xf5(\xbd\xec\
-M\xe1\xa8_=\xc6`I\xd7\xe3\xfd\xd1\xe8=\x08u\
-\xc3C\x00\x8dT\xc9\xd9\xca@\xfe>\xe9\x0d\xd2\xd1\xf5\
-\xac\xa4+\xd8i\xf7\xfb\x18n\xact\x16a\xd5\xd0\xf8\
-\x18\xcf\x9a\x11/f\x15\xbd\x03\x98w\xd3\xa8\x15\xc3\xc9\
-w\x1e\xe3\xff/\xd1\xf6\xde\xb0\xbb\xb2\x03\xbfz\xa9\xdf\
-~\xf4j4$+!\x0c\xa5\xa0\xddK\xa5\xc3\xeb\xe3\
-t6\x83\x83\xcd\xb4\xfa\xebh4X[\xf3\x22=E\
-g\xd2^k#\xbd\x9d\xa5\xc3)\xee\x07\x1b\x98\xf6\xbf\
-\x010\xf6\x8d\xfae\x06\xb4\x0d=v\xbbh\x7f\xe3x\
-\xf4\xc7\xeb\xeb\xd9\xf8zF\x080\xe8^fdN@\
-,\x00\x5c9J\xdb\xddO\xfe\x18q_\xf9q\xef\xe8\
-\xf8\xe0\xf5\xab$\xda\xac~]}\x1a\xe1D'\xban\
-a\xa4\xf8s0\xe83\x9a\x93E\xddj>fe\x06\
-\xd4\x0a\xb06F\xa4\xa7\xb4Z+\x9d\xe4\xb8\xf6\x7f\x5c\
-h\x01]AC\xff@\x0eR_M\xf2\x06\xed\x9e\x00\
-\xa4=\x19\xd57rp>\x87\x83!>Nf(\x10\
-\xb1\xf3\xa6\xf9\x0f\x89\xd5\xb9\xdbcOL\x06.3d\
-\xbe\x89\xae7\x9blhOE\xf8tK\x02\x9d\xbar\
-\x93\xf6\xc5L\x10]\xb2,\xd2u^u+\xb3\x14\x83\
-\xe9dT\xddW\xe5h|K\x8el}/@\xa5\x5c\
-\x1b\x95\xab8\xe3\xb1\xc9\xba\x14\xca\xba\x8b2\xbe\x85L\
-\x86\xb8\xb0Uy\x93T\xec9o\x11\xce\xf2\x90UQ\
-\x9d\x82X\xd3\xeeW\xdf\x8c\xa63ou\xf8\xf4*\x0b\
-\xc5V\x81\xab\xb4\xea2\x9cR( \x9c_\x89^\xeb\
-\xff\x9a\xcbTu\xae'x68\xe9\x8d\xd5\x15\xbd)\
-A\x15\xe1Dq\xbc\x1c\xdf\x15\xdel4\x82mc\x9c\
-\xb8\x03\x91\xc82w\xdd\xb4\xdf\xfe\x84\xe8l|U\xab\
-)\xfa\xda\xc1\x8a\xe8\x93\xa7\xfb\xa7F]\xff\xfc\xb9\xf1\
-t\xaeBu\x93\x83\xc7fp\x7f#p\x01k\xe4(\
-\xb2;\xea\x90\x9e\xb0z>\xea~B\xd3\x90\x8f@\x92\
-\xbdn#\x92\xce\xfeB%~9\xe1\xf2\x11\x8a]\x0f\
-0\xa0i\xdaO;\xb3\xb4\xeb0 N\x02\xb0\x88\x9d\
-\x94.\xa7\xc4\x09\xbc@\xfd\xddU<\xba\xb3\x95zF\
-7S\x18\x15\xe1\xb7\xeb$\x9a\xda\xc4\xc9\x0dxF\xe8\
-\xc1\xc4(p\x02\xe7\xdc3\xccn\xb9\x1cV\xa6:\x13\
-\xd8\x91\xdc2\xe6\xc1\xb8x\xce\xb5\x87 \xc0;\x19\xa3\
-/\xff\xbcuVH\xb2\xd4wF\x8c\xcd\x9a\xf1zO\
-\xa5\x1a\xc0\xcb//\xfbY#/C\x0d\x12\x84\xd0|\
-'\xe6\x17\xb3\xa5\x11\x88y\xbd\xce\xfb$ \xbcp\xeb\
-\x98\x1b\x11\xaaeQ\x00\x9biy\xce\x85`\x95NG\
-\x93$\x1a\x8fzd\xcc\x83\xb1\xbc\xdb\xb3\xeb)\x1e\xbc\
-\x8b\xbb%\xad\x0fF\xd7\xd3\x94|R\x14\xf5\x00\x96\xe4\
-1\xd5\xc7\xbd\xd0m\xeb\xa2\xd7\xb3\x05}\x87E\xbe\xa8\
-,\xbe\x0aE\xf6x\x94B#I\xa6Z'\x07m\xc4\
-\xf4\xea^\x8cg\xd1\x9e\xbb\xaa\xa0z\xab\xda\x9b\x9e\x8c\
-\xde\xa7C\x0e*;\xeb\xcd\xfa\xe2\xf9\xa3\xdd\x9f\xf9J\
-w\xcf\xfc\xbaQZ\x1aG\xd29|/^4WK\
-\xe0K\xd7r={\xa8\x92\xe5\x11g\x02\x01\x10!Y\
-\xec\xa1H\x99~\xa4\xe8h>\x81\x96\xcb\xcaOx\x96\
-\x15,\xf4\xf9\xd0\xd2t\x9d\xd7;\xed\x11\xc9\xea*n\
-\x84\xf4\x1b-\x9b\xf0\xe3\x07:$\xa2\xda\x86\x1e\x97\xeb\
-\x8b\xe9ab8\xf3e:\x13n\xfd\xfc\xd3A\x97\x0a\
-\xf5\x86\xb0!\x1d\xec\x96\xa3\x0a\xb0#\xe4\xaaf\x1f\xd3\
-2s\x15S\xf6p\x10\xd3\xea>\xe1\x84\xfe\xa5\xb1a\
-\xf5F\xcf\xb0\xb0$\xfd\xa9\xbeh\xf7\xa7i\x891\xa2\
-\x8f\xfd\x9a\xf0-\xd6\x5c\x8c\x0d\xd2\xe9\xb4}\x99\x1e\xec\
-\x9a\xf9|\xc9)U\x90\xfdKKP\xe3\x02\xca\xf3\xb2\
-lPN\xe3\xc7\xde.\xac\x07\xfa\xb6\xb6\x96\xed\x1c\xed\
-\xbc%\x1f\x0a\xaf\x00\xdd\x98;&C\xdas\xc8;H\
-A\xf4\xe7\xfe\x9e\xbb\x90\xdc\xf4\x86\xdd\xd1M\x95\xf3X\
-d@\x0fl\xf8W\x1f\xd5\xe8C\xf2\xe4]\xd0\x15[\
-\xb6z`L.rAK\xf5U\xc7\xd0\xaf\x9f\xd4'\
-\xe7\xeb\xe7&;\x01\xbb%Wp\x9c\x0e\xc4\x0e\x7f~\
-*{;?\xbee\x19\xf5\xfbx\xd7d3\xf4\x0f\xa1\
->\x07\xc64\xc2\x95\xfd\x1c\xac\xecd4~\xa8.\x00\
-\x11\xaf\x85\xb2\xdc\x1fZ\xff()\x09\x03@\x1c\xdf\x96\
-%>\xa1HJ\xea\x93\x9f\xf0s+n\xf2\xcas\xce\
-\xc2\xba-\xa5c\x1bj\x11,\xceL\xe9\xf5,8\xa3\
-2\x1b\xa5\xc0t\xf0L\xc9\xac\xc9\xec\x06&\xf7QC\
-&\xa2\x941\x7fS\x83\x011e<4 *\x96\x19\
-\x11\xc9\x99\xde\x90\xd0\xa5\xdd\x9d\xed\xf4\xb2\x14\xc9\x22\x0c\
-\x88\xb4V\x14\x90&\x90\xad\xc1\x1f\xd9~\xc5^\x22\x91\
-\x80\xa4\xca\xe6HP\xf8$\xe2\x91\xc1Y\xd2\x0a\xd4\xb0\
-P\x0d\x1c9\x1c\xbc\xa5C\x91S\x1aM\x91>\xd9\xc4\
-\xdep\x98NHd\xfc\xcbw\xc8\xdcV\xc8\x84\x8f\x03\
-\xaev\xaefp\x80~\x96KGW\xcd\x90\xbc\x81\xe9\
-\xfa\xcf_\xac\xa1\xf8KrK?E$\xc5\xcd\xd9\xe4\
-\xd3]\x86\xed\xb8\x9aS\xe8A\xd0\xf5@<\xef\x90\xfb\
-\xbat2\xe1\xe0\x19\xf0\x03\x0f\xc5xt\x91\xc0\xdb\x90\
-b\xc4\xbd<\xd6\x86\xa8?Q\x1fG\xbd\xeeJ\x96H\
-\xaa\x1c%{\xf1\xeaP\x9fZ\xcamsnqL3\
-7\xf7\xc9\x83\x0f\x1eV\x88\x10c\xfc\xe04\x0f\xbfK\
-j[\xa5\xc2>\xe7'\xda\xa6\x5c\xf4\xfa\xd0u\x9cy\
-\x87\xa2\x1a\xa5|\x91!\xba\x0fW\xf9\x82\xed\xfe\xf8\xaa\
-]2\x14T\x1e\x96\xa3XW\xb6X\xe7U\xb4\xae\x86\
-\x95M|\x98\xf6\x14N\xf9\x8f=\xf9\xcay\xeb3\x8f\
-\xbc\xfa\xb4\xf6\xaf}\xd6=\xfe\xf1\xfbW\xc7It5\
-\x9b\x8d\x1b\x1b\x1b777\xd5\x9b'\xd5\xd1\xe4rc\
-\xb3V\xabmL?^Fj\xfb\xe8\xe8\xf5\xe9O\xc9\
-\x97\xfcc\xf7\xa7\xa4\xce\xbf~N6\x9bK\xe8l\x03\
-\xe7\xc8\x82\xc7\x0cZE\x80\xef\xba\x9d7\x0db,\x81\
-\x07L\xda\xf1\xf4k$\x0db#\x16X#\xf8\x08M\
-\x11\xd2A\x14+\xaf\x8cTeK\x18\xcb\xbf\xea&B\
-7\x8d\xb3\xe1?\xc2Ip\xb1\xff\xde\xf1\x22\x8f\xd3\xd2\
-GU7\x1a\x1e4y[P\xc0\x9a\xbf9E\x9a\x8e\
-\x0do\x9d\xc3%LF\xd7\xc3ni\xb6n`\xac\xd6\
-\x89\x10q\xfc\xfa\x10\xc4<k9\xebXj\x9d\x9f'\
-w\x87\x8d\xb1:\x82\xffN\xe0\xbf\xe7\xf0\xdf~\x83\x1d\
-\x06\x97\xc7j\x97\x7fv\xe1\xe7)\xff\xbc)o\xae\x8f\
-\xe7\x9e\x0ba\x8d{s\x956\xb6\x17\xec\x9a\x14\xa6\x9e\
-f\xe5x\xdc\xef\xcd\x0ea\xe5\xe8\x91j0<'\xf0\
-\xaf\xe4n.\x8aASE^1\xc8\x19g\x06\xe2\xac\
-\xd7j\xa1OG\xd3\xfaJoh\xbap\x864\xfe\xea\
-\xf5\xc9\xf6\x09\xac\xba\xea\x0fov\x0f\xb6\xbf\x7f\xfdj\
-\xfb\x90\xd6\x00\x08\xb9\x22A>\x04~|rt\xf0\xb7\
-\xbd\x96\xe9\xa8\xe9F\xf6\x8c?\xf4\x0e\xf8\xb6\xb3\xadP\
-\xf2\xd2\x85\x1d\xe5@\xc7\x10#L\xa3\x1a\xab\x99\xa2\x89\
-f\xe2\xcf\xbaLt_\x8e\xdd\x94\x93\xf3\xf3\xeaa\x19\
-\xfe92\x86\xb0\xf4\xf7P,a\xd9\xeb\xd3D?i\
-\x9e$\xda\xccY_\x91B\xd1\x13\xf9`X\xe3\x0eq\
-&\xbe\x97\x04\xb6K\xb0\xcf\xe5\x83a\xcf5\xecy\xa2\
-\xcd\x84\x1d\xcd\x86\x1el\xe3\xee\xdc\xb5\xca+\x1a\xed\xdd\
-\xb8\x92\xcc\xd4\x03\xf4\xe8\xe5\xb3%cB\xc5\xe7\x8a\x16\
-O\xda]\xae-\xb2_\xb7&h\xe2a[\x96\x8b,\
-\x15X\x1f\xf1\xc6\x97\xcd\x9c\x1a\x8f\xbb`}\x0d\xab|\
-\x005\xe9\xb95\x93\x1eW0\x96\x08\xf5\xb7A]P\
-\xda\x1e~\xd2\xee\xf6\xae\xa7\x91\x05E\xc96c\x8a\xed\
-\xf5+V\x91\xbe\xf9\xae\xf0\xf3\xb1\x86\xfb\x0e\x1d\xbd%\
-\xf1\x8b6\xbf\xf8M\x9c\x09\xe4\xe6\x15:%\x03n\xd5\
-\xe9M:\xae\x0ei!\xfe\xd0\xc6\xa6\xbaO\x166\xd5\
-]u\x8a\x7fN\x15lP\x0e\xb5\xc2\x97\xd4\x01\xc5g\
-\xae\xc5\x15\xe4h|\xc2O\x97)G\x18'sL\xf6\
-W\x93[\xfbL\xe0tc\x13\xdf\x00\xc4j\xf2\xc9&\
-\x96\xf6\xcb\xbb\xb1\xce\xe8\xf8\xd0\x90\x90\x87\x8cq\x94\xe4\
-\x5c\xe7\xe11\xe6I\x8d\xcc\x03y\xfa:\x0f\x19\x0f\xe2\
-\x8c\xeb\x18\xe5\x9f\xd3\x16[\xd5\x146\x961\xba\xe1\xd6\
-\xf0\xc5\xc4\xe7\xb4\x85F\xbd\x85-y\x16\xbf\xdc\x0e?\
-:\xf8\xac\xa6\xe4]wak\xd9w\xdf\xdc Hn\
-\xd7\x181\xa4\xff\xd9\xc3{4\x82\xb3\x85\x16\xe1}\xd0\
-\xeeN\xaeo\xce\x7f\x0bB\x1e\xdd\xbf@\xb9E]\xd4\
-,c\x0aG\xad\xf7\xcb\xac\xf0\xcfa{\x9a\xa71\x83\
-\xe1\xaegy\x19\xf2\x8c2\xb3\xa9\xcf\xe3c\x1b\x9b\xe5\
-1/\xf8\x22~\xa6\xe1*\x0cG\x9c\xed\xca\xf8M\xfd\
-\x87`\x00\xdd\xcf\x15 \xc0\xc1\x80\xe6\x5c\x8fE\x041\
-\xec%\xd8\xf9\xf5\xb8\xdbk_\x8e\x86\x8f\x18\xf4\x1f\xc9\
-\xd8\xe5A\xd8m\xddy\xfc\x85\xc3\xff\xe4$\x00\x9b\xc6\
-\xad\xf2v\xd3\xe1\xe5\x98\xf0i\xd3/\x84\xc3\xeb\x8en\
-\x86\xffv\x03\xa4\x84\x85\xc3c\x14\xf8\xf3\xd7\x9eLF\
-7\x8f\x1a\x1dQXe&\xa3C:Sm\x16x\xda\
-\xb3\xf6p\xb3\xb4\xafN\xe3\xf5R\xa5\xfeM\x8d,>\
-\xaao\x0e\xe2\xeal\xf4\xa2w\x9bvKObu\xc4\
-\xb0h\xf2_\xda_\xdf/\x9f\xae\x03\xc5-D\x91\xca\
-\xe4\x15!\x09\x0e\xb0w\x17\xbd~\xbf\x11\x89\x86\x84\xae\
-\xeb\x225\x9b\xb4\x87S\x10\xf8\x07\x8d\x88~\xf6QU\
-\x1f\x95\x1d\xf7\xcf\x8c<\x8aU\xe1\xa5\xee\x979=^\
-\x99\xa0\xc8\x89\xa5\xda\xa8\xa6\x98c\x10\x95/\xd7g\xf8\
-\xa4\xa0\xbe\x8e\x8a\xd4\xcd\xf5Yx&/\x17N^\xcd\
-\x9b\xb0\xa3\xca-M\x98o\x17\xe7W6F\x8d\x97\xba\
-\xc3\xbb\xddlo\xb1x9R\xb5\x95\xc3@\x0e:\xbd\
-\x83\xccL\xc6'H\xcbC?\xb6\x96\xca'\x0a\x5c:\
-\x82e\xc2\x9a#$\xb11\x9cWF\x80\xee\xcb\xa5\xc5\
-\xbe7\xc9Xy\x0b\xa89ND\xbaj\xb2wG$\
-8\xe0\xd1o\x9a\xf8#\xc1\xe0z\xd5C(\x14\x88L\
-\x13\xd5Vj~<\x1a(&\xef\xae~\xfbr\x5c0\
-\x09c\xc4O\x1d\x90WW9b\xc2\xd5\x07D\x96C\
-\xeci\x00\xa7v\xad\xf6G\xc3\xcbn\xef\xe3\x12H$\
-\xf4$\xf8\x92wL\xa8\x91\xdf\xcd\x22\xce\xd4\x5c\x0aq\
-T\xc7?\x02u\xa7\x16u\xf5\x95v\x08\xaf\x994W\
-H\xa7\xf0C5(\x18\xc4;\x8e\x81\xb1\x89\xa7\xa2\xce\
-R\xe2\xde\xbf\x1b6s\x03\xaf~\xb5N\x18\x0a\xd2\xdc\
-8LsAX<\xaf\xca\xd4\x04\xa7\x0c\xd7\xbb\xf6\xdb\
-\xea\x9c\x91\x07\xc6\xd6`\xb0\x9e\x18[&cz=\x88\
-\xbf\xab\xd6\xb7\xa2Z\xd4\x18\x98\xfd\xa1\x1eW')\xf9\
-~-m\xbc\xad\xd6\xbe\xd8PQdn+?^f\
-\xee\xc6\xe9A\xd3\x8c\xb5\xf2\x90+\xd7\xae\x80Usa\
-\xc5\x86)\x82\xbdW\xc7%\xd2\x81\xaa\x08\x95\x9dq\x13\
-\x91)\x91YJ\xe6w\xf6\xd1\x02YX\xf1\x0eU\xe0\
-\xc1\x9b \xf6\xf9u\xe8\xae\x0bX\xe4\xef'\x0f\xe9\xb8\
-[\xc8\x80\x9d\xc6\x05[\x01\xfc\xe4\x1d/b\xce[\xe1\
-\x08`\xce\x16\x13K0\x10G\xae\xf4\xbd\x06\x02\xc6\xf4\
-\xfd1\xfc\xb6X\x96&\x9c\xd7~\xd0\x16\xda\x9d\xa8n\
-z\xc1H\x1e\x9d\xbf{\x08\xc9d\xc0B\x8e9\xcf\xdf\
-U{SQ\xee%\xab5\xaa\xc5<\xc5\xea\xa2\x02\x0e\
-S\xe0\xbf\xac\x8a\xab\xd7\x8d\xd7\xd6\xb0\xf84\x9dm\xcf\
-@\x0e;\xbf\x9e\xa5\xd0\x00]r\xf5\xd0=\xcd\xc5Y\
-\xaf\xeb\xdd\x1f7\xed\x80|\x9f\xef\xe7\xef\xd0\x13\xf8;\
-\xbc\x18(\xea\xf8\xfd\xbd(\xf8<Uw\xc1[\xcaG\
-\xdd.H]\x9f{\xbd\xa0\xbb\xf2\xaf}\xbfp\xf8z\
-g\xfbp\xcf\xc0\x1c\x8e\x80\xf4{\xbf\x92\xa2\xae\xf9\xa0\
-\xad\xf8\xe3]\xc8N'\x1d\x13\x11\xd2\x89{\xf7Q;\
->j\xf7%\xde\xf2\x1f\xf5\xe0\xd0\xf3\x058\xe9H\xac\
-\x0f|^\xe3\x98\x84\xd1w\xe4rs\x1b\xa3\x14\x0d[\
-1\xdb\xd5\xe3z\x01g\xdd\x0cn\xff$\xbd\x15\xfbS\
-\xa6\xf8\xea\xc5d4\xd8\x91\x90\xc3%\xaa-\x10?U\
-\x5c\xa3\x84b\x96\x02~\xd8\x9d\xe4\xe0R\xa2G\xe0\xcf\
-\xc4\x99\xaf\xef\x0f\x7f~\xb3\x7ff\xc7\xd9\x927[\x8f\
-(\x91\xdc\x01Dc\x98\xde\xac\x1c\x0c\xda\x97\xa9Xo\
-5\x22\x5c\x9ex\xdd375\xd2\x7f\xa3!\xd2~\xe1\
-\x8d:\x80\xa0\x95<zr\x11\x93\xabLi\x8a\xf3\xba\
-\xa8\xf8\x1eEB\x0e\x96\x86\xee:s\x9aYit\xff\
-\xcaW\xb6\x81\x0ec\xf4\xbe\xd7\x7f\x8b\xb4?K\xaa\x8d\
-\x06*&\xdd\x93\x09!\x89\x1a/\xf1b\xa9\xfe\x02\xbd\
-\xc26^\x1e\x02\xc5>ow_\x12\x06\xa3\x16}\xac\
-0>\x1b+\x7f\xaeG\xca!\xb4\xb8\x89\xd7\xc1\xfa\x1d\
-\x8a\xfe\x8bW\xe1\x14\xdc-\xfa\xfa\xe9\x9fyp\xd5m\
-\xe2\x80tuMW\xc8E\x0f]\xc86g<\x1a\x97\
-\x04\x1b\xfa}1\x96\xe17\x055\xf8\xbf\xbaCG8\
-\xe5\x05\x86\xd1\x90\x85\xd6\xa7\x9a\xe3\xa3\x97\x09\xe8u\xc3\
-\xc1*,\xcd\x86q3>Sd\xaf\xe6$\xcc1\xf4\
-\xa9\x17\x14\xf2\xca\x8f\x03I\x02\x97\x83\x7f\x02\xb2\xd6\xd2\
-\xfb~.\x97\xb1\xd9\xa7xr\xd8\xdfO\xf6\x9b\x14l\
-\x11\xdf,\x9e\x06\xef\xd8n\x00\x14=)\x9c\x9en\x9d\
-n\x9c\x9e\xae\xef\xef7j\x12\xa1\x11M\xc4\xf6\x83\x85\
-\xae\xa0j\xe1\x0d\x5c\xf3\xfe\xfe\xd6\xfe\xc6\xfe\xfe\xfa\xe9\
-i\x03\xfd\x962Y\x04\x04\x8d\xd38c\xff}\xea\xc0\
-fe\x8e\xfd8c\x13\xbe\xaf\x09\xe4\xa3vm\xe6[\
-\x9eW\x16\x5c\x22r\x11\xea\xb7mq\xa1\xf0\xa2\x03\x0e\
-_U\xbcPZ&\x80\xf1<\x1f\xd3\xfc\xf7}\x0b\xac\
-|N\x90\xb1\x11Sz\xdd\xa1l\x84\x0c&!/\x82\
-\xa3\x8b\x15\xca\xe6\xe0U\x00\x90\x88\x05\x97c0lW\
-m\xc2\x7f\xee\xefqQ\xdb\x06i\xf9\xbaOM3\x85\
--?(E\x1cq\x1de\xe3;\xe2\x89\x8d\xbbG\xdb\
-%\x10\x07\xf8\x5c\xb9\x81\xd9\xf1\xbf\xb4\xd4\xd0\x5c\xf6E\
-\xd6\x02\x01A\xc7\xb7*9\x0f\xbcc\xfd\xfa\x94\xfd\xc4\
-#]6\x0b\xdf\xa3~\xa6H\xe0\xed\xe4\x0b$\x05\xed\
-+\xa9\xc0\xa7\x8d\x0em\xbc\x84C\xfaF\xa9\xc8\x04\xbe\
-\xa6\xee\x90\xc4\x1b\x8e\xb7\xcd\x02\xb7\xecsq\xf4\x9e\x0b\
-\xe9W*\xf4e\x12\xb3\xefjZ\xdcG\xd6w\xb5\xc5\
-\xe7\xd2^\xac\x17\xba\xb1\xc6\xfb\xe8\xbb9?\xe4\xbd\x9b\
-\xfb\x22\xd31\x13G\x09\xf2\x08@7\xae\xac1>\xfa\
-r'\x7f_\x1c\x13@~\x8f\xd5x\x92\xea,\xfe\xc9\
-)c\x9b2f\xef\xe4\xcfu\xe9c\xe7\x0b\xca\x9b/\
-)\xfe\xc6O\x18[\xc2\xf2f\x87\xe3\xc9\xf1A\x15i\
-\x10\x0a,t\xf0\xc9\xf4\xdf'\xff\x83J\xbepC\xa7\
-\xc51\xee\xf70\x90\xa5v\x8e\xee\xbc\xcapJ\xc5\xdf\
-=\xd9\xd2\xdbl\xa0x\xa3\xae~\x07w\xe8\xd3\xdf\xec\
-\x0e]\x15\xfb+_\xc5,`\xb9\xffL\xdf\xe2\xaa\xf4\
-\x87\x05\xad\x88\xff\xdd\xfd\x95wo\x13^\x04[\xd3\xf2\
-\x98\xa4\x95\x06\xaf\x01\xf8~\xe3\xf8fl\xd4\x9a\xee+\
-\x1c\xd7]M\xf7V\xfb\xe6\xbf\xf5\xa2\xf5\xb0\x0b\xf4\xf1\
-\xfd=W(\x8e\xce\xe5\xf3\xb79<\x07\xf9\x91\x1c\xdc\
-@e\xf0oL\x81\xce\xc9\xf3\xf3\xfd\xfd\x1bJ\xe86\
-\xb9\x15\x0a0n\x9a\xb9\xa2\xa5O\x81\x92\xb8O\x14A\
-\xdcdw\x89\x11Pd\xa7\xebJ\xb7R\x0a8N\xef\
-\x96}\x07\xe9\x7f\xb4St\x98\x06\x98\x9aL\x5c\xcb\xe3\
-\xeb\xf3\xe3\xebq\x89\xd8\x229\xff\x01\x9e\xc6n\xaf%\
-\xa8\x184\xab\xa6q#Wl\xfcz\xd8\xffT\x0a\x80\
-\x030!+\xdf\x90\x94\x90\x96n\xa9bA\xde\x96\x10\
-N\xa6\xd0\x1bJ\xa5\x7f\xc7%\xcd\x9f\xb1\xb0p\xe67\
-D3\x0b\xfa\xc9E\xa9\xe1P\x11(\xa0\xe76\xd8\xb2\
--(\xedb\x1b\x7f\xb4\xcb\xf4E\xde\xd1\x91<\x5ch\
-\xcf\xaf\xbaK\x8a\x1e\xd4\x9b\x0c\x14\x81<fFM\xbd\
-\x8fE/\xbbL_\xe4,\xbd\xd81z\xd6\xcb\xba\xeb\
-O]\x0f5\x074\xf6\x81\x1eM\x89\x8f\xa2\x84\xfc3\
-\xbe?\xf0Ma&\xbc\xac\xc8<V\xf4\x0d\x0b?\xa8\
-\xfe\xd6\xb1\x8e\xb4\x0d\x1f\x0b2\x8b\x83\x14)\x11p\x16\
-G$RV\xf0)\x04\xe4l\x17v\xbc\x18\x96\xea\xd5\
-\x9d\xf4%N\x12\xc0\xb4\xec\x95\xcf\x1b+G\x12\xcbf\
-\xcb\xe4\xa1\xa9}\xc9\x91\xcf\x82`cW'w\xae%\
-:c\x17\x8a\x87\xbf4\xb9\xeb\x81\xcct\xd3\xa8\xe1\xc0\
-\x1a\x1a\xfb\x0d\x0e\xfc\x15\x8a\xe9\x0b]\x8a\xc8\xbf=\xb6\
-\x8ak?jREU4H\xc5\x1d-\x1a`\xe3<\
-\xaf\xb85;\xaf\xa8\x04\xb0\xc5\xa7\x17\xd2\x9eKR\xb9\
-\xac\xf8\xd7\x0dHO\xd4\x86 \x9c\x9b\x11\x8c\xda\x98P\
-S_\x8e\x07Q\x94)\x89\x97\x03\xd6$\xbe\x7f\x8e\x8b\
-\x01\xc7\x1e\xe0\x8d]\x7fX\xb9\x1b\x97\x87c  \x8e\
-\xb0670\x0fG\x84\x80\x1c\x17\xd3\xe3\xb6\xdb\x99\x1b\
-\xd9\x91\xb0)/\x1es\xdb\xed\xc9\x0ds+\x81\x12T\
-\x94\x93\x9b\xb9&\xa1\xb55\xfd\xcb,NMA&k\
-\xecgiN\xe0|\x04\x00\xc6.\x80\xa9\xc1\xba\x8e<\
-\xce\xc4\xed\xa4K\x12\x07qwr\xac\xe1U\x8b\xd3\x9c\
-\xe4'\x5c\xb3\x18L\x04Aw(\xee6\x88\xb0\xb4\xf0\
-\xebP\x8d\x9fUB\xa6\x90pU\xf0\x8b\x9f\x07\xa3,\
-\x1bH^\xe4\xc9 *\x13\xc5\xf1\xe1K\xcae\x0b\xfa\
-\xf1\x9cx\x1a\xd0N\x17\xf1[l\xae(\x80\x82\xd6\x9b\
-D\xcc\x85%\x99So\xf5'\x1e\x10ip\xae\xa2\x12\
-\x0fN\xdc1\xca\x93c\xb3\xa0\xab\x185v\xf58\x91\
-\xfa\x0cee&\x8d\xbdD\x0a\x8d\xdd\x9d\x93l\xc8\x07\
-\xe2;\xa4\xed\x8b\xf6{\x8c@\xa5#N\xcd\x1d\x0b\xea\
-,\xb2\xd0&\xa4\xa6\xba7\x18\x15\xf1\x82\xd8\x10qh\
-\xe7\x1c\xb2.>\xcfn\x0c}dg\xaa\x09\xc5o*\
-\xf9\x22\xcd\xac\xc3c\xdf\xf1,fL\xac\xc9X\xc6\xb6\
-\xab{\x83\xb6[M\xe4\x17\x88)\xba\xd2\xc2=y\x06\
-G|\xf5$\x96\xd3\x11\x8et\x0b\xe7\xc4\xbb*$\xff\
-\xc8\x0d\x9aj\xdf\xa5-\xfbFF\xb7\xc9m\xa3H\x00\
-\x04to\x08\x03\xf1\xdc\xa9S\xec\xca\xbb\xb7\x8d\xbc\x0f\
-K\xc9\xa4\xb3\x81q\xb5\xdc\xbd\x99\xdb\xa5\x96\x89\x05\xea\
-\x1f\xab\xef~\xe3\xf9\x1fgJs\x04\xd9\x1d\xa8\xca1\
-\xbd\xb9\x0a\xc7\x97\xd6y\xe2\x0d\xc1\xc7\x8b\xcedw\xbf\
-J\x7fzH\x95\x86\x16d\x9ekAT\xba\x16n\x07\
-\x06d[A\x96U\x006\x16\xdf\xc3:\xd4\x94\x19\xe5\
-\x1f\x14\x90\xce\x86\xd2\xc9\xf9g\x91\xd8{\xe3`\xd6\xd8\
-\x8b\x01+\xa2\x9cs\x19\xed\xcbtwK\xc4\xd7q\x03\
-\xeb\x04\xf5SS\x8eOGa\xb6T\xe0\xe0\xea\x04S\
-R9y\xda\xedZ@\xb0\xbe{8\xe2\xd1r\xa1\x8e\
-\x96\x88q\xc4[z\xe102\xc1\x8e2h\x86\xe1\x04\
-\xb0\x5cpZ\xbc{0T\x91\x8b\xd2\x87\x83p\x95?\
-\xfaa\xb7\x96CI\x99\xa3\xa3\xddR\x9c\xdb\xc7\xa1\x07\
-\x81\x1d\xc3\x88\x07)h!U<\x12\xd9\xf6\xbca\x11\
-\x9e=x\xdc\x89P\xf2`\xc7<\xb8\x90!\xc94\xd8\
-=jh\x9a%i{\xda\xcb\xf4,w\xec\xbb\x13\x99\
-\xe8!\xca\xf6\xc0\xc2\x02B\x18(\x18e$8\x947\
-<\x94\x10\x8ey<a,\x17)\x18|\xcc?\xa6\xcb\
-!\xaa\xe6\x83yE4IK\xa0\x83\x09{Z\xa6a\
-i\xd2~\x04\x82\x04\xf47\xd2\xb6%\x8fb\x8cgi\
-{\xb9\xa8a\x0fE {\xec\x0d\x99{w\xf4\xb9\x17\
-e\xde\xfd\xd3\xbf\xc1}\xd9\xf4\x1f\xe9j{\xd9k\xae\
-\x85\xb7\x5c\x0b#\x9b}\xb8\x1e\xa1\xf7\xc2h\xa2\x7f\xa0\
--\x83\xd8\xaeh\xdb\x99\xab\xf6\x94\xe0\x0dx\xbc\xb6\xf6\
-\x97\xe8/6\xae\x17'\x83\xd4\xee}'\xd1\x7f\xfc\x1f\
-\xffo$\xfd\xb6uL\xc2uL2uLL\x1d\xff\
-\x03\xea\xa0\xaa\x92L\x83t51\x1c\x91 \xecd:\
-#\xb0O\x90\xa5K\xd0$U\xf6?\x1c\xf8\xc9\xa3+\
-\x9b\xd8\xcaX\xfd\x9d\xde\xce\xfc\xae\x95\xad\x82B_\x8a\
-\x94\xbd\xc2\xcd\x82[zke\x84\x95\x06\xec\x89\xd4?\
-P\x1d\xf6X~\xf0\xd9L\xe0\x9f\xbb\xf2\xd9\xe3\x9c\xdb\
-2\xfb\x86[\xeae\xff\x9b\xc3\x83\x93\xf0\xf3iu\xb8\
-\xfd|\xef0\xa9\xd4\xd5\xf3\x83\xefw\x0f^\xee\xbdJ\
-\xea\xe9W\xcd\x07\xbd\x98\x86\x5c\xc2\xb1Jl2\xba\x99\
-6\xceZ\xaa\xdf>\x07\x09\xdf\xfcJ\xbb\x8d\xd5\xfa\xbc\
-\xf9\xe0Sz{+\xedy\xa7\xa4\xca\x1d\x17\xfd\xd4\xb7\
-\xd0\xb1\x8b2\xf4\x99\xcb^_7c\x1e\x8d\x17q0\
-s\xc3\xdd\xcc\xfb\x89\xc42\x0bySg\xd4\xbf\x1e\x0c\
-\xb5M!\x8c]\xff\xe4\x0c\x5c\xa9h`BY\xf6\x83\
-3\xb5mb\xfa\xe1\xba\xdd\x17x\xfd\x89\xe0\x06\x10\x1f\
-\x88L\xb9\x0e\xfd\xf3b\xd2\x1e\xa4\xfa\xaf\xadX\xb7\xae\
-\xab\x9e\xf6\xba\xc4/{C\x9e\x0e\x03x=M\xd9\xc1\
-d\xe4\x07\xcdY\x10\xdcOT\x953\xc7\x0d\xc0\xba\xb3\
-\xceu\x0c\x17\x7fg\x80\xb9<\xee\xfd\x0a\x98b\xfc\xe5\
-Uy\x97\x8e\xe9n1T\xbb\xfb\xee\x1a\xa6)\xed\xf7\
-\xb30\xc2\xb0\x08\x0f\xe8\x97\x8bf\xd9{\xa5-\xdd\xa6\
-\xd7;.\xb4W?\xe2\xedG\xaf\xea\x9c\xffs\x9e\x0b\
-\xf2\x06:]\x0c\xa9\xdd]\x07\xba\xcb\x9d\x91\x15\xe1\xb9\
-\xef\xebv\x0fi\x8a\xf2U+\x87\x0c\x17>\xca\xf7u\
-g\xf20\xff*\x91G\xf5\x9czR\x11]\x92\xbc\xa7\
-O\xe4\x19\xbdNu1t\x7f\xcf\xda\xcd\x1bvi\xef\
-\xba@\x0f\xc7\xc9\xaao|%\xea\x99C\xae\xf7(\xa1\
-\xa4?\xfc*D\x93\x99\xe5K\x1e\xda\x89?\x1d\xee\x0b\
-\xe5\xbex\xfd\xeadw\xfbd\x9b|\xf6\xef\xaf\xcb\x88\
-\xcd\x8aP\x87\xbb!\xc0\xdd<\xe0~\x02\xdcm\x17\xff\
-9\xc5\x7f\xfe\x8al\xb4\xa7\x06\xc4\xa4\x1epI\xcb~\
-\x00F7\x89\xeb\x8aV\xa1\xd7\xa2\xd9\x04wv\x0cb\
-\x81\x1a\xb8\xadZ\xa3Ro\xeeCfr\xb8\xafv\xe9\
-\xef\xae\xe1\x82\xef\xe0\xa0\xfa\x92`\x9d6\xca\xd3\xe6\xbb\
-\xef^6\xdfa+\xec\xf2\xe4\xf4\xec\x1d\xfa4\xc7?\
-\xd0\xc5\xf4+\xf5\xee\xd9_\xe1\xfb\xaf\xc9;\xf1wK\
-\xeeHt5g\xef*Sq_\xde\xe4\xf7\xff\xcf\xf6\
-)\xe0D\x89\xba\xd1\x91\x93\x0a\xfb\x04x\xb6\xcbY\xbb\
-&\xab+Y7\xcf\xdcf\xc5\x13\xc0|nC}\x1a\
->\x17\xdf1\xf1\xed\xef\xa2\xe7\x0dz>c\x03xJ\
-\xb8#\xfcT\xfb\xb1\xda\xdd\x0d\xe6\xec\xc6\x0e\xd2\xf7\xb3\
-\xc8\xa6~\xef\x0b\xfavw\xe7\xd2\x5c\xb2/\xcbq7\
-\xd9\x95_h\xfa\xc9\xbf\xfe\x9a\xfc\xd5\x92\x97\xe5P\x8b\
-\x08l\xe7\xf8\xcd\xf6\xce^B\xbb\xad\x1e\xa4\xb7\x0d\xc4\
-\xea(\x00bw\x06\x10\x91\xb7\x0f\x0f\xbe\x7f\x15\xaaB\
-\xe2\xd5\x1e\x05\x00\xf4\xae\x03\xc51\x5c\xc5q\xa88\xed\
-\x1bP<\x00\xa0w\x15(~z\xb0{\xb2\x1f*.\
-a\x02\x8f\xa4\x7f@\xec@\xe7@\xf0\x82+ B\xfe\
-\x85c\x11\xec\x03\xd9\xda)a\xd4d\xe7\x85SqR\
-B\x86&&\xd7\x9d\xdb\xa3`EG\x0b+:\xf2+\
-jz\x9d\xf9\xee\xafM\xe9Gu|=\xbd\xd2\xadz\
-0\x95\xba)J\xe3\xd7E\x13,\xcb)\x5c\x96~\x9f\
-y@NY\xc2\xbd\xdb,'pQ\xfa}\xe6\xc18\
-Eib\xbcf9\x85\xcb\xd2\xef3\x0f\xc8\x96\xf50\
-\x06|A\x90\xc5E\x055G\xe1\xd1\x1e\xf9\xa3\xc5\xb2\
-\xceh\xf9\xf7\xd9Qx\xb4G\xdeh\xb1\xa83Z\xfe\
-}v\x14\x1c\xad`\x11\xbe\x93\xa8\xef\xda'\xf5\xba\xce\
-\x85D=\xde\x8a\xf8\xfdy4\xe1\xa7\x1d=\xbcQ\xc1\
-^\x16\xf2WTm\x0b\x09#\xad\x00\x15#\xcf\xd3\xcb\
-\x07X\xd5\x91\xc9s3b\x02s\x97!v\xd3\xa9\x88\
-\x17L\x16\xa8i!\xdc\x99sR\x19\x17\xe6\xfb,W\
-\x00q2\xc7\x91\xbc\x08\xf0\x0dW\xf4\x8b\x9b\x9b\xab\xc9\
-\x0bw\x16a4^!\xc6\x03\x8b\xdb\x99\xb2\xb1b\xc8\
-\xb3Z\xcb\x0d\x19\x1dZJ\x06\xd0\x16\xaa/[\xa8\x8e\
-\x85\x5c\x833\x873\xd9W}x\xbd\xb9q\x89\xcf\xfa\
-l\xda\x0a'\xc0\xe9\xd7=\x11\x0b\xdbZ\xaa\xa8=\xb2\
-_\xf0\xf5\xd8j\xcd\x17\x1d%\xa4\x0c\x13\xe4\xab\xd7\xaf\
-\xf6\xb6\xe4\xad\x97\x0b\xd4\xc8\xd6\x91\x95>\x83x\xb48\
-\x0b\xa3\xccE\x8f\xd7\xc0\x96fF\x7fm%\xa6\x12\xd9\
-B\xce^\x9a4(\xd8\xb0\x806\xbb&\xdb\x01\xa5\xf2\
-/H\xf5G)\x9b\x9d\xec\x5c\xfcG\xd2d\xab:r\
-\xd3\x84\xfd\xf3\x1f\x0d\xc7iGn\x9a\xecC\xfcG\xc3\
-q\xda\x91\x9b&\x1b\x0e\xff\xd1p\xd2\xc8\x91\xd7\x8a\xd0\
-2\xff1\xb7~\xe6P\xb0h[>z}z\xecl\
-OJ\x06\xeb\x8e\x5co\x9cn\xef\xf5^\xedbC\xef\
-\x9f\xee\x88\xf4\x9e\xedbHo\xd3.\x86\xcc\xe6\xe9\x0d\
-S6#\xb9\xec\xffkk=\xd9\xd43\x8c\xfd\xb6|\
-\x002H4:I(B\xbb:R\x87\xe2\xd6\x89\xdf\
-&\xf3\x1b\x0d\xbce}\x9e\xd4\x9a\x1e\x1d\x01ar\xba\
-\x8bJ \x1b\x13\x12\xd5\xdc\xc2\xbb\xa4(\xdd\xdc'\xf9\
-V\x7f\xc0\xefL\x94<\xa7\x97y\xe1\x163Q\xae\x9d\
-dL\x1b\x98\x15?O\xcc\xce\xbc\xb1)\x83a\x07\xa5\
-\x874H!\xda^k5\xbb8\x91\x13@\xa2\x01@\
-\xe3\xf3\xfca\xcfdk\x07X\xf7\xf7\xb2\x22\xde\x15V\
-i\x00\x88\xc77\x91\xa7k\xde-S\xd4\x8c1\x917\
-\xde\xec\x95(\xe6\xd8k\xd1\xc1\xac\x1b\x91\xd3Auv\
-\x16\xa1\xeb\xd1\xa8\x05\x88mj\x5c\xe2\xceA\xf3R\x16\
-y\x141\xc5\x13\xe5p\x87\xe7\xceL`\x09\xa7t\xd9\
--\x8d\x99\xea\xb9\x9dP\xca\xcb0\x14\x8cgV0\xe5\
-\xc8\xd1\x9dcEM\x8e\x152\xb1\xe6<Az\x1e{\
-H1\xd6\x14tLQ0`I3\xe7\x88\xfb{\xf6\
-f\xd3\xc8\x05\xed\x98\xab\x0e\xac\x5cl\x05\xb0\xcd\xa7J\
-:n$P\x8b<*;\x12\x8e\x04\x00@ \x8b\xe6\
-\xae\x84uy\xee\x8b\x5cB0%\xd5Q%\xb1\x8e\x10\
-\xd1\xc7\xc6Q0\xfc\xdc\x11\xd0?\xd5\xa8\x8f\xb9'L\
-P\xe8D`|\x0b\xbf\xf4\xda\xf3[\x96\xfb\x1d\xfe\x88\
-\x81\x8a\x8fxY\xd2\x90\xb44\x01[\x91\xbb\x10\xd8\x9c\
-\xcbf\x1a\x11D\xfc\x088\x9e\x1a\xf5\xc9\xcb\x1e\x81J\
-\xd5M\xa5\x0f]\xb0P-\x1d9DQ\xa1g\xfb\xac\
-M\xd3\xd8\xceF!mr7\x19\xaf,\xcf\x9d\xbc~\
-\xb3U\xda\xdf\xc5\x01\x12\x1c\xdf\x1cfo\xb0\xf6w5\
-\xa6\xfc\xeb\xa3\x08\xdd\x10\xc5\x8d|\xb5\xcf_\x9f\x9c\xbc\
-~\xb9U\x0a\x95\x91\x00\xed*\xd7\xaa\xe7\x08\x0c\x9b\x0c\
-\xd5\xcc1\xe0\x02}\xb6\xfe\xb4\x8a\xc6\x80\xb1\xea\x83\xa3\
-\x18\xf4\xba]\xd4&6\xf6\x81\xe6,v\x17u\xcfB\
-U\xf6\xa1\xd6\x92%\x00G6\x84i\xb6R\xdf;\xa0\
-\x01\xf9\x02\xb6\xb3\x9a\x1f\x93&2T\xb6s\xc7X\xc0\
-\x9ckvS\xf0\x08\xd0\xe5\x1b10\xfb\xe7\xf3\xccf\
-\xb3Q\xb4\xd9@\x86\xdecI1\x16\xde^\x1d\x1b\xb6\
-a\xe8\x04\xa8\xf65\xce\x94\xa6\xcd\xdd\xd0\xae\xda\xd4\xcf\
-\xf0V\xf53<\xf3\xd6\x93\xc5r\xf73\x91\xa7\xfcn\
-\x9a\x15\x9c\xe8\x13\xefC:W\xa5\x8d\x12\x10\xe1=\x13\
-\xd5}'\xc5\xc8\x10\xf7x\x9d\x88R\xe3=F\x06\x8c\
-K+\xe5Re\xebm\xb7\x1c\xc7[\x1b\xf1Vi\x98\
-\x8c\xdb\x93iz\x00\x9c\xfc(\xbd\xdc\xbb\x1dW\xbfx\
-r\x7f\x0f[\x91_\x7f\xa23\xebj\xc8\x81)\xcb\xf9\
-\xc1\x97\xeb0\xf9\xc3g/\xef\xef\xd1\x892F\x11\x1f\
-\xb2\x0f\xe4\xb8\xe1\xd5\xe5\xcb\xe5\x94&\xfb<\xf0~\xf8\
-\xaf \x9can\x87?)g\xb7\xf7\x9cn\x14@6\
-\xed3\xd7\xe7\xe5\xc4\xf5\x09\xeb\xec\xea\xb0\x8f;\x87\xa8\
-\xab\x846\xa6n\x82d\xd4\x84:\xae\xca\xdd\xb2\xd9\xb8\
-\x15\xceO\x0f\x16\xe2\xb0\x82A\x12\xa1\xd2;\xf4\x05\x08\
-0\xdaW_M1\xee\x1b%H\x8cq\xa3\x979h\
-t\x15\x0e\xa8\xd1.w\xe7g.NZ\xb6\xfaX\xf5\
-\x9e%C\xae\xd8k7\x8e\xe7\xc8I\x9fss'\xb9\
-\xc6N\xdc\x86\xf0\x83\x9a\x82\x1f\x95v\xa6\xb1X=_\
-*\xbac\xe5\xb9\x11\x8aN\x92\x13\xf9\xf5\x1c\x16\x95\xca\
-i\x87\x1f\x5c.\x22\xf7\xbaBpP,\xb5\x0a\x96w\
-\xf8,\xb9\xa6t8\xaai\xb2ZW\x93\xb4O\x1f\xde\
-[hM\xfc\x7f\xfeb#&%\x0d=\x9c\x89\xf0.\
-\xcb9<\x89FW\xd7\x00\x98\x84\xea\x1f8\xc6y/\
-\xaee\xfd\x22Jl\x97\xec\x99\xca\xbd\xd2 \xf3F\xdd\
-\x92\xd8\xcd\xe9;\x84t\x82\xf3U\xaao\x94\xfe\x0a\x0b\
-\x86\xa9\x10\xa4\x0f\x108\xe0\xa8\x8c\x12\x87\xe86\xde\xb5\
-\x921?.\x87\xban\x82*@Q\xe0\xc1\x11\x93\xc6\
-\xba\xea\x8f\x95\xdb=N\xfc\x03VF\x04*{G\xeb\
--\xbbX\x1a\xb5\xb8Q\xcbw\xee\xb8l\x05\x94\xa6c\
-\x03\x0d\xc8\xac\x1c\xc7<&u\x13\xcf\xb1\xe0\x8d\xa5\xa4\
-\x9bX\x15\x8c\xf1f\xeeb\x93N\xfe'\xa7\x01q\x1e\
-\x12\xb3\xd2\x1b1\x0d\x1c9\x8a\xeb\x17\xbd\x19\xfe\x193\
-z\x8d\x82\x1aEr\xcb\xa8\xa0T~H\xa4\xac\x15T\
-\xa2\xc0d\x08\xc7tr\x0bSX\xfe}\x177\x22h\
-\xca\xcf\x86\x04\x93kR]\xaa\xdc\x92n\x19(j3\
-\xa8\x01\xd4\xc5\x15\x82\xc0\x16vZ&]v\xd9`]\
-\xb1@C\xd1\xd5\xad\x1c\x99{:\x8f\xa5\xe3f\x96\x1d\
-\x9e\xba\xfcP\x02\xb8\xb4\xa7/\x00w8\x06\xee\xc63\
-\xb2\xd25\xb3\x12\xbb\xa4\x9cC^N\xa0\xb5\xb4h\x86\
-r\x7f\xcfml\xe51G\x9b\xbc\x0e\xa0\x5c\x80;\x07\
-\xc6\x004(q\xd0c\xee\x93\xf0W\xfb\xd6\xf9bK\
-_\xaf\xfe\xa6^M\xa7\xa7\xcfNN\xc5\x05\xc5\xedl\
-\xd2Nj\x8e\xbaUOU\xe6\x80\xf7Ng\xe0\x0e@\
-\xa5\xca\x89\xb3,\x09\xe1\xea\x81\x19=\x051\xaer\xaa\
-'7\xb9Q\x8bf\xf0&n\xe2tQSx\x85\xc0\
-8\x04\xb6\x85\x94\x8e8\x8e\x15\x8dcm\xcdN\x1d\x8f\
-\xa9{\x93\xe0r\x84!n\xd8,g\x84N\xa2\x1e\x1d\
-\xf4\x07\x93\xd1\x158\x1a\x19\xab\x07I\x0b\xfa\x96\x9c\x9e\
-\xce\xe7\xa7\xa4\xb4\xd4\xab\x07~\xe7n\x15\x8e\x92\x93S\
-\xc3\xb7C\xc1\xb0\x9d\x0b\xd5\xb1LU\xbdV\xd3\xfe:\
-8c\x90\xe9\x03\x8cMe\xee\xb2\xbd:=\xc6\x1d\x06\
-\xd4\xee\xc8\x88\x5c3\xf6Z\x0b\x15,Zl\xc8*Y\
-B\xa2\x9ffZ\xa7\xde\xc5\x81'y\xfaJ\x5c]\xf9\
-bU\x82\xf2$\x14\x9f\xb5\x12\x098\xcbRu\xa8\xb8\
-{Hm5;\xfcT\xa0\x14\xfd\x88\xeb\xb1c\x1f\x11\
-h\x1f\x01[N\x9a\x17b\xb9\x11\xed\x17\x14Y[\xcb\
-\x97\xd9'1\x9eyY\xec\x98\xae\xf3\xbd\xef\x02\xa1A\
-.\x80\x8d\x03\xa1\xe1,g\x87\xc0\xc9$\xd1\xd0\xe4F\
-J\x92\xe81\x9d\x9f\xa4\x8d\x04\x1c\x00\xf4\x84D_\xd5\
-lEr\x1e9x\xb5\x0bg\x11>\x958\xbfQ\xf8\
-\xcb\x95K\x0a\xaabwF\x19\xd8|\xf5\xdb?\x9c\xbc\
-\x0e\xd7\xab#\xdf\xf0#\xcbm\xd6\xcd{pv\xb4^\
-\xbf\x8f\xf7\x0f^\x9c\xb8\xbf\xb3\xf5\xf3k\xe8\x82\xaab\
-\xbb\x0b\xe6!\xc25\xe1\x99\x81\x1fc\xd0g\x88\x15\xe6\
-K\xe9\x98\x8fr\xd9f,6R\xfey\xba(\xd0C\
-\xc6\xc2CU\xbf\x89\xcb.#\xe2L\xea\x0cHw7\
-\xc6D\xa0{\xe0\xd0S\x96Y{\xe8f\xc0L\x1f\xa7\
-\x9e\xda\x93\xd8_~B\x8f\x0e\xbe\xdf?\xd9\xaa\xd4\x1b\
-\xf5\xe6R\x04\xa0O\xf2\xb3\x1b\xd8\xa0\xd7K<\xf8\xca\
-t\xbdD\xfd/K\x97Q\xf4\xa4\xefD'4\x02}\
-\xc97\xb8U\x12x:\xba9x\x99\xaeK\x86AJ\
-M&\xe1\xf4\x99i\xdcB\xe1\x91N\x17d(\xd3!\
-[\xa9\xc21\xd0\xaf\xf5d\x8a\xee9n$\x17\xc7\xe3\
-\x0d\x87\xcbV\x9c^H\xb1\xca\x94)\x09Uc\x0b\xde\
-`x\xce\xa0y\xbf\x97\x9d\x03\x9d\x0c\xcc\xb4\x7f\xe7<\
->(\x0a\xed\xe8\xb6\xc8\xee\x89\xc7\x12\xb2\xb4\xeaiS\
-+\x0c\x06\xe5\x98\xdd\x98 A=\xba\xdb\x11\x8b,\xe5\
-\x82h\x83\x92\x5c\x9a\xde\x81\x84^\x83'2\xd2-y\
-\xd5\x15\x9c\xd82\x06/\x15\xad\x9a\xa9\xf9\xd1#3\xb5\
-G\x8cx\x94\xf4\x1eA\xad\xb1\xdb\x9f\xa0\x95=?j\
-\xce\x83e\xcd\xb4\xc5\x9b\x82y\xad\xa9\xb7f\xfe\x1b\x95\
-\x97\xeb\x15\xaf\xb9\x88*\x8f\x1a\x11\xf6\x05-em\xeb\
-g\x5c_+\xdb\xc39\xdf\xaa&Ineo\x95\xf2\
-\x0f\x87x\x9a\x14:I\xf0\xa7\xac`l\x96#U\xec\
-\x22\x89\x1d\xeed\x96\xe4\x02T:%c\x1d\xa3\xd2\xa5\
-^\xce\x0fv(\xe3B\xd3\xe9O\xd9\xad\x95(\x9f,\
-#\xb5P#\x03=\x09\x1d\xc6\x92\xc5\xc7\xc8\xba{\x8c\
-\x8c3\xd7'\xdcHV\x02\x05\xda\xe3\x0cR6z\xd1\
-\xaa\xc5\x9d[|'\xa3s\x07n\xca\xc8\xd25\xcfw\
-3\x85\xc5\xb8\xc7\xf4\x9cn\x13*\x8e\xa6\xb9/~-\
-\xf0\xc2@\xd7\x19\x8e~\xe6a\xd7S\x84\x9e\x00\x83\xb6\
-\x85\x97\xd0P\xf2\x83\xb0\x1c\x8b\x13\xcc\x13\xcb\xa1\xdf\xb9\
-h\xda\x05\xd5\xcd\xc5\xa0s)\xf1\xda\x814\x07\xa9\x05\
-\x22\xb7\xab*\xb9\x91pbd2;y\x9c{\xaa?\
-\xca\xf7\xa4\xf1t\xa5}^\x05\xecr\xe5\x91*\x0a\xd7\
-g\xad\xa6\xc0\xb1\x0a\x93N\xe6\xf0\x8b-\x1f\xa8\x93n\
-\xbfe50\x18\x87\x0a\xf4\xa9\xba\xd0\xec\xcd\x5c\x9d\x15\
-\xf9\xa9\xea\x19\xdc\xc4E\xd6\xe7A\x0bpD\xbeXU\
-\xfe\xe7\x9e\x03\xbb)\x87\xf6d^ q34Q\xf4\
-;\x18$\x9brT\xcd\xa0\xc4:}\x04f\x01<\xc0\
-\xab-\xed\xa2\xa2\xcf\x99\xf0\xfa?m\xc2g\xdd\xc7\xcd\
-t\xde\xd9k\xce\xfe\xdc\xa0 (jy\xbe\xb5\xf9\xe5\
-\xeb\xe4z\xa6\x9f\x8f\xf4\xa6{\x83s\x8c!4\xbdJ\
-\xbb\xa5\x98\xcfk\x83\x914\x07\xdb\xe5\xcb\xd7\xe2= \
-\xe3au0\x12\xd2k\x0f\x8f\xf9\xa8\x08gQ\x91J\
-\xa2\x98_Fk'vpHm\x84\xe0\xf7M\x98\x11\
-4\x94)\xf9e\xf6\x8d?\x0d\xf1\x03\xc2]\x03\xb1\x02\
-\xaa\x227W\xf0\x1b\x9d\x81E\x0a\xe7\x16\xbb\xd4\x1b\x92\
-?\x0a:\x12\xe7\x8b\xee\xefJ\x8c\xae2[\x11c\x91\
-}\x13\xdd*t\x98\x80\x0a\x15@l\xec\xef6'\xcf\
-\xea\xba\x87W\xeb\xc9D\x0c\x91\xe1\x17\xf0Q\xda\x03\xc4\
-\x9a\xd90Y\xfeVE\xd5Jd1\xebU\xf2\xb3\xde\
-\x85\x90l\xf4\xb9oCX\xb0\xfaw}\x1f\xf2\xf25\
-\xbb\xe7\x1d\x95\xe2\xeaiovU\xca\xdf\xd9\x8b[\x07\
-@\xea\x9b\xbdW\xdb\x87'?'w\xc3\x94\x0c\xb0\x1a\
-5X\x94\xe7\xc04\xdf7\xd0\xb4\xf8r4\xea\xf2\xd7\
-Ye\xb3Vk\xa9\xf3\xb6\xfe\xa6OD\x5c\x03\xed\x98\
-`b\xf9\x98R\xaf>y\x82\xc1\xcd\xcf{\x97\x8do\
-jP[:\x9d]\xb4;\xb3\xd1\xa4\xf1%|\x92\x98\
-%\xdf\x95\xbaN\xe0\xc8\xbf\x8dM\xfe\xea\xf7\x06\xbdY\
-\xa3\xae.\xd2a'm<\x05 r\x88\x8d\xbf\xe6j\
-\xef\xd5\xee\x8f\xdb\x87?\xec\x1d'w\xd8_\xea\x0c\x0b\
-\x10Q\xfb\x82\xc2\xc57\xedSC\xc3O\x98\xce4\xfc\
-\x9b\x14\x88f\xf6\xa9!\x83g\xa4\xd2\xab\xc0|\x8cy\
-\xab\x14\xe37\x96\xb4\x1c\x9a\xfc\x1b\xa4\xe7\x8bt2I\
-\xbb\xf7\xf7\x92\xc0\x7f\xf0a\x17\xb0J\x5cl^\xba\xb8\
-\xaa\xf0\xd32|\xa6\x19K;\x1e\x14\xed\x13\x18h{\
-\x9c\xd0s9\xa7jq\x1a\xc2\xd1zm2\xf1\x019\
-\xbc\xa1\xc5\x5c\x84\xf6+~)3\x8a\xe9K=vm\
-\xb2-(\xce\xbd\xdd\xd3\x18\x8cT\xe4c_\x12\xfa@\
-\xfa\xfc$\xc5d#^;W\x18\xb6u\x81\xc2J=\
-^\xe5\x85&1>\x10\xa5\xc4M\xee{\xd5\xef\x9fc\
-\x11\xf8\xfcho\xfbo\xc7'?\x1f\xee\xc1\x19\xeb\xc5\
-\xc1O~\x1a\xf0\xb2p\x05\xae\x97\xef\x8b\xdemf\xf8\
-\xc0'\x9cb\x82\x86 \xeb\xcc\x83\xa9\xea\xd3\x07\x9eS\
-:~\x8a\x96\xf2\xdd\xa0\xe4\xf5\x1690\xb2\x15\xa9!\
-,\xef\x9f\xe1?vl\x92}\xees\x7f_WDc\
-\x0d\xfaWn\xff\x1aws\x19Z\x83\xff\xcc\x95s\xd7\
-ml\xea1\x89Evu7\x17\xdd\x89\x0fr\x8cI\
-\x06D\x891.y\xd9\xc6\xeb,8\xf7$w\xe4\xd3\
-\xbcA\x97]\xde\x12\xad\x0aS\x22\xf7L\xa7\x0d\xd6\xc6\
-\xd0\xbf\xfa7\xec\x9e:\x1dYN\x03X\xc59FJ\
-\x18&\xabu\xd7\xf7S:\x03&\xf1\x1c\xeb*A\x8b\
-\xa2\x96]\xa5+}\xf8\xaeR=\xcf\x04\xc5f\x8e\xe5\
-Z\x15\x01\xa4c@O\xa6k\xcc9a\xe5\xfa\xef\x7f\
-\xc8i\x00\xb9\x05\xa11\xe2\x00\xe9\x98/~g\xe8[\
-\x94\xc3\xdcS\x8d\x0c\x03X\x9d\xf6{\x9d\x14\xe3\xc8\xea\
-\xa1\xd4\x1e\xc2\xbd\xad\xf4\xc19p\xda\x97\xb9\xc0\x94S\
-j\x9e\x8b\x1a\x84\xb0\xd2K\xb9\xe3\xcfL\x8c\x89\xc4\xc0\
-nx\xa6\x87\xb0\x16\xb1\xbb\x8bQ\xa2m\x11-W7\
-\xa8\xc8\x1d\xf6\xd8\xef\xc8o\xbd]q}P\xfa\xae\xa0\
-\x1d&(|1\x9f\x81\xce\xcd\x9dn,\xd4Tu\x1d\
-'\xdc\x99\x88\xa6\x0e\x11\xda\xcd\x06\xb8\xcaH\xb01\x1b\
-\x8d\xc9\xc5+\xc9\xb8\x22\x8c\x9e\x10Z\x18\xcb@\xd16\
-\xc3\x97Re\x1a\xb02\xe0#&\x87p\xa5<\xd15\
-\xbf\x1el\x0fbS\xbfY\x02;(\x8d\xc2\xc7\xc4\xf6\
-\xc1F@\xa0\xe62$\xdb\xf3R\x89\xee\xe2\x90\x1b\xb5\
-S\xf4\x0b\x86D\xa6\x89\xdc)\xa6om\x15w\x13\x97\
-2\xb2B~\x07\xd5#[\x95J]\xaf\x0e8\x9a\xa1\
-\xfb'*~Z\xe6jn\xf8\x13\x9d\x13q#\x9c\xec\
-\xfc<e\x08\xe4\x19\xe52\x1et\xe8\x0a@\xc3|\xa7\
-\xc9\x5c\xcb7\xeba\xceP#\xe54\xb6\x04l\xc0\xcc\
-\x9a(jr\x09\x0bQ\x8f\xd6\xaf2\xda\x1aG\x8cH\
-\xb0\x08\xc8\x7f\x9d\xf6\xacd\x91\x13+3\x82\x1bo\xb0\
-\xc5\x1c\xca\xa3\x0e=s\xc8\x90\x0c\x0a\xd6\xd6\xcc\xcfJ\
-\x05\xd8b\x931\xc5\x08\xde\xb2xix\xeb\x9a\x90P\
-\xea)\x1e\x05\xe6\xc7s\xa7\x0d|_\x04\x13c\xd8\xb1\
-q\x17/d\xbe\xb6\xc6\x03\x86\x91\xbf|]u\xc4,\
-\xf9\x0d\x12-\xd4t\x95Nz\x92,\x1f\x98\xbe$&\
-\xeb*K\xa8\xe8\x9c?<\xea\x1cvL\xef\x18\xdd\xc9\
-\xa9&*\xe0 \x9cgo\xff\x08\x15\xce\xa2vq\x92\
-\xa7\x0b?F\x87G\x1d\x8c\xf9r\xc2\xae\xc4n\xca\xfc\
-\xf7\x10\x1d\x84\xc8\xef#r\x16\xb2\xce\x1fz\x03\x97Q\
-yt\xce\xabK/\x04\x13\x04\x08S\x9dkKO\xf2\
-\xcd\xec[\xc2\x97\xfc\xdd\x8a{\x8fbg^\x22\xe1\xf2\
-|\x95A\x82)\xee\xf8gg\xe6n\xa3\xd5\x8a\x15q\
-T\xcau\x0f\xe2\x84\x0e\xe6\xa0\xe7\xf6\x92\xc4=\xb5\x88\
-\xc95\x95\x11\xca4\x0fq\xb3\x9b\xce`\xf41\xd5\xbb\
-\x8e\x0c\x05\x9b\xf5\xc6\xa3\xa3`\xb0g\x03\xb6\xbcY\xbc\
-\xc9.\xb9\xc1\xba\x9b+\x8a\x18\xaa\xfb3\xbb\x89\xe3\xde\
-\x0e\x9f\xd5\xf4S\xd6\xdc\x13Um\xec6}\xdf\x1b+\
--M\x0a\xdf\xe3\xd2\xda\xf7\x83\x15#\xc5\xfeId5\
-\x17*v\xc1\xd69\x87\x1fx\xff,\xb5\xfd,H\xfd\
-\xb9b\xcf\xe9\xd0-\xc1k\x97\xc3]]\x95\xa5\x0a\x1a\
-\xc9\xcf\x15]D\xefw\x0c47\x9a\x7fh3\x17\x1f\
-\xcdy^,w#\x14\xca\xcdI\x16\xa5=\xa3-p\
-_}\xb8G\x17\xbeL8\x5c}\xd6\x94\x16\xba\x97\x81\
-\x08\xc5 \xee\xfelL\x00\xf3.\xeaD\xaa\xe4\x11j\
-\xb0\xaeC\x98UY\x14\x82\xe2\xc4\xbd\xe6\xaf\x0e\xcbe\
-\xe7\xb9)\xf6\xc9[Z\x96\x84\xd8\xa2\xe1z\xa2\x8b\x8f\
-'\xe9Go\x821\xeaU\xe2N,\xe3E\xc4-\xb1\
-G\xae\x99\xfb\x9d\xe1\x16T\x96\xbb\xaa'\xb7\xda\x1f\x03\
-\xc9\x18\x85+\x9b\xdapE\xb8\xadlA\x5cb\xb9r\
-\x98\xd8\xc8B\xe6\xa0\xe2\xe4!\xe3\x03\x1e\xcd\xc3\x15\xa9\
-\x07\x8c\x0d8[\x8f\x03&}+`k\xd0\x08\x11\x96\
-T\xedx\xe5\xa53Fp\xf2da\x0fG\xfcr\xe9\
-s\xe6\x92\xa8\x0c9\x82\xdc=\x87'\xd2\x9e\x80\xbd\x89\
-t\x93-\x86lj\xe1D\x9a\xc3r\xae\x5cv\x22)\
-1\x07\xe5Od\xc8\x1a\x83G\xf3pE\xd6\xa2N\x98\
-Fd~\x834g\x8d/T\xb1\xe1E\xc8\xd6\xc2\x99\
-y\xa8\xb2F\x16{\x01\xeb\x87\xbc\x09\xce\xa3M&\x9a\
-b#\xb0\xf8\xe2\xb6\xc2m\xc8u\xbd\xde\x80\x8b\x18\x1c\
-\x95\xb9\xbf\xd7t\xb5\xc5\xc7\x5c\xe6\x96B\x98z[\xf3\
-\x08S\xf67R\x06\xe4\x99L/!\x10\xd4\xd5\xbd\xc3\
-\x83\x1d\xda\x8b\xa2\x06=#J\xf3\xf7;\xf8~\x97\x13\
-\xd51\x1f\x8d\xc3\xdf\x91\xb7\xd5\x891\xaa\xac\xc7y\xf1\
-\x05{xLG\x01\x06\xe5cA\x9d\xcf\x98\xe6#\xd7\
-W\x1d\x8cZn\xb8\xcd\xb59\xed\xecv\x93\xa7S\x80\
-\xbb\xe7\xc3\x81\xe8\xbbwM\xaf\x1f\x1c\xf7\xc7\xf4\xf2\xbb\
-\xa4\xbe\x15\xee\xa6\xbd.\xf0\xb0\xd6x\xc4\xa0@\xc2}\
-`(\xb1\xb2\x8e\x9dYr\x01\x99T\xeb>\x9a\xceP\
-\xf0\x1f\x95\x19\x07\xe2\xec\x8f\x18\x05k]\x96\x98\x0e6\
-<\xb0fn\xa6\x8a\xa5\x08Pq%\xf2\xde\x0c\x8b\xe5\
-.\xe8\xa82{K\x97\xbf;\x0a\x08rTSF\x92\
-\xa34\xdf$\x02\xe9 \x9f\x9aD\x91w\xfc?D\x8b\
-Ag\xc2`]\xf2\xd7\x96\xb3\xe5\xdf\x94]\x9d\xc3a\
-\x83\xeb\xed\xc0\x94M_\xe1\xab\xe3\xcc\xb7\xf3n\xf9\xe5\
-_\x7f\xea\xb0\xc7\xde\xb7]\x8ar\xea5~\x84\x0ac\
-\x07\xd1\xa6q\x89]\x15l\xfe(V\xb8]X\xda\x10\
-\x03T\x07\x06?\xb5D\xae\x9d\xa2M\xd2\x0b\x0d\x98\x09\
-\x17\x9a\x8f\x1f:I\x11\xed\xf6zO \x86 n\xc9\
-\x0d\x04\x81\xf5\xba\x5cU\xaf+\x13\xa0\x1fQ\xf8S\x1b\
-\xf22\xf5\xea\xf5\xee^a\x87A\xb0i\xba\x9d&`\
-\xfc\xc7\xed\xb4\xd1\x8d\x1en\x1f\x9fPn\x13\x7fe;\
-\xd9\x8c)?\x94\xa5@Z#\xa9\xff\xf8\xf0`G\x1a\
-\xe8\xf4GC\xa6\xc7\xd5\xba\xa1\xc6P\xe1\x84\x0a)\xfa\
-7\x97G\xafE9\xab\xd7-'Q\x05\xc8\xa0\x82\x8a\
-\x94\xde\xf0:\xadD\xe5\xa1\xcaY\xbb\x10t\xec,3\
-\x1fs\xf9\xc3\x0b\x87\xc3\xb5|emm\xd5r\x93\xfb\
-{/'wrxH?\xfe|\xef\xc5\xeb\xa3=]\
-\x0b\xd6\xb8\xb6\xf6\x88\xe2\xdb/\xd0\x96\x8a\x9f\x94-\xa0\
-\xcc\xe6\xc3\x94Ig\x89\xac\xb7/o\x0d\xb1\x06\x10F\
-\xef\x1c;$\xa9\x94M\xcak\x0ec\xe5\x0e\xd15\xe4\
-vM\x9f\x90g\x94\x1c\x8cj\xc4\xe0\xbc\x1fL_\x90\
-ui\xa84\xd9)E\x9e^\xf20\xa9\xf1\xe4[\xee\
-\xe1\x7f.f\x1e\xde\xb4\x22\x1bp\xf5\x9a[\xb9^\xc1\
-\xa1\xb8!\x1e\x10ry\xca\xe10\xfa\x08\xe4\x5c\x19\xb8\
-\xfcG\xd5`\x07\xd0\xd7\xf5t;\xd7\xcd\x5c\xb1=\xa0\
-\xd9t\xa3\xa6\xfe\x03u\x86\x019\xe7wS\x19\xaaU\
-\xd3\xbb\x03\x09\x0fH\xbfQ\xebe\xfb=\x02\xcauL\
-\xbf\x0e\xd8\x8a\x22\xc2d\xa0\xa9A>\xab\xe6\xbe\xdf\xae\
-7\xdf}7 \x0bx\xbb\x9bG\xd3t\x1c\x95\xdf\xb5\
-\x02\xb5r\x8ec\xf7q\xa0\x1f\xe74m\x8f\xe8J5\
-P\x98\xd2#~\xe5\xe4`\xfe\xc01\x05\xf9\x1d4\xa4\
-8\xae\xf7N\xed\xe2C\xc0\x0e\xef}Vk\xfa\xfe\xbf\
-\xb4\xa6N7~O\xad\xe5?\xf80q\xf0\x88\xd3\x84\
-G \xff\x98\x93\x85\x7f\xaa\xd0k0G\xab\xfei\xe3\
-\xfd\xe2\xd3\xc6\xfbG\xc9\xe9\xef\x7f\xaf\xd3F\xa6\xd3\x9f\
-q\xfax\xbf\xe8\xf4\xf1[G\xf5\x19\xa7\x0f\xbd\xf7\xa0\
-\xdf\xa8\xeb\xf1c\xf7\x1e\x94\x94Bq\x08\x7f\xd3\x8d\xd6\
-#\xb7\x22Y\xc4v\xfby\xec\xd6c\xd7\x98\xb3\xe5\xe3\
-0N\x831\x16\xb5L\xe0\xca\x1e\xdd\x1bO\x5c\xa8d\
-+r-\x06\xb35=\x82\xfd:E\x7f\x076l[\
-0w\xe1\xb1\xdd\xc6\x03\x8c\xd54\xef2Xe\x11\xea\
-\x1d\xa6\xba7\xf9{\x13\xe53\xe3b~\x9a\xe3\xbd\xbf\
-\x8d\xc1z\xdb\x9eC\xa5|\xdfb\xc3\xc6\x86\x1f\x8eP\
-\xe4\xd8\xa6\xcfQ\xb7\x8a\xe7s9nJh,f7\
-\x8d\x22\x16\x11j\x8dXE\xaeB\x97U\x14\xf71\xcb\
-2\x0a\xfb%,\x03\x1f\x97\xfa\x87\xe4%\x8e\x9d\xae\x91\
-\x8d\x8eh\x86\x052\x166\xb9\xa8g\x0e\x0c\x85<\xcb\
-\xc7Ps!\xceu\x84\x95\xad|P\x14L\xc6\xa0\x8b\
-\xe3\xad`\xc0\x94Fq\x98\x15\xe2`7\x89'\xb4s\
-4d\x0a\x22\x98\xb9k\xa4_\x90\xd3\xca\xcb\xfa\xdee\
-\x08\xd7Q\xfdY\xc7\xdf+\xa8\xe7|\xf9z,+\x0f\
-\x07\x83\xfe\x870\xf4f\x9e\x9dS\x81G\xb2\xf4\x87y\
-y\x8e\x8b7\xfd\x8b_\xc6\x1a-\xed\xe2U\x80!\x96\
-xFi\x91\xc3\x1f\xbe\xf9\xfd\x09\xaf\x81\x9b\xaep(\
-\xec\xcd\xe4\xe6\xf6\x92\xffI\xf8\xfb\xbf\x12S\xd7\x5cG\
-\xf9\xf6\xe2\xbc,\xe4N\xd8J\x8f\xf5\xf8n\x11\x8bj\
-\x06\xa2U\xe5y\x8c\x0dY\xa5\x82Q\x1a}HbY\
-\xc1\xc8\x8f\x198d\x5c\xba\xea<\x7f\xd29\xb1\x8e\x14\
-\x1c\x84@&\xe6\x85\xb9\x0a\x04\xc3R\x196\xa6\xe3]\
-\x05\x98\x8b\x13\xda\xfb\xa6\xecD\xf0\xfb\xc9\x09Q\x89\xb7\
-\xb8\xba\xc9EU\x9c\xbbU\x9c\xbbU\x9cC\x15\xf3\xff\
-\xda\x9c\xff\xd0\xcd\xf9A\xaa\xffw\xde\x9c\xb3\x14\xbd\x88\
-\x9c9\x12\xa6\x0ef\xf9\xb3l\xbc\x85\xc0\xe7\x06\x98\xa8\
-\xd4\xec\xae\xa3\xcf\xd8R\x89\xf1\xf1\x8c\x89\x8aAT\xbe\
-\xbd\xae\xa7h\xc41\x1e\xec\xfa{mQ\xcc\x97\x7f}\
-\xbbqzX\xbd\x83\xdaW\x8c\xc3\x80\xba\xcd\xc8\xf8\x98\
-\xf9|S\xf2p\x05\x0f\x9a\x92\xdb \xd3\xd4#i\xf1\
-d\xef\xa7\x9d\xc3\xed\xe3\xe3\xeak\xd8;\x1d\xed\x0f\x1c\
-\xf5\x1f(\xb0s\xf8\xfax\xcf)\xe1\xa9\x8eX\xe6q\
-\xf6\xc8\xa6\xa8\x8a\xb3F\xa4\x22\x5c\xbag\xc7\xb2{\x0a\
-\x15\xe34\xf7\x8e\x8ad\x13\xeb$~\xe9K\x03t4\
-_\x86M\x98\xc4\xa7\xd3\x0a\xf7\x8dl\x00\x92Z\xfe\x0a\
-b5SQ\xf5\xd5\xde)~\xf8\xb4\xc9\x8fL\x82\xa6\
-\xdd\x95\xd3\xa60#Q\x8f\xdb\xa9\x0bx\xa2pM8\
-\x02\xb6\x18^A\xcf\xf5F\xa0\xa0\xe3O\x83\xf7\x90\xdf\
-\xdf\xf4,n\xf2\xc8E0e\xcf\x04lM@r\x84\
-Hdd\xf7u\xd1\x1f\x8d&%\x86\xdf\x08aj\xbd\
-\x9e>\x81\xfd\x9f\xcb\x90\xcf\x85\xacA8\xbf\xfd\xa9<\
-Y\x97\x0c\xeb\xb8\x0e\x17\x95-P6%(#V\x9f\
-A$K\xac\x133\x1f\x0b\xd7F\x1c\xea\x17\xa9\xc2c\
-e\xd2\xcd\x9aY\xb7\xb2\xab~\xdc\xc4\x0f9u\xcfu\
-\x15g\xd9!\xdd\xdf\xfb\x84\x8a\x06K-X$Z~\
-7\x0f\xbb\xce\xdf\xa5\x1d|\x99\xb3=\x99\xb4?\x95L\
-yt\xb7\xe5L\x17\xbf\xef\xd6\x1d4Pg\xb5\xd6\xba\
-\xe9l\xdc(9\xcd\xf3\xd4>c\x1f\x86\xba.\x93\xef\
-\x94R\xab:\xfbY\xe2J\xee\xb1\x16\x96ua\xf9\xab\
-\x9c\x9dB[@\xe5\x85\xea\xbc\xd5\xe2\x227(\xee\x1b\
-\x19o\xed8\x19\x86\xbcz\xdd\xdc\xde\x84F\x97Vg\
-\x88\x17h\xffj\xdb!\xdfl\xd2o\xcaL\xb2\x04\xd3\
-\xf4\xf3\xd7\xd6Vul\xb3\xdd\xde\x00\x03Y\x94\xd0\x1b\
-z\xa6\x92<\x8d\xc59&\xaf>\x8f\x91gx\xf1#\
-8\xac\xfa\xe3\x19\xcdoY\xa9>\x0a\xdd5\x99An\
-\x12@\xef\xda\xda\xcd3\xd3/\xfb\x86Q\xcf\x16\xbe\xd8\
-;\x07\xb1\xf1r2\xba\x1evu\xaa\x9bbg09\
-+\xdd\x94\xbd\xaa\x18I\xf1\xba\x97\xc8ci\xd9\xd7\xa9\
-\xff\x13q\x8c\x22V\xa0\xc2\x1bHtN\xdeM\xa2e\
-\x18\xc5\x83O}O\xd2\x9fVp:;W#8\xe6\
-\x84\x9e\xfa\xd2\xe6\x92\xfed\x81\x1e\xcbs<\xdb't\
-\xcb\xb2\xf8\xa9\xce\xe7\xe9#\x8a\x1a\xc9\x1c9\x0b\x8a\x03\
-\xae\xe8e4\xf2\xd56\xb5\xf6\x9fs\x904\xc2i:\
-h\x0fg\xbd\xce\xf4\xf3\xc6\xb8\xba\xea\xfb_p\xbf\xfe\
-\xe01K+[\xf9&\x97\xc3@\x03/\x9b\x1e\xfd\xf4\
-^\xbf\x96\xfb\xdc\xd7\xf7\xba|\xee\x01\xfe\xde\xed,\x1d\
-N\x91\xd8@\x96\xdb\x84\xca\x92\xbb\x8f\xe9\x04\x13\x1a\xfa\
-M=\xbf\x92o\xdc\xb1\xb3*,\xd88;\x8b\xde\xbe\
--\xc1\xa1\xee\xed\xdb8j\xb5\x94X\xf3\xea\xbc/\xbe\
-\x80,\xf8\xa7\xa5\x10\xee\x8c\xe0Z\x08\x87O/N\xda\
-\x97\xd3\xc6Y\xc4\xeai\xc8\x1a\x8e\xccO}z\xc5\xb7\
-\x07m\x98:\xf89F&\x13uF\x14\xa4\xaf=\x1c\
-\x8e\x00\x97\xd09\xef\xa3r;\xe8C[\x80;\xa0G\
-\x92G\x1b\x91\x8c\xe6\x17N\x8c\xd4x2\xea\xa4\xd3i\
-&WRM\xf6\x1el\xe3\xe3t\xdaX\xad\x9b\x94\xe1\
-\xc7\xded4D\x12\x9db\xc8EI>J/\xe43\
-\xfd\xd8Ko\x1a\xc8\xc3\xa2\xb9t\x81Fxw>i\
-\xb8S\xfc\x1c]\x96\x00\xe7\xebM_\x1e\x1f\xc0\xb9\xb1\
-;\xea\x5cc\xadU\xfd\xe3%\x8c\xf1\xbbo\xb7\xa2\xb7\
-\xc3\xa8\x11\xadD\xea\x06*\x88`\x9c\x7f\xea\x00\x1d@\
->\xa4B\x0bo&\xe9\x1b\xee\x82\xa5\xdd\x94\xb59b\
-)\xc3\xd3uM/\xe8KN\x8a\xe7\xf9`\x875\x1d\
-;\x94S\xd2\xf8\x10k*\x86\x8f\xdd\x0f\xbdL\xd7\xd6\
-\xdcZ\x0e\xc8\xd1U\xc9\xbe\x83\xf4\x81A\x8c\x1c\xf5\xba\
-+\xc6\x94Jr\x05g\x801\xd1A\x07\xd2K\x81\x8c\
-$\xc2\xf05\x91\xd7/\x1c&yU\xd6\x0e\xd2\x13\xed\
- ]\x90\x82w\xed\xfc+1\x18\x07\xa9Q\x14`\xcf\
-?\x1dt\x0d\xfab%\xbf\xa0\xf9\x5c\x99\xf3Q\xf7\x93\
-n\x99L0\xdf\xb4\x91\xc1\x0c\xa7\xa5X\xd8\x0fJ\x80\
-Z\xaf&\xc5u\x85d\x1av\xdc;\xef\xa3l=W\
-~\x05\x8d\x8cK\x0bb\x1eSrN\xac\x7f\xa0\x93j\
-\x99Dg\xecdH\xa1e\xa1\xceUr7W\xec[\
-H\xd0f\xd7k\xd6\xe5\x0c7\xe1x\x9d\x19s_\xfe\
-W\x0ci[\xca\x15G\x17\xfc\x14\xcf\xc86vV\x00\
-\xd4J\xee\x06h\x5c\x09\x84\x0b\xec\xaf\x11\x84\xaa\xe3\xc8\
-\xa8=V\x81\x02\xa0\xe0\xa2T\x00\x1f\xcf\x1dw\xb4\x02\
-\xe3\xb0\x9c\xcf\x1a\x9eS~\xc1\xf8rPf\x80\xcd\x15\
-\xfc\x9bho\x10\xeep3\x85\x1e\x1eo\xae\x00\x0cX\
-\x06\xa1\xcd\x90\xc7vH\x923\x1d\xc9\xd2\xa3_\x87\xac\
-\xec\x950\xc5\xf7\xa8\xf02\xab'\xc7\xc8\xbc\xea\x807\
-\xbf}{\x0e\x82\xd9\xf0\xed\xdb\xbb\xd2\xd9\xdf\xe7\xad\xf5\
-\xf8\xed\xdby\x94\xab\x80yc\xbe\xec\xfa[\xfa\xdf\x17\
-\xb9\x12\xc8$\xf3\xe0\xa5\xf4C\xbc5I/\xa05j\
-\x8c\xdb\xe2\x81\x90\xf5\xcc0\xbdY\xe1\xf8\x01%.k\
-\xc6\xa4\xa2K\x03*;\x89\x0b\x1d\xfd\xbd\x14\x95\xa5\x0b\
-:\xdf\x16.G1nK=q;\xca\xac\x1aMu\
-2j\x02\xeb\x18\x06\x19\xcf\x11\x9bk\xe3\xb6\x01'U\
-*\xc3cy\x10\xdc`\xc3\xd9\x97\xfc*\xf2\xf9\xdaM\
-\x92MI\xa4\x00\xd3\xc1\x96;\xda\xd2\xdf\xefWb\x18\
-\xb1@\xb8\x03-\xad\xdc\x7f\x11Gqc\xe3\xef_l\
-p\x95\xee\xfe\x97\x84j\xf1\xa7\x8e\xe0lE\xcc\x8a\xcc\
-E\xed\x5c\xb9+\xca\x11\xa2\x8c\xa8\xe4\xc4\x1c+\x9d\xbd\
-\xfd\xfb\x17\xc0\xdb\xe6\xe5\xf5\xad\xb7\x95\xfb\xb7go[\
-o\x1b \x0f\xc4\x18w\x0c\xc8\xa6\x8e\xde\x94\xed\x9ap\
-\xb6\xb5a\xd7\xd4\xe7\xf48\xbf\xa2\x11\xb0\x1c\xdd#q\
-U\xef\xcf\xee\xe6\xad\x88\x08e\xae\xec\xc2\xb0\xb5\xb6\xd5\
-\xb9\xa9U\xdb\xbe\xae&\xc9\xb9\xc6\xb0\xfeQ\xd1\x99\x8d\
-6\xe4n\xd5\x1a\xed\xef\xce\xc9C\xeb\x5c9\x9c>\xb7\
-\x09\x83\xb07\x1a\x8b\x1c`\xdd\xdct\x86\xedA\xaaf\
-\xf4\xafL.=\xcc\x15l7\xcdf%?V\x13\xac\
-\xa6\x19G\x7fBQ\x08]\xcc\x98\x9d\x04\x98\x0e\x992\
-\xcfF\x87\xa3\x9bt\xb2\xd3\x9e\x82\x08\xbe\xc5\x95:\x1b\
-\x97\xd9\x92(\x12\xb9\xd9\xe2\x1a%\xeaJb6f]\
-\xaf\xb1\x91\xde\x8a\xa2F.\x91\xbb\x9e/5k_f\
-\xcbH\x92\xcaE,\xa1\x861P\x0bU%1J\xe8\
-#\x8e5\x22\x92\x1c\xadV\xd3\xdb\xb4#`jU7\
-b\xdf6\xdf\xdfS\x9e\x09h\x82\xd4,Ks#\xbe\
-\xbf_\x95\xba\xf4\x1e\xad\xb9\x02\xd5J\x83BU\x8f3\
-%II\xa32\xbb\x12\xdd\x9e\xc0\x9e\xafkVE\x9b\
-\xbf\xfb\x00\xdb!\x0a\x0e\xa4m\x85\x0dG@\x09K\x0b\
-z\x12\x03\xf2\x1e\xba\x1f\x8b|\xda }\x8a]|o\
-\xa7e\xb6n\x17\x8a\x17\xd0&\xbbM\x05\x94\x91\x04\xab\
-\xc6\xa3)\xec\xad\x93\x14\xdb\xb2b\xc54mOP\xae\
- \xb6\x0c\xd2\xee\x5c\xb9k/\xb1,[\xd3o\x93)\
-\x9e\xeb\xe1\x97\x1an\x092\x87<\xa0\xdb\x7fh\x90\x1b\
-\xb5\xa4\xbf,\xad\x03\xc2X\xde\xf1\xaa\xa6\xc9\xc9!\x22\
-\x8e\x9b\xb1\xbf\x22hH\xdc\xeb-;\x80\x97D=\x8c\
-\x10\x8d]\xb3Y\x872\x8da\xb5TH\xb9iw\xcb\
-k,\x1d\x92\xb6\x1b\xc9\xb1\xe4\xd7\xeav\x03\xe8O\x10\
-\xe6d\x19\xf2\x88\xef\xba\xa3;z\xf5\x9a\x91)C\xd4\
-2\xbf\x01\xe2JK\x06\xa58\x03\xab\x89C\xc8H\xfb\
-g\x8b\xd1\xdb\xa2\xb1\xad\x1aQX\xa6e5?-l\
-+\xc4}\x8f\xdd#\xb2\x8c\x8e\x06\xbf%+:\xfd\xb8\
-\xa71If\x0a\x1f\xf5\xc4'\x5c\x01Y\xf3\x13I\x98\
-\xef\xd1\xb4\xac\x7f\x03'.\x0b\x96\xaa\xe7}4^\xa9\
-i9`Y\x1a\x9d\x1b\xdfw\xd2\xf0\x5c\xd9\xa9\xb7k\
-\xcb\x9ff\x8e\x8f\x80\x8a\xc7\xc4\x91\x0d\xf9_\x90\x05\xb5\
-}\xf6jB0\xb1\xd7#\x14\x08)\x19iH\x91\xd0\
-\xc8\x9f\xf8S\x8d;\xa3k\xd8>\xd0\xa3d:\xd4\xcc\
-S\xe1@\x1b\xbaz\xfd0\x031\xd1\x08\xaf\xa3J\x06\
-VF?\xbd\xe9A\xb2\x162\xb9U)\xcbV\xda+\
-\xc89D\xea\xc3\x15g\xaa1\xc1c\xbf\x8a\xf3\xa3\x81\
-\x12\xf0\xe7.*3x\xbdU\x8e\xe6\x91\x0a\x8b\xc3\x0b\
-\xc6W{\xcc\x88\xd4\xb9EI]'\x96\x9f\xa8\xde\xf4\
-9v\x1e\x88\xcaN\xba?\xec\xac\xac\xed\x92&J\x0c\
-\xb1\x89\xef\x01\xe3\x02y4\x8c\x87/\xd1\xcd\x1b\x8c\xfb\
-C!\xc4Wq\x80\xf8\xfdc\x10\xfc\xf1\xd0`\x91\xf3\
-h|\xc8P\x0d[:\x8b\xa2\x96\xe5J\xfc\x18\xb4=\
-\xbdJ\xa7\x81\x9ef\xaa\xa2\xd7\x04\xe8\x1dp\xd8\x942\
-\x92\xf1\xe7\xcd$\xa9m\x950'9\xd3YvK\x81\
-\xff\xb1\xe8\x16\xc5-5L\xea T\xf8\xa0\xd2`=\
-\x0e\x17R\x11j\x86\x86d\x90\x8d\xe5\x8c$\xed\xf9j\
-\xa5h\x90\x1c\x1b\x12\x7f\xf2\xd8\x90\x15\xf9\xf0\xb83\x92\
-\xa9I~\x13\xf4\xc7\xad=\xd44s\x80IaQ\xa7\
-`9\x8b\xbc\xa1a\xd1\xee\xebN\xcf\xf57\xf6\xdb\xcc\
-\xcd\x83\xd086\x1ej\xd1\xa69\xccq0M\x06\x0b\
-\xf9\x97P\xa4C\x9d\xfa\xc8\xa3\xc7\x94$v]\xc0\xbc\
-;\xec{m\xad\xb6jr\x99l\xd1\x89\x80\x03a\xf6\
-%\x9d\x88<<<\x00\x03\x02(\xd4u\xdau\x0c\x22\
-v\x06\xc7\xfc\x18\xd7k\x1c\x9f\x84x;.\xdaN>\
-\xb8\xe9\x16\xb2\x07\xda\x01\xd0Ezt\xe7.\xee-\xaf\
-\xcdr\xb9\x01|\xce\xc9^[\xcb\xf4\xc9\xfb\xacT\x94\
-\x99\x1fw\xdfs\xf5<\x01\xd1A{\x89,\x1cLn\
-k\xf5_t\x17\x8e\xce\xf6\xc6\x03\xb1\xdd\xd1;\xc3]\
-\x9e\xe2\x0a\xe6\xd1\xdbb\xe5\xaf\xca\x096:G\xab\xff\
-x\x1bV\xce\x98\x02\x22m\x98`\xd9Yi\xe2\x8e^\
-\x91\x8d\x01\xae\xed+\x85\x22\x10\x89\xad%\x1f\x0eI1\
-I(M\x1f\xef\xf8\xc3\x91\x99\x1a\x9c\x02\xdbVoF\
-g%\xa7p\x8c\x87\x03j\x87+\xf1YO\xbb\xdb\xf5\
-\x0aP=vu\xcb\xa3Rw\xa9p\xc7\xb1\xcb\xba\x8b\
-\xc8\xf9\xb7\xcc\xeft\x98\xef\x07B\xc4\x0d\x07\xa4Y\xc2\
-\xde#1^y'\x05\x10\xf7\xe0kU\xc6\xcb\x1e\xd3\
-X8I0\xc3\x11\x8a\xadJ9q\xf2\xe8 \xc7\xb5\
-j\xc8r\xa6\xa4\xe5\xe7\x7f\x7f{\xb6\x83N\x95\xde\x9e\
-\x95J\xd5\xfb\xb7\xc3\xfb\xb7\x93x=\x86\x93}\xeb\x0b\
-8o\xe0\x99\xbe\xb1\xb8*\xfbXL\x141Y)\xd5\
-\xebWFDm\xe6\xea\xe6\x07<Tz+Z\x89\x1a\
-\xfcsNpE\x8f\xef\xa1\x01\x0e\x1d\x7f\x92\xfe\x94\xf8\
-5\xea\x0d@\xa3\x1d\x88Ge d\x1bp *\x0e\
-{\x8b\x1d\x16[\xd8\x03\xcc\x8b\x15k\xb5W\x83:r\
-9\xb6\x8a\xc2\x98\xd3\x0c\x03D\x1a\x83\xae\xc7LP\x0e\
- R)\xe00\x0f\xe8\x09(\xf3\xa2m\xa6\xa6\xc4\xb4\
-\x8d\xfe\x14u\x9eM|\xa8\xed\xb9\xe2\x8d\xac\xc8!A\
-`\x03*X3\xfe\x8e\xc8\x97g.\xc73\xbas\xb9\
-v\xb1\xdb\x1e\xc5\x80\x82\xfd\xfdN\xcc\xb81\x9b\x95]\
-\x0f*\xea\xf4%Nh\x02\x9afv\xcc\x8c\xe4\x191\
-\x03\x8f\xae\xa7\xb2\x149`\xb1Q\x9e\xd8\xc2\xa2\x03\xa4\
-\x1bo\xf2\x1bl\xea\xd4]`S\xe0\x8b^\x1f\xe6D\
-\xcf7\x0e\xab\x15\xab<\xf0\x22\xc1\xe9\xce4\xdfp\x1b\
-\x9f\xebj\xb4\xa6\xd1L\x9c\xae\x15vC\x8de\xa1\xa3\
-\x22,\xf3\xb5\x9d\xbd\x22\xe1B\xb6\x1f|\xabgV\x02\
-\x7f\x93\x93d\xf6\xb7\xbc\x015\xc1Y\x02\xeb\xf4F2\
-Mg\xc7\x04[\xe2\x22\xd4b\xae\xbb\x9c\x87o\xfa\xf0\
-\xef\x5cy8\xb3]\xa6\xde\xea}2\xbd\x9d\xcf\xc3\xf6\
-\x08\xf6Z\x0dv\x91\xb3\xc8~F\xc57\xa5\xadE\xb7\
-\xb0\xd1\x99\xe4\xb56R]p\xba!%\xe9\x166_\
-\xf1\x19\xd2\xc5\xc6\xf6\xcb\xe3N7j\x15\xde\xc3.\xb8\
-\xc6\x83\xe2\xd5\x9d]\x9c\xfc\x11\x87\xc5jDO\xf1b\
-\x15\xaf\x1e\x9d\xcf\xab\xf6\x04Sz\xbf\xa6T\xf7\xd3t\
-\x80v\x1c6\xad.iW\xbdnj\x9d\xe6K\x0c\xb6\
-\xd5\xfa<\x9e/i\xd4\xb1\xc0q\xfb\x02G\xed'{\
-?\x99\xac\x83\xa1\xf8b\x87\xea\xd4\xf1\xc9\xf6\xce\xdf\x0e\
-N\xf6^&\x18\xea\xf7\x98\x9c\xc6\x1e\xcc\xd2\x01\x96\xd8\
-\xdd{A\xa9\xbb\xe9Eo\xd8\xa3\x08\x05Y\x8f\xefa\
-<\xeb\xcb4\xae\x03$.sM\x02\xa8L\xa2\x9d\xdd\
-_ )\x92&`{N;\xbdv\xff,\xfa_`\
-\x860\x93\xd0f\xb2\x07\xed\xcedD\xa1\xc6vv)\
-G\x5c\xe8\x02 \xa4\xd1G1\xac\x84~\x11`\xfe\x22\
-\xe8\xea\x1b\x8c\xb9\xecXJP\x9f,\x8d\xd31\xde\xb7\
-Rx\x83\xf7\x0b\x9cn\xd1Vm\x93\x19\x93\xf6`O\
-_\xdd\xf4\xa2q\xe7\xc4\xddnD\x1c\x1e\x18\xc9\x8db\
-\xd3r\xb4\xb4\x86\xb8\xed\xd2\x84\xa5I\xca\xc9\xd2D\xa6\
-\x8d\x01\xd8\x81<\x1e\xceq\xe8\x0d-\x02\xc2\x9cA\xe7\
-\xab\x82\x91\xfb{)mi\x12\xc1\xaf\xc2\xe0W\x06\xdc\
-\x92+R\xa3\x9e\x07g\xf3!\xfd\x14\xa9\xde\xb5\xf0\x89\
-\xfa\xe6*\x1a\xbfo\xcb\xb5Y\x8f5]\x1d\xad;>\
-{\xf6\xdd\x8f\xdb\xd5\xfb\xa4\xb5\xe1\x9f\xe8_\xcf\xae\xd2\
-\x09\xd7\xc8\xbe\x1ez\xe2\xdbf6\x1a'N?OF\
-c\xf4\xbb2\x1a\xc3\xa1\xa6]\xca`\x1d5\xc6\x98\xe5\
-x\xdc\xd0\xb7\xdc\xd0{\x8cz\xc8-\xa8P\xa5\xd6o\
-\x05\x0d\xf3h\x04{\x15\xd4\xc5!\x15\xec\x99\xbd\x0e\x87\
-j\x8c\xe8\x8dS\xa15%%]\x02\x8eW\xf58\xfe\
-\xf3\xa6\x82%\xd6\x1cj\xbf\xda^\xd3C\xb1[\xbfB\
-\x9fzw\x12\xef\xa2\x81\x15\xe2T)\x09o\xf1\x89\xe6\
-\xf4c\x08\xe6\xca\x85Q\xd3O d\x02\xda;\xf8!\
-\xfc\xa8\xa6&\xf2cNA\x97\xab\x14\x1c\xd2QJ\xdd\
-s\x02tR4n\x83>yi.I\xf8\x85\xe8?\
-\xfe\xdb\xff\x17\x09\x05c\x1fb\xa7l\xf2P\xd9D\x97\
-\xbc\xb2%\xef\x0cZ\x93\xbb\xe8Y\xd4\x88\xfe\xe3\xff\xfc\
-\xef\x91\x8a\xbe\xa3_\xffW\xa4~\xc4\xbf\xffO\xa4\xb6\
-\xf1\xef\xff\x1d\xcd\xcf:-\xd56\xaf\x0d~\x18\x9f\x8c\
-\x08{\xe5\x8e\xea\xc4\xea\xbc \x83\xc6\xfa\x8c\xbaw\x7f\
-\x0fuS?Q@\xc7\xbeJ\xef\xa8\x0fn\xffT\x1b\
-(\xa4\x9dDo\xdf\xbe\x07\x01m%*\xeb\x99\xa0\x9c\
-s\x11u\xda\xddD\x07\xb3+\xd7\xeb\x83\xebH\xa3:\
-\xfa\x0a>\xe6M\xd3\xc25\x08w\x13\x90y\xb4\xcd\x80\
-F\x0e\xfc@\xcf\xa0\xe8\xe211\xcc\xa6\xd4V\xfe\x0a\
-\x8c\xb1\x00:\x8e\x19\xf4\xab\xc7\xe9l\x17\xc8\x18KV\
-\xb1B\xb6YCw\xa0i\xb7\xd4\x96!\xc0\xa7f4\
-\x1f%\x14ET\xad\xc3\xb62\xc7\xcb\x0fz\xf0\xea4\
-w\xbeds4\x08\xaf\xbds\xa7=\xa8X\xb3\x93\xc0\
-\xd6\x85\x17\x07\x1a\x19R\x18\xc7.\x9d\xec\xa6c\xc0a\
-MI\xc4\xac\xa8\xfa\xd5\xd7\xdcY\x89\xb8\x82E\x99L\
-\x82\xb4\xe5\xce\x1e\xd3\xa5*\xd1,\xb9\xad\x02H\x89P\
-\x8dC\xd9\xa6\x97L%\x8b\x03\x98hy\xb3\x8b\x9c\xf3\
-\xed\xdb~\xbf=\xbe\x8b\xcam\xd2\xb2\x06\xd1\xc3\xf8\x91\
-\x8a\xa8\x072\x18m\x97\xdf\xf0M\xf7\x8fv\xe7\x8c\xfb\
-\xa5\xda\x9fp\xfb\xe7\x0b\xda\x8f\xe7\xf0W\x0e)\xb4\xe5\
- BU\x9e\xb5\x10\x8b\xc6\xcf\x10\x87\x0e\xb2\xd1\x92a\
-p\xf7\xf7g\xad\xd8\xd5L\xb2s&\xcd\xe8\xdcl\xb7\
-'\xee4\xeb9\xd6s\xfbM\x95\xe4 \x9e\xf2h\x13\
-~\xcf\xb5\xf5\x07\x95\xb5\xbc\x9b\x86\xa0\x8b\xf7\xa6{\xc3\
-\xd9\x84x\x1b\xf6\xbe\x81\xff \x81(g{\xcf\x0e0\
-\xbc\xed\x196\xb1\xdb\x83-\xdd\xc1\x91\xd9\xf8\x97\xaa\xe7\
-*X\xcf\xdc3\xf0[V45\x22\xd1C\xc2)\x85\
-J\x09\x88\xa7\xc3\xeb\xc1y:i\xd4\xf8Z\xe5\x95\xfe\
-:\xd8\xa5h\x17\xe9\x07\xf9!\x81\xbd(\xc9\xfe\x9e\xa0\
-=\xddY\xeb\x9f$X\xc2\xa8\x92\x87\x06\x5c$d\x16\
-\x0a\xa5\x22}b\xaa\x9c)\xd3\x0f\xd7d\xaf\xc8\xb8A\
-\xf9\xf4\xf081\xdd?\xb5\xe6\x02\xa7\x14\x8b\x9e\xcd\x9d\
-Ns\xb1\xb7O\xcfz-\xcb:\xf1\xb6|6\xc2S\
-\x15\x07\xdb\xc6\xd0\x86\x22\xbd\x9c\x9e\x8aQ\xc8\x0a\x1aC\
-\xe0\xd3\xd1\x1f\x8e\x0e\xc9\x1fn\xc0\x14n\xfa\xfc\xd3\x09\
-_\xdd\x97\x22~S\xabUfQ\xd4\x90\xdbzS\xac\
-?\xea\xd0H\x1c\x0d\xff\x9f\xaa\xeb_\xd0U\xb3\x96\xa4\
-\xb7\xbb\xdd\xd2\x1d[l\xb7'\xb5\xc1\xa8q\xd7\x83\xff\
-\x0dg\x8d\xb3hs\xbb\xb6\x03\xa7\x94\x02.\xf5f\x0e\
-t\xc0\xd2q\x83*\xc0\xb6\xa1\xd4v\x07ES\xd8\x9b\
-7w\xb7\xf1\x02\x81\x83d\xc8fw\xd2\xeb\xa3\x89\xe8\
-0\x05\x19\xb9\xcbig\xd11\xfe\x9dPT\xa8\xea\xe1\
-\xde\xab\xefO\xf6\xab\xaf\xf6\xbe\xdf>9\xf8q\xef\xe5\
-\xde\xee\xc1\x0f/_n\x9f\xecSL\xca\x16\x96\x84\xc5\
-\xd4y\xbfD\xd9\x93\xfd\x83\x9d\xbf9E{\xdd\xd1l\
-\xca#\xa3\xb0\x16\x07 @_N\xda}\xb2{\x85\xf4\
-\xb7o;\x08A\xbf\xa1\xe3\xdd.|y\xe3\xa9\xed>\
-\xe7\xf4|\xc6\x0edLa3\xc3\xfd\x13\xaaG\xacP\
-\xb5\x88\x97\xd1\xf8\xce\xf9A\xec\xfa\xed\xdb\xf1U{8\
-\x1b\x0d\xee\xfe\xf4d>\x9f\xbf};\x1c\xd1\xab\x89\xe9\
-\x9f\xeao\xdf\xae\x1ah\xc8t\xb26\x81\xbf?ia\
-\x88\xd2\xb4\xeb5r\x01Iw_\xbc}\xebJ\xf4w\
-\x7f\xaa\xcf\xbf\x80\x02\xf5\x96\x9a\xb5/\x1b\xd1>\x05\xa0\
-\x03\xd2\xc1\x08\x91N\xca\xab\x11\xa5\xd1\x12\xd7i\x87\x1c\
-\x9c\x12\x16\xbbN9J/\x22E\x97k\xd0\xb0\x93\xb4\
-Zk)\xd2\xc1\xc1r\xf2\xbaDg\x9a;\xc8\x22\xa9\
-z~\xd7\x99\xe3\xc8\xf0Z\xd2\xa4Q\xdfz\xc3w0\
-:(\x8a\x14\xdd}=\xa6\xd7\xa9\xefp\x7f\x80#M\
-\x13\xb2\x00\xaf\xb0rr@\x98\xe6C\xc1\x82D<\x0d\
-/\xc2\xf8'\x89\x04\xcd\x15q.D(\x00\xb9x~\
-\x07\x85`\x06L\x05\xd3\xebq\xb8\x02\x94\xa0\x1e*o\
-FS\xd4\x81\x09\xee\x19$\x01,\xaa\xc6\x0e\xb8p \
-\xe9\xc5\x03\xd5\xec\xa6\x9d~{B\xba\xa1\xd7\xe3t\xd2\
-\xc6\xa0c2s\x92\x85x\x1cI\x16\xed\x93\x92\xad\xc1\
-\x11\xd9\x91:~\xdf\x1b\x1f\x12\xfd5\x22\xfb;R\x97\
-\xe9\xf0b\xd2\xee4\xa2\xef\xf9G\xa4\xe8\xf3\xcc~G\
-\xf6\xff\x81\x06\x0bs\x81\x08\xba\x85\x99\x18u\xad7\x1c\
-\x0d\xbcL4h\x8f\xe1\xbf\x9aT\xbd\x10\x02\xab_\x08\
-\x00Mtx$;/(sz\x05S\x8d\x086\xa4\
-~\x8c)\xccb\xac\xbb\xf4\x16\x03\xd2\x8c\x16C\x92C\
-\xeb\x96\xba\xb5\x13\x0f\xb0\xb7\xdb\xac\x8d\xf8\xe6\xe9\xb7_\
-\xaa\xa7\xea+\xc87\x13\xeago\xaa\xafa\xc9\xe3e\
-\x8cQw4\xeeX\x01\x00\xfc\xe7\xe51\xad$\xb9~\
-\x05q\x07\xfe?\x9a\xf4\xed\xffE\xb4w\x95\xcejj\
-S\xe5\xfek\xc5-\x15Q]\xebQ\xa0\xb6\xfa\xe3k\
-\xc3\xe7\x0b\x14E\x8e\x19,\xfe4}\x83\xb6t65\
-\x97\x05\x80y\xa2;\x95pO\xea\xd8\x13\xd3>\xb6u\
-\xd9\xc6\xe3~!\x16:@\x18\x11\xc3,\x18\x1dB\x11\
-\x06\xda\xd4.\xfe\xda\x9e\xb9\x15i\x0c\xb5g\x5c\x8b\x0f\
-Q'\x08\x02H\xbb\xa1*\xea4.\x01\xd0\xd9i\x17\
-:\xb3\xedt\xc6\xfe\xf3\x18t\xab\xa8J\xda\xbfh7\
-\xd2\xd8X\xae\x8d\x8e$\xb9\xe55S\xc6\xf2\xc1R\xf4\
-\x8fA?,\x1c:#\xaa\xe8\x98V\xd8t\xd0\xee\xf7\
-\x81CMz\xb7\x855`\xbb\x5cA}\xe3\x09u\x7f\
-\xd3\xa9A\xcb\x5cP|O~\xd2\x853\x00\xe8o\xde\
-m\x22\x0dI\x13R\x04\x8b\x92hD\xc8O?\x0c\xcd\
-\xc8\xc2\xeb\xa5\x83\x02\x00\x86\xe1pD\x08_t\x10T\
-Q\xe3\x5c\xdb\xa2\x15\xb3|}s\xd5\xe5\xc7\x92@\xc8\
-w\xc0\xe3\xfb\x18T\x0bk\xae\xd5\xbe^$x\xed\xbd\
-\x9a\xb7pO\x98,\x05O7@\x5c\xa0\xff\xa3\x14\xd8\
-\xac\xd5\xbfZ\xa6\x81\xa5\xe0\xa5\x81\xf9\x5c\xe35\x0ei\
-C\x8d\x00\x12:[\xe2Y\xc4\x1c\x92p\xf2\xf0\xfc=\
-\x91g\x14@V\x03\x12\xf3\xa6%\x0d\xb2=\xb9\xbcf\
-\x073l\x97\x0a\x02\x0d\x9c\xfa/\xc9\x1a\x1f\xb51P\
-T4\x0c \xab\x03a\xe25\x1b$J<\xf4\xcb\xfe\
-\xe8\xbc\xddw\x0f\xb3\x9c\xd2\xe4?h\x1b{\xb0\x9b\xc0\
-\xbfJ\x12Hb\x9a\xae\xad\xe1\xb0\xf6\x809\xe3\xdd\x03\
->\xfb\x82!\xbd\x1a\xcd\xb6\xfb\xfd\xd1M\xda=\x18\xee\
-\xa1\x06:\xfas}\x05\xe0W\xda\x9c\xba\xd2\x1b\xae\xfc\
-ys\xc5a\xe0\x11\x9dJ\xfd\xaaa=\xd8\xb6\xfdv\
-HT\x1dc\xec`j\x0f\x1a\xd0)+\x7f\xaes]\
-^\xe9D\x07\x14n\x8f\xc7\xfdOx\xbe\xe6\x133J\
-\xbb\xb0\xcf\xf7\xc9H\x81p\xa1\x8f\xcb\xdd\x86\x87\xab\x83\
-\xdd\x12T\x13\xa3\xc2\xd6\x11\x11\x17\x1ct\xdd\x9e\x8b\xfb\
-\x8c`\xae\xca\xa7\xd2\xe8\x13TT:\x92g\x88@\x8a\
-\xa6\x8c\x05\xd7$L\x17M\x0a\xa9A\x10kk%X\
-\xaep\x0c\xba\xf8a\x0c\xac\x1aM\xb0\xa5\x0b\x92\xfd\xd9\
-(\xe7\x0ep\xe0ij\x83O\xcbg\xf4\xa7u\x7f\x8f\
-I\xfa\x08-\x89q\xb89\x11\xbb#\xfa\xbb\xf2\x97?\
-\xd7\xff\xc2\x0f\x0aa\x1aW\xbax\x94M\xbb\x22\xa8C\
-\xeb\x81j\x93;\x92\xeb\xb7\xb6\xb6\x228\xeb\xe03\xb4\
-\xd8\xcc!H\xeb>ZY\x9a\x8f\xefl\x10\xee0\x0e\
-\xf1\x14\x90,7,8\xcf^\x90\x95\xecE\xbe'\xd4\
-\xdf\xf3v\x173W\xbd\x99\x10\x8b1 \x03HB2\
-iR\xcf\xf0\x02\xb7\x1dX\xc5H\x9a\xae\x0eH+\xec\
-\x16\x92;\x15\xd2\xca%<\xc4x\xd5\xc2i\x1b;]\
-\xedu\xf5\xe1;V\x1d~\x80(\xda\x86_\xd0\xaa\xd0\
-\xc1\xa6\x91\xa0C\xa4\xca\xa7\xb5\x0c7\xc3\xd3yd\xcf\
-ro\xdf\xba\xb2tg\xba,\xa3k\xa2e^\x92t\
-\xa6\xfa\x86\x84^\xa6C\xf9\x8ec\xce\xc7\x18\xd5\xda\xba\
-\xfc\xaa\x80\x1c\xd4\xc9\x19\x9b\xbfu\xb6\xf8C\xc3\xb6\xbb\
-\xf5y\xe4(\x0b*NN\xc5>\xffIg\xbb\xe9\x05\
-\xb4\xaa\x82\x07\x94\xc9\x00\xf6\xbe\xd1\x18\xd5\x91e\x1em\
-\xcb \xce=[\xfc>\xb8\xd3\xc3\x5c\x02w\xbfy\xdc\
-\xa4]I\x16\x8f\xb5\x1c\xe1\x0d\x80s\x95\xc5>\xc1\xe4\
-&K\xae\xc7\x13`x\xce\xc1\xaa\xf8:\x0cF\xf1\x0a\
-\x8d\x8c\xd0\x01/\x17\x15\x0aH:kken\xa7\xb7\
-\xb6\x16q\xdb\xc6:\x05\x8a\xed\x1c\x93\x09\xbe\xb4\xd73\
-3@'\x94\x0c+\xa0\x83\xcc\x02%\xaf\x91\xdc\xa9\x01\
-T\xf8R\xdc\xe5\xc0nx0\xb4r=n\x84\x9d\xf6\
-pe4\x04\xfe\x85\xfe\xc0\xd0\x83R\x0f\xcf\xec\xb0=\
-\xa4+\xba\xce\xfc\xd6\xd8\xa2\xdb5\xf7\x0a.\xd8\xd6\xf6\
-\xec\xe4*%\xc1\x0f\xd0\xfc\xfa\xe2\xd04:\xb8\x9e\xce\
-V:\xa3A\xba\xd2\x9eQS\xa4\x8c@\xa8\x95\xd1\x05\
-%\xc8\xc1#\xd3\x16\xa1!\xa1\x7f\xe7\x8a\x0e\x83A\x12\
-\x9d\x14\x12\xdcs(\xf2>\x9dM\x19\xabdW6\xbc\
-\x1e\x141\xd6n:,\xca\xc2\xf3(\xef\xe3\xf8+\xa3\
-\xfb\x9fM\xaegL\x9b\xac\xe8\x89\xca\xd0H\xb1\xf2_\
-=T\x1a\xfa\xb1\xe0\xea\xa0\xc96[%\x18\xf6]\xbf\
-\xe1\x1f\x81\xd5\xa4\x919\xe9\xaa\x88\x9e?\x9f\xf5'\xd9\
-M\xee\xa0\xdfO/%\x5c,L\x93|\xb2\xcb'\x1c\
-\xf9\x0a]\xd9_\xf4Db\xb2\xdbl\x1f]T\x22\x1a\
-\xaa0L\xf6\x10E_\xd0\xed\x91|\xf7'\xee\x8e\x80\
-\xb9@\xeer\xd8\xcf\x90:\x9e\xb3\x15\x1d\xc6\x15\xa9\x11\
-\x15a!\xbe\xe3Qb.:$I\xb5\x7f)T\xd9\
-k\x11\x1d\xe6H\x8b\x9b\x0cM\xd5\x008\xfd]\x02\x9e\
-\x1a\xe45\xd9y\x9f\x14\x89\xb2:\xd0!t\x8b\x1c\xab\
-\x1b\xa7i\x0fs8f\xfc\x86\xe4h\xd2M/,\xbd\
-e\xd23\xc4\x06\xc5\x11\x94\xefB\x85\xa3P\xb7\x09\xeb\
-\xb8r(a(\xcf\xc0:\xefcE\x08\xbb\xbf'<\
-\xc4\x02I\x9a\xef\x8b\xdem\xda}\x81.\xae\x08\x84\x9a\
-\xb2W_\xf8\x83\xb0\x85O\xf4\xe71O\x0b`\x80\x03\
-\xa1\xf1\xbcPl\x1at{\x95\x9c\xc1AUE'|\
-b\x8c\x8e\x8f\xa3\xd6\x19\xc1\xb4\x84B\xc5\xed\x9cKs\
-\xcf\xdbh\xd2{u\x8c`/F\xe8M\x0fR\xc8\xd4\
-o\x85\x8a\xae\xc0\xfe\xef\x92\x9a\xc5\x04e3%\xe1\x01\
-9\x91\xea\xb7\x18\x09\xae\x9e\x15\x0d\x9b)\x91\xef\xe4(\
-\xa8kR\x8b\x1b!\xc8z\x1e\x92r*\xf5x\x9e\xa3\
-_\xcdH3\xf6#r\x7f\x93v\x8b\x0dI\xd8>\xee\
-*\xed\xbc\xdf\xfb\x80g\x92\x92k[\xa2\xd9nI\xd7\
-\xe3\xac\xfb\xbc\xc5I\xc6F\xc45'\x11\xf5\x01\xdf\xa6\
-9\xb7'\xd8o\xe4\xc5\xe4\xc9H\xacS\xe4\xe2\x9b#\
-T\xa3\x9a\xdc-\x00R\xdd1$\xa1=\x09\x8b\x93\xd2\
-\x80\x0f\xc2\x11\xe8\xf0\xd2L\xe9sw\x11f\xf04x\
-\x89W\x92\x12\xa5P*\x5c\x800\x81\xd7f\x9c\x1e\xea\
-\x98\xc5H\x5cE\xfa\xd7\xca\x09g\x7f\xef\x00\xa7Ca\
-\x01\xa4\x07R_\x95\xf0\x97\xb9\xcdqD\x8a>B\xf5\
-\xc9+\xa9M\x9c`\xe2\x84]\x82\xda\xd4\x0e\xa6\x8ay\
-\x8f;uz\xdc\xdc\xed*\xf1\xb3\xfc\x98\x7f\xdbt\xba\
-&F\x8c=\xdf\xbeH\xfe\xde\xdfG\xa4\xffq+x\
-\x82w\xb5\xbf}r}\xf5U\xcez*\xe3'\xd0\xdd\
-u\xcd\xb5CT\xb6\x18\xc2\xad-c\x81\x8f|s\x22\
-\x910\x99\x95j\xcc\xca!\x82\x1ce\xb4\x85\xb7N\x85\
-\x04t\xdf\xb6g\x0f\xd2\x9d\x84}BW2\x88A\xee\
-n\x14iB\xc4\xc7\xec\xf4xS\xc0\xe1\xcc\xf4\xf1\xd1\
-C\x02\xae\x1b\x10\x1f\x16\xc0\x1b\xf3\xa9\xbf\xd7*\xdf\xb6\
-62\xdb\xf3\x9b\xd1\xb47\xeb}L\xe9N\x8c\xf6.\
-\xe0\x96\xbaZ\x90\x0aW\xb4\x5c\x85R\xd5\xcaX\xa0a\
-\xab&p\xe7\xca'\xdbp\x0b$\x88g\xb5fL\x03\
-,'\xa4\xc6\x15<\x88\xb3\x81Z:X\x81\xff\x226\
-lBw\xd0\x82&\x0df\x96\x93E\xb0;\x9f\xfe\xb2\
-x\x90\x0b4\xc5\x90\xa8\xfd)\xf9\xac\xe2\xc5\xa4D\xd5\
-\xc8\xa4\x03\xb5x\xba\xc9,\xcd\xc0\xfcw2\xae\xa0|\
-\xb6\x93\xd7\x95P\x11<\x13\xd3\x0f\x10\xfa\xb5\xc9\xb3\x1c\
-f\xd1\x95\x10_Y+j\xc3\xf6\x00\x8fQ\xd9\x0e\xa0\
-\x19\x8c\xd7|V[s\xc9\x8fv\x00n\xae\x9c\xae\xe5\
-\x9f\xc7\xb8\xe5\xd2\x0fC\x90\x1d}\xd2\xc2\xbf\xc3tt\
-=}\x95Ng\x80\xc2\xbd\x0f\xa8\xa8\xd5\x89+CN\
-E\xd1\x5c\xabvWPJ\xed@\xd7\xd2i\xd4\x0a\xa1\
-\x82\x9b!\xbd\x91w\x93\x9b\x11\xf6z\x92,\xeb\x11\x9f\
-c\xf8\xa7\xaa&\xbf*\xd4\xef+t\x80\x1f9iy\
-\x052\x12\xba>W\x91V\x95\x0f_R\x09y|\xe3\
-v\xf1\xa8\xa8/\x9d)\x9b\xde\xe0\xd3\x05\xef\xaas\x88\
-T\xf0\xffQY\x17\xc2E\xd30@Y\xb8\x1c\xa8H\
-\x0er6\xb59K\x9eB\xf9\xae)\x83\xb7\xce\xd5D\
-\xf5\xd5D?\xab\xbd\xb0\x96kQ\xb9\xd4/O\xe2r\
-\xe4\x18\xb0\xf5\xe9k\xae\xceG\xb3$x\x12r\x8c%\
-3\xa2'\x1bj\x89i\x16\xfeA\xad\xc6\xb4\xc4f\x0c\
-\xd5\x8b\xc9h\xb0\x03\x09;hG\x0e}\x8a\x8d\x0e\xc7\
-5_\x0c\xeb\xa4\x8f\xf6\x0e\xe7dv\x955\xaac\x03\
-\xb0\xe6\x83\xf6q\xd0ei\x0d\xad\xc4\xf2\x16rO\xd9\
-\xea\x0cG\x8d6r0v\xc7Jn4\xfb|;\xb9\
-\xd1lA\xbb\x95\xea\xe6\x97\xda6\xcf\xb3\xe6\xd2\x88\xa1\
-\xe0@\xaf\xffF\x025\x1d\x82\xbc\xf3\xc8\x02M\xc3\x12\
-\xfa\x13\xe6\x16\xe8\xc9\xa0\xb3\x852w\xa3\x83G51\
-#17\x19[\x9d\x06\xf9\x9f\xf04\x9c\xbd\xe9\x14\x0f\
-\xe9\x93\x1f\x86\x93\xb43\xba\x1c\xf6~M\xbb\xd41\xd4\
-\xadr\xe6\x0a\xc8\xe2\xd7N\xf6\x8a\xa91#\xa6\xd3\xa8\
-|\x96\xe6\x5c\x22D\xebQ\x92d\x97\xb9~\xda\x00\x00\
-\x22\xe3ID\xda\x09zxs$,}Y\x81\xbc\xd4\
-Sz\xe7\xb5\xd0re\x80\xa6\xc9\xae2;\xbeC\xed\
-&\xef\x22\xd0\x86w\xa3\xe0i\x1d\x99U\x97,tu\
-6\x12\xfb\x1d9\xc8!\xf5z\x87w\xd2GE\xe5\x9c\
-N\xd4m$\xa6\xb3<>l!\x8ak\xe6/\x06\x5c\
-k\xca\x80\xee\xdf\xabl\x8eao/\xd3\xd9R\xb8\xa0\
-[\x18[\x1cQ\x93\xdbN|\xa5\xbb\x8e2}=e\
-\xe5\xf7Aw\xcaz_tTY\xd01*\x1ag\x14\
-\xe0n\x9e\xe8\xc1\xddq\xa0\x12\x9ak\x85\xe9.\xf2/\
-\xc6\x001\xab\xb6\x0fv\xa7g\x9c`t\xddN\x92\xde\
-(\xd0l\xae\xd9\x1d\xdd!5\xf1\x8d\x11\x06;\x8d~\
-\x01\x16->\x1e\x8a\x1a\x03\xdc\xda\x86\x0ev\xbdF\xe0\
-3n\x0a\x12\xa0\xef\x19\x94\x15\x8f\x9b\xe1c\xfd\xfa8\
-\xd7\xeb\xa4.G\xc3~\xda\x9e \xdd\x90@\x05\xbb\xbb\
-|/A\xedr\xbd\xe3\xdc\xe9\xe4R\xa0\xc7~\x1au\
-\x0e\x1f\xfe\xdc\x1e\xa01^\xbb\xff\xf2\xb5m\x09\x15o\
-\xd6\xa0\x8eM\xe9\x1c\xc5\x9f\xb1\xa6\x03Z21\xa1#\
-\xf6g\x8c\xa2\x8f\x0e\xee\xcc\x0aIr\x90\xd7\x9e\x8d\x06\
-\xd9\xac\xfb{\xfde\x5cQf\x12\x5cmc\x1c\xdf\xe9\
-\xdc\xdet\xcf\xfa\x80G\x85*\x81]\x0f9d\x0e-\
-\xa8\x1e.W2q\x9b\xfb\xccD\x9f\xb4\x93\xcc\x13\x83\
-\xea\xf1\xf59]/\x94\xee\xb0o\x0d\xab]U\x88 \
-\x87GkQ\x94Os,n\x1d\xff\xf0f\xef\xa8d\
-\x0f'U,\xe3\x9c[d_\xd0e\x13\xfdc\xa1\xbc\
-\xc8\x9bU\xfbc\x9a\xdc\xb1qX\xfe\x92n\xae\x82\x02\
-\xa2\xad~5(\xac\x82\x10:\xec\xb29nVpt\
-\x9fE\x08Wvi\xc4\xc6\x1a\x11n8\xeb\x16]m\
-2\x90\x8d\xefI*\x5c4\xe8\x06P\xe7@\x9bd \
-\x04UxyD'\x11\x00w\xc2\xbf%h\xe6\x0a\x9d\
-?r\xc5\xa3\xf8\xae.\x8eZ\xec\xdb\x8d\xfce\x1eN\
-&\x14\x9b\xbe\xc6'_x\xa3wr\x95\xae\xe0Q\xd9\
-\xd5\x7f\xc3\x81\xca\xd1|\xf3\xe1\xea\x0a\xa6`\x05H\xb8\
-3\xeb\x7fZ\x81\xd9Z\xe1\xdeG\xd6v\xc6\xc8\xc3\x8c\
-=\xeb;\x0f\xa5\x1a3\x1e\xdd\xf7\x13\x04r{\xaf\xdd\
-\xe1\xe4\xa8H\x03W;\xed~\xdf%$w\x96\x98-\
-\x88v\xd1\xcd\xa8\xd4UOnb+u\xeb\x98\x88@\
-`q\xe1\xfar\xe6A?\xa8)\xc8N|%\xb3\xdb\
-\x8f\xb3\xc1\xe2\xba\x06\x0b\xea\x22\xfdt,!k\xdd+\
-ko\xbd\xc8\xa7\xec\xff\xfa\x1c\xe6\x82{\x15h\xc3\x80\
-\x12\x0f\x9e\x15<Z\xfe\xd0z\x97**E\xb6j\x8d\
-\x10\xda\x9c\xce\xcb\xe6u\xa6=\xa6S\xfb&\xbeT\x0e\
-\x10\x03]\x12\xbb\xccUk\x98&O\xd7l\x92`\xac\
-Q*\xb5E+\x88~\xa6\xdd\x19\xab\xef\x01\xa0\xe9\xd4\
-\xdek%\x90\x92]b:\x0f\xe4\x81\xdc\xf8\x13\xc3>\
-\x84U\xccCZ\xab\x07\xd9\xa05\xa7\xc9\xb0\xc1\xb0\x9e\
-\xeb\x1f\xce\x14\xa7\x01\xae8UK\xf2K\x86Nt\xef\
-Y~\xe6\xcb\xb7\xdf\x99\xadZ\xc6Do\xcd\x16s\xd6\
-\x0c\x07\x5c\xc4_\x1ff\x8d\x9a\xda4Q\xfd\x11Km\
-\xabdy\xdc\x82\x85B\xdc\xd0\xf4\xc5\xd0\xbb\xb8\xf5r\
-\x05 \xbfG\xae\xf9\x8a\xdbn\x8e\xe7\x06\x96\x08\xb6\xb9\
-\x04\x0b~$\xff\xcd\xd0\x8f\xbf\xd2\xa6\xea\x91\x8b\x91c\
-i\x99c\xce\xa8\xdf\xddA\xd5\x0e>\x84hd\xa1\xec\
-\x83\x85\x8e\x86Q\xe6\x97\xe3\xf5\x1b\xbe\xd8\xc5\x1dz\xcf\
-C\xe6\x87)$v\x09I8\xef\xfc\xe8\xe0\xabMg\
-r\xe7(\x94XEE}\x7fo\x09\xc1\xfd}\x89\xee\
-\x92\xe5\xb37=\x18\x0e\xd3\xc9\xfd}\x048\x0b\xaea\
- \xa1\xcc\xc2\x11\x7f\x81\x96\xe8l\xd5\xdc\xdb<e)\
-\xf7\xdc\xd4R\xa4\x0f\xf9-jn\xff\xe1m\x84/\x89\
-&\xbd\x99\xfb\x04\x90\xe8\xac\xe4\x93\xaeCmDhV\
-G\xa0\xe5}G\xf2\x84\x93\x1fvv\xee\xea\xf7\xdc\xb9\
-\xb6T\xa6h\xfa\x90H\xb0\xab\xe3I\xca\xef\xf3\xf1\x09\
-\xcf\x94\x9e\x86\x942\xa2\xba3G,\xa8\xcb\x87\xb2\x07\
-Y2\x17r^\x17yG5thaN&\xfaC\
-\x1b\x06\xd5\x95g\x1a$\xa7\x1d\xa9\x95\x057\xf6N\xa0\
-_\x019\xad\xd0k*\x1a\xc4h:{h\x14\x0f\xd4\
-\x15\x1cA6\x9f\xbb\xa5\x02\x8e\xb6\xe5\x5cg\xc7\x19\x17\
-A1N<\x04\xc5\x0eF\x80~\xa9\xa7\xe4\x9d\x04\xce\
-6$d\xae\xad\x09\x92\xc4[\xaf3\x16\xc0\x81\xaa\xd7\
-j\x05\xc1\x1c^\xa6\xd3i\xfb2\xe5\xe7Y\xa4\x95&\
-g\xba+\xf4\xc6\xca\x7f\xa1\xa5[\xc0\xf7M\xde\x94`\
-0\xf6x\x99\xfa\x81\xa1\x15\xd4>`0\xe2\x19f$\
-Z\xc0\xcc4Vk\xfaG\xc3\x0c\xbc\x91tt:\x9e\
-\xd9\x9c\xf9\x9c\xa5\xa17f\xb0PN\xf6\xaa?\xbc\xd9\
-\x85?!\xaf\xc2\xe21\x94:^\xba\x93\xb7\x96\x0d\xdd\
-\x04\xbf\x9bk\x94\xd0\xd5\xed.\xda\xaf\x11\xa3\xe8\x0dR\
-4\xd2i\xd4\xd4;\xfc\xaf}\x8b\xaf\xe5\xe0\x0f\xbe\xa6\
-\x83\x9d\xc0,E\x8a* \x84:\xc1\xd7B{\xfec\
-3\xfb\xcel\xa8\xde\xa7\xe9\x98\x9f\xc42^\x5c\x02D\
-\xd7\x8a\x0e\x00\x88\xc1\x96\x9c\xf4\xaa\xe2\x05\x96\xf1\x02\x11\
-\x0ca\x80o\xf5\xe4\x05\x9d\x8e\x5c\xf0\x1b\xde&\x12\xb5\
->\xf0:q\xfaip>\xeaO\x03\x0f\x14\xff\xf0\xb7\
-\x85\xbb{/\x9a\xa1\xe7\x85\xees\xc1\xec\xab\xb8\x1e\xde\
-\x9d^\xb6\x07\x83v#\xaa=\xd9\xdd%G\x1c\xef\x81\
-%\xd3\xf7\x8b\x1a}\x7fO\xf9g\x90\xf0\xed\x93HQ\
-i|\x13\xd4\x1e\xceH\xce\xfeq\xfb\xe8`\xfb\xd5I\
-\xf5\xe0\x04\x0e$;sz\xe9\xb3\x9b\xf6gR\xe4\xcb\
-%\x8b\xc0YR\x17\xf9f\xc9\x22\x87\xed\xc1yW\xca\
-<_\xb2\xccO=\x86\xdf[\x12\xfe\x0d\xc3o\xd7\x96\
-\x84?\xee]\x0a\xb2\xb6\x97E\xd6\x0f\xe3i\xafOO\
-\x04\xa0\xd0\xd3e\xfbu%\x1d\xfbj\xd9\x02S)\xb0\
-,v_\x0f\xd2K\x19\xc9\xb7\xcb\x149O\xe95s\
-\xfd\x09\xf4\xe8\x12\xf8F\x9f>\xbe\x8eT\xb7\xdd\xd7Y\
-\xd06\x86H\x1aO \x9f\xcc\xef\x9f\xe0x\xa5\xda\x17\
-\xa3\xc9\x00\x15\xfc-uE\xae\x1c\xb1D\xed\x05\x91 \
-\x88|W\xfc\x0ass\xb3\x16,r\xde\x87zg\x98\
-x\x89\xd2\xc7\xe6\xd3\xe7@x\xfa\xbb;\xbaA\xf4B\
-\xe2\xee\x83e\x09\x16A\x81B\xa6\xc0\xc4&T\xdb\x0b\
-\xa0\xaf\xe7\xa3[\xfd\x93J8\xb9;\x91\xea\x8f~\x05\
-\xdeM\x9f;\xdb\x91\xda\xed\xb5\x07#\xf4\xbd\xc9\x9fT\
-\xc0\x82|\xbb\x07\x95tz\x13\x90\xd8\xbb\xc7\xd8\xb3/\
-w\x16M\xcb\xab\xd7G/\xb7\x0f\xb1\xa7\xbdK\xe4\x96\
-P\xc3W\x88\x86\xe9\x18e,\x10z\xf4\xa8\xe1\x7f\x91\
-\x1a\xa4\xed)\x06\xa6\xb0\x89x\xc7\x90\xde\x02\xc3\x99\xe2\
-g\xedK\xb4\x87@\x8eG\xef\xae0\x05\x00\x06W#\
-D\xf8&L\x18\xce\x16>\xbexQ[\xa6O/z\
-\xc3\x8f4\xb9\xd0t\xb7\xd7\xbe\xbc\x1e\xe3\xa0\xbf\x86*\
-\xbf\xa7\xd7w\x9b\xf5/\xeb\x9c\xa3Q\xfb5@>?\
-?\x7fO\x8d|\xb5h\xe5\xee\xbe\xfe\xe1\xf9\xe1\xde\xf1\
-\xc9\xd1\x0f;\x7f\x83\xa6>\xa5P\xbeV\xc3E\x22\xc8\
-;\xa2o\x98*\x92\xe0\x07\xc0\xbc\xa0\x81\xaf\xeb\xb0\xf4\
-\x06m\x10\x95\xa6\xd8\xfe\xd7\x9b\xb5h\xae\xbc\xa7\xc0\xdd\
-\xd1l\xdc\xbf&l\xd4\x01\x1b\xfd\x19\xd0#}\xed\x00\
-\xa9\xd3\xab\x1f\xd8\xc2@\xe8\x15\x10\xa0\xe8\x89\x05\x81\xe9\
-\xdci\xe3 7wq\xc8\xa3k\x90j;6\x01u\
-%\xb3\xabI\x9a\xda\x120\xc4\x9dk\x06xbJ\xd8\
-\x04\xb2\x94\xc9\x14\xd9\xc1\x952\xb9I\xbbD/\x9b\xcf\
-\xe1\xbbs=\xe9\x7f2);\xb82\xd2\xf4\x9c\xa8a\
-\xf3\xf9s\xc9\x87$\xca\xdd\xd3\xed8\xb5l?\x85\xd4\
-\xf3\xd1\xad\x19\xd8\xb7/\x0c\x22\xbb\xbc\xe06\xbf\xdd%\
-\x10\xd3\x11d|\x02\xd2\x9e\x12\xb1 \xab\x05\x08|+\
-\x8c\xf9u\x93\x8f\x7f\x08`\x9b\x004\x82\x91\xd5\xb2\xd5\
-\x0f?/\x86\xce\x05Wp\xb7\xf7\x11\x8e\x1a\xa3\xa1\xc5\
-\x01\x90\x22^\xfcN\x80\xc0i\x8c\xdb\x88\xdc\x0f\x1f\xf0\
-\xf7W\xc8d\xf4\xef\xaf)\x1dx\x06Q\xf3\xf6\xd7\xbb\
-\x94g\xbf\xf7\xf0\x8d/}\xf61p\x0d$}\xfb\xd4\
-$]\xce&\x94\xf2\x15V2\x9dN{\x03\xac\x13I\
-\x14r\xf4\xd7\x13\xce\x84\x8dqBL`\xfb\x9b\xa7\x94\
-\xef$@y\xfeJ\xa9S_ns\x11A\xd3\xeeW\
-\x04\xaf\xbf\xb0\xc7}\x1a\xd4\xee7\xf4\x93\xfbE_\x97\
-\x97\x97\xf4\xf3[\xfaI\xbd\xa3\x0f\x84\x91\xcf\xaf\xb96\
-]\xea\xeb\xaf97\xfd\xa0\xc1\xb7)\x1fDo]\xef\
-s\x0d! \xdb\xdf<\x17\x10\x0d\xb3\xfd\xcd\x0e\x92\xcc\
-,\xfd \x9d|\x0a3\xbb\x8b\xdf\xfa#\xfd\xa0g\xf8\
-).\x88\x1e\xden\xa2\x15\x80@<aB\x90/\xe8\
-\xd2\x05,#\x1fd\xd3\xb2dN\xd8\xe1\xfd@\xd0\xfc\
-d7b\xeb\xd5)=\x12\x86\x84\x9d \xbb\xe6\x12\x5c\
-\xc5\x8e.#S\x81\xc5\xbe\xfc&T\x0c\xef\x90A\xc6\
-#\x9a\xd9F\x12\x9c^\x8f\x9d\x04\x18\xd21A\x10\xbe\
-j\xf85\xd6_u\xdc\x0a\xa6&\xf7\x9b\x17\xfc\xad\xf3\
-\xbf\xada\x04\xa7\xb4C\x0b\x90\xbb\x85\xef\xd6\xa6\xd7\x1d\
-/iW\x96h\xfa\x01\x81\xa9\xe2=\x93\x84\xc0\x94\xf4\
-\x82\xeb\xd2\x94\xb7\xc7\xf5\xe8O\xc9\xb5t\xf7\xfck\x06\
-pR\xbe\xa1-S#\x9a^\xfc\xe2\xeaA\xd6t\xd5\
-\xd5?\x1d\x08~\xea\x8b\xe9\xc8\x8b\x04\xe4\x89\x9d*\xac\
-\x81\x87\x80{\xea\xf5\xf0\xff\xa7\xee\xcd\x9b\xe3H\xb2;\
-\xc1\xaf\xc2\x8a\xd2t#\x0b\x91`x\xdc\x91\xe8l.\
-\x08\x80U\xec\xe6%\x80U}\x80Po\x12H\x92\xd9\
-\x05dB\x09\x80d\x09\x84L\xc7\xaa\x0fI\xb3+\xc9\
-\xc64\xbalW3\xda5\x9b?\xb4\x87\xcd\xd8\xcc\xae\
-\xedj\xfe\xd1\xfe\xb92\x9b\xef\xa0\x0f0\x9fa\xdf\xef\
-=w\x0f\xf7\xc8\x88D\xd6\xd5-I]D\xa4?\xf7\
-\xe7\xf7\xf3\xe7\xcf\xdfa\xb08\x07,\xa3\xd0y2\xe4\
-1h\xe8\xc7\xeb\x1dMZ\xc0y|b\xe8\x0cx\x8a\
-O^\xdb_[\x86\xec\x9eNN\x983H\xe2\xa4u\
-\x12_\xcd\xe6D\x98\x8fy\x9e;\xb2\x00\xcf\x8b\xb9>\
-\xf2\x13\x9c\x88\x1dx\xceFs\xcaJ\x8c\x0a#kg\
-+.O\xcf\xf4\x86\xa6\xa1'\x16\xe7\xcd\x18g\x10\x11\
-\x1d\x9a\xe0\xbb5\x90\xa6\xe9\x0c\xdem\xe9Z\xf7)O\
-c\x1ah\x8b\xf7\xb3\x8b\x19\x9f!;\xb2\xd4\xc7\x9a\xd9\
-\xc3\xa9\xbb\x13\xf8\xac\x87\x9e\xaal;n\x00\xcc\x0ce\
-\x98[\xb6\x88\x85\x83J\xde2)Zu4\xba<\x97\
-\x9fB\xd7d\xb1\xa4\xfe4\x0b\x03\xd4:d\xdf\x99M\
-\xb8E`B\xa6\x86f\xe4\xd4\xa7\xa9&(\xf9=\x06\
-\xc8:\x8e\x90\xae\xbf\x95\xa4\x0b\xad\x85g\x8d\xb2h\xab\
-`\xfa\xd2\xcb\xd3\xba?\xa7L\xdb\x0ft\x0d\xed84\
-\x5c\xb5\xc1O\xa6\xdc&n\xc1K\xf3\x0d\xea:5\xe7\
-D)\x00\xf9\x01\x8a\x0a;\xd3\xa9\xc1\x9a\xb7\xb6\xea\xa5\
-\x9f\xa7j\xafY\x8f\xf8.\xe8\xb2\xfd\x01\xaa<uN\
-\x08\x10t\xf77\xad\xf9\xa9\xa1\x04%\x06\xd5\xd0\x80R\
-i\xc8Xj\xddm\x1f\x0fd79ZG\x04(t\
-\x7f\xb7\xeefB'\xec\xef\x5c(\x89mm\xa9\xe1\xe6\
-w\xa5\xe1\x0ea\xa9t\x16'\x09}0\xcb\x0d\xad>\
-\x9aM\xf9\xf4Js\x00\xbc\xcd\x9a\xb6wbq#\xe6\
-\xad\x19\x81G\xa3\x99\xda\xfc:\xfb\xb4&$\xdb\xf8e\
-)\x0e\xed\xb0iMr\xb0\xa0?\xb10,\xe9&\x91\
-\xdc\xddr\x12-]\x04\xb3>]\xa4\x86\xbb\xdb\xcd\xcc\
-:}\x87\xe7RN\x1b\x9e\xcf\x92\x13\xce\xea\x84\xca\xc9\
-!3\xd8\xb1'\xea3\xea@\x97\xeb:\xd8\xa6\x1a\xf5\
-\x969\xd8L\xc2]\xa6\x02u\xa6\x03\x9dk\x11\x11g\
-;s\xb3\xdd]Z\x9f\x1c\x9cw\x9d\x0a%e\xdb\xaf\
-\x91qq\xbe\xe5U\xea|\xadg>F\xdd\xfa\x92\x00\
-yR\xe0\x0ey\xd0k\x17\x14\x92^\x09\x0b\xdeL\xce\
-u\xf6\x06\x16ZN\x0fj'\x15\x94\x02\xdei\xcfq\
-k\x81$j\xfa\xc5\x9b\xd9\xab\xf1\xe8\xd8\xcb\x0a\xceV\
-\xa7\xfb\x05\xc04\xdb\x9c\x17\xa3\x09_\x85\xb7b\xdd\x02\
-?\x15\xac\xe5lv\xc6\x89z\x19\xaa\xad\xbbN\xa2Y\
-\x86\x0ak\xdb\xf6\x8cn2g\xb3\xd9T:q\xd7\xe9\
-\x9b\x05\x1c\x00\xd2:\x98\xc4r\xbc\x1e{\x15\x82\x1a\xd4\
-\xa9\xb6F0\x17\xc2\xdc\xfb\xb9\xb7\xbc\xe4:;\xb5\xe3\
-\x81\xdc\xdb\xef\xd2\x08\xec\xe9O\xa2\x0b\x97g\x97g\xce\
-\xa0\x97\xe04\xdfL\xf1\x9f\x93\xba\x85|\xba\xf9\xb6\xaa\
-{Nb]\xd1\xae hd\xde\x06\xff2\x86f(\
-K\xcdLN66>\x95\x0b\xda\xdd\xd2+i1n\
-\xc7\xce\xd8\xd2\xc5~\xf2\xb2\x9e\xcc\x1d=\xba~2\x84\
-e\x08R|\xce\xe7;\xff\x04\xa1\xf1\x17\xc2n,\xa9\
-\xde\xb2\x019\x9f\xfa\x0b\x09d\xc7/\x89[\xd6\xf4\x81\
-\x9b\x09\x9c\xeet\xcf\xcb\xb4}Ocj,\xbf]]\
-\xd6O\xa6;a\xd33\xc3\xe5\xc9\xd1l>\x1d\xcf\x03\
-\x82'j\x9b\xf5\xdd/\xe7n\xda\x0e\xa7\x9dx\xf9v\
-%\xcd\xcbw/\xa8\x9dfMN\xcfN&\xe3s\xcf\
-\xcf\xcf\xe6\xb3g\x0f\xe8l\xa8[DI\x08\x9a\xcaY\
-\x8f\x9f\x7f\xd6\x96\xd9\x8e\x11\xe7u\xfc0\xb0\xe2\xcc\xde\
-\xee\x03\xadb\xbb\xf1\xf8\xc9\xd3\x1f<\xd9e\xed\xd8\xcd\
-\x96\x17\x09\x9d\xcb>\xfc\x85WT`\xeb\xee\x83]\x04\
-\x95}1yKC\xf1\x8f\x7f\xf8o\x83\x01\x15\x0f\xe9\
-\xebo\xcc\xd7\x9f\xfe\x07\xfd\xf5_\x7f\xeb'\xf6\xeb\xa7\
-\xf6\xeb\x0f\xed\xd7\xbf\xb4_\xff\xbd\xfd\xfa\x1f\xec\xd7\x1f\
-\xd9\xaf?\xb6_\x7fj\xbf\xfe\xb5\xfd\xfa3\xfb\xf5\xe7\
-\xf6\xeb/\xec\xd7_\x9a\xaf\xdf\xfe\x03\xfb%u\x5c\xaf\
-\x14\xceW\xcb\xc2\xb5\x80\xfa+\x10\x87kLK%\xe2\
-p\xa8\xfd\xf5\xc8\xc2;\x9d\xe9iIx\xc3O\x9e\x11\
-|\xcb\x02}%.\xc0\xf6v\xef\xfdhtA\xbb\xe4\
-\xf9\xe5\xc580\xb6\xf1\xach\xed\xa6\xeb\x07M\xb6\x94\
-\xf3\xf2\x9f\x9f\xdf'\x9e\xe4\xfe\x8e\x93x\x93\xb3\x10\xaf\
-\xca6\xb5e\xba\x0dv\xe9\xe6[\xc7!\x0e\x88\x96\xb6\
-\xeb\x1a\x98\xd5\xa6)\x9f\xeb\x13\x800\x8a\x97H\xbf_\
-m\x95s\x96/V\xbd\x84z@\xd5G\xda\xcb\xbc \
-\xb3)\xac\xba\xcfi\xae\x8aw\xddV\x19}\xce\xc0\xcd\
-m\x0cw\xbbw\x15kD\xfa\xc5\x9bk,R\x83M\
-k\x9ei\x9c\x10\xc8\x0f\x1b\xad\xc8\x98\xad\xae\x0f)o\
-O\x96E\x8d\x82\xfb'\xd6\x9d\xad\xfd\x93U\xc4\xffr\
-\xff\xdce\xd3\xd69\xe8\xdd~U\xeb\x80X\xe7\xfb;\
-Fq\xde)\xd2V\xaf\xc5\xee\xdb4\x98\x07E %\
-\xa29\x9e\xb3^\x89\x1a\xf2\x008J\xa6wP\xde\xa4\
-\x1dD\x87\x03\xadz\xe2\x96C\x0fV\xa6Y\x1c\x80\xfc\
-KR+\xf6\xeb\xbf\x8cNI\xc0\xfb_0\xa5\xea~\
-\xce[N\xbd.f/Y\xb0\xff\x94\xff\x06,\xd9\xbe\
-\x98\x9c\x89W\x0f\xfa\x08`;r\x81\x94\xa6\x1f\x0bJ\
-\x83\xff\xc4+\xadr\xff~|}\x1d\x84\xf1M\x1e\x8e\
-\xa4\x9e\xe6Z1\x0f\xd8Zq\x0as\xba)\x11\xda\xa4\
-}\xd8MkmK\xd5\x98]\xf4x\xd5\xf0S\xbf\xe3\
-\xf7y\xfe\xb2\xcb`\xbf\xe1\x1bE\xa6\xccQ\x1fa\x0d\
-\x08c\x1a\xca@\xd6\xbfcM\xc9\xed\xa7\xf7\x1f?\x02\
-\x8f\xb0\xf1\xf4\xf1\x87\x1f>\xd8\xe5\xbd\xa0\x87\xebsl\
-\x82\x90\xb2\xb7n\x8e\xd6\xb6Ig&g\xab4\xea\xf1\
-\x83\xa7\xf7\x9f\xb0\xb7\xe7\x15\xb7\x85 \xfb\xb2\x1bC\x0f\
-\xe2\xd2\xadqy1\xa3s\xfe\xf8k\xdb\x1c\xed\x8f\xd6\
-+\xa8\xec\xf0\x11\x80\x08n\xae\xd6KW0\x97\xce0\
-!\x08W\xd2\x0b]e\x93M\xa4m\xbc\x9e\x9cO\x9e\
-ON&\x17\x9f\x0d\x83W\x93\xe3\xe3\xf1\x94\x0d<\xa7\
-B\xed7^\xd0L\xde\x1b\x9dNN\x08\x0c-\x89\xf3\
-\xf0\x16\xd56y\xa13\x8d\xd8\xbb\xb5\x84\xaaiTm\
-C\xc6\x05[w\xb7\xbf\xff\x83\x1f\x8e\x9e\x1f\xbd\xfd\xec\
-7\x02m\x1c\xf3\xbd!\x97\x17\xc3(\xb65\xdfl\xd4\
-\xfa=\x1d\xa7\x81'%\xfc\xde7\xbe\xd1,0\x1c\x0e\
-)u\xcdj\xd8\xc0\x5c\x0f\x99\x85a\x83g\x0c\x03a\
-C;ipG\x98\x1d\x0e\x08\xd7\xd4\x8c\xe9^\x94z\
-\xad|\xe9e\xa9\xf1,]\x98\xcf\x9f\xcf\xde\xfe3\xa1\
-\xd8h\xea \xb8{\x97\x1a|\x03\xadE\x9e.J\x0b\
-,\xc3N\x9f,N\x18\xa6\x06\xd1\xe2\xe0\xd9C\x94\xd6\
-\xb6\xfc\xb7\xc3\xdbp\x9b\xf1\x82\x05\xd2/\xe7\xb3\xcb\xe9\
-\xb1p3Z\xf3\xda\x8d\xb6\xed+]\x9fI\x5c5\x02\
-C#\xc9\x09\xc7\xa5\xe3\xfcz\x91\x7f\xc5\x1f\xb3\x84?\
-\xe4B\xc6T\xfb\xd7\xd6\x9em<;^\x7fG\xff\xf1\
-\xd7\x07\xbd;\xbd\xb5\xb3\x8bw\xe3\xd3w\xe3\xb7\xefN\
-/\xdf\x9d\xbd}7\x99\xbe;:}wz\xda\xfb\x95\
-\xdbl\xce\xcaE{W\xc7P\x1eks2\x86\x81{\
-2\x87\xdf\xd7\x8b\xcf\xc4]N\xedx\xe5\xe2\xcd\xe4h\
-,\x0e\xeb\x08\xf4dt|\x8c\xc8\xd0\xda\xecn\xd3\x84\
-1\xe0\xa1c4\x92a\xcd\x86\x19\x95\x8f\x84\xf2R>\
-\xec,\xa8J\x1ag\xee\xeb\xc1:\xa5\x1ag\xee\xfa\x97\
-6!\xc5gmb\x1a\x7f\xb0\x80\xf1\xba'\xde\xfd\xfd\
-\xd19\x18\xf5\x7f\x03\xc6\xec4B\xef\x1f\xd0\xc7\xa8\xff\
-\xe2\xf0*\xbfv\x7f%\xd740\x93\xde\x9d\xb5z\x0a\
-\xbf\xec\xb8\xdc\xb5\x98\xac\xe3\x90\x1a9\xcf_o\xe0\xb5\
-\xf3\xa0O\xed<\x5c\x1fp;4\x1b\xfd\xe5\x9a\xc0\x1e\
-Ml\xed\x0e{\x0f\x14\x0c\x5c\xe3v\xf4\x06\xecK\x05\
-\xdf\x0do<S\x98\xa9\x1f7jd\x97s\xc7\xb3\xf1\
-\xf9\xf4\x9b\x17\xb7N\x88\x02\xdc:\x99|\x0a{\xff\xa3\
-\xd9\xc9l\x1e\xc2\xf0_\xa6\xfc\xd61\xfc\xd8\x83\x9a\x84\
-0\xdb\x1c\xc9\x0d#\xe0\x1dt\xd8\xbb\xe6\xc5\xc7a\xd3\
-\xfc(\x0e\x88\xa3V\xeb\xad\xf6BgR\xde\xbd\x93+\
-\x81WN\xbc\xb08\xc5X\xff\xa1.4h\xeeK{\
-mp\x8dcQ\xfc:\xb4#SS\x0d\xce|n\xad\
-\xe0\xe5\xa7\xe4\xd4K\xdb\x0d\xbeX;\x5c\xa1\xef\x95\xd9\
-\x0fP\x93/K\xe5\x99\x22-\xa5\xf0\xf6\xd0\xfae\xe8\
-\xd3-\x13/,\xb8\xe1\xbf\xfb\xf8\xc1\x8eVZ\x19^\
-]o:?\x0f\x16\x95f\x0e\x87n\x1a\xf2\x86]\x05\
-D\xbbj\xb1\x80\xa4w\x16\xbb\xb7\xb7\xf5\xdd\xa7\x1f\xef\
--\x96\xd3\x80\xce\x82\xfb\xdb{\xf7\x9f<],'\xe9\
-\xdd\xc5\xb6\x1e\xed\xef\xef\xee\xdd\xbf\xd7R\xd2\x80\xbc\xc2\
-A\x9fn \xfd#\x183\xcdGg\xaf&G\x88g\
-\xd5L\xeb\x0b\x8b\xb3X\x0e\xeb\x82w\xa6)d\x12t\
-\x09?\x04\x80>\x83\xedb\xa2\x93\xb8^X7\x9c\xc7\
-\xc6\x09\xb9\x13\xd1\x0d?k\x8b\xb3:&F]\x81\xac\
-.-v\x1fr\x01\x1c\xd9k\x81\xa3\xe6\x14 T\x13\
-\x00N\x9a\x8e#\xa9\x7f\xddi\x8e\xe4\xc0\x1d\x08\x9d\xe9\
-\xf0\xdd;\xfde\x95\xe2\x81\x95v{\xdd\xdd\x96\xfbM\
-\xdd\xd6ag/B0\x9bM0\xd26;\x8b\xc0\x12\
-\xba\xa5\x00\xf7k\xd3\xb3\x99h\xbb?5\x0a\xe1\x9f\xb0\
-\xbb*\xa7\xa1~\xfc\x97\xd5i\x98\xc5\xf0\xa5)\x99\xc5\
-\xb4\x94\x9e\x1d\x8d\xa6G\xe36Z\x16n=x\xf0\xf8\
-{\xbb;\x1c\x0am6\x1f(\xd1V\xd3\xdf\xce\xc1 \
-\x00/A\x1f]\x03\x15Z\xffe\x03u\xfd\xcb\xe1\x82\
-\xc3\xed\xadG\xdb\xbb\x0f\x867\xf4\x7fS\xb2\xb1\x9b\x19\
-#\x02s4\xc4\xc1\x99B4&\xd678\xe8\xf9\x97\
-\xaf1\xbf\x864\x06\xd4<\xe7-\xcfc\x15\xb8\xdc^\
-+\x17\xfb\xe9\xf8\xb3\xd7\x1cy\x1b\xc5\xc1\xc8\xea\x02\x07\
-\x03\x04_3\xad\xd3sr`r\x1fD\x87\x87l\x8b\
-=\xbf\x1c\xc3\x1c\xc8\xa6+$;\xbf\x86\xa0%\xc1\x8b\
-\x111v7\xe4S\xcc\x86{5\xb8\xd9\xadv=e\
-\xba\x0e\x97\xde0dh\x07\x07\xc1\xb6\x8c1\x1b\xf7<\
-z\xfct\x0b2\x06\xd8\x04\xdc\xdf\xfa\xf0\xf1\xa3\xad\x07\
-\xfbO\xf7\xee\x7fw\xf70|\xbe\xbc\xc0\xce\xe3\xef=\
-j\x16y\xfb\xf9\xea`y\xe8\x8dH\x05'\x9e\xd0\x04\
-\xe9\xd3\xd9M\x14Y\xf25\xcd(g\x17\x12\x10F\xa4\
-7X\x1a_\xe0\xa2\x04\xbe\xbemi\xae]\x19\xfc\x03\
-\xf3q-+\xb4)\xf8\xd1\xc1\xa5\x17X\xc2\xeb\xd0t\
-oi\xc3eU\xb6z\x94\xf9\xfa\xba\xf49g\xb1\xce\
-\xb1\xb5\xb7\xf7\xf8{f \xa4\xe9.[\xcc)~x\
-\xb3\xa0/\xee\xf5\xed\xddI~6\x03\xb45\xdd \x9f\
-_\x9e-\x1d\xdeP\xaaZ\x9d\xf2\xcb\xaa\xfb\xb2T_\
-\xb0,\xa7\xf8 \xe1_<\x98\xaa\x14\x0f\xaf\x0c\x8d\x0f\
-\xb2\xb3\xb7\xd0\xad\x9d\x1f\x8f\xa1\x96E?\xa8\xc7\x9c\x89\
-H\xc0\xd6\xd9|r\x04\xd5\xcd\xf7\xef\xdd\xbd[\x95t\
-\x9f\xda\xfa\xf5\xcb\xd1)\xa2\xb7\x8c)1\x8a\xee\xb2N\
-\xfb\xdd\x09\x02.\x9f\xbf\x19c\xc0\xdf\xdf\x8e\xd2{\xaa\
-\xa0T\xa8\x9b\xd1\xef8V\xbb\xea\x1e~_\xa2P\xbc\
-\x13\xdf\xabb\xf9\xf9\xe1\x9cU\xdf\x80(\xc13:\xd2\
->\x99\xccN\x18OZ$\x15g\xa46|\xba7>\
-\xa6\xa4\xbby\x12\xe3I\xf9.\xab\xe2\x05\xef\x17U\x9c\
-E\x11\xb4\xe6\xe6\xd3\x8b\xc7\xf3\x11k\xc2\xbf\x7f\x8f\x92\
-\xf1\xc8\xbc=:\xa6\x85-\xb5\x16i\xc1J\xc4\xdb\xa3\
-\xf9\x94\xd7\xe8\x93\xc9\x14\x8d\xbb\x17\x97\xacu\xb8=\x9e\
-_\x9e\x8cG\xd2\x98\xadx7\xa1\xa4\xd9|\xfa\x02\x8e\
-\xe9\xe7\x1aG\xaa\xeeF\xbb\xc8\xfb\x99\xc9\xb7\xbbK\xfd\
-\xda\x19M\xf1\x02\x8e\x99x\xff\xde\xce\xddm\xe8\xc8\xed\
-\x8c\xe6\x9f>\x9e\x1f\xbd\x82\x82\xd1\xfb[i\x96@;\
-f\xf7t<\x1f\x9d\x1cK\xd1\x0aZ\xd1\xf7f\xd0-\
-\xa8G\xa1\xba\x9b\xd1D\xde\xbb<zu>\x19QJ\
-\xb9\x9d\xe4\xd0\xa1\xfd\x90\x98\x81\xf1t>C\xd9{\xf7\
-v\xee\xa1\x8a\x0f\xe1\xf2/x\xbfJ\xab\x1c\xd6-5\
-\x92\xad\x1cz\x85\xfc\xfb\x07cx\xd6\xa7\xd4\x9d{\xbb\
-yAM\xff\xce%\x9e\xc0\x9d\xbc\x15\x06\xe5\xc1\xe8\xf5\
-x\xca\xf3\xff\xfe\xbd\xb4\xdae\x05\x16\xba\xb5\x9al\xe5\
-\xcev\x91\xec\x22l\xf0K\x22\x97h\xd7\xeev\x14\xa1\
-]\x0fG\xaff/GS\xb4c\xabJR\xcc\xf2\xc3\
-\xd1|\xc6C\xb1u/a\xdd\xc1\x87\xe3\x13\x19\x9a\xb2\
-\xda-\xee\xd2\xef\xc9\xf1\x14[U\x0fj\x14\xe5\x05T\
-\xa7\xe9f\xff|<\x9fkT\xdb0\x0bz4z\xfd\
-Y\x9dk\x17\x0b\xe4\xf1\xc9\xe4\xb5mW\xb2]F\x89\
-\xa2D;\xf1Y\xc9\xd6!\x92 KfwG%\xd9\
-\x16\xd2\xccl\xdc+b\xa8\x92<\x19\x8f\x8e^\xc9j\
-\xc9\x91\xe1\xc9x>yC\x8b\xe2\x84\x97KU\x14\xa8\
-\x8fV\x893Z\xe5]\xe8p?9\xb9<\xc5\xc0C\
-\xbd\x8f:\xac\xa3*\xdb\x86\xdee\x1b\x87'\x97\xf33\
-\xc6TUi\x01\xc5\x8b\xbd\xd1\x9b\xfd\xc9x:\xc5\xf0\
-UEJ\x1d\xa24\xd3\xc2\xbbP;\xa5_uO\xe2\
-\x9c\xedX(\xcd\xee\x87-\x15\xa7\xb0l\xd8{5;\
-\x1e\x9d\xca\x0e\xdc\xbd\x97e\xd0\xb8\xdf\x9b}6:\xb1\
-M(\x14t\xfb9\xcd\xb6#W\xc9\xbd\xaa\xa2\xd4K\
-P\x04Ss\xa4\xa0B\xbc?:9\x959\xca+V\
-\x08\xdb\x1f\x8f\xec \xdf\xbb\xbb\x8d\xa5\xba?>\xe3%\
-\x99\x17\xaa\xc4\x96\xdb\xff\xd4\xccM\x9aogPU\xd9\
-?\x83G&Sn;\xdf\xd9\x86\x16\xfdS\xde+;\
-[\xd5\x0e4\xcc\x9f\x8e\x9dfn\xedBu\xf4)\x11\
-\xe6\x0bn\xe2NY&P\x0fzz9\xff\xf5\xcb\xd9\
-\xe4\x5c\x8fg\x0a\xc3\x03;\x0aY\x99\xb2\xb9\x80$\xe8\
-~\xd0\xc4C?\xea{\xaf&\x17<z\xfc\x7f\xf4{\
-rr\xbc\x7f1\x1f\xbd1+kw7\xae\xd0(\xbb\
-/([\x8c\xdeH\x82i{Uno\x176\xb5\x9e\
-\x94\xad\xadXm\x05\xec\xe5i\x9b\x19i/\x8c\xf8\x09\
-N\xc6\xde\x15\x7f\xbe{'I\xc3\x00g\xe6q \x22\
-\xc1\x17\xe2W\xe5  \x04?\x928\xe1\x1c\x0a\x80\x19\
-\xb2\x17Smp\xed\x0a\x9f>\x9e\xeah\x06\x5c\xdfC\
-\x14\x08\xc2\x80\x7f\xdc\xe2\xe2\x12\xfb\x00A4l\xd8\x03\
-A\xdb\x0b_L\x1d\xdbe\xb6~F\xc3\x7f4\x7f\xf9\
-\xbcn7\xfd\x106a\xef\xc3\xbb\xc3\xe0\xfd`3\xc1\
-\x13\x1b\xa5\x0e\xe9\xbf\xd5\x84\xb1\x86\xd3}v\xfeAH\
-\xff\xd5\x0c\xb2vZ\xe0\x89\xef\xd04\xe2$\x94\xed\x04\
-\x1f\xb3\xe7\xec\xb6L{z\x91n\xcd\xc7\xbf~9\x99\
-\x8fo%\xb7\xc4v\xf8\x9cJP\x93\xe0#\xd3a\xda\
-\x89\x07O\x84\x07'\x18\xb8\xeeZ\x1a\x5c\xcb\x81\xdf\xb1\
-d\x18B\xdf\x96\x01\xd6\xd2\xbd\x9d\xf1\xd1\xe4tt\x22\
-\x16\xa3\xf0\xb9-\xc94\xa8\x9c\xae\x1b\x11h\xd1\xee\x14\
-b\xc2\xf3\xf1=:\xd4/\xd6\xa4\xe6\xde\xe6\xda\xf4[\
-\xd1\xbbw\xd3o\xe3Q\xbf\xb3\xe3\xf1\x8d\x1dg\xe76\
-\xcf\xe1\x88\x9d\xf5\xc2\x11\x10\x85\xce\x97[\xff\x22\xd1\x03\
-\x10F!q\xf1\xf0h\x8a\x83~\x83\x0e(\xaa \xce\
-\xb2\x0f\xa6\xbd\xda+\x9a\xca\xed,|+\xa6\x1b\xc2t\
-\x18D\xc1\xfa\xb4\x17\xd24\xaf\x0f\xa7\xe6\x0e@\xbfd\
-M\xd0\xc7?\xd35Am\x5cuM\xd0\x22X\xba\x06\
-\x16&\xbfu\xd2\xefO\xeb)\x9f~\x9b\x06\xfek\x9b\
-mt\x0d\x11\xac\xb2L\xe6{\xfa\xc5\xe7\xf7\xa5\xe7\x1e\
-\x18\xbfzW\xf8\xb7\x1e\x9b\xf3\x0fZ\xb6\x0c\xa5~]\
-\xbb\x86\xdb\xa0I\xdf/`\xe7\xbcdg9_j\xeb\
-\xd0NX\x9f\xe2\xffeH\x99\xae7\xe5`\x9e\x8fZ\
-\xe6\xa17^\x8d\xce\x1f\xbf\x99\x9a\x97\x03\xc9w\xc7\xc9\
-p\xc0/\x13\x12x\xd7\x0a^\x1ab\x13<%\xe1\xb5\
-G\x17c\x1f\x19:kxIw\xf7a\x0b\xc0\xd9\xa8\
-\x1b\x1f\xdc\xe1\xf7\x9f\xc3\x0fz\xd8\x9e\xbf\xa2\x02<\xe0\
-\x1d\xc7z\xf8\xaf\xdc\xe7$g\x8a \xc7_\x07zs\
-\xb7\xaa\xdf\xa4\x9c\xf7\xa8\x96\xaa\xaf\x7fY\xa2\xa2%\x81\
-k\x1f<\xde\x1b.\xbfPmr&\xac=\x94\xbeA\
-4\xc2\xa7\xbf\xacGQ\x8d\xd1)x\x88\xd7\xa9r\x1e\
-\xebt\xc64\xd6\x10N\xe3\xe7[N\xc0\x13n\xf8\xa2\
-N|aSo\x12[\xf8<H-\x8a\x15\xd6\xa3\xc3\
-\xc1,W\xd4\x15\xefF\x802\x12\x86\xcb\xd1\xcc\x0d\x83\
-jo\x9b\xae\x0b\x1c<=\xf5\x5c\x9d4\x1d\xe5V:\
-\xcf\xff\xd2=\xba)\x91\x95\xba\xe4\xbd\xac!n\x0d\xed\
-8\xfe2\xbaG\x97\xada[[\x97t@\x86\xa5C\
-b\xb2I\x08\xef\xb4\x95\x1d,\x86\x00\xb3\xb0\x05\x81E\
-\xeb\x03\x9f;\xc2\x10\x099\xeb\xac\xd5\x81->\xbbt\
-\x00\xfda]\x88\xc0\xf2\xa2kPe855\xe3\x1a\
-\x0e\xdb\x87XxP\xb3\xba?w\xfb\xac\x02\x95\x1f\xaf\
-\xaaC\x15\xac5l\xba\xa3\xda\x85\xb0n\xed/\xa5\x8d\
-\xb6k\x0e><\x92P\xe4\xba\x90d\xd2\x04\x8f\xc3\xc6\
-\x87/\x96\xf5\xec\xc5\xb2\x9e\xfd\xd3\xef\xb6QX\xd6r\
-\x22\xa8\xdd\xeaYg\xc2/\xc9\xeb\xc1\xad\xf3\x19\xce\x7f\
-\x03]@\xf6\xe2\x861\x5cY\xd8\xc6\x8c\xc0\x97\x95\xb5\
-\x01\xc9RQ\x9b\x96\x0d.}]\x11S\x08\x15\xfe3\
-\x7fe\xe1\xfe\x0co\x1a\x07\xf3\x80\xb1\x5c5Ig\x1f\
-\x04\xbb\xba\xdc\x0d\xe7\x98\xce\xd6\xb6m\x8cD\xb9ss\
-t\xca\xb0o\x10`/\x8a\xdfk\x86)\xc4\x9b\x0f\x02\
-\xccCI\xe8\x17\xfbN\xc4\xe3\xdb|\x1er\xdfw\x9c\
-o\x87\xc3\x0b\xd66>\xe8\x05\x96\xb9\xfb\x8a\xdf\x93\x02\
-^\xe3^>\xb8\x05v\xb2\xdd\x81\xebN;W\xee\x0f\
-\xa2\x09\x97gp\xd41\xa3\x1d,x\x06\xcb\xdf\xa7V\
-}\xfeX\x95Vh\x04_\x96Zh4\xcb\xe9\xc5\xdb\
-\x8b\xb3\x17\xe3\xc9\xc9/\xc5<\xa5\xa9?\xb2\xd9\xa6\xb1\
-\xf0v\xd1\xb6\xf0 \xb0\xbd@\x1c\x13\xf1I\x15\x1c\x86\
-o\x17\xcc\x13;s\x9e\x8e\xce`\xb2\xd6\x09?\x99\xc1\
-\xd0\xfart\xb2\xa4\xb2\x19B\x18t\xc2\x1f\x8d\xdf\xd0\
-\xe0.m\x86KdV\x1bk\xdf\x8d\x977\xde-\x16\
-_2\x9c\xe1\xf2\xa1\xb4\xf1\xc8\xf3\xa8\x0cU\x1c\xaa\xbc\
-} \x9d|y\xa8\x8aP%\xee0\xd6P\x95\x86y\
-X4\x86\xd0\x80s\x15\x16\x0c\xb4\x83W\x17LS\xae\
->\xf6\x87.\xa0\x1f4x\x92\x0b1\x84z\xad\x04\xd9\
-\xc9\xd5\xca\xa5\x9dw\x91c\xbe\x12vr9\xaf\xba\xf9\
-\xf2\xf3Z\x12\xf1L\xee\xaa\xeb\xef6X\x1d\xf1\xdd;\
-W\x1a\xe0tF\x8b\x8c\xeeM\xe6t\xed\x1f\xb5\x84\xdf\
-y.\xeax\xd3\x8b\xf9\xec\xe4\xd69\x0d\x1e\x82\xab\xdd\
-B\x85\xb5: \xda\xeb\x09\x0d{\xe1\x9a\x15\x16vW\
-\xcc\x8a\x85t\xb7\x9b\x1ew\xd5Lsn\x22\xfe\x9cS\
-\xe5\xb0.\xbf\x18\x1f\xdfz\xfe\x19\xb7\xe9\xf4td\xdb\
-@\xc3\xe2\xb5\xe0]\xf4\x16*\x99[\xfd{\x87\xeb7\
-\x8e@\xc2\x1e\xb3'\xf3\xe3\xee\x11\xa0\x1b\xfc\x11\xb1\xdf\
-\xb7`\x804:B\x8c\x08-\x96\xb1\x0d\xf0C\xa2\xea\
-I\x94\xa1\xd1\x81\xba\xc2@\xa6\xcfJ\xc0\x10bd1\
-\xc2\xa9Y~\x08\x8ab\xb32\x22\x8e\x84\xdeH\x22b\
-\x7f\xf89\xc8\xb8\xa6\xad_\x9a\x8ek<>!\xff\xc2\
-D\xf9\x93\xdd\xbd\xfd\xfb\x8f\x1f\x0d\x0d_\xf8\xc5\xf5\xff\
-\x96\xf3T\xe2jj69\x1a\x8bM\xce6\x7f\xdf\xc4\
-Y\xd59\xdb\xf6\xf1N+w\xf4\xb45u\xbf=u\
-\x7f\x05\xd3\x15\xeab\xdd\xfa\xb5\x9d\xf0i\xb8O\x05\xf5\
-\x09\xde\x84\xcbs?b\x0b/8\xbd\xf6\xf2\x05Ps\
-x\xc2\x06\x06\x88ls\xd4\xe8$\xeb\xf9\x88A\x9e^\
-\xa5'c\x86\xf4\xfc\x98T:u\xd3\xa8\xde\x11\x9e\x19\
-|\x10\x99l\xf1\xa6\x97\x0c/\x9bl\x22b\x0a\x12?\
-(\xe2\xc8\xa1\xf1\x83\xfb\x09\xff\x5c\x0b\x5c\xcf\xb5\xb4\x7f\
-\x9c@\x86Ao\xb3./\xa5\xdd8\x87\xdf\x8e\xee\xb0\
-x\xf2t2]K\xc2E\xf8\xba\xea\x0dt\xaa[\xc7\
-\x9dh\xa0\xac\x18|J\x1b^\x87f\x12\x97\xb9\x9bH\
-A8\x08\x1c\x95\xef\x0d\x87\xf8\xc9~\x877{\x9cw\
-*\xc6-\x92\xd7\xf8\xdf\xe4\x22k\xfeH\x0d\xeb\x91\x0c\
-\x1bC\xa3B\x0b\xbb\xd6\x9f\xae\x84\xd4\x97\x8e\xb2)\x9f\
-A\x80u\xd1;D\xa1\x0b\x9ad\xb1\xda\xac\xd5\x89\xe7\
-\xe3\xd7\x8d\xf0[\x1a\xf7Zo\xc3)!\x19\xaf\xc3\xc9\
-9\xc7\xe6\x81:vW\xe5\x0e\x02'\xf7\x1a\x17v\x82\
-X\xacT\xdc\x0bz\x01\xe9\xc6|\x85j%\x9f\x1b\xdc\
-\xa3\xb3\x06\xc9\x88\x22\x173\xd8\x1c::\xd9\xb0\xa3\xd1\
-\xc5\xf8\x87\xcc82\x89U\x10\xf5L\xe7\xeam\xd4\x86\
-\x1e@\xb8\x06\x8172\x0a\x98\xa1b\xb3\xf3\x02\xc7)\
-\xdb\xe9h#\xa0:A\xdb\x0b\x9d\xd2I3aW\x00\
-0^\xad\xed\x88\xea\xf4\xe1M\x05\xc3\x9b2\x0c\x03m\
-C\x84^\xef\x7f\xf2\xe1B\xf8\xa2\xd7/\x1b\x9d\xa1L\
-k~\xc09J\x81kov\xa3M\xf9\x09\xdf\xeb\x97\
-@\x87\x90\xc8\xb3\xa9?\x94X\xeav\x06\xea\xcd\xb3]\
-\x8f%[Wq\xb6\xb0\x06\xbd\x920\xd1,\x99k\x87\
-\x89\xf8\xa3\x09\xa3\x8b\xbf\x98B\x01\x10z\xbb\x00\xe1\x88\
-B$\xa3\xa9OhEO\xc6o\xba\xa7\xfdV=\xed\
-O\xda\xe6=\xacAn[\xdba\xd2\xd6&\xcc\xb6\x15\
-\x80\x96\xb6\xf2,\xadz\x88\xd7\xf4\xfb\xcb\x1e\xe35\xa6\
-\xa57\xb2\xd31\xdd=\xdfL>\x9d@\xa5\xfb\xf5\xd1\
-W\x7f1[\xd5;\xae\x9c\xe2[[\x8e\xfd\xec\xff\xfb\
-{t\xb1\x19\xd1\xad\xc0\xb3\xa9\xa5\x84\xb3W\x1ap\xfe\
-\xd9i+l\xeb\xe4\xec\xd5h\xc1\x12w~z\xb5u\
-\x8d\x92\xd3c\x0fvB\x09\x9c\xfc\xd2G\x06M J\
-\xbf\xfb\xfc\xf9\x02\xaa\xe7\xcf\x01\x10\xe7\xb9\x0b\x95\xdcE\
-%PO^,\xf6\x02\x10\x84kp!H\x18_\x10\
-d\xbb\xa5\x9e\xabm`\xdbf\xcf\xb3\x0b5}\x1f\xb0\
-\xa3\x13\xe2L=(\xa7\x5cN\x80\xf2\x88x\xd9\xf3n\
-\xb4\xbc\x8e\xdev\xc2\x8ff\xf0J\x5cC\xff\xcb\x9fs\
-\xa1F\xe2\x9fQ\xe2\x0e\xdc\xe9\xcf=D\xc7\xc7\x9c\x06\
-\xa0vw\xec\x94\xf9+J>&&\xdd/a|\xd3\
-\x00\xb8\xd5\x00\xee8\xc0\x9d\xd1\x12 |\xbfL\xd8\xeb\
-Y\x0d\xd7<>\xf1\xd6Wo\xe3\xadh\x07\x9d;^\
-!\xe3.g\x14\xb7\xb2\xfe0\x9aD\x19\xe6\xf1\xe9\xd9\
-\x85\xefN\x85S\xceyZw\xad\xaf\xe1\x85\x09d\xfc\
-\xbb\xed\xcb\xe8#\xc0\xc6\x97\xf3\x99\x03\xfc\xc7\xdf\xf9[\
-$\xc2\xad\xac_\x1b;\x9a%\xd0\xcb\xf1\xb4\xb5\x88N\
-\x9f\x9a\xfbu+\xf4\x0d\x22\x114a\x1f\xb5\xad\x0en\
-\xdb\xab\xad\x91?\x0b\xbe\xfb\x1b\xe4h\xce\xd3I3\xc7\
-G\xcd\x1c\x8b8\xc60}\xf4\xf2H\x92\x8c\xfc\xe4t\
-\xf4r\xecA\xef\x9f\x22yJ\x14\xc6K\xa6\x94\x8b\xcf\
-\x08r\x7f\xd6>\xdc\xf7\xd1%\xf8\xd7l\x94\xa2\xd4\xef\
-\x8e\xfc\x15o\xcb|\x17e>m\xee\x87\xff\x09E\x9a\
-\x89\xff#%\x9e4I\xcc\x89\xa11'm\x03eF\
-\xe0A\xdb\x18\x19\xe0\xc9\xd62\xe0\xfc\xc6\x09x0\xbf\
-q\x06N\xe6[7eyx\xd96<\x0f1<\x8f\
-\xda\xd6\xcf#@\xa6\xa3\x8b.\xea\xc4\xf0G\xadH\x19\
-\xf4\xb8k\xaf\xcd\x96n\xe88\xe6\x0d7\x9b\xdc\x90\xeb\
-\x9e\xce\xb5<[\x12]\xeb\x1a\x8f.\xe6G'\xb3\xa3\
-O\xdf@'oI\x81\x84\x0b\xbcx19\x9a\xd0Q\
-\xd5\xb6O\x1f\x9fN\xe8g+\xadx\xcc\x85\x1b\xd3\x89\
-\x87\xf9\xf0\x89\x93\xf6\xf7\xff\x89\x12\xcehO\xc8\x1bK\
-\x0d\x08Bu\xc8F\x95\x1e\x02$P[P\xe6\xe4\xf2\
-\xfc\xd4\xaf\xf8\x0c;\xe9W\xdb\xe6\xe7W\xd1\x96\xbd6\
-\xc8\x1e \xf3\xe6B\x9f\x9b\x85\xbe\xb0\xda\xbce\xb4\xd7\
-\x84\xee\xb9\xd0\x85e\xe8C\xc7#\xffX\xdd\x1b\xeb\xd4\
-\xf3\xcev\xee-\x87\xbe\x9a\xb5\xcd\xc3\x13\xc0\xce\xc5\xaf\
-\xb2s\xe6R\x02\xd2G\xa7g\xeeQ\xfd_\xfe\x0d%\
-\xee7\x13\xff\x1a9\xe9\x02\xe3a\xd8G\xe2\xd9\xe8\xb8\
-\xe1\xc4K\x92\x84\xd8\x9d_hO\xf7\x16\xd3_\x02\xfd\
-B\xea_\x04\xec1\xd0\xc7\xc3\xae\x01\x050n\x81\x8c\
-\x7f\x9dagM\xd8\x99\x81=\x1d\xb5\xee\xc7\xa7\x18\x0e\
-hx\xb0\xf3\x86\x93\xb1h\xbd8\xeb\xfa\x8f\xfe\x06\x19\
-\x10i\xa0\xc9\xae\xc1Q*\xd2\x09~\xd9\x9cy\xed\xbb\
-\x0e\xa0\xe6\xb4\x7flA\x1f\x8f:A\xf5\xce[h4\
-\x07@~-\xee\xb1\xaf$I8e\xfa\xf1\xea\xf2\xe5\
-\xd8n[\xf8my\xf6,\x84\xef\x16'\xe5\x86\x9f\x5c\
-\xe2\xd9\xb3\xe9L\x87r\xc6\xb6\xa3\x8e\xb6\xb2R\xf0\xc4\
-\xd8:\xa5\x04`\xba\xb2\x0aQ\x891\x01\xaf\x11\xd0\xcf\
-\x9f\xb9Sbo\xaep\xc6\xcc\xd1%\xf6\xbbz\x1d\x84\
-\xd1a\xf8f<\x19\xcf}G5o\xce\x08\xc7\x0f\xdb\
-v\xc2\x0f\x81\xfd\x87\x1d\x9c.\x80ZJ\xfe\x85\xee(\
-\xfe\xe5c\xf9E\x85\xe6hL\xf4\xe8\xce\x17\xaa\x88\x0b\
-3\xfe\xc1\xda\x0d\x15|Q\xbb\x11]>\xbc:\x19\xbf\
-\x1c\x1d}\xc6Q\x93\xafo\xea\x8d\xd1\x0f\x902w\xd6\
-\xbe\xbe7\xb0\xed]\x9b\xfe\xf8\xf9\x8f\x89\xf68\xe2C\
-\x89\xeb=\xa0#\x02Agh.\xf0I\x98\xf0\x07!\
-P\x07\x10]\xc1u~\xc0T%`/\xb5:\x81\xbf\
-8\xcd\x8f\xb4'8m\x5cw\x8e(.\x7f\xaeC\x96\
-\x86J0\xb3\xab\xa0\x1f\x0c\x82\x87p\x8eO\x0bk\x9d\
-\xbe\x9f\x9c\xf0\xe7\x1a}>>\x83\x03\x98\xa0G\x9f\xdb\
-\xfcN\x1e\x06\x07u\xf2\xa1\x93\xfc-\xfa~0>G\
-\xc1_\xa3\xcf}\x22cs\x11\x09\x06\xe1\x8f\xf0\xfb\xb9\
-\xf9\x15|@\xf0\x9d\x19\xbe6\xec\xd7\x90\xbe\x10<\x07\
-\xba\xe3\xef\xa3\x0d\xe2\x91\xe1WD\x94\xcc+\x1e\xad\xd4\
-\xcb\xff\x16j\xe0\xa8\xb1\xd7\xe1\x96\xb8\xd2\xa4n|\x9b\
-R\x9d\xc3\x8c\xda\x84\x9e\xd5|\x1c\x12\xbe\xadS\xfc|\
-C[\xd4\xf5%*\x10\x80\xf6\xda@R\xeaA\xd35\
-\xa9\x1e\x00C=\xc3\xd7\x83\xa0\xbeU\xc1B\x19\xf7\x18\
-\x19\xf4\xbe\xee\xf8Pw\x9a\xf8\xa8_\xbf\x9c\xbc\xa6_\
-\xbf\xc9\xbf\x08\xf1\x19G \xc0\x00\xfcf\x9f\xd3\x9e#\
-\xd2\xd3\xd5\xf6.\xebb]_]\xbb\xb9\x9e\xd1\xff\xf5\
-\xd9\x19\x95\xcd\x80\x82C.8\x1f\x11\x15\x8bO/\xaf\
-V\xc2\xb1\x80\x881\xf5\xfb_\x15\xaa\xfeo\xde\x88\x8a\
-\x8b\xde\xd0=\xa0\xda\xd8\xc02\xba\x12\x06\xe0\xba\xf9W\
-2,\xcb\xe1\xe4\xe4\xe5\xe1qDz\x11\xb9\xd7\x810\
-\xb8sG\xa6\x07\xde\xc4\xee\xdc\xb9\x0e\xf4~rE\x80\
-u\xd4\xd4\xf1\xdba\x10\x88T\x0a;y\xf8\x9e\x12\x81\
-\xfd\xe4[\xce\xc64\x8a\x18^\x10w\x0d\xd2n\xf9\xa4\
-Po\xf3\xc8<\xc5\xf1\x1b$\xbc\x90\xd4\xef\x1b\x0f\xc6\
-\xb0r[\xeb\x0d\xeaL\xf0\xa8r\xdb\xcd\xa3#\x95K\
-\xf0\xc4\x83\x80\xd3\x82\xf5\xb5:\x03\x93\x85\x83\xa3\xc3w\
-\xef\x82\xc7\xf0\xba\x1e\xf4\x0e\xd7\x8e\xfc\xe8s\xf7&\xd3\
-\xc9\xf9\xab-\xea\xce\x1a\x9eu\x8cF\xb4\x1e\x07i\xc5\
-B\x94D\xa7\x90.\xf2P\xbf)\xbe^\xbb\xf5\xeeW\
-z\xa6\x954b\xebC\xcc\x96\xd6&\x96\x0d\xbe\xf1\x1a\
-n\x9b\x06kN\x16\x1bB\xddC&O\xb34.\x1c\
-:\xdd\x19\xf7\xa8\xa7\xdb'#\xd0\x14\xd8j!\xe5\xc3\
-Z\x15_\x5c\xf0X\x0c&\x82%\x11\xdb\x9e\xf9\x18N\
-7\xe1\xc9f\xb1\x83F\xdb\xf2\xe8U\x03\xedm\x8bX\
-\xfb\xf6a\xd5\xbb\xf9\xe8\x08\xfd\xc1\xdf+\xe8p\x07\xd7\
-\xf4\x873\xd4\xaf\x9e\xe8\xcf\xa6\xd7}\x8fo\xc2X\xc8\
-S\xce:\xd0\x08\x8a%_\x81\xf8\xe0\xa9\x11j\xd1i\
-\xdb\xba4o,\xa6b:\x11\xae\xf5`\xf2\xc1Q\x8f\
-\xe5\x11?k\xbdg\x07Mk\xe6O\xde\x1b\x0e\x17\xd1\
-\xf6\xd57\xbeA\xb4\xbc\x01\xf3\xd6\xfb\xba\xea\xd5^'\
-\xbc\x15\x84\xcd:\xf4K\xea\xa1\x92\x92a\xdc\xf3^\xd2\
-&\xeb\xc38|=\x9b\x1c\xcb\xcf\xad\xe3c^Xk\
-\xc0\xd3s\xc7\xf5\xaa\xef\x8d\x0d\x9d\xb2\xeb\xc3#\xbdg\
-\xd7\xd7u\xb7qFz\xbd\xb6=\xbe\xe3\x94\x1a\xacu\
-\xac|\xae\xe9H\xff\xa8\xb1\xd2Y\xb8\x88\xb4\xa3\xb4\xbe\
-\xf1\xdc\x0a\x9aH\xf8\x18]\x1d\xcd\xd5\xf0z\x01\x05\x9f\
-\xbe\x9f\x03\x85>\xb8\x16\x11\x81QX\x8e\xa7s\xa3\xac\
-\x1d\xbc\xfe\xb5\xc3gD\x156\x19\xba\x8c6\x1c\xc8N\
-\xd1\x0bG\xf5\x0e\x17H\x05-\xfb#\xdb6C\x07\xb6\
-}\x95\xbe\xee^j\xfa\xe1N]M\x5c\xea\xce\x82\xfd\
-Y\xa1\xb3|\x8a\xf8\x9d]#\xc6\xe4\xce;0\x1b\xf4\
-/\xfdA\xaf9\xdb\x1d\x7f\xadrZ\xcf\xed\xd9b\xaf\
-\x1c\xce\xab\xb9-i\x18h\xc7\xac\xb5\x1e/\xeb\xeb\xfa\
-\x80\xe9\xe9v\x13\xcaM'@8u\xe3x\x0d\x8e\xf3\
-6\x83\xfe\x06\xd0\xb8\x0b\x1d{\xc6\x1e\xa3\x83S\xfb$\
-\x0b\xd8\xf6\xee\xdaiO\xfb\xb9\xec\xb9\xb6YW\xfdg\
-\xd7\xb7i\x1b\x07=\xed\x0e\x0c-\xbc\x05\xd4Gt\xf4\
-\xf0\xdf\xde\xb2I'6\xeb\xd0\x9b\x06!\xc5-\xb4\x9c\
-uV\xfa\xcf60\xacS\xafqSK\xc7,\x83\xda\
-:hK\x07\xcc\xd4\x1f\x9aS\x81;\xed\x8f\xda\x0d#\
-\xd0\xd9t9-\x9cF?w\x1b\x0d\xdex\x95\x05l\
-\x1b\xc7CY\xb7\xec\xa8g\x11\x11c\xbd\x22\xa6\xae\x1d\
-[+E\xb1F\x10M\xe5&\xc7\x11~N\x1c//\
-\x18>\xef\x1a\x84v\xd3\xce\xfcqw\xbe\xa1\x9b\xef\xa2\
-;\x9f%Cun?\xb3\xf6\x024=n\x0c\xf2\xd5\
-\xc6\x07wh*\xd0\xea`\x93\xe1\xf8\xc7\x1e\xbd!\xff\
-\xd2gV\xec\x93>\xc3:1_\x7f\x80\x8c`\x9c\x1c\
-\xe6\xb0g\xcfZ\xd9~m\xd4\xec\x8a\xf8\xc9\xeb\x1a\xe8\
-\x1f\xb6\xd7M6f\xe0\xd2!.a\xd60\x0b~V\
-\x9bEC\xa0\xc1\xe1\xadL\xe9\x8f\x9c\xe2\x86(\xd5\x85\
-\x85:\xb9\x1c\xac\xe5\xc9\xb6\x9f\x1e>;\xa0\x85|d\
-\x16\xf2\xa4\xdf\x0f\x8f\x86Gf3E\xda\x0f\xe8\xe8\xf9\
-\xec\xf5\xb8\xa9-M\xad\x0a\x9f\x8fO\x0c\xd1\xf4\x00\x9b\
-\x0e5\xd5t\x81S\x0eCF\xf5\xee\x1d\x17\xbc\xb3\xc6\
-\x7f\xa8r\x06\xd2\xb0\x1e\x04\xeb\x9c\xb4N\x97X\x180\
-\x00\x89\x91\xaa\x8cOhJ\xde\xd2\xc4\x9a\xcc4\xc9\x8c\
-\x8d\x1d\x87\xf2?\x03[\x02Z\x8f\x04\xe6\x9c\x819\x8c\
-y\xb08\xed:\xac\x87\xb2\x1e)\x8e_\xedx\xd3\xba\
-<\xd3|\x12\xad8\xfd%\xf7{\xf7\xc7sa\xad\xb8\
-\xac\xe1E\xb1$\xb4\xc3 \xc3\x0bQ\xdd5\xa7z\xe6\
-2\xad\xc2\x0dmZ\xfeL\xaa09\xa4\x0e\xb8\xfaq\
-Q\xd1Z\xbej\xfc\xbe\xf6\xabr\xe0P\xef\xd2{\xa6\
-O|\x9b\xc7~IeC\xd3\xae\xd0\xa9\xd3$>\xb7\
-\x04\xd4f\xb3W'B\xbdn+e6\xce\xbd^i\
-\x95ln\xbf\xd3\xf5\xb5\x1a\xcd\xb3g\xbc9\xae\xa23\
-\xba\xf0\xf1?\x1b\xf1\xf8\x14~`\xd7:\x87\x9b\xfb\xf6\
-^\xdd\xd7;-Y\xf9\xcbM_VU\xdd\xe2g\xcf\
-\xb6w\x91_\xa2\x11[\x22\x22\x153\xfd\xd8\xde\x9d\xce\
-\xa6c^n>\xf8\xac\x0dL\x93\xe26\xd4|\x0c\x02\
-\x1f\xc12\xe4-\x98\x05\xb13\xdbw\xc0W\x05\xa6'\
-\xee\xec\x99\xce\x07\x86;q&@\x08\xd9\xaf\x99\x8b\x1a\
-\x0e\xde\xc0\x0e\x87\xac9'\xdf\x8f\xea|\xcf9\x9f\xcd\
-hW\xcfs\xaa\xe7\xbaeYt]\xb8\xd9\x01\xbc\xa6\
-\x19\x0b\xc7\xfb\xc1\xd2\xfb\x87Y\xc4A\xb0\xe9\x9d\x7f\xcf\
-\x05\x9b\xcb\x1b\x11!\xd1\xda=\xc16s/wL&\
-\xb0\xeac\xea\x96\xfe\xcd\xdci\xf0\x94\xf3P\xdfuj\
-\xad^L\xa7\xd1\xb3kV\xef]\xb3\x18\xfc\xd2D\x0f\
-k\xd48i,\xd4BX\xf0y\xe4p\x07\xf3\xf1\xcb\
-\xf1[m\x9d\xc8\x877'l\x8c\xdf\x8e\x8f\xd6:/\
-Q=\xab\xb0\xc4e\xc4\x9f'\x95\x15O\xae\xd1\xa19\
-\x0f$\xc1\xc4\xfd\x0e\xf5\xa1\x84q\xf1\xc6\xdb(\xff\x9d\
-\xb6\x5c\x06\xc3\x89V\x07\xe4\x1e\x8c\xcf\x87\x91\x91\x93\x9c\
-j\xb1\xc8\xf6\x92k\xe2:_\xa9\xb7eH#\xfa#\
-H|]J\xaf\x83\x13\xdd\xf6\xfe\x84h\xd5\xa6P\xb1\
-\xed;Rl}]\x9f\xc7\xdbz~\xc6\xe7\x1a\xd2\xef\
-\x0f\x5cU\xe7\xdd\xb7\x17\xf3\x11\xdf#\x1eN\xce\xa1c\
-\xa8%\xa3\x9c~K\xac:\xb8 \x1c\xab\x9eJ\x96[\
-3\xca#\xa9\xc1!\xf1\xbe\x82\xb8\xe1DV\xb22\xe6\
-\xbb\x9c34i.V*\x1fz\x9a\xd73\x94@A\
-\x1a\x1cX\xa3\x8f\xe0\xfb\xf5\x05M\x03\x97B\xe9\x7f\x81\
-\xc8\xa5\xac\xd4\xbcy\x93d|{\x97\xf8\xd8\x1b\xac\x8c\
-\xc7\x83\x00\xbeO\x8e^\xe8\xbfc\x9d\xf0\xb6\x11\x9f\xa7\
-\xd3\xaa\xa2-\x82SG\xd6\xbd\xd5\xb3.He;\xb3\
-\x9e\x98\xf0<\x0d\xc4\xce3\x0e$\x8d\xc2\x14X\x19\xcb\
-\x15\xf1\xae\xcf\x9e\xbdG\xff\xbb\xd2\xe2B]\xf4\xf2\xec\
-\x9a\xdf\xa3\xe4\xed\xe7J\xe4\x86\x1a\x061\xb0)\xd5\xa7\
-l\xba\xf6\xbd\xcf_\xfb\x92\xca\xa5\xee\x93\x13\xdd\x84\xc5\
-\x06\xe8Z\xdbF\xa8\xb5\xd6F\x05W\xdd\x9d\xf2[\xc8\
-\xfd{\xf5\xd9\xd9\xab\xb1\xff\xa4\xcd\x8cq\x9fu\x9f\x9c\
-#\x10\xab\xa6\xfe\x15\x84r\x0a!\x95O\xa3\xb0\x96\x02\
-7^\xb5'\xe7\xe3\x84\xc5\xc7\x17\x93\xe9g\x16\xfb\xb3\
-g\x9f\x8e\xe7\xd3\xf8\xf4rI\x0a^\xce\xc2\xf1\xf4\xf5\
-d>\x9brHh#U\xa6\x1a\x88\x95\x847\x06V\
-\x5c\xaf\xff\x09\xe6:)\x886\xa2\x88\x9d\xb8\x11\x19\x0f\
-U\xabaOcW\xd9\x15'\xb6\x12\x9d;\xea\xed*\
-\x9b\xe6F\x83\xa7\xaf\xd4\xd2hy{\x176\xba\xb5\xf0\
-\xc9\xaa<\xa4\xff\xef\xd8\xe4\xb5!P\x16\x87\x19\x1b\x09\
-\xed\xad\x96\xadm\xe9.dsF\xa0\xc3\x84h{w\
-i\x0c\x8cE\xeb p\x16t\xb1g\xfbd}\x9b\xdf\
-t\x1f\xd7\xc0\xbft\x9f\xa4\xfa\xb8\x19F\xd7\xfe\xc2o\
-i\x83\xcbX5\xbd\xda;lt\x03\x04\x8b\x84V@\
-\x17\xae.DK\xfc\xfd7,\x1f9\xc6\x9c\xee\xc8\x1a\
-\xeaG]\xc0\x1b\x8ai\xb7\xed\xe5\x9an\xf9s\xdd\x01\
-\xf6\x0d)[\xbc\xd1\x7f\xa7\x86\xd6&l\xa0\xd0\xda\xe7\
-0\xae\x94\xe3\xecK+\xf3\xd6\xef\xd7\xce\x036c\xb0\
-\x9eE`\x11\xc1\xd9\x88q\xbb!\xc7\xd0m\xba\x06\xcf\
-g3b\xee\xda+N\x9cg\xf9m\xa2\xee\xb0\xd2\xde\
-\xf8\xd5\xcb\xf1\xe5\x98N\xfd=q:\x14x\x1d\x0b\x83\
-\x03)z\xe8\xb4\xfd0<\x08\xdc\x0e/\x14\xb9\xb9\xfb\
-\xc4\xb1t\xd2\xb8\xe9\xf8\x0d\x1b\x8eM\x8f\xff\xe9\x9a\x97\
-\xd6mdS\xc3m\xdd\xdep>\xee\x82P\xba{J\
-\xb0\x81b\xfd[\x97\x5c\x9a\xe3\x18q\xd7\xf8\xd0\xa2\xd6\
-!~\xe2\x05\xde\x8d/n2\x8d\xaa\x1b\xb1\xcc\xc4\x91\
-h\xcd)_8\xcf\xbb<.\x84\xd3.\xfb\xf3\xd9\xd9\
-E\x17h\x897\x0d\xbc\xc5\x83\xd1>\xaf\xa57\xc4&\
-7l\xf4`\xb4W\x1b\x0dn\xbc\x13\xe1`\x8b\xb5\xe0\
-\xfd\x13\xa8^\x9cl\x8b\x15\xe4\xbe6\x82|\xc46\x90\
-\x06\xd8n#\xc9\xfe\x95\xc0\xcfj+AHI\xd7\xa6\
-\x0b\xa3\x02\xdb\x12\x1b\xbc\x81\x03L,\x98N\xeajh\
-\xfcG\xa7\xb5\xab(]\xb7\xd8\x22\xde\x9a\xbd@\xbc\x0a\
-\xaa\xe9\x82\xed%m,\x07Dq\xb0mh\xb18\xd4\
-\xcc\x0a\xdc;O1\xe0\xc4{\x87\xfe\x02i\x9b]Z\
-O_\xeb\xf4>\xef\x9e\xdfp\xbcd\xee\xffI\x8d1\
-\x8d\xe1\x1a\x0d\x14\x0d\xf2]\xe8\x0e\xd0\xcf <\x10\x06\
-mwz\x8c\x9f\x87\xdcQ\xeeQ=\xfaf'\xde`\
-8\xbc\xbd\x8f\xe4:\x9a\xcc\xe8\xb4\x86=\x1d\x13\x01\x1d\
-]\x8c\xb5/b<M\x1c\x9d/\xdd4\x82\x80zB\
-,&-`\xea)\xf3\x98w\xda\xd7\x0b\x9c\x08\x98:\
-x\xed\xb0\x9e\xd2\x11\xbb\xbc\x02\x9e\x9e\x16\x02w,4\
-\xc9\x84\xbe>\x18_|\x9en2\x95\x0c\x8f,\xf0\x11\
-\x9d\x03k|\xb5\x0e\x86F^a_\x14\x9a\xd9z\xa1\
-\xa1\x0cb\xdb\xe8z\x8c\xf1jyo\x8d\xeb\xd1>\xc1\
-\xce!&\xe0\xc6\xeb\x05\xdd\xa3\xc2\x9at\xcb\x0b\xf7h\
-\x1e\x9dNZ\xdd\x94\xf5\x04\xd1Apt\xfe\xb0\xcej\
-C!8\xc5\xc5\x89\xd9\xa1}\x19X\xc81[\xbd\x82\
-YK\x05\xb3\x1b*(VE_, /\x5c\xd4,\
-\x03\xd6\x19lT\xdb&n^\x90R\x81\x16\xfa\xd6\xf5\
-\xec\x98B\xb6\x1e\x8b\xe6\xc0\x96;$\xfe\x99;b\xca\
-\xe9\xc5utX?\x035\x16 \xe7\x94X\x8b2\xd9\
-\x8e\xe4\xe7\xf4X/;:\x14\x8c\x8c\x8c\xaa2\x827\
-\xbb\x82\xda\x85 \xfb\x12>\xc7\xd8\x8b\xbf\x98\xc1\xe5i\
-m\xa9\xee\x9f\x0c\xd4\xc6\xd3\xe3C#k]B<\xd1\
-\xa8^}^q\xc3\xcd\x96\xf3\x9aNm6\xad\xd7T\
-\xe0\xe0\x90hn\xb4\xb9\xb0Mj\x1f,2HK\x15\
-}\xb0\xa7\xdew\xdfc\xeb}\xd4\xb3\xea\x12\x13\xdao\
-R\xe9\xc1\xf4p\xb8T\x8a\x85\x08<7\xbc\xec\xd6$\
-Z\x11\x89^\xa0\xd0\xdb\xa3\xe9\xc5\xc7\xe7\xe3\x8f\xe8\x92\
-\x1d;\xb4\xf9\x92\x96\x01\x91\xab\xf7A\x85/\xf4\x00\xd9\
-\xa3\xf7\xe8\xdc\xb5\x9a?\xea\xbd7\x5c_\x9f\xfa\xd3(\
-G:t\xdc\x99\xf6s,*K\xe3\x05\x8f\x9d[9\
-\x07hn\xcfm\xa1\x93\xcft-fT\xd7U\xfd\xbc\
-w%\xe4FK\xf9\xbe\xe0\xb0IN=3\xdf\x8e\xee\
-\x1cL\x0d\x01\x1dLk\xbd\x8f\x96\x95\xb9'O\xb9X\
-N\xe2\x9a\xd1\x91\xd2\xcdk\xd8-\xa9\x9b\xfbzl\xd9\
-S\x8c)\x8f \x96\xab>\x94\x5c\xb2\xdfp\x99\x0f\xa1\
-Eh\x1a&\xf4\xd5^X\xb1\x227\xfd5\xa43\xb2\
-\x17\x9c\xf7\xea\xb78\x1e\xf95\x0b[\xdcp\xbcBh\
-\x110\xa3\x1a|,SO\x13d\xe2H1\xfc\xd6\xe4\
-\xe2\xdc\xe9\x89\x8d)\xe6\xbb8\x9d\xb2K!4O\xc2\
-]\x9a\x06\xda\xd9\x97\x8e\xe9\xc6\xd0\xb4\x1e\xc29\x18\xb5\
-^&\x0c\x0f\xf2\x17\x93\x8b\xcb\x0b\xdcL\xcfq\xeb>\
-\xe7A0o=\xfa\xcem\xf5#(\x0f\x8f\x917\xdb\
-'\xb0\x025\xcb\xdf\xde\xc0C\xbd%\x98dm\xcf.\
-\xa7\x17\xdf\xc60\xe8{\xd8\xc3\xad\xef?\xdc\xda\xde{\
-\xbc\xdf\x18\x9c\xd1[\x9e#j\x17\x9cz\xe8{\x08\x0d\
-\xc8\xdb\xc9\xe9\xe5\xa9\x10\xca[\xe7\xa6\xd1\x98\xe0#`\
-\xbe5~{4&\xfe\xe3x\xf3\xd6\xe4\x1c\xde@\xe7\
-\xf0x1\x1f\x1f]\xd2\xed\xe8\xb5&\xb0\xb7\xe0\x05\xf9\
-N\x80u`8\x99z\xfaY/\xd2\xe3c\xd8\x89\xf3\
-\xe2\x0a\xb0\xfe\x04\x18\xcen\x02\xcf\x80a\xd4\xe2\x89\xd0\
-j\x92\x0a\xbd\xe7G\x85\xcdz\xae$$\x8f)\x0e\xdf\
-I\x03\xf3\xa3w]O3\x17\xb0>\xa4\xba&\xdc\x92\
-\xdc\xb6J{\x9b5+\xda6\xe5\xcf9\xd4\xc1\xb8+\
-\x0f\x91\xe21;\xed[\x14\xf4\xfbk\x83\xc7o\x95\xb5\
-\xc1-\xbc\x0e\x85\x81\x5c2\x0b\x86O?\x1eJ\xfc\xd7\
-+\xfe\x17\x07(g\xdd0=\xdc\xbc\xa9e\x8c\x8e\x8a\
-\xae\xaf\xd2:L\x0c\x1fUv\x175\xe8\x04o'\xeb\
-[\x82\xa3\xc5\xd1o\xb7\x0d\x8b\xbci\xf3\xdc\x0a\x7fL\
-5\x11Kq\xb7\xf1\x10\xf3\xc5\x14V\x1d:\xad\xbb1\
-\x1c\x82@\xd7\x15(\xdd\xc1\xc5\xab\xc8\x8f\x87\x86N[\
-\xe6\xa7\x95\x98\xd9\xb7f\x8b\x94*\x00\x8f\xfa\xe3\xfe\xd0\
-(l4O\x80\x1fK\xd3,\xcbj\xf9\xda\x1f\xd3\x7f\
-n\xef\x1b\xfa.\xad\xd2=O)w\xfd\xdd\x06]s\
-7\xcd\x93\x99\xf7FFT\xd7<x\xd5\x9d\xeb9\xfa\
-\x86--\xb8\xf6\x0e\x9f\xbd\xcb\xe9\xe8\xcd\xe833R\
-p\xc3,)\xb5\x83\x1d9U\xef\x18\xc2\xac\xdf\x02y\
-\xbc\xdc x\xbcR\xba_\xc8\xf4b\xe0|\xe6i\xef\
-=\xbd\xa2\xeeD\x03I\xd7\xfd~\xf6Lz\x8e\xfb\xbd\
-v\x91\xdc\xfaN\xe7![\xd0d\x8e\x06v\xb0\xdc\x8c\
-\xa1bq\x1f\x0fB}m\x1e6\xee5\x9a\x9bu$\
-1\xc27\x0f\x97\x5c\x0f\xed\xb5\xea\xe0P\xb6\x9c\xf8\xa3\
-7\x03y\x1e*\x91\x1d\xb7\x22\xde\x98\x9c\xd3\x019\x1f\
-\xbe\x17]\xaf&\x8a\xac%L_V\x1cYcZj\
-\xb2\xa3\xed\x94\xdaLj4hpu\xbd\xa2u\x8d\xc1\
-\x15^!D\xd9\xf9 \xd8\x7fz\xff\xfb\x1f\x8e\xa7\x08\
-\x18\x12~skN\xac\xda\xad\x8f\xb5#\xa7\x87\xfb\xdf\
-\x0c\x5c\xdb\x9b_\xa8\x9f\xc8\x8f\x1f\xdd\xdf~\xbc\xb3;\
-\xbciLL\x8f\x96{52\xe3\x14\xe8\xbe\xdd$\xb4\
-\xd3\xd9\xda.\xdd\x1f\xedtIc8\xbe\xdcG;D\
-+>\xdaYt\xd8\xb8$b@\xd8\x1eE\xe0\x0e\xe1\
-\x19\xb6\xa1r\x22\xe1\xd6q\xee\x16\xda\xd3\x1b\xac1\xf4\
-\xa3\x9d\x90\xf0\xa0\xb7=\xe3\x1f}E\x99\x94\xa3\xe5\x18\
-\xbd\xbd\x1d\x06o\x89\xbb\x98\xd6\x1d1\xee\xc3\x10\xd4u\
-\xfd\x9d\x08\x8c\x16\x1d\x9a\xdd\x1d\x1d\x9bA\x0f\x83-\xc7\
-y\x985\xc0s|\x88\xf9\x8e\xdc\x1f\xd5~\xc0\xeaj\
-\xdf\xd2\xc0\xb0\xa7\xf4\xc1\xb4\xb7\xa9W\xc9\xc1\xa3\xc3;\
-\xe8\xeb\xbbw\xd2\xe5:\xf9 >\xec\x0d\xea\x9f\xc3\x83\
-2\x8a\xc2\x98\xfe\xe3\x08}\x8f\x0eC\x9e/'\x7ft\
-\xe8:mW\xe3\xe4\x83\x8fv\xd8\xa9\x98\x93G\xb5\xe5\
-a\xc6\xd7\x8b\x9d\xb8\x18\x17P<\x82^o\xe2\xfb\xce\
-\x9a\xd7Jvf\x89\xf4\x17\x12\x98\x1b\x9f\xf5\xf8\x07\x98\
-\xf9o\x06\x88\x16\xc5\xc8\xa9\xcd\xfa\xcb\x8c\x0b\xfcd\xdc\
-\xeeI\x80_\xc6\xf3\xc6\x0d\xb5m\x0b\x9a\xec\x93\x8b\x11\
-\x11\xcaw}H'&\x17^A\x09]\x1bH\x0eb\
-\xed\xe0\x05\xcaT\x8a<n\xd0G\xfd\x97eff'\
-\x12\x13k\xe8q\xdd\xc3\x85\xb8X\xe0\xf2\xf9\x0b\xf7C\
-\x08;\xe0\xf5\xbe\xf7\x85\x1co\x9ae\xd4B\x8d\xbbI\
-\x16\x5c\xce\xf4\xb7\xf7\xf7\xbf`\x8c\xd5{\x8f\x1f=\xdd\
-\xbf\x998\xe9\xcb\x08\x0fk\xf8\xe1\xeeS\x13f\xb5v\
->v6\x9f]\xcc\xe0 \x8b\xfd)\xb1_/\x1e\xd2\
-\xcd:\x8b\xa5J~\x8e\xa6\xe9\x8b\x99\x93\xba\x1a\xed\x8e\
-\x99\xe3\xb2\xd8\xc3\x90\xf9%\xb3\x1atKyf\xd9C\
-x\x03\x106\x92\xb9\xdb\xbdP\xee\xa2:\x8fa\xdat\
-\x9e\xcd\x06\x0a\xa8\xdc\x9b$\x9a\xd7\xd1\xe5\xc9\xc5=\xd9\
-\xaa\xa6\x15\xc3\x16'\x98t\xa0\x99\xb5\xd5s\x8b\x0d\xaf\
-d\x7f\x0c\xb8%\xd7:\xdc\x8dl\x19\xb7Q\xb4\xa3l\
-\xbc\x1b\x86\xde\x91?\xeb\xb0\xd2[\xe7\xc2\x03]\x8c\x7f\
-\xb45\xf1\xc0C\x98\x1c\x12\xf5\xf0R\x8c\xe2\x94\xf9\xad\
-\x0e\xc3\x8c(K\xc4\xff^\x11[1\xfdt\x8a\xf0a\
-4\x00\xf8!'\xca{Bzt\xe5\xd7\x87\xa6\xe2\x86\
-\xf9o\xf7\xc2\xdd\xff\xe4\xc3\x7f:k\x96\x1a\xb3|\xc9\
-z\x19VX\xb16\x90\x90UY\xfb\x92K\xd5\x9d\xa1\
-;kK\xd6&k\xe4\xde\xe3Y\xa1\xb5\xb9\xe2\xd2\x5c\
-X6mKj:\xdb\x1b\x9f\x8e\xce\xdc\xca^\x0d\x9b\
-+\xc9\x22\x1a6\xd7\x94\xa9l\xd0\xbeR>\x0f\xc3\xa9\
-\xb1.\xe56\x89\xc5|\xfeO-d\xf5r\xe6\x0e-\
-\x1e\x04\x9f\xa0\xdd7\xb0u\xc8\xd3\xfa\x90\xd2\x90\xdd\x86\
-\xe7\xe8\xd6\xd0\xc8\x5c\xf9j\x0d\x85\xea\xa3V\xd161\
-5\xf7\x10n\xc3J\x0d\x1b78+Y[b\x99\xd7\
-}\xf3~ox\xb4\xd9\xf3\xc5\xf5\x9363<\xbfi\
-V\x87\x90\x1f\x0a\xda\x95\x08\xed\x8bA\xb3\x9d\x18\x92Z\
-\x84\xe7\xc92x`Bs]\xf69\xd3\xbf\xffkc\
-\x82g-U\x1a\xe7=K\xfe\x9c\xa8\x00zE\x0f\xdc\
-h\xd1\x0f\x1f?z\xbc\xffdk{\xf7\xfas\xb0\x00\
-X\x02_\xf66\x06\x1c\xfe\xcex|y\xa1\x97b\xed\
-\xcbo\xe3\xcd\xf89H\xe3\xced>\x0c^]\x5c\x9c\
-\x9d\x0fn\xdf>:\x9e\xfe\xf8|\x83\xc6\xf5\xf2\xf8\xc5\
-\xc9hN\xf7\xcf\xd9\xe9\xed\x11\xd5}\xfbd\xf2\xfc\x9c\
-}\xc8\xe1\x07vRz\x9b\x09\xebm\xc3\x7f\x04\xa1]\
-\x8f\xec\xb2\x0fw\xa2p\xeb;[\xdf\xefp\xfb\xbau\
-\x9f~\xe8\x06\xfe\xe8\xe1h2\x95\x18\xe3~Z\xff.\
-\x87\x12\x97@\xeb.\xe8\xe2U\xff\xbe\xf0u\xe1\xd6\xc3\
-\xfd\x1aB?\x82p\xff\xfe\x0fwU\x9d\xb6?\xf9\x8d\
-\xb1\x92\xd4\xd8O\x8d%5\xf1S\x13IM\xfd\xd44\
-\x08?\x1a\x06\x1f\x05\xe1'\xc3\xe0\x93 \xdc\xfd\xfe\xd3\
-\xbd\xad\x8f\x86W\x98\x93A0\x86\x82m\x10\x1eO\xe6\
-\x83\x8f\xae\x05\xf6I\x0b\xec\x93\xeb\x90\xe3\xb5\xee\xed>\
-!\x06\xbe\x88c\x1e\x860\xe2\xff\xefo$\x8a\xff9\
-\x0cw\xea\x5c\xb9r\xf3D\xe1\x06\x81?~D\xa4\xe4\
-\xfe\xa3\xdd\x9d{[\x0f\xef?\xf8\xc1\x90\xc7\xdb\x1cw\
-\x97&\x00\x9e\x90\xf0\xcd\x16\xc2\xef\xe5\x97\xf03\xe1U\
-\xb0\xf1\xf0;\xdf?\xea\xd3\x02\xea_\xcay\xdf\xdf\x0b\
-\x06W\x01f\xb9/\x87|0h\xd4\x1c\x0aT\xec|\
-\x07\xc1t6?e\x97\x09\x9c*|{\x9d|\x1d\xb6\
-Tq\xffsV\xa1\x99\xf9\xcfS\xc5\xdd\xaf\xa6\x17|\
-\xfdh\xaf\xe0+\xea\x84\xd4@\x94B\xe6\x07G\x89\xfd\
-\x82#u\xf9\x81#\x19\xf2\x1fj\xc1\xa2\x18\x05<\x0b\
-\x1c\xbf\x9c\x7f:9\x1b\xa8\x8d8\xc4\x8f\x8f\x06\x1b%\
-\x7f\xec\x0c(EX\xc6+g\xc3\x0c\x8cFh\x9fN\
-\xc3K\xda\xf6 \x1e\xf6I\xe1G\xdb\xd4\xd8\x97\xf3\xd1\
-\xd9\xab\xc9\x91lG\xc9\xdfL\xe6B\xa6\xcc\xbd\xf9\xe8\
-Sbz$\xa7\xfe\xd1\x8e\xdd\x00\x1d\xccn\x92\x9f\x99\
-\xf7=\x92\xf5\xde\x97\xfc\x8dT\xaf!\xfb\xa3\xe9\xf9\xfe\
-x>y!Y\xed\xcf\xf6\xc6\xd4`\xa79~bW\
-\x01\xafE\xcdd\xbfIb\xd7)\x19\xf9\xdbk\x8c\xc9\
-\xf6\x94\xd8\xd27s\x9cj\x92\xb5\xfe\xedf\xbf&b\
-\xf0\xddG\x8f\xbf\xf7hp\xb57\xb8b\xf7-\xd0U\
-\x1a\x04-\x9b\xf9:\xbc\xbf<\xcb}8\x04Y\x9e\xe5\
-.\xb2\xdc\x80\x86\xf6\x03\xb1/\xfa\x18\x1c\x5c\xc9~\x1a\
-h9\xdd\x01S3\xa6\xd0\xa0\xdc\x08>~\xf4\x8a\xe5\
-~\x12\x7f\xfa\xc3A\x95f\x86U\xfc\xb0\xde+sp\
-\x9e\x83\xabJ%\x83<\x0b+\x95\x0e\xf2\x9c\xfe\x14\x83\
-\xbc\xa2?\xe5\xa0\x8a\xe8O5(\xe2\xb0\x8a\xd5\xa0H\
-\xe8O<((g\x9c\x0e\x8a\x82\xfed\x83\xa2\xa4?\
-\xc5\xa0\xa0\x02q5(\xa9@\x12\x0f\xca\x94\xfed\x83\
-\xb2\x0c\xb3\x22\xaf\xf2\xc1A\x99Ui\x18p\x87^\x8f\
-\x8f\x82\xc3\xb0\x8c\xa9\xb2\xb2HUH\x14\x1b\x19\xe8_\
-\x93A\x9a\x19\x10\x9bF\xf9\xd2<!(\xfd\xdb\x0a\x8d\
-\xd3xp\x90TapN\x8b\xa3\x7f\xce\xabCw\xee\
-0TQ\x91\xa6\x83\x83\xb4\x08]\x0eB\x8e=\xe8\x0e\
-\xb3\xf3P3\x828&\xb5?Q8\xf26\xe3G\xdc\
-\xd6dZ\x93\xaf\xf6\xe1D\xa9\xfe/nL\xeb~y\
-5\x1f\xb6\x0fv\x9f)\xa07\xe2y\x14\x0f\x82\x7f\xfc\
-\xc9\x1f\xfd\xc3\xff\xc5\xa1\x1f\x12\xfc\xf8\x13\xf9\x113\xe4\
-_\xc9\x8f\x0c\x90\x9f\xealY\x8a\x1f\x06\x92\xe1\x87\x94\
-)\xa2\x92~\xfc\xecw\xe5G\x1a\xe1\xc7\xdf\xe8\x1f\xc0\
-\xf6\xb3\xffE~\xe4\x15~\xfc\x9d\xfc(\x80\xe0\xe7\xbf\
-\xc7?JjX\xf0-\xfdI\xe9\xdf\xd6\x9f9\xb2\xfc\
-\xcf\xfaG\x81\x1f\x82\xa9L\x80\xf6\xe7\xff\xb7\xfe\x81F\
-\xfe\xfc\xff\x91\x1f\x5c\xfb\xef\xffD\xffP\xf8\xf1S\xf9\
-Q\x00\xdb\xef\xff[\xfd\x03\xd8~\xff\xdf\xf1\x8f*F\
-\xf3\x7f\xfew\xfa\x07\x1a\xf9\xf3\xffL?h\x81\xc8\xc0\
-\xda%\x22+'\xf4y\xa9\xfbf\xf0u\xe6%\x8b\xe7\
-k_\x19\xd4doE\xd8\x96w\xd2\xfaz\xc5w7\
-\x9f\xd7\xcf/\xa6\xf1\xc7\xb3\xcb\xe7'c:\xd2\xe7\x97\
-G\x9f\xd6\xcd'\x92\x16\xd6\x14\xae\xa6n\xd7\xe1\x0b}\
-$.tT\x1fw\xc1a\xd7l\x98\xa1\xd2\x18\x82N\
-\x14rju\x93\x06\xcd\xc2h\xc7\x02\x0bX\xe40\xba\
-\xb9\x1d\xdas\xd6\x12\x0474\xc0!\x81mX\xcc\xe1\
-\xb9BKV\xc2\xb3\xe2\xb0\xb4\x10\xe6eHW\xd8M\
-\x1a\x8b\x8fz\xf9\xaao\xc1\x7f\xf3\xb2\xb7\xf5\xd0\xd5n\
-&\xee\x16\x17\x10\xd7\xec\xc3\xd2a\x85\xe3\xbd\xfeQ\xcd\
-\xda\xb54\xd1a\xfc\xc4y)\x1d3[\xd8i\xfa\x94\
-\xd9\xaa\x0f\xed\x1b\xea\xa1\x8ei\x96\xf8\x86Jn\xc0#\
-\xb2\xffV\x1a\xd2N\xf6\xa6\xb3\xfb\xdb\xbft\xf2\xe7\xf1\
-\x087\x12\x10\xd3\xa6\xb2\xa43,+\x92,\xa7\xc3!\
-\xaa\xf8\xb3\x90#\x88>\xe9\xb6\xc8\x07\x10Rq\xfa\xd2\
-\xf9\xc1\xc9\x11\x7fK\xc1J\x8e>|Fr\xf0\xe1S\
-\xc9\x91\x84\xcc\xb9\x1cH\xf8,\xf1\xc9\x19\x8a\x08\x9f\x09\
-\x7f*\xc2V\xd1\xb9\x8a\x1c\x05\x7fK\xe5\xd4W]G\
-L\xa9\xba\x9d\x89\xcb6\xb9\xdc\xcd\xa3\xc7{\x0f\xb7\x1e\
-4Y\xa7\xf6\x1c\xf5x\x8d\xdb\x96\xe4'\xe3\xa3\x8b\x99\
-\xbb\xb0\xaf\x9bLEW\x19C\x1b\xdc\x82\xec \xf3\xf1\
-Y]\x86%\x07\x9ag\xe5\xb9\xf1\x18W\x14a\x1b\xc7\
-f\x91\xae\xcc\x8d-\xd6\xd5\xc0\x85{W\xd8\x22\x1aY\
-\x95\x0fllP\x97\x085w\xe3\xd7\xdb\x1e\x1a\x81\xbd\
-\xadG\x1f\xee\xee\x0f\x0e\xaeX-7\x18\xc17\x7f\x10\
-\x9e\xcc\xde\x0c\xaa\x22|E\x97\xe1\x81\x8ac\xdd\xeeA\
-\xb0\x15\x84\xa3\xe3\xe3A\x12_\x87\xba\x80\x89\xc6\x84\x12\
-i)%h\x0f\x98\x02\x8f\x02\x9b\xf3\xe5|<\xfeT\
-\xa3&6XpG*\xb5y?\x0c\xae\x0f\xc3\xbd\xdd\
-\x87[O\x06W*\xa2J\x88\xf7$\xee\xb1PI\x98\
-gQQ\x0dh\xb7\xc7\xf8,#|&!\xfd7(\
-\xabH\x85yU\x0c\xc0\xd3\x87UA\xf4 \xc1*W\
-\xc8\x93\x83{\xa5<\xb1\x02.\xe2\x11\xab\x8c\xfe\xd2\x06\
-\xa0\xf5O;/\xce\xa3\x01q\xc3e\x95\x83\x0cT1\
-\xberj\x13\xad\xfd\xb0\xcai\xabU95\x82\xa0\xf8\
-\xa2\xfdY\x81\xb3\xa5\x7f\x14\xber|\x11\x09\xc9s@\
-s@s@s@s@s\x82F\x91\x22\x841\xb5\
-\x84>c\xfe\xa4M\x1a\xc7U\xae\x93\xf1]\x98\xf4(\
-*\x88.\x15t1!^\xbd\xaa\x06\xd4d\xeaR\x0c\
-\xb4\xd4)\xfaJ\xa5Ie\x9aE\x83\x83\xdc\xbf\xa0\xec\
-<\xfe\xf8\xee\x83\xdd\xfd\xa7{\x1fo\x7f\x17\xbb8\xab\
-\x06\x07D\x14\xdd,\xfb\xdb{\xf7\x9f<\xe5-\x1e-\
-\x00\xef\xedm}\xf7\xe9\xc7{\x0cU\x0b\xd0&v\xea\
-\xf5\x81\x8a\xd2\xb6+\x12\xa0t\xcf(\xd2\xae\xba3\x02\
-&\x9du\x13y*\xf2\xae\xa2\xe8S\xb9\xb4a\x05\x88\
-W\xb4<\x0b\xb5\xaeT\xcb\xb3P\x1b\xcb\xae\xc1+\xf2\
-\x05\xa0\xd3\x01\xba$4\xa1M\xec%5\xa0Z\xde\xc6\
-\x92\xea\xa8\x92\xa2\x85\x043\xb4\x5c@\xe0\xb4\xa0\xa2\xb9\
-\xc9\xbb\x86\xb0J\x16V\x8e[\x94\xaa\xa5\xa3\xa3\xa3(\
-\xf5\xac\x88\xba\x80\x98\x9a\xa2\x1d\x88k\x1b\xfd\x93\xd2\x06\
-\xa3\x96W\xd4\x7f|U\xf8\xa2C\xad\xaah\xaf\xa6\xbc\
-\xfd*\x85\xaf\xbcy9\xe4+\xdd\xcf\xfe@_\x01\xf9\
-\x16\xa7!|#\xfb\xf9\xcf\xe4z\xc6\xd7\xd3\x9f\xff\x1b\
-}\xf3\xe3\xfb\xdd\xbf\x94\x1f1\xeew?\xff\xf7\xfa\x07\
-\xeew?\xff\x0f\xfa\x07\xae\xa7?\xffO\xfa\x07\xdf.\
-\xffO}A\xe4\x9b\xdf\xef\xe8\x1f|\xf3\x93J\xab\x84\
-o\x8b\x7f\xac\x7f\xf0m\x91\xaf\xb4\xb4is\xa0\xfb\xd9\
-\xdf\xd2\xff\x02H\x19\xd0\x86\xdf\xfa\xf7\xf4?\xfe\x95\x9a\
-_&\x015\xfc\xd6\x7f\xa4\xff\xf1\xaf\xc2\xfc\xd2\x09E\
-\xe5\xe4G\x91k\xa1\x8e[\xdb\xdb\xbb\x90\xe5\x04\xff\xf0\
-[\xc1 \xf8\xff\xfe\x80h\xff?\xfc6\xbe~\x1f_\
-\xbf\x83\xaf\x9f\xe0\xebw\xf1\xf5W\xf8\xfa\xef\xf0\xf5s\
-|\xfd\x04_\x7f\x86\xaf\x9f\xe2\xeb\xcf\xf1\xf53\xfa\xfa\
-\xfb\x7f\x87\xaf\xdfG\xda_\xe0\xeb\x0f\xf1\xf5S8\x08\
-\xff\xdd\x7fM\x9f\xff\xf5\xf7\xfe\x1a\xdf?\xf9\x93\xfa\x9b\
-\xda3\x08\xbe\xc9_\xff\x91\xbe\xfe[\xce\xfbG\x01\xc4\
-\x00\x7f\xc7\xdf\x7f\x8c\xef\x9f\xfe\x16\x7f\xff)\xa7\xff\x11\
-\x7f\xff\x1b\xfe\xfeW\xfc\xfd\x7f\xd0\xf7\x07\xfc\xf5\x97\xf4\
-\x05_\xac\xf8\xfe+\xf9\xde\xf0;\x0c1\xee\x1e\xf5\xfa\
-\x1f\x7f\xf7o\x19\xf3os\xde\xff\x95\xb1\xfdg\xfe\xfe\
-\xdf\x9cZ\xfew\xfe\xfe\x93e\xb8\x9f<\xd8z\xb4\xab\
-p\xdc\x1c\x1c(U\x95\x88yI\x7f\x12\x1c7\xde:\
-\x16\x19\x0f\xe7IR\xceC|[Ut\xe5\x01\x83G\
-\x7f\xca\xac\x89\xc7\xd0G\xceU\xe6\xc8U)\xd5\xc4\xe4\
-\xe6\xaa\x10\x05\x93\xfe\x10!hi\x93\x973\xe1\xd6\xd3\
-\xf1\xd0\xd62/g\xce}\xa0\xfd\xd7\xc4i\xf6\xeb\x81\
-\x8a\xa3(G\x04\xd0(\xaa\x16F\xc3R\x0b\xceV!\
-RgD\xf8\x9a\xd5z\xd9\xe8\x7f\x9c-]\x18\x13\x9f\
-\xeeq\xde\x22\xe6\xbcUk\x9f}\xb4\x1572\x8e[\
-;\xede\x8dcnh\x9c.\xf6z\xeb\xd1\xfe\xfe\xee\
-\xde\xfd{:c\xc6M\x8dq\x83(\x96f,pz\
-G\x09\xf8\x8f\xc5v62'\x11w*\x89\x8b\xb6\x96\
-63\xc7\xdc-\xb0\xeb]m\xad'\x14\xf9\xb8kI\
-Qu\xb6\xd8\xcd\x9e&\xdc\x944[\x18_\xfbH\xaa\
-3f\xdc\x8c\xb4\x5c\x18\xddf\xc6\x923f\xc4\xa8\xd1\
--\xadu[\x104\xe5\xe1\xca\x8ah!\x93\xdb\xbaL\
-f?\x8f\x08W\x9auf\xcb#\xeesN#\xd5V\
-\xa5\x975\xe1\x09e\xc6,\xcd\x96g\xcd\xa5\xf22o\
-\xc5\xda\x98\xa6B\x16u\x91\xa6\x0b\xb9m\xcef\x0dE\
-\xc95\x14\x95\x0a\xd3\xb2c\xa4JY+\xa5Z\xc8\xd3\
-h@\xa9$c\xdc\x8a\xac\x999\x96\xcc\xc9B\xe6z\
-65\xfb\xfd\xe1\xde\xee\xeew\xbf\xf2\x1b7\x1d\xf2q\
-S$MT\x8b\x18\x03\xa6\x81\x11}DTM\x01\x86\
-Y1\xb7KW\x10l\x97d\x80\xfb+}\x10\xf7[\
-\x22k\x86\x04,v\xe2\xb2K\xba\x8a\xb0\x22\xcc\x93\x93\
-\xd1t\xac\x1c=\x0c\xab\xe2r\xe5\xc7?\x17\x15\x02C\
-\xfb\x9d0\xe7\xdf\xf8\xc6{k\xd3o\xf9\xe0\x83\x09\x94\
-7{l\xbd\x02\xbb\x89o\x0d\x17\xe1\xea\xb0w5\x1d\
-N\xfbm%\xd7\x17\x13c\xad\xe0U\x0f\xf5\xc1\x14q\
-\xcb\xb5\x02\xad\x97lU\x81\x04\xa6g\xec`\x11ir\
-x\xb8\xf9|>\x1e}\xaa\x8d]\xae\xa6\x03;\x00\xb5\
-\x8aO\xb8\xb3\xfb\xe0\xfe\xc3\xfbOw\xf7\xf6\x07Wi\
-4\xb8\xe2w\xf0\xf0\xa3\xef\xe1\x04\xe4\x0b2\xd6\xcaF\
-l\xe4\x1d\xf4]\xcaS=}\xc7\x1b\xa9<\xd0\xd3w\
-\x22\x8f\xf2\x87\x08zB\x15\x1e\xbd\x1a\x5c]\xcc\xce\x88\
-'Utc\x11P8~{\xc1\x09\xb9Ix>\x93\
-\x84B'P{R\xf5\xb5\xb4\xa1l\xb6\xa1j\xb4\x81\
-\x16b\xdd\x86\xe2+h\xc35\xed\x88\xaf\xa3+\xb4\xb5\
-\xfd\xae\xc4q\xb3+I\xdd\x15b\xfc\xbf\x92\xae$_\
-KW\xd2fW\xb2fW\xf2\xba+\xd4\xaf\xaf\xa5\x11\
-f\xf1\x85\xa7\x93cN(\x9b\x8d\xa8\x1a\xcdL\x22\xb7\
-Ui[\xab\x9cz\xb8\x10_\xe1\x19\xc2e\xb2\xaf\xa3\
-'\x89j\xf4$i\xae\x8c$Y\xd6\x93B\xb7\xea#\
-i\xd5FV-\xf4e>\xa6\x9a(\xa3\xed\x0a\xa4*\
-~!\xda\xcc\xba7\x1b\xa5\xde\xd8\xd2\x9d$\xc9l\x87\
-\xd4F\x9a\x16\xeb\x1b\xba=\x09\xa7TQU/\xb8\x22\
-\x89\x1bx\x89\xe7\xb0x\xa3\xcc\xc3\xeb\xa1M\x1ah\xcb\
-\xb2\xa8\xd1\xd2\xc1\xa8\x1ax\xdb\xfb\x88\x8c\xb6\x93\xfc\xe0\
-\xe9N\xd8F\x1e9\x13%rD\xd6\x07\xc4\xabh\xcb\
-\xdc\xa7\x0e\xae\xac\xf2{\xb6\xb8`\xe0\xd3\x8a\xdf^c\
-\xddc\xb4\xc8\xa8\x1c\x09\x0a\x7f'P\x1f\xcb\x05,\xbc\
-(\x90\xd54TOy^\xea\x04\xc1\x94\xde\xd0\x18\xb7\
-\xee\x90\xfdh\xe9ga\xa7C\xd9\xcd\xadiV.+\
-\x12e\xbd\xd6\xe4_fh\xba\x9a\xd7\xa0\xe6\x1bQ\x9a\
-~\xfe\xd1jm0d~+5\x982:\x0d\xdeq\
-'3\xcf\x8aU'\x93\xb2z\xcd\xc3\xba\xf4ZS\xae\
-0\x99;\x0b\xc3E\xe5\xea\xe1\xca\xb3j\xc5\xd9tj\
-\xd7\x83Ce\xdd\xe6\xe4\xd1\x97\x1a\x9c\x8e\xf6\xe5j\xe5\
-\xe9\x5c2^\xad-.\xe2\x06\xd1)\x8a\xb2\x83<\x18\
-\xe5@)\x97|\x0d\x8cSV$\xa9\xcf9!%m\
-P\xf4\xd4R\xf4\x17D\x7fX\xc5\xfax<?G4\
-+nX\xf5\xb9\x0f'P\xab\xd5\x0a\xb9T\xad\xca\xcb\
-_,\xb3#\x95V\xbfX\xb6\x84+-\xbe\xda\xc9^\
-\x85\x8b+q\x07\xfa:*]\xc6o\x81;\xf0I\x81\
-\xe5'Zx\x8f\xa8\x8b\xb3\xb0\xbcG\xe4\xa1\xce}\xd4\
-\x90=\xb5nb\x97A\xebD\x9dx\xa8\x8b\x95Q'\
-\xea&\xd4\x96\xf7c\xd4\x8dE\xbe\x84\x0dH\xaa\xe5\xbb\
-\x0c\x0fW.\xadq2\x9fN\xa6\x83\x8d*\x14\xe2\x98\
-\x15y\x19yl\x1d'%\xd0\xd0*i\xa25D\x93\
-J$\xda.1\xa1BJ\xeav\xa1LV\xad6^\
-\xacVq\xb5Q[\xb5\xc9\xb2j\xf9a\xeb+\xb9\x88\
-\xf0\xb3\xd8W\x85)\x8e\xbf\xc2E\xe8\xae\x14\xe0N\xbe\
-\xc2U\xe8.\xf0\x94\xb8\xad\xd1\xc9dt>\xe0CH\
-\xeb\xb4\x83\x8f\x93T\xe2\xc8mb\x9d\x15\xec\xacN\xa5\
-Mn\xf3&\x16A\xa1\x12\x93\x0a\xfe\xde\xa4\x82\xd8-\
-\xe0-@\x8d\x161\x94N^[[\xa9\xca\xb6F\xe0\
-\x01\xb6#=\xe9H\xcf\xda\xd3\xb3\xb4\xa5\xdde\x1a\x15\
-6;\xd8A\x93^\xc4\x16MZ\x18\xa5\x7f~\x935\
-H\xf8\x0d\xb6\x06\xc4.\xa0.\xa1\x92\xd6\xe6Ti\xd1\
-\xda-y\xc7\xb5\xf3F\x84@#\x92\x87\xdf\xb6\xba\xe5\
-\x19\xb8\xadry\xfa\xd6\x10~\x01\xd7\xb5\xc8Cx\x0d\
-H,@\x0d\xc4 \x02J\x9a\xb9\xf3]\xd6\xdf4\x1f\
-\xf5w\x22\xdf\x9f\xe0;u\xd2\xb3:=N\x9do'\
-=q\xf0\x13)\xae\xbfK'OU\x7f\xa7Q\x9d'\
-u\xda\x99\xc6N\x1e\xa7=\xb9\x83?\xb7\xf8\x89\x13\x8a\
-\x9coU\x7f\x97Nz\xe9\xa6\xa7\xcewf\xbeU\x94\
-E\xb1\xfb#q~\x14\xa9\xfb\xc3\xf6\x19?r\x17R\
-8\x90\xd2\x85\x94\x85\xfb\xa3t\xb3U\xce\x8f*r\xb2\
-U\xca\xfd\x11\xbb\xd9\xeaQ\x81\x96C=\xefv\xa3\x96\
-UM\x17\x1a\xe9\x99\x93\xee,SZt\xce\xbe\x89\x1d\
-@\x12\xb5m(\x00\x94\x03\xc8]@\xbd\xe2\xc1\xe2;\
-\x80\xc4\x01\x94. \xad\x01y\xe4\x02\xea\xddF\x0b\xd5\
-\x05\xe4\x0e\xc0k\x95\xb3whJ]H\xe9B\xec\x1e\
-\x11\x95\xe7\xc5\xbe\x13\xc9u,;\xb6\x9en\x0d\x17\x0c\
-=\x1a\x19\xc4$t\xa3E1gx%Q\x8c9\xf8\
-o\x5c\x16\xe1\xe8\x1c\x09\x83\x82\x0e\x87\xe3\xb1|\x83\x04\
-\x9c\x7f:~3\xb8\xca\xb3\xc1\x86\xa2\xa1\xa6\x15\xbf\xa1\
-\x88d\xd0j\x97\xbf\xe5`#\xe2G\xc9\x8a\x12\x88\xc8\
-\x10\x91\x96\xbfJ\xff\x8d\xf5\xdf\x842\xc6t\x87\xa1\x85\
-\xbb\xa1\xf2\x22\xa45\xbb\x11e4\x17\x85FYh\x94\
-\x85AYh\x94\xb4k$\xa1\xd48\x89]\xd1\x09\x89\
-\x14\xa1\xfd#\xc8\xcb\xcc@r\x93R\x98\x94R\xe7\xad\
-tB\x15q\xc2uHk\xe3\x00\xf6Rx[\x8b\x10\
-\xe48-\x07\x07i\x16\x87t\xa4\xc1\xac\x99\x0a\xa59\
-\x92+$'\xda\xd8\xb9\xcc\xc34\xcea\xfe\xec\xa6\xd2\
-\xa5(M+JU\x1a\x05\x8d \xa7\xc7tX\x227\
-\xd5\x95\xe2\x89\x93\xc6\x12\xe9q\x19\xa6\x05\x8c\xa8\x13\xc1\
-b\xf2g@URz\x0ae\x89\xcc4\xc5\xa2\xc9\x80\
-\xc6\xc9\x9eQ\xa33J\x87\x82D\x9eS\xbadOt\
-\xf6\xc2\xc7\xceh\x8a\xc3\x90u]\xa8\x09T[Q\x95\
-!\x9d\xf5\xa5\xa2\xc6\xb3\x92K\xc4\x95\xe2\xdaJ\xc7j\
-\x9e\x13\x03\x90\x17:9\xa3n@O\x88ZM\x8c\x0c\
--\x81\x03\xf0\x5c\x11\xceb\xea\x18M(U\xc9\xba0\
-\x82#\x8b\x19u\x06\x1cE$\x99\x09gAY\x15M\
-PL5\x16P\xe9\x89\xf8\xe57\x84X\x83\x861\xab\
-\x90\x1eK\xf6\xb4\x84\xca\x10g\x8f\xa8Jh\xd1H\x95\
-\x19\xa5\xf6\x099\x91\xe8C,-N\x06\x96\xbc\xc0\xc8\
-\xd2\x0a\x01\x96\xcc\xb6\xa5\xc8c\xae;Av\xa7\x9bU\
-\xc4\xdd\xc4`\x15\xba\x9b\xf2\xd2\xaa0E\x8a\x18\xf9C\
-,\xcc\x03\xec\x0e\xe8B\xc6Q\xd8\xe7\xd7R\xa0\xaf\xbb\
-Z\x10\xd1!*R\x14\x94\xbd\xd4]\xc5K&%c\
-`0\x5c\xa5\x92\xdc`\xb5 \x94TD*\x8a\x12\xf9\
-\xb9\xaf\xbc\xeaJ\xea/\xe5/Q+\xadq\xdb\xca(\
-\xc7\x10p_\xa1\xa4SP\xf1\xbc\xe41HR\xca\x08\
-\xec\x99TJ\x8d\xce\xe9\x02\xd5\xe7\x1c\xc0\x92\xeb\xc6\x10\
-\x16\x95`\x0a\x89\xdaA\xf7E''\xd0\xc7D\xb2\x8a\
-\x12\x9a\xa6\xb2\x9eS\xc5\x85\xca\x08H*=\xbe\xb4\xae\
-r\xaa8\xc16\xa7\xdcUds\x13\x86\x84\xf6vN\
-\xb9\x15\xb4\xb8\xdc}u\xddJ\x9b\x0e\xdaT\x03=\xe2\
-\x94\xd0r\xd5\xc4\xa9\xcaTM\x9c\x88\x88\x88A\x9c\xd1\
-\xe6\x7f19\x19\x1b;/\x8d\x8a\xed\xa48\xa6\xc9\xe0\
-@A\xf5\x01\x8a\x03E\x1c\xb2\xe0Xa\x9ap\x14A\
-\x93-\xa6\xd5\x92`\xda\x09\xed\x01\x18\xccB\xd1\x86\xe2\
-\xed\xc1\xab\xe5\x80\xae\x11\xe0+\xd9>'<(\xb1\x83\
-\xe9\x1f\x0c\x22V\x09\xfd\xc3Z|*4\xfa|\xac\xde\
-W@\xa3\x0f\xeb%\x06\x80\x0a\xd2?\xd0\xf2\xc3V\x83\
-J \x98\xc3P\xd4Y\xe9\x9f\x825\xb4bV\xe2\xa2\
-\xa9$\xb4\x22_$\xeeH\x1d2\xff\x83\x7f\x0a\xfcS\
-2{\xc3|\x0d3.\xcc\xb1H\x10\x01\x91bA:\
-E\xad.\xb1\xadJ\xe9\x0b3\xe9\x90\x10\xf17+\x22\
-&\xb9|C\xd3\x17\xfb\xb3D/Kld\xfa\x07\x19\
-\xd0\x90\xa2\xc4O\xa8E\xc1\x93\x0c\xfd\x03\x0d\xe0\x88\x7f\
-f\xd0eB\x1a:^\xc6\xd0\x07\x8e\xa1c\x8c\xf5X\
-&\x80&P\x0c\x06~\xe8-\x1e\xd0\xbf\xf8\x04\xf1\xa1\
-o\xd6\x1f\xce+\xac7\xccIY\x01}\x15\xa5\x00V\
-\x18\x9d*\xe5vWhT\x05:\x09.\x82Y\x86\xd0\
-h:\x16\xa1\xd1j\xc4v\xa4f\x1cT\x98 \xfa\x07\
-uT\xb4\x87\xe8\x1bT@k42\xf7z\xc0\xdc\x85\
-\x1c\xda\x80\x94\x0a+\xbf\x8aYE9\xa69\x95S\x8f\
-\xd6\x03\x1d\x16\x09\x88\x12\x0e\xbc\xa8\xcaJQ@\xeeK\
-*\xa6\x8c\x0e\x91\x18C\x16\xe5\x92\xa1\xe5<I\xf4\x16\
-\xee\xab\x90\x15\xa9\xab0\xc6y\x92\x80\x5cQw\xfa\x09\
-5\x05*\x054TiEK-\xc9\x04\xa0*\xda\x96\
-\x196<4\xb9(\x1d\x04+\x03%%\xa2\x92!9\
-S\xc0S\xd8d\xce\x9d\xe9\xdc\xa5&4\x0a\xe3\xc8$\
-\x14\x9dM*\xa7Vt\xa2H\xa994\xb4i$h\
-\xa0\x84\x92\xa6\x18\x09\xb4\x88\x9a\x93*\x1f@\xf5&)\
-U\x00+5\xa4\x13\xfd\x95\x06\xd1\x82\xc9\xb0PS\x90\
-gZ^L\xe2\xc04\xa4B\xe5a\xdf\xa5\xf8\x8cH\
-m\xcd\xa0Bt\x8d<\xc0Y\xddW\xb4 \x12\x10\x18\
-\xaaY\x01\x90K\x01\x0c\x9c\xce\x8f\x05\x91\xea\x0ec\x80\
-y \xa8^\xa5\xe4\xdc\x86\xd6\xab\x92\xe4\x14\xe7T%\
-\xe7vN'\xa4\xa4\xd2vO\xabT\xcemd\x96T\
-ZF\x99*\xe4\xdcF^\xa5\x04\x05%\xc7\xfa\xd8\xc6\
-\xa6\x92\xcctRd\xa0\xc18\xb4\x9d\xcc\x16G\xea\xe3\
-(5\x0e\xcc*\xb4r\x94\x9d=t\x9e\x8fl4\xba\
-\x91\xbbhO\x06kB\xa7ccD\xa0M\x8bdw\
-d\xc1>\x80\x04\x13\xa7O\xb4\x84'\x82\x8e\xa1\xa2\xc2\
-\xb9\xaf`_\x98\x10\x96\xa8\xf2f\x08z\xb3m\xf9y\
-\x01G\xa85KY\xed'-\x80\x9d\x170\xad]\x1f\
-\x07\xaf\xde2\x04I\xa2\x05\x03BW\x0aO\x01\xcd\x15\
-\xb0\x18%X\xaa\x22\x8b\x85\xa5\xc8\xab\x82\xd7(-\x16\
-B!\xccCi3\xd3\x81\x08\xe2\x81q\xcd\xf9\xf8\xc1\
-\x9e*h*\x80\x22N\x0cG\xc1\xa9\xb4\xed\x995\xcd\
-\x84\xa1`\xc4\x11\x9dN\xd26\x8c\x93\xf0\x13@\x5c\x09\
-cWb#\x0a;\x81\xd4\x94H*\xd1\xe7\x14\xdbJ\
-\xb8\x09\x99/\x10\x1d0=\xc2K\x18\x0c\x8a1d\x9a\
-\x95\x90\xd4\xbc\xe2\x06\xe7\xd8 EaRAUBV\
-\x9c\xe6\xdcek+xc\x82B\x81\x96\xf3X\xf0\xe9\
-\x12\x99\xccE\xa9{\xad\x84\x8b\x10\xae\x221\xb9\x89\x18\
-\x1b&\x82\x1b]\xe62t|\xce'v\x9csn\x1d\
--\xaaT\x98\x08\x1a.\x8c3\xb8B:\xce9sV\
-\xe3\xa0\x85\xc0\xfcufX\x08Z\x11<\xaf8\xc5\xd0\
-\xc7\xb20\xa9J\x81\xb0a\xc5\xe6\x96\x83\xc8\xf5*`\
-^=3\x1c\x84Ie\x0aZ\x19\xfe\x81\xbbH4\x87\
-{Cy+U\xefr\xaci\x90\xd9\x18\x84\xad\x8a\xdb\
-\xb7?t\x87\xdd\x02\xe0f*\x1a\xd8\xca\xd0\xd9,\x96\
-\x02\x10-3wM7\xcf\x03\xda\x03\xb4\x1f8=\x92\
-Q\xa9\x98/$\xe6\x0972\xceO\xe7n\x92 \xbf\
-\xe6\xa3\x89\xdce\x15\x93\x01\x8cWU\x0a\xfe\x9c\xc7\x96\
-i9j\xadl^\xc5\x0b\x85\xb7\x8c\x8a\x2273Q\
-\xfc<\xe2\xb3I\xdf\x17rf\xad\x093\xd3(:\x9f\
-d\xe3Q\x87\xe8\xb4\xa3\xbd\x94b\xfd\x10eFn\xe2\
-Y\x22i8\xb8\xeb\x8c\xb1\xeb\xaeF\x82\x9dh5\xb6\
-\x08\xad:$\xa3\x83\x18\x17B\x13\x0b\xf6\x5c\x92\xe1\x1b\
-\x0e\xf8\xfbDj\xe3\x82!\x85\xc5C\xfc\x09u)\x03\
-\x13I\xe7\xa4I\xd6x\x12\x90{Z\xdch\x0eZ\x89\
-\xf3\x07\x07.\xa8\xa3R\x91I\xf6\x1a\xa3tW3\x8f\
-\x96*\x15Kn\xbee:\xe3H\xbc\xb7\x03\xa0\xd6\xd8\
-1S\xa9\xc1\x9f\x82\xde\xe1pbD\x99\x19\xf8\x94\xe8\
-'\xceT\xf0\xa8\xb4*q(Q\xa5|\x86\x11;\xc6\
-g\x9bR\x85 \xc9\x1b\x8d\xd4t6\x91\x01\x00W\xcf\
-m\xd1t6er\x85=\x80MG\xd7\x04I\xd6\xc3\
-E\x93R\x82\xad\x88\x95$c|\x19\x90h4ql\
-\xf2\xf3\xda\xa0\xd9\xce\xd1\x968\xf1\x17v\x81{ \xda\
-\x1e\xa7\xf5\x09,[\xa1\x92\xa5\x0d\xed\x8d\x8e\x22\xd4]\
-<\xd1\xf5\xc1\x97\x02B\xc4\x82W`\xa52C0]\
-ZU\xf1\xf80\xd9\xc6$\x82\x97\xc0\xdcVqTS\
-%\x87\xc8Wqb\xa9<m\x15Z\x0aE\x8e=\x8b\
-j\x85\xa2\xd0\x1d\x00\xa7V\x81s\x1c\xd6\xc8\xbaN\x97\
-\xe2A;\xdd\x90\x03P\xffD\xa8\x7f\x95hj\xd5\xa8\
-2I\xbd\xdc\xa9\xc9]\x9f,^\xeeB\x1a.\xb9i\
-u\x17tW[\xe9\x0ab\xac\x00}\x09\x09\x0d\xb0\x91\
-\x90\xd0\xa7\xbd\x84\xd07\x9bB\xd5\x96\x8c\xed\xec\x9fB\
-K\x92\x08'\x12\x96\xb0\xc7\xfe\x15\xb4\xbf\x88\xc4(b\
-\x0e2\x90\x99\x9a\xffK\xf9\xb4\x84\xda\x1a\x1f\xa2\x0e\xa7\
-\xc7\xe9)\x88p\xa1Y=\xaa\x81/\xb8\xb8\x99\x13\x8d\
-\x8eb\x97\xd7\xa3*\x12^\x9a\xc4Y\xe1\xd6c\x99=\
-\x08\x1a\x88\x09P\xb8q\xe3\x90MU\x03@\xad\xc5J\
-\xab\x99\xbdXV\xad\x22\xc2\x91\x95\xa9p{\x19x\x9f\
-B*\xe7\xb3=\xd1\xdc^\xac\xb9\xbd\x08\x97`\xda\x00\
-\xb1\xe6\xf6@mp\xf3J\x98\xa3\xa6\xb1P\x9a\xdb\xa3\
-\x02\xf58\xc5\xf0p\xe3q{\x5c1\xd1\xebBs{\
-\x10\x8d(I\x06\xd7\x87m\xc4\xec^\x9e\xeb\xcd\x85\xe4\
-4/5\xbf\x97\xf3\x18!\x1dc\x9d)\xcd\xf0\xd5\xc9\
-\xb8\xbf\x03\x093|y.r\x1a\xa8\xba\xea\xdd\xc3,\
-_\x9d]\x81\xf3\xcd\x0b_N\x83t\x0c\x126\x043\
-}N\xfe\x04t&\xf5\x055\xa8\x96V\x00\xc6\x8c\xb9\
->\x17}\xa1\xd3A\x8e\x12wh\x92\xa8\xd4l_R\
-\x0fq\x11I:\xf3w4\x17}\xbc\xd6\xf0\xa4\xd0\xe2\
-\xa0\xab\x9c\xe6\xe4\x94\x1d\x1c\xcc!F\x81-\xa2\xe4\xae\
-\xc0\xd9\x89<\x17\xa5\xe6\xe5${\x91\x82xA\x92a\
-x9\xbe\xefG)\xcf{\x12;\xe2!H\x05h\xe4\
-p\xd3Q\xb1'\x1f\xcap\xbd\xa6\x86d.3\x07I\
-\x0d\x11\xea\x22u\x98\xb9>\xb4\xd6\x13N\xc6\x12(T\
--a!RoQ\x1b\xf1\x90n^\xea\xb2sHM\
- \xa4\x83\xc0\xa6\xac\x85C\x18q\x22\xdc\x05\x04$\xb1\
-\xe1\xe7\x18\x05-P\xa0\xc8*\xc3\xcf!5\xa7\xbdD\
-\xa99\xb6_Q\x98T\xba\x8c\x86l5\xcb\x8cb\xd9\
-\xda\x8aJDZfO\xa6\x90l\x96\xb5XHw\x9c\
-Z\x02rU\x1a\x01X\x956\xb2\xeb.\x02\x0d\xce\xe1\
-L\xb8^G*D\xeb\x15\xfc~\xce\xe2\x1ff\xe8\x0a\
-\x96\xdb\xd0\x14\xe0\x1a\x1f\xe5\x8eT(\xe6&2]A\
-\x1b\x8dTH\xa7\xc7\xb8\xce\xe7\x8eX\x88\xd2+Z\x9a\
-1\xaf\x8c\xd8\x97\x0b\xa1\xab\xe0\xed\xb3Z.\x14i\xec\
-\xb8\x0eg\xaeX\x08\x22\xa7\x92WK\x83\xad\xc3\x9aM\
-\x88R\xe4\x0d\xee-\xc2\xda\xa55\x8d\xb9p\xd8\xb7\x82\
-W-]\x9e!S\xd4\xec\x1bDYz\xef\xd2\xccf\
-\xa9\xe6\xd2\xd2\x98\x19w\xdeD|k\xa9\xf94\xde\xce\
-l\xe6\x1c\xb2\xc8\x859\xb5\x14\x19u:\xb5(\xaf\x1c\
-^\xcdE\xc4\x92-\xe6\xd6P\x83)AG]\x11Y\
-~\x0d\x1c\x95l\xc8~\x0c\x09ldX6*\x82\xb1\
-D\x19\x10\x14a\xc2R\xaf\x12^\x84\xa9\xe1\xd92>\
-xy\x98 \xe3\x8b\x0c\xd3F\xe9\xb6\x0ab\x1f\x92\xdc\
-e\xdat\xffp\xf9\xaaJ\x87k\xc3\xd0\xe1\xe4 \xe2\
-\xa1b\xc3\xb6\xc98\xe14\xc1\xdd\x18\xb4@\xf86=\
-~X[\x19D\xb2\x86qs\xc75\x91#CX7\
-\x004\xb1\x04\xcb[\x1a\xceM\xa7\xcb8)\xcd\x9d0\
-\xeb&\xa8\xd2\x98\xabH\xcb\xd4\xf0n:=\x82$\x99\
-\xce\xa3\xd20o1_I\x12X\x98R\x17\x8a\xc4p\
-o\x98:B\x9c\xf0 e<\x0f\xc2\xbe%f\x82\x80\
-\xbf\x8a-\xff\x96\xf0=\x08\x0cD&\x04M3pR\
-/.G\xb41Ub98%\xb3\x86[\x0eD\x0a\
-\xb1\xe5\xe0lC3t07l\x17\x0d&\xb1]\xa5\
-,\xd6\x14\xb2\x11\xd5\x22\x0e\xa5\x14&\xc6\xa9P]\x88\
-\xc5\xa85\xb4\xee u2\x0b\xd2\x9dz\xc8\xa0\xf4\x1a\
-Jy\x18x\xea\xf9R\xca4\x96hR_\x9c\xb1\xf6\
-c\x1a\xd4>8\xf9\x82\xe9\xac\x03Q\xb4\xdfX&^\
-D\xce\xb6B\x11:\x921\x9b\x05_\x9ds\xea\x02]\
-)\x18@\xc7\x1a\x13\xb4\x82\x85\x03\x15\x01\x98u\xed\xc7\
-%xw\x00\xec\x0eU\x19\x03\x98\x8d\x06\x80O?.\
-\xc1\xa8\x14\xa1\xea\xe3\xa8/\x98\xc02$KM\xed|\
-A/4+CEb.B\xf4\x87\xaf\xd2u?\x12\
-.\x90B\xd2u\xc8/\xfd\xc4\xd7\xa3\xb9Q,\x95\xd3\
-\xde\xa8|>Whx\x11e\x9a\xcf\x95#\x8d\x17=\
-\x16\x87\xe1s\xdb\xc853\xba\x92\x1f\xec2K\xe3r\
-\xcb\xe8b\xe4x!a-\xa5\x1e\xa3k\xce\x02&a\
-\xc2\xe8&\x9a.\x83\x14\xe2\xf2Q\x19\xc1\xa0p\xcb`\
-\xce\xca$\xb6\x9c\xae\xc9\xae2\x5c\xfaK\xcb\xea&&\
-\x7f\x04\xe9r\xaay]\x8d\x87E\x9c\xe8Tu(\x1a\
-\xc6\x071\xdd\xe1y\xb8\x5c\x1a\xc9:\x0f5\x08\xe2P\
-\xec&lj>t\xe46\xe0p\x8e0xK0\xa9\
-\x10jwq\x95\x90u7\x98\xda\x18\xf2\x22>\x83\xe2\
-Xu1\xbc\xe2\xd4\x01WQ\xbc6\xa4\xfc@\x056\
-\xecz\xf9k&\xb8u\xff\xa5\x80\x90\x9a\x97\x82\xc8a\
-\xd2\x8b\xd8\x13\xe8B\xd6(\x02]~\x18\x14!.\xa8\
-`j^+\xb58\x97\xc0\xd7\xdd\xfc|\x1f\xb7e\xbc\
-\x09\xd0\xe0TM~\x1e\xd7\x1c\xda\xa5E\xdc`\xe7\xa9\
-Bf\x81\x0a_\x9c\xab\xdf\xf0@\xf9]&\xdf\xe4\xce\
-}\x1e\x1fo[\xe0\x07\x8a\x06\x8b\xaf\x9b\x13\x83\xbc\xbb\
-\x1c~B\xbb\x16,\x22X\x04\x97\xc1G:\xc4\x088\
-\x88|\x06\x1f7V\xa2i\x90\xd90\x7fO\x8b\xae\x94\
-\x8a\xd1\x1e\x90@\x97\xbd\xb7\xf5F\x86\xbd\x8fAi \
-\xf7aZ\x1b\xf3\x95\x83\xd9{\x1eIg\xd4<\xee>\
-\xe2^\xa7,\xe3-kN\xb8\xf1\x06\xab\x99{\xbc\x15\
-\xd0\xe9\x8aA0\xbc}T\xbf\x9dV\x86\xb5\xf7\xdfN\
-\x0b\xcd\xda\xf3\xcem>\xc0:\xf5Y\x1c\xa9\x97\xec\xbe\
-\xbfB\x96kr7\x9f_\xe3\xfa\xf9\xb5\xf0\xb9z\x17\
-\x093\xf5\xcd\x01\x11\x9e>\xf2\xc6\x15w9\x16\xe5b\
-kD<\x0d%\x9e\xdc\xd3&\xab\xef\xcc\x0f\x8br[\
-\xf2\xd7o\x11xiB\xcbU\xee_\x00\x5c$5\xff\
-\x9fE\xf2h[\xf8\xfc\x7f\xc9O\x8d|\x87p\xf8\x7f\
-fK)_\xee\xb1\xff9z\x842\x1e\xfb_*y\
-\x8e\x8c]Y.\xb8\x7f\xa42\x7f\xedp\xff\xa5\xdc \
-\x92\xccc\xfey\xfd@\xfe\xeb1\xff\xb9b1\x0f\x9f\
-v\xa9eh\x99(\x81\x07\xcb<\xe6\xbf\xe0\xd7O~\
-\x0fs\x99\x7fy\xed.c\x97\xf9\xaf\x14\x8b\xc4\xca\xb2\
-\xf0x\x7f\xb7\x11\xce\x8b\xb03\x9a\x0e\xeb\x8fN\xe3\x90\
-L\x9d\x07\xe1\xca\x99\xc0\x06\xe7\x8f3M_\xb3\x5c\xce\
-\x1f\x94\x03\x0f\xd5\x91\xc7\xf9\xc7`\x08\xa9\x8a\xccg\xfc\
-\x9d\xf6\xb9|?K\xd6B~\x14t\xd8~:\x10J\
-\xbc5\xc3\x94\xd1c\xfb\x81\x85\xda\x89\xb7\x08\x87\xed\x07\
-\x12\xe8x\x94>\xd7\xaf\xb8y,\xeaq\xa8\x0eV5\
-\xac\xe0\xe2,k\x08s\xcd\xfeO\xfd\xeb\x00\x0a\xa0M\
-\xfem \x11\x1d\x07\xe2>\x89\x8e\x15\xfem\x80y\x9d\
-\x14\xdbI\x5cF\x80\xd1\xe0'\xfd\x88\xaf\xec1\xf8Y\
-\xb9&\x94\xcc;\x0a\xb5N+\xff\x96\x901\x9b-\x1c\
-\x9f\x5c\x1287\xcb\x05)7\xdeT\xbd;\x02^%\
-\x88yL2{E\xb0\xf9Af$\x7fl\x8ej\xbc\
-\x9a\x11K\xcbG\x84\x96\xe8\xe2\x0a&\x87\x01\xa4\x99e\
-\xe6It\xb95\x99\x96\x96F\x9a\xb3\xd2\x83\x93\xcb`\
-\xca\xe5 \x97\x1b[\xc2\x22l\xec\xc7\xd2\x93\xe8B\x1d\
-Cd8\x9eD\xd7\xe0\xc9\x13\xe7j\x10\xf1\x11\x049\
-\xa7\xaa\x9c\x9bA\xa31\xca\xf4\xd5'\xa9\xfe\xbd\xc0\x19\
-K\xefb\xc0\xda!\x89\x1e5s/\x00\xc1\x07\x9f\xab\
-o6r-\xe0\xc1L\xf8\x1c\x93\x9b\xa1\x5c\x0b\xf8\xe9\
-\x96\x8f2<,%\xf5\xb5 \xb6sh\x1b\xaa\xc5(\
-H\x8fY\xc5\x82E\x03r-\x90t\xec\x1e\xe6\x0b\x13\
-s-`\xb1\x0bg\xc7\xbd\xc7\xcau!\xff\x8dR\x1f\
-\x0f\xdf\x0a8\xbf\x99s\x96\x8f{r]\x9c\xacD~\
-\x92\xa6\x5cWvE%\xab\xdc\x97\xebzE\xec\x05C\
-e\xf6\x0c\xe4V\xb5\xdc/J\x87\xc9F^h\xd6\xf0\
-\xfd\x0b\xb4\x13~\xc1\xfap\xb3@\xa7\x07\x885\xaf\x07\
-P\xc4\xac\x8a\x84\xc7\xe7\x8ai!\x826(\xd6\x96\xa1\
-:\x991\xe7\x8d\x04\x85\x09~\x8e(\x0as\xfc\xba\xd4\
-N1\xb9s\xb7^\x8c\x17e\xec\xb1\x98'\x94x\xd1\
-~\xc5E\x80*G-p3r\x80\x9b\x5c\x92\xd7\xb8\
-\x94\xbd\x12\xc5\x8d\xf5\xee\xdc\x88\x1a\xeb\x1d\xb6\x80\x1dt\
-\xa2\xc0r\xcdS\xbe\xae$\x1a\x84w\x02~5L:\
-\xba_\xa8\xb4\xab3\x05_4ZIL\x11\x97\xce\xcd\
-\x88g\x80\xce~\xa8\xd2\x14qe\xafF\xc2-*\xa8\
- \x81\xd8\xc2\xdcP_\xc0r\x7f\x8aa\xdb\xd31\x07\
-\xfa\x06\xa8\x1b\x01.\xaeb\xd9\x7ff\xaf\x805(\xc6\
-5Jq+\x0aw\x94P\xaa\xc4+\xbcJ\xbck`\
-\xce\xa5R:\xf5\xfaej\xee\x81f\x90\x00\x813\xf2\
-\x22j\xb9\x08\xa6\xc4\x1e\xf4y\x8c\x9c\x9b`\xc5\x15)\
-\xbe\xdb\xb5]\x05Sp'Un\xef\x82\x99\xbd\x0b\xc2\
-\xe5D_\xa5\xa5\xbe\x0e\x16\x91BM|\xadM\xa0>\
-PF\xe6>hf\x97\xbb\x04N]\xf1\xdbh\xaaY\
-hi\x1d\x1e|\x08]\xd4\xb8+\xd6G\xbe{WL\
- \x14\xc2\x13\xac\xbd+.\x1c\xef\xdeU1\x15\xb59\
-\xd5\xb8*\x16\xe0\xfe\xf8\xd8w\xaf\x8a\xce\xd1\xec^\x15\
-\xf9\x88\x17.\xca\xbd*\x1a\xb1a\xe3\xa6hx\xae\xcc\
-\xbf(z\xb9\x0b\xb9\xe4Jn\x1a\xa4\x9com\x0a\x87\
-\xaa\x09\xe2\xc2\xa4\x83\x922I\x82\xfc\xcf$\xe5\x92\x04\
-\xa6\xde$\x15\x0d\x9a\x03\x8d(I\x82\x8e\xa7$\xc58\
-\x0b\x9bI\xfaRU\x1aT\x8d\xabj}\x807o\xaa\
-\xe3DZ\xb5pK\x05a`\xcd\xcar\xe1\x92\xea\xde\
-\x8b\x9awT\xec\x22P\xea\xbc\xe5\x8e\xea\x5c\xe2\xa0\xbc\
-e\xf8[fQ0\xaaI\xc9\xcd\x88\x8d~a\x945\
- \xd8\xb0r\xe7Q\xd0:\x03\xa9\x8b\xb0\x1f\xc4\xc53\
-qF\xd8=a,O\xb81_\xafa-\xc0R!\
-Z\xc09\xef\x07(\xc0\xb0\x8c\xb8\xe3\x96l\x9c\x96E\
-|\x10\x9aU\xc3\xd5\xa4\x96)\xc7\xf3>\x11Y\x22Y\
-Z\xc9\xac\xd6\x08\x85\x1eY\x0ef43\xee\xc3\xcc=\
-\x13\x8bD+\xc2A\x1b\xcd\xbe\x09k\xc6.\xe3tp\
-p\xf2\xd2\xc2\x93C\x80\x0a\x0c\x1c[\x06[5&\x1e\
-f<\x08\xb2\x8e\x22\xd6\x9b[$\xb7E\x9c\xabr\xa3\
-H\xdeU\x0bzHc\x8bK~\xa3\x08\xc8\x07\xbc\xa0\
-`\xc4\xa8L\x5c\xd92\x95\x0f\x01\xb6\x82\xe5\xe1\xc2\xce\
-akGM\x88\xf2!\x16\x1b\xac\x12Z\x9b\x96c\x0d\
-\x1a\x00t\x0e\xa0\x13\x14\x096p\x22\x1d\xa0D\xf7\xb4\
-\x0f%A\x1f!\xf6o\x5cD\x8b5\xe1\xb2\xef\x97\xc9\
--H\xf9e,@\xee\xc1-\xcd\xc6-\x16O$\xd0\
-\xe5\xf0K\x14\xf5\xec`\x0d\xe0d\x85\x02,[\xfbv\
-\x14\xa9\xba\x8a\xf0}\x96\x0fr.\x92\xb0\xb3\xc2C1\
-\xaa\xb5\x13\xea\x15)\x0c/\xac\xaf>\xcc\x85\x1e\x8a\xac\
-\x86\xcf\x09\xa4\xc3\x81\x0c\xb6\x85\x00\x0a\x97y\x169\x0b\
-\xa7WREQz\xc2\x85RX\x03\xa8''\x1e\xc5\
-'@}\x9b\x06\x11/!#f\xed\x17\x95\xd4gJ\
-\x03\x92\xf9E\x129T\xd8\xb2\x97g\x84'\x8b\xef\xe6\
-\xa9\xdc\xcdK8S<\xe0E\x9c\xe7\xfe\xcd\xb1h2\
-\x84FN\x22\x1eS\xdbnP\x04\x01w\x04\x91k\x92\
-y\x12\x9d\x92\xf9\x12V#\x93\xeb\xa3\x95=\x95\xcc\x97\
-\xb4C@\xcbL$AV\xcf\x8fi'qO\x93\xc4\
-\xb2\xdb~\xa3\x93Z\xcc\xef-\xb1\x22\xc9\xcd\xc4\xb8\x87\
-\x1c\xdb\x08\xb73\xc4l\x09\xecuS\xf1\xbbG\xc1 \
-\xe6\xda\xf8\x8e\xc8\xccl&\xccl\xc9\x0e\xe5\xdb\x01Y\
-\x17 \xef\x02\x14f\x9es\xa6\xa4\x18\x17>\x17\xe0T\
-\xaf!\x81\xc9L\xff\xc1\x94\xb1\xe8,\xe1\xde\x809\x15\
-\x00\x98+<4\xf4\x0d\x9fk\x8b\x14\x89\x16\xb2\xe3\x1e\
-\x22cf \xd44x\xbb\xc2\xcc\xf8e A\x80\xd7\
-\xc2\xbejb\x13\xa9@\xb4(\x1d\x82&o\xbdp\x1b\
-\x90f\xe3j\x08\xd0Q\xaaJJO\xa8\x04E\xe0.\
-\x08\x18\xf1\x8c\xf8H\x08\xd5]\xd2Pb\xafA\xd9\xda\
-\x00\xcc\xe2(\xb1\xa03\xecI\xe5\xef\x8e2.|\x80\
-\xad\x03\xeb\xcc\x95u\xd9\x12I\xb6(\x04K\x18P6\
-\xda[\x17\xa9Zz\xc2e\xba\xd6F\x99V\x0b\xc8X\
-/\xbe,Y0\xe9@r[\x0d\x84\x93\x19\xeb\xcf\x00\
-W\xae\xc2\x9c\xd5\xf7\xca,\xeeHO\xecR\xf2\xe7\x04\
-\x12\xcav@\xd6\x05\xc8\xbb\x00E\x07 \xcf[\x8f\xfe\
-2/:\xd2K\xb9;8\xec'\x8f \xdfDZ\xd2\
-\x8b\xb8\xde\xf6%\xab+@\xe5\x93\xd5\xbd\xb1LS\xbe\
-\x95\xe8\xe3\x9dX\x12~\x17\xaf\xb0L\xf55\xc2\x97\xa0\
-\x12\x08\xdc\x0d\xf3\xfd\x22M!J\xcelO\x85\x05\xcc\
-\xb74\xd6C\x82\xba:\x9e\x11\xa1k\x0e\x8f\xa5\x11s\
-a\x1e&\x90\x16[I\x83\x87\xabRv\xc3\x0a\xa00\
-\x91\xb4cY\xde\x9dr\xfb0\x08V\x93\x06\xba\xb9E\
-\x8a\xc7\xceC\xf1\x15\xe0\x81b<js}E\xd4Y\
-\xa8P]\x85\xc0N\xc9\xcd\xad&\x1a\xb2\x97`[w\
-\xc0w#\x95\xa4\x1e\x88\xcd\xde\x0f\xe0\x1d.\x86>\x9b\
-b*\x9c@Z\xcdV\xeb>$\xd7\x90\x1c\xabV_\
-\x88\xf0tP\x89ZR\xc5\x9c\x81\x8ck&\xe3\x9a\x8a\
-\x22%\xcerN\x81\x06\x93W\x22_,\x01\xe1\x1b\x9f\
-\xc0|\x96\xab\xcc\xa3\x17\x95\xdc\xde\xa0\xa1\x9f\xf8\xcb\xa7\
-*c-\xa5v\xe9\xaf\x00r]$\x8f\x9b\x10t\x11\
-\x0f\xca\x1a\x19\xac<\xf0N\x0f{\x01=\xcc\xb1y\x1e\
-I\xf8M\x8eI\x06\x9dh!\xfc9&\xe2\x9e2\xe1\
-\x1b\x1b\x93\x0c\xc2k!\x5c&\xd1\x16\x07\xfek\x0b\xd4\
-\x91,\xacX|\x89\x11\x1dQX\x83{3\xc0\xaf\xb6\
-Yq\xa8\xad\xb9\x9b\xb3\x13\x8bf\x00\x0c&-W\x99\
-G\x8cQe\xb1\x88\x1d\x93\xc8\x81%L\xa4\x14\xeb\x16\
-\x89\xd9\xa4\x85\xc1{(\xca\xb1\xa1\x95XNZ\xd6\x8e\
-q\xe6N\xb9\xc4\x81%\xa5\xc0X\xad\x92\xed'-\xac\
-\x14\x8dB\xc5Jib)\xe9\xb5\x85\xdb)8K\x95\
-y\xb2\xe6R\x04@l\x9c\xd1N\xb2\xd9b\xa3\xf5\xf4\
-\xb9Y\xdb\xaf\x8e\x0d\xd7\xad\xed\x07cgk\x0fY6\
-\xb5\xfd\x1c\xf3H\xa8R\xe6\xc6\x1c\xd2\xbc.\xb2\x81$\
-\xb8\xcf\xdc\xd8\x1d\x16\xc6\x9c\x11&\x92\xf2\x11\x1bS\xc8\
-D\x1bK\xb6\xd9H\x8a\xf5\xa4\xc1\xebYI\xca;\xa6\
-k&)\x1f\xae\x9d\xa4~\xeb4\x1f\xe6\x1d\xb4,\x1d\
-sH\xf9\xa8t\xa5\x90ms3 \xcc6I\xb1I\
-2\xf6\x9c\x90P\xf7\xcd\xa7A\x06\x91\xb0.\xa1b\x9b\
-\x96\xd8\xaf\xd4B3\xfb\x95[haP\xab\xd2~\x99\
-^B&\xab\xd3b[Gl\x06\xb0R\xc6\x00\x14\xb2\
-\x1bni\x15\xdb\x8e\xc5\x89I\xcam\x92\x99\x1e\xc8]\
-tZ\x92\xd8\xb4\xd4\xa6\xe56\xcd\xcc\x00\xc8\xbf\xb4\xa4\
-J-\xbe\xd4\xe2K\xad\x9dif\x1b\x90\x99\x16WY\
-l\xd3lm\x99\x99\xe4*+\xecW)+\xa2\xca\xcc\
-\xacT\xb9mhn\x91\xe4\xc6\x00\x16\xce\xe2\xcd\x97m\
-\x14/F)k\xd0\xd9uT\xd9\xd5\x82\xa7\x1e\xfb\xa9\
-t\xab\xda\xacc\x0b\x9fq\xe4u\x8f\x97\x9f\xc6ca\
-&\xafD\xcec!t\xe63\x18o8\x8f\x85xR\
-d[\xcb\x027\xb0\xfa\xb1\xb0\x94g\x01\xa6B\x8e\xe1\
-G\x22V\x87\xb5))\xcb\xec\xd2\x84S\xd3\xaa\xf1X\
-\x98[\xc4\xf5c!\xb4\x81a\x97\x04&\xa2~,L\
-S>\x84X;\xc9},\xcc\xd8\xac\x87u\xeb\xea\xc7\
-\xc2\x92\xd5\xb0q\xa0y\x8f\x85%\xabr\xe7i\xe1=\
-\x16\x16<\x14*\xc2\x13i\xfdZXFI\xdd\x0aW\
-S\x90\xb5\xea\x0a\xd0s\xe7\xb5\x90\xaeP\xd8\xe9\x99j\
-(\x0aB\x9b\xc3\xe4\x8e\xadz#\x8f3\xb2g\xbe\xf5\
-\xa8Xr\xb2mE\xfdZ\x98\x95\xccI\xb0j\x9e\xf3\
-Z\x88?y$\x86\x9c\xceka&&\xa4\x05\xf3\x1d\
-\x8e\x92 k\x0f\x83\x14\x94\xeec!\xe6\x10<V\x16\
-\xd7\x8f\x850!\xc2@\x01w\xe2\xbd\x16\xf2\x05Y\x9f\
-\xcf\x85U\x80\xcab\xeeL\x06\x15\x12W\x81/f\xfb\
-\x83\xb4~\x9a\x13]\xac\x84%\x09i\xec\xa9\xef\x01K\
-\xc4X\xc4\x1aB9\xca^lR\xa3\xf3\xc7\x8e\x18\xaf\
-\x8a\x84\x9f]\xd0\xdd+\xd8\xa8(e=~Ww\x0f\
-\xbaj\xa50\xc0\xfau\x8e\xcf78\xce\xc2+\xb4\x9c\
-|\xb9\xa4\xe3\xe1\x08G7\x98\xdaT\xce\xd9Zw/\
-\x13\x87\xb9\x99\xa4;\xba{\xb0\xd0\xc6\x80\xe6\x0d\xdd=\
-\x96l\x86lS\xe9\xea\xee\xe5\xccw\x19\xc3\x05e\x15\
-\xe5\xd2\x92\xcd\x85S(\x95\xf8Ot\xb4&\xfb\x18\x8d\
-\xaah*\xef\xa5\xcc\x5c\xb1\x90\xc4\xd3\xdd\xcb\xf8\x89]\
-\x1e\x88\xac\xee\x1et\xee*\x98\x14\xa7\xaaj\xe8\xee\xe5\
-\xac\xbe\x9dH~\xe7\x91\x0e\xe2\x1e%\xaa\xc8\xb5\xee\x9e\
-4\x15\xf8Y\xe9\xd2\xd1\xdd\x13\xf2\x03\xabm_w\x0f\
-x\x12\xab\xa2\xa7\x9cY\xabx,RQ\xf6st\xf7\
-\xc0\xc4e\xa2 \xbe\xf8\x80f\x9f\x05\xa0\x8eLT\x0a\
-4\x06\xccH\xf3]\xa04\xaabQ\xebFn\xbe\x0b\
-\xd0\xbd\xb1\x88\xbcw\x81\x02\x22\xabD\xb4\x82\x9cw\x01\
-K\xaa\x0a\xff]\xa0\xc4\xb6\x15\xcd^\xe7] \x13\xb3\
-\xef\x82\x8d\x8f\xeaw\x01\x5c#\xe3T\x8c\xc6\x9dw\x01\
-\xb8\xae\xe0!l\xbc\x0b@\xaa\x13\xe9w\x8e\xb4\xd6\xc6\
-\x84\x85q\x02\xfb\x1b\xec\xce47\x1a\x0b)$ml\
-\xd7\xc2\xdc{\xaa\xf7-\xfb\x19P\xf2b\xca\x9a\xb7i\
-)\xd6\xeaJ\xae.\x09ls0\x90\xe2R\x81m\xde\
-\xb1\x15c<\x8f\xb0b\xaf\x19Il\x14\x98\xf0\xa4\xf2\
-\xa4\x5cefR!\x86\xa9\xc4\xd6\x86\xdb\x94\xc5V\x02\
-\x8e\xd5\xc7\x93\x8a\xaee\x89]\x95\xf0D\x9e\x96\x9a\x9d\
-\xcfRg\xd5\x88\x968+\xf0eF\x02-\xc4\x0e\x06\
-\xa08\xafp8\xdb\x8aa\xabkly\xaa\xcc<A\
-B\x9f\x97mN\x13N.M\x0f2\xee\x01V\x1f\x0f\
-EV\xb5\xee\xc4*\x8f\xea\xb7\xe9\x82u2dLs\
-\xa7\xc7ph\x8a\x8a\xa1\x15\x83\xd3_\xf7\x0c\xcf\xa5|\
-\x9c\xa4\xac\xe1\x88W\x02\x8bI\xcbO\xd1e\x08\xaa8\
-\x9d\xba\x95\x14x\xe5f\xf5]\xb0\x0cFY\x16\xb2\x12\
-V\x90\xe7\x9am\x97\xa1\xe1\x03\xfa@\xab\x86/o\x8e\
-\x1ej.\x22\x5c1y\xcb5\xb5B\xa7s\xa1\x0dl\
-\xed\xc0\x17^\xa3w\xcb\x9a\x1cT\x805\xb5\x0b\xabv\
-\x94U\x9c?\xe3S\xa1T5\x228r\x81.%d\
-\xc0U\xa9_\xd8\x95\x9c.\x90\x13\x08M\xb7\x04\x91u\
-\x90Y\xaa\xc4\xc3\xc4\xac\x8c\x19\x8eTL\x95`\xf9u\
-\x83j!\x07\x82\xee\xba\x12\x94\x8e\x01P\xc2zQM\
-\x16\x09\xa2R\x00`1\x0d;\x01Z\xe2|TA\x88\
-\xe9\x02\x12<\xfch\x8bf\x93\x9e\xc9EU\xb4N\xdc\
-\xfc\x98\xfc\x08\x16[\xa9\xa8\xcdx\x05R] i\x14\
-\xc0\xf4\xa5Z\x07\xc1\x16\x80\x89\xb5\x9ceZ\xd5\xa0\x1d\
-\xb2@\x10\xf9U\xbd\x10\xe9\xb0\xa8V\xf4K\xed\xd7\x03\
-c\x00Yn?\xabx\xcb\x84Z\xd1\x94\x9f\x98m\x11\
-<\x1a\xc3BK\xbf/\xdb\x02H\xcf\xf0\xc2\xa7#z\
-\x1e\xe4\xac\xcc+ZY\xb0\xc1V\xf6A\x89_\x06s\
-\x16\x12\xc5\xf6\x09*k\x07\x88\x5c\x82_0\xf9\xfa_\
-h\xe3Yy\x96\x10\x83f\x0fP(G2S\xc9S\
-\x1e\xf3he\x11G\x9d\x10G0C\x83\xc7\x0f\x0d\xf2\
-@)2sf\x86\xe5YF\xb1\xde|\x1c\x19Y7\
-4\x93U&j\x92\xec\xdf\xa44\xa2n\x0d\xe1\x91L\
-\xb5E\xb2H\xa1K\xad\xeb\xa0\xd5\xf7r\x0d)kH\
-\xa9\xf8\x0a_e\x22\x1d\xafj\x88\xc2\xc3\x02n\xdb\x09\
-\xf3{E\x16u\xe0+\xab\xdc\x11\xc9%\x22\x87\xe6\xc7\
-\xe2\xb2*:!e'\xa4\xea\x800\xc9\xb0\x0b\x16l\
-@\x14\x8b\xe6\xa5H\xc9<P\xecJ\xc9:\x0a\x15\xaa\
-\xbdP%\xda0\xbc\xac\xb0H\x12\xa8\x83\x08\xb3\xc6B\
-\x1a3K(\x03Ugm~\xab\x0a\x1fT\xc0\xf2@\
-\x8c-2GsM)6\x96\xc0\xf4k`\xb2\x0c\x98\
-.\x03v\x0c<@\xed\xe3\xbb\x02)\x8b}RF\xe5\
-5)S\x08\xf8gh\x19[\x8c\xb7\xd12\x05\x8b\xab\
-\x1c\xf4\x016\xe4`?\xd8a\x84j@\x12\xadL\x8a\
-Uj\x01\xa5\xf4O\xd4\xe3\xdd\x122;82\xb5\x1a\
-\xa0_\xc4h\xd4'\x8d\x22`\xfd\xd2BS4\x0b\xc9\
-\xb5\xd48K\x0dI\xeb\x00u\xd0\xb4\x22\x16E\x17l\
-\xd2>\xb8\x88\xc8\x125\xe8D\xe7\xfa\x05Kk\x1e\x08\
-Q3eD\x00L}7T\xcd\x94\x00\x00\xf8,e\
-\xa9\xb0\x8a\xd8\xaf\x90\x88\xd7\x89\x15U\x86\xb6t\xc2\x94\
-\x03\xd3\xda\x05*\x11B\x91\xd8\xb9i\xa1/<\x0b\x98\
-^L\xabV\x15\xd5\xcfo \x16\x16\x84\x88r\x8cT\
-\xbfg\x81^\xd4@\xb8\x9f\x01\xb0b\xcf7L0\xda\
-\x912\xc5\xb0\x0dU\xf2\x1e@\xab:34\xa3\x13\x86\
-ha|\x1e\xb6\xc0\xcc\xa0\xa5U\x13\xc6\x94\xa3^~\
-\xb8j\xc6\xa9h5\x0a\xe9\xf0`\x90\x0eG\x89\xa1\x1d\
-]\xc5\x0a\xd5QL\x13\x89zM\xc9\xbb=\xe5\xa9\xc9\
-\x84\x07,3c|\xc5t\x82\xfb\x87>dz\xb7\xa7\
-\x0e\x9d\xe8\x06\xa6\xcb\x80y\xd7\xd0hJ\xd1:\xde+\
-\xd0\x8a\xa4\x8b\xedQ\xa9\xc3\xf7T]|\x0f\xe7B\xab\
-Yi\x19F\x5c\x91\xa1\x15.\x04\x8a\xb2\xb1\xa1\x15\x06\
-\xa0\x22Y\xdfUYiba <Q`\xc6U\xae\
-\x89\x85_&\x87\xff*M-\xdc2\xb87\x8b\xc9\xbd\
-\x0ba}\xe5D\xb3\xb3B-|\x90\xd2\xa0\xa5\xd4\x22\
-\x95\xfd\xd8\xe7\xbf\x85!\x17\x84\x836\xbf\xde\xab\x0a\x7f\
-b\x9f`\xb0\x92\x9b\x82:\xabQ\xb3\xb3e\x04\x90\x08\
-\x1f$\xbb\x9b\xdb\xb5\xb8\xbbe\xf5\xdb\x9e\xe2\xeag\x0c\
-\xcd\xf4\xeawal6\x97\xdb\xd5\xdfQ\xacP\x1d\xc5\
-\xcc\xea7m\xe11\x22\xbe?\xcf\x9c\xd5\xef\x0e \x94\
-=\x88-_a\xb1\xa5\x9d\x8b\xcd\xb5\xb2Wq\xe7j\
-\x93\xb6\xa0^(\x0c\xb3\x0d`\xa9\x97\x9b\x07\xe2\xe32\
-\xd5\xeb\xcdB|b[y\xa5xt \xc8\x90[\xf9\
-\x92bI\xb3\x18D\x05\x89Yt\x16\x02G\x09\xb0\xb3\
-g\xad@Yu\x1d\xb0\xf6e\x07\x0fx\xb4~\xf0F\
-S\xb2\xe6\x22tFc\xbd\xee\xe8\x1aD@\x0e;\x8a\
-g&\xfc\xc9\xf4\xba\xb3\xe5\xe4\x19\x13\xee\x95\xf4\xc2\xb3\
-\x85\x00\x81s\xfd\xbe\xd5\xf4\xd0M\xebZy\xb6\xe1\xec\
-\xaa#\xaf\xb4\xf9\xb1,=\x0fHcQ3m\x9d\xe5\
-\x0a\xd5Q\xaeb\xb9\x12\xfdCc\x03\x96\xbb\x80\xb9\x92\
-\x12\xdf3\x95V\x00\x8f\xf8:\xa8!)\xdfi\x95P\
-d\x98.\xa6\xe9B\xa9\xb2\x81\x11W\xe4R@\x95\x87\
-\x10a\xc84$\x8e\x1a\x08\xebB\xb12\xf8\xd2L3\
-\x97\x95V\xdbda\x93\xcbuV\x22\xf0\xab\x0c\xfb\x22\
-\xf8\x9a\x85\xd2\x06B\xf0\xb3\xdc\xad8s\xd1\xc5\xb8\xf6\
-k@\xde@W\x17\x01\x0b[U\xdc\xa5\x12.gR\
-\xed\x94C\xc5<\x0e0\x15\xce\x05\xa6\x8c\xfb\x10\xb8\x90\
-F\x04U\xbc 7Kau$z\x884D\x97\x81\
-\x88\xca\xa9\xc9\xc1\x96\xc4\x8d\x9a\x5c|\x89W\x93S\x0a\
-\x8f\xef\x15;\x91\xcb\xe4b%ocqM\x91\xf4\x8a\
-)\xf5\xfe\x89\xb4\xde\xbe&I>\x14\xae\x85\xd8%\x03\
-B\x17\xe0\x82\x05\x96G\xf0\x16Q,x9\xd0\x01F\
-\xd8\x87!t\xe6\xa1\xf8\x1b\x17}NX<\x82\xe0\xf5\
-\xe3T\xa4\xa2\xec\x91\xbc\x01S\x91<\x83\xb3\x03s\x1a\
-3V\x9b](\x95x\x10\xb7LjtG\xd3HC\
-Tt\x13M\x95P\xd5\x0d\xa2Z\xfbv\x85[Z\xf3\
-\x96\x095.\xd6\xc4\xb4\xca\xa6\xc6\xf0\x84\x8e\x83\x9b\x9e\
-N\xbd\x90\xd8\x8d\xear[\x1d\x91\x97\xfa\xe9\xd4V\xc7\
-DG\x89k%\x90\xe5\xb4K\x1as\xc0N\xca\xd9m\
-!\xa2\x95\x0d\x97\xe4\xa1\x8dM9n\xc6\xa2n\xc4\xa2\
-\x96c\x81k#DN\x1bbR\x96g\xcc$c\xd1\
-\x95Q\xdc\xa8\xb3\x8fu\xe4\xec\x0f\xe3U2*B\x99\
--\xcd\xc7kG\xea\x8eo\xa8[gU\xcb\xb2\x9a\xe1\
-+\x12D\x87\xa3V\xd2\x95\xfa\xc6\x8c\x19-\x8a\xf9\x8b\
-\xc9\xdb\x01L\xd1\xafC\xbdl6>\xba|\xbe\xb17\
-~99\xa7\xd5\xb2\xf1`6:\xfeh6\xfbtM\
-\xb0!\x88\xf8\xced\xbe\x1e\xdc^\xf4\xe0\xb9f\x03\xe7\
-\xf5\xaeZ\xeb\xe6\xf8\x84N#a\x82qc\xc6\xba\x91\
-\x94\xfd\xfa\xba\xd7\xfb\x02\xed|\xfa\xd9\xd9\xf8\xcd|B\
-\xf9\xfaT\xe0\xf2d4_\xa9\xc1v\xc3\xd6\xe5\x0f\x92\
-\x18m\xa7\x99(\xb2\xf0\xf3\x94\xb1\xdd\xa0\x82\xd7+\x97\
-$j\xfc\xf9\xab\xe3B^}\xcdQ\xbb?=\x1f\xcf\
-/\xd6\xba\x17Hx5G@\xc4\xed\xd9\xe9\xf3\xc9t\
-2}9\xb8\x82\x9a$\x1e\x81a\xa8\x02Z\x04\xa6\x85\
-\x1d\xb0\x16\x8a}\xfa\xc3\xe0\x04nha^\xc2\xeeX\
-\x8bl\x00_(\xd0\x88\x84?W\xd8\x89\x14\x09\xbf\x8b\
-\xb0\xb7\x7f\xd6\x14\xa2\xbbB\x1d\xf0;*t$\xa6\x06\
-\xfd\x0a\x10\x86KU\xb1g\xfd\x10^\x9d\x9f\x8d\x8e\xc6\
-\x03u\xcd\xe6\x0c\x89\xb6]\xe0\xdb\x7f\x13\x98.+\x99\
--+\xe9\xdbR4\x80\xbeUE\x03\xe8\xdbWx\xc0\
-\xa6\xa5E\x03\xa8\xfb\xa9ZZ\x1bG\xba\x9fm\xa0\xb4\
-\x13\x84W\xdd\x0eP\x15u\x83T7(\xee\x00\xd1\xa5\
-:\xd3\xb0\xbe\xf8\xea[\x00\xeb\x1e\xf4\x93\xa8\xadt\xcd\
-S7\x80\xd7\xab/\xe0v?a\xed+\x9a\xb5\xd8d\
-\xc5\xb3\x05\x16V\xb6\xfe\xc9\x97AZ\xe0\xe6'\xae\x80\
-Il\x7f\xe2\x16\xa9\x12\xfb3\x15\x1f\xdd\xe6'\xbb\xec\
-\xae\xecOpAy\x0de\x1d5\x8b\xb9\xe4\x8aLT\
-\x12\xb3/\x167\xc1\x17\x1e\x029\xff\x7fq[\xdaW\
-\xddB\xedv\x12\xbaw\xb9n%z\xd9\xe8\xd2\x8b\xd1\
-\xe9\xe4\xe4\xb3G\xa3\xd3\xf1\xd0\xd2k\x90\xf7\xde\x15\x02\
-\xb2N)\xfd|\xb8\xc6)C\xfc\xb31\x1f\x9f\x9d\xd0\
-\xaaY\xbb\xfdk\xa6\x86\xdba\x10\xf4z\xeb\x81!\xfe\
-Ao\xe3\xfc\xecdr\xb1v\xbb\x7f\xbb\x17\x9e_\xbe\
- :\xb9)AO\x83\x87\xdf\xf9\xfeQ\x9f\xce\x8c~\
-\xb0\xbe\xc6\xb8\xe9\x88\xde\xb8\x98=\x98\xbd\x19\xcf\xb7G\
-\xe7\xe3\xb5^]\xc1\xda\x9d\x81q\xd4\xff\x8e&c\xf2\
-\xe2\x9dP\xe0w\x84\xe9\x1d\xf5\xa9\xf7+\x5c3U\x1c\
-\xac\x0b.uX\x97>\xf8\xb5\xad\xfe\x0f\x0fo\xbf\xe4\
-\xc6]\x87\xceY\x84~\xed?\xfd\xc1\x83\xdd}\xcd\x07\
-\x1d\xcd\xa6/&/7X\xab\xed<\xe49n\xe5\x90\
-\xc2\xc7O\xef\xed\xdc\xdf\x1bn}g\xeb\xfb\x1bp\xb4\
-\xfd\xf1\xde\x03\xbdB\xde\x8c\x9f\xfbg\xe2\xec\xe2E\xd0\
-\x0bw\x1f?]\xb5\xc0xvA\x05\xbe\xf7\xf8\xde\xca\
-U\xbc\x99\xbd@\x1d/\xa8\xbb\xe7\xc3\x83\xc3M\x13D\
-\x17cqk2\xbd\xc5mFL\x5c9\xca^\x8d\xce\
-\x1f\xbf\x99>\x99\xcf\xceha\x7f\xc6\xa3\xdf\x93\xc1\x90\
-%0\xec\x5c\x18\x927\xbc\xb7\xf5\xf0\xfe\x83\x1f\x0c%\
-\xdd\x86\xbde`\xc7\xe4\xd3\x84l\xca\x96A\xa6\xc3\x8d\
-\xa3\x93\xd1\xf9\xb9,5F\xb2\xc9\xb5ci]\x05\xf8\
-\xd3\x97\xe4` \x7f\xaf7Ql\x88\x7f\xeay\xedo\
-|\xc0\xd3\x1e\xf2j<\x9f\x1f\x0d\x03S\xf5p8\xd4\
-\xad\xba\x13\x9c\xcc\x8eF'k\xdf\x94\x95\xb1\x1e|\xb3\
-\x17\xdej$\x99\x16\x7f\xb3\x17\x0c\x9a\xd9o\x05\xeb\x1a\
-S{Q\x0f\x1c\xc8\x14l\x9c]\x9e\xbf\x92\xad\x13\xda\
-&\xbdg\x9b\xf4\x8do\xacu\xf7t=x\x1b\x84\xd4\
-\x97\xc1b\xbb\x83k3\xd4\x1b\xa7\xa3\x8b\xa3Wk\xb7\
-\xb1\x95o\xf74\xbe\x03A'N\xe0\xe9\x1a\x22n\xe0\
-{\xcd2B\x22\x9a\xa5x\xc5\xa3\x90\xd6\xe44s\xbc\
->\x0c\xc2`\xddiZ\xb3\x832\xfa]}yC\xa5\
-\xa93\xb7n\x7f\xa0>\xb8M\x83{9\xe7\x1e\xc9f\
-\xa0\xc5\xdb6\x8c\x1b\xb4\xfe1\x94\xba`\x8c\x82\x07\xa6\
-\xa4\xde\x15]E\xb1\x11\xbe\xd9\xa3\x854\xa7\xde\xae}\
-S~\x12*]ZvmWa\xda\xa8NY\xda\x1c\
-\xd3\x0b\xe2\xf5\xa8\xfc\xe1\xc6\x8fg\x93\xe9Z\x10\xde\x0a\
-@?\x9aS\xdc6R\xd4q!,\x07\xc1\x86I=\
-l\x8e\x92\x14\xbc\xbe\x16\x8c\x12\xdc\x9a\xa6\xc5\x14\xfco\
-t\xe6#L\x0c\xe7\xe9]\xaf\x19\xaa\x0d\x18X\xf1\xf1\
-\xf1\x1a\xfb\xf8\xc7\xef\xe3\xd1\xc5\x88Z\xb8fN\xaf\xc7\
-\x97\x17g\x97\x17\xf8\xa2\xc3\xe8t6EA{\xb4\xed\
-\x9e\x8cO\xa9\x87\xf8<==\xb1\xc9[?\x1e\xbd\xed\
-\xd54\x92+\x13\xda\xf0\xc9\xee\xde\xfe\xfd\xc7\x8f\x86A\
-\xbcQld\x81\x13\x9f\xbaI/j\x08\x9f\xb5C\xef\
-\x94\x0cB\x5c:\x86-'g\xb8\xf5p\xbfN\xa7\x1f\
-\x81D\x0d\xab\xd3X\x0fARS?5\x0d\xc2\x8f\x86\
-\xc1GA\xf8\xc90\xf8\x840\xe9H\x95\xc3:\x1e\xa4\
-f\xa2\xfa\x1b\xb0\xcf\xde\x80\x1f\xc5\x9d:W\xae\xdc<\
-Q\xb8A\xe0\xe3\xf1\xc9\xe4tx\x957\xc2\xd2\xc2\xd7\
-Tk\xe4\xc9\xdc\x09\xba\x88XN~\x84M\xeaN[\
-\x80M\xba\x98\x01\xb2\x10H\x16\x01\xa0\x96\x22\xb0!8\
-\xa3\xb2\x03\x83Z\x16\xc6N\x85\xab\x05lE,\x04\x9e\
-\x04\x1e\xba(\x0b7*\xe9\xa0\xf2\xa2\xa85\xa3\xd5\xe5\
-:\x8a'\xfcZc\xbaeP\xe1\x06q!zk3\
-\xbe\xab`OW\x0bPZ7\x8f\x1aW\xd9\x16\xae\x10\
-|\x16\x11\xb3\x96v@\xdaURCo\xe8@k\xf8\
-\xd9F\xec\xe9\x0d\xac\xc2\xc6\x0c\xeaH\xa8q*\xf3\xd7\
-\xc0\x1bR\x7f\x0a\x8d+[\x19W\x06@\xb8\x01/P\
-mA\x85\xf3d\xd5\xa8\xb8I\xde\x11\xe187A\x1c\
-oFQt\xa2(\x17\x03\xd9\xb6w()\xa5C\x0a\
-2^\xb5\xa1\xba\xbaU\xad\x8c\xb0Z\x09azS\x80\
-\x5c\xbb\xfd\xd2\xa8\xab\x97\xa9Z\x19\x87\xea\xc4\x11\xdf\xd8\
-1\x1d.7\x8dW\xebX\xb22\xc2d%\x84\xf9\x8a\
-\x84.w\x08\xdd\x01\x07Mq\x02\x07\x17+\xd2:\x22\
-\xbd\x1dH8\xca\xdc\x92\xf0\x99\x99\xa6w\x15,C\xd1\
-/\x903e09g\xc4\x06L\x82u\x85U*\xa3\
-\xa33K5j\xb5j\xaaX\x97\xdc\xc0\xbb\xeeB5\
-LNb\xb7\xaa*w\x0aH@\xd0h1\xe6\xb1d\
-\x81\x91[\x1d\xd8T\xff^\x18t/B\xe9B\xf0\xcf\
-\xb6\xc8\xa4R\xadZRm\xd6\xa86k\xaf6^\xa9\
-Z/8l\x99.;\xaeh\xac\xf4\xd0\x1a\xc9\x813\
-\x7fF>\xc0\x07wb\xab\xa8E\x0e-\x11\x989\xb4\
-\xe0\xb2\x0a\xeb\xfa2[_\xb8P\xa5SY\xeagk\
-\xa9SB\x18\xaep(\xdf\x14w\xdb?\x95\xd5\xa1\xc6\
-\xbd4\x80la\x90#\xb8\x90]\xd4\xf1*\xa1\xbd%\
-\xc0\xe2\x0a\xcb\xbe\xe3\xdc\x08\x17\xa8\xa5F\xba\xf4\x08\xce\
-\xc2\x95\x0f\x81\xb0\x8b\x08\xeaz\xf2\x15\x1b_,o\xbc\
-\xf2\x1a_\xac\xd6\xf8j\xe5\xc6'\xad\x8d/\xf3\x95V\
-\xcc\xf2\x81\xef`\xe3$\xf0\xe5\x0a\xe8=>+\xbb\x81\
-\xcfj\xccrY.\x1b\xa8\xe2\xf3r\x8a\x8b\xcbAW\
-S-\xaf\xe6s\xf2s]k\xa9\x8aV\x9b\x8e\xe2\x8b\
-MG\xa5\xbe\x86\xe9\xf0\xd6m\x15\x7f\xc5\xd3Q\xb5\x8f\
-S\xf2\x15O\xc7\xe2\xee\xb8\xb6r\xae\xc91\xa4\x5c|\
-a\xeb\xf1\xbfM\x11\xd7\xe4\x18\xf2\x8e\xfa^z09\
->\x1crN|\xf56\x97\xdf\xa9\xfbc\x84\xcc\xbb\xe9\
-f\xdd\xf1^\xb6\x7f1\x9a_\x5c\x9e\xf1\x93YP\xe7\
-\xbeE\x19o\xed\x8dG\xc7\x9f\xf9\xcfc\xe8\x0e\xb7\x86\
-\xe5*\xd2\xb0\xe1\xd2\x0b=\xcb_\xfcks\xab\xac\x1a\
-\xf9\xf08m$o\x83n)\x9f\xc85\xdcg\xec\xa2\
-VE\x8a\xa2\xfa\x1d\x1b\x91\xfa\x164\x91\xc4\xfd\x92\x0a\
-\xb5\xfb\xc0B\xd4\x10\x8c\xe5\xa3\xd2*\xa8a\x0e\x05\x1a\
-\xb1|\x8c\xd9\xe9f,\xf1W\xe0U\xcdX>j\x14\
-\xf0\xdfi\xdd\xa4Z\x14\xb0\xde\x8b\xea \x9aJ\xf4\x10\
-c\x89\xc3!\x96\x8f\x82\xb8\x90\x10[\xa9\x13BSi\
-O{\x08\x81Y[>*\xb6<gG\x8b\x8e\x9b\xd4\
-\xa2\x10\x7f1\x12\xf3\xc2\x18>\x0a\x066n*k\xc3\
-\xc7F\xd3\x0a\x93Z\xb1\xf7\x02X9\xd5v\x8f\xb1\xf8\
-{\xc1\x1fV\x5c\xd2N\xdcL\x8bSQ\xc2(\xfd\xee\
-\xe5\xd0-6\x86\x8fPlR~\xee\xb81p\xec\xe6\
-[\xec\x1ec\x1e\x1c\x18\xc8\x97\x121\xa0L\xddF\xc3\
-<;q\xbc\xa4\xea)a\x1c\x95c\xf7(\xad\x86#\
-,\xc7\xec\x11\x9ei\xe0\x9f \xac*'0B\xa3\x15\
-\xd5B\xaa\x13.S\x1a\x818G\xe21\xd4\x0e\x1d+\
-\xfd\xd3\x14\xb0\xc3\xc7\x16\xb7\x8eY\x9b\xdfU\xc5\x0fE\
-\x1c\xb1\x05*\xb9\x1cD\xaa\x82\xe7\xae\x98=A\xc3\xa1\
-\x8e`f\xd7\x81\xd4\x91\xb8\xcaZ\xbd\x89\xf9\xbaf1\
-^(\xa1k\x16'int\xcd\xe0L0\x87F&\
-\x1b.\xe0O\xd4\xa2kF%\x0aG\xd7\xcc\x14b\x08\
-{\xaf\x87=O%\xda6e\xed\xd3F\x89\xed&\xbb\
-\xea\xe48Y\x98)8\xbfe\xb7\xe5\xec\xb9\xc7\xf1\x9b\
-\x0636\xd6?\xeev\x8e&3\x96Z\x8ff\xa9\x84\
-\x88+S\xb1'\xcd\xf4\x88\xc3\xa3\x0f/\xb4\x8c\x0dA\
-9\xba.W\xdeg{X\x81`Y\xb1\x1b%\xb6c\
-\x03$\x15\xdb\x14<\x92j\x08;\x87Ie?\x94\x99\
-2\x16\xb8\x89\x890\xc5\x0a\x85\xe27\x0dvX\xfd<\
-\xb5\xde\x99\xd8\xd3\x07k\xc9\xb8\x90\xac\x14\xad\xb62\x8f\
-l\x19\xc7\xcdW\xcc\x90\xa4\x01I-\x04f\x5c\xec\xbc\
-1i8\xe7\xe21v!X8\x09\xbb'\x8b\x1c\x88\
-\xb5PH$\x08\xa9j\xc0\x8aJ[/\x10\x0c\x0e(\
-\xa07W;\x1b\xe3`p9\xb4\xe7\x1c@bk\x8a\
-]l\xec\x05\x03kFj\x8a;{+\xbe@\xe2\xb0\
-\xe1\xf1*gO uz&6wtd\xa3?\xd0\
-\x9c\x14m\xc6\x02j\xac\x9c\xce\xae\x8e\x22\x9d\x9eB\x8b\
-\x98\xf1\xb3\xf9d\x16-x\xc2\xc9\xd9\x97{\x03\xc0m\
-M\xca\xda\xd1\x19\xfa\xa3JDBc#\xa4\xa4\xf2A\
-0\x90db\x04aGW\xa14\xe9,\xc4.\xc9\x8b\
-\xb0\xe9\x1c.\xcd;\xd2k\xaf>\x0d@Y\xfb\xe7\x13\
-/\x11rb\x10\xa4\xea(\x92E\xbe+\xfb\xba\x08\xfb\
-3\x82\xce\x5c\xda,\x12w\x01\xe0<$a{X\x7f\
-\xc1\xb2G#\xf6\xbb(k%\x86\x89\x22\x032\xbf\x84\
-]D|\xd2\xb2J\xbeLda\x978{(r \
-(\x13K\x99\xaae[0\xa4p6&-E\x8e)\
-\xa6b6\xbe\xcf\x8b\xb4\x01+-\xac\x80\xd57\x82\xdc\
-\xea\xe0\xdb\xb5\x1f6\xec\xb32\x17\xafn\x1e\xa5aG\
-t\x88\xb7\xa9W\x13\x1dib\xbb!\xb6\xd1X\x97\xa9\
-\x84\xa9\x15\x8f\xf1\x0d\xdfq\xec\x1b6\xd5\xb4\xa1\xe0=\
-\x91\xc3CEm\xd3\x16\x1b\x07q\xf0(\x1f\x0b\xa0R\
-\xda7\xb8\xf8m\x83Rz\x5c6\x1d\xb7u\xf9g\xd3\
-\xbe)\xe3\x05\x00<\x9de\x12gm\xc1\xa3\x9b\xae\x1c\
-\x8ac\x15\xccO\xc5\xa1\x9a\xb5\xa7\x8b\xd9\xe7R\x1f\xfe\
-\x8cdTR\xe3_\xd9q\xa7#e\x1a\xce\xc2\xfb\xec\
-\xc7\x9aMa\xd8>\x17\xf1\x8e\xe2\xda\xe2\x99\x9d\xd3\xb1\
-}\xae\x03H\x0c@\xfc\xb6\xc1\x13~\x12{\x87\x0f\x81\
-\xb2\x0e\xa7\xfa%\xabr\xa4\xb9\x84\xdd\xf1\x0b\x15\x91\xc4\
-d\xef\x8331\xce\x86x6\x99\xad\xca`L\x935\
-\xe6Y|\xba\xc1\x8dm\xd4\xc4\x86\x01E\x04\x05\xe1\x8d\
-x\x5cy\xd2\xd8\x02\xb6\x8aay\xe9\xb7\x0c,\x0f\x03\
-\x16\x1b\xcd\x0c\x0eX\x83h\xa1\x10&:\x92\xd8F\xcc\
-\x1ff\xc2\x1f\x12\xa40\x90\xd8\xe3\x1c\xcb\x02\xfcK\xc7\
-\xe8\xb0\x9b\xf7X\xb5\x82\xd8\xc8\xaej\x80\xd8\xfd\x17\xfb\
-o\xcc\x12\xe6\x5c\x1an\xe5\x8aN\x08\xdb\xc2\xd1\xd2)\
-\xc5I\x1d\xa6W\xdc\xb4\xb1s\xc7V\x88j,\x1f\xf6\
-\xad\xc5vF\x8ay\xa7R\xecU\xfc2Y'\x04\x1d\
-B\x0c\xd8(\xa9!\xe2\xd9\xae\xe8\x84\x94\xa2\xea\x137\
-w\x5c\xc9\x86\xa7\xad\x10\xd6 \xe7 \x09\x82-M5\
-/Tr\x0cF\x07R\x8fN\xcc\x8e\x07\x89~,B\
-*\x03I\x1bmc\xe7\xd2\xad-HT'\xc4\xba\xcc\
-(\x1b\xa3c\xfc\x12,B\xd88\xda\x1d\x9d\xda\xc1\x9e\
-j\x197\xf1\xb0\x17K\xf0\xce\xd8\xf5\x09(e\x92\x06\
-\xa4.\xd3\xe5-\x10\xe7\x9e\x03\xc8ko}<j\xb1\
-\x8dtb\xac\x82\xcb\xac\xea\x00\xb0\x7f\xb3V\x00OZ\
-\xd5p\xc0L\xe9IGz\xda\x91\x9e\xb5\xa7\x17q\xbb\
-\xe7\xbd\x22i%\xdcea\xc3\x08\x94BQ\xcbD<\
-\xef\xe5\x86\x05\x06\x1ev\xfa\xc9\x9c\x5c\xc9\x17\xb9V\x80\
-e\x9a\xc5z;\x13\xadz\x02T\x1d\x00P\xac\xd6\x89\
-(\x93.@\xa7\x9f\xc9\xb2\xd3\xcf$n`\xe2o<\
-^4#\xd4\xbe\x15b}\x1d\xcc\x0a\xed\x09\xb6\xac\xac\
-C;\x7f\x1c9,\xc5b:;\x1dT\xa5\x89\xbb`\
-\x1dzV`\xbf3\xd8i7h\x7f\xc5\x8e\xebkr\
-\xad\x88?\xe0X\x82\x04\xc9;!\x85\xf5s\xeb\xcdz\
-e\xbc\xc1,\x02\xaa\x0e\x97\x9d\x15\xbb\xdf\x14\x0f1E\
-\xce|k^\xb0%\x18\xbb\xdf4\xf7y\x0f\x10\xb7;\
-\xd3\xac\xd89~\x8b3\xcdJu\xb8Ye\xff)\xed\
-\x00P\xfc$\xb7\x80\xdc\x02\xb0\x05S\x15\xba\xbbY\xea\
-\xa8:\x00\xb1\xe3_4\x91xI*\x16\xdb\xf2X5\
-@Y\x0d\x8aY\x16\xc7\x11\x22Mg8\x226;k\
-\xe9\x80\xe4\xe2\x00\xd0\x0f\xa8S\xb2c:'=\xb6\xe9\
-e\x0b9\x936W\x1d\x07\x04\xfbm\x81\xe2c\x92U\
->CP\xe1\xe6\xd1\x01\xc9;!E'\xa4\x94\x18\xd7\
-\x0b\xe4\xb9bg\x86\xad\x10!\xdcqK\x7fZ\x09w\
-b]S\x16\xda5\xa5\xbffk\xd7\x94\xa9\xef7\x97\
-\xd0\xe5\x8e(\x83j,Q\x07\xbb\x91\xb11\xb6\x22?\
-h\x16\x1e.;A\xd8\xccI\xeeEk\xd2\x80\xbc\x1d\
-\x90\x95\xd6\x0f\xb9\xf8\xad\x8ct\xc0\xe2\xac\xcc\xdb\x01y\
-\xd2J\xf0)=iO\xcf\xf4\x85Xs\xd2\xd8e\x89\
-u\xb1\xd9\x0eH[\xa9e%\x9e\xb4\x8b\xdc\x88\xaf\xea\
-\x12|:\xb5\x02\xbaP\x15:B\x82J\xfc\x8dY\x15\
-\x89\xb9\x8f*\x11\xed\xc1f\xb1\x92\x008,\x14\x89\xd8\
-\xa4W|\x0c\xca\x9d\x90 \xaa\xf6%o\x1d%\xb1=\
-i\x91\xa8\xf6\x8a`\x8c\x0e\xbeJ%\xf0\xc2\xe0\xd2^\
-\x82\x14E;\xf1\x07\xa8\xec\x04a.\x89s\xa5\xcb\x85\
-?\x07\x00\xe5\xdd\xa0\xa2\x85\xaf\x10\x8f\x5c\xbc\xd2:@\
-\xd8<9\x84\xaa\x85e\x08$\xfc\x0e\x9fA] \x1c\
-*\x11\x87\x1dM\x9a\xadg\xc3\xd3v\x18\x1fF\xed\x9d\
-f\x0f\xb8\x1d \xe6\xccZ\xf8c\x80\xd2nP&\xcd\
-\x8f\xab\xb4n~!\xa0\xbc\x1bT\xe8N'\xcdN\x0b\
-\x05j\x07\xa5\x95p\xfd\xc6\xc3\xa0\xe3\xe9\x93\x1dC\xb9\
-\xa0\xba_\x90\x0e\x14\xf0\xdd\xaee\x89N\xe3\xd9\xa7F\
-\x0b(+\x92,\xf2\xee\xa7\xb8Q\xb27U\x80\xcc5\
-4\xe5k(@\x1c\xbb\x05\xa0\xb8Ul\x09H\xd2&\
-\xb7\x04 7c\x9b.\xb4\xa1\xe8\x06\xc1\x90\x1fF\xa3\
-\xb1\xf2N\x0a\x80:\x0e\x11\x02\xe5Q7Hu\x22\x84\
-\x14E\xdc.F\x0b \xdd\xc2D\xdfz]P\xd9]\
-\xaa2\xa5\x92f\xbf\xf8\x09\x03\xcet\xb3\xccc\xe8\x01\
-R\x06\x94\xba\x1c\xfdu\x87\x1ah\xb0.\xca\xd0\x97\xcf\
-\xcf/\xe6ke\xaf]\x95\xd3\x7f2\xda\x1e\x9d\x18\xed\
-zQ\xc4\xdc\xfc\xca\xdf\x8f\x12Z\xa0\xc6]T\xea\x84\
-\xa2$\x8a&\xfa\xca\x03\xd1Vv\x1c\xc8\xc2\x11E\xce\
-^K\xd9},\xbf\x01\x0d6h\xf5\x96\xec<V\xb1\
-s7\xfdW\xe9\xbf\xb1\xfe\x0bw\x9d0 f\xcf\xb1\
-U,\x9ec!o.\x04a!\x08\x0b\x83\xb0\xd0\x08\
-\xd9i,\x12J\x8d\x91}\xc6r\x02;K\x15\x8f\xb1\
-\xc0\xcc\x1ec\x19\x90\x9b\x94\xc2\xa4\x94\x92\xb5\xd2\xbf+\
-\xf6\x1b\xdb\xe6:\xb4\xd4\xe2\xd6\x82\x8d?\xe1z\x00\x1c\
-/{\x81\xe37\x03\xa4\x96\x91DF\xe6\x9d\x99G:\
-\x95eK\x85\x04uL9\xb2\x9f\x12\x1cx\xd9\xc9$\
-\xaa#\x1c\xbf\xb1\xff/\x18\x96\xc6\x12\xf3\x8b\xf7\xa3\x93\
-\x1f\xac\xbf\xb2\x01\xdb\xeb\xa6\x94\xe2\x8e\x02D$E`\
-G\x9d\x1d\x12x8\x14\xc8\xb4\xe7\xc6f\xf6\xc2`\x8f\
-\xbct~\x10DH\xdb*\xac\xe0\xfd\xb1\x12\x97\x16\xb9\
-q\x9cGd!-\x99\x91N\xed\x93 ?4\xc1I\
-'\x84Z\xf02#O\x82\xeceP\x82\xa1\xb1I?\
-o*\x18\xf1\xc3\x0f\x1dS\x98\x9cC\x00G\x929A\
-\x5c[yyKl\xecDv\xbe\x1bBI\x09.J\
-\xe0\xedA^\x05\xd9eeU\xc2\xaf\x18\xbc\xfa\x99g\
-\xc1\x5c\xfb\x1c\xed#\xe6 '\xa7\x92\xac\xd8\x94\x87}\
-;V\xe0$\xd8\x18)b\x81zY\xc0\xbd\x1a\xad\x9a\
-T\x9e\x06urQ\x96\xcce\xb0\xf7S\xddM8P\
-\x00\xe3\x97\xc0w,\xbc>\xe3\xf0\xc6&\xc1hA\xb6\
-\x0a\x97\xd1\x8aCWU\x16\x11]\x97\x88{\x81\x00\xc3\
-<\x10r\xd0\x9aRE<2hei\xfa\x0a9~\
-\x02/\x0d\xd4+~\x86\xd3\x9d\x05\x9a\x8a\xf3W\xa52\
-o\x842\x92U.\x11\x98\x94\xbc\x11\x228\x0c\x9c\x13\
-\xc0W!\xfc\xfb\x16\xe6\x91\x10\xce\x87\xd8cm_\xac\
-\x99\xcc+!v\x18\x8d^\xc1X\xf8\xbaP\xd8d\xa5\
-\x10\x91\x0fw\x0f\x8e\x83\xabg\xb5\x8f\xa8\xdb\xcc\xf8T\
-\x91\x0d\xa6Hm\xe4\xb0\xd4\x15\x07@\x834\xb4\x8a\xec\
-\x22P\x88R$17\x16^\x05W\xa6\x8e7\xbd\xe8\
-\xdfL<\xef\xcdG\x9f^\x5c\xce\xbf.\xc2\x19g\xd6\
-9U\xe1\x12N:\xa0}\xc2\xd9\x1a\x97\x17\xac6<\
-{\xb1c\x18\x88\x81\x95\x09\xcc\x8b\xc8\xd3\x90ae\xec\
-\x106\x86@Y\xdel0\xe6\xb2|\xc1\xbfV&\xa4\
-.\xe7\xcf\x19;\x8b\xcbJ\x1dR\x97='\xc2\x7f%\
-Vq*N\x1686\x09^%h+1\x00.\xd5\
-\xd8\xbb\x0d\x8bih'\xc1KO\xc2\x01\x01u0\x5c\
-\x1d\xb2\x04\xb2\xa3*\x91X\xbf\x85\x0e\xaa\xcb\xd1\x96\x15\
-g\x970\x99\x89\x8e\xaa[d\x12\xde\x9aK\xa4\x22\xc2\
-\xe1\xa8\xba\x11\xbbT\xe4\x02\xec\x9a\xb2\xd0^\x9a\x11\x9e\
-\x17\x9b\xbe\x82/Vqf\xcb\xc2\xafH\xb4\x06\x90\x0c\
-\xc7\xa3\x89&\xc1|M\xc9\x04y\x06W\xbeL\x82\x11\
-\xa6OgN\xc5=#\xd3\xe0\xb2\x90\xc0N\x15{\x9e\
-d\x8f\x91L\x83!\x01\xaarN\xc7K,{\x5cH\
-D\xca\x8d\x18\x0a\x9c^\x89\xd4\x9e\xfd\xa0E\xa9mK\
-)>\xba\x84\x06W\x1cr\xda\xb4\x06\x22=\xe6\xa0\x88\
-\x02e\x92[\x07ud\x12\xcc\x8d\x91\xf4\x18\x9e\xbe*\
-\x1d]7c\xcd\x84X\xbc8+\xec'v\xbf\x09\x97\
-\x8c \x04\x1c\x9d\x14\xb4^\xc7\xd1\x85\xeb\x1d(\xe2@\
-\xa4\xc7\xe2\xb3J\x02\xe6\x22\xf0\xb8\x82\xb0\xb8\xb4N\x87\
-sM\x0e\x12\x0e\x1b\xcd\xf1`c\x1b\x1a7\x0d\xd9E\
-%\xc6\xab\x90\xc7+~\x87\xa2s\x05\xfc\x13\xc7O\xd5\
-\xce\xb1\x8db\x04\x0e\x88\x98\x91\xc1Em\xae\x89\x01,\
-\x22\xf9\x89M\x22\xc2\x0a\x8dO\x99\xc0\x19E\x13\xa6\xfd\
-\xec\x1a\x96\x1bQ1\xc9\xa6&\xa5\x8e\xe6\x07\xfb`V\
-!\x9c\xb0Y\xd5\x0f\x1dt\x97\x0fJ\xf8\xea\xd14\x1e\
-~\x8b\x14\x82\xf1B,\x95s\xd0\xc1Lg\x07\xf7\xc0\
-\xaa\x22\xecx\xd6\xa8\x7f\xc4|\xa7\x13\x7f\xcei\xad\xff\
-\x91@\xf5\x02.^0\x01p\xb8\xca\x174\x8e\x17\x8e\
-\x80\x09\xc0V\xc1\xbd)S\xf8\x98\xcbW\xb8\xa9\xc6\x10\
-\x85\x1b\x0a_rD\x85\xaa`M\x0dy\x9cS\x92\xbd\
-LL\xf6J\xd9P\xb9\x1c\xc5\xa1*\xd8Cx\x05\xc5\
-\x95\x92{\x9a\xe9\xdf\xd8kr\x1c\xa4\xf6\xa8,\x10t\
-\x91\x06=\x8a\x0d\x81g\xc5\x19\x8c\x16\xed\xbc\xb2\xa6\xef\
-\x99\x99\x22\x1a5\x89Se:\x0a\x17#\xb8\x0c\xa25\
-\xfc\xe2_\xcax\xc1o\x09ozj\x86U\x05\x81\x1c\
-.%<\x1c@\xb6,L\xb8\x5c\x1c\x12\xb8\x1cC\xd2\
-\x9a\xea\xf0\x80\xec\x17J\xdcT\xc1\x83\x07\x0b\xcbr\x1d\
-\x17\x97O\xce\x98\xd3\xf91\xae\x94\xb8\xb8\x10B\xf5\xe1\
-N\x17\xd1\x19\x95h\x05\xb1+m\xb8E\x8e\xd9m-\
-\xbb\x0e\xb6\xae\xb49\xa432\x97\xda\xf59\xbb\xd2.\
-xz N\x049\x13\x0fg\xcc\xae\xc7\xacG\xc3\xbe\
-\x87L\xf8X%\x8fkp\xdc\x0b\xcf\xc1J\xfc\xf7\xb2\
-+m^\x91\x1cEC\xfc\x9c\xd6qn\xd9c#a\
-\xaa\x98\x13\xcaRe\x5ci\x97\x12\xd4\x1e\xbe\x96!\xa5\
-\xfe\xff\x8b\xbb\x96^\xbbn\xf3\xfaWZ\x0d\x8c\x08\xd0\
-\x15\xf8&w\x02\x0f\xe2 @:(\x90\xd6\xc9\xa4A\
-\x06N\xaa8B\x5c)\xf5\x95P\x14E\xfe{\xf7Z\
-\xeb\xfb\xb8\xc9s\x8e\x5c\x0fjgb_q\xf3p\xf3\
-\xb1I\xae\xef\xb9B\xf7\x5c\xda\x83\xd7sF>\xe4\xb3\
-\xcb\xddSic=\x90H\x1d\xde$\xe7\xa1\x92\xf2d\
-\xba\xd5Ja\x0cH\xb0\x9b\x93\xa7\xd2\x1e\x12\xe7p\x88\
-\x83\xee%&\xcf\xa5\xdd\xb9\x95\x01\xd6\x22n\xe4\xe0\xb9\
-\xb4{\x16\xc15\x8e\x9d&\xb2X\x9e~I\xe9\x90u\
-\xcdTR\xfbRqZm\x08\xa1h\x96\x0eO\xa5\xcd\
-T\xd6\x91\xd9l\xc7\xfcE\xb1\xd9\xc0t\x07&\xe6\xe5\
-\xed\x1e\xed\x04d\x924\xa4\x03\xc3\xe1\x18=\x97\xf6\xf9\
-\xa5$d\xa8\xcctC\xe1$\xc5k\x95\xb1>\x87\x12\
-5GiS\x99W\x19\x1d\x22\x01\x9a\xa7\xd2\xae\xfa8\
-\x8fH\xf1u\xb0?L\xa5\xdd\x99<\x8a\xf7\x18\x8cM\
-\xd1Risd\xcc'\x8e\xd6\xcf\x01$O\xa5\x8d\xf5\
-\xc7\xe9\xd8@\x03z\xae\xf3\xc3\xc4i\x22k\x84%\xed\
-\xa9 )\x1b&\x14\xc9\xaa\xfaE\xd6\x98\xc4Z\xcaG\
-8\xa0q\xa3\x0cN^#/\xcf+X\xca\x01\xc8\xf1\
-j<\xe1\xbd\x9e\xa9\xd5'-\xf0\xf9\x11b\x85\xf0\xc8\
-\x0f-d\x1b\x1f\xdc=\x19\xbb\x01\x8f\x9a\xad\xaa\xdd:\
-P>\x01\x0c\xe0\x91;\x0aiv\x91K\x1e\xfd;\x9f\
-\x902\x12D\x92\xc2\x8e\xdc\xd5\xf0\xd3\xc0\xa3h\xa9\xad\
-3Oc|\xd1\xc8i\xf5\xe3\x03\xb2\x1f\x04\x8b\x8d\xc7\
-X\xac|'\xfaJ\x07\x988\x90\x1e\xfa\x16|ac\
-\x03\x1e8\xf6\x1a\xe6\xbe\xf6\x8aY\x01\xf3-\xf6\x82W\
-!a\xd6\x8e\xbdD\xa4s\xae\x13>\x91\x15{\xe1\x01\
-\xee\xa8~\x0b\xbd`\xac\x01\x915[\xba\xa0W\x87\x8f\
-F\x97\xb7\xdf\x0a\xbd\xc8\x9f\x01\x87\xb9[\xe4\xc5\x1f\xc0\
-\x8d\xafm\xc8\x8bD*\xd8\xf8\xe1\x06x\x05\x1e\x13\xe4\
-\x16\xa5\xec\x0b\xdbTfq1\x97\x0e\xc9\xbe\xe7\x8eV\
-i\xb7\xc4P\xdc\x88:B\x02N\xee\xf3\xe7\xc5\x80W\
-\xcfW\xdbF]@\xe0EE\xaf\xea\x93\xa0 \x1a\xf0\
-\xc2^b\x8e.5O\xe5\x16\x81W\x98}\xa9\xca\xae\
-N\xe0\xd5\x06],\xd9|W\x12\xcb\xdafnuV\
-G\x8a\xf5\xe8\xc2\xef1{\xe3,\xaa+\xf2bV)\
-0Q/\xc8\x0b+\x149\xf1\x119\xbd\x89\xbc\xda0\
-?\x0c\x9cQE\xbe\x0eB^JC\xd8\x90 ^\x14\
-HD^\x07\xb9\xd3{\x94\xfd\x0a\xbb^\x1ce\xbc\x8a\
-\xc6`\xa2\xf7\xe1\xee\xb6\xbc\xbe\x8b\x080pxu\x07\
-^\x95\xb5\xf1a\x025U\x07^\xaa\x0di\xb3)\x7f\
-\xb9\x0b\xd70\xa7\xcb\x9b\x08\xf9\xf3\x0dx\x1dA\xd8\x08\
-\xf6N8O\x1a\xf0j\x8dl`\xa4\x19\x85 y\x09\
-\xd7\xa4\xfb,@\x0e\x95\xc8\xc8\x85k$\xbd\x03\xf0\x8a\
-F\x93\xde\x8d}\x00\xa77V\xa5C\x82w\xe4\xc5f\
-\xf0\x128\xb1\x16G^\x07\x87\x82\xc8\x18\xfd\x9f\x5c\xc9\
-c^\xa06\xd4\x91\x5c\xb6N\x87\xfe\xcd\xc5\xea\xf4V\
-\x0a\xd6\x0c\xf0O\x22\xa4\x1a\xcc\x15\x1dU\xbd\x1d\xaa~\
-n\xdb\x91.\xd1\x1a\x98,\x0d5V\x0cy\x1d\xf6\xb2\
-\x83\x13C\xff\xa5\x22\x1f^\x8e\x88\xd7\x9bl\x8eU\x10\
-\x1b\xc5\xe7*?%7\x1d_#\x05\x15\x02\xdfQ/\
-\xd1Z#$\xa66\xff\xc3a\x18\x0b\xaa\xe4Cd\x08\
-\xc7%ZsH8\x05\xba\xf12\x04\x0d\x89\x046A\
-T\x009\xdd@/\x92\x0fu\x11s]\xd8KG\xc4\
-\x13)\xb1n\xb1\x97Q\x17W\xc7^\xe4\x7f\xa1\x83g\
-\x93\xdb\xd71&,E\x1a4\x80\xac\xe24&\x8d\xa0\
-\x1f\xe7\x18\xa9,&\x8dI \x0bJAr\xbd\xec\x18\
-+\xca\x13)C-\x0d\x06\x97s\x97\x94\x89\xbd\x22/\
-\xeb,h\x9d\x95#?\xab;pe\xa9\x81:\xa2\x22\
-\xcbJ\xb1yC\xb6}\xea\x85\x8dl\x9e\xd8\xabS#\
-\x95 \x90\x9dGn\x9b\xe0\xcbP\x5c\x1a\xa4q\xe7\xa1\
-n\xd8\x8b\xda\x0e\xfa\x95\x83\xea\xe1\xc2^4j\xa5\x81\
-+Tg\xb4A/\xa2gD\x99\x83\x84-O\xe4%\
-B\xd7D\xedTe\x12{A/\xb2\x82AX\x05\x9b\
-6a\x88L\xd6f\xdf7\x92@q\x8cd\x01)\xe0\
-\x80\x22\xe0b\xa4$E\x07l\x92\x03|\xec\xba\xea\x0d\
-y\x0d\xa6\xc1\xa34\x08\x89\xafM\xe4E\xe5Q\xd67\
-\x94\xcb\x98\xc8\xab\x88\x96\xe1\x14\xf6\xb0\xa4\x8e\xbc2{\
-Z\xc5\xad\xa7\x19%\xf2\x12\x90\xee\x9dt\x11\xf4\xf37\
-\xe4\x95\xe4\x01:\x98B1\xb7\xec\xd0\x0b;\x0b=9\
-\x0e\x9e\xd59\xde@\xaf|\x08z\xc5\xf2\x7fB/q\
-\xf1!\xd7|\x1d7\xd0K\xa4{\xd0\x9c4\x83^i\
-\x0as\xe0\xda\x80~\x13\xb3\xea\xa0\x8c\xc9\x91qC0\
-\xf1w^@\xd9\xd0[8Q\xf8p\x8f\x0b\x94\x11D\
-\x01>p\x7f\xe68\x16P\xa6\xc1\x80\x86\xa6Z>\xf7\
-\x09\xca\xda\x9cx\xe0t!/\xceq'\x07\x08<1\
-\xf1\xa6\x22\xb8\x16\x8f\xeb\xfb\x09\xa2\x11\x8a\xe5\xc7\x84d\
-\xb7\xe9\x89~\x08hV\xaf4\x8bu\xb1/\xb4[\xfb\
-\xc2'\xf9\xea\x9a\xe8\xeah_pU>-\x0e\xb0\x1b\
-4W\xe6w\xb7\x10\x90\xae\x8e\x7f$\xb7-d\xb3>\
-<2:\xc8\x1c\xe1\xedn\x86\x07\x19\x0dV\xcb\x83\xfe\
-XM\x0f\xfa\xa3\xf8\x1f\xd5m\x0ec\xb11\xe8\x8f\xc3\
-^*\xba: ,\xd2\xd5\xa9(y\x91\x1bH\x8c\xae\
-N\x7fzc\xa2\xab\xe3/b\x9aey\xfeU\xe6\xd3\
-:\xffj\xf3i\xf7\xa6IW\xa7\xbf|\x94\xa2\xabc\
-Y\x9a\xefH>\x81\xa2\xab\xe3(HWw\xf6Tt\
-u,\x22]\x1d\x8b\xda,\xf2\xe5\x11]\x1d\xcbHW\
-\xa7\xb22\xcb\xda,\xf3\x15\x10]\x1dz\x22\xba:\x95\
-\xcd\xf6\xca4\xde\xd4\xd9\x81\xea=\x16]\x9d\xca\xe6\xdb\
-\xaa/\xb2\xe8\xea\xf4\xd7\xd0\x17!\xba:Vk\xb3\xa3\
-m6\xd2\xdc\xa8$\xba:\xfd5;\xc5\x8fQ\xbf\xf5\
-\xe6\xe6wt\xcc\xaf\xc5\xe8\xea\xf4g\xb4^}\x92\xae\
-N&\x9aq\xf0\xc6\x96\xa8!\xba\xbaH\x17\x0e\x9e\xab\
-T\xfe\xb66\xf5\xed\x8d\xbc3\xd4\xb7\xbb\x85\x06\x86\x0e\
-\x91?\x0f\xdc\x9c\x97\x85\xe6\x80\x0c\x03\xd6\xc1\xb2\xd2\xd5\
-\xc1:\x81&\x88\xb7.\xba\xba\xf3|Gi8\x16\xfb\
-L\x83\x07\x1d\xf5\xc0\xb5\x5c\xe6\x99@\x9d\x13\xb9y\xa8\
-\xe8\x9b\xe6\x19d\x83\x07\x80\xecy\x01\x90\x90<I\x7f\
-N\x03l\xaf\xb3\x0d(\xb7I\xf0\x97/\xf8\x18$\xcc\
-\x80\x862\xba\xde\x0e\xa5\xe7\xd7\xae7&\x5c\x94\xfd\x1a\
-a\x0dKG.\xc3\xcc@DK\x96\x02aLc\x05\
-\x94\x9c\x18c\xe9\x8b]\x06A\x03b\x06S\xed\xcb,\
-\x83\x08mT\xdf\xcc2\x1d&a\x18}\xe4\x9eI\xca\
-:$\xefC\xa8)\xbd\x89\xd2e\x95\xc1\xfc\x01b\x01\
-N\xf5\x0b9\xd2\x94z\x9ejP+\xb6\x0b9\x92\x89\
-\x0amC\x0f\x1e\xfae\x94\x09\x8a\x9c\xe2w~\x01G\
-\xd8\xcc*\xad[dj\xba\x06\xd9aT;_\xecX\
-\xaf\xc2U\xa9Qo 1\xc3\x19\xeb\x86X\xdd\xaa\xd0\
-\x01\x91^\x8d(\x05\x9a\x0b\x8a\xc7\x9a|uP\xbc\x06\
-6!\xf5T\xf4\x96!5x\xf4\x96\xb1\xd5A\xcaF\
-t\x8e\xa8\xa5\xa5\xab\xcb\xc6\xa9\x15`\x02%3XY\
-\xc9\xea\x06\xa5\x09 \x0feR\xae^\x5cB\x15b\x9b\
-\x10\x8f\x0cL\x10\x1b\xa3\xa8\xeaj[\xa8\xea\x06uJ\
-\x18\x93Hk\xe7P\xb3\x14T\xe9\x98\x08\x8f\xbd?;\
-\x96\xc8\x06\x1b\x04\xa8\x82?@f\x01\x08\x5c\x02`\xd7\
-h\x01\x91\x11\x0f4y\xea\xaa\xe8\x9d\xe0\x95\x0e\x95X\
-\xa5wG\xcc\xd7\x93\x0a\xa2\xc4a\xac}\x84xj)\
-\x11\x8a\xd60i\xea4\xf9d\xc6r\x22<\xe2\xbb\xf3\
-[;\x01\xa2\x18\xfb\xc6T\xaciY\xa5:lD\xcc\
-\xe4\xa8\xc3w\xfc\xaa*\xd8@SL\xdc\xc1\xe2!\xbf\
-\x91.\xc2\xb99\xd4V\xb9\xf5i\xde\x15A\x9d/\x14\
-\xa4H\xe8\xbd\xbaC;[q2\x84U\x9cL\xdf\xc1\
-O\x07\x02\x90\xce\xbd\xcc\x5c\xf5r\xbb\x8a\xdc\xb4P\xb3\
-\x9e\x9fl\x99\xf4t4\x1b\x0c\x85\xa8\xd1L`\xf4t\
-<\x08A\x03\x04\x13o\x9b\xf4t\x95|\x97\x91[\xa8\
-\xed\xf4t\xd7\xd1\xd4&?\x9d\xa8\xa1+\xc4D\xe6\xa6\
-7~:2\xceu\xe9\xcdT\x5c\xe6&R\x0cd\xa7\
-gZ\xbe\x0e\xa7(7\xd7#L~:RJv\xdc\
-i\xda\xcd\xe2\xa7\xd3'\xd4hd\xef1Mz\xba\xa8\
-o\xa5\x11\x83\xcb\xef\x8d\xf4t\xd5|\x01`\x8b:w\
-Xwv:\x88\xc7\x90\xbb\xf9\xcdq\x97\xba[\x02\x0e\
-\xfcD\x8b,\x95*\xf2A\xc2\x8d\x82u\x0bCF\xff\
-IN\x87\x05u\xf6\xc5b\xbch\x22\xa7\xe3\x826\xea\
-O\x8ck.{\xffA\x06\x09jS\x0e\xab\xce\x0fw\
-\xdd\xa8\x173]\xe6T\x16,zrf:{+@\
->I\x87\x933\xd3\xe1\x01\x22\x0eu$\x0dg\xa6\x8b\
-vp@\x80\x83\x5c\x19\x9c\x99\xeen\xeb\x89\x98\xaep\
-\xbfC\xabn\xee\xb0\xe2\xa5\xb3\xc9l1]\xec\x80\xe4\
-\xa5#\x1bh\x85\xf5\x80r\xab\xd8\xc3\xf3\xd5P\x13\x0d\
-bwZ\xba\xc2q\xe1\x90\xc4\x0b\xc4oW}35\
-m&Q\xc6\xb59\xdcSf,\xbc{\xba\xde\xeb\xc3\
-\x850|JK\xb0x\x8c\xba\xb1\xd2\x01\xa2\x0e\xeeK\
-\xca\xf9mnW*\x92\x8a\x22\x07\x8c\x94\x0e'\x04U\
-\x18\xd8\xf3m\xe3\xa4\x03gm\x82G\x0a]\x96\xc4I\
-\xc7q\x1d\x9dq\x9e\x07I\x1cDIW\xed;\x84~\
-\xa5\x9aZ^\x94t\xd8h\xe7\xb7C\xb3j\xa9?\xaa\
-\x09\xff\xcb\xaf\xde=\x7f\x89\xac\xa2?\x9c\x11\xff\xe2\xcf\
-^x<P\xfc}\x8c\xf8\x0cT\xc8\x0c\x9a\xc7\xa3\xe6\
-jd\xa8Xp\x01\x829\x0f\xa6)\xd4\xafW\x10\xe3\
-\x01\xc8\x10\x05\xcd\xb2\xd1h1\xdc\x8e\xae%\x05\x82\xb6\
-\xb3\xbb\x8b\xcb\x1a\x5c=2\xe7\xd1\x1b\xd1=U#\x95\
-\xc2m\xba\x02\xd8kI\xad\x16d\x86\x9b\xd1kh\x18\
-\x22\x10\xce\x87f\xdah\x0b1B9\xce%\xe8\x09<\
-r\xed)\xc1\xa0M/\x9c\xb3CI\xda\xe8\x16\xe9$\
-rv\x1c^\xb0g[\xc5\xd4\xd1\x05\xbdl\xfb\x8b\xa9\
-\x8e\xa6f\xa2i\x8a\x92Q\x086\xfd \xec\xd5\x17\xb2\
-6\xbe6j\x1e\x8a%(\xa6\x95\x9b\xc0\x8e\x0c\xbb\xf4\
-\xbc\x8ctN\xa9\xa4N>\x1b\xc8RG+\x1a\x82\x95\
-\x9b\xd4[5\xce9\xb3bRq\xd6\x19\x9a\x82R*\
-\xb9\x86T\xd1\x16\xba\xc0\xe2nN^\xe5q\x1b\x1e\x9a\
-\x1e\xf7\xe2\xb6\xf7\xda\x8b\xfb\xe3F\x86\x14\xce\xfb\x8cL\
-5\xf4\xcd\xc4\xf2<\x0b\xfd\xd5\x130\xcc\xb2\x10\xed\x22\
-X\x8d\xfc^x\x985w]\x80\xf9\x82@\x92nU\
-\xad\xce\xf0\x9b\x9c\x85\xc4\x83\xab\xa6\xa9\xcd\xef$\x1d\xb7\
-\xca\xfdj#\xa8\x8d\xe2\xaai\xab}\xfe\x0fr5N\
-+J\x15G4\xd7,\xb0r\x1d.U\xa8\x14\x8e\xd9\
-\xc9\xd8\x18\xe3\xa4\xd5\xf4\xdeUO\x05\xa1\xdeY\xc3\xc1\
-\xfd\x01\xb4\xe32\x89\xab\xd2t\xf9\xb2\xf5\x82\xf2\x0cy\
-\x03\xcc\xe3\xcb\x9ah\xd6D4\x99BK>\xd4\x8b<\
-5\xd2\x85\x02\x08dW\xdd\xda}<\xec\xc41\x97\xb0\
-\x93=\xe8\xec\x96\xfb\x01\xa8r\xd0\xc4\x15\xe7\xc0\x8e\xda\
-\x1b\xb3\xb6+\xa3\xb7\xda\xd5t\xd1\xd64\xe6\xa8\x98\x7f\
-\xc80\xa5\xa7-U\x10\x15\xae;\xfe3*\xa6h\xa9\
-\x92\xc9\x13\xd7\x0aB\x83\x1c\x5c\x13\xcd\x17\x9e\xe0\xf6\x10\
-\xb8\x8d\xae\x88\x9e\x9f\x01\x5c\xf4\x14\xdd\xb1\x96\xe2\x16\x0a\
-\xee\x00\xa0H\xae\x9e\xb8T\xa4\xb8Z\xce\x11\xb8\xa5\xe0\
-|\x89\xae\x82^\xca\x13T\xb2Y*hv\xb0B\x1c\
-#\x11\xa5\x19o\x11f\x01\xb4\x8c\xa3\xb4\xf2\x94\xe5\xf0\
-\xa5\x9b\xd6\x0eK\xd4E\x93\xfemRl\x93\xe3O\xb4\
-\xa2.\xb1\xa86\xd4\xa8\xd8\xbd\xa4\x9b\x9e\x14\xdb\x91\xd5\
-\xf1n\x19\xed\xa3\xb4\xa2qJ\xaaF\x98\x9d|3\xe5\
-l\x9a\xee\xe8\x22\x0b\x9c\xe4\x82N\xeb\x99\xfc\x22\xcc\xb0\
-5\xf6\x06\xa7\xd4\x982K\xe5\xbdA\x83\x5cR\xb1\x05\
-\xb3A\x8f\x0d\x17\xf6'h\x14e\xfb\x9f\x0b\x05\xd0\xdf\
-\xb21A\x87\xb9NIv\xa7\x14\xa2\xcb,M\xc1\x1d\
-\x97p+\x89\xa5\x8d\xdb\xceD\x1f\xab\xce*\x98\xe0\xe9\
-\xc7\x1eW\x8f\xd4e.%\xb1,\x0f\xe6\xacQb\xe1\
-{3\xb88\x11\xe8\xde\xa6N\x9a\x93Y\x80O\xcf\xc7\
-\x87\x8b,U\xba\xe2B\xa6\xe1\xf3gy\xca,\xc3\x17\
-\x856\x891\x85\x96a\xc9\x11\x92\x9d\xed&\xb4p#\
-\x9cH\x84\xee\x8d\xc7\x14Zfm\xd0\x14\xd7)\xb4\x98\
-\xad\xc0\xf9b\xf2\x14ZP\xdf|)h\xd4 /Q\
-F\xaa\x8cxP0\xc3\x96\xd2\xb7s'\xced\xc6\xca\
-\xb1\x89u9j\xeb\xd7+\xb7e\xed\xf3\xa8\xc4W\x8f\
-\x9c \x95q\xe4\xc3R\xee\xaf\x8f\xa0!~:\xb2\xa5\
-)\xd9~Ths;,O\x89\x1e\x951\xdb\xd3\x8f\
-\x92\xdc\x85\x9f*=\x92\x9fh\x9c\x05|\xed}\xee\xbc\
-\x9a\xf4\xe4\xfc\xcf\x08\x96\xaa\x9f\xb6l\xf8|\xa0\x0b\xe0\
-\xcb\x8dT\xcdx\xd8\xe5S\xe5W\xfc\x04g\x8b\xa7#\
-Z\x06\x7f\xeb\x1d\xbb\xa0\x08u\xaab\xfaq\xdb\xf1\x80\
-\xdb\xca\xf2\xfcC\x02|\x92\xf1i\x19\x92DD^\x10\
-\xeb\xd1L\x11\xd1\xcef\x80&p\xf34\x17\x11\x0d\x06\
-\xe1\x0e\xc4i\x9cMD\xbc\x0e)\x88\x83y2\x98_\
-g(\x1c\xd6\x9b\x8b\x88|\xe7z\xc4KB\x9c'?\
-\xee\xd7<%\xc4H9s}e.[\xed\xe4\xb5g\
-\xc7\xd7KZ\x12\x22\x11\x0aj\xc3\x9b\x80\xc6\xcc\x84\xcd\
-\x99\x13}\x8a\xb7\xe3\xef|\x92\x96'Q\x9c\x18\xe7\x94\
-\x1dn/1\xd8\x97\x8dQW \xc1\xed%\x0f\x10\xe1\
-H),\xbf\x02FE\xf0Me\x18hJ\xf11~\
-\xfd\xbb\x80\xfe\x1f\xd0(\xf1I\xd8\x7fc\x86\xf8.\xdc\
-O\x05z\x10;\xef\x85\xfb\xbb\xb2j\xc0\xa6\xce\x9b\xea\
-\x02\xfe\x16v\xd6\xe1\xb6\xb7\x03\x7fe\xe1\xa0\x0f\xea\x02\
-\xfcQ\x1bDn<\xd5\x17\xe0\xdfi\xe4\x80P\xb9\x02\
-\xff.[/\xfcE3\x1c\xf9\xca\xc2\x03-K\x1d\xbe\
-\xb7\xb8C\x7f\x1a?\xcfF\xc2\x82\xfc=.1\xb2K\
-\xc3\x1cQ\x94e\x85\x01\xc0\x0c\xb8\xac\x82\xfe\xf0\x8cI\
-r,A\x22\x22:\xa8\x00\xf93\x81\x02\x90?\xc2Y\
-\xa3\xb8\xec\x81\xfc\x8fa!\xc9\xf4o?\x16\xe0o\xb9\
-\x0e\x9aT\x11\xcc\xf9\xa2\xa8_f\x0f\x19\xda\x0e\xc0\xfd\
-(\x0e^Z0\x95\xcc\xf62K\xd1\x10K\xe3\xd6\x04\
-O\xeab\xb0\xbf6\xab\x0cv\xd8d\x1e((\xf5\xca\
-A\xc1|\x8c\xbe\xb8\xda8\xdc\xdf\xb8\xaav\xb4\xb5\xa6\
-\xaa\xacY\xf4\xc5U\x1d\xe9\xc9j\x11\xee\x87\xef\xe4R\
-\x5c\xaa\xe1\xfeR\x96\x09\x81\xa0E\xdc_\xca6\xad(\
-\xa7\xfb\x09\xce\xec\xe8\x01LCj;\x01\xff\xf2J\xc4\
-\xcf\xf1\x94\xb9*\xc80\x85\xfc\xe9\x0c\xa3\xc4g@\x9b\
-}\x85\xfeL3\x82\x17\x8c\x0b\xfa\xab\xf4\x00\xcal\x8e\
-\xfc\xd5\x06\x0dBv\xe9\xb6\xb1F\xef\xa3#\x14\x08&\
-\xf2\x07\xc9\xf2\xb0\xd4p\x17\xf2\xaf\xf0\xc9\x80\xa2;o\
-\xc8_\xbd\xab\xe7\xb9\x196\xe8\x1f\x10\xc2c9\xdc\xe6\
-\xa63\x0f\xa6\x8c>/\xd0\x1f#\x878\x85\x0f\xff\x82\
-\xfeT\xf3\xc2\xa6W7\xe8_\x92<\x1b\xdb\x0a\xfd\xc1\
-\x94H\x1b\xd6\xb1A\xff\xa0y\x86\xc8\xbcB\x7fD,\
-F\x94\xe7\x15\xfbc\x8e\xc6\x90,5\xb1?G\xb6V\
-\xbf2\x22 J\x02\xd5\xc7\x06\xfe\xab0E\x0b\x1b\xf8\
-\x87Z\x17\x87\x01\x15\x8d\x0b\xfa\xc7S\xf8yp\x05\xc6\
-\xb6\x8a\x91\xb7\xce\xb1\xc2\x7f&\xbb\x83\xaa\x90D\x81\x17\
-\xfcg\xf5\x22N\xd2\x0b\xfe\xb3\x14*\xe8\x186\xfc\xaf\
-hW]\x96\xcba\x92\x06#u\x99\xaad\xc5\xff(\
-\x7f\x82Kl\xdd\x04\x80\xa4\xe4}t\xb6\x87\x9d\x8b\x02\
-@\xa6\x19s\xee\xc1\xe6\x16\x0b\xf6\x19zMJ\xb6=\
-/\x12\x00\x03\xae\xa0\xb4\xa2\xf6Y\xde)L7G\xcd\
-\x15\x1c\x05V\xa3\x05\x91>B`\xce\xedwy\xa7\x5c\
-\xf5M\xbeX%\x80\x80\x8cKR\x03\x98\xd1\xa2J\x02\
-\x90\x07\x07\xcf\xc8U\x02\xb0\xe6\xe9_\x11\xa6\xe6;1\
-\xd1\xa1\x9c\x02\xcc+\x18G ]UNx\xd4\x9c\xc2\
-v\xae\x15\x04\x98\x8eO!\xef\x12\x80\xb73%\x80Z\
-\x0dN\xf4\xac\xcf\xc3l\x16w\x9d\x89\x16\x93f\xc7\x16\
-L\x5c\x02\xfaI\xad\x10\xe8\xc3\xc5\x04\x9a\xfc1m\x16\
-\xd7\x03\xa0}=(\xfe\xde\x5c\x92\xf2\xd3\x14\x97\x00\xf4\
-\x82<\xb2\xdc-\xa6\x04\xd0U\x0eMV'E\xa4I\
-\x00e.\x0a\xbf\x84\xee\x12\x00OF-\xfcX\xed\x16\
-,g\xbc\x00.\x22\xba\xed\xa4\xb0\xd5\xb7V(\x02@\
-T\x80\x82W\xe5l%\xa5Y\x1b\x0e\xf1\xc3\x96\x96\x12\
-\x00\x80\x16\xc3E\xf8e\x9e\x13\xd4\xc2\xa7E\x80\xb2\xac\
-GR\xf4]\xf7W^\xeb\x9a\xa8M\xb8D\x80DP\
-\xcc\xe4X\xb0\xa2,\x12\x80\x9e`C\xb4]\x00\xd0\x03\
-\x90\x99fOS\x88\xfb\xe4\x84\xffYDb\xd0\xe3;\
-\xfa\xcfqb\xfc\x1c\x91^j\x03\xffA\x89\x0d\x11\xc1\
-\x9b\x1d\xfb\x0fr\x955\xb1\xeb\xe2\xef\x09\xfd\xf9\xaf\x91\
-\xd4ah\x1f&\xf2\xcf\xd7H\x08N7\xdco\x0f\xe0\
-\x06\x9d'\xec\x07H\x19\xf6 \xb3\xbf+\xe8\xd7\xa1\xdc\
-J\xdb@\xff\x90vJ\xd6\x15\x81\xfe\xeaYE\x22\xdc\
-,B\xd9Q?y\xb4\x11\x17\xb3\xa1~\x1cdh\x86\
-\xc7\xc9\x82\xfa\x97+fE\xfd\xcaH3h\x5c\xc9y\
-\x02v\xbc\xb3g#\xe7]`?\x22\x5cp3\xaa\xfc\
-\xcaH\xc6\xfaQ\x86\xf2\x15\xf8+\xb7#\xf5\xb6\x06\xfc\
-c\x92\xdb\xeez\xec\x19\xf2\xf7GL\xfd\x06\xe4o\xcf\
-\xdaC\xdcw\x03\xfdo1\xe1\x8a\xfd\x0d\xa7\xa6\x0e\x11\
-\xa7\xec\xd8\xff\x06\xc3\xfe=\xc0\xff\x8f\x8b\xfa\xbf\x07\xcc\
-\xa7\xea\xe6\x0e\xe6g\xc42\xd4{\x94\x8f\xc46\x10\xbb\
-oP>L(\x00\xa17(\x9f\xb5\xdb\x1d\xc8/&\
-\x91\xde\x81|\xc0\xf91\xee1>\xee\x85\x9c\xef!>\
-\xac\xb3X\xe3;\x8c\x0f\x0d\x13>\x9a\x09\xf1\xd3\x96\x96\
-\xe7\x06\xe1\xcf\xd7\xde\x22|\xec:F\x0b\xde |\xd5\
-\xbeA\xf8\xcc7X\xef >|\xc4q(\xdc@\xfc\
-l\xbe|\x16~\xa4\xd2\xe2nw;\xc4/\xa6\xb2\xd9\
-!>\x0e\xf8\xbeB|[\xb9lm\x94\x0d\x9c\xcf6\
-v\x88?\x8bw\x84\x8f\xc0\x96\xda\xee\x10\xfe\xac}\x8b\
-\xf09!\xb7\x08\xdf\xa7\xf5\x0e\xe1\xfb2\xec\x08\x1f>\
-\x9a\xb1m\xaa\xfd\x99\x99$}\x7f|\x1f\xc3\x82\xef\xa3\
-\xa8\xcc\x0f\x19\xf6\xef\xe0=\x93s\xdd\xc1{\xca6w\
-\xf0\x9eq\xe5\x82\xf7W\xdf\x0e\xb9\x12\xdc\xa1\xfb\x06\xd9\
-\xeb\x0e\xddGj\x98n\xd0=\x03\xb4\x1e\xa0\xfbV\xe3\
-\x03tO\xd0w\x87\xee\xe9\x0a~\x87\xee\x1b\xb5V\xc7\
-u\xb9d\xa6\xbelP\x8e\xdd\x81{R\xa9\x0b\xdc\xd7\
-\x09\xeeg\xed;l\xcf\x94\x97;\xb6/\xe6\xe1\xb1c\
-\xfb\xb3\x15\xba\xc7\xdf@{\xdc\x89\xac\xdcn\xa0:m\
-\xea7\xc0\xbeH|\xb9\x83\xf5\xaa\xbb\xc1zd\xff\xcd\
-\x0f@}\xd5\xbd\xbc\x83wt\xa7\xb5{P\x9f\xe8\xcd\
-\xf2\x00\xd3#\xfb_\x8a\xf7\x90>h]\x84\xe8\x83#\
-z\xb8\xa4\xadNH\x17\xa2\xa7\xe5q\x22\xfa@\x84\x8e\
-8\x15a\xe8\x1d\xd1s?\xcfX?\x93\x17\x00\xc5\x86\
-\xd7\xdf\x10=\x1d\xa3\xfb\x03DO\x9f\xed\xfa\x08\xd1\x97\
-r\x8f\xe81\xc1=n\x88\xbe\x0a\xf9!\xbc\xfaH\x8f\
-\x10}\xd1\x0fn\x11}\x94W\xfc\x1d\xa2O\x17\xa2\xaf\
-\xb7\x9d\x89q\xce\xcdz\xd4\xdd!z\xcee~\x80\xe8\
-\xe7\xac\xdd!z\x85/\x0a\xd1\xf3\x05YQ\xb4\x99\x88\
-x\x22\xfa@D\x0f7\x86\x9c\xef\x11\xfd\xd5\xd1\x1d\xd1\
-\xe3\x1al\xf7\x80\x1e~0\xe3\x0e\xcf\x07]\x0c\x0b\x9e\
-/{+\xf7\x80>\xa4G\x80\x1e\x97\x09N\xce\xef\x83\
-\xe7\xb9\x1a\x0b\x9e\xbfY\xd5;<\xcf\x14\xbd\x91\xa7\xce\
--\xa0\xcf\x01Q\xca\xe5\x01\xa2\x87\x99\xe4\xa9\x1f\x0f \
-\xbd2\xfe\x96\x07\x98\x1e\x99~\x9ezx\x00\xea\x0b\xc6\
-\xda\xcb\x03T\xcf\x1eD\xe8\x19\xee`}>\xd0\xefP\
-6\x95\xbe\xcb\x1bP\xf6\x1f\x0f\x90}F\x8e\xf4Q\x1e\
-@\xfb9\xa2{l\xaf\xad\xff\x9d\xd8\x9e\x97\xf3z\xf3\
-}oh\xafX\xe4;h\xcf\xfb\xe5\x1e\xda7\x9df\
-\x1b\xb4\x9f)\xcfvd\x7f\xd5\xde\x80\xfdU\xfb\x16\xd7\
-\xd3Y\xe8\x01\xae\xb7\xb3\xef\x01\xac?O\xef[u\xbe\
-\xe1<\x22\x86\xe3!\xa6w\xd0\xf0\x00\xd2G\xc8\xe3\xad\
-?\x84\xf4\x86W\x7fLD\xff\xc7o\xdf\xfe\xf5\xc3\x0f\
-\x01\xe7\xcf\x0f\xc2\xe1|\xbe\x22\x0b \xf3^\xc1\x03@\
-\xbf\xccU\x04\xdbL\xff\xe9kjT\xe1\xad\x0dd\x82\
-\xdcB\xd8\xed\x019\x8d\x12\x03\x07\x98\x5c\xe5\xfc\x19\x22\
-\xe2\xb2\xfd\xbf\xfc\xf4u\xe1\x19z\xfe\x1b*\xb5\xb39\
-\xdc \xf0\xf5\xa6\xcah\xe85LU\x84\xe0 k\x0e\
-\x1e\xe0\x5c\xa9\xa4\xd7\x0fk\x0f\xc1\x02|^\xf9:\xa4\
-)\xe2?\xbb\xfe9\xecW\x87~\x85\xf8\x81\xf3m\x7f\
-\xfb\x04\x99\x07|$\xcf7R\xd7r\xde|\xcds\xf7\
-(\xc7@P\x8e\x01\x84a\x11\xea!>G\xd1x\x88\
-QsMnW5\xc4\xf9\xc0K\xb8\xce\xe4=\xdd\x1d\
-\x01\x9bR\x9e\x91\x0f\x1c!\xf2H\xedA\xcf\xbb\xe3\xf0\
-\xdc=Q)~\x22Ub$z\x10?8c\x9a\x0f\
-\xd8\xcc\xa9?6\xb8\xc7@dL\x15A\xe7\xe1\x8e\x1c\
-\xac\x8e\xac@\xa1\xd2u\xe4\xbc\xae\xb2e\xefQ\xfb\x07\
-\xa3iqAx\xfa\x1ek\xa8+q{\xa0\x02\xd8\x22\
-[\xe5]\x10\x94\xfa \x9aK\x07\x9384fkT\
-C\xc3\xbd\xc4\x19\xd6\x05\x97\xea&O\xe9aG\x12c\
-\xf0\x91\xe7/8\xb5@\xbc\xde;\x94\xe1d\x98\x9b\xb8\
-\x17\xd3\x83\x0a\x9e\xf2\xee&>8i\x8d\x01[Z'\
-\xc6\x182\xdf\x00\xdd\x03\xa1{>,\xc6p\xce\x0eS\
-=\x1e\xcd\xf0\x9f\x157\x9cJp\xc2\x0a\x02\x80\xb36\
-\x13U\xc9\xcbu\x8cYNd\xa8\xccJQ(\x90j\
-i\x84\x1e\x06\xa6\xfd\x80\xc7\x0dC\x0cQ\x1f\xa1\x8b\x91\
-\xf9\xf4\x03\x1d\x12\xfe\x8e\xf9{~\xf3\xdf\x7f}#2\
-\xf1\x1f\xe2\xf087\xa2\x1d\x1e8\x1f\xaf\x88\xf1\xe3\x13\
-\xba\x00\x915$\xe1\xc4L\x8f>\xdc\x13\xc8z@\x1b\
-\x17\xf3&%!\x0f*\x03\xe8\xa8L\x97\x15\xf8\xe3\x1e\
-R\x05PfI,\xae\x16\x85\x9c\xddM]\x8d@g\
-\xca\xdaC/5\xbf\x17j)\x83\xa9\x02\x90~\x03\xca\
-5\xbe\x149\xc4h\x1a\x0b[\xf3\x91Q!\x96\xf3g\
-)\x87\xf1\xa4\x9a\xa3_M0\xcc\xab\x97\xf4\xe0uM\
-\x00 \xc60\x87\x1b\xc0a\xcf\xf8\xc3`\xd3\xc3\xde\x9b\
-\xa5\xd0\x872 \x17\xf4\xa8\xeb\x17\xf0\xf0\xa6\xd9\xb0\xe9\
-\x17O*\x8e\xccT\x90\xa4\x0fX\x06\xec\xf3@u@\
-R\x10\x1cRb$\xf3;<4\x0f\xd6\x0a#\x0b]\
-\x1fp\x15\xd7$\xb5=\x15\x02\xd7\xacA\xdd\xd2-\xee\
-\x1ct\xaeV\x1b\xbe \x87\xe5\xfba\x98t\xd8\x1b)\
-{#\xd5\x1a\xc1\xaa2\x96w\xb6\x0d\x99\x8f\x1a\x81\xa5\
-\xdf^\xbb\xef\x8d4+\x1e\xca\xd5x;)\xd4\x09 \
-\x19\xcf\x9c^\x84%B\x16\x0fJi\xc1\xcc\xd6\xcb\xec\
-6\xe7#a>\xa1e\xa1Z\xfa\xc4\x0f\xcc\x81\xd3\x96\
-\x1b\xa7z\x92\x12\x01\xa5\xed\x1a\x93\xbb\x07\xe2\xd3^>\
->\xbbZ\xf8\xf1Y\xe7\xcd5\xb4\xdd\x0c\xd5\x92\x00\x10\
-!/\xb5\x9b\xe4\xaav\xec\xc5\x88\xf1M\xa6G\xb8\x8a\
-\xb1\x95\xfcnY\xda\xce\xd6\x13\x82\xe2\xadm\xba\x0e\xf5\
-\xbc\x15CmP=r]\xe1\xf0>#\x04\xdduo\
-d\xe8\xab\xe8m\xdd\xbd\x18\x10\xf5\x0e}\xaf\x9c\x94\xde\
-\xa3\x8f\xadrPz\x1a\xe2\xe5\xeb\x9b\xa0\xef\xd70e\
-\xc26t~At\xd8Fm\xbaa,\xd5\xd3\xd6m\
-\x0c\x92\x19\x89\xf36%\xfe\xd5\x8e\xb2O`SN\x84\
-Q\xb7F\x9e\xb2\x11L\xd9 \xfb\xb5\x08\xee'x\x95\
-\xda\x18\xc7\xbe\x90\xc9\xe6i\xec\x0b\xc9\xb1WS)\x5c\
-\xc5H\x1f\xc8h\x84\xfd\x18b\x22\x96A\x97\x9d\x87\xa7\
-\xc1\x91\xb7\xea\xe7\xf9\x92\xa3E\xb0\xb3q\xc8\xa4<\x0f\
-\x9a\xa2\xcc\xe5=x\xfe{\xff\xe8\x8f\xa6\x18\xf3\xa7\x5c\
-\xfd\xb8\x84G\x7f0\x1d\x04\x04x\xefe\xa5\x04aC\
-\xb5\xd2s\xa0\xae\x80\x80\xe3\xa5vNS\x0f\xa5\x7f\x98\
-u\x99[,\xb8\xfaa\xd6\xc6\xf0\xafhw\xee\xd7y\
-\xcc\xe7\xa9~(H\xe3u\xf8\xecZ\xdc\xd4\xbe\x9e\xc5\
-\x9b\xe7z\xa6\xf5\x13W\xe4zSyJ\xc3_\x9c\xfb\
-4(.\x1f]v\xd7\xc7}U\x91\x04\xb2O\x05D\
-n^\x8ex\xaa\x9ag \xd4\xf5\xc0;\x14\xb7\xf1\xfa\
-\xd7(\x0dD\xb6T<\xd7\x5cJ\x01\xb1\x94\xc3\xd6X\
-f\x8e\xa1<'\x08\x8e|W\xa4\xfbl\x9f[z\xb8\
-\x02\x02f\xf2\xb9K\xaf0w\xac\xc5\xdeG;u\x8b\
-7m!V\xc7Z\xec\x87\x88\xb4\x0f\xd7\x19\xed\xb7\x85\
-\xf4\x0f9\xce)N\xcd\xda\x11\xff\xd3\xfcA\x9e>\x88\
-y\xff\xb6\x83\x97\x97}/\x00\x96\x1f\xb4X\xd6\xed\x07\
-\xf0\xd9\xd7\x0f\xda\xfc\xec\x9b\xdf\xe2\xfa|R\xb7\xcf\x01\
-\xce\xcf\x1c\x05\x94#\x90z?\xa5\xe4\xc8\xf1\xf6\xdb\x91\
-\x96c\x19\x98\x7f;}\x1e\xe1\xc8\x0a\x05\xe9\x1eL\xee\
-Q\x87\xe4\xb1?\xcal7v\xd7r\xf8&\xa5N\x00\
-z\x84\xeeZ\x0e\x1f\x07u\x19\xe3\x04\x1a\xc3\xb4\x1c\xb5\
-/\x9e\x81H0\xd2\xa7\xe9\x92\xd4\x0e\xd4\x80?\x15d\
-\xde\x90\xce\xa4-c\xe7{\xe2\xa6\xca\x80\xfa\x02\xa9\x08\
-\xd0;zvJ\xfb\x1b\xecM\xc8\xb7\xe3Z\x93cj\
-,\xee\x0e~i,Rv4g\xf8\x8c\x1a\x8b\x07g\
-\xbc4\x16\xd7\xdd\x99=\xc7F\xda/Of\xc9\x88\xae\
-\xb3\xb8\xbf\xca\xa4\xb4X\xf6\xbf\xdd\xaa\x87\xa3\xd1\xa7\x05\
-\x9f5W[,\xf5\xa3\x9d\xaf\xf9\xe6\xbd]\xfb\x8a\x8a\
-\x8b\xb5\x9d\xa4\x0d\x9aB\x1c\x9f\x82\x98\xe7\xb3\xe3S\xe7\
-\xe9HLd$<l\xfb\x0c\xe6\xfe\xf8\xff\x97b\xea\
-o/_\xbe\xfa\xd5o\xbfx\xfd\xc5\xb7\xef\xff\xeb\x19\
-\xfc\x9do\xbey\xf3\xc7\x0f\xf37\xff\xfc\xe6\xf9\xf9\xab\
-\xaf\xdf\xbc\xfe\x83\x1e?\xbf|\xf5\xc5\xcf\xbf\xfc\xe5\xeb\
-\x9f\x7f\xfc\xf0\xe7\xf7\xdf\xfe\xe2\xfd\xbb?\xbd\xfd\xfa\xb3\
-\xcf^\xb8\xdc\xf1\xe2\xf3\xcf?\x9c\x02\xc6\xfb?\xfd\xc3\
-]-\xfb\xc7?\xbd{\xfb\xe1\xb3\xcf\xbe\xeb\xe9O\xd4\
-\x9f\xff\xfc\xf8\xe6\xe3\x9b\xcfY\xf1\x17_}\xf3\xcd\x1f\
-\xbe\xfa\xe3_^\xff\x0b\xca\xd6\xe7\xaf\x7f\xfd\xf1\xf9\xcf\
-?\xf9\xdd\x8b_\xbf\x7f\xfe\xf0\xe2\xd5\x97\xbf\xf9\xf9\xbf\
-\xfe\xe6\xb7\xbf~\xfd\xfc\xf6\xebw_}\xf3\xea\xc5\x17\
-o\xbe~\xfb\xee\xc5\xef_\xfd\xee\x85^2k\xa8\xe8\
-\xfd_\xde\xbe\xd9\x8a\xbe\x84\x97\xe2\xf3Vd\xc3_\xca\
-n\xc9K\xd9\x8f\x9f}\xfb\xe6\xc3\xc7o\xdf\xfd\xc3\xa3\
-\xeez\xaf\xce\xd9<\xbb\xee\xff\x22U\xf6\xf3\xd9\xcc\xf3\
-O^\xbe\xd40\xfe\xe7o\xe7b\xf0\x9d\xef>./\
-\xf4_\xbc\x7f\x87e>\x9bX{\xe0\xcb\xf4\xf6\x99\xdc\
-\xaa\x9f\xffc`\x13\x90\xf2\x9e\xdf|\xd8\x86\xf2\xab\xaf\
-\x9e\xff|3\xb6w\x1f\xff\xed\xfd\xfb\xff\xd8\x0a\x1f\xcf\
-\xe4/\xdf\xfd\xfb\x8b\xdf\x9f_\x92\x8b\x91/^\xbe|\
-\xf9\xb3\xff\x05\xa9\xd8\xe8\xde\
-\x00\x00\x108\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22UTF\
--8\x22 standalone=\x22\
-no\x22?>\x0a<svg\x0a   xm\
-lns:dc=\x22http://p\
-url.org/dc/eleme\
-nts/1.1/\x22\x0a   xml\
-ns:cc=\x22http://cr\
-eativecommons.or\
-g/ns#\x22\x0a   xmlns:\
-rdf=\x22http://www.\
-w3.org/1999/02/2\
-2-rdf-syntax-ns#\
-\x22\x0a   xmlns:svg=\x22\
-http://www.w3.or\
-g/2000/svg\x22\x0a   x\
-mlns=\x22http://www\
-.w3.org/2000/svg\
-\x22\x0a   xmlns:xlink\
-=\x22http://www.w3.\
-org/1999/xlink\x22\x0a\
-   xmlns:sodipod\
-i=\x22http://sodipo\
-di.sourceforge.n\
-et/DTD/sodipodi-\
-0.dtd\x22\x0a   xmlns:\
-inkscape=\x22http:/\
-/www.inkscape.or\
-g/namespaces/ink\
-scape\x22\x0a   width=\
-\x2217.600834\x22\x0a   h\
-eight=\x2217.050808\
-\x22\x0a   viewBox=\x220 \
--883.9 972.55177\
- 941.89919\x22\x0a   v\
-ersion=\x221.1\x22\x0a   \
-id=\x22svg4596\x22\x0a   \
-sodipodi:docname\
-=\x22equation.svg\x22\x0a\
-   inkscape:vers\
-ion=\x220.92.3 (240\
-5546, 2018-03-11\
-)\x22>\x0a  <metadata\x0a\
-     id=\x22metadat\
-a4600\x22>\x0a    <rdf\
-:RDF>\x0a      <cc:\
-Work\x0a         rd\
-f:about=\x22\x22>\x0a    \
-    <dc:format>i\
-mage/svg+xml</dc\
-:format>\x0a       \
- <dc:type\x0a      \
-     rdf:resourc\
-e=\x22http://purl.o\
-rg/dc/dcmitype/S\
-tillImage\x22 />\x0a  \
-      <dc:title>\
-</dc:title>\x0a    \
-  </cc:Work>\x0a   \
- </rdf:RDF>\x0a  </\
-metadata>\x0a  <sod\
-ipodi:namedview\x0a\
-     pagecolor=\x22\
-#ffffff\x22\x0a     bo\
-rdercolor=\x22#6666\
-66\x22\x0a     bordero\
-pacity=\x221\x22\x0a     \
-objecttolerance=\
-\x2210\x22\x0a     gridto\
-lerance=\x2210\x22\x0a   \
-  guidetolerance\
-=\x2210\x22\x0a     inksc\
-ape:pageopacity=\
-\x220\x22\x0a     inkscap\
-e:pageshadow=\x222\x22\
-\x0a     inkscape:w\
-indow-width=\x22384\
-0\x22\x0a     inkscape\
-:window-height=\x22\
-2004\x22\x0a     id=\x22n\
-amedview4598\x22\x0a  \
-   showgrid=\x22fal\
-se\x22\x0a     fit-mar\
-gin-top=\x220\x22\x0a    \
- fit-margin-left\
-=\x220\x22\x0a     fit-ma\
-rgin-right=\x220\x22\x0a \
-    fit-margin-b\
-ottom=\x220\x22\x0a     i\
-nkscape:zoom=\x2241\
-.204245\x22\x0a     in\
-kscape:cx=\x226.537\
-9055\x22\x0a     inksc\
-ape:cy=\x226.366771\
-9\x22\x0a     inkscape\
-:window-x=\x22-11\x22\x0a\
-     inkscape:wi\
-ndow-y=\x22-11\x22\x0a   \
-  inkscape:windo\
-w-maximized=\x221\x22\x0a\
-     inkscape:cu\
-rrent-layer=\x22svg\
-4596\x22 />\x0a  <defs\
-\x0a     id=\x22defs45\
-80\x22>\x0a    <path\x0a \
-      id=\x22MJX-9-\
-TEX-I-78\x22\x0a      \
- d=\x22m 52,289 q 7\
-,42 54,97 47,55 \
-116,56 35,0 64,-\
-18 29,-18 43,-45\
- 42,63 101,63 37\
-,0 64,-22 27,-22\
- 28,-59 0,-29 -1\
-4,-47 -14,-18 -2\
-7,-22 -13,-4 -23\
-,-4 -19,0 -31,11\
- -12,11 -12,29 0\
-,46 50,63 -11,13\
- -40,13 -13,0 -1\
-9,-2 -38,-16 -56\
-,-66 -60,-221 -6\
-0,-258 0,-28 16,\
--40 16,-12 35,-1\
-2 37,0 73,33 36,\
-33 49,81 3,10 6,\
-11 3,1 16,2 h 4 \
-q 15,0 15,-8 0,-\
-1 -2,-11 Q 486,7\
-7 440,33 394,-11\
- 333,-11 263,-11\
- 227,52 186,-10 \
-133,-10 h -6 q -\
-49,0 -70,26 -21,\
-26 -22,55 0,32 1\
-9,52 19,20 45,20\
- 43,0 43,-42 Q 1\
-42,81 130,66 118\
-,51 107,46 96,41\
- 94,41 l -3,-1 q\
- 0,-1 6,-4 6,-3 \
-16,-7 10,-4 19,-\
-3 36,0 62,45 9,1\
-6 23,68 14,52 28\
-,108 14,56 16,66\
- 5,27 5,39 0,28 \
--15,40 -15,12 -3\
-4,12 -40,0 -75,-\
-32 -35,-32 -49,-\
-82 -2,-9 -5,-10 \
--3,-1 -16,-2 H 5\
-8 q -6,6 -6,11 z\
-\x22\x0a       inkscap\
-e:connector-curv\
-ature=\x220\x22 />\x0a   \
- <path\x0a       id\
-=\x22MJX-9-TEX-N-32\
-\x22\x0a       d=\x22m 10\
-9,429 q -27,0 -4\
-3,18 -16,18 -16,\
-44 0,71 53,123 5\
-3,52 132,52 91,0\
- 152,-56 61,-56 \
-62,-145 0,-43 -2\
-0,-82 -20,-39 -4\
-8,-68 -28,-29 -8\
-0,-74 -36,-31 -1\
-00,-92 l -59,-56\
- 76,-1 q 157,0 1\
-67,5 7,2 24,89 v\
- 3 h 40 v -3 Q 4\
-48,183 436,95 42\
-4,7 421,3 V 0 H \
-50 v 19 12 q 0,7\
- 6,15 6,8 30,35 \
-29,32 50,56 9,10\
- 34,37 25,27 34,\
-37 9,10 29,33 20\
-,23 28,34 8,11 2\
-3,30 15,19 21,32\
- 6,13 15,29 9,16\
- 13,32 4,16 7,30\
- 3,14 3,33 0,63 \
--34,109 -34,46 -\
-97,46 -33,0 -58,\
--17 -25,-17 -35,\
--33 -10,-16 -10,\
--19 0,-1 5,-1 18\
-,0 37,-14 19,-14\
- 19,-46 0,-25 -1\
-6,-42 -16,-17 -4\
-5,-18 z\x22\x0a       \
-inkscape:connect\
-or-curvature=\x220\x22\
- />\x0a  </defs>\x0a  \
-<rect\x0a     style\
-=\x22opacity:1;fill\
-:#0d5df4;fill-op\
-acity:1;stroke:n\
-one;stroke-width\
-:79.02939606;str\
-oke-miterlimit:4\
-;stroke-dasharra\
-y:none;stroke-da\
-shoffset:0;strok\
-e-opacity:1\x22\x0a   \
-  id=\x22rect5160\x22\x0a\
-     width=\x22972.\
-55176\x22\x0a     heig\
-ht=\x22942.15948\x22\x0a \
-    x=\x220\x22\x0a     y\
-=\x22-884.04791\x22\x0a  \
-   ry=\x22314.37042\
-\x22 />\x0a  <g\x0a     s\
-tyle=\x22fill:#ffff\
-ff;fill-opacity:\
-1;stroke:#000000\
-;stroke-width:0\x22\
-\x0a     id=\x22g4584\x22\
-\x0a     data-mml-n\
-ode=\x22mi\x22\x0a     tr\
-ansform=\x22matrix(\
-1,0,0,-1,55.1394\
-79,-84.864911)\x22>\
-\x0a    <use\x0a      \
- height=\x22100%\x22\x0a \
-      width=\x22100\
-%\x22\x0a       y=\x220\x22\x0a\
-       x=\x220\x22\x0a   \
-    id=\x22use4582\x22\
-\x0a       xlink:hr\
-ef=\x22#MJX-9-TEX-I\
--78\x22\x0a       styl\
-e=\x22fill:#ffffff;\
-fill-opacity:1\x22 \
-/>\x0a  </g>\x0a  <g\x0a \
-    style=\x22fill:\
-#ffffff;fill-opa\
-city:1;stroke:#0\
-00000;stroke-wid\
-th:0\x22\x0a     id=\x22g\
-4588\x22\x0a     trans\
-form=\x22matrix(0.5\
-9944897,0,0,-0.5\
-9944897,603.9626\
-9,-388.6699)\x22\x0a  \
-   data-mml-node\
-=\x22mn\x22>\x0a    <use\x0a\
-       height=\x221\
-00%\x22\x0a       widt\
-h=\x22100%\x22\x0a       \
-y=\x220\x22\x0a       x=\x22\
-0\x22\x0a       id=\x22us\
-e4586\x22\x0a       xl\
-ink:href=\x22#MJX-9\
--TEX-N-32\x22\x0a     \
-  style=\x22fill:#f\
-fffff;fill-opaci\
-ty:1\x22 />\x0a  </g>\x0a\
-</svg>\x0a\
-\x00\x00\x02\xa8\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22utf\
--8\x22?>\x0a<svg xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22 xm\
-lns:xlink=\x22http:\
-//www.w3.org/199\
-9/xlink\x22 style=\x22\
-margin: auto; ba\
-ckground: none; \
-display: block; \
-shape-rendering:\
- auto;\x22 width=\x221\
-00px\x22 height=\x2210\
-0px\x22 viewBox=\x220 \
-0 100 100\x22 prese\
-rveAspectRatio=\x22\
-xMidYMid\x22>\x0a<circ\
-le cx=\x2250\x22 cy=\x225\
-0\x22 r=\x2237\x22 stroke\
--width=\x2212\x22 stro\
-ke=\x22#0d5df4\x22 str\
-oke-dasharray=\x225\
-8.11946409141117\
-4 58.11946409141\
-1174\x22 fill=\x22none\
-\x22 stroke-linecap\
-=\x22round\x22>\x0a  <ani\
-mateTransform at\
-tributeName=\x22tra\
-nsform\x22 type=\x22ro\
-tate\x22 repeatCoun\
-t=\x22indefinite\x22 d\
-ur=\x220.9615384615\
-384615s\x22 keyTime\
-s=\x220;1\x22 values=\x22\
-0 50 50;360 50 5\
-0\x22></animateTran\
-sform>\x0a</circle>\
-\x0a<!-- [ldio] gen\
-erated by https:\
-//loading.io/ --\
-></svg>\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x0a\
-\x0d\x02\xc4S\
-\x00M\
-\x00a\x00t\x00h\x00J\x00a\x00x\x00.\x00j\x00s\
-\x00\x08\
-\x0aaW'\
-\x00i\
-\x00c\x00o\x00n\x00.\x00s\x00v\x00g\
-\x00\x18\
-\x0a\x0b\x8a\x87\
-\x00p\
-\x00r\x00o\x00c\x00e\x00s\x00s\x00i\x00n\x00g\x00-\x00i\x00c\x00o\x00n\x00-\x00a\
-\x00n\x00i\x00m\x00.\x00s\x00v\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x85\xfaH\xc5\xc5\
-\x00\x00\x00@\x00\x00\x00\x00\x00\x01\x00\x02:\xc9\
-\x00\x00\x01\x85\xfaH\xc5\xc5\
-\x00\x00\x00*\x00\x00\x00\x00\x00\x01\x00\x02*\x8d\
-\x00\x00\x01\x85\xfaH\xc5\xc5\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,42 @@
+import unittest
+import subprocess
+import sys
+import time
+
+HEAVY = ['torch', 'transformers', 'timm', 'pandas', 'numpy', 'cv2', 'albumentations', 'PIL', 'PyQt6', 'requests']
+
+
+def run(*args, importtime=False):
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + list(args)
+    start = time.perf_counter()
+    p = subprocess.run(command, capture_output=True, text=True)
+    return time.perf_counter()-start, p
+
+
+def imported_modules(stderr):
+    return {line.split('|')[-1].strip() for line in stderr.splitlines() if line.startswith('import time:')}
+
+
+class TestStartup(unittest.TestCase):
+    def test_no_heavy_imports(self):
+        for args in [['--version'], ['-h'], ['batch', '-h'], ['watch', '-h'], ['serve', '-h']]:
+            _, p = run('-m', 'pix2tex', *args, importtime=True)
+            self.assertEqual(p.returncode, 0, p.stderr)
+            modules = imported_modules(p.stderr)
+            for heavy in HEAVY:
+                self.assertFalse({m for m in modules if m == heavy or m.startswith(heavy+'.')}, '"pix2tex %s" imports %s' % (' '.join(args), heavy))
+
+    def test_client_is_stdlib_only(self):
+        _, p = run('-c', 'import pix2tex.client', importtime=True)
+        modules = {m.split('.')[0] for m in imported_modules(p.stderr)}
+        self.assertFalse(modules & set(HEAVY))
+
+    def test_version_time(self):
+        # startup on top of the bare interpreter, best of a few runs to reduce noise
+        baseline = min(run('-c', 'pass')[0] for _ in range(3))
+        elapsed = min(run('-m', 'pix2tex', '--version')[0] for _ in range(3))
+        self.assertLess(elapsed-baseline, .1)
+
+
+if __name__ == '__main__':
+    unittest.main()
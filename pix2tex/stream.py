@@ -0,0 +1,126 @@
+'''Pipelined prediction of a stream of images from stdin.
+
+Input is either one image path per line (`paths`) or a sequence of image files, each
+prefixed with its length as 4 byte big endian unsigned integer (`blobs`). For every
+image one JSON line `{"index", "file", "latex"}` (or `"error"`) is written to stdout.
+Reading, preprocessing and decoding run in separate threads connected by bounded
+queues, so decoding does not have to wait for I/O. If the input cannot be read (e.g. a
+truncated blob), the images before are still predicted and the process exits with 1.
+'''
+from queue import Queue, Empty
+import io
+import struct
+import sys
+import threading
+import time
+
+from pix2tex.batch import BatchPredictor, write_jsonl
+
+END = object()
+
+
+class ReadError:
+    '''Passed through the queues when the input stream could not be read'''
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def read_paths(stream):
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield line.decode('utf-8'), None
+
+
+def read_blobs(stream):
+    while True:
+        header = stream.read(4)
+        if len(header) < 4:
+            return
+        size, = struct.unpack('>I', header)
+        data = stream.read(size)
+        if len(data) < size:
+            raise EOFError('Stream ended in the middle of an image')
+        yield None, data
+
+
+def reader(items, out: Queue):
+    try:
+        for index, (path, data) in enumerate(items):
+            out.put((index, path, data))
+    except Exception as e:
+        out.put(ReadError(e))
+    finally:
+        out.put(END)
+
+
+def preprocessor(model, resize: bool, inp: Queue, out: Queue):
+    from pix2tex.batch import load_image
+    while True:
+        item = inp.get()
+        if item is END:
+            out.put(END)
+            return
+        if isinstance(item, ReadError):
+            out.put(item)
+            continue
+        index, path, data = item
+        result = {'index': index, 'file': path}
+        start = time.time()
+        try:
+            _, img, error, _ = load_image(path if data is None else io.BytesIO(data), model.args.max_dimensions, model.args.min_dimensions, resize)
+            if error is not None:
+                raise ValueError(error)
+            image = model.finish_preprocess(img, resize=resize)
+        except Exception as e:
+            out.put((result, None, {'preprocess': round(time.time()-start, 4)}, str(e)))
+            continue
+        out.put((result, image, {'preprocess': round(time.time()-start, 4)}, None))
+
+
+def main(arguments):
+    from pix2tex.cli import LatexOCR
+    model = LatexOCR(arguments)
+    stdin = sys.stdin.buffer
+    items = read_blobs(stdin) if arguments.stdin == 'blobs' else read_paths(stdin)
+    raw, ready = Queue(maxsize=4*arguments.batchsize), Queue(maxsize=2*arguments.batchsize)
+    threading.Thread(target=reader, args=(items, raw), daemon=True).start()
+    threading.Thread(target=preprocessor, args=(model, model.resizes(not arguments.no_resize), raw, ready), daemon=True).start()
+
+    write = write_jsonl(sys.stdout)
+    results = {}
+
+    def emit(result: dict):
+        # the batch predictor only knows the index of the image
+        info = results.pop(result.pop('file'))
+        info.update(result)
+        write(info)
+
+    predictor = BatchPredictor(model, arguments.batchsize, emit)
+    done, failure = False, None
+    while not done:
+        # block for the next image, then take everything else that is ready right now
+        batch = [ready.get()]
+        while len(batch) < arguments.batchsize:
+            try:
+                batch.append(ready.get_nowait())
+            except Empty:
+                break
+        for item in batch:
+            if item is END:
+                done = True
+                continue
+            if isinstance(item, ReadError):
+                failure = item.error
+                continue
+            result, image, timing, error = item
+            if error is not None:
+                write({**result, 'error': error, 'timing': timing})
+                continue
+            results[result['index']] = result
+            predictor.add(result['index'], image, timing)
+        predictor.flush()
+    if failure is not None:
+        print('Could not read the input: %s' % failure, file=sys.stderr)
+        sys.exit(1)
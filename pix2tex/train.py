@@ -1,4 +1,5 @@
 from pix2tex.dataset.dataset import Im2LatexDataset
+from pix2tex.dataset.loader import PrefetchLoader
 import os
 import argparse
 import logging
@@ -16,8 +17,10 @@ from pix2tex.utils import in_model_path, parse_args, seed_everything, get_optimi
 
 
 def train(args):
-    dataloader = Im2LatexDataset().load(args.data)
-    dataloader.update(**args, test=False)
+    dataset = Im2LatexDataset().load(args.data)
+    dataset.update(**args, test=False)
+    # batches are prepared in worker processes while the model trains
+    dataloader = PrefetchLoader(dataset, workers=args.get('workers', 4), prefetch=args.get('prefetch', 2), seed=args.get('seed', 42))
     valdataloader = Im2LatexDataset().load(args.valdata)
     valargs = args.copy()
     valargs.update(batchsize=args.testbatchsize, keep_smaller_batches=True, test=True)
@@ -47,7 +50,12 @@ def train(args):
     try:
         for e in range(args.epoch, args.epochs):
             args.epoch = e
-            dset = tqdm(iter(dataloader))
+            dset = tqdm(iter(dataloader), total=len(dataloader))
+            efficiency = dataset.padding_efficiency()
+            tqdm.write('Epoch %i: %.1f%% of the decoder positions are tokens (not padding), %i samples in incomplete batches skipped' % (
+                e+1, 100*efficiency, dataset.dropped))
+            if args.wandb:
+                wandb.log({'train/padding_efficiency': efficiency, 'train/dropped_samples': dataset.dropped})
             for i, (seq, im) in enumerate(dset):
                 if seq is not None and im is not None:
                     opt.zero_grad()
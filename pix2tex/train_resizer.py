@@ -7,7 +7,6 @@ from timm.models.resnetv2 import ResNetV2
 from timm.models.layers import StdConv2dSame
 import numpy as np
 from PIL import Image
-import cv2
 import imagesize
 import yaml
 from tqdm.auto import tqdm
@@ -28,7 +27,7 @@ def prepare_data(dataloader: Im2LatexDataset) -> Tuple[torch.tensor, torch.tenso
     Returns:
         Tuple[torch.tensor, torch.tensor]: One batch of resized images and labels
     """
-    _, ims = dataloader.pairs[dataloader.i-1].T
+    ims = dataloader.index.paths(dataloader.pairs[dataloader.i-1])
     images = []
     scale = None
     c = 0
@@ -57,9 +56,8 @@ def prepare_data(dataloader: Im2LatexDataset) -> Tuple[torch.tensor, torch.tenso
         if im is None:
             print(path, 'not found!')
             continue
-        im = np.array(im)
-        im = cv2.cvtColor(im, cv2.COLOR_BGR2RGB)
-        images.append(dataloader.transform(image=im)['image'][:1])
+        im = np.array(im.convert('L'))
+        images.append(dataloader.transform(image=im)['image'])
         if images[-1].shape[-1] > x:
             x = images[-1].shape[-1]
         if images[-1].shape[-2] > y:
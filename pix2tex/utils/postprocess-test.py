@@ -0,0 +1,56 @@
+import unittest
+import os
+import random
+import re
+import pix2tex
+from pix2tex.utils import post_process
+
+
+def reference(s):
+    # post_process before it was rewritten to handle every whitespace run once
+    text_reg = r'(\\(operatorname|mathrm|text|mathbf)\s?\*? {.*?})'
+    letter = '[a-zA-Z]'
+    noletter = r'[\W_^\d]'
+    names = [x[0].replace(' ', '') for x in re.findall(text_reg, s)]
+    s = re.sub(text_reg, lambda match: str(names.pop(0)), s)
+    news = s
+    while True:
+        s = news
+        news = re.sub(r'(?!\\ )(%s)\s+?(%s)' % (noletter, noletter), r'\1\2', s)
+        news = re.sub(r'(?!\\ )(%s)\s+?(%s)' % (noletter, letter), r'\1\2', news)
+        news = re.sub(r'(%s)\s+?(%s)' % (letter, noletter), r'\1\2', news)
+        if news == s:
+            break
+    return s
+
+
+class TestPostProcess(unittest.TestCase):
+    def assertSame(self, s):
+        self.assertEqual(post_process(s), reference(s), repr(s))
+
+    def test_cases(self):
+        for s in [r'\frac { a } { b }', r'a b', r'a \, b', r'\alpha \beta', r'x _ { 1 } ^ { 2 }', r'\mathrm { d x }',
+                  r'\operatorname* { a r g \, m a x }', r'\text {a b} + c', r'\\ \\', r'a\ b', '\\\t x', '\\\t \t x',
+                  r'\begin{array} { c c } 1 & 2 \\ 3 & 4 \end{array}', ' a  =  é  ', 'é  é', '', ' ', '1 2  3']:
+            self.assertSame(s)
+
+    def test_random(self):
+        rng = random.Random(0)
+        alphabet = list('ab=+\\_^1{}&é²٣ \t\n\xa0') + [' ', ' ', r'\text {', r'\mathrm {', r'\operatorname* {', ' }']
+        for _ in range(20000):
+            self.assertSame(''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 24))))
+
+    def test_valdata(self):
+        filename = os.environ.get('PIX2TEX_VALDATA', os.path.join(os.path.dirname(pix2tex.__file__), 'dataset', 'data', 'val.pkl'))
+        if not os.path.exists(filename):
+            self.skipTest('validation data not found (set PIX2TEX_VALDATA)')
+        from pix2tex.dataset.dataset import Im2LatexDataset
+        dataset = Im2LatexDataset().load(filename)
+        for eq in dataset.index.equations(range(len(dataset.index))):
+            self.assertSame(eq)
+            # like the detokenized predictions in eval
+            self.assertSame(' '.join(eq))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,7 @@ import torch
 from munch import Munch
 from inspect import isfunction
 import contextlib
+from typing import List
 
 operators = '|'.join(['arccos', 'arcsin', 'arctan', 'arg', 'cos', 'cosh', 'cot', 'coth', 'csc', 'deg', 'det', 'dim', 'exp', 'gcd', 'hom', 'inf',
                       'injlim', 'ker', 'lg', 'lim', 'liminf', 'limsup', 'ln', 'log', 'max', 'min', 'Pr', 'projlim', 'sec', 'sin', 'sinh', 'sup', 'tan', 'tanh'])
@@ -91,11 +92,131 @@ def gpu_memory_check(model, args):
     del im, seq
 
 
+class Detokenizer:
+    '''Convert token ids to strings with lookup tables built once from the vocabulary.
+
+    Byte level tokens are stored with `Ġ` already replaced by a space and the special
+    tokens (`[PAD]`, `[BOS]`, `[EOS]`) map to empty strings, so a sequence is decoded
+    by indexing the table and concatenating. Everything after the first `[EOS]` of a
+    sequence is ignored, unless `stop_at_eos` is False: the evaluation keeps the tokens
+    after it as it always did, so that its BLEU and edit distance stay comparable.
+    '''
+
+    def __init__(self, tokenizer, special_tokens=('[PAD]', '[BOS]', '[EOS]'), eos_token='[EOS]'):
+        """
+        Args:
+            tokenizer (Union[tokenizers.Tokenizer, PreTrainedTokenizerFast]): Tokenizer to take the vocabulary from
+            special_tokens (tuple, optional): Tokens that are removed. Defaults to ('[PAD]', '[BOS]', '[EOS]').
+            eos_token (str, optional): Token that ends a sequence. Defaults to '[EOS]'.
+        """
+        vocab = tokenizer.get_vocab()
+        strings, tokens = [''] * (max(vocab.values())+1), [''] * (max(vocab.values())+1)
+        self.special = np.zeros(len(strings), dtype=bool)
+        for token, i in vocab.items():
+            if token in special_tokens:
+                self.special[i] = True
+            else:
+                strings[i] = token.replace(' ', '').replace('Ġ', ' ')
+                tokens[i] = token.replace('Ġ', ' ').strip()
+        self.strings = np.array(strings, dtype=object)
+        self.tokens_table = np.array(tokens, dtype=object)
+        self.eos = vocab.get(eos_token, -1)
+
+    def _ids(self, tokens) -> np.ndarray:
+        ids = tokens.cpu().numpy() if isinstance(tokens, torch.Tensor) else np.asarray(tokens)
+        if ids.ndim == 1:
+            ids = ids[None, :]
+        return ids
+
+    def _valid(self, ids: np.ndarray, stop_at_eos: bool = True) -> np.ndarray:
+        # mask of the tokens (before the first EOS) that exist in the vocabulary
+        valid = (ids >= 0) & (ids < len(self.strings))
+        if stop_at_eos:
+            valid &= np.cumsum(ids == self.eos, 1) == 0
+        return valid
+
+    def __call__(self, tokens, stop_at_eos: bool = True) -> List[str]:
+        """Decode a batch of token ids
+
+        Args:
+            tokens (Union[torch.Tensor, np.ndarray]): Token ids of shape (B, T) or (T,)
+            stop_at_eos (bool, optional): Ignore the tokens after the first `[EOS]`. Defaults to True.
+
+        Returns:
+            List[str]: One string per sequence
+        """
+        ids = self._ids(tokens)
+        valid = self._valid(ids, stop_at_eos)
+        parts = self.strings[np.where(valid, ids, 0)]
+        parts[~valid] = ''
+        return [''.join(row).strip() for row in parts]
+
+    def tokens(self, tokens, stop_at_eos: bool = True) -> List[List[str]]:
+        """Decode a batch of token ids to lists of stripped token strings without special tokens (e.g. for BLEU)
+
+        Args:
+            tokens (Union[torch.Tensor, np.ndarray]): Token ids of shape (B, T) or (T,)
+            stop_at_eos (bool, optional): Ignore the tokens after the first `[EOS]`. Defaults to True.
+
+        Returns:
+            List[List[str]]: tokens of every sequence
+        """
+        ids = self._ids(tokens)
+        valid = self._valid(ids, stop_at_eos)
+        return [list(self.tokens_table[row[mask]]) for row, mask in zip(ids, valid & ~self.special[np.where(valid, ids, 0)])]
+
+    def stream(self, batchsize: int = 1) -> 'DetokenizerStream':
+        """Start decoding a batch of sequences that grow one token at a time"""
+        return DetokenizerStream(self, batchsize)
+
+
+class DetokenizerStream:
+    '''Incremental decoding, see `Detokenizer.stream`'''
+
+    def __init__(self, detokenizer: Detokenizer, batchsize: int):
+        self.detokenizer = detokenizer
+        self.parts = [[] for _ in range(batchsize)]
+        self.done = np.zeros(batchsize, dtype=bool)
+
+    def append(self, tokens) -> List[str]:
+        """Add the next token (or tokens) of every sequence
+
+        Args:
+            tokens (Union[torch.Tensor, np.ndarray]): New token ids of shape (B,) or (B, k)
+
+        Returns:
+            List[str]: The decoded sequences so far
+        """
+        ids = tokens.cpu().numpy() if isinstance(tokens, torch.Tensor) else np.asarray(tokens)
+        ids = ids.reshape(len(self.parts), -1)
+        for b, row in enumerate(ids):
+            for i in row:
+                if self.done[b]:
+                    break
+                if i == self.detokenizer.eos:
+                    self.done[b] = True
+                elif 0 <= i < len(self.detokenizer.strings):
+                    self.parts[b].append(self.detokenizer.strings[i])
+        return self.text
+
+    @property
+    def text(self) -> List[str]:
+        return [''.join(parts).strip() for parts in self.parts]
+
+
+detokenizers = {}
+
+
+def get_detokenizer(tokenizer) -> Detokenizer:
+    """Cached `Detokenizer` of a tokenizer"""
+    if id(tokenizer) not in detokenizers or detokenizers[id(tokenizer)][0] is not tokenizer:
+        detokenizers[id(tokenizer)] = (tokenizer, Detokenizer(tokenizer))
+    return detokenizers[id(tokenizer)][1]
+
+
 def token2str(tokens, tokenizer) -> list:
-    if len(tokens.shape) == 1:
-        tokens = tokens[None, :]
-    dec = [tokenizer.decode(tok) for tok in tokens]
-    return [''.join(detok.split(' ')).replace('Ġ', ' ').replace('[EOS]', '').replace('[BOS]', '').replace('[PAD]', '').strip() for detok in dec]
+    # only removes the special tokens, used by the evaluation (see `Detokenizer`)
+    return get_detokenizer(tokenizer)(tokens, stop_at_eos=False)
 
 
 def pad(img: Image, divable: int = 32) -> Image:
@@ -135,20 +256,30 @@ def pad(img: Image, divable: int = 32) -> Image:
     return padded
 
 
-def post_process(s: str):
-    """Remove unnecessary whitespace from LaTeX code.
+TEXT_GROUP = re.compile(r'\\(operatorname|mathrm|text|mathbf)\s?\*? {.*?}')
+WHITESPACE = re.compile(r'\s+')
+# `\` followed by a tab or newline and then a space
+ORDER_DEPENDENT = re.compile(r'\\[^\S ]+ ')
 
-    Args:
-        s (str): Input string
 
-    Returns:
-        str: Processed image
-    """
-    text_reg = r'(\\(operatorname|mathrm|text|mathbf)\s?\*? {.*?})'
+def char_class(c: str) -> str:
+    """Class of a character for `post_process`: `L`etter, `N`on letter, `B`ackslash or `O`ther (e.g. `é`)"""
+    if 'a' <= c <= 'z' or 'A' <= c <= 'Z':
+        return 'L'
+    if c == '\\':
+        return 'B'
+    if not c.isalnum() or c.isdecimal() or c == '_':
+        return 'N'
+    return 'O'
+
+
+CHAR_CLASSES = {chr(i): char_class(chr(i)) for i in range(128)}
+
+
+def _remove_spaces(s: str) -> str:
+    # deletes whitespace step by step until nothing changes anymore
     letter = '[a-zA-Z]'
-    noletter = '[\W_^\d]'
-    names = [x[0].replace(' ', '') for x in re.findall(text_reg, s)]
-    s = re.sub(text_reg, lambda match: str(names.pop(0)), s)
+    noletter = r'[\W_^\d]'
     news = s
     while True:
         s = news
@@ -160,6 +291,41 @@ def post_process(s: str):
     return s
 
 
+def _whitespace(match) -> str:
+    # what is left of a whitespace run, decided by the characters before and after it
+    s, (i, j), run = match.string, match.span(), match.group(0)
+    prev = (CHAR_CLASSES.get(s[i-1]) or char_class(s[i-1])) if i > 0 else 'O'
+    nxt = (CHAR_CLASSES.get(s[j]) or char_class(s[j])) if j < len(s) else 'O'
+    if prev == 'B':
+        # an escaped space is kept
+        prev = 'O' if run[0] == ' ' else 'N'
+    if prev == 'L':
+        return run[0] if nxt == 'L' else run[-1] if nxt == 'O' else ''
+    if prev == 'N':
+        return run[-1] if nxt == 'O' else ''
+    return run[0] if nxt != 'O' or len(run) == 1 else run[0]+run[-1]
+
+
+def post_process(s: str):
+    """Remove unnecessary whitespace from LaTeX code.
+
+    Whitespace between two non letters, a non letter and a letter or a letter and a non letter
+    is removed, an escaped space `\\ ` is kept. Every whitespace run is handled once, based on
+    the characters around it.
+
+    Args:
+        s (str): Input string
+
+    Returns:
+        str: Processed image
+    """
+    s = TEXT_GROUP.sub(lambda match: match.group(0).replace(' ', ''), s)
+    if ORDER_DEPENDENT.search(s):
+        # the result depends on the order of the deletions, do them one by one
+        return _remove_spaces(s)
+    return WHITESPACE.sub(_whitespace, s)
+
+
 def alternatives(s):
     # TODO takes list of list of tokens
     # try to generate equivalent code eg \ne \neq or \to \rightarrow
@@ -0,0 +1,140 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+from pix2tex.batch import IMAGE_EXTENSIONS, BatchPredictor, load_image
+
+
+class FolderState:
+    '''Remember which images were processed in which version (modification time and size)'''
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.files: Dict[str, List[int]] = {}
+        if os.path.isfile(filename):
+            with open(filename, 'r') as f:
+                self.files = json.load(f)
+
+    @staticmethod
+    def signature(path: str) -> Optional[List[int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def done(self, path: str, signature: List[int]):
+        self.files[path] = signature
+
+    def save(self):
+        with open(self.filename+'.tmp', 'w') as f:
+            json.dump(self.files, f)
+        os.replace(self.filename+'.tmp', self.filename)
+
+
+def scan(directory: str, recursive: bool = True) -> Set[str]:
+    files = set()
+    for root, dirs, names in os.walk(directory):
+        files.update(os.path.join(root, name) for name in names if name.lower().endswith(IMAGE_EXTENSIONS))
+        if not recursive:
+            break
+    return files
+
+
+def start_observer(directory: str, recursive: bool, pending: Set[str], lock: threading.Lock, wakeup: threading.Event):
+    """Watch `directory` with inotify (or the native api of the platform) if `watchdog` is installed
+
+    Returns:
+        Optional[Observer]: The running observer. None if watchdog is not available.
+    """
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        return None
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory:
+                return
+            path = getattr(event, 'dest_path', None) or event.src_path
+            if path.lower().endswith(IMAGE_EXTENSIONS):
+                with lock:
+                    pending.add(os.path.abspath(path))
+                wakeup.set()
+
+    observer = Observer()
+    observer.schedule(Handler(), directory, recursive=recursive)
+    observer.daemon = True
+    observer.start()
+    return observer
+
+
+def main(arguments):
+    from pix2tex.cli import LatexOCR
+    directory = os.path.abspath(arguments.directory)
+    state = FolderState(os.path.abspath(arguments.state) if arguments.state else os.path.join(directory, '.pix2tex-state.json'))
+    jsonl = open(os.path.abspath(arguments.jsonl), 'a') if arguments.jsonl else None
+    model = LatexOCR(arguments)
+
+    pending, lock, wakeup = scan(directory, arguments.recursive), threading.Lock(), threading.Event()
+    observer = None if arguments.poll else start_observer(directory, arguments.recursive, pending, lock, wakeup)
+    if observer is None:
+        print('Polling %s every %.1fs' % (directory, arguments.interval), file=sys.stderr)
+    signatures = {}
+    wakeup.set()  # process what is already in the folder
+
+    def write(result: dict):
+        path = result['file']
+        if 'latex' in result:
+            if jsonl is not None:
+                jsonl.write(json.dumps(result)+'\n')
+                jsonl.flush()
+            else:
+                with open(os.path.splitext(path)[0]+'.tex', 'w') as f:
+                    f.write(result['latex']+'\n')
+        else:
+            logging.warning('%s: %s' % (path, result['error']))
+        # failed images are not retried until they change
+        state.done(path, signatures.pop(path))
+
+    predictor = BatchPredictor(model, arguments.batchsize, write)
+    try:
+        while True:
+            wakeup.wait(arguments.interval)
+            wakeup.clear()
+            if observer is None:
+                pending.update(scan(directory, arguments.recursive))
+            now, ready = time.time(), []
+            with lock:
+                candidates = list(pending)
+                pending.clear()
+            for path in candidates:
+                signature = state.signature(path)
+                if signature is None or state.files.get(path) == signature:
+                    continue
+                if now-signature[0]/1e9 < arguments.settle:
+                    # wait until the file is completely written
+                    with lock:
+                        pending.add(path)
+                    continue
+                signatures[path] = signature
+                ready.append(path)
+            resize = model.resizes(not arguments.no_resize)
+            for path in sorted(ready):
+                path, img, error, load = load_image(path, model.args.max_dimensions, model.args.min_dimensions, resize)
+                predictor.predict(path, img, error, {'load': round(load, 4)}, resize=resize)
+            predictor.flush()
+            state.save()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if observer is not None:
+            observer.stop()
+        if jsonl is not None:
+            jsonl.close()
+        state.save()
@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 
+import re
 import setuptools
 
 # read the contents of your README file
 from pathlib import Path
 this_directory = Path(__file__).parent
 long_description = (this_directory / 'README.md').read_text(encoding='utf-8')
+version = re.search(r"__version__ = '(.+)'", (this_directory / 'pix2tex' / '__init__.py').read_text(encoding='utf-8')).group(1)
 
 gui = [
     'PyQt6',
@@ -21,15 +23,17 @@ api = [
     'python-multipart'
 ]
 train = [
+    'transformers>=4.18.0',
     'python-Levenshtein>=0.12.2',
     'torchtext>=0.6.0',
     'imagesize>=1.2.0',
 ]
 highlight = ['pygments']
+watch = ['watchdog']
 
 setuptools.setup(
     name='pix2tex',
-    version='0.1.2',
+    version=version,
     description='pix2tex: Using a ViT to convert images of equations into LaTeX code.',
     long_description=long_description,
     long_description_content_type='text/markdown',
@@ -58,22 +62,22 @@ setuptools.setup(
         'requests>=2.22.0',
         'einops>=0.3.0',
         'x_transformers==0.15.0',
-        'transformers>=4.18.0',
         'tokenizers>=0.13.0',
+        'safetensors>=0.3.0',
         'numpy>=1.19.5',
         'Pillow>=9.1.0',
         'PyYAML>=5.4.1',
-        'pandas>=1.0.0',
         'timm==0.5.4',
         'albumentations>=0.5.2',
         'pyreadline3>=3.4.1; platform_system=="Windows"',
     ],
     extras_require={
-        'all': gui+api+train+highlight,
+        'all': gui+api+train+highlight+watch,
         'gui': gui,
         'api': api,
         'train': train,
         'highlight': highlight,
+        'watch': watch,
     },
     entry_points={
         'console_scripts': [